@@ -0,0 +1,89 @@
+"""
+Benchmark the speedup of the compiled accelerator over the pure-Python modules, by running the codec benchmarks of
+`bench_suite.py` in fresh processes with and without the environment variable `MSDSALGS_NO_ACCELERATOR` set.
+
+The runs of the two variants alternate for a number of rounds and the best time of each benchmark is kept, so that
+drifts in the load of the machine affect both variants alike.
+
+The accelerator must have been built, e.g. in place with:
+
+    MSDSALGS_BUILD_ACCELERATOR=1 python setup.py build_ext --inplace
+
+Usage: python benchmarks/bench_accelerator.py [--rounds N] [--repeat N]
+"""
+
+from argparse import ArgumentParser
+from json import load as json_load
+from os import environ
+from os.path import dirname, join as path_join
+from subprocess import run, DEVNULL
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import Dict, Any, Optional
+
+# The prefixes of the names of the benchmarks of the operations that involve the accelerated modules.
+ACCELERATED_BENCHMARK_PREFIXES = ('sid.', 'ace.', 'acl.', 'security_descriptor.', 'fscc.', 'time.')
+
+BENCH_SUITE_PATH: str = path_join(dirname(__file__), 'bench_suite.py')
+
+
+def run_suite(no_accelerator: bool, repeat: int) -> Dict[str, Dict[str, Any]]:
+    env: Dict[str, str] = {key: value for key, value in environ.items() if key != 'MSDSALGS_NO_ACCELERATOR'}
+    if no_accelerator:
+        env['MSDSALGS_NO_ACCELERATOR'] = '1'
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with TemporaryDirectory() as directory:
+        for prefix in ACCELERATED_BENCHMARK_PREFIXES:
+            path: str = path_join(directory, f'{prefix}json')
+            run(
+                [executable, BENCH_SUITE_PATH, '--filter', prefix, '--repeat', str(repeat), '--save', path],
+                env=env,
+                check=True,
+                stdout=DEVNULL
+            )
+            with open(path) as file:
+                results.update(
+                    (name, result) for name, result in json_load(file)['results'].items() if name.startswith(prefix)
+                )
+
+    return results
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    accelerated_modules_result = run(
+        [executable, '-c', 'from msdsalgs.accelerator import accelerated_modules; print(len(accelerated_modules()))'],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    if accelerated_modules_result.stdout.strip() == '0':
+        print('Warning: the accelerator has not been built; both runs use the pure-Python modules.\n')
+
+    pure_python_results: Dict[str, Dict[str, Any]] = {}
+    accelerated_results: Dict[str, Dict[str, Any]] = {}
+    for _ in range(args.rounds):
+        for no_accelerator, best_results in ((True, pure_python_results), (False, accelerated_results)):
+            for name, result in run_suite(no_accelerator=no_accelerator, repeat=args.repeat).items():
+                if name not in best_results or result['ns_per_op'] < best_results[name]['ns_per_op']:
+                    best_results[name] = result
+
+    print(f'{"benchmark":<52} {"pure-Python ns":>14} {"compiled ns":>14} {"speedup":>9}')
+    for name, pure_python_result in pure_python_results.items():
+        accelerated_result: Optional[Dict[str, Any]] = accelerated_results.get(name)
+        if accelerated_result is None:
+            continue
+
+        pure_python_ns: float = pure_python_result['ns_per_op']
+        accelerated_ns: float = accelerated_result['ns_per_op']
+        print(f'{name:<52} {pure_python_ns:14.1f} {accelerated_ns:14.1f} {pure_python_ns / accelerated_ns:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Micro-benchmark of `Mask` operations on `SecurityDescriptorControl` and `FileAttributes`.
+
+Usage: python benchmarks/bench_mask.py [--number N]
+"""
+
+from argparse import ArgumentParser
+from timeit import Timer
+from typing import Type
+
+from msdsalgs.utils import Mask
+from msdsalgs.fscc.file_attributes import FileAttributes
+from msdsalgs.security_types.security_descriptor import SecurityDescriptorControl
+
+
+def bench_mask_class(mask_class: Type[Mask], number: int) -> None:
+    value: int = mask_class.ALL_FLAGS_VALUE & 0x5555
+    mask = mask_class.from_int(value)
+    other = mask_class.from_int(value)
+
+    statements = {
+        'from_int': lambda: mask_class.from_int(value),
+        'int': lambda: int(mask),
+        'items': mask.items,
+        'set_all': mask.set_all,
+        'clear_all': mask.clear_all,
+        'eq': lambda: mask == other,
+    }
+
+    for name, statement in statements.items():
+        seconds: float = min(Timer(statement).repeat(repeat=5, number=number))
+        print(f'{mask_class.__name__}.{name:<12} {seconds / number * 1e9:10.1f} ns/op')
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--number', type=int, default=100_000)
+    args = parser.parse_args()
+
+    for mask_class in (SecurityDescriptorControl, FileAttributes):
+        bench_mask_class(mask_class=mask_class, number=args.number)
+
+
+if __name__ == '__main__':
+    main()
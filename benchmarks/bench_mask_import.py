@@ -0,0 +1,57 @@
+"""
+Benchmark the import time of the modules defining masks, with and without the ahead-of-time generated `Mask` classes,
+as well as the time `Mask.make_class` takes for a single mask on each path.
+
+Bytecode caching should be enabled (`PYTHONDONTWRITEBYTECODE` unset) so that the generated module is not compiled on
+every import.
+
+Usage: python benchmarks/bench_mask_import.py [--number N]
+"""
+
+from argparse import ArgumentParser
+from os import environ
+from subprocess import run
+from sys import executable
+from timeit import Timer
+from typing import Dict
+
+from msdsalgs.utils import Mask
+from msdsalgs.fscc.file_attributes import FileAttributesFlag
+
+# Time only the imports, not the interpreter startup, in a fresh process.
+IMPORT_TIMING_PROGRAM = '''
+from time import perf_counter
+start = perf_counter()
+import msdsalgs.fscc.file_attributes, msdsalgs.security_types.security_descriptor
+print(perf_counter() - start)
+'''
+
+
+def time_import(env: Dict[str, str], number: int) -> float:
+    return min(
+        float(run([executable, '-c', IMPORT_TIMING_PROGRAM], env=env, check=True, capture_output=True).stdout)
+        for _ in range(number)
+    )
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    generated: float = time_import(env={**environ}, number=args.number)
+    dynamic: float = time_import(env={**environ, 'MSDSALGS_NO_GENERATED_MASKS': '1'}, number=args.number)
+
+    print(f'generated classes: {generated * 1e3:8.2f} ms')
+    print(f'dynamic classes:   {dynamic * 1e3:8.2f} ms')
+
+    for name, statement in {
+        'generated': lambda: Mask.make_class(int_flag_class=FileAttributesFlag, prefix='FILE_ATTRIBUTE_'),
+        'dynamic': lambda: Mask.make_dynamic_class(int_flag_class=FileAttributesFlag, prefix='FILE_ATTRIBUTE_')
+    }.items():
+        seconds: float = min(Timer(statement).repeat(repeat=5, number=1000))
+        print(f'FileAttributes make_class, {name + ":":<10} {seconds / 1000 * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
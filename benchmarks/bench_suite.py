@@ -0,0 +1,549 @@
+"""
+Benchmark suite of the `msdsalgs` codecs, with a baseline file format and a regression comparison mode.
+
+Each benchmark times a single operation on a synthetic input made from a fixed seed, with `msdsalgs.synthetic_corpus`
+for the larger inputs, so that the results of two runs are comparable. The number of loops of each benchmark is
+calibrated with `Timer.autorange`, and the best of several repeats is kept.
+
+A results file is a JSON object of the form:
+
+    {
+        "format": 1,
+        "python": "3.11.4",
+        "implementation": "CPython",
+        "machine": "x86_64",
+        "results": {
+            "sid.from_bytes": {"ns_per_op": 812.4, "number": 200000, "repeat": 5},
+            ...
+        }
+    }
+
+Usage:
+    python benchmarks/bench_suite.py [--filter SUBSTRING] [--repeat N] [--save PATH]
+    python benchmarks/bench_suite.py --compare BASELINE_PATH [--threshold FRACTION]
+
+With `--compare`, the results are compared to those of a baseline file, and the exit status is `1` if any benchmark is
+slower than its baseline by more than the threshold.
+"""
+
+from __future__ import annotations
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from json import dump as json_dump, load as json_load
+from platform import python_version, python_implementation, machine
+from random import Random
+from struct import pack as struct_pack
+from subprocess import run
+from sys import executable, exit as sys_exit
+from timeit import Timer
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from msdsalgs.synthetic_corpus import SecurityDescriptorProfile, DirectoryBufferProfile, NotifyBufferProfile, \
+    corpus_item
+
+RESULTS_FORMAT = 1
+
+SEED = 0x6D736473
+
+Setup = Callable[[], Callable[[], Any]]
+
+# A mapping of benchmark names to their setup functions and whether their statements time themselves.
+BENCHMARKS: Dict[str, Tuple[Setup, bool]] = {}
+
+
+def benchmark(name: str, self_timed: bool = False) -> Callable[[Setup], Setup]:
+    """
+    Register a benchmark.
+
+    :param name: The name of the benchmark, by which its results are compared.
+    :param self_timed: Whether the statement measures itself and returns its time in seconds, e.g. to exclude the
+        startup of a subprocess.
+    :return: A decorator registering a setup function, which prepares the inputs and returns the statement to time.
+    """
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = (setup, self_timed)
+        return setup
+
+    return register
+
+
+# Inputs
+
+def make_sid_bytes(random: Random, num_sub_authorities: int = 5) -> bytes:
+    """Make a domain SID of the NT authority, e.g. `S-1-5-21-X-Y-Z-RID`."""
+
+    sub_authorities: List[int] = [21, *(random.getrandbits(32) for _ in range(num_sub_authorities - 2))]
+    sub_authorities.append(random.randrange(1000, 100_000))
+
+    return struct_pack(f'<BB6s{num_sub_authorities}I', 1, num_sub_authorities, b'\x00' * 5 + b'\x05', *sub_authorities)
+
+
+def make_ace_bytes(ace_type: int, access_mask: int, body: bytes) -> bytes:
+    body += b'\x00' * (-len(body) % 4)
+    return struct_pack('<BBHI', ace_type, 0x02, 8 + len(body), access_mask) + body
+
+
+def make_acl_bytes(random: Random, num_aces: int) -> bytes:
+    aces: List[bytes] = []
+    for i in range(num_aces):
+        sid: bytes = make_sid_bytes(random)
+        if i % 4 == 1:
+            # An object ACE with an object type.
+            aces.append(make_ace_bytes(0x05, 0x00000130, struct_pack('<I', 0x1) + random.randbytes(16) + sid))
+        elif i % 4 == 3:
+            # A callback ACE with application data.
+            aces.append(make_ace_bytes(0x09, 0x00000001, sid + b'artx' + random.randbytes(12)))
+        else:
+            aces.append(make_ace_bytes(random.choice((0x00, 0x01)), 0x001F01FF, sid))
+
+    return struct_pack('<BBHHH', 2, 0, 8 + sum(len(ace) for ace in aces), len(aces), 0) + b''.join(aces)
+
+
+# SIDs
+
+@benchmark('sid.from_bytes')
+def bench_sid_from_bytes():
+    from msdsalgs.security_types.sid import SID
+
+    data: bytes = make_sid_bytes(Random(SEED))
+    return lambda: SID.from_bytes(data)
+
+
+@benchmark('sid.from_string')
+def bench_sid_from_string():
+    from msdsalgs.security_types.sid import SID
+
+    sid_string: str = str(SID.from_bytes(make_sid_bytes(Random(SEED))))
+    return lambda: SID.from_string(sid_string)
+
+
+@benchmark('sid.str')
+def bench_sid_str():
+    from msdsalgs.security_types.sid import SID
+
+    sid = SID.from_bytes(make_sid_bytes(Random(SEED)))
+    return lambda: str(sid)
+
+
+@benchmark('sid.bytes')
+def bench_sid_bytes():
+    from msdsalgs.security_types.sid import SID
+
+    sid = SID.from_bytes(make_sid_bytes(Random(SEED)))
+    return lambda: bytes(sid)
+
+
+# Security descriptors
+
+@benchmark('ace.from_bytes.basic')
+def bench_ace_from_bytes_basic():
+    from msdsalgs.security_types.ace import ACE
+
+    data: bytes = make_ace_bytes(0x00, 0x001F01FF, make_sid_bytes(Random(SEED)))
+    return lambda: ACE.from_bytes(data)
+
+
+@benchmark('ace.from_bytes.object')
+def bench_ace_from_bytes_object():
+    from msdsalgs.security_types.ace import ACE
+
+    random = Random(SEED)
+    data: bytes = make_ace_bytes(
+        0x05,
+        0x00000130,
+        struct_pack('<I', 0x3) + random.randbytes(32) + make_sid_bytes(random)
+    )
+    return lambda: ACE.from_bytes(data)
+
+
+@benchmark('ace.from_bytes.callback')
+def bench_ace_from_bytes_callback():
+    from msdsalgs.security_types.ace import ACE
+
+    random = Random(SEED)
+    data: bytes = make_ace_bytes(0x09, 0x00000001, make_sid_bytes(random) + b'artx' + random.randbytes(28))
+    return lambda: ACE.from_bytes(data)
+
+
+@benchmark('acl.from_bytes.16')
+def bench_acl_from_bytes():
+    from msdsalgs.security_types.acl import ACL
+
+    data: bytes = make_acl_bytes(Random(SEED), num_aces=16)
+    return lambda: ACL.from_bytes(data)
+
+
+@benchmark('acl.filter_acl.generic_all.16')
+def bench_acl_filter_acl():
+    from msdsalgs.security_types.ace import ActiveDirectoryRightsMask
+    from msdsalgs.security_types.ace_filter import ACEFilter, filter_acl
+
+    data: bytes = make_acl_bytes(Random(SEED), num_aces=16)
+    ace_filter = ACEFilter(access_mask=ActiveDirectoryRightsMask.ADS_RIGHT_GENERIC_ALL)
+    return lambda: filter_acl(data, ace_filter)
+
+
+@benchmark('conditional_expression.evaluate')
+def bench_conditional_expression_evaluate():
+    from msdsalgs.security_types.conditional_expression import ConditionalContext, compile_conditional_expression
+
+    def attribute(token: int, name: str) -> bytes:
+        name_bytes: bytes = name.encode(encoding='utf-16-le')
+        return struct_pack('<BI', token, len(name_bytes)) + name_bytes
+
+    # (@User.Department == "Sales" && @User.Clearance >= 3) || Exists @User.Override
+    data: bytes = b'artx' + attribute(0xF9, 'Department') + attribute(0x10, 'Sales') + b'\x80' \
+        + attribute(0xF9, 'Clearance') + struct_pack('<BqBB', 0x04, 3, 0x03, 0x02) + b'\x85\xa0' \
+        + attribute(0xF9, 'Override') + b'\x87\xa1'
+
+    context = ConditionalContext(user_claims={'Department': 'Sales', 'Clearance': 5})
+    return lambda: compile_conditional_expression(data).evaluate(context)
+
+
+@benchmark('security_descriptor.from_bytes.16')
+def bench_security_descriptor_from_bytes():
+    from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+
+    data: bytes = corpus_item(SecurityDescriptorProfile(num_dacl_aces=(16, 16)), seed=SEED, index=0)
+    return lambda: SecurityDescriptor.from_bytes(data)
+
+
+@benchmark('security_descriptor.bytes.16')
+def bench_security_descriptor_bytes():
+    from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+
+    security_descriptor = SecurityDescriptor.from_bytes(
+        corpus_item(SecurityDescriptorProfile(num_dacl_aces=(16, 16)), seed=SEED, index=0)
+    )
+
+    return lambda: bytes(security_descriptor)
+
+
+def make_security_descriptor_batch(num_distinct: int = 10, size: int = 100) -> List[bytes]:
+    # As in a directory, where subtrees inherit the same ACEs, the batch repeats a few distinct security descriptors.
+    profile = SecurityDescriptorProfile(num_dacl_aces=(16, 16))
+    return [bytes(corpus_item(profile, seed=SEED, index=i % num_distinct)) for i in range(size)]
+
+
+@benchmark('security_descriptor.from_bytes.batch.100')
+def bench_security_descriptor_from_bytes_batch():
+    from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+
+    blobs: List[bytes] = make_security_descriptor_batch()
+    return lambda: [SecurityDescriptor.from_bytes(data) for data in blobs]
+
+
+@benchmark('security_descriptor.decode_many.100')
+def bench_security_descriptor_decode_many():
+    from msdsalgs.security_types.security_descriptor_batch import decode_many
+
+    blobs: List[bytes] = make_security_descriptor_batch()
+    return lambda: decode_many(blobs)
+
+
+@benchmark('security_descriptor.decode_many.summary.100')
+def bench_security_descriptor_decode_many_owner_dacl_summary():
+    from msdsalgs.security_types.security_descriptor_batch import decode_many, SecurityDescriptorField
+
+    blobs: List[bytes] = make_security_descriptor_batch()
+    fields = SecurityDescriptorField.OWNER | SecurityDescriptorField.DACL_SUMMARY
+    return lambda: decode_many(blobs, fields=fields)
+
+
+# FSCC
+
+@benchmark('fscc.decode_directory_buffer.100')
+def bench_decode_directory_buffer():
+    from msdsalgs.fscc.file_information_classes import FileInformationClass, decode_directory_buffer
+
+    data: bytes = corpus_item(DirectoryBufferProfile(num_entries=(100, 100)), seed=SEED, index=0)
+    return lambda: decode_directory_buffer(FileInformationClass.FileIdBothDirectoryInformation, data)
+
+
+@benchmark('fscc.iter_file_notify_information.100')
+def bench_iter_file_notify_information():
+    from msdsalgs.fscc.file_notify_stream import iter_file_notify_information
+
+    data: bytes = corpus_item(NotifyBufferProfile(num_records=(100, 100)), seed=SEED, index=0)
+    return lambda: [record.file_name for record in iter_file_notify_information(data)]
+
+
+@benchmark('fscc.file_notify_information.extract_elements.100')
+def bench_file_notify_information_extract_elements():
+    from msdsalgs.utils import extract_elements
+    from msdsalgs.fscc.file_notify_information import FileNotifyInformation
+
+    data: bytes = corpus_item(NotifyBufferProfile(num_records=(100, 100)), seed=SEED, index=0)
+    return lambda: extract_elements(
+        data=data,
+        create_element=FileNotifyInformation.from_bytes,
+        get_next_offset=lambda record: record.next_entry_offset
+    )
+
+
+# Times
+
+@benchmark('time.filetime_to_datetime.int')
+def bench_filetime_to_datetime_int():
+    from msdsalgs.time import filetime_to_datetime
+
+    filetime: int = 133_000_000_000_000_000
+    return lambda: filetime_to_datetime(filetime)
+
+
+@benchmark('time.filetime_to_datetime.bytes')
+def bench_filetime_to_datetime_bytes():
+    from msdsalgs.time import filetime_to_datetime
+
+    data: bytes = struct_pack('<Q', 133_000_000_000_000_000)
+    return lambda: filetime_to_datetime(data)
+
+
+@benchmark('time.datetime_to_filetime')
+def bench_datetime_to_filetime():
+    from msdsalgs.time import datetime_to_filetime
+
+    dt = datetime(year=2022, month=6, day=1, hour=12, tzinfo=timezone.utc)
+    return lambda: datetime_to_filetime(dt)
+
+
+@benchmark('time.dos_date_to_datetime')
+def bench_dos_date_to_datetime():
+    from msdsalgs.time import dos_date_to_datetime
+
+    return lambda: dos_date_to_datetime(0x54C1)
+
+
+@benchmark('time.dos_time_to_timedelta')
+def bench_dos_time_to_timedelta():
+    from msdsalgs.time import dos_time_to_timedelta
+
+    return lambda: dos_time_to_timedelta(0x6B2F)
+
+
+# Crypto
+
+@benchmark('crypto.des_ecb_lm.from_int_key')
+def bench_des_ecb_lm_from_int_key():
+    from msdsalgs.crypto import DesEcbLmCipher
+
+    return lambda: DesEcbLmCipher.from_int_key(500)
+
+
+@benchmark('crypto.des_ecb_lm.decrypt')
+def bench_des_ecb_lm_decrypt():
+    from msdsalgs.crypto import DesEcbLmCipher
+
+    cipher = DesEcbLmCipher.from_int_key(500)
+    encrypted_hash: bytes = Random(SEED).randbytes(16)
+    return lambda: cipher.decrypt(encrypted_hash)
+
+
+@benchmark('crypto.decrypt_aes.zero_iv.256')
+def bench_decrypt_aes_zero_iv():
+    from msdsalgs.crypto import decrypt_aes
+
+    random = Random(SEED)
+    key: bytes = random.randbytes(16)
+    value: bytes = random.randbytes(256)
+    return lambda: decrypt_aes(key, value)
+
+
+@benchmark('crypto.decrypt_aes.iv.256')
+def bench_decrypt_aes_iv():
+    from msdsalgs.crypto import decrypt_aes
+
+    random = Random(SEED)
+    key: bytes = random.randbytes(16)
+    value: bytes = random.randbytes(256)
+    initialization_vector: bytes = random.randbytes(16)
+    return lambda: decrypt_aes(key, value, initialization_vector)
+
+
+# Masks
+
+@benchmark('mask.from_int')
+def bench_mask_from_int():
+    from msdsalgs.security_types.security_descriptor import SecurityDescriptorControl
+
+    return lambda: SecurityDescriptorControl.from_int(0x8014)
+
+
+@benchmark('mask.items')
+def bench_mask_items():
+    from msdsalgs.security_types.security_descriptor import SecurityDescriptorControl
+
+    return SecurityDescriptorControl.from_int(0x8014).items
+
+
+@benchmark('mask.int')
+def bench_mask_int():
+    from msdsalgs.security_types.security_descriptor import SecurityDescriptorControl
+
+    mask = SecurityDescriptorControl.from_int(0x8014)
+    return lambda: int(mask)
+
+
+# Error catalogs
+
+# Time only the imports, not the interpreter startup, in a fresh process.
+CATALOG_IMPORT_TIMING_PROGRAM = '''
+from time import perf_counter
+start = perf_counter()
+import msdsalgs.ntstatus_value, msdsalgs.win32_error
+print(perf_counter() - start)
+'''
+
+
+@benchmark('catalog.import', self_timed=True)
+def bench_catalog_import():
+    return lambda: float(run([executable, '-c', CATALOG_IMPORT_TIMING_PROGRAM], check=True, capture_output=True).stdout)
+
+
+@benchmark('catalog.nt_status_error.known')
+def bench_nt_status_error_known():
+    from msdsalgs.ntstatus_value import NTStatusValueError
+
+    return lambda: NTStatusValueError.from_nt_status_int(0xC0000022)
+
+
+@benchmark('catalog.nt_status_error.unknown')
+def bench_nt_status_error_unknown():
+    from msdsalgs.ntstatus_value import NTStatusValueError
+
+    return lambda: NTStatusValueError.from_nt_status_int(0xC0FF0001)
+
+
+@benchmark('catalog.win32_error.known')
+def bench_win32_error_known():
+    from msdsalgs.win32_error import Win32Error
+
+    return lambda: Win32Error.from_win32_error_code_int(5)
+
+
+@benchmark('catalog.nt_status_table.description')
+def bench_nt_status_table_description():
+    from msdsalgs.status_metadata import NT_STATUS_TABLE
+
+    return lambda: NT_STATUS_TABLE.description(0xC0000022)
+
+
+@benchmark('catalog.nt_status_to_win32_error_code')
+def bench_nt_status_to_win32_error_code():
+    from msdsalgs.status_translation import nt_status_to_win32_error_code
+
+    return lambda: nt_status_to_win32_error_code(0xC0000022)
+
+
+# Running and comparing
+
+def time_benchmark(setup: Setup, self_timed: bool, repeat: int) -> Tuple[float, int]:
+    """
+    Time a benchmark.
+
+    :param setup: The setup function of the benchmark.
+    :param self_timed: Whether the statement of the benchmark returns its own time.
+    :param repeat: The number of times to repeat the timing.
+    :return: The best time per operation, in nanoseconds, and the number of loops per repeat.
+    """
+
+    statement = setup()
+
+    if self_timed:
+        return min(statement() for _ in range(repeat)) * 1e9, 1
+
+    timer = Timer(statement)
+    number, _ = timer.autorange()
+    seconds: float = min(timer.repeat(repeat=repeat, number=number))
+    return seconds / number * 1e9, number
+
+
+def run_benchmarks(name_filter: Optional[str] = None, repeat: int = 5) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for name, (setup, self_timed) in BENCHMARKS.items():
+        if name_filter is not None and name_filter not in name:
+            continue
+
+        ns_per_op, number = time_benchmark(setup=setup, self_timed=self_timed, repeat=repeat)
+        results[name] = dict(ns_per_op=ns_per_op, number=number, repeat=repeat)
+        print(f'{name:<52} {ns_per_op:14.1f} ns/op')
+
+    return dict(
+        format=RESULTS_FORMAT,
+        python=python_version(),
+        implementation=python_implementation(),
+        machine=machine(),
+        results=results
+    )
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare the results of a run to those of a baseline.
+
+    :param baseline: The results of the baseline run.
+    :param current: The results of the current run.
+    :param threshold: The fraction by which a benchmark may be slower than its baseline before it is a regression.
+    :return: The names of the benchmarks that regressed.
+    """
+
+    if baseline.get('format') != RESULTS_FORMAT:
+        raise ValueError(f'Unsupported baseline format: {baseline.get("format")!r}.')
+
+    regressions: List[str] = []
+
+    for name, result in current['results'].items():
+        baseline_result: Optional[Dict[str, Any]] = baseline['results'].get(name)
+        if baseline_result is None:
+            print(f'{name:<52} {"":>14} {result["ns_per_op"]:14.1f} {"new":>9}')
+            continue
+
+        ratio: float = result['ns_per_op'] / baseline_result['ns_per_op']
+        regressed: bool = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+
+        print(
+            f'{name:<52} {baseline_result["ns_per_op"]:14.1f} {result["ns_per_op"]:14.1f} {ratio:8.2f}x'
+            f'{"  REGRESSION" if regressed else ""}'
+        )
+
+    return regressions
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--filter', help='Run only the benchmarks whose names contain this string.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', help='The path of a file to which to write the results.')
+    parser.add_argument('--compare', help='The path of a baseline results file to which to compare the results.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='The fraction by which a benchmark may be slower than its baseline before it is a regression.'
+    )
+    args = parser.parse_args()
+
+    current: Dict[str, Any] = run_benchmarks(name_filter=args.filter, repeat=args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json_dump(current, file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline: Dict[str, Any] = json_load(file)
+
+        print()
+        print(f'{"benchmark":<52} {"baseline ns":>14} {"current ns":>14} {"ratio":>9}')
+        regressions: List[str] = compare_results(baseline=baseline, current=current, threshold=args.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} regression(s) above {args.threshold:.0%}: {", ".join(regressions)}')
+            sys_exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+from os import environ
+
+# Import the pure-Python sources of the modules of the compiled accelerator, even if it has been built.
+if environ.get('MSDSALGS_NO_ACCELERATOR'):
+    from msdsalgs.accelerator import install_source_only_finder
+    install_source_only_finder()
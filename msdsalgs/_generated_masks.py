@@ -0,0 +1,672 @@
+# This file is generated by `python -m msdsalgs.mask_generation`. Do not edit.
+
+from msdsalgs.utils import Mask, IntFlagClassReference
+
+
+class FileAttributes(Mask):
+    __slots__ = ()
+
+    INT_FLAG_CLASS = IntFlagClassReference(
+        module_name='msdsalgs.fscc.file_attributes',
+        qualified_name='FileAttributesFlag'
+    )
+    FLAG_TABLE = (
+        ('archive', 0x00000020),
+        ('compressed', 0x00000800),
+        ('directory', 0x00000010),
+        ('encrypted', 0x00004000),
+        ('hidden', 0x00000002),
+        ('integrity_stream', 0x00008000),
+        ('no_scrub_data', 0x00020000),
+        ('normal', 0x00000080),
+        ('not_content_indexed', 0x00002000),
+        ('offline', 0x00001000),
+        ('readonly', 0x00000001),
+        ('reparse_point', 0x00000400),
+        ('sparse_file', 0x00000200),
+        ('system', 0x00000004),
+        ('temporary', 0x00000100),
+    )
+    ALL_FLAGS_VALUE = 0x0002FFB7
+    ATTRIBUTE_NAME_TO_BIT = dict(FLAG_TABLE)
+
+    @property
+    def archive(self) -> bool:
+        return self._mask & 0x00000020 == 0x00000020
+
+    @archive.setter
+    def archive(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000020
+        else:
+            self._mask &= ~0x00000020
+
+    @property
+    def compressed(self) -> bool:
+        return self._mask & 0x00000800 == 0x00000800
+
+    @compressed.setter
+    def compressed(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000800
+        else:
+            self._mask &= ~0x00000800
+
+    @property
+    def directory(self) -> bool:
+        return self._mask & 0x00000010 == 0x00000010
+
+    @directory.setter
+    def directory(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000010
+        else:
+            self._mask &= ~0x00000010
+
+    @property
+    def encrypted(self) -> bool:
+        return self._mask & 0x00004000 == 0x00004000
+
+    @encrypted.setter
+    def encrypted(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00004000
+        else:
+            self._mask &= ~0x00004000
+
+    @property
+    def hidden(self) -> bool:
+        return self._mask & 0x00000002 == 0x00000002
+
+    @hidden.setter
+    def hidden(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000002
+        else:
+            self._mask &= ~0x00000002
+
+    @property
+    def integrity_stream(self) -> bool:
+        return self._mask & 0x00008000 == 0x00008000
+
+    @integrity_stream.setter
+    def integrity_stream(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00008000
+        else:
+            self._mask &= ~0x00008000
+
+    @property
+    def no_scrub_data(self) -> bool:
+        return self._mask & 0x00020000 == 0x00020000
+
+    @no_scrub_data.setter
+    def no_scrub_data(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00020000
+        else:
+            self._mask &= ~0x00020000
+
+    @property
+    def normal(self) -> bool:
+        return self._mask & 0x00000080 == 0x00000080
+
+    @normal.setter
+    def normal(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000080
+        else:
+            self._mask &= ~0x00000080
+
+    @property
+    def not_content_indexed(self) -> bool:
+        return self._mask & 0x00002000 == 0x00002000
+
+    @not_content_indexed.setter
+    def not_content_indexed(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00002000
+        else:
+            self._mask &= ~0x00002000
+
+    @property
+    def offline(self) -> bool:
+        return self._mask & 0x00001000 == 0x00001000
+
+    @offline.setter
+    def offline(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00001000
+        else:
+            self._mask &= ~0x00001000
+
+    @property
+    def readonly(self) -> bool:
+        return self._mask & 0x00000001 == 0x00000001
+
+    @readonly.setter
+    def readonly(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000001
+        else:
+            self._mask &= ~0x00000001
+
+    @property
+    def reparse_point(self) -> bool:
+        return self._mask & 0x00000400 == 0x00000400
+
+    @reparse_point.setter
+    def reparse_point(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000400
+        else:
+            self._mask &= ~0x00000400
+
+    @property
+    def sparse_file(self) -> bool:
+        return self._mask & 0x00000200 == 0x00000200
+
+    @sparse_file.setter
+    def sparse_file(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000200
+        else:
+            self._mask &= ~0x00000200
+
+    @property
+    def system(self) -> bool:
+        return self._mask & 0x00000004 == 0x00000004
+
+    @system.setter
+    def system(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000004
+        else:
+            self._mask &= ~0x00000004
+
+    @property
+    def temporary(self) -> bool:
+        return self._mask & 0x00000100 == 0x00000100
+
+    @temporary.setter
+    def temporary(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000100
+        else:
+            self._mask &= ~0x00000100
+
+
+class SecurityDescriptorControl(Mask):
+    __slots__ = ()
+
+    INT_FLAG_CLASS = IntFlagClassReference(
+        module_name='msdsalgs.security_types.security_descriptor',
+        qualified_name='SecurityDescriptorControlMask'
+    )
+    FLAG_TABLE = (
+        ('dacl_auto_inherit_req', 0x00000100),
+        ('dacl_auto_inherited', 0x00000400),
+        ('dacl_defaulted', 0x00000008),
+        ('dacl_present', 0x00000004),
+        ('dacl_protected', 0x00001000),
+        ('group_defaulted', 0x00000002),
+        ('owner_defaulted', 0x00000001),
+        ('rm_control_valid', 0x00004000),
+        ('sacl_auto_inherit_req', 0x00000200),
+        ('sacl_auto_inherited', 0x00000800),
+        ('sacl_present', 0x00000010),
+        ('sacl_protected', 0x00002000),
+        ('self_relative', 0x00008000),
+    )
+    ALL_FLAGS_VALUE = 0x0000FF1F
+    ATTRIBUTE_NAME_TO_BIT = dict(FLAG_TABLE)
+
+    @property
+    def dacl_auto_inherit_req(self) -> bool:
+        return self._mask & 0x00000100 == 0x00000100
+
+    @dacl_auto_inherit_req.setter
+    def dacl_auto_inherit_req(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000100
+        else:
+            self._mask &= ~0x00000100
+
+    @property
+    def dacl_auto_inherited(self) -> bool:
+        return self._mask & 0x00000400 == 0x00000400
+
+    @dacl_auto_inherited.setter
+    def dacl_auto_inherited(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000400
+        else:
+            self._mask &= ~0x00000400
+
+    @property
+    def dacl_defaulted(self) -> bool:
+        return self._mask & 0x00000008 == 0x00000008
+
+    @dacl_defaulted.setter
+    def dacl_defaulted(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000008
+        else:
+            self._mask &= ~0x00000008
+
+    @property
+    def dacl_present(self) -> bool:
+        return self._mask & 0x00000004 == 0x00000004
+
+    @dacl_present.setter
+    def dacl_present(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000004
+        else:
+            self._mask &= ~0x00000004
+
+    @property
+    def dacl_protected(self) -> bool:
+        return self._mask & 0x00001000 == 0x00001000
+
+    @dacl_protected.setter
+    def dacl_protected(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00001000
+        else:
+            self._mask &= ~0x00001000
+
+    @property
+    def group_defaulted(self) -> bool:
+        return self._mask & 0x00000002 == 0x00000002
+
+    @group_defaulted.setter
+    def group_defaulted(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000002
+        else:
+            self._mask &= ~0x00000002
+
+    @property
+    def owner_defaulted(self) -> bool:
+        return self._mask & 0x00000001 == 0x00000001
+
+    @owner_defaulted.setter
+    def owner_defaulted(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000001
+        else:
+            self._mask &= ~0x00000001
+
+    @property
+    def rm_control_valid(self) -> bool:
+        return self._mask & 0x00004000 == 0x00004000
+
+    @rm_control_valid.setter
+    def rm_control_valid(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00004000
+        else:
+            self._mask &= ~0x00004000
+
+    @property
+    def sacl_auto_inherit_req(self) -> bool:
+        return self._mask & 0x00000200 == 0x00000200
+
+    @sacl_auto_inherit_req.setter
+    def sacl_auto_inherit_req(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000200
+        else:
+            self._mask &= ~0x00000200
+
+    @property
+    def sacl_auto_inherited(self) -> bool:
+        return self._mask & 0x00000800 == 0x00000800
+
+    @sacl_auto_inherited.setter
+    def sacl_auto_inherited(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000800
+        else:
+            self._mask &= ~0x00000800
+
+    @property
+    def sacl_present(self) -> bool:
+        return self._mask & 0x00000010 == 0x00000010
+
+    @sacl_present.setter
+    def sacl_present(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000010
+        else:
+            self._mask &= ~0x00000010
+
+    @property
+    def sacl_protected(self) -> bool:
+        return self._mask & 0x00002000 == 0x00002000
+
+    @sacl_protected.setter
+    def sacl_protected(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00002000
+        else:
+            self._mask &= ~0x00002000
+
+    @property
+    def self_relative(self) -> bool:
+        return self._mask & 0x00008000 == 0x00008000
+
+    @self_relative.setter
+    def self_relative(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00008000
+        else:
+            self._mask &= ~0x00008000
+
+
+class ActiveDirectoryRights(Mask):
+    __slots__ = ()
+
+    INT_FLAG_CLASS = IntFlagClassReference(
+        module_name='msdsalgs.security_types.ace',
+        qualified_name='ActiveDirectoryRightsMask'
+    )
+    FLAG_TABLE = (
+        ('access_system_security', 0x01000000),
+        ('actrl_ds_list', 0x00000004),
+        ('delete', 0x00010000),
+        ('ds_control_access', 0x00000100),
+        ('ds_create_child', 0x00000001),
+        ('ds_delete_child', 0x00000002),
+        ('ds_delete_tree', 0x00000040),
+        ('ds_list_object', 0x00000080),
+        ('ds_read_prop', 0x00000010),
+        ('ds_self', 0x00000008),
+        ('ds_write_prop', 0x00000020),
+        ('generic_all', 0x10000000),
+        ('generic_execute', 0x20000000),
+        ('generic_read', 0x80000000),
+        ('generic_write', 0x40000000),
+        ('read_control', 0x00020000),
+        ('synchronize', 0x00100000),
+        ('write_dac', 0x00040000),
+        ('write_owner', 0x00080000),
+    )
+    ALL_FLAGS_VALUE = 0xF11F01FF
+    ATTRIBUTE_NAME_TO_BIT = dict(FLAG_TABLE)
+
+    @property
+    def access_system_security(self) -> bool:
+        return self._mask & 0x01000000 == 0x01000000
+
+    @access_system_security.setter
+    def access_system_security(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x01000000
+        else:
+            self._mask &= ~0x01000000
+
+    @property
+    def actrl_ds_list(self) -> bool:
+        return self._mask & 0x00000004 == 0x00000004
+
+    @actrl_ds_list.setter
+    def actrl_ds_list(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000004
+        else:
+            self._mask &= ~0x00000004
+
+    @property
+    def delete(self) -> bool:
+        return self._mask & 0x00010000 == 0x00010000
+
+    @delete.setter
+    def delete(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00010000
+        else:
+            self._mask &= ~0x00010000
+
+    @property
+    def ds_control_access(self) -> bool:
+        return self._mask & 0x00000100 == 0x00000100
+
+    @ds_control_access.setter
+    def ds_control_access(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000100
+        else:
+            self._mask &= ~0x00000100
+
+    @property
+    def ds_create_child(self) -> bool:
+        return self._mask & 0x00000001 == 0x00000001
+
+    @ds_create_child.setter
+    def ds_create_child(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000001
+        else:
+            self._mask &= ~0x00000001
+
+    @property
+    def ds_delete_child(self) -> bool:
+        return self._mask & 0x00000002 == 0x00000002
+
+    @ds_delete_child.setter
+    def ds_delete_child(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000002
+        else:
+            self._mask &= ~0x00000002
+
+    @property
+    def ds_delete_tree(self) -> bool:
+        return self._mask & 0x00000040 == 0x00000040
+
+    @ds_delete_tree.setter
+    def ds_delete_tree(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000040
+        else:
+            self._mask &= ~0x00000040
+
+    @property
+    def ds_list_object(self) -> bool:
+        return self._mask & 0x00000080 == 0x00000080
+
+    @ds_list_object.setter
+    def ds_list_object(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000080
+        else:
+            self._mask &= ~0x00000080
+
+    @property
+    def ds_read_prop(self) -> bool:
+        return self._mask & 0x00000010 == 0x00000010
+
+    @ds_read_prop.setter
+    def ds_read_prop(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000010
+        else:
+            self._mask &= ~0x00000010
+
+    @property
+    def ds_self(self) -> bool:
+        return self._mask & 0x00000008 == 0x00000008
+
+    @ds_self.setter
+    def ds_self(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000008
+        else:
+            self._mask &= ~0x00000008
+
+    @property
+    def ds_write_prop(self) -> bool:
+        return self._mask & 0x00000020 == 0x00000020
+
+    @ds_write_prop.setter
+    def ds_write_prop(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00000020
+        else:
+            self._mask &= ~0x00000020
+
+    @property
+    def generic_all(self) -> bool:
+        return self._mask & 0x10000000 == 0x10000000
+
+    @generic_all.setter
+    def generic_all(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x10000000
+        else:
+            self._mask &= ~0x10000000
+
+    @property
+    def generic_execute(self) -> bool:
+        return self._mask & 0x20000000 == 0x20000000
+
+    @generic_execute.setter
+    def generic_execute(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x20000000
+        else:
+            self._mask &= ~0x20000000
+
+    @property
+    def generic_read(self) -> bool:
+        return self._mask & 0x80000000 == 0x80000000
+
+    @generic_read.setter
+    def generic_read(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x80000000
+        else:
+            self._mask &= ~0x80000000
+
+    @property
+    def generic_write(self) -> bool:
+        return self._mask & 0x40000000 == 0x40000000
+
+    @generic_write.setter
+    def generic_write(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x40000000
+        else:
+            self._mask &= ~0x40000000
+
+    @property
+    def read_control(self) -> bool:
+        return self._mask & 0x00020000 == 0x00020000
+
+    @read_control.setter
+    def read_control(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00020000
+        else:
+            self._mask &= ~0x00020000
+
+    @property
+    def synchronize(self) -> bool:
+        return self._mask & 0x00100000 == 0x00100000
+
+    @synchronize.setter
+    def synchronize(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00100000
+        else:
+            self._mask &= ~0x00100000
+
+    @property
+    def write_dac(self) -> bool:
+        return self._mask & 0x00040000 == 0x00040000
+
+    @write_dac.setter
+    def write_dac(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00040000
+        else:
+            self._mask &= ~0x00040000
+
+    @property
+    def write_owner(self) -> bool:
+        return self._mask & 0x00080000 == 0x00080000
+
+    @write_owner.setter
+    def write_owner(self, value: bool) -> None:
+        if value:
+            self._mask |= 0x00080000
+        else:
+            self._mask &= ~0x00080000
+
+
+GENERATED_MASK_CLASSES = {
+    'FileAttributes': (
+        FileAttributes,
+        ('FileAttributes', 'FILE_ATTRIBUTE_', (
+            ('FILE_ATTRIBUTE_ARCHIVE', 0x00000020),
+            ('FILE_ATTRIBUTE_COMPRESSED', 0x00000800),
+            ('FILE_ATTRIBUTE_DIRECTORY', 0x00000010),
+            ('FILE_ATTRIBUTE_ENCRYPTED', 0x00004000),
+            ('FILE_ATTRIBUTE_HIDDEN', 0x00000002),
+            ('FILE_ATTRIBUTE_NORMAL', 0x00000080),
+            ('FILE_ATTRIBUTE_NOT_CONTENT_INDEXED', 0x00002000),
+            ('FILE_ATTRIBUTE_OFFLINE', 0x00001000),
+            ('FILE_ATTRIBUTE_READONLY', 0x00000001),
+            ('FILE_ATTRIBUTE_REPARSE_POINT', 0x00000400),
+            ('FILE_ATTRIBUTE_SPARSE_FILE', 0x00000200),
+            ('FILE_ATTRIBUTE_SYSTEM', 0x00000004),
+            ('FILE_ATTRIBUTE_TEMPORARY', 0x00000100),
+            ('FILE_ATTRIBUTE_INTEGRITY_STREAM', 0x00008000),
+            ('FILE_ATTRIBUTE_NO_SCRUB_DATA', 0x00020000),
+        ))
+    ),
+    'SecurityDescriptorControl': (
+        SecurityDescriptorControl,
+        ('SecurityDescriptorControl', 'SE_', (
+            ('SE_DACL_AUTO_INHERIT_REQ', 0x00000100),
+            ('SE_DACL_AUTO_INHERITED', 0x00000400),
+            ('SE_DACL_DEFAULTED', 0x00000008),
+            ('SE_DACL_PRESENT', 0x00000004),
+            ('SE_DACL_PROTECTED', 0x00001000),
+            ('SE_GROUP_DEFAULTED', 0x00000002),
+            ('SE_OWNER_DEFAULTED', 0x00000001),
+            ('SE_RM_CONTROL_VALID', 0x00004000),
+            ('SE_SACL_AUTO_INHERIT_REQ', 0x00000200),
+            ('SE_SACL_AUTO_INHERITED', 0x00000800),
+            ('SE_SACL_PRESENT', 0x00000010),
+            ('SE_SACL_PROTECTED', 0x00002000),
+            ('SE_SELF_RELATIVE', 0x00008000),
+        ))
+    ),
+    'ActiveDirectoryRights': (
+        ActiveDirectoryRights,
+        ('ActiveDirectoryRights', 'ADS_RIGHT_', (
+            ('ADS_RIGHT_DS_CREATE_CHILD', 0x00000001),
+            ('ADS_RIGHT_DS_DELETE_CHILD', 0x00000002),
+            ('ADS_RIGHT_ACTRL_DS_LIST', 0x00000004),
+            ('ADS_RIGHT_DS_SELF', 0x00000008),
+            ('ADS_RIGHT_DS_READ_PROP', 0x00000010),
+            ('ADS_RIGHT_DS_WRITE_PROP', 0x00000020),
+            ('ADS_RIGHT_DS_DELETE_TREE', 0x00000040),
+            ('ADS_RIGHT_DS_LIST_OBJECT', 0x00000080),
+            ('ADS_RIGHT_DS_CONTROL_ACCESS', 0x00000100),
+            ('ADS_RIGHT_DELETE', 0x00010000),
+            ('ADS_RIGHT_READ_CONTROL', 0x00020000),
+            ('ADS_RIGHT_WRITE_DAC', 0x00040000),
+            ('ADS_RIGHT_WRITE_OWNER', 0x00080000),
+            ('ADS_RIGHT_SYNCHRONIZE', 0x00100000),
+            ('ADS_RIGHT_ACCESS_SYSTEM_SECURITY', 0x01000000),
+            ('ADS_RIGHT_GENERIC_ALL', 0x10000000),
+            ('ADS_RIGHT_GENERIC_EXECUTE', 0x20000000),
+            ('ADS_RIGHT_GENERIC_WRITE', 0x40000000),
+            ('ADS_RIGHT_GENERIC_READ', 0x80000000),
+        ))
+    ),
+}
@@ -0,0 +1,1002 @@
+# This file is generated by `python -m msdsalgs.status_translation_generation`. Do not edit.
+
+# The translations of `NTSTATUS` values into Win32 error codes, in ascending order of `NTSTATUS` value.
+NT_STATUS_TRANSLATIONS = (
+    (0x00000000, 0x00000000),  # STATUS_SUCCESS
+    (0x00000080, 0x000002DF),  # STATUS_ABANDONED_WAIT_0
+    (0x00000102, 0x000005B4),  # STATUS_TIMEOUT
+    (0x00000103, 0x000003E5),  # STATUS_PENDING -> ERROR_IO_PENDING
+    (0x00000104, 0x000002E5),  # STATUS_REPARSE
+    (0x00000105, 0x000000EA),  # STATUS_MORE_ENTRIES -> ERROR_MORE_DATA
+    (0x00000106, 0x00000514),  # STATUS_NOT_ALL_ASSIGNED
+    (0x00000107, 0x00000515),  # STATUS_SOME_NOT_MAPPED
+    (0x00000108, 0x000002E6),  # STATUS_OPLOCK_BREAK_IN_PROGRESS
+    (0x00000109, 0x000002E7),  # STATUS_VOLUME_MOUNTED
+    (0x0000010A, 0x000002E8),  # STATUS_RXACT_COMMITTED
+    (0x0000010B, 0x000002E9),  # STATUS_NOTIFY_CLEANUP
+    (0x0000010C, 0x000003FE),  # STATUS_NOTIFY_ENUM_DIR
+    (0x0000010D, 0x00000516),  # STATUS_NO_QUOTAS_FOR_ACCOUNT
+    (0x0000010E, 0x000002EA),  # STATUS_PRIMARY_TRANSPORT_CONNECT_FAILED
+    (0x00000110, 0x000002EB),  # STATUS_PAGE_FAULT_TRANSITION
+    (0x00000111, 0x000002EC),  # STATUS_PAGE_FAULT_DEMAND_ZERO
+    (0x00000112, 0x000002ED),  # STATUS_PAGE_FAULT_COPY_ON_WRITE
+    (0x00000113, 0x000002EE),  # STATUS_PAGE_FAULT_GUARD_PAGE
+    (0x00000114, 0x000002EF),  # STATUS_PAGE_FAULT_PAGING_FILE
+    (0x00000115, 0x000002F0),  # STATUS_CACHE_PAGE_LOCKED
+    (0x00000116, 0x000002F1),  # STATUS_CRASH_DUMP
+    (0x00000117, 0x000002F2),  # STATUS_BUFFER_ALL_ZEROS
+    (0x00000118, 0x000002F3),  # STATUS_REPARSE_OBJECT
+    (0x00000119, 0x000002F4),  # STATUS_RESOURCE_REQUIREMENTS_CHANGED
+    (0x00000120, 0x000002F5),  # STATUS_TRANSLATION_COMPLETE
+    (0x00000121, 0x00002009),  # STATUS_DS_MEMBERSHIP_EVALUATED_LOCALLY
+    (0x00000122, 0x000002F6),  # STATUS_NOTHING_TO_TERMINATE
+    (0x00000123, 0x000002F7),  # STATUS_PROCESS_NOT_IN_JOB
+    (0x00000124, 0x000002F8),  # STATUS_PROCESS_IN_JOB
+    (0x00000125, 0x000002F9),  # STATUS_VOLSNAP_HIBERNATE_READY
+    (0x00000126, 0x000002FA),  # STATUS_FSFILTER_OP_COMPLETED_SUCCESSFULLY
+    (0x00000127, 0x000002FB),  # STATUS_INTERRUPT_VECTOR_ALREADY_CONNECTED
+    (0x00000128, 0x000002FC),  # STATUS_INTERRUPT_STILL_CONNECTED
+    (0x00000202, 0x00001A33),  # STATUS_RESOURCEMANAGER_READ_ONLY
+    (0x00000367, 0x000002FD),  # STATUS_WAIT_FOR_OPLOCK
+    (0x40000000, 0x000002BA),  # STATUS_OBJECT_NAME_EXISTS
+    (0x40000001, 0x000002BB),  # STATUS_THREAD_WAS_SUSPENDED
+    (0x40000003, 0x000002BC),  # STATUS_IMAGE_NOT_AT_BASE
+    (0x40000004, 0x000002BD),  # STATUS_RXACT_STATE_CREATED
+    (0x40000005, 0x000002BE),  # STATUS_SEGMENT_NOTIFICATION
+    (0x40000006, 0x00000517),  # STATUS_LOCAL_USER_SESSION_KEY
+    (0x40000007, 0x000002BF),  # STATUS_BAD_CURRENT_DIRECTORY
+    (0x40000009, 0x000003F6),  # STATUS_REGISTRY_RECOVERED
+    (0x4000000A, 0x000002C0),  # STATUS_FT_READ_RECOVERY_FROM_BACKUP
+    (0x4000000B, 0x000002C1),  # STATUS_FT_WRITE_RECOVERY
+    (0x4000000D, 0x00000518),  # STATUS_NULL_LM_PASSWORD
+    (0x4000000E, 0x000002C2),  # STATUS_IMAGE_MACHINE_TYPE_MISMATCH
+    (0x4000000F, 0x000002C3),  # STATUS_RECEIVE_PARTIAL
+    (0x40000010, 0x000002C4),  # STATUS_RECEIVE_EXPEDITED
+    (0x40000011, 0x000002C5),  # STATUS_RECEIVE_PARTIAL_EXPEDITED
+    (0x40000012, 0x000002C6),  # STATUS_EVENT_DONE
+    (0x40000013, 0x000002C7),  # STATUS_EVENT_PENDING
+    (0x40000014, 0x000002C8),  # STATUS_CHECKING_FILE_SYSTEM
+    (0x40000015, 0x000002C9),  # STATUS_FATAL_APP_EXIT
+    (0x40000016, 0x000002CA),  # STATUS_PREDEFINED_HANDLE
+    (0x40000017, 0x000002CB),  # STATUS_WAS_UNLOCKED
+    (0x40000019, 0x000002CD),  # STATUS_WAS_LOCKED
+    (0x4000001B, 0x000002CF),  # STATUS_ALREADY_WIN32
+    (0x40000023, 0x000002D0),  # STATUS_IMAGE_MACHINE_TYPE_MISMATCH_EXE
+    (0x40000024, 0x000002D1),  # STATUS_NO_YIELD_PERFORMED
+    (0x40000025, 0x000002D2),  # STATUS_TIMER_RESUME_IGNORED
+    (0x40000026, 0x000002D3),  # STATUS_ARBITRATION_UNHANDLED
+    (0x40000027, 0x000002D4),  # STATUS_CARDBUS_NOT_SUPPORTED
+    (0x40000029, 0x000002D5),  # STATUS_MP_PROCESSOR_MISMATCH
+    (0x4000002A, 0x000002D6),  # STATUS_HIBERNATED
+    (0x4000002B, 0x000002D7),  # STATUS_RESUME_HIBERNATION
+    (0x4000002C, 0x000002D8),  # STATUS_FIRMWARE_UPDATED
+    (0x4000002D, 0x000002D9),  # STATUS_DRIVERS_LEAKING_LOCKED_PAGES
+    (0x4000002F, 0x0000030E),  # STATUS_SYSTEM_POWERSTATE_TRANSITION
+    (0x40000031, 0x0000030F),  # STATUS_SYSTEM_POWERSTATE_COMPLEX_TRANSITION
+    (0x40000032, 0x00000311),  # STATUS_ACCESS_AUDIT_BY_POLICY
+    (0x40000033, 0x00000313),  # STATUS_ABANDON_HIBERFILE
+    (0x40000294, 0x000002DA),  # STATUS_WAKE_SYSTEM
+    (0x40000370, 0x000020AC),  # STATUS_DS_SHUTTING_DOWN
+    (0x40020056, 0x00000720),  # RPC_NT_UUID_LOCAL_ONLY
+    (0x400200AF, 0x00000779),  # RPC_NT_SEND_INCOMPLETE
+    (0x400A0004, 0x00001B9A),  # STATUS_CTX_CDM_CONNECT
+    (0x400A0005, 0x00001B9B),  # STATUS_CTX_CDM_DISCONNECT
+    (0x40190034, 0x00001AA5),  # STATUS_RECOVERY_NOT_NEEDED
+    (0x40190035, 0x00001AA6),  # STATUS_RM_ALREADY_STARTED
+    (0x401A000C, 0x000019D3),  # STATUS_LOG_NO_RESTART
+    (0x80000002, 0x000003E6),  # STATUS_DATATYPE_MISALIGNMENT -> ERROR_NOACCESS
+    (0x80000005, 0x000000EA),  # STATUS_BUFFER_OVERFLOW -> ERROR_MORE_DATA
+    (0x80000006, 0x00000012),  # STATUS_NO_MORE_FILES
+    (0x80000007, 0x000002A3),  # STATUS_WAKE_SYSTEM_DEBUGGER
+    (0x8000000A, 0x000002A4),  # STATUS_HANDLES_CLOSED
+    (0x8000000B, 0x0000056F),  # STATUS_NO_INHERITANCE
+    (0x8000000C, 0x000002A8),  # STATUS_GUID_SUBSTITUTION_MADE
+    (0x8000000D, 0x0000012B),  # STATUS_PARTIAL_COPY
+    (0x8000000E, 0x0000001C),  # STATUS_DEVICE_PAPER_EMPTY -> ERROR_OUT_OF_PAPER
+    (0x80000012, 0x00000103),  # STATUS_NO_MORE_EAS -> ERROR_NO_MORE_ITEMS
+    (0x80000013, 0x000000FE),  # STATUS_INVALID_EA_NAME
+    (0x80000014, 0x000000FF),  # STATUS_EA_LIST_INCONSISTENT
+    (0x80000015, 0x000000FF),  # STATUS_INVALID_EA_FLAG -> ERROR_EA_LIST_INCONSISTENT
+    (0x80000017, 0x000002A5),  # STATUS_EXTRANEOUS_INFORMATION
+    (0x80000018, 0x000002A6),  # STATUS_RXACT_COMMIT_NECESSARY
+    (0x8000001A, 0x00000103),  # STATUS_NO_MORE_ENTRIES -> ERROR_NO_MORE_ITEMS
+    (0x8000001B, 0x0000044D),  # STATUS_FILEMARK_DETECTED
+    (0x8000001C, 0x00000456),  # STATUS_MEDIA_CHANGED
+    (0x8000001D, 0x00000457),  # STATUS_BUS_RESET
+    (0x8000001E, 0x0000044C),  # STATUS_END_OF_MEDIA
+    (0x8000001F, 0x0000044E),  # STATUS_BEGINNING_OF_MEDIA
+    (0x80000020, 0x000002A7),  # STATUS_MEDIA_CHECK
+    (0x80000021, 0x0000044F),  # STATUS_SETMARK_DETECTED
+    (0x80000022, 0x00000450),  # STATUS_NO_DATA_DETECTED
+    (0x80000023, 0x00000702),  # STATUS_REDIRECTOR_HAS_OPEN_HANDLES
+    (0x80000024, 0x00000713),  # STATUS_SERVER_HAS_OPEN_HANDLES
+    (0x80000026, 0x000002AA),  # STATUS_LONGJUMP
+    (0x80000027, 0x000010F4),  # STATUS_CLEANER_CARTRIDGE_INSTALLED
+    (0x80000028, 0x000002AB),  # STATUS_PLUGPLAY_QUERY_VETOED
+    (0x80000029, 0x000002AC),  # STATUS_UNWIND_CONSOLIDATE
+    (0x8000002A, 0x000002AD),  # STATUS_REGISTRY_HIVE_RECOVERED
+    (0x8000002B, 0x000002AE),  # STATUS_DLL_MIGHT_BE_INSECURE
+    (0x8000002C, 0x000002AF),  # STATUS_DLL_MIGHT_BE_INCOMPATIBLE
+    (0x8000002D, 0x000002A9),  # STATUS_STOPPED_ON_SYMLINK
+    (0x80000288, 0x0000048D),  # STATUS_DEVICE_REQUIRES_CLEANING
+    (0x80000289, 0x0000048E),  # STATUS_DEVICE_DOOR_OPEN
+    (0x80000803, 0x00001ABB),  # STATUS_DATA_LOST_REPAIR
+    (0x80130001, 0x000013C5),  # STATUS_CLUSTER_NODE_ALREADY_UP
+    (0x80130002, 0x000013C6),  # STATUS_CLUSTER_NODE_ALREADY_DOWN
+    (0x80130003, 0x000013C7),  # STATUS_CLUSTER_NETWORK_ALREADY_ONLINE
+    (0x80130004, 0x000013C8),  # STATUS_CLUSTER_NETWORK_ALREADY_OFFLINE
+    (0x80130005, 0x000013C9),  # STATUS_CLUSTER_NODE_ALREADY_MEMBER
+    (0x80190009, 0x000019E5),  # STATUS_COULD_NOT_RESIZE_LOG
+    (0x80190029, 0x00001AA0),  # STATUS_NO_TXF_METADATA
+    (0x80190031, 0x00001AA2),  # STATUS_CANT_RECOVER_WITH_HANDLE_OPEN
+    (0x80190041, 0x00001AB3),  # STATUS_TXF_METADATA_ALREADY_PRESENT
+    (0x80190042, 0x00001AB4),  # STATUS_TRANSACTION_SCOPE_CALLBACKS_NOT_SET
+    (0xC0000001, 0x0000001F),  # STATUS_UNSUCCESSFUL -> ERROR_GEN_FAILURE
+    (0xC0000002, 0x00000001),  # STATUS_NOT_IMPLEMENTED -> ERROR_INVALID_FUNCTION
+    (0xC0000003, 0x00000057),  # STATUS_INVALID_INFO_CLASS -> ERROR_INVALID_PARAMETER
+    (0xC0000004, 0x00000018),  # STATUS_INFO_LENGTH_MISMATCH -> ERROR_BAD_LENGTH
+    (0xC0000005, 0x000003E6),  # STATUS_ACCESS_VIOLATION -> ERROR_NOACCESS
+    (0xC0000006, 0x000003E7),  # STATUS_IN_PAGE_ERROR -> ERROR_SWAPERROR
+    (0xC0000007, 0x000005AE),  # STATUS_PAGEFILE_QUOTA
+    (0xC0000008, 0x00000006),  # STATUS_INVALID_HANDLE
+    (0xC0000009, 0x000003E9),  # STATUS_BAD_INITIAL_STACK -> ERROR_STACK_OVERFLOW
+    (0xC000000B, 0x00000057),  # STATUS_INVALID_CID -> ERROR_INVALID_PARAMETER
+    (0xC000000C, 0x0000021D),  # STATUS_TIMER_NOT_CANCELED
+    (0xC000000D, 0x00000057),  # STATUS_INVALID_PARAMETER
+    (0xC000000E, 0x00000002),  # STATUS_NO_SUCH_DEVICE -> ERROR_FILE_NOT_FOUND
+    (0xC000000F, 0x00000002),  # STATUS_NO_SUCH_FILE -> ERROR_FILE_NOT_FOUND
+    (0xC0000010, 0x00000001),  # STATUS_INVALID_DEVICE_REQUEST -> ERROR_INVALID_FUNCTION
+    (0xC0000011, 0x00000026),  # STATUS_END_OF_FILE -> ERROR_HANDLE_EOF
+    (0xC0000012, 0x00000022),  # STATUS_WRONG_VOLUME -> ERROR_WRONG_DISK
+    (0xC0000013, 0x00000015),  # STATUS_NO_MEDIA_IN_DEVICE -> ERROR_NOT_READY
+    (0xC0000014, 0x000006F9),  # STATUS_UNRECOGNIZED_MEDIA
+    (0xC0000015, 0x0000001B),  # STATUS_NONEXISTENT_SECTOR -> ERROR_SECTOR_NOT_FOUND
+    (0xC0000016, 0x000000EA),  # STATUS_MORE_PROCESSING_REQUIRED -> ERROR_MORE_DATA
+    (0xC0000017, 0x00000008),  # STATUS_NO_MEMORY -> ERROR_NOT_ENOUGH_MEMORY
+    (0xC0000018, 0x000001E7),  # STATUS_CONFLICTING_ADDRESSES -> ERROR_INVALID_ADDRESS
+    (0xC0000019, 0x000001E7),  # STATUS_NOT_MAPPED_VIEW -> ERROR_INVALID_ADDRESS
+    (0xC000001A, 0x00000057),  # STATUS_UNABLE_TO_FREE_VM -> ERROR_INVALID_PARAMETER
+    (0xC000001B, 0x00000057),  # STATUS_UNABLE_TO_DELETE_SECTION -> ERROR_INVALID_PARAMETER
+    (0xC000001C, 0x00000001),  # STATUS_INVALID_SYSTEM_SERVICE -> ERROR_INVALID_FUNCTION
+    (0xC000001E, 0x00000005),  # STATUS_INVALID_LOCK_SEQUENCE -> ERROR_ACCESS_DENIED
+    (0xC000001F, 0x00000005),  # STATUS_INVALID_VIEW_SIZE -> ERROR_ACCESS_DENIED
+    (0xC0000020, 0x000000C1),  # STATUS_INVALID_FILE_FOR_SECTION -> ERROR_BAD_EXE_FORMAT
+    (0xC0000021, 0x00000005),  # STATUS_ALREADY_COMMITTED -> ERROR_ACCESS_DENIED
+    (0xC0000022, 0x00000005),  # STATUS_ACCESS_DENIED
+    (0xC0000023, 0x0000007A),  # STATUS_BUFFER_TOO_SMALL -> ERROR_INSUFFICIENT_BUFFER
+    (0xC0000024, 0x00000006),  # STATUS_OBJECT_TYPE_MISMATCH -> ERROR_INVALID_HANDLE
+    (0xC0000027, 0x0000021E),  # STATUS_UNWIND
+    (0xC0000028, 0x0000021F),  # STATUS_BAD_STACK
+    (0xC0000029, 0x00000220),  # STATUS_INVALID_UNWIND_TARGET
+    (0xC000002A, 0x0000009E),  # STATUS_NOT_LOCKED
+    (0xC000002C, 0x000001E7),  # STATUS_UNABLE_TO_DECOMMIT_VM -> ERROR_INVALID_ADDRESS
+    (0xC000002D, 0x000001E7),  # STATUS_NOT_COMMITTED -> ERROR_INVALID_ADDRESS
+    (0xC000002E, 0x00000057),  # STATUS_INVALID_PORT_ATTRIBUTES -> ERROR_INVALID_PARAMETER
+    (0xC000002F, 0x00000057),  # STATUS_PORT_MESSAGE_TOO_LONG -> ERROR_INVALID_PARAMETER
+    (0xC0000030, 0x00000057),  # STATUS_INVALID_PARAMETER_MIX -> ERROR_INVALID_PARAMETER
+    (0xC0000031, 0x00000057),  # STATUS_INVALID_QUOTA_LOWER -> ERROR_INVALID_PARAMETER
+    (0xC0000032, 0x00000571),  # STATUS_DISK_CORRUPT_ERROR -> ERROR_DISK_CORRUPT
+    (0xC0000033, 0x0000007B),  # STATUS_OBJECT_NAME_INVALID -> ERROR_INVALID_NAME
+    (0xC0000034, 0x00000002),  # STATUS_OBJECT_NAME_NOT_FOUND -> ERROR_FILE_NOT_FOUND
+    (0xC0000035, 0x000000B7),  # STATUS_OBJECT_NAME_COLLISION -> ERROR_ALREADY_EXISTS
+    (0xC0000037, 0x00000006),  # STATUS_PORT_DISCONNECTED -> ERROR_INVALID_HANDLE
+    (0xC0000038, 0x00000224),  # STATUS_DEVICE_ALREADY_ATTACHED
+    (0xC0000039, 0x000000A1),  # STATUS_OBJECT_PATH_INVALID -> ERROR_BAD_PATHNAME
+    (0xC000003A, 0x00000003),  # STATUS_OBJECT_PATH_NOT_FOUND -> ERROR_PATH_NOT_FOUND
+    (0xC000003B, 0x000000A1),  # STATUS_OBJECT_PATH_SYNTAX_BAD -> ERROR_BAD_PATHNAME
+    (0xC000003C, 0x0000045D),  # STATUS_DATA_OVERRUN -> ERROR_IO_DEVICE
+    (0xC000003D, 0x0000045D),  # STATUS_DATA_LATE_ERROR -> ERROR_IO_DEVICE
+    (0xC000003E, 0x00000017),  # STATUS_DATA_ERROR -> ERROR_CRC
+    (0xC000003F, 0x00000017),  # STATUS_CRC_ERROR -> ERROR_CRC
+    (0xC0000040, 0x00000008),  # STATUS_SECTION_TOO_BIG -> ERROR_NOT_ENOUGH_MEMORY
+    (0xC0000041, 0x00000005),  # STATUS_PORT_CONNECTION_REFUSED -> ERROR_ACCESS_DENIED
+    (0xC0000042, 0x00000006),  # STATUS_INVALID_PORT_HANDLE -> ERROR_INVALID_HANDLE
+    (0xC0000043, 0x00000020),  # STATUS_SHARING_VIOLATION
+    (0xC0000044, 0x00000718),  # STATUS_QUOTA_EXCEEDED -> ERROR_NOT_ENOUGH_QUOTA
+    (0xC0000045, 0x00000057),  # STATUS_INVALID_PAGE_PROTECTION -> ERROR_INVALID_PARAMETER
+    (0xC0000046, 0x00000120),  # STATUS_MUTANT_NOT_OWNED -> ERROR_NOT_OWNER
+    (0xC0000047, 0x0000012A),  # STATUS_SEMAPHORE_LIMIT_EXCEEDED -> ERROR_TOO_MANY_POSTS
+    (0xC0000048, 0x00000057),  # STATUS_PORT_ALREADY_SET -> ERROR_INVALID_PARAMETER
+    (0xC0000049, 0x00000057),  # STATUS_SECTION_NOT_IMAGE -> ERROR_INVALID_PARAMETER
+    (0xC000004A, 0x0000009C),  # STATUS_SUSPEND_COUNT_EXCEEDED -> ERROR_SIGNAL_REFUSED
+    (0xC000004B, 0x00000005),  # STATUS_THREAD_IS_TERMINATING -> ERROR_ACCESS_DENIED
+    (0xC000004C, 0x00000057),  # STATUS_BAD_WORKING_SET_LIMIT -> ERROR_INVALID_PARAMETER
+    (0xC000004D, 0x00000057),  # STATUS_INCOMPATIBLE_FILE_MAP -> ERROR_INVALID_PARAMETER
+    (0xC000004E, 0x00000057),  # STATUS_SECTION_PROTECTION -> ERROR_INVALID_PARAMETER
+    (0xC000004F, 0x0000011A),  # STATUS_EAS_NOT_SUPPORTED
+    (0xC0000050, 0x000000FF),  # STATUS_EA_TOO_LARGE -> ERROR_EA_LIST_INCONSISTENT
+    (0xC0000051, 0x00000570),  # STATUS_NONEXISTENT_EA_ENTRY -> ERROR_FILE_CORRUPT
+    (0xC0000052, 0x00000570),  # STATUS_NO_EAS_ON_FILE -> ERROR_FILE_CORRUPT
+    (0xC0000053, 0x00000570),  # STATUS_EA_CORRUPT_ERROR -> ERROR_FILE_CORRUPT
+    (0xC0000054, 0x00000021),  # STATUS_FILE_LOCK_CONFLICT -> ERROR_LOCK_VIOLATION
+    (0xC0000055, 0x00000021),  # STATUS_LOCK_NOT_GRANTED -> ERROR_LOCK_VIOLATION
+    (0xC0000056, 0x00000005),  # STATUS_DELETE_PENDING -> ERROR_ACCESS_DENIED
+    (0xC0000057, 0x00000032),  # STATUS_CTL_FILE_NOT_SUPPORTED -> ERROR_NOT_SUPPORTED
+    (0xC0000058, 0x00000519),  # STATUS_UNKNOWN_REVISION
+    (0xC0000059, 0x0000051A),  # STATUS_REVISION_MISMATCH
+    (0xC000005A, 0x0000051B),  # STATUS_INVALID_OWNER
+    (0xC000005B, 0x0000051C),  # STATUS_INVALID_PRIMARY_GROUP
+    (0xC000005C, 0x0000051D),  # STATUS_NO_IMPERSONATION_TOKEN
+    (0xC000005D, 0x0000051E),  # STATUS_CANT_DISABLE_MANDATORY
+    (0xC000005E, 0x0000051F),  # STATUS_NO_LOGON_SERVERS
+    (0xC000005F, 0x00000520),  # STATUS_NO_SUCH_LOGON_SESSION
+    (0xC0000060, 0x00000521),  # STATUS_NO_SUCH_PRIVILEGE
+    (0xC0000061, 0x00000522),  # STATUS_PRIVILEGE_NOT_HELD
+    (0xC0000062, 0x00000523),  # STATUS_INVALID_ACCOUNT_NAME
+    (0xC0000063, 0x00000524),  # STATUS_USER_EXISTS
+    (0xC0000064, 0x00000525),  # STATUS_NO_SUCH_USER
+    (0xC0000065, 0x00000526),  # STATUS_GROUP_EXISTS
+    (0xC0000066, 0x00000527),  # STATUS_NO_SUCH_GROUP
+    (0xC0000067, 0x00000528),  # STATUS_MEMBER_IN_GROUP
+    (0xC0000068, 0x00000529),  # STATUS_MEMBER_NOT_IN_GROUP
+    (0xC0000069, 0x0000052A),  # STATUS_LAST_ADMIN
+    (0xC000006A, 0x00000056),  # STATUS_WRONG_PASSWORD -> ERROR_INVALID_PASSWORD
+    (0xC000006B, 0x0000052C),  # STATUS_ILL_FORMED_PASSWORD
+    (0xC000006C, 0x0000052D),  # STATUS_PASSWORD_RESTRICTION
+    (0xC000006D, 0x0000052E),  # STATUS_LOGON_FAILURE
+    (0xC000006E, 0x0000052F),  # STATUS_ACCOUNT_RESTRICTION
+    (0xC000006F, 0x00000530),  # STATUS_INVALID_LOGON_HOURS
+    (0xC0000070, 0x00000531),  # STATUS_INVALID_WORKSTATION
+    (0xC0000071, 0x00000532),  # STATUS_PASSWORD_EXPIRED
+    (0xC0000072, 0x00000533),  # STATUS_ACCOUNT_DISABLED
+    (0xC0000073, 0x00000534),  # STATUS_NONE_MAPPED
+    (0xC0000074, 0x00000535),  # STATUS_TOO_MANY_LUIDS_REQUESTED
+    (0xC0000075, 0x00000536),  # STATUS_LUIDS_EXHAUSTED
+    (0xC0000076, 0x00000537),  # STATUS_INVALID_SUB_AUTHORITY
+    (0xC0000077, 0x00000538),  # STATUS_INVALID_ACL
+    (0xC0000078, 0x00000539),  # STATUS_INVALID_SID
+    (0xC0000079, 0x0000053A),  # STATUS_INVALID_SECURITY_DESCR
+    (0xC000007A, 0x0000007F),  # STATUS_PROCEDURE_NOT_FOUND -> ERROR_PROC_NOT_FOUND
+    (0xC000007B, 0x000000C1),  # STATUS_INVALID_IMAGE_FORMAT -> ERROR_BAD_EXE_FORMAT
+    (0xC000007C, 0x000003F0),  # STATUS_NO_TOKEN
+    (0xC000007D, 0x0000053C),  # STATUS_BAD_INHERITANCE_ACL
+    (0xC000007E, 0x0000009E),  # STATUS_RANGE_NOT_LOCKED -> ERROR_NOT_LOCKED
+    (0xC000007F, 0x00000070),  # STATUS_DISK_FULL
+    (0xC0000080, 0x0000053D),  # STATUS_SERVER_DISABLED
+    (0xC0000081, 0x0000053E),  # STATUS_SERVER_NOT_DISABLED
+    (0xC0000084, 0x0000053F),  # STATUS_INVALID_ID_AUTHORITY
+    (0xC0000089, 0x00000714),  # STATUS_RESOURCE_DATA_NOT_FOUND
+    (0xC000008A, 0x00000715),  # STATUS_RESOURCE_TYPE_NOT_FOUND
+    (0xC000008B, 0x00000716),  # STATUS_RESOURCE_NAME_NOT_FOUND
+    (0xC0000095, 0x00000216),  # STATUS_INTEGER_OVERFLOW -> ERROR_ARITHMETIC_OVERFLOW
+    (0xC0000098, 0x000003EE),  # STATUS_FILE_INVALID
+    (0xC0000099, 0x00000540),  # STATUS_ALLOTTED_SPACE_EXCEEDED
+    (0xC000009A, 0x000005AA),  # STATUS_INSUFFICIENT_RESOURCES -> ERROR_NO_SYSTEM_RESOURCES
+    (0xC000009D, 0x0000048F),  # STATUS_DEVICE_NOT_CONNECTED
+    (0xC00000A1, 0x000005AD),  # STATUS_WORKING_SET_QUOTA
+    (0xC00000A2, 0x00000013),  # STATUS_MEDIA_WRITE_PROTECTED -> ERROR_WRITE_PROTECT
+    (0xC00000A3, 0x00000015),  # STATUS_DEVICE_NOT_READY -> ERROR_NOT_READY
+    (0xC00000A4, 0x00000541),  # STATUS_INVALID_GROUP_ATTRIBUTES
+    (0xC00000A5, 0x00000542),  # STATUS_BAD_IMPERSONATION_LEVEL
+    (0xC00000A6, 0x00000543),  # STATUS_CANT_OPEN_ANONYMOUS
+    (0xC00000A7, 0x00000544),  # STATUS_BAD_VALIDATION_CLASS
+    (0xC00000A8, 0x00000545),  # STATUS_BAD_TOKEN_TYPE
+    (0xC00000AA, 0x00000225),  # STATUS_INSTRUCTION_MISALIGNMENT
+    (0xC00000AB, 0x000000E7),  # STATUS_INSTANCE_NOT_AVAILABLE -> ERROR_PIPE_BUSY
+    (0xC00000AC, 0x000000E7),  # STATUS_PIPE_NOT_AVAILABLE -> ERROR_PIPE_BUSY
+    (0xC00000AD, 0x000000E6),  # STATUS_INVALID_PIPE_STATE -> ERROR_BAD_PIPE
+    (0xC00000AE, 0x000000E7),  # STATUS_PIPE_BUSY
+    (0xC00000AF, 0x00000001),  # STATUS_ILLEGAL_FUNCTION -> ERROR_INVALID_FUNCTION
+    (0xC00000B0, 0x000000E9),  # STATUS_PIPE_DISCONNECTED -> ERROR_PIPE_NOT_CONNECTED
+    (0xC00000B1, 0x000000E8),  # STATUS_PIPE_CLOSING -> ERROR_NO_DATA
+    (0xC00000B2, 0x00000217),  # STATUS_PIPE_CONNECTED
+    (0xC00000B3, 0x00000218),  # STATUS_PIPE_LISTENING
+    (0xC00000B4, 0x000000E6),  # STATUS_INVALID_READ_MODE -> ERROR_BAD_PIPE
+    (0xC00000B5, 0x00000079),  # STATUS_IO_TIMEOUT -> ERROR_SEM_TIMEOUT
+    (0xC00000B6, 0x00000026),  # STATUS_FILE_FORCED_CLOSED -> ERROR_HANDLE_EOF
+    (0xC00000B7, 0x00000226),  # STATUS_PROFILING_NOT_STARTED
+    (0xC00000B8, 0x00000227),  # STATUS_PROFILING_NOT_STOPPED
+    (0xC00000B9, 0x00000228),  # STATUS_COULD_NOT_INTERPRET
+    (0xC00000BA, 0x00000005),  # STATUS_FILE_IS_A_DIRECTORY -> ERROR_ACCESS_DENIED
+    (0xC00000BB, 0x00000032),  # STATUS_NOT_SUPPORTED
+    (0xC00000BC, 0x00000033),  # STATUS_REMOTE_NOT_LISTENING -> ERROR_REM_NOT_LIST
+    (0xC00000BD, 0x00000034),  # STATUS_DUPLICATE_NAME -> ERROR_DUP_NAME
+    (0xC00000BE, 0x00000035),  # STATUS_BAD_NETWORK_PATH -> ERROR_BAD_NETPATH
+    (0xC00000BF, 0x00000036),  # STATUS_NETWORK_BUSY
+    (0xC00000C1, 0x00000038),  # STATUS_TOO_MANY_COMMANDS -> ERROR_TOO_MANY_CMDS
+    (0xC00000C2, 0x00000039),  # STATUS_ADAPTER_HARDWARE_ERROR -> ERROR_ADAP_HDW_ERR
+    (0xC00000C3, 0x0000003A),  # STATUS_INVALID_NETWORK_RESPONSE -> ERROR_BAD_NET_RESP
+    (0xC00000C4, 0x0000003B),  # STATUS_UNEXPECTED_NETWORK_ERROR -> ERROR_UNEXP_NET_ERR
+    (0xC00000C5, 0x0000003C),  # STATUS_BAD_REMOTE_ADAPTER -> ERROR_BAD_REM_ADAP
+    (0xC00000C6, 0x0000003D),  # STATUS_PRINT_QUEUE_FULL -> ERROR_PRINTQ_FULL
+    (0xC00000C7, 0x0000003E),  # STATUS_NO_SPOOL_SPACE
+    (0xC00000C8, 0x0000003F),  # STATUS_PRINT_CANCELLED
+    (0xC00000C9, 0x00000040),  # STATUS_NETWORK_NAME_DELETED -> ERROR_NETNAME_DELETED
+    (0xC00000CA, 0x00000041),  # STATUS_NETWORK_ACCESS_DENIED
+    (0xC00000CB, 0x00000042),  # STATUS_BAD_DEVICE_TYPE -> ERROR_BAD_DEV_TYPE
+    (0xC00000CC, 0x00000043),  # STATUS_BAD_NETWORK_NAME -> ERROR_BAD_NET_NAME
+    (0xC00000CD, 0x00000044),  # STATUS_TOO_MANY_NAMES
+    (0xC00000CE, 0x00000045),  # STATUS_TOO_MANY_SESSIONS -> ERROR_TOO_MANY_SESS
+    (0xC00000CF, 0x00000046),  # STATUS_SHARING_PAUSED
+    (0xC00000D0, 0x00000047),  # STATUS_REQUEST_NOT_ACCEPTED -> ERROR_REQ_NOT_ACCEP
+    (0xC00000D2, 0x00000058),  # STATUS_NET_WRITE_FAULT
+    (0xC00000D3, 0x00000229),  # STATUS_PROFILING_AT_LIMIT
+    (0xC00000D4, 0x00000011),  # STATUS_NOT_SAME_DEVICE
+    (0xC00000D7, 0x00000546),  # STATUS_NO_SECURITY_ON_OBJECT
+    (0xC00000D8, 0x0000022A),  # STATUS_CANT_WAIT
+    (0xC00000D9, 0x000000E8),  # STATUS_PIPE_EMPTY -> ERROR_NO_DATA
+    (0xC00000DA, 0x00000547),  # STATUS_CANT_ACCESS_DOMAIN_INFO
+    (0xC00000DB, 0x0000022B),  # STATUS_CANT_TERMINATE_SELF
+    (0xC00000DC, 0x00000548),  # STATUS_INVALID_SERVER_STATE
+    (0xC00000DD, 0x00000549),  # STATUS_INVALID_DOMAIN_STATE
+    (0xC00000DE, 0x0000054A),  # STATUS_INVALID_DOMAIN_ROLE
+    (0xC00000DF, 0x0000054B),  # STATUS_NO_SUCH_DOMAIN
+    (0xC00000E0, 0x0000054C),  # STATUS_DOMAIN_EXISTS
+    (0xC00000E1, 0x0000054D),  # STATUS_DOMAIN_LIMIT_EXCEEDED
+    (0xC00000E2, 0x0000012C),  # STATUS_OPLOCK_NOT_GRANTED
+    (0xC00000E3, 0x0000012D),  # STATUS_INVALID_OPLOCK_PROTOCOL
+    (0xC00000E4, 0x0000054E),  # STATUS_INTERNAL_DB_CORRUPTION
+    (0xC00000E5, 0x0000054F),  # STATUS_INTERNAL_ERROR
+    (0xC00000E6, 0x00000550),  # STATUS_GENERIC_NOT_MAPPED
+    (0xC00000E7, 0x00000551),  # STATUS_BAD_DESCRIPTOR_FORMAT
+    (0xC00000E8, 0x000006F8),  # STATUS_INVALID_USER_BUFFER
+    (0xC00000EA, 0x0000022C),  # STATUS_UNEXPECTED_MM_CREATE_ERR
+    (0xC00000EB, 0x0000022D),  # STATUS_UNEXPECTED_MM_MAP_ERROR
+    (0xC00000EC, 0x0000022E),  # STATUS_UNEXPECTED_MM_EXTEND_ERR
+    (0xC00000ED, 0x00000552),  # STATUS_NOT_LOGON_PROCESS
+    (0xC00000EE, 0x00000553),  # STATUS_LOGON_SESSION_EXISTS
+    (0xC00000FB, 0x00000003),  # STATUS_REDIRECTOR_NOT_STARTED -> ERROR_PATH_NOT_FOUND
+    (0xC00000FD, 0x000003E9),  # STATUS_STACK_OVERFLOW
+    (0xC00000FE, 0x00000554),  # STATUS_NO_SUCH_PACKAGE
+    (0xC00000FF, 0x0000022F),  # STATUS_BAD_FUNCTION_TABLE
+    (0xC0000101, 0x00000091),  # STATUS_DIRECTORY_NOT_EMPTY -> ERROR_DIR_NOT_EMPTY
+    (0xC0000102, 0x00000570),  # STATUS_FILE_CORRUPT_ERROR -> ERROR_FILE_CORRUPT
+    (0xC0000103, 0x0000010B),  # STATUS_NOT_A_DIRECTORY -> ERROR_DIRECTORY
+    (0xC0000104, 0x00000555),  # STATUS_BAD_LOGON_SESSION_STATE
+    (0xC0000105, 0x00000556),  # STATUS_LOGON_SESSION_COLLISION
+    (0xC000010B, 0x00000557),  # STATUS_INVALID_LOGON_TYPE
+    (0xC000010C, 0x00000230),  # STATUS_NO_GUID_TRANSLATION
+    (0xC000010D, 0x00000558),  # STATUS_CANNOT_IMPERSONATE
+    (0xC0000118, 0x00000231),  # STATUS_INVALID_LDT_SIZE
+    (0xC0000119, 0x00000233),  # STATUS_INVALID_LDT_OFFSET
+    (0xC000011A, 0x00000234),  # STATUS_INVALID_LDT_DESCRIPTOR
+    (0xC000011C, 0x00000559),  # STATUS_RXACT_INVALID_STATE
+    (0xC000011D, 0x0000055A),  # STATUS_RXACT_COMMIT_FAILURE
+    (0xC000011F, 0x00000004),  # STATUS_TOO_MANY_OPENED_FILES -> ERROR_TOO_MANY_OPEN_FILES
+    (0xC0000120, 0x000003E3),  # STATUS_CANCELLED -> ERROR_OPERATION_ABORTED
+    (0xC0000121, 0x00000005),  # STATUS_CANNOT_DELETE -> ERROR_ACCESS_DENIED
+    (0xC0000122, 0x000004BA),  # STATUS_INVALID_COMPUTER_NAME -> ERROR_INVALID_COMPUTERNAME
+    (0xC0000123, 0x00000005),  # STATUS_FILE_DELETED -> ERROR_ACCESS_DENIED
+    (0xC0000124, 0x0000055B),  # STATUS_SPECIAL_ACCOUNT
+    (0xC0000125, 0x0000055C),  # STATUS_SPECIAL_GROUP
+    (0xC0000126, 0x0000055D),  # STATUS_SPECIAL_USER
+    (0xC0000127, 0x0000055E),  # STATUS_MEMBERS_PRIMARY_GROUP
+    (0xC0000128, 0x00000006),  # STATUS_FILE_CLOSED -> ERROR_INVALID_HANDLE
+    (0xC0000129, 0x00000235),  # STATUS_TOO_MANY_THREADS
+    (0xC000012A, 0x00000236),  # STATUS_THREAD_NOT_IN_PROCESS
+    (0xC000012B, 0x0000055F),  # STATUS_TOKEN_ALREADY_IN_USE
+    (0xC000012C, 0x00000237),  # STATUS_PAGEFILE_QUOTA_EXCEEDED
+    (0xC000012D, 0x000005AF),  # STATUS_COMMITMENT_LIMIT
+    (0xC0000132, 0x00000238),  # STATUS_LOGON_SERVER_CONFLICT
+    (0xC0000133, 0x00000576),  # STATUS_TIME_DIFFERENCE_AT_DC -> ERROR_TIME_SKEW
+    (0xC0000134, 0x00000239),  # STATUS_SYNCHRONIZATION_REQUIRED
+    (0xC0000135, 0x0000007E),  # STATUS_DLL_NOT_FOUND -> ERROR_MOD_NOT_FOUND
+    (0xC0000136, 0x0000006E),  # STATUS_OPEN_FAILED
+    (0xC0000137, 0x0000023B),  # STATUS_IO_PRIVILEGE_FAILED
+    (0xC0000139, 0x0000007F),  # STATUS_ENTRYPOINT_NOT_FOUND -> ERROR_PROC_NOT_FOUND
+    (0xC000013A, 0x0000023C),  # STATUS_CONTROL_C_EXIT
+    (0xC0000141, 0x0000003B),  # STATUS_INVALID_ADDRESS -> ERROR_UNEXP_NET_ERR
+    (0xC0000142, 0x0000045A),  # STATUS_DLL_INIT_FAILED
+    (0xC0000143, 0x0000023D),  # STATUS_MISSING_SYSTEMFILE
+    (0xC0000144, 0x0000023E),  # STATUS_UNHANDLED_EXCEPTION
+    (0xC0000145, 0x0000023F),  # STATUS_APP_INIT_FAILURE
+    (0xC0000146, 0x00000240),  # STATUS_PAGEFILE_CREATE_FAILED
+    (0xC0000147, 0x00000242),  # STATUS_NO_PAGEFILE
+    (0xC0000148, 0x0000007C),  # STATUS_INVALID_LEVEL
+    (0xC0000149, 0x00000056),  # STATUS_WRONG_PASSWORD_CORE -> ERROR_INVALID_PASSWORD
+    (0xC000014A, 0x00000243),  # STATUS_ILLEGAL_FLOAT_CONTEXT
+    (0xC000014B, 0x0000006D),  # STATUS_PIPE_BROKEN -> ERROR_BROKEN_PIPE
+    (0xC000014C, 0x000003F7),  # STATUS_REGISTRY_CORRUPT
+    (0xC000014D, 0x000003F8),  # STATUS_REGISTRY_IO_FAILED
+    (0xC000014E, 0x00000244),  # STATUS_NO_EVENT_PAIR
+    (0xC000014F, 0x000003ED),  # STATUS_UNRECOGNIZED_VOLUME
+    (0xC0000151, 0x00000560),  # STATUS_NO_SUCH_ALIAS
+    (0xC0000152, 0x00000561),  # STATUS_MEMBER_NOT_IN_ALIAS
+    (0xC0000153, 0x00000562),  # STATUS_MEMBER_IN_ALIAS
+    (0xC0000154, 0x00000563),  # STATUS_ALIAS_EXISTS
+    (0xC0000155, 0x00000564),  # STATUS_LOGON_NOT_GRANTED
+    (0xC0000156, 0x00000565),  # STATUS_TOO_MANY_SECRETS
+    (0xC0000157, 0x00000566),  # STATUS_SECRET_TOO_LONG
+    (0xC0000158, 0x00000567),  # STATUS_INTERNAL_DB_ERROR
+    (0xC0000159, 0x000003EF),  # STATUS_FULLSCREEN_MODE
+    (0xC000015A, 0x00000568),  # STATUS_TOO_MANY_CONTEXT_IDS
+    (0xC000015B, 0x00000569),  # STATUS_LOGON_TYPE_NOT_GRANTED
+    (0xC000015C, 0x000003F9),  # STATUS_NOT_REGISTRY_FILE
+    (0xC000015D, 0x0000056A),  # STATUS_NT_CROSS_ENCRYPTION_REQUIRED
+    (0xC000015E, 0x00000245),  # STATUS_DOMAIN_CTRLR_CONFIG_ERROR
+    (0xC0000161, 0x00000246),  # STATUS_ILLEGAL_CHARACTER
+    (0xC0000163, 0x00000247),  # STATUS_UNDEFINED_CHARACTER
+    (0xC0000164, 0x00000248),  # STATUS_FLOPPY_VOLUME
+    (0xC0000165, 0x00000462),  # STATUS_FLOPPY_ID_MARK_NOT_FOUND
+    (0xC0000166, 0x00000463),  # STATUS_FLOPPY_WRONG_CYLINDER
+    (0xC0000167, 0x00000464),  # STATUS_FLOPPY_UNKNOWN_ERROR
+    (0xC0000168, 0x00000465),  # STATUS_FLOPPY_BAD_REGISTERS
+    (0xC0000169, 0x00000466),  # STATUS_DISK_RECALIBRATE_FAILED
+    (0xC000016A, 0x00000467),  # STATUS_DISK_OPERATION_FAILED
+    (0xC000016B, 0x00000468),  # STATUS_DISK_RESET_FAILED
+    (0xC000016E, 0x00000249),  # STATUS_BIOS_FAILED_TO_CONNECT_INTERRUPT
+    (0xC0000172, 0x00000451),  # STATUS_PARTITION_FAILURE
+    (0xC0000173, 0x00000452),  # STATUS_INVALID_BLOCK_LENGTH
+    (0xC0000174, 0x00000453),  # STATUS_DEVICE_NOT_PARTITIONED
+    (0xC0000175, 0x00000454),  # STATUS_UNABLE_TO_LOCK_MEDIA
+    (0xC0000176, 0x00000455),  # STATUS_UNABLE_TO_UNLOAD_MEDIA
+    (0xC0000177, 0x00000469),  # STATUS_EOM_OVERFLOW
+    (0xC000017A, 0x0000056B),  # STATUS_NO_SUCH_MEMBER
+    (0xC000017B, 0x0000056C),  # STATUS_INVALID_MEMBER
+    (0xC000017C, 0x000003FA),  # STATUS_KEY_DELETED
+    (0xC000017D, 0x000003FB),  # STATUS_NO_LOG_SPACE
+    (0xC000017E, 0x0000056D),  # STATUS_TOO_MANY_SIDS
+    (0xC000017F, 0x0000056E),  # STATUS_LM_CROSS_ENCRYPTION_REQUIRED
+    (0xC0000180, 0x000003FC),  # STATUS_KEY_HAS_CHILDREN
+    (0xC0000181, 0x000003FD),  # STATUS_CHILD_MUST_BE_VOLATILE
+    (0xC0000184, 0x00000016),  # STATUS_INVALID_DEVICE_STATE -> ERROR_BAD_COMMAND
+    (0xC0000187, 0x0000024A),  # STATUS_BACKUP_CONTROLLER
+    (0xC0000188, 0x000005DE),  # STATUS_LOG_FILE_FULL
+    (0xC000018A, 0x000006FA),  # STATUS_NO_TRUST_LSA_SECRET
+    (0xC000018B, 0x000006FB),  # STATUS_NO_TRUST_SAM_ACCOUNT
+    (0xC000018C, 0x000006FC),  # STATUS_TRUSTED_DOMAIN_FAILURE
+    (0xC000018D, 0x000006FD),  # STATUS_TRUSTED_RELATIONSHIP_FAILURE
+    (0xC000018E, 0x000005DC),  # STATUS_EVENTLOG_FILE_CORRUPT
+    (0xC000018F, 0x000005DD),  # STATUS_EVENTLOG_CANT_START
+    (0xC0000190, 0x000006FE),  # STATUS_TRUST_FAILURE
+    (0xC0000191, 0x0000024B),  # STATUS_MUTANT_LIMIT_EXCEEDED
+    (0xC0000192, 0x00000700),  # STATUS_NETLOGON_NOT_STARTED
+    (0xC0000193, 0x00000701),  # STATUS_ACCOUNT_EXPIRED
+    (0xC0000194, 0x0000046B),  # STATUS_POSSIBLE_DEADLOCK
+    (0xC0000197, 0x000005DF),  # STATUS_EVENTLOG_FILE_CHANGED
+    (0xC0000198, 0x0000070F),  # STATUS_NOLOGON_INTERDOMAIN_TRUST_ACCOUNT
+    (0xC0000199, 0x00000710),  # STATUS_NOLOGON_WORKSTATION_TRUST_ACCOUNT
+    (0xC000019A, 0x00000711),  # STATUS_NOLOGON_SERVER_TRUST_ACCOUNT
+    (0xC000019B, 0x00000712),  # STATUS_DOMAIN_TRUST_INCONSISTENT
+    (0xC000019C, 0x0000024C),  # STATUS_FS_DRIVER_REQUIRED
+    (0xC0000202, 0x00000572),  # STATUS_NO_USER_SESSION_KEY
+    (0xC0000203, 0x0000003B),  # STATUS_USER_SESSION_DELETED -> ERROR_UNEXP_NET_ERR
+    (0xC0000204, 0x00000717),  # STATUS_RESOURCE_LANG_NOT_FOUND
+    (0xC000020A, 0x00000034),  # STATUS_ADDRESS_ALREADY_EXISTS -> ERROR_DUP_NAME
+    (0xC000020C, 0x00000040),  # STATUS_CONNECTION_DISCONNECTED -> ERROR_NETNAME_DELETED
+    (0xC000020D, 0x00000040),  # STATUS_CONNECTION_RESET -> ERROR_NETNAME_DELETED
+    (0xC0000218, 0x0000024D),  # STATUS_CANNOT_LOAD_REGISTRY_FILE
+    (0xC0000219, 0x0000024E),  # STATUS_DEBUG_ATTACH_FAILED
+    (0xC000021A, 0x0000024F),  # STATUS_SYSTEM_PROCESS_TERMINATED
+    (0xC000021B, 0x00000250),  # STATUS_DATA_NOT_ACCEPTED
+    (0xC000021C, 0x000017E6),  # STATUS_NO_BROWSER_SERVERS_FOUND
+    (0xC000021D, 0x00000251),  # STATUS_VDM_HARD_ERROR
+    (0xC000021E, 0x00000252),  # STATUS_DRIVER_CANCEL_TIMEOUT
+    (0xC000021F, 0x00000253),  # STATUS_REPLY_MESSAGE_MISMATCH
+    (0xC0000220, 0x0000046C),  # STATUS_MAPPED_ALIGNMENT
+    (0xC0000222, 0x00000254),  # STATUS_LOST_WRITEBEHIND_DATA
+    (0xC0000223, 0x00000255),  # STATUS_CLIENT_SERVER_PARAMETERS_INVALID
+    (0xC0000224, 0x00000773),  # STATUS_PASSWORD_MUST_CHANGE
+    (0xC0000225, 0x00000490),  # STATUS_NOT_FOUND
+    (0xC0000226, 0x00000256),  # STATUS_NOT_TINY_STREAM
+    (0xC0000227, 0x000004FF),  # STATUS_RECOVERY_FAILURE
+    (0xC0000228, 0x00000257),  # STATUS_STACK_OVERFLOW_READ
+    (0xC000022C, 0x00000258),  # STATUS_CONVERT_TO_LARGE
+    (0xC000022D, 0x000004D5),  # STATUS_RETRY
+    (0xC000022E, 0x00000259),  # STATUS_FOUND_OUT_OF_SCOPE
+    (0xC000022F, 0x0000025A),  # STATUS_ALLOCATE_BUCKET
+    (0xC0000231, 0x0000025B),  # STATUS_MARSHALL_OVERFLOW
+    (0xC0000232, 0x0000025C),  # STATUS_INVALID_VARIANT
+    (0xC0000233, 0x00000774),  # STATUS_DOMAIN_CONTROLLER_NOT_FOUND
+    (0xC0000234, 0x00000775),  # STATUS_ACCOUNT_LOCKED_OUT
+    (0xC0000236, 0x000004C9),  # STATUS_CONNECTION_REFUSED
+    (0xC0000237, 0x000004CA),  # STATUS_GRACEFUL_DISCONNECT
+    (0xC0000238, 0x000004CB),  # STATUS_ADDRESS_ALREADY_ASSOCIATED
+    (0xC0000239, 0x000004CC),  # STATUS_ADDRESS_NOT_ASSOCIATED
+    (0xC000023A, 0x000004CD),  # STATUS_CONNECTION_INVALID
+    (0xC000023B, 0x000004CE),  # STATUS_CONNECTION_ACTIVE
+    (0xC000023C, 0x000004CF),  # STATUS_NETWORK_UNREACHABLE
+    (0xC000023D, 0x000004D0),  # STATUS_HOST_UNREACHABLE
+    (0xC000023E, 0x000004D1),  # STATUS_PROTOCOL_UNREACHABLE
+    (0xC000023F, 0x000004D2),  # STATUS_PORT_UNREACHABLE
+    (0xC0000240, 0x000004D3),  # STATUS_REQUEST_ABORTED
+    (0xC0000241, 0x000004D4),  # STATUS_CONNECTION_ABORTED
+    (0xC0000242, 0x0000025D),  # STATUS_BAD_COMPRESSION_BUFFER
+    (0xC0000243, 0x000004C8),  # STATUS_USER_MAPPED_FILE
+    (0xC0000244, 0x0000025E),  # STATUS_AUDIT_FAILED
+    (0xC0000245, 0x0000025F),  # STATUS_TIMER_RESOLUTION_NOT_SET
+    (0xC0000246, 0x000004D6),  # STATUS_CONNECTION_COUNT_LIMIT
+    (0xC0000247, 0x000004D7),  # STATUS_LOGIN_TIME_RESTRICTION
+    (0xC0000248, 0x000004D8),  # STATUS_LOGIN_WKSTA_RESTRICTION
+    (0xC0000250, 0x00000260),  # STATUS_INSUFFICIENT_LOGON_INFO
+    (0xC0000251, 0x00000261),  # STATUS_BAD_DLL_ENTRYPOINT
+    (0xC0000252, 0x00000262),  # STATUS_BAD_SERVICE_ENTRYPOINT
+    (0xC0000254, 0x00000263),  # STATUS_IP_ADDRESS_CONFLICT1
+    (0xC0000255, 0x00000264),  # STATUS_IP_ADDRESS_CONFLICT2
+    (0xC0000256, 0x00000265),  # STATUS_REGISTRY_QUOTA_LIMIT
+    (0xC0000258, 0x00000266),  # STATUS_NO_CALLBACK_ACTIVE
+    (0xC0000259, 0x00000573),  # STATUS_LICENSE_QUOTA_EXCEEDED
+    (0xC000025A, 0x00000267),  # STATUS_PWD_TOO_SHORT
+    (0xC000025B, 0x00000268),  # STATUS_PWD_TOO_RECENT
+    (0xC000025C, 0x00000269),  # STATUS_PWD_HISTORY_CONFLICT
+    (0xC000025F, 0x0000026A),  # STATUS_UNSUPPORTED_COMPRESSION
+    (0xC0000260, 0x0000026B),  # STATUS_INVALID_HW_PROFILE
+    (0xC0000261, 0x0000026C),  # STATUS_INVALID_PLUGPLAY_DEVICE_PATH
+    (0xC0000265, 0x00000476),  # STATUS_TOO_MANY_LINKS
+    (0xC0000266, 0x0000026D),  # STATUS_QUOTA_LIST_INCONSISTENT
+    (0xC0000268, 0x0000026E),  # STATUS_EVALUATION_EXPIRATION
+    (0xC0000269, 0x0000026F),  # STATUS_ILLEGAL_DLL_RELOCATION
+    (0xC000026B, 0x00000270),  # STATUS_DLL_INIT_FAILED_LOGOFF
+    (0xC000026E, 0x00000015),  # STATUS_VOLUME_DISMOUNTED -> ERROR_NOT_READY
+    (0xC0000271, 0x00000271),  # STATUS_VALIDATE_CONTINUE
+    (0xC0000272, 0x00000491),  # STATUS_NO_MATCH
+    (0xC0000273, 0x00000272),  # STATUS_NO_MORE_MATCHES
+    (0xC0000275, 0x00001126),  # STATUS_NOT_A_REPARSE_POINT
+    (0xC0000282, 0x00000273),  # STATUS_RANGE_LIST_CONFLICT
+    (0xC0000283, 0x00000488),  # STATUS_SOURCE_ELEMENT_EMPTY
+    (0xC0000284, 0x00000489),  # STATUS_DESTINATION_ELEMENT_FULL
+    (0xC0000285, 0x0000048A),  # STATUS_ILLEGAL_ELEMENT_ADDRESS
+    (0xC0000286, 0x0000048B),  # STATUS_MAGAZINE_NOT_PRESENT
+    (0xC000028A, 0x00001770),  # STATUS_ENCRYPTION_FAILED
+    (0xC000028B, 0x00001771),  # STATUS_DECRYPTION_FAILED
+    (0xC000028C, 0x00000284),  # STATUS_RANGE_NOT_FOUND
+    (0xC000028D, 0x00001773),  # STATUS_NO_RECOVERY_POLICY
+    (0xC000028E, 0x00001774),  # STATUS_NO_EFS
+    (0xC000028F, 0x00001775),  # STATUS_WRONG_EFS
+    (0xC0000290, 0x00001776),  # STATUS_NO_USER_KEYS
+    (0xC0000291, 0x00001777),  # STATUS_FILE_NOT_ENCRYPTED
+    (0xC0000292, 0x00001778),  # STATUS_NOT_EXPORT_FORMAT
+    (0xC0000293, 0x00001772),  # STATUS_FILE_ENCRYPTED
+    (0xC0000295, 0x00001068),  # STATUS_WMI_GUID_NOT_FOUND
+    (0xC0000296, 0x00001069),  # STATUS_WMI_INSTANCE_NOT_FOUND
+    (0xC0000297, 0x0000106A),  # STATUS_WMI_ITEMID_NOT_FOUND
+    (0xC0000298, 0x0000106B),  # STATUS_WMI_TRY_AGAIN
+    (0xC0000299, 0x0000201A),  # STATUS_SHARED_POLICY
+    (0xC000029A, 0x0000201B),  # STATUS_POLICY_OBJECT_NOT_FOUND
+    (0xC000029B, 0x0000201C),  # STATUS_POLICY_ONLY_IN_DS
+    (0xC000029D, 0x000010FF),  # STATUS_REMOTE_STORAGE_NOT_ACTIVE
+    (0xC000029E, 0x00001100),  # STATUS_REMOTE_STORAGE_MEDIA_ERROR
+    (0xC000029F, 0x00000494),  # STATUS_NO_TRACKING_SERVICE
+    (0xC00002A0, 0x00000274),  # STATUS_SERVER_SID_MISMATCH
+    (0xC00002A1, 0x0000200A),  # STATUS_DS_NO_ATTRIBUTE_OR_VALUE
+    (0xC00002A2, 0x0000200B),  # STATUS_DS_INVALID_ATTRIBUTE_SYNTAX
+    (0xC00002A3, 0x0000200C),  # STATUS_DS_ATTRIBUTE_TYPE_UNDEFINED
+    (0xC00002A4, 0x0000200D),  # STATUS_DS_ATTRIBUTE_OR_VALUE_EXISTS
+    (0xC00002A5, 0x0000200E),  # STATUS_DS_BUSY
+    (0xC00002A6, 0x0000200F),  # STATUS_DS_UNAVAILABLE
+    (0xC00002A7, 0x00002010),  # STATUS_DS_NO_RIDS_ALLOCATED
+    (0xC00002A8, 0x00002011),  # STATUS_DS_NO_MORE_RIDS
+    (0xC00002A9, 0x00002012),  # STATUS_DS_INCORRECT_ROLE_OWNER
+    (0xC00002AA, 0x00002013),  # STATUS_DS_RIDMGR_INIT_ERROR
+    (0xC00002AB, 0x00002014),  # STATUS_DS_OBJ_CLASS_VIOLATION
+    (0xC00002AC, 0x00002015),  # STATUS_DS_CANT_ON_NON_LEAF
+    (0xC00002AD, 0x00002016),  # STATUS_DS_CANT_ON_RDN
+    (0xC00002AE, 0x00002017),  # STATUS_DS_CANT_MOD_OBJ_CLASS
+    (0xC00002B0, 0x00002019),  # STATUS_DS_GC_NOT_AVAILABLE
+    (0xC00002B2, 0x00001127),  # STATUS_REPARSE_ATTRIBUTE_CONFLICT
+    (0xC00002B3, 0x00000275),  # STATUS_CANT_ENABLE_DENY_ONLY
+    (0xC00002B4, 0x00000276),  # STATUS_FLOAT_MULTIPLE_FAULTS
+    (0xC00002B5, 0x00000277),  # STATUS_FLOAT_MULTIPLE_TRAPS
+    (0xC00002B6, 0x00000651),  # STATUS_DEVICE_REMOVED
+    (0xC00002B7, 0x0000049A),  # STATUS_JOURNAL_DELETE_IN_PROGRESS
+    (0xC00002B8, 0x0000049B),  # STATUS_JOURNAL_NOT_ACTIVE
+    (0xC00002B9, 0x00000278),  # STATUS_NOINTERFACE
+    (0xC00002C1, 0x00002024),  # STATUS_DS_ADMIN_LIMIT_EXCEEDED
+    (0xC00002C2, 0x00000279),  # STATUS_DRIVER_FAILED_SLEEP
+    (0xC00002C4, 0x0000027A),  # STATUS_CORRUPT_SYSTEM_FILE
+    (0xC00002C6, 0x00001075),  # STATUS_WMI_READ_ONLY
+    (0xC00002C7, 0x00001076),  # STATUS_WMI_SET_FAILURE
+    (0xC00002C8, 0x0000027B),  # STATUS_COMMITMENT_MINIMUM
+    (0xC00002C9, 0x000004ED),  # STATUS_REG_NAT_CONSUMPTION
+    (0xC00002CA, 0x000010E8),  # STATUS_TRANSPORT_FULL
+    (0xC00002CB, 0x00002138),  # STATUS_DS_SAM_INIT_FAILURE
+    (0xC00002CC, 0x000004E3),  # STATUS_ONLY_IF_CONNECTED
+    (0xC00002CD, 0x00002139),  # STATUS_DS_SENSITIVE_GROUP_VIOLATION
+    (0xC00002CE, 0x0000027C),  # STATUS_PNP_RESTART_ENUMERATION
+    (0xC00002CF, 0x0000049D),  # STATUS_JOURNAL_ENTRY_DELETED
+    (0xC00002D0, 0x0000213A),  # STATUS_DS_CANT_MOD_PRIMARYGROUPID
+    (0xC00002D1, 0x0000027D),  # STATUS_SYSTEM_IMAGE_BAD_SIGNATURE
+    (0xC00002D2, 0x0000027E),  # STATUS_PNP_REBOOT_REQUIRED
+    (0xC00002D4, 0x00002141),  # STATUS_DS_INVALID_GROUP_TYPE
+    (0xC00002D5, 0x00002142),  # STATUS_DS_NO_NEST_GLOBALGROUP_IN_MIXEDDOMAIN
+    (0xC00002D6, 0x00002143),  # STATUS_DS_NO_NEST_LOCALGROUP_IN_MIXEDDOMAIN
+    (0xC00002D7, 0x00002144),  # STATUS_DS_GLOBAL_CANT_HAVE_LOCAL_MEMBER
+    (0xC00002D8, 0x00002145),  # STATUS_DS_GLOBAL_CANT_HAVE_UNIVERSAL_MEMBER
+    (0xC00002D9, 0x00002146),  # STATUS_DS_UNIVERSAL_CANT_HAVE_LOCAL_MEMBER
+    (0xC00002DA, 0x00002147),  # STATUS_DS_GLOBAL_CANT_HAVE_CROSSDOMAIN_MEMBER
+    (0xC00002DB, 0x00002148),  # STATUS_DS_LOCAL_CANT_HAVE_CROSSDOMAIN_LOCAL_MEMBER
+    (0xC00002DC, 0x00002149),  # STATUS_DS_HAVE_PRIMARY_MEMBERS
+    (0xC00002DE, 0x0000027F),  # STATUS_INSUFFICIENT_POWER
+    (0xC00002E1, 0x00002153),  # STATUS_DS_CANT_START
+    (0xC00002E2, 0x00002154),  # STATUS_DS_INIT_FAILURE
+    (0xC00002E3, 0x0000215D),  # STATUS_SAM_INIT_FAILURE
+    (0xC00002E4, 0x00002163),  # STATUS_DS_GC_REQUIRED
+    (0xC00002E5, 0x00002164),  # STATUS_DS_LOCAL_MEMBER_OF_LOCAL_ONLY
+    (0xC00002E6, 0x00002165),  # STATUS_DS_NO_FPO_IN_UNIVERSAL_GROUPS
+    (0xC00002E7, 0x0000216D),  # STATUS_DS_MACHINE_ACCOUNT_QUOTA_EXCEEDED
+    (0xC00002E9, 0x00000577),  # STATUS_CURRENT_DOMAIN_NOT_ALLOWED
+    (0xC00002EA, 0x00000052),  # STATUS_CANNOT_MAKE
+    (0xC00002EB, 0x00000281),  # STATUS_SYSTEM_SHUTDOWN
+    (0xC00002EC, 0x00002171),  # STATUS_DS_INIT_FAILURE_CONSOLE
+    (0xC00002ED, 0x00002172),  # STATUS_DS_SAM_INIT_FAILURE_CONSOLE
+    (0xC00002FE, 0x0000045B),  # STATUS_SHUTDOWN_IN_PROGRESS
+    (0xC00002FF, 0x000004E7),  # STATUS_SERVER_SHUTDOWN_IN_PROGRESS
+    (0xC0000300, 0x000004E6),  # STATUS_NOT_SUPPORTED_ON_SBS
+    (0xC0000301, 0x0000106F),  # STATUS_WMI_GUID_DISCONNECTED
+    (0xC0000302, 0x00001074),  # STATUS_WMI_ALREADY_DISABLED
+    (0xC0000303, 0x0000106E),  # STATUS_WMI_ALREADY_ENABLED
+    (0xC0000320, 0x000004EF),  # STATUS_PKINIT_FAILURE
+    (0xC0000321, 0x000004F0),  # STATUS_SMARTCARD_SUBSYSTEM_FAILURE
+    (0xC0000350, 0x000004E8),  # STATUS_HOST_DOWN
+    (0xC0000352, 0x0000177D),  # STATUS_EFS_ALG_BLOB_TOO_BIG
+    (0xC0000353, 0x00000282),  # STATUS_PORT_NOT_SET
+    (0xC0000354, 0x00000504),  # STATUS_DEBUGGER_INACTIVE
+    (0xC0000355, 0x00000283),  # STATUS_DS_VERSION_CHECK_FAILURE
+    (0xC0000358, 0x00002182),  # STATUS_DS_AG_CANT_HAVE_UNIVERSAL_MEMBER
+    (0xC000035D, 0x000004EB),  # STATUS_APPHELP_BLOCK
+    (0xC000035F, 0x00000286),  # STATUS_NOT_SAFE_MODE_DRIVER
+    (0xC0000365, 0x00000287),  # STATUS_FAILED_DRIVER_ENTRY
+    (0xC0000366, 0x00000288),  # STATUS_DEVICE_ENUMERATION_ERROR
+    (0xC0000368, 0x00000289),  # STATUS_MOUNT_POINT_NOT_RESOLVED
+    (0xC0000369, 0x0000028A),  # STATUS_INVALID_DEVICE_OBJECT_PARAMETER
+    (0xC000036A, 0x0000028B),  # STATUS_MCA_OCCURED
+    (0xC000036C, 0x000004FB),  # STATUS_DRIVER_BLOCKED
+    (0xC000036D, 0x0000028C),  # STATUS_DRIVER_DATABASE_ERROR
+    (0xC000036E, 0x0000028D),  # STATUS_SYSTEM_HIVE_TOO_LARGE
+    (0xC000036F, 0x000004FC),  # STATUS_INVALID_IMPORT_OF_NON_DLL
+    (0xC0000371, 0x000021AC),  # STATUS_NO_SECRETS
+    (0xC0000372, 0x00000312),  # STATUS_ACCESS_DISABLED_NO_SAFER_UI_BY_POLICY
+    (0xC0000388, 0x000004F1),  # STATUS_DOWNGRADE_DETECTED
+    (0xC000038E, 0x0000028E),  # STATUS_DRIVER_FAILED_PRIOR_UNLOAD
+    (0xC0000401, 0x0000078C),  # STATUS_PER_USER_TRUST_QUOTA_EXCEEDED
+    (0xC0000402, 0x0000078D),  # STATUS_ALL_USER_TRUST_QUOTA_EXCEEDED
+    (0xC0000403, 0x0000078E),  # STATUS_USER_DELETE_TRUST_QUOTA_EXCEEDED
+    (0xC0000404, 0x0000217B),  # STATUS_DS_NAME_NOT_UNIQUE
+    (0xC0000405, 0x0000219D),  # STATUS_DS_DUPLICATE_ID_FOUND
+    (0xC0000406, 0x0000219F),  # STATUS_DS_GROUP_CONVERSION_ERROR
+    (0xC0000407, 0x0000028F),  # STATUS_VOLSNAP_PREPARE_HIBERNATE
+    (0xC0000409, 0x00000502),  # STATUS_STACK_BUFFER_OVERRUN
+    (0xC0000410, 0x00000503),  # STATUS_PARAMETER_QUOTA_EXCEEDED
+    (0xC0000411, 0x00000290),  # STATUS_HIBERNATION_FAILURE
+    (0xC0000412, 0x00000505),  # STATUS_DELAY_LOAD_FAILED
+    (0xC0000413, 0x0000078F),  # STATUS_AUTHENTICATION_FIREWALL_FAILED
+    (0xC0000414, 0x00000506),  # STATUS_VDM_DISALLOWED
+    (0xC0000416, 0x0000030D),  # STATUS_INSUFFICIENT_RESOURCE_FOR_SPECIFIED_SHARED_SECTION_SIZE
+    (0xC0000417, 0x00000508),  # STATUS_INVALID_CRUNTIME_PARAMETER
+    (0xC0000419, 0x0000215B),  # STATUS_DS_SRC_SID_EXISTS_IN_FOREST
+    (0xC0000420, 0x0000029C),  # STATUS_ASSERTION_FAILURE
+    (0xC0000421, 0x00000219),  # STATUS_VERIFIER_STOP
+    (0xC0000423, 0x00000300),  # STATUS_CALLBACK_POP_STACK
+    (0xC0000426, 0x00000301),  # STATUS_COMPRESSION_DISABLED
+    (0xC0000427, 0x00000299),  # STATUS_FILE_SYSTEM_LIMITATION
+    (0xC0000428, 0x00000241),  # STATUS_INVALID_IMAGE_HASH
+    (0xC0000429, 0x00000307),  # STATUS_NOT_CAPABLE
+    (0xC000042A, 0x00000308),  # STATUS_REQUEST_OUT_OF_SEQUENCE
+    (0xC000042B, 0x0000050C),  # STATUS_IMPLEMENTATION_LIMIT
+    (0xC000042C, 0x000002E4),  # STATUS_ELEVATION_REQUIRED
+    (0xC0000432, 0x00000509),  # STATUS_BEYOND_VDL
+    (0xC0000441, 0x00001781),  # STATUS_CS_ENCRYPTION_INVALID_SERVER_RESPONSE
+    (0xC0000442, 0x00001782),  # STATUS_CS_ENCRYPTION_UNSUPPORTED_SERVER
+    (0xC0000443, 0x00001783),  # STATUS_CS_ENCRYPTION_EXISTING_ENCRYPTED_FILE
+    (0xC0000444, 0x00001784),  # STATUS_CS_ENCRYPTION_NEW_ENCRYPTED_FILE
+    (0xC0000445, 0x00001785),  # STATUS_CS_ENCRYPTION_FILE_NOT_CSE
+    (0xC0000446, 0x00000513),  # STATUS_INVALID_LABEL
+    (0xC0000450, 0x0000050B),  # STATUS_DRIVER_PROCESS_TERMINATED
+    (0xC0000451, 0x00003B92),  # STATUS_AMBIGUOUS_SYSTEM_DEVICE
+    (0xC0000452, 0x00003BC3),  # STATUS_SYSTEM_DEVICE_NOT_FOUND
+    (0xC0000500, 0x0000060E),  # STATUS_INVALID_TASK_NAME
+    (0xC0000501, 0x0000060F),  # STATUS_INVALID_TASK_INDEX
+    (0xC0000502, 0x00000610),  # STATUS_THREAD_ALREADY_IN_TASK
+    (0xC0000702, 0x000003EA),  # STATUS_INVALID_MESSAGE
+    (0xC0000712, 0x0000050D),  # STATUS_PROCESS_IS_PROTECTED
+    (0xC0000713, 0x00000310),  # STATUS_MCA_EXCEPTION
+    (0xC0000715, 0x000005B7),  # STATUS_SYMLINK_CLASS_DISABLED
+    (0xC0000717, 0x00000459),  # STATUS_NO_UNICODE_TRANSLATION
+    (0xC0000718, 0x000004DA),  # STATUS_ALREADY_REGISTERED
+    (0xC0000800, 0x0000030C),  # STATUS_DISK_REPAIR_DISABLED
+    (0xC0000801, 0x000021A4),  # STATUS_DS_DOMAIN_RENAME_IN_PROGRESS
+    (0xC0000802, 0x0000050F),  # STATUS_DISK_QUOTA_EXCEEDED
+    (0xC0000804, 0x00000510),  # STATUS_CONTENT_BLOCKED
+    (0xC0000901, 0x000000DC),  # STATUS_FILE_CHECKED_OUT
+    (0xC0000902, 0x000000DD),  # STATUS_CHECKOUT_REQUIRED
+    (0xC0000903, 0x000000DE),  # STATUS_BAD_FILE_TYPE
+    (0xC0000904, 0x000000DF),  # STATUS_FILE_TOO_LARGE
+    (0xC0000905, 0x000000E0),  # STATUS_FORMS_AUTH_REQUIRED
+    (0xC0000906, 0x000000E1),  # STATUS_VIRUS_INFECTED
+    (0xC0000907, 0x000000E2),  # STATUS_VIRUS_DELETED
+    (0xC0009898, 0x0000029E),  # STATUS_WOW_ASSERTION
+    (0xC000A080, 0x00000314),  # STATUS_LOST_WRITEBEHIND_DATA_NETWORK_DISCONNECTED
+    (0xC000A081, 0x00000315),  # STATUS_LOST_WRITEBEHIND_DATA_NETWORK_SERVER_ERROR
+    (0xC000A082, 0x00000316),  # STATUS_LOST_WRITEBEHIND_DATA_LOCAL_DISK_ERROR
+    (0xC0020001, 0x000006A4),  # RPC_NT_INVALID_STRING_BINDING
+    (0xC0020002, 0x000006A5),  # RPC_NT_WRONG_KIND_OF_BINDING
+    (0xC0020003, 0x000006A6),  # RPC_NT_INVALID_BINDING
+    (0xC0020004, 0x000006A7),  # RPC_NT_PROTSEQ_NOT_SUPPORTED
+    (0xC0020005, 0x000006A8),  # RPC_NT_INVALID_RPC_PROTSEQ
+    (0xC0020006, 0x000006A9),  # RPC_NT_INVALID_STRING_UUID
+    (0xC0020007, 0x000006AA),  # RPC_NT_INVALID_ENDPOINT_FORMAT
+    (0xC0020008, 0x000006AB),  # RPC_NT_INVALID_NET_ADDR
+    (0xC0020009, 0x000006AC),  # RPC_NT_NO_ENDPOINT_FOUND
+    (0xC002000A, 0x000006AD),  # RPC_NT_INVALID_TIMEOUT
+    (0xC002000B, 0x000006AE),  # RPC_NT_OBJECT_NOT_FOUND
+    (0xC002000C, 0x000006AF),  # RPC_NT_ALREADY_REGISTERED
+    (0xC002000D, 0x000006B0),  # RPC_NT_TYPE_ALREADY_REGISTERED
+    (0xC002000E, 0x000006B1),  # RPC_NT_ALREADY_LISTENING
+    (0xC002000F, 0x000006B2),  # RPC_NT_NO_PROTSEQS_REGISTERED
+    (0xC0020010, 0x000006B3),  # RPC_NT_NOT_LISTENING
+    (0xC0020011, 0x000006B4),  # RPC_NT_UNKNOWN_MGR_TYPE
+    (0xC0020012, 0x000006B5),  # RPC_NT_UNKNOWN_IF
+    (0xC0020013, 0x000006B6),  # RPC_NT_NO_BINDINGS
+    (0xC0020014, 0x000006B7),  # RPC_NT_NO_PROTSEQS
+    (0xC0020015, 0x000006B8),  # RPC_NT_CANT_CREATE_ENDPOINT
+    (0xC0020016, 0x000006B9),  # RPC_NT_OUT_OF_RESOURCES
+    (0xC0020017, 0x000006BA),  # RPC_NT_SERVER_UNAVAILABLE
+    (0xC0020018, 0x000006BB),  # RPC_NT_SERVER_TOO_BUSY
+    (0xC0020019, 0x000006BC),  # RPC_NT_INVALID_NETWORK_OPTIONS
+    (0xC002001A, 0x000006BD),  # RPC_NT_NO_CALL_ACTIVE
+    (0xC002001B, 0x000006BE),  # RPC_NT_CALL_FAILED
+    (0xC002001C, 0x000006BF),  # RPC_NT_CALL_FAILED_DNE
+    (0xC002001D, 0x000006C0),  # RPC_NT_PROTOCOL_ERROR
+    (0xC002001F, 0x000006C2),  # RPC_NT_UNSUPPORTED_TRANS_SYN
+    (0xC0020021, 0x000006C4),  # RPC_NT_UNSUPPORTED_TYPE
+    (0xC0020022, 0x000006C5),  # RPC_NT_INVALID_TAG
+    (0xC0020023, 0x000006C6),  # RPC_NT_INVALID_BOUND
+    (0xC0020024, 0x000006C7),  # RPC_NT_NO_ENTRY_NAME
+    (0xC0020025, 0x000006C8),  # RPC_NT_INVALID_NAME_SYNTAX
+    (0xC0020026, 0x000006C9),  # RPC_NT_UNSUPPORTED_NAME_SYNTAX
+    (0xC0020028, 0x000006CB),  # RPC_NT_UUID_NO_ADDRESS
+    (0xC0020029, 0x000006CC),  # RPC_NT_DUPLICATE_ENDPOINT
+    (0xC002002A, 0x000006CD),  # RPC_NT_UNKNOWN_AUTHN_TYPE
+    (0xC002002B, 0x000006CE),  # RPC_NT_MAX_CALLS_TOO_SMALL
+    (0xC002002C, 0x000006CF),  # RPC_NT_STRING_TOO_LONG
+    (0xC002002D, 0x000006D0),  # RPC_NT_PROTSEQ_NOT_FOUND
+    (0xC002002E, 0x000006D1),  # RPC_NT_PROCNUM_OUT_OF_RANGE
+    (0xC002002F, 0x000006D2),  # RPC_NT_BINDING_HAS_NO_AUTH
+    (0xC0020030, 0x000006D3),  # RPC_NT_UNKNOWN_AUTHN_SERVICE
+    (0xC0020031, 0x000006D4),  # RPC_NT_UNKNOWN_AUTHN_LEVEL
+    (0xC0020032, 0x000006D5),  # RPC_NT_INVALID_AUTH_IDENTITY
+    (0xC0020033, 0x000006D6),  # RPC_NT_UNKNOWN_AUTHZ_SERVICE
+    (0xC0020034, 0x000006D7),  # EPT_NT_INVALID_ENTRY
+    (0xC0020035, 0x000006D8),  # EPT_NT_CANT_PERFORM_OP
+    (0xC0020036, 0x000006D9),  # EPT_NT_NOT_REGISTERED
+    (0xC0020037, 0x000006DA),  # RPC_NT_NOTHING_TO_EXPORT
+    (0xC0020038, 0x000006DB),  # RPC_NT_INCOMPLETE_NAME
+    (0xC0020039, 0x000006DC),  # RPC_NT_INVALID_VERS_OPTION
+    (0xC002003A, 0x000006DD),  # RPC_NT_NO_MORE_MEMBERS
+    (0xC002003B, 0x000006DE),  # RPC_NT_NOT_ALL_OBJS_UNEXPORTED
+    (0xC002003C, 0x000006DF),  # RPC_NT_INTERFACE_NOT_FOUND
+    (0xC002003D, 0x000006E0),  # RPC_NT_ENTRY_ALREADY_EXISTS
+    (0xC002003E, 0x000006E1),  # RPC_NT_ENTRY_NOT_FOUND
+    (0xC002003F, 0x000006E2),  # RPC_NT_NAME_SERVICE_UNAVAILABLE
+    (0xC0020040, 0x000006E3),  # RPC_NT_INVALID_NAF_ID
+    (0xC0020041, 0x000006E4),  # RPC_NT_CANNOT_SUPPORT
+    (0xC0020042, 0x000006E5),  # RPC_NT_NO_CONTEXT_AVAILABLE
+    (0xC0020043, 0x000006E6),  # RPC_NT_INTERNAL_ERROR
+    (0xC0020044, 0x000006E7),  # RPC_NT_ZERO_DIVIDE
+    (0xC0020045, 0x000006E8),  # RPC_NT_ADDRESS_ERROR
+    (0xC0020046, 0x000006E9),  # RPC_NT_FP_DIV_ZERO
+    (0xC0020047, 0x000006EA),  # RPC_NT_FP_UNDERFLOW
+    (0xC0020048, 0x000006EB),  # RPC_NT_FP_OVERFLOW
+    (0xC0020049, 0x000006FF),  # RPC_NT_CALL_IN_PROGRESS
+    (0xC002004A, 0x0000070E),  # RPC_NT_NO_MORE_BINDINGS
+    (0xC002004B, 0x0000076A),  # RPC_NT_GROUP_MEMBER_NOT_FOUND
+    (0xC002004C, 0x0000076B),  # EPT_NT_CANT_CREATE
+    (0xC002004D, 0x0000076C),  # RPC_NT_INVALID_OBJECT
+    (0xC002004F, 0x00000719),  # RPC_NT_NO_INTERFACES
+    (0xC0020050, 0x0000071A),  # RPC_NT_CALL_CANCELLED
+    (0xC0020051, 0x0000071B),  # RPC_NT_BINDING_INCOMPLETE
+    (0xC0020052, 0x0000071C),  # RPC_NT_COMM_FAILURE
+    (0xC0020053, 0x0000071D),  # RPC_NT_UNSUPPORTED_AUTHN_LEVEL
+    (0xC0020054, 0x0000071E),  # RPC_NT_NO_PRINC_NAME
+    (0xC0020055, 0x0000071F),  # RPC_NT_NOT_RPC_ERROR
+    (0xC0020057, 0x00000721),  # RPC_NT_SEC_PKG_ERROR
+    (0xC0020058, 0x00000722),  # RPC_NT_NOT_CANCELLED
+    (0xC0020062, 0x0000077A),  # RPC_NT_INVALID_ASYNC_HANDLE
+    (0xC0020063, 0x0000077B),  # RPC_NT_INVALID_ASYNC_CALL
+    (0xC0020064, 0x000006C1),  # RPC_NT_PROXY_ACCESS_DENIED
+    (0xC0040035, 0x0000029F),  # STATUS_PNP_BAD_MPS_TABLE
+    (0xC0040036, 0x000002A0),  # STATUS_PNP_TRANSLATION_FAILED
+    (0xC0040037, 0x000002A1),  # STATUS_PNP_IRQ_TRANSLATION_FAILED
+    (0xC0040038, 0x000002A2),  # STATUS_PNP_INVALID_ID
+    (0xC0040039, 0x00000F6E),  # STATUS_IO_REISSUE_AS_CACHED
+    (0xC00A0001, 0x00001B59),  # STATUS_CTX_WINSTATION_NAME_INVALID
+    (0xC00A0002, 0x00001B5A),  # STATUS_CTX_INVALID_PD
+    (0xC00A0003, 0x00001B5B),  # STATUS_CTX_PD_NOT_FOUND
+    (0xC00A0006, 0x00001B5F),  # STATUS_CTX_CLOSE_PENDING
+    (0xC00A0007, 0x00001B60),  # STATUS_CTX_NO_OUTBUF
+    (0xC00A0008, 0x00001B61),  # STATUS_CTX_MODEM_INF_NOT_FOUND
+    (0xC00A0009, 0x00001B62),  # STATUS_CTX_INVALID_MODEMNAME
+    (0xC00A000B, 0x00001B64),  # STATUS_CTX_MODEM_RESPONSE_TIMEOUT
+    (0xC00A000C, 0x00001B65),  # STATUS_CTX_MODEM_RESPONSE_NO_CARRIER
+    (0xC00A000D, 0x00001B66),  # STATUS_CTX_MODEM_RESPONSE_NO_DIALTONE
+    (0xC00A000E, 0x00001B67),  # STATUS_CTX_MODEM_RESPONSE_BUSY
+    (0xC00A000F, 0x00001B68),  # STATUS_CTX_MODEM_RESPONSE_VOICE
+    (0xC00A0010, 0x00001B69),  # STATUS_CTX_TD_ERROR
+    (0xC00A0012, 0x00001B8F),  # STATUS_CTX_LICENSE_CLIENT_INVALID
+    (0xC00A0013, 0x00001B8E),  # STATUS_CTX_LICENSE_NOT_AVAILABLE
+    (0xC00A0014, 0x00001B90),  # STATUS_CTX_LICENSE_EXPIRED
+    (0xC00A0015, 0x00001B6E),  # STATUS_CTX_WINSTATION_NOT_FOUND
+    (0xC00A0017, 0x00001B70),  # STATUS_CTX_WINSTATION_BUSY
+    (0xC00A0018, 0x00001B71),  # STATUS_CTX_BAD_VIDEO_MODE
+    (0xC00A0022, 0x00001B7B),  # STATUS_CTX_GRAPHICS_INVALID
+    (0xC00A0024, 0x00001B7E),  # STATUS_CTX_NOT_CONSOLE
+    (0xC00A0026, 0x00001B80),  # STATUS_CTX_CLIENT_QUERY_TIMEOUT
+    (0xC00A0027, 0x00001B81),  # STATUS_CTX_CONSOLE_DISCONNECT
+    (0xC00A0028, 0x00001B82),  # STATUS_CTX_CONSOLE_CONNECT
+    (0xC00A002A, 0x00001B84),  # STATUS_CTX_SHADOW_DENIED
+    (0xC00A002B, 0x00001B85),  # STATUS_CTX_WINSTATION_ACCESS_DENIED
+    (0xC00A002E, 0x00001B89),  # STATUS_CTX_INVALID_WD
+    (0xC00A002F, 0x00001B5C),  # STATUS_CTX_WD_NOT_FOUND
+    (0xC00A0030, 0x00001B8A),  # STATUS_CTX_SHADOW_INVALID
+    (0xC00A0031, 0x00001B8B),  # STATUS_CTX_SHADOW_DISABLED
+    (0xC00A0032, 0x00001B99),  # STATUS_RDP_PROTOCOL_ERROR
+    (0xC00A0033, 0x00001B8D),  # STATUS_CTX_CLIENT_LICENSE_NOT_SET
+    (0xC00A0034, 0x00001B8C),  # STATUS_CTX_CLIENT_LICENSE_IN_USE
+    (0xC00A0035, 0x00001B92),  # STATUS_CTX_SHADOW_ENDED_BY_MODE_CHANGE
+    (0xC00A0036, 0x00001B91),  # STATUS_CTX_SHADOW_NOT_RUNNING
+    (0xC00A0037, 0x00001B7D),  # STATUS_CTX_LOGON_DISABLED
+    (0xC00A0038, 0x00001B9C),  # STATUS_CTX_SECURITY_LAYER_ERROR
+    (0xC00A0039, 0x00001B9D),  # STATUS_TS_INCOMPATIBLE_SESSIONS
+    (0xC00B0001, 0x00003AFC),  # STATUS_MUI_FILE_NOT_FOUND
+    (0xC00B0002, 0x00003AFD),  # STATUS_MUI_INVALID_FILE
+    (0xC00B0003, 0x00003AFE),  # STATUS_MUI_INVALID_RC_CONFIG
+    (0xC00B0004, 0x00003AFF),  # STATUS_MUI_INVALID_LOCALE_NAME
+    (0xC00B0005, 0x00003B00),  # STATUS_MUI_INVALID_ULTIMATEFALLBACK_NAME
+    (0xC00B0006, 0x00003B01),  # STATUS_MUI_FILE_NOT_LOADED
+    (0xC00B0007, 0x00003B02),  # STATUS_RESOURCE_ENUM_USER_STOP
+    (0xC0130001, 0x000013AF),  # STATUS_CLUSTER_INVALID_NODE
+    (0xC0130002, 0x000013B0),  # STATUS_CLUSTER_NODE_EXISTS
+    (0xC0130003, 0x000013B1),  # STATUS_CLUSTER_JOIN_IN_PROGRESS
+    (0xC0130004, 0x000013B2),  # STATUS_CLUSTER_NODE_NOT_FOUND
+    (0xC0130005, 0x000013B3),  # STATUS_CLUSTER_LOCAL_NODE_NOT_FOUND
+    (0xC0130006, 0x000013B4),  # STATUS_CLUSTER_NETWORK_EXISTS
+    (0xC0130007, 0x000013B5),  # STATUS_CLUSTER_NETWORK_NOT_FOUND
+    (0xC0130008, 0x000013B6),  # STATUS_CLUSTER_NETINTERFACE_EXISTS
+    (0xC0130009, 0x000013B7),  # STATUS_CLUSTER_NETINTERFACE_NOT_FOUND
+    (0xC013000A, 0x000013B8),  # STATUS_CLUSTER_INVALID_REQUEST
+    (0xC013000B, 0x000013B9),  # STATUS_CLUSTER_INVALID_NETWORK_PROVIDER
+    (0xC013000C, 0x000013BA),  # STATUS_CLUSTER_NODE_DOWN
+    (0xC013000D, 0x000013BB),  # STATUS_CLUSTER_NODE_UNREACHABLE
+    (0xC013000E, 0x000013BC),  # STATUS_CLUSTER_NODE_NOT_MEMBER
+    (0xC013000F, 0x000013BD),  # STATUS_CLUSTER_JOIN_NOT_IN_PROGRESS
+    (0xC0130010, 0x000013BE),  # STATUS_CLUSTER_INVALID_NETWORK
+    (0xC0130011, 0x00001712),  # STATUS_CLUSTER_NO_NET_ADAPTERS
+    (0xC0130012, 0x000013C0),  # STATUS_CLUSTER_NODE_UP
+    (0xC0130013, 0x000013CE),  # STATUS_CLUSTER_NODE_PAUSED
+    (0xC0130014, 0x000013C2),  # STATUS_CLUSTER_NODE_NOT_PAUSED
+    (0xC0130015, 0x000013C3),  # STATUS_CLUSTER_NO_SECURITY_CONTEXT
+    (0xC0130016, 0x000013C4),  # STATUS_CLUSTER_NETWORK_NOT_INTERNAL
+    (0xC0130017, 0x00001713),  # STATUS_CLUSTER_POISONED
+    (0xC0150001, 0x000036B0),  # STATUS_SXS_SECTION_NOT_FOUND
+    (0xC0150002, 0x000036B1),  # STATUS_SXS_CANT_GEN_ACTCTX
+    (0xC0150003, 0x000036B2),  # STATUS_SXS_INVALID_ACTCTXDATA_FORMAT
+    (0xC0150004, 0x000036B3),  # STATUS_SXS_ASSEMBLY_NOT_FOUND
+    (0xC0150005, 0x000036B4),  # STATUS_SXS_MANIFEST_FORMAT_ERROR
+    (0xC0150006, 0x000036B5),  # STATUS_SXS_MANIFEST_PARSE_ERROR
+    (0xC0150007, 0x000036B6),  # STATUS_SXS_ACTIVATION_CONTEXT_DISABLED
+    (0xC0150008, 0x000036B7),  # STATUS_SXS_KEY_NOT_FOUND
+    (0xC0150009, 0x000036B8),  # STATUS_SXS_VERSION_CONFLICT
+    (0xC015000A, 0x000036B9),  # STATUS_SXS_WRONG_SECTION_TYPE
+    (0xC015000B, 0x000036BA),  # STATUS_SXS_THREAD_QUERIES_DISABLED
+    (0xC015000C, 0x00003701),  # STATUS_SXS_ASSEMBLY_MISSING
+    (0xC015000E, 0x000036BB),  # STATUS_SXS_PROCESS_DEFAULT_ALREADY_SET
+    (0xC015000F, 0x00003704),  # STATUS_SXS_EARLY_DEACTIVATION
+    (0xC0150010, 0x00003705),  # STATUS_SXS_INVALID_DEACTIVATION
+    (0xC0150011, 0x00003706),  # STATUS_SXS_MULTIPLE_DEACTIVATION
+    (0xC0150012, 0x00003709),  # STATUS_SXS_SYSTEM_DEFAULT_ACTIVATION_CONTEXT_EMPTY
+    (0xC0150013, 0x00003707),  # STATUS_SXS_PROCESS_TERMINATION_REQUESTED
+    (0xC0150014, 0x00003702),  # STATUS_SXS_CORRUPT_ACTIVATION_STACK
+    (0xC0150015, 0x00003703),  # STATUS_SXS_CORRUPTION
+    (0xC0150016, 0x0000370A),  # STATUS_SXS_INVALID_IDENTITY_ATTRIBUTE_VALUE
+    (0xC0150017, 0x0000370B),  # STATUS_SXS_INVALID_IDENTITY_ATTRIBUTE_NAME
+    (0xC0150018, 0x0000370C),  # STATUS_SXS_IDENTITY_DUPLICATE_ATTRIBUTE
+    (0xC0150019, 0x0000370D),  # STATUS_SXS_IDENTITY_PARSE_ERROR
+    (0xC015001A, 0x00003712),  # STATUS_SXS_COMPONENT_STORE_CORRUPT
+    (0xC015001B, 0x000036CC),  # STATUS_SXS_FILE_HASH_MISMATCH
+    (0xC015001C, 0x00003715),  # STATUS_SXS_MANIFEST_IDENTITY_SAME_BUT_CONTENTS_DIFFERENT
+    (0xC015001D, 0x00003716),  # STATUS_SXS_IDENTITIES_DIFFERENT
+    (0xC015001E, 0x00003717),  # STATUS_SXS_ASSEMBLY_IS_NOT_A_DEPLOYMENT
+    (0xC015001F, 0x00003718),  # STATUS_SXS_FILE_NOT_PART_OF_ASSEMBLY
+    (0xC0150020, 0x00003713),  # STATUS_ADVANCED_INSTALLER_FAILED
+    (0xC0150021, 0x00003714),  # STATUS_XML_ENCODING_MISMATCH
+    (0xC0150022, 0x00003719),  # STATUS_SXS_MANIFEST_TOO_BIG
+    (0xC0150023, 0x0000371A),  # STATUS_SXS_SETTING_NOT_REGISTERED
+    (0xC0150024, 0x0000371B),  # STATUS_SXS_TRANSACTION_CLOSURE_INCOMPLETE
+    (0xC0190001, 0x00001A90),  # STATUS_TRANSACTIONAL_CONFLICT
+    (0xC0190002, 0x00001A2C),  # STATUS_INVALID_TRANSACTION
+    (0xC0190003, 0x00001A2D),  # STATUS_TRANSACTION_NOT_ACTIVE
+    (0xC0190004, 0x00001A32),  # STATUS_TM_INITIALIZATION_FAILED
+    (0xC0190005, 0x00001A91),  # STATUS_RM_NOT_ACTIVE
+    (0xC0190006, 0x00001A92),  # STATUS_RM_METADATA_CORRUPT
+    (0xC0190007, 0x00001A34),  # STATUS_TRANSACTION_NOT_JOINED
+    (0xC0190008, 0x00001A93),  # STATUS_DIRECTORY_NOT_RM
+    (0xC019000A, 0x00001A95),  # STATUS_TRANSACTIONS_UNSUPPORTED_REMOTE
+    (0xC019000B, 0x00001A96),  # STATUS_LOG_RESIZE_INVALID_SIZE
+    (0xC019000C, 0x00001A9E),  # STATUS_REMOTE_FILE_VERSION_MISMATCH
+    (0xC019000F, 0x00001A36),  # STATUS_CRM_PROTOCOL_ALREADY_EXISTS
+    (0xC0190010, 0x00001A37),  # STATUS_TRANSACTION_PROPAGATION_FAILED
+    (0xC0190011, 0x00001A38),  # STATUS_CRM_PROTOCOL_NOT_FOUND
+    (0xC0190012, 0x00001A35),  # STATUS_TRANSACTION_SUPERIOR_EXISTS
+    (0xC0190013, 0x00001A2E),  # STATUS_TRANSACTION_REQUEST_NOT_VALID
+    (0xC0190014, 0x00001A2F),  # STATUS_TRANSACTION_NOT_REQUESTED
+    (0xC0190015, 0x00001A30),  # STATUS_TRANSACTION_ALREADY_ABORTED
+    (0xC0190016, 0x00001A31),  # STATUS_TRANSACTION_ALREADY_COMMITTED
+    (0xC0190017, 0x00001A39),  # STATUS_TRANSACTION_INVALID_MARSHALL_BUFFER
+    (0xC0190018, 0x00001A3A),  # STATUS_CURRENT_TRANSACTION_NOT_VALID
+    (0xC0190019, 0x00001AB1),  # STATUS_LOG_GROWTH_FAILED
+    (0xC0190021, 0x00001A97),  # STATUS_OBJECT_NO_LONGER_EXISTS
+    (0xC0190022, 0x00001A98),  # STATUS_STREAM_MINIVERSION_NOT_FOUND
+    (0xC0190023, 0x00001A99),  # STATUS_STREAM_MINIVERSION_NOT_VALID
+    (0xC0190024, 0x00001A9A),  # STATUS_MINIVERSION_INACCESSIBLE_FROM_SPECIFIED_TRANSACTION
+    (0xC0190025, 0x00001A9B),  # STATUS_CANT_OPEN_MINIVERSION_WITH_MODIFY_INTENT
+    (0xC0190026, 0x00001A9C),  # STATUS_CANT_CREATE_MORE_STREAM_MINIVERSIONS
+    (0xC0190028, 0x00001A9F),  # STATUS_HANDLE_NO_LONGER_VALID
+    (0xC0190030, 0x00001AA1),  # STATUS_LOG_CORRUPTION_DETECTED
+    (0xC0190032, 0x00001AA3),  # STATUS_RM_DISCONNECTED
+    (0xC0190033, 0x00001AA4),  # STATUS_ENLISTMENT_NOT_SUPERIOR
+    (0xC0190036, 0x00001AA7),  # STATUS_FILE_IDENTITY_NOT_PERSISTENT
+    (0xC0190037, 0x00001AA8),  # STATUS_CANT_BREAK_TRANSACTIONAL_DEPENDENCY
+    (0xC0190038, 0x00001AA9),  # STATUS_CANT_CROSS_RM_BOUNDARY
+    (0xC0190039, 0x00001AAA),  # STATUS_TXF_DIR_NOT_EMPTY
+    (0xC019003A, 0x00001AAB),  # STATUS_INDOUBT_TRANSACTIONS_EXIST
+    (0xC019003B, 0x00001AAC),  # STATUS_TM_VOLATILE
+    (0xC019003C, 0x00001AAD),  # STATUS_ROLLBACK_TIMER_EXPIRED
+    (0xC019003D, 0x00001AAE),  # STATUS_TXF_ATTRIBUTE_CORRUPT
+    (0xC019003E, 0x00001AAF),  # STATUS_EFS_NOT_ALLOWED_IN_TRANSACTION
+    (0xC019003F, 0x00001AB0),  # STATUS_TRANSACTIONAL_OPEN_NOT_ALLOWED
+    (0xC0190040, 0x00001AB2),  # STATUS_TRANSACTED_MAPPING_UNSUPPORTED_REMOTE
+    (0xC0190043, 0x00001AB5),  # STATUS_TRANSACTION_REQUIRED_PROMOTION
+    (0xC0190044, 0x00001AB6),  # STATUS_CANNOT_EXECUTE_FILE_IN_TRANSACTION
+    (0xC0190045, 0x00001AB7),  # STATUS_TRANSACTIONS_NOT_FROZEN
+    (0xC0190046, 0x00001AB8),  # STATUS_TRANSACTION_FREEZE_IN_PROGRESS
+    (0xC0190047, 0x00001AB9),  # STATUS_NOT_SNAPSHOT_VOLUME
+    (0xC0190048, 0x00001ABA),  # STATUS_NO_SAVEPOINT_WITH_OPEN_FILES
+    (0xC0190049, 0x00001ABC),  # STATUS_SPARSE_NOT_ALLOWED_IN_TRANSACTION
+    (0xC019004A, 0x00001ABD),  # STATUS_TM_IDENTITY_MISMATCH
+    (0xC019004B, 0x00001ABE),  # STATUS_FLOATED_SECTION
+    (0xC019004C, 0x00001ABF),  # STATUS_CANNOT_ACCEPT_TRANSACTED_WORK
+    (0xC019004D, 0x00001AC0),  # STATUS_CANNOT_ABORT_TRANSACTIONS
+    (0xC019004E, 0x00001A3B),  # STATUS_TRANSACTION_NOT_FOUND
+    (0xC019004F, 0x00001A3C),  # STATUS_RESOURCEMANAGER_NOT_FOUND
+    (0xC0190050, 0x00001A3D),  # STATUS_ENLISTMENT_NOT_FOUND
+    (0xC0190051, 0x00001A3E),  # STATUS_TRANSACTIONMANAGER_NOT_FOUND
+    (0xC0190052, 0x00001A3F),  # STATUS_TRANSACTIONMANAGER_NOT_ONLINE
+    (0xC0190053, 0x00001A40),  # STATUS_TRANSACTIONMANAGER_RECOVERY_NAME_COLLISION
+    (0xC01A0001, 0x000019C8),  # STATUS_LOG_SECTOR_INVALID
+    (0xC01A0002, 0x000019C9),  # STATUS_LOG_SECTOR_PARITY_INVALID
+    (0xC01A0003, 0x000019CA),  # STATUS_LOG_SECTOR_REMAPPED
+    (0xC01A0004, 0x000019CB),  # STATUS_LOG_BLOCK_INCOMPLETE
+    (0xC01A0005, 0x000019CC),  # STATUS_LOG_INVALID_RANGE
+    (0xC01A0006, 0x000019CD),  # STATUS_LOG_BLOCKS_EXHAUSTED
+    (0xC01A0007, 0x000019CE),  # STATUS_LOG_READ_CONTEXT_INVALID
+    (0xC01A0008, 0x000019CF),  # STATUS_LOG_RESTART_INVALID
+    (0xC01A0009, 0x000019D0),  # STATUS_LOG_BLOCK_VERSION
+    (0xC01A000A, 0x000019D1),  # STATUS_LOG_BLOCK_INVALID
+    (0xC01A000B, 0x000019D2),  # STATUS_LOG_READ_MODE_INVALID
+    (0xC01A000D, 0x000019D4),  # STATUS_LOG_METADATA_CORRUPT
+    (0xC01A000E, 0x000019D5),  # STATUS_LOG_METADATA_INVALID
+    (0xC01A000F, 0x000019D6),  # STATUS_LOG_METADATA_INCONSISTENT
+    (0xC01A0010, 0x000019D7),  # STATUS_LOG_RESERVATION_INVALID
+    (0xC01A0011, 0x000019D8),  # STATUS_LOG_CANT_DELETE
+    (0xC01A0012, 0x000019D9),  # STATUS_LOG_CONTAINER_LIMIT_EXCEEDED
+    (0xC01A0013, 0x000019DA),  # STATUS_LOG_START_OF_LOG
+    (0xC01A0014, 0x000019DB),  # STATUS_LOG_POLICY_ALREADY_INSTALLED
+    (0xC01A0015, 0x000019DC),  # STATUS_LOG_POLICY_NOT_INSTALLED
+    (0xC01A0016, 0x000019DD),  # STATUS_LOG_POLICY_INVALID
+    (0xC01A0017, 0x000019DE),  # STATUS_LOG_POLICY_CONFLICT
+    (0xC01A0018, 0x000019DF),  # STATUS_LOG_PINNED_ARCHIVE_TAIL
+    (0xC01A0019, 0x000019E0),  # STATUS_LOG_RECORD_NONEXISTENT
+    (0xC01A001A, 0x000019E1),  # STATUS_LOG_RECORDS_RESERVED_INVALID
+    (0xC01A001B, 0x000019E2),  # STATUS_LOG_SPACE_RESERVED_INVALID
+    (0xC01A001C, 0x000019E3),  # STATUS_LOG_TAIL_INVALID
+    (0xC01A001D, 0x000019E4),  # STATUS_LOG_FULL
+    (0xC01A001E, 0x000019E6),  # STATUS_LOG_MULTIPLEXED
+    (0xC01A001F, 0x000019E7),  # STATUS_LOG_DEDICATED
+    (0xC01A0020, 0x000019E8),  # STATUS_LOG_ARCHIVE_NOT_IN_PROGRESS
+    (0xC01A0021, 0x000019E9),  # STATUS_LOG_ARCHIVE_IN_PROGRESS
+    (0xC01A0022, 0x000019EA),  # STATUS_LOG_EPHEMERAL
+    (0xC01A0023, 0x000019EB),  # STATUS_LOG_NOT_ENOUGH_CONTAINERS
+    (0xC01A0024, 0x000019EC),  # STATUS_LOG_CLIENT_ALREADY_REGISTERED
+    (0xC01A0025, 0x000019ED),  # STATUS_LOG_CLIENT_NOT_REGISTERED
+    (0xC01A0026, 0x000019EE),  # STATUS_LOG_FULL_HANDLER_IN_PROGRESS
+    (0xC01A0027, 0x000019EF),  # STATUS_LOG_CONTAINER_READ_FAILED
+    (0xC01A0028, 0x000019F0),  # STATUS_LOG_CONTAINER_WRITE_FAILED
+    (0xC01A0029, 0x000019F1),  # STATUS_LOG_CONTAINER_OPEN_FAILED
+    (0xC01A002A, 0x000019F2),  # STATUS_LOG_CONTAINER_STATE_INVALID
+    (0xC01A002B, 0x000019F3),  # STATUS_LOG_STATE_INVALID
+    (0xC01A002C, 0x000019F4),  # STATUS_LOG_PINNED
+    (0xC01A002D, 0x000019F5),  # STATUS_LOG_METADATA_FLUSH_FAILED
+    (0xC01A002E, 0x000019F6),  # STATUS_LOG_INCONSISTENT_SECURITY
+    (0xC01A002F, 0x000019F7),  # STATUS_LOG_APPENDED_FLUSH_FAILED
+    (0xC01A0030, 0x000019F8),  # STATUS_LOG_PINNED_RESERVATION
+)
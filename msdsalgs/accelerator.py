@@ -0,0 +1,70 @@
+"""
+The optional compiled accelerator of the hot binary codecs.
+
+The modules listed in `ACCELERATED_MODULES` can be compiled with Cython from their unmodified Python sources, by
+building the package with the environment variable `MSDSALGS_BUILD_ACCELERATOR` set, e.g.:
+
+    MSDSALGS_BUILD_ACCELERATOR=1 pip install .
+
+A compiled module is an extension module with the same name as the source module, which the import system prefers
+over the source; where no extension module has been built, the pure-Python module is imported as usual. Setting the
+environment variable `MSDSALGS_NO_ACCELERATOR` before `msdsalgs` is imported makes the source modules be imported
+even where extension modules have been built, e.g. to compare the two.
+"""
+
+from __future__ import annotations
+from importlib.abc import MetaPathFinder
+from importlib.machinery import FileFinder, SourceFileLoader, SOURCE_SUFFIXES, ModuleSpec
+from importlib.util import find_spec
+from sys import meta_path
+from typing import Tuple, Optional, Sequence
+
+ACCELERATED_MODULES: Tuple[str, ...] = (
+    'msdsalgs.security_types.sid',
+    'msdsalgs.security_types.ace',
+    'msdsalgs.security_types.acl',
+    'msdsalgs.fscc.file_information',
+    'msdsalgs.time'
+)
+
+
+class SourceOnlyFinder(MetaPathFinder):
+    """
+    A finder importing the accelerated modules from their Python sources, ignoring built extension modules.
+    """
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]], target=None) -> Optional[ModuleSpec]:
+        if fullname not in ACCELERATED_MODULES or not path:
+            return None
+
+        for directory in path:
+            spec: Optional[ModuleSpec] = FileFinder(directory, (SourceFileLoader, SOURCE_SUFFIXES)).find_spec(fullname)
+            if spec is not None:
+                return spec
+
+        return None
+
+
+def install_source_only_finder() -> None:
+    if not any(isinstance(finder, SourceOnlyFinder) for finder in meta_path):
+        meta_path.insert(0, SourceOnlyFinder())
+
+
+def is_accelerated(module_name: str) -> bool:
+    """
+    Determine whether a module is imported from a compiled extension module.
+
+    :param module_name: The name of one of the `ACCELERATED_MODULES`.
+    :return: Whether the module is, or will be, imported from a compiled extension module.
+    """
+
+    spec: Optional[ModuleSpec] = find_spec(module_name)
+    return spec is not None and spec.origin is not None and not spec.origin.endswith(tuple(SOURCE_SUFFIXES))
+
+
+def accelerated_modules() -> Tuple[str, ...]:
+    """
+    :return: The names of the accelerated modules that are imported from compiled extension modules.
+    """
+
+    return tuple(module_name for module_name in ACCELERATED_MODULES if is_accelerated(module_name))
@@ -1,6 +1,8 @@
 from struct import pack as struct_pack
 from Crypto.Cipher import AES, DES
 
+from msdsalgs.instrumentation import instrumented
+
 
 def has_odd_parity(n: int) -> bool:
     has_add_parity = False
@@ -10,6 +12,7 @@ def has_odd_parity(n: int) -> bool:
     return has_add_parity
 
 
+@instrumented('crypto.transform_des_key')
 def transform_des_key(input_key: bytes) -> bytes:
     """
     Transform a 7-byte key to a 8-byte key.
@@ -43,6 +46,7 @@ def transform_des_key(input_key: bytes) -> bytes:
     return bytes(out_key)
 
 
+@instrumented('crypto.decrypt_aes')
 def decrypt_aes(key: bytes, value, initialization_vector=b'\x00' * 16) -> bytes:
     """
 
@@ -0,0 +1,272 @@
+"""
+A compressed, read-only store of the descriptions of the error catalogs, keyed by exception class name.
+
+A store file starts with `MAGIC` and a `HEADER_STRUCT` header (the number of keys, the number of distinct
+descriptions, the number of compressed blocks and the number of descriptions per block), followed by little-endian
+`uint32` tables and the data they refer to:
+
+- the offsets of the keys in the key blob, followed by the length of the blob,
+- the key blob, the ASCII encoded keys concatenated in ascending order,
+- the index of the description of each key,
+- the offsets of the compressed blocks, relative to the first block, followed by the length of the blocks,
+- the blocks, each a zlib compressed run of NUL-separated UTF-8 encoded descriptions.
+
+The file is read through `mmap` where possible, and a description is decompressed only when it is first requested.
+Recently decoded descriptions are kept in an LRU cache.
+
+A store is made with `write_description_store`. The stores of the error catalogs are generated from JSON sources by
+`msdsalgs.description_store_generation`; their descriptions are changed by editing the sources.
+"""
+
+from __future__ import annotations
+from array import array
+from functools import lru_cache
+from mmap import mmap, ACCESS_READ
+from os import PathLike
+from struct import Struct
+from sys import byteorder
+from typing import Union, ByteString, Optional, Iterator, Tuple, Mapping, Dict, List, Any, Type
+from zlib import compress as zlib_compress, decompress as zlib_decompress
+
+MAGIC = b'MSDSDSC1'
+
+# The number of keys, the number of distinct descriptions, the number of compressed blocks and the number of
+# descriptions per block.
+HEADER_STRUCT = Struct('<IIII')
+
+BLOCK_SIZE = 64
+
+
+class BadDescriptionStoreError(Exception):
+    pass
+
+
+def _uint32_table(data: ByteString, offset: int, num_items: int) -> Union[memoryview, array]:
+    table: memoryview = memoryview(data)[offset:offset + 4 * num_items].cast('I')
+    if byteorder == 'little':
+        return table
+
+    swapped_table = array('I', table)
+    swapped_table.byteswap()
+    return swapped_table
+
+
+class DescriptionStore:
+    """
+    A read-only view of a description store.
+    """
+
+    def __init__(self, data: ByteString, cache_size: Optional[int] = 1024):
+        """
+        :param data: The contents of a store file, e.g. an `mmap`.
+        :param cache_size: The maximum number of decoded descriptions to keep; `None` for no limit.
+        """
+
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise BadDescriptionStoreError('The data is not a description store.')
+
+        self._data: ByteString = data
+
+        num_keys, num_descriptions, num_blocks, block_size = HEADER_STRUCT.unpack_from(data, len(MAGIC))
+        offset: int = len(MAGIC) + HEADER_STRUCT.size
+
+        self._key_offsets = _uint32_table(data=data, offset=offset, num_items=num_keys + 1)
+        offset += 4 * (num_keys + 1)
+
+        self._keys_offset: int = offset
+        offset += self._key_offsets[num_keys]
+
+        self._description_indices = _uint32_table(data=data, offset=offset, num_items=num_keys)
+        offset += 4 * num_keys
+
+        self._block_offsets = _uint32_table(data=data, offset=offset, num_items=num_blocks + 1)
+        offset += 4 * (num_blocks + 1)
+
+        self._blocks_offset: int = offset
+        self._num_keys: int = num_keys
+        self._num_descriptions: int = num_descriptions
+        self._block_size: int = block_size
+
+        self.description_at = lru_cache(maxsize=cache_size)(self._decode_description)
+
+    @classmethod
+    def from_path(cls, path: Union[str, PathLike], **options) -> DescriptionStore:
+        with open(path, 'rb') as file:
+            return cls(data=mmap(file.fileno(), 0, access=ACCESS_READ), **options)
+
+    @classmethod
+    def from_resource(cls, package: str, resource_name: str, **options) -> DescriptionStore:
+        """
+        Open a store shipped as a package resource, mapping it into memory if it is a file on disk.
+
+        :param package: The name of the package containing the resource.
+        :param resource_name: The name of the resource.
+        :return: The store.
+        """
+
+        # Imported here, as `importlib.resources` pulls in several modules that are otherwise unneeded at import.
+        from importlib.resources import files as importlib_resources_files
+        from pathlib import Path
+
+        resource = importlib_resources_files(package) / resource_name
+        if isinstance(resource, Path):
+            return cls.from_path(path=resource, **options)
+
+        return cls(data=resource.read_bytes(), **options)
+
+    def _key_bytes(self, index: int) -> bytes:
+        return bytes(
+            self._data[self._keys_offset + self._key_offsets[index]:self._keys_offset + self._key_offsets[index + 1]]
+        )
+
+    def _decode_description(self, description_index: int) -> str:
+        block_index, index_in_block = divmod(description_index, self._block_size)
+        block_start: int = self._blocks_offset + self._block_offsets[block_index]
+        block_end: int = self._blocks_offset + self._block_offsets[block_index + 1]
+
+        block: bytes = zlib_decompress(self._data[block_start:block_end])
+
+        start: int = 0
+        for _ in range(index_in_block):
+            start = block.index(b'\x00', start) + 1
+        end: int = block.find(b'\x00', start)
+
+        return block[start:end if end != -1 else len(block)].decode(encoding='utf-8')
+
+    def index(self, key: str) -> Optional[int]:
+        """
+        Find the position of a key in the store.
+
+        :param key: The key to find.
+        :return: The position of the key; `None` if the store has no such key.
+        """
+
+        key_bytes: bytes = key.encode(encoding='ascii', errors='replace')
+
+        low, high = 0, self._num_keys
+        while low < high:
+            middle: int = (low + high) // 2
+            if self._key_bytes(middle) < key_bytes:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low if low < self._num_keys and self._key_bytes(low) == key_bytes else None
+
+    def description_index(self, index: int) -> int:
+        """
+        :param index: The position of a key in the store.
+        :return: The index of the key's description among the distinct descriptions.
+        """
+
+        return self._description_indices[index]
+
+    def description(self, key: str) -> Optional[str]:
+        index: Optional[int] = self.index(key)
+        return self.description_at(self._description_indices[index]) if index is not None else None
+
+    def keys(self) -> Iterator[str]:
+        return (self._key_bytes(index).decode(encoding='ascii') for index in range(self._num_keys))
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return (
+            (key, self.description_at(self._description_indices[index]))
+            for index, key in enumerate(self.keys())
+        )
+
+    @property
+    def num_descriptions(self) -> int:
+        return self._num_descriptions
+
+    def __contains__(self, key: str) -> bool:
+        return self.index(key) is not None
+
+    def __len__(self) -> int:
+        return self._num_keys
+
+
+class StoredDescription:
+    """
+    A descriptor providing the `DESCRIPTION` of an exception class from a description store, by the class's name.
+
+    A class without a description in the store inherits that of the first class of its method resolution order that
+    has one, and gets `NotImplemented` if none does. The store is opened when a description is first requested.
+    """
+
+    def __init__(self, package: str, resource_name: str):
+        self._package: str = package
+        self._resource_name: str = resource_name
+        self._store: Optional[DescriptionStore] = None
+
+    @property
+    def store(self) -> DescriptionStore:
+        if self._store is None:
+            self._store = DescriptionStore.from_resource(package=self._package, resource_name=self._resource_name)
+        return self._store
+
+    def __get__(self, instance: Optional[Any], owner: Type) -> str:
+        store: DescriptionStore = self.store
+        for cls in owner.__mro__:
+            description: Optional[str] = store.description(cls.__name__)
+            if description is not None:
+                return description
+
+        return NotImplemented
+
+
+def write_description_store(
+    path: Union[str, PathLike],
+    key_to_description: Mapping[str, str],
+    block_size: int = BLOCK_SIZE
+) -> None:
+    """
+    Write a description store.
+
+    :param path: The path of the file to write.
+    :param key_to_description: A mapping of ASCII keys to descriptions, which must not contain NUL characters.
+    :param block_size: The number of descriptions per compressed block.
+    :return: None
+    """
+
+    keys: List[str] = sorted(key_to_description)
+
+    descriptions: List[str] = []
+    description_to_index: Dict[str, int] = {}
+    description_indices = array('I')
+    for key in keys:
+        description: str = key_to_description[key]
+        if '\x00' in description:
+            raise ValueError(f'The description of {key} contains a NUL character.')
+        if (description_index := description_to_index.get(description)) is None:
+            description_index = description_to_index[description] = len(descriptions)
+            descriptions.append(description)
+        description_indices.append(description_index)
+
+    key_blob = bytearray()
+    key_offsets = array('I', [0])
+    for key in keys:
+        key_blob += key.encode(encoding='ascii')
+        key_offsets.append(len(key_blob))
+
+    blocks: List[bytes] = [
+        zlib_compress('\x00'.join(descriptions[start:start + block_size]).encode(encoding='utf-8'), 9)
+        for start in range(0, len(descriptions), block_size)
+    ]
+    block_offsets = array('I', [0])
+    for block in blocks:
+        block_offsets.append(block_offsets[-1] + len(block))
+
+    tables: List[array] = [key_offsets, description_indices, block_offsets]
+    if byteorder != 'little':
+        for table in tables:
+            table.byteswap()
+
+    with open(path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(HEADER_STRUCT.pack(len(keys), len(descriptions), len(blocks), block_size))
+        file.write(key_offsets.tobytes())
+        file.write(key_blob)
+        file.write(description_indices.tobytes())
+        file.write(block_offsets.tobytes())
+        for block in blocks:
+            file.write(block)
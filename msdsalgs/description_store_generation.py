@@ -0,0 +1,60 @@
+"""
+Generation of the description stores of the error catalogs.
+
+The descriptions of the `NTSTATUS` and Win32 error classes are kept, keyed by exception class name, in JSON files in
+the `data` directory of the repository, where they can be reviewed and edited. This module writes them into the
+description stores shipped as resources of the `msdsalgs` package.
+
+Regenerate the stores with:
+
+    python -m msdsalgs.description_store_generation
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from json import loads as json_loads
+from pathlib import Path
+from typing import Dict, Tuple
+
+from msdsalgs.description_store import write_description_store
+
+SOURCE_DIRECTORY_PATH = Path(__file__).parent.parent / 'data'
+STORE_DIRECTORY_PATH = Path(__file__).parent
+
+
+@dataclass(frozen=True)
+class DescriptionStoreSpec:
+    source_name: str
+    resource_name: str
+
+    @property
+    def source_path(self) -> Path:
+        return SOURCE_DIRECTORY_PATH / self.source_name
+
+    @property
+    def store_path(self) -> Path:
+        return STORE_DIRECTORY_PATH / self.resource_name
+
+
+DESCRIPTION_STORE_SPECS: Tuple[DescriptionStoreSpec, ...] = (
+    DescriptionStoreSpec(source_name='ntstatus_descriptions.json', resource_name='ntstatus_descriptions.bin'),
+    DescriptionStoreSpec(source_name='win32_error_descriptions.json', resource_name='win32_error_descriptions.bin'),
+)
+
+
+def read_descriptions(spec: DescriptionStoreSpec) -> Dict[str, str]:
+    """
+    :param spec: The specification of a description store.
+    :return: The descriptions of the source of the store, by exception class name.
+    """
+
+    return json_loads(spec.source_path.read_text(encoding='utf-8'))
+
+
+def main():
+    for spec in DESCRIPTION_STORE_SPECS:
+        write_description_store(path=spec.store_path, key_to_description=read_descriptions(spec))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+from struct import Struct
+from typing import Generic, TypeVar, Type, List, ByteString, AsyncIterator, AsyncIterable, Union, Optional, Protocol
+from asyncio import StreamReader
+
+
+class ChainedRecord(Protocol):
+    """
+    A record in a chain of records linked by their `NextEntryOffset` fields, e.g. `FileDirectoryInformation`,
+    `FileIdFullDirectoryInformation` or `FileNotifyInformation`.
+    """
+
+    # The size of the fixed part of the record, preceding the file name.
+    structure_size: int
+    # The offset of the `FileNameLength` field in the record.
+    file_name_length_offset: int
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ChainedRecord:
+        ...
+
+
+ChainedRecordT = TypeVar('ChainedRecordT', bound=ChainedRecord)
+
+
+class IncompleteChainedRecordsError(Exception):
+    def __init__(self, num_remaining_bytes: int, msg: Optional[str] = None):
+        super().__init__(
+            msg or f'The data ended before the last record in the chain was complete: {num_remaining_bytes} bytes remain.'
+        )
+        self.num_remaining_bytes = num_remaining_bytes
+
+
+class ChainedRecordParser(Generic[ChainedRecordT]):
+    """
+    An incremental parser of chained FSCC records, such as those in a `QUERY_DIRECTORY` or `CHANGE_NOTIFY` response.
+
+    Data is pushed to the parser in chunks of any size with `feed`, which returns the records completed by the chunk.
+    A record is complete once `NextEntryOffset` bytes of it are available or, for the last record in the chain, once
+    its file name is.
+    """
+
+    _UINT32_STRUCT = Struct('<I')
+
+    def __init__(self, record_class: Type[ChainedRecordT]):
+        """
+        :param record_class: The class of the records in the chain.
+        """
+
+        self.record_class: Type[ChainedRecordT] = record_class
+
+        self._buffer = bytearray()
+        # The offset in the buffer of the record currently being parsed.
+        self._offset = 0
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the last record in the chain, the one whose `NextEntryOffset` is `0`, has been parsed."""
+        return self._finished
+
+    @property
+    def unused_data(self) -> bytes:
+        """Data fed to the parser after the end of the chain."""
+        return bytes(self._buffer[self._offset:]) if self._finished else b''
+
+    def feed(self, data: ByteString) -> List[ChainedRecordT]:
+        """
+        Add data to the parser.
+
+        :param data: The next chunk of the chained records.
+        :return: The records that were completed by the chunk.
+        """
+
+        self._buffer += data
+
+        if self._finished:
+            return []
+
+        records: List[ChainedRecordT] = []
+        buffer: bytearray = self._buffer
+        offset: int = self._offset
+        uint32_unpack_from = self._UINT32_STRUCT.unpack_from
+        structure_size: int = self.record_class.structure_size
+        file_name_length_offset: int = self.record_class.file_name_length_offset
+
+        while len(buffer) - offset >= structure_size:
+            next_entry_offset: int = uint32_unpack_from(buffer, offset)[0]
+            if next_entry_offset != 0:
+                record_len: int = next_entry_offset
+            else:
+                record_len: int = structure_size + uint32_unpack_from(buffer, offset + file_name_length_offset)[0]
+
+            if len(buffer) - offset < record_len:
+                break
+
+            records.append(self.record_class.from_bytes(buffer[offset:offset+record_len]))
+            offset += record_len
+
+            if next_entry_offset == 0:
+                self._finished = True
+                break
+
+        if not self._finished and offset > len(buffer) // 2:
+            # Discard the parsed data, so that the buffer does not grow with the whole chain.
+            del buffer[:offset]
+            offset = 0
+
+        self._offset = offset
+
+        return records
+
+    def close(self) -> None:
+        """
+        Signal that no more data is to be fed to the parser.
+
+        :raises IncompleteChainedRecordsError: The data ended in the middle of the chain.
+        """
+
+        if not self._finished and len(self._buffer) > self._offset:
+            raise IncompleteChainedRecordsError(num_remaining_bytes=len(self._buffer) - self._offset)
+
+    async def records(
+        self,
+        stream: Union[StreamReader, AsyncIterable[ByteString]],
+        chunk_size: int = 65536
+    ) -> AsyncIterator[ChainedRecordT]:
+        """
+        Parse the records of a chain read from an asynchronous stream, yielding each record as soon as it is complete.
+
+        :param stream: A stream reader, or an asynchronous iterable of chunks, from which to read the chain.
+        :param chunk_size: The maximum number of bytes to read at a time from a stream reader.
+        :return: An asynchronous iterator of the records in the chain.
+        """
+
+        if isinstance(stream, StreamReader):
+            while not self._finished:
+                chunk: bytes = await stream.read(chunk_size)
+                if not chunk:
+                    break
+                for record in self.feed(data=chunk):
+                    yield record
+        else:
+            async for chunk in stream:
+                for record in self.feed(data=chunk):
+                    yield record
+                if self._finished:
+                    break
+
+        self.close()
@@ -0,0 +1,210 @@
+"""
+An on-disk cache of directory listings, stored as the raw buffers of `QUERY_DIRECTORY` responses.
+
+The cache is an append-only file starting with `MAGIC`, followed by records consisting of a `RECORD_HEADER_STRUCT`
+header (the length of the buffer, its file information class and the length of the directory path), the UTF-8 encoded
+directory path and the buffer itself. The most recently appended record of a path supersedes the earlier ones.
+
+The file is read through `mmap`, so that the buffers can be decoded on demand without being read into memory first,
+and so that several processes can share the same snapshot.
+"""
+
+from __future__ import annotations
+from mmap import mmap, ACCESS_READ
+from os import PathLike
+from struct import Struct
+from typing import Union, ByteString, Dict, Tuple, Iterator, Optional, BinaryIO, List
+
+from msdsalgs.fscc.file_information_classes import FileInformationClass, DirectoryInformation, iter_directory_buffer
+
+MAGIC = b'MSDSDLC1'
+
+# The length of the buffer, its file information class and the length of the directory path.
+RECORD_HEADER_STRUCT = Struct('<IIH')
+
+
+class BadDirectoryListingCacheError(Exception):
+    pass
+
+
+class DirectoryListingCacheWriter:
+    """
+    Append directory listings to a cache file, creating it if it does not exist.
+    """
+
+    def __init__(self, path: Union[str, PathLike]):
+        self._file: BinaryIO = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+
+    def append(
+        self,
+        directory_path: str,
+        file_information_class: Union[FileInformationClass, int],
+        data: ByteString
+    ) -> None:
+        """
+        Append the listing of a directory.
+
+        :param directory_path: The path of the listed directory.
+        :param file_information_class: The file information class with which the directory was queried.
+        :param data: The buffer of chained entries from the `QUERY_DIRECTORY` response(s).
+        """
+
+        directory_path_bytes: bytes = directory_path.encode(encoding='utf-8')
+
+        # The record is written with a single call, so that it is not interleaved with those of other writers.
+        self._file.write(
+            b''.join([
+                RECORD_HEADER_STRUCT.pack(len(data), int(file_information_class), len(directory_path_bytes)),
+                directory_path_bytes,
+                data
+            ])
+        )
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> DirectoryListingCacheWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class DirectoryListingCache:
+    """
+    A read-only, memory-mapped view of a directory listing cache file.
+
+    Buffers obtained with `raw_buffer` refer to the mapped memory and must be released before the cache is closed. A
+    mapping replaced by `refresh` is unmapped by the first `refresh` or `close` after no such buffers refer to it.
+    """
+
+    def __init__(self, path: Union[str, PathLike]):
+        self._file: BinaryIO = open(path, 'rb')
+        self._mmap: Optional[mmap] = None
+        self._view: memoryview = memoryview(b'')
+        # Mappings replaced by `refresh` that buffers obtained with `raw_buffer` still refer to.
+        self._retired_mmaps: List[mmap] = []
+        # A mapping of directory paths to the offsets and lengths of their buffers and their file information classes.
+        self._index: Dict[str, Tuple[int, int, FileInformationClass]] = {}
+        self._indexed_len = 0
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Map the records that have been appended to the file since it was last mapped.
+        """
+
+        self._file.seek(0, 2)
+        file_len: int = self._file.tell()
+        if file_len < len(MAGIC):
+            raise BadDirectoryListingCacheError('The file is not a directory listing cache.')
+
+        if self._mmap is not None:
+            if file_len == len(self._mmap):
+                self._release_retired_mmaps()
+                return
+            self._view.release()
+            self._retired_mmaps.append(self._mmap)
+
+        self._mmap = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._release_retired_mmaps()
+
+        if self._indexed_len == 0:
+            if self._view[:len(MAGIC)] != MAGIC:
+                raise BadDirectoryListingCacheError('The file is not a directory listing cache.')
+            self._indexed_len = len(MAGIC)
+
+        offset: int = self._indexed_len
+        view_len: int = len(self._view)
+        while offset + RECORD_HEADER_STRUCT.size <= view_len:
+            data_len, file_information_class, directory_path_len = RECORD_HEADER_STRUCT.unpack_from(self._view, offset)
+
+            directory_path_offset: int = offset + RECORD_HEADER_STRUCT.size
+            data_offset: int = directory_path_offset + directory_path_len
+            record_end_offset: int = data_offset + data_len
+            # A record that is still being written is ignored until the next refresh.
+            if record_end_offset > view_len:
+                break
+
+            directory_path = str(self._view[directory_path_offset:data_offset], encoding='utf-8')
+            self._index[directory_path] = (data_offset, data_len, FileInformationClass(file_information_class))
+
+            offset = record_end_offset
+
+        self._indexed_len = offset
+
+    def _release_retired_mmaps(self) -> None:
+        """
+        Unmap the replaced mappings that no buffers refer to anymore.
+        """
+
+        exported_mmaps: List[mmap] = []
+        for retired_mmap in self._retired_mmaps:
+            try:
+                retired_mmap.close()
+            except BufferError:
+                exported_mmaps.append(retired_mmap)
+
+        self._retired_mmaps = exported_mmaps
+
+    def file_information_class(self, directory_path: str) -> FileInformationClass:
+        return self._index[directory_path][2]
+
+    def raw_buffer(self, directory_path: str) -> memoryview:
+        """
+        Retrieve the buffer of a directory listing, without copying it.
+
+        :param directory_path: The path of the listed directory.
+        :return: A view of the buffer in the mapped memory.
+        """
+
+        data_offset, data_len, _ = self._index[directory_path]
+        return self._view[data_offset:data_offset+data_len]
+
+    def entries(self, directory_path: str) -> Iterator[DirectoryInformation]:
+        """
+        Iterate over the entries of a directory listing, decoding each from the mapped memory as it is reached.
+
+        :param directory_path: The path of the listed directory.
+        :return: An iterator of the entries of the directory.
+        """
+
+        data_offset, data_len, file_information_class = self._index[directory_path]
+        with self._view[:data_offset+data_len] as data:
+            yield from iter_directory_buffer(
+                file_information_class=file_information_class,
+                data=data,
+                base_offset=data_offset
+            )
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._retired_mmaps.append(self._mmap)
+            self._mmap = None
+        self._release_retired_mmaps()
+        self._file.close()
+
+        if self._retired_mmaps:
+            raise BufferError('Buffers obtained with `raw_buffer` must be released before the cache is closed.')
+
+    def __contains__(self, directory_path: str) -> bool:
+        return directory_path in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __enter__(self) -> DirectoryListingCache:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
-from struct import pack as struct_pack, unpack as struct_unpack
-from typing import ClassVar
+from struct import Struct
+from typing import ClassVar, ByteString, Optional
 
 from .file_attributes import FileAttributes
 from msdsalgs.time import filetime_to_datetime
@@ -10,6 +10,21 @@ from msdsalgs.time import filetime_to_datetime
 
 @dataclass
 class FileInformation:
+    # The last four slots memoize the `datetime` representations of the `FILETIME` values.
+    __slots__ = (
+        '_creation_time',
+        '_last_access_time',
+        '_last_write_time',
+        '_change_time',
+        'allocation_size',
+        'endof_file',
+        'file_attributes',
+        '_creation_datetime',
+        '_last_access_datetime',
+        '_last_write_datetime',
+        '_change_datetime'
+    )
+
     _creation_time: int
     _last_access_time: int
     _last_write_time: int
@@ -20,44 +35,86 @@ class FileInformation:
 
     structure_size: ClassVar[int] = 52
 
+    _STRUCT: ClassVar[Struct] = Struct('<QQQQQQI')
+
     @property
-    def creation_time(self) -> datetime:
-        return filetime_to_datetime(filetime=self._creation_time)
+    def creation_time(self) -> Optional[datetime]:
+        try:
+            return self._creation_datetime
+        except AttributeError:
+            self._creation_datetime = filetime_to_datetime(filetime=self._creation_time)
+            return self._creation_datetime
 
     @property
-    def last_access_time(self) -> datetime:
-        return filetime_to_datetime(filetime=self._last_access_time)
+    def last_access_time(self) -> Optional[datetime]:
+        try:
+            return self._last_access_datetime
+        except AttributeError:
+            self._last_access_datetime = filetime_to_datetime(filetime=self._last_access_time)
+            return self._last_access_datetime
 
     @property
-    def last_write_time(self) -> datetime:
-        return filetime_to_datetime(filetime=self._last_write_time)
+    def last_write_time(self) -> Optional[datetime]:
+        try:
+            return self._last_write_datetime
+        except AttributeError:
+            self._last_write_datetime = filetime_to_datetime(filetime=self._last_write_time)
+            return self._last_write_datetime
 
     @property
-    def change_time(self) -> datetime:
-        return filetime_to_datetime(filetime=self._change_time)
+    def change_time(self) -> Optional[datetime]:
+        try:
+            return self._change_datetime
+        except AttributeError:
+            self._change_datetime = filetime_to_datetime(filetime=self._change_time)
+            return self._change_datetime
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> FileInformation:
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> FileInformation:
+        (
+            creation_time, last_access_time, last_write_time, change_time, allocation_size, endof_file, file_attributes
+        ) = cls._STRUCT.unpack_from(data, base_offset)
+
         return cls(
-            _creation_time=struct_unpack('<Q', data[:8])[0],
-            _last_access_time=struct_unpack('<Q', data[8:16])[0],
-            _last_write_time=struct_unpack('<Q', data[16:24])[0],
-            _change_time=struct_unpack('<Q', data[24:32])[0],
-            allocation_size=struct_unpack('<Q', data[32:40])[0],
-            endof_file=struct_unpack('<Q', data[40:48])[0],
-            file_attributes=FileAttributes.from_int(struct_unpack('<I', data[48:56])[0])
+            _creation_time=creation_time,
+            _last_access_time=last_access_time,
+            _last_write_time=last_write_time,
+            _change_time=change_time,
+            allocation_size=allocation_size,
+            endof_file=endof_file,
+            file_attributes=FileAttributes.from_int(file_attributes)
+        )
+
+    def pack_into(self, buffer: bytearray | memoryview, offset: int = 0) -> None:
+        """
+        Write the structure into a buffer.
+
+        :param buffer: A writable buffer with at least `structure_size` bytes available at `offset`.
+        :param offset: The offset in the buffer at which to write the structure.
+        """
+
+        self._STRUCT.pack_into(
+            buffer,
+            offset,
+            self._creation_time,
+            self._last_access_time,
+            self._last_write_time,
+            self._change_time,
+            self.allocation_size,
+            self.endof_file,
+            int(self.file_attributes)
         )
 
     def __bytes__(self) -> bytes:
-        return b''.join([
-            struct_pack('<Q', self._creation_time),
-            struct_pack('<Q', self._last_access_time),
-            struct_pack('<Q', self._last_write_time),
-            struct_pack('<Q', self._change_time),
-            struct_pack('<Q', self.allocation_size),
-            struct_pack('<Q', self.endof_file),
-            struct_pack('<I', int(self.file_attributes))
-        ])
+        return self._STRUCT.pack(
+            self._creation_time,
+            self._last_access_time,
+            self._last_write_time,
+            self._change_time,
+            self.allocation_size,
+            self.endof_file,
+            int(self.file_attributes)
+        )
 
     def __len__(self) -> int:
         return self.structure_size
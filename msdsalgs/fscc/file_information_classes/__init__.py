@@ -1,7 +1,14 @@
+from __future__ import annotations
 from enum import IntEnum
+from typing import Dict, Type, Union, List, ByteString, Iterator
 
 from .file_directory_information import FileDirectoryInformation
+from .file_full_directory_information import FileFullDirectoryInformation
 from .file_id_full_directory_information import FileIdFullDirectoryInformation
+from .file_both_directory_information import FileBothDirectoryInformation
+from .file_id_both_directory_information import FileIdBothDirectoryInformation
+from .file_id_extd_directory_information import FileIdExtdDirectoryInformation
+from .file_names_information import FileNamesInformation
 
 
 # TODO: These should be in caps, should they not?
@@ -13,3 +20,75 @@ class FileInformationClass(IntEnum):
     FileBothDirectoryInformation = 0x03
     FileIdBothDirectoryInformation = 0x25
     FileNamesInformation = 0x0C
+    FileIdExtdDirectoryInformation = 0x3C
+
+
+DirectoryInformation = Union[
+    FileDirectoryInformation,
+    FileFullDirectoryInformation,
+    FileIdFullDirectoryInformation,
+    FileBothDirectoryInformation,
+    FileIdBothDirectoryInformation,
+    FileIdExtdDirectoryInformation,
+    FileNamesInformation
+]
+
+# Each decoder class unpacks the fixed part of its structure with a single precompiled `Struct`.
+FILE_INFORMATION_CLASS_TO_DECODER: Dict[FileInformationClass, Type[DirectoryInformation]] = {
+    FileInformationClass.FileDirectoryInformation: FileDirectoryInformation,
+    FileInformationClass.FileFullDirectoryInformation: FileFullDirectoryInformation,
+    FileInformationClass.FileIdFullDirectoryInformation: FileIdFullDirectoryInformation,
+    FileInformationClass.FileBothDirectoryInformation: FileBothDirectoryInformation,
+    FileInformationClass.FileIdBothDirectoryInformation: FileIdBothDirectoryInformation,
+    FileInformationClass.FileNamesInformation: FileNamesInformation,
+    FileInformationClass.FileIdExtdDirectoryInformation: FileIdExtdDirectoryInformation
+}
+
+
+def iter_directory_buffer(
+    file_information_class: Union[FileInformationClass, int],
+    data: ByteString,
+    base_offset: int = 0
+) -> Iterator[DirectoryInformation]:
+    """
+    Iterate over the chained entries of a `QUERY_DIRECTORY` response buffer, decoding each entry as it is reached.
+
+    :param file_information_class: The file information class with which the directory was queried.
+    :param data: A buffer containing the chained entries.
+    :param base_offset: The offset of the first entry in the buffer.
+    :return: An iterator of the entries in the buffer.
+    """
+
+    from_bytes = FILE_INFORMATION_CLASS_TO_DECODER[FileInformationClass(file_information_class)].from_bytes
+
+    if len(data) <= base_offset:
+        return
+
+    offset: int = base_offset
+    while True:
+        entry: DirectoryInformation = from_bytes(data, base_offset=offset)
+        yield entry
+
+        if entry.next_entry_offset == 0:
+            break
+
+        offset += entry.next_entry_offset
+
+
+def decode_directory_buffer(
+    file_information_class: Union[FileInformationClass, int],
+    data: ByteString,
+    base_offset: int = 0
+) -> List[DirectoryInformation]:
+    """
+    Decode the chained entries of a `QUERY_DIRECTORY` response buffer.
+
+    :param file_information_class: The file information class with which the directory was queried.
+    :param data: A buffer containing the chained entries.
+    :param base_offset: The offset of the first entry in the buffer.
+    :return: The entries in the buffer.
+    """
+
+    return list(
+        iter_directory_buffer(file_information_class=file_information_class, data=data, base_offset=base_offset)
+    )
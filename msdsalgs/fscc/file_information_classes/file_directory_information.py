@@ -1,8 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from struct import unpack as struct_unpack
+from typing import ClassVar, ByteString
+from struct import Struct
 
 from msdsalgs.fscc.file_information import FileInformation
+from msdsalgs.fscc.file_attributes import FileAttributes
 
 
 @dataclass
@@ -12,12 +14,46 @@ class FileDirectoryInformation:
     file_information: FileInformation
     file_name: str
 
+    # NOTE: The size of the fixed part of the structure, preceding the file name.
+    structure_size: ClassVar[int] = 64
+    file_name_length_offset: ClassVar[int] = 60
+
+    # `NextEntryOffset`, `FileIndex`, the times, `EndOfFile`, `AllocationSize`, `FileAttributes` and `FileNameLength`.
+    _STRUCT: ClassVar[Struct] = Struct('<IIQQQQQQII')
+
     @classmethod
-    def from_bytes(cls, data: bytes) -> FileDirectoryInformation:
-        file_name_length: int = struct_unpack('<I', data[60:64])[0]
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> FileDirectoryInformation:
+        next_entry_offset, file_index, *file_information_fields, file_name_length = cls._STRUCT.unpack_from(
+            data,
+            base_offset
+        )
+        file_name_offset: int = base_offset + cls.structure_size
+
         return cls(
-            next_entry_offset=struct_unpack('<I', data[:4])[0],
-            file_index=struct_unpack('<I', data[4:8])[0],
-            file_information=FileInformation.from_bytes(data=data[8:8+FileInformation.structure_size]),
-            file_name=data[64:64+file_name_length].decode(encoding='utf-16-le')
+            next_entry_offset=next_entry_offset,
+            file_index=file_index,
+            file_information=_make_file_information(*file_information_fields),
+            file_name=bytes(data[file_name_offset:file_name_offset+file_name_length]).decode(encoding='utf-16-le')
         )
+
+
+def _make_file_information(
+    creation_time: int,
+    last_access_time: int,
+    last_write_time: int,
+    change_time: int,
+    endof_file: int,
+    allocation_size: int,
+    file_attributes: int
+) -> FileInformation:
+    # NOTE: Unlike in `FILE_NETWORK_OPEN_INFORMATION`, `EndOfFile` precedes `AllocationSize` in the directory
+    # information classes.
+    return FileInformation(
+        _creation_time=creation_time,
+        _last_access_time=last_access_time,
+        _last_write_time=last_write_time,
+        _change_time=change_time,
+        allocation_size=allocation_size,
+        endof_file=endof_file,
+        file_attributes=FileAttributes.from_int(file_attributes)
+    )
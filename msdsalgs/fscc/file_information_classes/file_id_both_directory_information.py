@@ -0,0 +1,40 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import ClassVar, ByteString
+from struct import Struct
+
+from .file_directory_information import FileDirectoryInformation, _make_file_information
+
+
+@dataclass
+class FileIdBothDirectoryInformation(FileDirectoryInformation):
+    """
+    [MS-FSCC]: 2.4.17 FileIdBothDirectoryInformation
+    """
+
+    ea_size: int
+    short_name: str
+    file_id: bytes
+
+    structure_size: ClassVar[int] = 104
+
+    # ..., `FileNameLength`, `EaSize`, `ShortNameLength`, `Reserved1`, `ShortName`, `Reserved2` and `FileId`.
+    _STRUCT: ClassVar[Struct] = Struct('<IIQQQQQQIIIBx24s2x8s')
+
+    @classmethod
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> FileIdBothDirectoryInformation:
+        (
+            next_entry_offset, file_index, *file_information_fields, file_name_length, ea_size, short_name_length,
+            short_name, file_id
+        ) = cls._STRUCT.unpack_from(data, base_offset)
+        file_name_offset: int = base_offset + cls.structure_size
+
+        return cls(
+            next_entry_offset=next_entry_offset,
+            file_index=file_index,
+            file_information=_make_file_information(*file_information_fields),
+            ea_size=ea_size,
+            short_name=short_name[:short_name_length].decode(encoding='utf-16-le'),
+            file_id=file_id,
+            file_name=bytes(data[file_name_offset:file_name_offset+file_name_length]).decode(encoding='utf-16-le')
+        )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import ClassVar, ByteString
+from struct import Struct
+
+from .file_directory_information import FileDirectoryInformation, _make_file_information
+
+
+@dataclass
+class FileIdExtdDirectoryInformation(FileDirectoryInformation):
+    """
+    [MS-FSCC]: 2.4.20 FileIdExtdDirectoryInformation
+    """
+
+    ea_size: int
+    reparse_point_tag: int
+    file_id: bytes
+
+    structure_size: ClassVar[int] = 88
+
+    # ..., `FileNameLength`, `EaSize`, `ReparsePointTag` and the 128-bit `FileId`.
+    _STRUCT: ClassVar[Struct] = Struct('<IIQQQQQQIIII16s')
+
+    @classmethod
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> FileIdExtdDirectoryInformation:
+        (
+            next_entry_offset, file_index, *file_information_fields, file_name_length, ea_size, reparse_point_tag,
+            file_id
+        ) = cls._STRUCT.unpack_from(data, base_offset)
+        file_name_offset: int = base_offset + cls.structure_size
+
+        return cls(
+            next_entry_offset=next_entry_offset,
+            file_index=file_index,
+            file_information=_make_file_information(*file_information_fields),
+            ea_size=ea_size,
+            reparse_point_tag=reparse_point_tag,
+            file_id=file_id,
+            file_name=bytes(data[file_name_offset:file_name_offset+file_name_length]).decode(encoding='utf-16-le')
+        )
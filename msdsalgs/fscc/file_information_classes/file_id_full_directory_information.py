@@ -1,10 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import ClassVar
-from struct import unpack as struct_unpack
+from typing import ClassVar, ByteString
+from struct import Struct
 
-from .file_directory_information import FileDirectoryInformation
-from msdsalgs.fscc.file_information import FileInformation
+from .file_directory_information import FileDirectoryInformation, _make_file_information
 
 
 @dataclass
@@ -14,15 +13,24 @@ class FileIdFullDirectoryInformation(FileDirectoryInformation):
 
     _reserved: ClassVar[int] = 4 * b'\x00'
 
+    structure_size: ClassVar[int] = 80
+
+    # ..., `FileNameLength`, `EaSize`, `Reserved` and `FileId`.
+    _STRUCT: ClassVar[Struct] = Struct('<IIQQQQQQIII4x8s')
+
     @classmethod
-    def from_bytes(cls, data: bytes) -> FileIdFullDirectoryInformation:
-        file_name_length: int = struct_unpack('<I', data[60:64])[0]
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> FileIdFullDirectoryInformation:
+        (
+            next_entry_offset, file_index, *file_information_fields, file_name_length, ea_size, file_id
+        ) = cls._STRUCT.unpack_from(data, base_offset)
+        file_name_offset: int = base_offset + cls.structure_size
+
         return cls(
-            next_entry_offset=struct_unpack('<I', data[:4])[0],
-            file_index=struct_unpack('<I', data[4:8])[0],
-            file_information=FileInformation.from_bytes(data=data[8:8+FileInformation.structure_size]),
+            next_entry_offset=next_entry_offset,
+            file_index=file_index,
+            file_information=_make_file_information(*file_information_fields),
             # TODO: Support "Reparse Tag" content.
-            ea_size=struct_unpack('<I', data[64:68])[0],
-            file_id=data[72:80],
-            file_name=data[80:80+file_name_length].decode(encoding='utf-16-le')
+            ea_size=ea_size,
+            file_id=file_id,
+            file_name=bytes(data[file_name_offset:file_name_offset+file_name_length]).decode(encoding='utf-16-le')
         )
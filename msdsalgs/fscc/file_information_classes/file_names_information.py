@@ -0,0 +1,32 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import ClassVar, ByteString
+from struct import Struct
+
+
+@dataclass
+class FileNamesInformation:
+    """
+    [MS-FSCC]: 2.4.28 FileNamesInformation
+    """
+
+    next_entry_offset: int
+    file_index: int
+    file_name: str
+
+    structure_size: ClassVar[int] = 12
+    file_name_length_offset: ClassVar[int] = 8
+
+    # `NextEntryOffset`, `FileIndex` and `FileNameLength`.
+    _STRUCT: ClassVar[Struct] = Struct('<III')
+
+    @classmethod
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> FileNamesInformation:
+        next_entry_offset, file_index, file_name_length = cls._STRUCT.unpack_from(data, base_offset)
+        file_name_offset: int = base_offset + cls.structure_size
+
+        return cls(
+            next_entry_offset=next_entry_offset,
+            file_index=file_index,
+            file_name=bytes(data[file_name_offset:file_name_offset+file_name_length]).decode(encoding='utf-16-le')
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from enum import IntEnum
-from struct import unpack as struct_unpack, pack as struct_pack
-from typing import ClassVar
+from struct import pack as struct_pack, Struct
+from typing import ClassVar, Dict, ByteString
 from dataclasses import dataclass
 
 
@@ -19,6 +19,17 @@ class FileNotifyAction(IntEnum):
     FILE_ACTION_TUNNELLED_ID_COLLISION = 0x0000000B
 
 
+# Looking up an action by its integer value is cheaper than calling the enum class.
+FILE_NOTIFY_ACTION_FROM_INT: Dict[int, FileNotifyAction] = {action.value: action for action in FileNotifyAction}
+
+
+def file_notify_action_from_int(value: int) -> FileNotifyAction:
+    try:
+        return FILE_NOTIFY_ACTION_FROM_INT[value]
+    except KeyError:
+        raise ValueError(f'{value} is not a valid {FileNotifyAction.__name__}') from None
+
+
 @dataclass
 class FileNotifyInformation:
     next_entry_offset: int
@@ -27,16 +38,20 @@ class FileNotifyInformation:
 
     # NOTE: I defined this, not the docs.
     structure_size: ClassVar[int] = 12
+    file_name_length_offset: ClassVar[int] = 8
 
-    @classmethod
-    def from_bytes(cls, data: bytes) -> FileNotifyInformation:
+    # `NextEntryOffset`, `Action` and `FileNameLength`.
+    _HEADER_STRUCT: ClassVar[Struct] = Struct('<III')
 
-        file_name_len: int = struct_unpack('<I', data[8:12])[0]
+    @classmethod
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> FileNotifyInformation:
+        next_entry_offset, action, file_name_len = cls._HEADER_STRUCT.unpack_from(data, base_offset)
+        file_name_offset: int = base_offset + cls.structure_size
 
         return cls(
-            next_entry_offset=struct_unpack('<I', data[:4])[0],
-            action=FileNotifyAction(struct_unpack('<I', data[4:8])[0]),
-            file_name=data[12:12+file_name_len].decode(encoding='utf-16-le')
+            next_entry_offset=next_entry_offset,
+            action=file_notify_action_from_int(value=action),
+            file_name=bytes(data[file_name_offset:file_name_offset+file_name_len]).decode(encoding='utf-16-le')
         )
 
     def __len__(self) -> int:
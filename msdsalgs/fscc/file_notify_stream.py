@@ -0,0 +1,219 @@
+from __future__ import annotations
+from codecs import utf_16_le_decode
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import ByteString, Iterator, Optional, Dict, List, Tuple, Callable, Final
+
+from msdsalgs.fscc.file_notify_information import FileNotifyInformation, FileNotifyAction, \
+    file_notify_action_from_int
+
+
+class FileNotifyInformationView:
+    """
+    A `FILE_NOTIFY_INFORMATION` record read in place from a buffer.
+
+    The file name is only decoded when it is first accessed.
+    """
+
+    __slots__ = ('next_entry_offset', 'action', '_buffer', '_file_name_offset', '_file_name_len', '_file_name')
+
+    def __init__(
+        self,
+        next_entry_offset: int,
+        action: FileNotifyAction,
+        buffer: memoryview,
+        file_name_offset: int,
+        file_name_len: int
+    ):
+        self.next_entry_offset: int = next_entry_offset
+        self.action: FileNotifyAction = action
+        self._buffer: memoryview = buffer
+        self._file_name_offset: int = file_name_offset
+        self._file_name_len: int = file_name_len
+        self._file_name: Optional[str] = None
+
+    @property
+    def raw_file_name(self) -> memoryview:
+        return self._buffer[self._file_name_offset:self._file_name_offset+self._file_name_len]
+
+    @property
+    def file_name(self) -> str:
+        if self._file_name is None:
+            self._file_name = utf_16_le_decode(self.raw_file_name, 'strict', True)[0]
+        return self._file_name
+
+    def to_file_notify_information(self) -> FileNotifyInformation:
+        return FileNotifyInformation(
+            next_entry_offset=self.next_entry_offset,
+            action=self.action,
+            file_name=self.file_name
+        )
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(action={self.action!r}, file_name={self.file_name!r})'
+
+
+def iter_file_notify_information(data: ByteString, base_offset: int = 0) -> Iterator[FileNotifyInformationView]:
+    """
+    Iterate over the chained `FILE_NOTIFY_INFORMATION` records of a change notification response buffer.
+
+    The buffer is not copied; each record is a view into it.
+
+    :param data: A buffer containing chained `FILE_NOTIFY_INFORMATION` records.
+    :param base_offset: The offset of the first record in the buffer.
+    :return: An iterator of views of the records in the buffer.
+    """
+
+    buffer = memoryview(data).cast('B')
+    if len(buffer) <= base_offset:
+        return
+
+    header_unpack_from = FileNotifyInformation._HEADER_STRUCT.unpack_from
+    header_size: int = FileNotifyInformation.structure_size
+
+    offset: int = base_offset
+    while True:
+        next_entry_offset, action, file_name_len = header_unpack_from(buffer, offset)
+
+        yield FileNotifyInformationView(
+            next_entry_offset=next_entry_offset,
+            action=file_notify_action_from_int(value=action),
+            buffer=buffer,
+            file_name_offset=offset + header_size,
+            file_name_len=file_name_len
+        )
+
+        if next_entry_offset == 0:
+            break
+
+        offset += next_entry_offset
+
+
+COALESCABLE_ACTIONS: Final[frozenset] = frozenset({
+    FileNotifyAction.FILE_ACTION_ADDED,
+    FileNotifyAction.FILE_ACTION_REMOVED,
+    FileNotifyAction.FILE_ACTION_MODIFIED
+})
+
+# The resulting action of an action on a path followed by another one; `None` if the two cancel each other out.
+_COALESCED_ACTION: Final[Dict[Tuple[Optional[FileNotifyAction], FileNotifyAction], Optional[FileNotifyAction]]] = {
+    (FileNotifyAction.FILE_ACTION_ADDED, FileNotifyAction.FILE_ACTION_ADDED): FileNotifyAction.FILE_ACTION_ADDED,
+    (FileNotifyAction.FILE_ACTION_ADDED, FileNotifyAction.FILE_ACTION_MODIFIED): FileNotifyAction.FILE_ACTION_ADDED,
+    (FileNotifyAction.FILE_ACTION_ADDED, FileNotifyAction.FILE_ACTION_REMOVED): None,
+    (FileNotifyAction.FILE_ACTION_MODIFIED, FileNotifyAction.FILE_ACTION_ADDED): FileNotifyAction.FILE_ACTION_MODIFIED,
+    (FileNotifyAction.FILE_ACTION_MODIFIED, FileNotifyAction.FILE_ACTION_MODIFIED): FileNotifyAction.FILE_ACTION_MODIFIED,
+    (FileNotifyAction.FILE_ACTION_MODIFIED, FileNotifyAction.FILE_ACTION_REMOVED): FileNotifyAction.FILE_ACTION_REMOVED,
+    (FileNotifyAction.FILE_ACTION_REMOVED, FileNotifyAction.FILE_ACTION_ADDED): FileNotifyAction.FILE_ACTION_MODIFIED,
+    (FileNotifyAction.FILE_ACTION_REMOVED, FileNotifyAction.FILE_ACTION_MODIFIED): FileNotifyAction.FILE_ACTION_MODIFIED,
+    (FileNotifyAction.FILE_ACTION_REMOVED, FileNotifyAction.FILE_ACTION_REMOVED): FileNotifyAction.FILE_ACTION_REMOVED,
+    (None, FileNotifyAction.FILE_ACTION_ADDED): FileNotifyAction.FILE_ACTION_ADDED,
+    (None, FileNotifyAction.FILE_ACTION_MODIFIED): FileNotifyAction.FILE_ACTION_MODIFIED,
+    (None, FileNotifyAction.FILE_ACTION_REMOVED): None,
+}
+
+
+@dataclass
+class _PendingFileNotifyEvent:
+    first_timestamp: float
+    action: Optional[FileNotifyAction]
+    file_name: str
+
+
+class FileNotifyCoalescer:
+    """
+    Collapse bursts of change notifications for the same path into a single event.
+
+    Added, removed and modified events for a path that arrive within `window` seconds of the first event of the burst
+    are merged, e.g. added followed by modifications becomes added, and added followed by removed disappears. Other
+    actions, such as renames, are passed through in order and end the burst of their path.
+    """
+
+    def __init__(self, window: float, clock: Callable[[], float] = monotonic):
+        """
+        :param window: The number of seconds after the first event of a burst during which events are merged into it.
+        :param clock: A function returning the current time in seconds.
+        """
+
+        self.window: float = window
+        self.clock: Callable[[], float] = clock
+
+        # Ordered by the first timestamp of the bursts.
+        self._pending: OrderedDict[int, _PendingFileNotifyEvent] = OrderedDict()
+        self._file_name_to_open_key: Dict[str, int] = {}
+        self._next_key: int = 0
+
+    def add(self, action: FileNotifyAction, file_name: str, timestamp: Optional[float] = None) -> None:
+        if timestamp is None:
+            timestamp = self.clock()
+
+        open_key: Optional[int] = self._file_name_to_open_key.get(file_name)
+
+        # A burst that has outlasted its window is closed, even if it has not been flushed yet.
+        if open_key is not None and timestamp - self._pending[open_key].first_timestamp > self.window:
+            del self._file_name_to_open_key[file_name]
+            open_key = None
+
+        if action not in COALESCABLE_ACTIONS:
+            if open_key is not None:
+                del self._file_name_to_open_key[file_name]
+            self._pending[self._next_key] = _PendingFileNotifyEvent(
+                first_timestamp=timestamp,
+                action=action,
+                file_name=file_name
+            )
+            self._next_key += 1
+        elif open_key is not None:
+            pending_event: _PendingFileNotifyEvent = self._pending[open_key]
+            pending_event.action = _COALESCED_ACTION[(pending_event.action, action)]
+        else:
+            self._pending[self._next_key] = _PendingFileNotifyEvent(
+                first_timestamp=timestamp,
+                action=action,
+                file_name=file_name
+            )
+            self._file_name_to_open_key[file_name] = self._next_key
+            self._next_key += 1
+
+    def feed(self, data: ByteString, timestamp: Optional[float] = None) -> None:
+        """
+        Add all the records of a change notification response buffer.
+
+        :param data: A buffer containing chained `FILE_NOTIFY_INFORMATION` records.
+        :param timestamp: The time at which the response was received; the current time if not provided.
+        """
+
+        if timestamp is None:
+            timestamp = self.clock()
+
+        for record in iter_file_notify_information(data=data):
+            self.add(action=record.action, file_name=record.file_name, timestamp=timestamp)
+
+    def flush(self, force: bool = False) -> List[Tuple[FileNotifyAction, str]]:
+        """
+        Retrieve the events whose bursts have ended.
+
+        :param force: Whether to retrieve all pending events, regardless of whether their bursts have ended.
+        :return: A list of action and file name pairs, in the order of the first events of their bursts.
+        """
+
+        deadline: float = self.clock() - self.window
+        events: List[Tuple[FileNotifyAction, str]] = []
+
+        while self._pending:
+            key: int = next(iter(self._pending))
+            pending_event: _PendingFileNotifyEvent = self._pending[key]
+            if not force and pending_event.first_timestamp > deadline:
+                break
+
+            del self._pending[key]
+            if self._file_name_to_open_key.get(pending_event.file_name) == key:
+                del self._file_name_to_open_key[pending_event.file_name]
+
+            if pending_event.action is not None:
+                events.append((pending_event.action, pending_event.file_name))
+
+        return events
+
+    def __len__(self) -> int:
+        return len(self._pending)
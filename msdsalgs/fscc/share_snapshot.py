@@ -0,0 +1,367 @@
+"""
+Snapshots of the files of a share, and the differences between two snapshots.
+
+A snapshot is stored column-wise in `array`s sorted by file ID, with the file paths concatenated into a single UTF-8
+encoded blob, so that tens of millions of entries can be held without a Python object per entry. Two snapshots are
+compared in a single merge pass over their file IDs, yielding the changes as they are found.
+"""
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from enum import IntFlag
+from os import PathLike
+from struct import Struct
+from sys import byteorder
+from typing import Iterable, Iterator, Optional, Union, List
+
+from msdsalgs.fscc.file_information_classes import FileIdFullDirectoryInformation
+
+_MAGIC = b'MSDSSNP1'
+# The number of entries and the length of the path blob.
+_HEADER_STRUCT = Struct('<QQ')
+
+
+class SnapshotChangeFlag(IntFlag):
+    ADDED = 0x1
+    REMOVED = 0x2
+    MODIFIED = 0x4
+    RENAMED = 0x8
+
+
+@dataclass
+class SnapshotChange:
+    flags: SnapshotChangeFlag
+    file_id: int
+    old_path: Optional[str]
+    new_path: Optional[str]
+
+
+class ShareSnapshot:
+    """
+    A column-wise snapshot of the files of a share, sorted by file ID.
+
+    The times are the raw `FILETIME` values.
+    """
+
+    _COLUMN_NAMES = ('file_ids', 'last_write_times', 'change_times', 'endof_files', 'file_attributes', 'path_offsets')
+
+    def __init__(
+        self,
+        file_ids: array,
+        last_write_times: array,
+        change_times: array,
+        endof_files: array,
+        file_attributes: array,
+        path_offsets: array,
+        path_data: bytes
+    ):
+        """
+        :param file_ids: The file IDs of the entries, in ascending order.
+        :param last_write_times: The `LastWriteTime` values of the entries.
+        :param change_times: The `ChangeTime` values of the entries.
+        :param endof_files: The `EndOfFile` values of the entries.
+        :param file_attributes: The `FileAttributes` values of the entries.
+        :param path_offsets: The offsets of the paths of the entries in `path_data`, followed by the length of
+            `path_data`.
+        :param path_data: The concatenated UTF-8 encoded paths of the entries.
+        """
+
+        self.file_ids: array = file_ids
+        self.last_write_times: array = last_write_times
+        self.change_times: array = change_times
+        self.endof_files: array = endof_files
+        self.file_attributes: array = file_attributes
+        self.path_offsets: array = path_offsets
+        self.path_data: bytes = path_data
+
+    def path_bytes(self, index: int) -> bytes:
+        return self.path_data[self.path_offsets[index]:self.path_offsets[index + 1]]
+
+    def path(self, index: int) -> str:
+        return self.path_bytes(index).decode(encoding='utf-8')
+
+    def find(self, file_id: int) -> Optional[int]:
+        """
+        Find the entry with a file ID.
+
+        :param file_id: The file ID of the entry to find.
+        :return: The index of the entry; `None` if there is no entry with the file ID.
+        """
+
+        index: int = bisect_left(self.file_ids, file_id)
+        return index if index < len(self.file_ids) and self.file_ids[index] == file_id else None
+
+    def save(self, path: Union[str, PathLike]) -> None:
+        with open(path, 'wb') as file:
+            file.write(_MAGIC)
+            file.write(_HEADER_STRUCT.pack(len(self), len(self.path_data)))
+            for column_name in self._COLUMN_NAMES:
+                column: array = getattr(self, column_name)
+                if byteorder != 'little':
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(file)
+            file.write(self.path_data)
+
+    @classmethod
+    def load(cls, path: Union[str, PathLike]) -> ShareSnapshot:
+        with open(path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError('The file is not a share snapshot.')
+
+            num_entries, path_data_len = _HEADER_STRUCT.unpack(file.read(_HEADER_STRUCT.size))
+
+            columns: List[array] = []
+            for column_name, typecode in zip(cls._COLUMN_NAMES, ('Q', 'Q', 'Q', 'Q', 'I', 'Q')):
+                column = array(typecode)
+                column.fromfile(file, num_entries + 1 if column_name == 'path_offsets' else num_entries)
+                if byteorder != 'little':
+                    column.byteswap()
+                columns.append(column)
+
+            return cls(*columns, path_data=file.read(path_data_len))
+
+    def __len__(self) -> int:
+        return len(self.file_ids)
+
+
+class ShareSnapshotBuilder:
+    """
+    Build a `ShareSnapshot` from the `FileIdFullDirectoryInformation` entries of the directories of a share.
+
+    If several entries have the same file ID, e.g. hard links, the first one added is kept.
+    """
+
+    def __init__(self):
+        self._file_ids = array('Q')
+        self._last_write_times = array('Q')
+        self._change_times = array('Q')
+        self._endof_files = array('Q')
+        self._file_attributes = array('I')
+        self._path_offsets = array('Q', [0])
+        self._path_data = bytearray()
+
+    def add(self, path: str, entry: FileIdFullDirectoryInformation) -> None:
+        file_information = entry.file_information
+
+        self._file_ids.append(int.from_bytes(entry.file_id, byteorder='little'))
+        self._last_write_times.append(file_information._last_write_time)
+        self._change_times.append(file_information._change_time)
+        self._endof_files.append(file_information.endof_file)
+        self._file_attributes.append(int(file_information.file_attributes))
+        self._path_data += path.encode(encoding='utf-8')
+        self._path_offsets.append(len(self._path_data))
+
+    def add_directory(self, directory_path: str, entries: Iterable[FileIdFullDirectoryInformation]) -> None:
+        """
+        Add the entries of a directory listing, except for its `.` and `..` entries.
+
+        :param directory_path: The path of the directory.
+        :param entries: The entries of the directory.
+        """
+
+        path_prefix: str = directory_path.rstrip('\\') + '\\'
+        for entry in entries:
+            if entry.file_name in ('.', '..'):
+                continue
+            self.add(path=path_prefix + entry.file_name, entry=entry)
+
+    def build(self) -> ShareSnapshot:
+        """
+        Build the snapshot, emptying the builder.
+
+        The columns are sorted through a compact array of the indices of the entries, computed with `numpy` if it is
+        installed and with a radix sort otherwise. Each column of the builder is released as soon as it has been
+        copied in sorted order, so that at most one column is held twice.
+
+        :return: The snapshot of the added entries.
+        """
+
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        order: array = _unique_argsort(keys=self._file_ids, numpy=numpy)
+
+        columns: List[array] = []
+        for column_name in ('_file_ids', '_last_write_times', '_change_times', '_endof_files', '_file_attributes'):
+            column: array = getattr(self, column_name)
+            setattr(self, column_name, array(column.typecode))
+            columns.append(_gather(column=column, order=order, numpy=numpy))
+            del column
+
+        path_offsets, source_path_offsets = array('Q', [0]) * (len(order) + 1), self._path_offsets
+        path_data, source_path_data = bytearray(), self._path_data
+        self._path_offsets, self._path_data = array('Q', [0]), bytearray()
+
+        for i, index in enumerate(order, start=1):
+            path_data += source_path_data[source_path_offsets[index]:source_path_offsets[index + 1]]
+            path_offsets[i] = len(path_data)
+
+        del source_path_offsets, source_path_data, order
+
+        return ShareSnapshot(*columns, path_offsets=path_offsets, path_data=bytes(path_data))
+
+
+def _unique_argsort(keys: array, numpy=None) -> array:
+    """
+    Compute the indices that sort an array of keys, keeping only the first index of each key.
+
+    :param keys: An array of unsigned 64-bit keys.
+    :param numpy: The `numpy` module, if it is to be used.
+    :return: An array of indices of `keys`, in ascending and stable order of the keys.
+    """
+
+    if numpy is not None:
+        keys_view = numpy.frombuffer(keys, dtype=numpy.uint64) if keys else numpy.empty(0, dtype=numpy.uint64)
+        sorted_indices = numpy.argsort(keys_view, kind='stable')
+        sorted_keys = keys_view[sorted_indices]
+        is_first = numpy.empty(len(sorted_keys), dtype=bool)
+        is_first[:1] = True
+        numpy.not_equal(sorted_keys[1:], sorted_keys[:-1], out=is_first[1:])
+        del sorted_keys, keys_view
+
+        order = array('Q')
+        order.frombytes(sorted_indices[is_first].view(numpy.uint8))
+        return order
+
+    # An LSD radix sort on 16-bit digits, which is stable and only needs two arrays of indices.
+    num_keys: int = len(keys)
+    order = array('Q', range(num_keys))
+    scratch = array('Q', [0]) * num_keys
+
+    for shift in range(0, 64, 16):
+        # The number of keys with each digit, offset by one, so that the prefix sums are the start offsets.
+        offsets = array('Q', [0]) * 0x10001
+        for key in keys:
+            offsets[((key >> shift) & 0xFFFF) + 1] += 1
+
+        # The pass would not reorder the indices if all the keys have the same digit.
+        if num_keys == 0 or max(offsets) == num_keys:
+            continue
+
+        total = 0
+        for digit in range(0x10001):
+            total += offsets[digit]
+            offsets[digit] = total
+
+        for index in order:
+            digit: int = (keys[index] >> shift) & 0xFFFF
+            scratch[offsets[digit]] = index
+            offsets[digit] += 1
+
+        order, scratch = scratch, order
+
+    del scratch
+
+    # The indices of repeated keys are removed in place.
+    num_unique = 0
+    previous_key: Optional[int] = None
+    for index in order:
+        key: int = keys[index]
+        if key != previous_key:
+            order[num_unique] = index
+            num_unique += 1
+            previous_key = key
+
+    del order[num_unique:]
+
+    return order
+
+
+def _gather(column: array, order: array, numpy=None) -> array:
+    """
+    Copy the values of a column in an order.
+
+    :param column: The column to copy.
+    :param order: The indices of the values to copy.
+    :param numpy: The `numpy` module, if it is to be used.
+    :return: A new column with the values of `column` at the indices of `order`.
+    """
+
+    gathered_column = array(column.typecode, [0]) * len(order)
+    if numpy is None or not order:
+        for i, index in enumerate(order):
+            gathered_column[i] = column[index]
+    else:
+        numpy.take(
+            numpy.frombuffer(column, dtype=column.typecode),
+            numpy.frombuffer(order, dtype=numpy.uint64).astype(numpy.intp, copy=False),
+            out=numpy.frombuffer(gathered_column, dtype=column.typecode)
+        )
+
+    return gathered_column
+
+
+def diff_snapshots(old: ShareSnapshot, new: ShareSnapshot) -> Iterator[SnapshotChange]:
+    """
+    Compare two snapshots of a share, in order of file ID.
+
+    An entry is modified if its last write time, change time, end of file or attributes differ, and renamed if its
+    path differs.
+
+    :param old: The earlier snapshot.
+    :param new: The later snapshot.
+    :return: An iterator of the changes from `old` to `new`.
+    """
+
+    old_file_ids, new_file_ids = old.file_ids, new.file_ids
+    num_old, num_new = len(old_file_ids), len(new_file_ids)
+    i = j = 0
+
+    while i < num_old and j < num_new:
+        old_file_id: int = old_file_ids[i]
+        new_file_id: int = new_file_ids[j]
+
+        if old_file_id < new_file_id:
+            yield _removed_change(snapshot=old, index=i)
+            i += 1
+        elif old_file_id > new_file_id:
+            yield _added_change(snapshot=new, index=j)
+            j += 1
+        else:
+            flags = SnapshotChangeFlag(0)
+
+            if (
+                old.last_write_times[i] != new.last_write_times[j]
+                or old.change_times[i] != new.change_times[j]
+                or old.endof_files[i] != new.endof_files[j]
+                or old.file_attributes[i] != new.file_attributes[j]
+            ):
+                flags |= SnapshotChangeFlag.MODIFIED
+
+            if old.path_bytes(i) != new.path_bytes(j):
+                flags |= SnapshotChangeFlag.RENAMED
+
+            if flags:
+                yield SnapshotChange(flags=flags, file_id=old_file_id, old_path=old.path(i), new_path=new.path(j))
+
+            i += 1
+            j += 1
+
+    for i in range(i, num_old):
+        yield _removed_change(snapshot=old, index=i)
+
+    for j in range(j, num_new):
+        yield _added_change(snapshot=new, index=j)
+
+
+def _removed_change(snapshot: ShareSnapshot, index: int) -> SnapshotChange:
+    return SnapshotChange(
+        flags=SnapshotChangeFlag.REMOVED,
+        file_id=snapshot.file_ids[index],
+        old_path=snapshot.path(index),
+        new_path=None
+    )
+
+
+def _added_change(snapshot: ShareSnapshot, index: int) -> SnapshotChange:
+    return SnapshotChange(
+        flags=SnapshotChangeFlag.ADDED,
+        file_id=snapshot.file_ids[index],
+        old_path=None,
+        new_path=snapshot.path(index)
+    )
@@ -0,0 +1,289 @@
+"""
+Optional instrumentation of the decoders and the crypto functions: call counts, error counts, the number of ACEs of
+each type and histograms of latencies.
+
+Instrumentation is disabled by default and costs next to nothing while disabled:
+
+- The `from_bytes` class methods of `SecurityDescriptor`, `ACL`, `ACE` and `SID`, and the methods of
+  `DesEcbLmCipher`, are replaced with measuring wrappers by `enable` and restored by `disable`, so that the hot
+  per-element decoders run unwrapped while disabled.
+- The module-level functions `extract_elements`, `transform_des_key` and `decrypt_aes`, which may have been imported
+  by name before instrumentation is enabled, are wrapped permanently; while disabled, the wrappers only check the
+  `ENABLED` flag before calling the function.
+
+The latencies are inclusive; e.g. the latency of `SecurityDescriptor.from_bytes` includes those of the SIDs and ACLs it
+decodes. A snapshot of the metrics is a plain `dict`, to be exported by a Prometheus or OpenTelemetry bridge.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from functools import wraps
+from importlib import import_module
+from threading import Lock
+from time import perf_counter_ns
+from typing import Dict, List, Tuple, Any, Callable, Optional, Iterator, TypeVar
+
+# Whether the metrics are being collected.
+ENABLED = False
+
+# The upper bound of the first latency bucket is 2^8 ns (256 ns), and that of each following bucket twice the previous
+# one's, up to 2^31 ns (about 2.1 s); the last bucket has no upper bound.
+_MIN_EXPONENT = 8
+_NUM_BOUNDED_BUCKETS = 24
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class LatencyHistogram:
+    """
+    A thread-safe histogram of latencies with exponentially growing buckets.
+    """
+
+    __slots__ = ('counts', 'count', 'sum_ns', '_lock')
+
+    UPPER_BOUNDS_NS: Tuple[int, ...] = tuple(2 ** (_MIN_EXPONENT + i) for i in range(_NUM_BOUNDED_BUCKETS))
+
+    def __init__(self):
+        # The number of observations of each bucket, followed by that of the unbounded bucket.
+        self.counts: List[int] = [0] * (_NUM_BOUNDED_BUCKETS + 1)
+        self.count: int = 0
+        self.sum_ns: int = 0
+        self._lock = Lock()
+
+    def observe(self, elapsed_ns: int) -> None:
+        index: int = (elapsed_ns - 1).bit_length() - _MIN_EXPONENT
+        with self._lock:
+            self.counts[min(max(index, 0), _NUM_BOUNDED_BUCKETS)] += 1
+            self.count += 1
+            self.sum_ns += elapsed_ns
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counts = [0] * (_NUM_BOUNDED_BUCKETS + 1)
+            self.count = 0
+            self.sum_ns = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the histogram in the form of a Prometheus histogram.
+
+        :return: The number of observations, their sum in seconds, and the inclusive upper bound in seconds and
+            cumulative count of each bucket, the last bound being infinity.
+        """
+
+        with self._lock:
+            counts, count, sum_ns = list(self.counts), self.count, self.sum_ns
+
+        buckets: List[Tuple[float, int]] = []
+        cumulative_count = 0
+        for upper_bound_ns, bucket_count in zip((*self.UPPER_BOUNDS_NS, float('inf')), counts):
+            cumulative_count += bucket_count
+            buckets.append((upper_bound_ns / 1e9, cumulative_count))
+
+        return dict(count=count, sum=sum_ns / 1e9, buckets=buckets)
+
+
+class Metrics:
+    """
+    A thread-safe collection of counters and latency histograms, by name.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """
+        Retrieve a latency histogram, creating it if it does not exist.
+
+        The histogram is kept for the lifetime of the collection, so that measuring code can hold on to it.
+
+        :param name: The name of the histogram.
+        :return: The histogram.
+        """
+
+        with self._lock:
+            histogram: Optional[LatencyHistogram] = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            return histogram
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Take a snapshot of the metrics.
+
+        :return: A `dict` with the `counters`, a mapping of names to values, and the `histograms`, a mapping of names to
+            the exported form of each histogram with observations (see `LatencyHistogram.to_dict`).
+        """
+
+        with self._lock:
+            counters: Dict[str, int] = dict(self._counters)
+            histograms: List[Tuple[str, LatencyHistogram]] = list(self._histograms.items())
+
+        return dict(
+            counters=counters,
+            histograms={name: histogram.to_dict() for name, histogram in histograms if histogram.count != 0}
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            for histogram in self._histograms.values():
+                histogram.clear()
+
+
+METRICS = Metrics()
+
+
+def _make_measuring_wrapper(
+    name: str,
+    function: Callable[..., Any],
+    on_result: Optional[Callable[[Any], None]] = None
+) -> Callable[..., Any]:
+    observe: Callable[[int], None] = METRICS.histogram(name).observe
+    errors_name = f'{name}.errors'
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start_ns: int = perf_counter_ns()
+        try:
+            result: Any = function(*args, **kwargs)
+        except Exception:
+            METRICS.increment(errors_name)
+            raise
+        finally:
+            observe(perf_counter_ns() - start_ns)
+
+        if on_result is not None:
+            on_result(result)
+
+        return result
+
+    return wrapper
+
+
+def instrumented(name: str, on_result: Optional[Callable[[Any], None]] = None) -> Callable[[F], F]:
+    """
+    Wrap a module-level function so that its calls are measured while instrumentation is enabled.
+
+    :param name: The name of the function's latency histogram and the prefix of its counters.
+    :param on_result: A function called with each result of the function, e.g. to update counters.
+    :return: A decorator.
+    """
+
+    def decorator(function: F) -> F:
+        measuring_wrapper = _make_measuring_wrapper(name=name, function=function, on_result=on_result)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return function(*args, **kwargs)
+            return measuring_wrapper(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _count_ace_type(ace) -> None:
+    METRICS.increment(f'ace.from_bytes.{ace.header.ace_type.name}')
+
+
+def count_elements(elements: List[Any]) -> None:
+    METRICS.increment('extract_elements.elements', len(elements))
+
+
+# The methods that are swapped while instrumentation is enabled: the module and name of the class, the name of the
+# method, whether it is a class method, the name of the metrics and the function to call with each result.
+_SWAPPED_METHODS: Tuple[Tuple[str, str, str, bool, str, Optional[Callable[[Any], None]]], ...] = (
+    ('msdsalgs.security_types.security_descriptor', 'SecurityDescriptor', 'from_bytes', True,
+     'security_descriptor.from_bytes', None),
+    ('msdsalgs.security_types.acl', 'ACL', 'from_bytes', True, 'acl.from_bytes', None),
+    ('msdsalgs.security_types.ace', 'ACE', 'from_bytes', True, 'ace.from_bytes', _count_ace_type),
+    ('msdsalgs.security_types.sid', 'SID', 'from_bytes', True, 'sid.from_bytes', None),
+    ('msdsalgs.crypto', 'DesEcbLmCipher', 'encrypt', False, 'crypto.des_ecb_lm.encrypt', None),
+    ('msdsalgs.crypto', 'DesEcbLmCipher', 'decrypt', False, 'crypto.des_ecb_lm.decrypt', None)
+)
+
+# The original attributes of the swapped methods, by class and method name, while instrumentation is enabled.
+_original_attributes: Dict[Tuple[type, str], Any] = {}
+
+
+def enable() -> None:
+    """
+    Enable the collection of metrics.
+
+    The modules of the instrumented classes are imported if they are not already; `msdsalgs.crypto`, which requires
+    PyCryptodome, is skipped if it cannot be imported.
+    """
+
+    global ENABLED
+
+    for module_name, class_name, method_name, is_class_method, name, on_result in _SWAPPED_METHODS:
+        try:
+            owner: type = getattr(import_module(module_name), class_name)
+        except ImportError:
+            continue
+
+        if (owner, method_name) in _original_attributes:
+            continue
+
+        original_attribute: Any = owner.__dict__[method_name]
+        _original_attributes[(owner, method_name)] = original_attribute
+
+        measuring_wrapper = _make_measuring_wrapper(
+            name=name,
+            function=original_attribute.__func__ if is_class_method else original_attribute,
+            on_result=on_result
+        )
+        setattr(owner, method_name, classmethod(measuring_wrapper) if is_class_method else measuring_wrapper)
+
+    ENABLED = True
+
+
+def disable() -> None:
+    """
+    Disable the collection of metrics, restoring the swapped methods. The collected metrics are kept.
+    """
+
+    global ENABLED
+
+    ENABLED = False
+
+    for (owner, method_name), original_attribute in _original_attributes.items():
+        setattr(owner, method_name, original_attribute)
+    _original_attributes.clear()
+
+
+def is_enabled() -> bool:
+    return ENABLED
+
+
+@contextmanager
+def enabled() -> Iterator[Metrics]:
+    """
+    Collect metrics within a context, disabling the collection afterwards if it was disabled before.
+
+    :return: A context manager providing the metrics.
+    """
+
+    was_enabled: bool = ENABLED
+    enable()
+    try:
+        yield METRICS
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot() -> Dict[str, Any]:
+    return METRICS.snapshot()
+
+
+def reset() -> None:
+    METRICS.reset()
@@ -0,0 +1,146 @@
+"""
+Ahead-of-time generation of `Mask` classes.
+
+`Mask.make_dynamic_class` formats attribute names and builds property closures for every enumeration member each time
+a module defining a mask is imported. This module emits equivalent plain Python source, with real properties and
+`__slots__`, into `msdsalgs/_generated_masks.py`. Each generated class is stored together with a fingerprint of the
+`IntFlag` class it was generated from, and `Mask.make_class` only uses it if the fingerprint still matches.
+
+Regenerate the classes with:
+
+    python -m msdsalgs.mask_generation
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import IntFlag
+from importlib import import_module
+from pathlib import Path
+from typing import Type, Optional, Tuple, List
+
+from msdsalgs.utils import Mask, mask_class_fingerprint
+
+GENERATED_MODULE_PATH = Path(__file__).parent / '_generated_masks.py'
+
+
+@dataclass(frozen=True)
+class MaskClassSpec:
+    module_name: str
+    int_flag_class_name: str
+    prefix: str = ''
+    name: Optional[str] = None
+
+    def get_int_flag_class(self) -> Type[IntFlag]:
+        return getattr(import_module(self.module_name), self.int_flag_class_name)
+
+
+MASK_CLASS_SPECS: Tuple[MaskClassSpec, ...] = (
+    MaskClassSpec(
+        module_name='msdsalgs.fscc.file_attributes',
+        int_flag_class_name='FileAttributesFlag',
+        prefix='FILE_ATTRIBUTE_'
+    ),
+    MaskClassSpec(
+        module_name='msdsalgs.security_types.security_descriptor',
+        int_flag_class_name='SecurityDescriptorControlMask',
+        prefix='SE_'
+    ),
+    MaskClassSpec(
+        module_name='msdsalgs.security_types.ace',
+        int_flag_class_name='ActiveDirectoryRightsMask',
+        prefix='ADS_RIGHT_'
+    ),
+)
+
+
+def generate_mask_class_source(mask_class: Type[Mask]) -> str:
+    """
+    Generate the Python source of a `Mask` class equivalent to a dynamically created one.
+
+    :param mask_class: A mask class created with `Mask.make_dynamic_class`.
+    :return: The source of a class definition with the same attributes as `mask_class`.
+    """
+
+    int_flag_class: Type[IntFlag] = mask_class.INT_FLAG_CLASS
+
+    lines: List[str] = [
+        f'class {mask_class.__name__}(Mask):',
+        '    __slots__ = ()',
+        '',
+        '    INT_FLAG_CLASS = IntFlagClassReference(',
+        f'        module_name={int_flag_class.__module__!r},',
+        f'        qualified_name={int_flag_class.__qualname__!r}',
+        '    )',
+        '    FLAG_TABLE = (',
+        *(f'        ({attribute_name!r}, 0x{bit:08X}),' for attribute_name, bit in mask_class.FLAG_TABLE),
+        '    )',
+        f'    ALL_FLAGS_VALUE = 0x{mask_class.ALL_FLAGS_VALUE:08X}',
+        '    ATTRIBUTE_NAME_TO_BIT = dict(FLAG_TABLE)',
+    ]
+
+    for attribute_name, bit in mask_class.FLAG_TABLE:
+        lines.extend([
+            '',
+            '    @property',
+            f'    def {attribute_name}(self) -> bool:',
+            f'        return self._mask & 0x{bit:08X} == 0x{bit:08X}',
+            '',
+            f'    @{attribute_name}.setter',
+            f'    def {attribute_name}(self, value: bool) -> None:',
+            '        if value:',
+            f'            self._mask |= 0x{bit:08X}',
+            '        else:',
+            f'            self._mask &= ~0x{bit:08X}',
+        ])
+
+    return '\n'.join(lines) + '\n'
+
+
+def generate_module_source(mask_class_specs: Tuple[MaskClassSpec, ...] = MASK_CLASS_SPECS) -> str:
+    """
+    Generate the source of the module containing the ahead-of-time generated `Mask` classes.
+
+    :param mask_class_specs: Specifications of the mask classes to be generated.
+    :return: The source of the module.
+    """
+
+    class_sources: List[str] = []
+    registry_lines: List[str] = []
+
+    for spec in mask_class_specs:
+        int_flag_class: Type[IntFlag] = spec.get_int_flag_class()
+        mask_class: Type[Mask] = Mask.make_dynamic_class(
+            int_flag_class=int_flag_class,
+            name=spec.name,
+            prefix=spec.prefix
+        )
+        name, prefix, members = mask_class_fingerprint(
+            int_flag_class=int_flag_class,
+            name=spec.name,
+            prefix=spec.prefix
+        )
+
+        class_sources.append(generate_mask_class_source(mask_class=mask_class))
+        registry_lines.extend([
+            f'    {mask_class.__name__!r}: (',
+            f'        {mask_class.__name__},',
+            f'        ({name!r}, {prefix!r}, (',
+            *(f'            ({member_name!r}, 0x{value:08X}),' for member_name, value in members),
+            '        ))',
+            '    ),',
+        ])
+
+    return '\n\n'.join([
+        '# This file is generated by `python -m msdsalgs.mask_generation`. Do not edit.\n\n'
+        'from msdsalgs.utils import Mask, IntFlagClassReference\n',
+        *class_sources,
+        '\n'.join(['GENERATED_MASK_CLASSES = {', *registry_lines, '}']) + '\n'
+    ])
+
+
+def main():
+    GENERATED_MODULE_PATH.write_text(generate_module_source())
+
+
+if __name__ == '__main__':
+    main()
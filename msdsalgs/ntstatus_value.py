@@ -5,6 +5,8 @@ from sys import modules as sys_modules
 from inspect import getmembers as inspect_getmembers, isclass as inspect_isclass
 from abc import ABC
 
+from msdsalgs.description_store import StoredDescription
+
 
 class NTStatusValue(IntEnum):
     STATUS_SUCCESS = 0x00000000
@@ -1803,9031 +1805,7256 @@ class NTStatusValue(IntEnum):
     STATUS_VHD_DIFFERENCING_CHAIN_ERROR_IN_PARENT = 0xC03A0019
 
 
+# The descriptions of the exception classes, read on demand from a compressed resource.
+NT_STATUS_DESCRIPTIONS = StoredDescription(package='msdsalgs', resource_name='ntstatus_descriptions.bin')
+
+
 class NTStatusValueError(Exception, ABC):
-    DESCRIPTION: str = NotImplemented
+    DESCRIPTION: str = NT_STATUS_DESCRIPTIONS
     NT_STATUS: NTStatusValue = NotImplemented
 
     NT_STATUS_TO_ERROR_CLASS: Dict[NTStatusValue, Type[NTStatusValueError]] = NotImplemented
+    # The same mapping keyed by plain integers, for looking up raw values without constructing enumeration members.
+    NT_STATUS_INT_TO_ERROR_CLASS: Dict[int, Type[NTStatusValueError]] = NotImplemented
 
     def __init__(self, description: Optional[str] = None):
-        super().__init__(description or self.DESCRIPTION)
+        # The class description is only read from the store when the message is needed.
+        super().__init__(*((description,) if description else ()))
+
+    def __str__(self) -> str:
+        return self.args[0] if self.args else str(self.DESCRIPTION)
         
     @classmethod
     def from_nt_status(cls, nt_status: NTStatusValue, **error_options) -> NTStatusValueError:
         return cls.NT_STATUS_TO_ERROR_CLASS[nt_status](**error_options)
 
+    @classmethod
+    def from_nt_status_int(cls, nt_status: int, **error_options) -> NTStatusValueError:
+        """
+        Make an exception from a raw `NTSTATUS` value, which need not be a known value.
+
+        :param nt_status: A raw `NTSTATUS` value, e.g. from a response.
+        :param error_options: Keyword arguments passed to the exception class.
+        :return: An instance of the value's exception class; an `UnknownNTStatusValueError` if it has none.
+        """
+
+        error_class: Optional[Type[NTStatusValueError]] = cls.NT_STATUS_INT_TO_ERROR_CLASS.get(nt_status)
+        if error_class is None:
+            return UnknownNTStatusValueError(nt_status=nt_status, **error_options)
+
+        return error_class(**error_options)
+
+    @classmethod
+    def raise_for_nt_status(cls, nt_status: int, description: Optional[str] = None) -> None:
+        """
+        Raise the exception of a raw `NTSTATUS` value, unless it is `STATUS_SUCCESS`.
+
+        The `STATUS_SUCCESS` check is done first and allocates nothing, so that the method can be called on every
+        response.
+
+        :param nt_status: A raw `NTSTATUS` value, e.g. from a response.
+        :param description: A description overriding that of the exception class.
+        :return: None
+        """
+
+        if nt_status == 0:
+            return
+
+        raise cls.from_nt_status_int(nt_status, description=description)
+
+
+class UnknownNTStatusValueError(NTStatusValueError):
+    """An exception for `NTSTATUS` values that have no exception class of their own."""
+
+    def __init__(self, nt_status: int, description: Optional[str] = None):
+        super().__init__(description or f'An unknown NTSTATUS value was encountered: 0x{nt_status:08X}.')
+        self.nt_status: int = nt_status
+
 
 class StatusWait1Error(NTStatusValueError):
-    DESCRIPTION = """The caller specified WaitAny for WaitType and one of the dispatcher objects in the Object array has been set to the signaled state."""
     NT_STATUS = NTStatusValue.STATUS_WAIT_1
 
 
 class StatusWait2Error(NTStatusValueError):
-    DESCRIPTION = """The caller specified WaitAny for WaitType and one of the dispatcher objects in the Object array has been set to the signaled state."""
     NT_STATUS = NTStatusValue.STATUS_WAIT_2
 
 
 class StatusWait3Error(NTStatusValueError):
-    DESCRIPTION = """The caller specified WaitAny for WaitType and one of the dispatcher objects in the Object array has been set to the signaled state."""
     NT_STATUS = NTStatusValue.STATUS_WAIT_3
 
 
 class StatusWait63Error(NTStatusValueError):
-    DESCRIPTION = """The caller specified WaitAny for WaitType and one of the dispatcher objects in the Object array has been set to the signaled state."""
     NT_STATUS = NTStatusValue.STATUS_WAIT_63
 
 
 class StatusAbandonedError(NTStatusValueError):
-    DESCRIPTION = """The caller attempted to wait for a mutex that has been abandoned."""
     NT_STATUS = NTStatusValue.STATUS_ABANDONED
 
 
 class StatusAbandonedWait0Error(NTStatusValueError):
-    DESCRIPTION = """The caller attempted to wait for a mutex that has been abandoned."""
     NT_STATUS = NTStatusValue.STATUS_ABANDONED_WAIT_0
 
 
 class StatusAbandonedWait63Error(NTStatusValueError):
-    DESCRIPTION = """The caller attempted to wait for a mutex that has been abandoned."""
     NT_STATUS = NTStatusValue.STATUS_ABANDONED_WAIT_63
 
 
 class StatusUserApcError(NTStatusValueError):
-    DESCRIPTION = """A user-mode APC was delivered before the given Interval expired."""
     NT_STATUS = NTStatusValue.STATUS_USER_APC
 
 
 class StatusAlertedError(NTStatusValueError):
-    DESCRIPTION = """The delay completed because the thread was alerted."""
     NT_STATUS = NTStatusValue.STATUS_ALERTED
 
 
 class StatusTimeoutError(NTStatusValueError):
-    DESCRIPTION = """The given Timeout interval expired."""
     NT_STATUS = NTStatusValue.STATUS_TIMEOUT
 
 
 class StatusPendingError(NTStatusValueError):
-    DESCRIPTION = """The operation that was requested is pending completion."""
     NT_STATUS = NTStatusValue.STATUS_PENDING
 
 
 class StatusReparseError(NTStatusValueError):
-    DESCRIPTION = """A reparse should be performed by the Object Manager because the name of the file resulted in a symbolic link."""
     NT_STATUS = NTStatusValue.STATUS_REPARSE
 
 
 class StatusMoreEntriesError(NTStatusValueError):
-    DESCRIPTION = """Returned by enumeration APIs to indicate more information is available to successive calls."""
     NT_STATUS = NTStatusValue.STATUS_MORE_ENTRIES
 
 
 class StatusNotAllAssignedError(NTStatusValueError):
-    DESCRIPTION = """Indicates not all privileges or groups that are referenced are assigned to the caller. This allows, for example, all privileges to be disabled without having to know exactly which privileges are assigned."""
     NT_STATUS = NTStatusValue.STATUS_NOT_ALL_ASSIGNED
 
 
 class StatusSomeNotMappedError(NTStatusValueError):
-    DESCRIPTION = """Some of the information to be translated has not been translated."""
     NT_STATUS = NTStatusValue.STATUS_SOME_NOT_MAPPED
 
 
 class StatusOplockBreakInProgressError(NTStatusValueError):
-    DESCRIPTION = """An open/create operation completed while an opportunistic lock (oplock) break is underway."""
     NT_STATUS = NTStatusValue.STATUS_OPLOCK_BREAK_IN_PROGRESS
 
 
 class StatusVolumeMountedError(NTStatusValueError):
-    DESCRIPTION = """A new volume has been mounted by a file system."""
     NT_STATUS = NTStatusValue.STATUS_VOLUME_MOUNTED
 
 
 class StatusRxactCommittedError(NTStatusValueError):
-    DESCRIPTION = """This success level status indicates that the transaction state already exists for the registry subtree but that a transaction commit was previously aborted. The commit has now been completed."""
     NT_STATUS = NTStatusValue.STATUS_RXACT_COMMITTED
 
 
 class StatusNotifyCleanupError(NTStatusValueError):
-    DESCRIPTION = """Indicates that a notify change request has been completed due to closing the handle that made the notify change request."""
     NT_STATUS = NTStatusValue.STATUS_NOTIFY_CLEANUP
 
 
 class StatusNotifyEnumDirError(NTStatusValueError):
-    DESCRIPTION = """Indicates that a notify change request is being completed and that the information is not being returned in the caller's buffer. The caller now needs to enumerate the files to find the changes."""
     NT_STATUS = NTStatusValue.STATUS_NOTIFY_ENUM_DIR
 
 
 class StatusNoQuotasForAccountError(NTStatusValueError):
-    DESCRIPTION = """{No Quotas} No system quota limits are specifically set for this account."""
     NT_STATUS = NTStatusValue.STATUS_NO_QUOTAS_FOR_ACCOUNT
 
 
 class StatusPrimaryTransportConnectFailedError(NTStatusValueError):
-    DESCRIPTION = """{Connect Failure on Primary Transport} An attempt was made to connect to the remote server %hs on the primary transport, but the connection failed. The computer WAS able to connect on a secondary transport."""
     NT_STATUS = NTStatusValue.STATUS_PRIMARY_TRANSPORT_CONNECT_FAILED
 
 
 class StatusPageFaultTransitionError(NTStatusValueError):
-    DESCRIPTION = """The page fault was a transition fault."""
     NT_STATUS = NTStatusValue.STATUS_PAGE_FAULT_TRANSITION
 
 
 class StatusPageFaultDemandZeroError(NTStatusValueError):
-    DESCRIPTION = """The page fault was a demand zero fault."""
     NT_STATUS = NTStatusValue.STATUS_PAGE_FAULT_DEMAND_ZERO
 
 
 class StatusPageFaultCopyOnWriteError(NTStatusValueError):
-    DESCRIPTION = """The page fault was a demand zero fault."""
     NT_STATUS = NTStatusValue.STATUS_PAGE_FAULT_COPY_ON_WRITE
 
 
 class StatusPageFaultGuardPageError(NTStatusValueError):
-    DESCRIPTION = """The page fault was a demand zero fault."""
     NT_STATUS = NTStatusValue.STATUS_PAGE_FAULT_GUARD_PAGE
 
 
 class StatusPageFaultPagingFileError(NTStatusValueError):
-    DESCRIPTION = """The page fault was satisfied by reading from a secondary storage device."""
     NT_STATUS = NTStatusValue.STATUS_PAGE_FAULT_PAGING_FILE
 
 
 class StatusCachePageLockedError(NTStatusValueError):
-    DESCRIPTION = """The cached page was locked during operation."""
     NT_STATUS = NTStatusValue.STATUS_CACHE_PAGE_LOCKED
 
 
 class StatusCrashDumpError(NTStatusValueError):
-    DESCRIPTION = """The crash dump exists in a paging file."""
     NT_STATUS = NTStatusValue.STATUS_CRASH_DUMP
 
 
 class StatusBufferAllZerosError(NTStatusValueError):
-    DESCRIPTION = """The specified buffer contains all zeros."""
     NT_STATUS = NTStatusValue.STATUS_BUFFER_ALL_ZEROS
 
 
 class StatusReparseObjectError(NTStatusValueError):
-    DESCRIPTION = """A reparse should be performed by the Object Manager because the name of the file resulted in a symbolic link."""
     NT_STATUS = NTStatusValue.STATUS_REPARSE_OBJECT
 
 
 class StatusResourceRequirementsChangedError(NTStatusValueError):
-    DESCRIPTION = """The device has succeeded a query-stop and its resource requirements have changed."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_REQUIREMENTS_CHANGED
 
 
 class StatusTranslationCompleteError(NTStatusValueError):
-    DESCRIPTION = """The translator has translated these resources into the global space and no additional translations should be performed."""
     NT_STATUS = NTStatusValue.STATUS_TRANSLATION_COMPLETE
 
 
 class StatusDsMembershipEvaluatedLocallyError(NTStatusValueError):
-    DESCRIPTION = """The directory service evaluated group memberships locally, because it was unable to contact a global catalog server."""
     NT_STATUS = NTStatusValue.STATUS_DS_MEMBERSHIP_EVALUATED_LOCALLY
 
 
 class StatusNothingToTerminateError(NTStatusValueError):
-    DESCRIPTION = """A process being terminated has no threads to terminate."""
     NT_STATUS = NTStatusValue.STATUS_NOTHING_TO_TERMINATE
 
 
 class StatusProcessNotInJobError(NTStatusValueError):
-    DESCRIPTION = """The specified process is not part of a job."""
     NT_STATUS = NTStatusValue.STATUS_PROCESS_NOT_IN_JOB
 
 
 class StatusProcessInJobError(NTStatusValueError):
-    DESCRIPTION = """The specified process is part of a job."""
     NT_STATUS = NTStatusValue.STATUS_PROCESS_IN_JOB
 
 
 class StatusVolsnapHibernateReadyError(NTStatusValueError):
-    DESCRIPTION = """{Volume Shadow Copy Service} The system is now ready for hibernation."""
     NT_STATUS = NTStatusValue.STATUS_VOLSNAP_HIBERNATE_READY
 
 
 class StatusFsfilterOpCompletedSuccessfullyError(NTStatusValueError):
-    DESCRIPTION = """A file system or file system filter driver has successfully completed an FsFilter operation."""
     NT_STATUS = NTStatusValue.STATUS_FSFILTER_OP_COMPLETED_SUCCESSFULLY
 
 
 class StatusInterruptVectorAlreadyConnectedError(NTStatusValueError):
-    DESCRIPTION = """The specified interrupt vector was already connected."""
     NT_STATUS = NTStatusValue.STATUS_INTERRUPT_VECTOR_ALREADY_CONNECTED
 
 
 class StatusInterruptStillConnectedError(NTStatusValueError):
-    DESCRIPTION = """The specified interrupt vector is still connected."""
     NT_STATUS = NTStatusValue.STATUS_INTERRUPT_STILL_CONNECTED
 
 
 class StatusProcessClonedError(NTStatusValueError):
-    DESCRIPTION = """The current process is a cloned process."""
     NT_STATUS = NTStatusValue.STATUS_PROCESS_CLONED
 
 
 class StatusFileLockedWithOnlyReadersError(NTStatusValueError):
-    DESCRIPTION = """The file was locked and all users of the file can only read."""
     NT_STATUS = NTStatusValue.STATUS_FILE_LOCKED_WITH_ONLY_READERS
 
 
 class StatusFileLockedWithWritersError(NTStatusValueError):
-    DESCRIPTION = """The file was locked and at least one user of the file can write."""
     NT_STATUS = NTStatusValue.STATUS_FILE_LOCKED_WITH_WRITERS
 
 
 class StatusResourcemanagerReadOnlyError(NTStatusValueError):
-    DESCRIPTION = """The specified ResourceManager made no changes or updates to the resource under this transaction."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCEMANAGER_READ_ONLY
 
 
 class StatusWaitForOplockError(NTStatusValueError):
-    DESCRIPTION = """An operation is blocked and waiting for an oplock."""
     NT_STATUS = NTStatusValue.STATUS_WAIT_FOR_OPLOCK
 
 
 class DbgExceptionHandledError(NTStatusValueError):
-    DESCRIPTION = """Debugger handled the exception."""
     NT_STATUS = NTStatusValue.DBG_EXCEPTION_HANDLED
 
 
 class DbgContinueError(NTStatusValueError):
-    DESCRIPTION = """The debugger continued."""
     NT_STATUS = NTStatusValue.DBG_CONTINUE
 
 
 class StatusFltIoCompleteError(NTStatusValueError):
-    DESCRIPTION = """The IO was completed by a filter."""
     NT_STATUS = NTStatusValue.STATUS_FLT_IO_COMPLETE
 
 
 class StatusFileNotAvailableError(NTStatusValueError):
-    DESCRIPTION = """The file is temporarily unavailable."""
     NT_STATUS = NTStatusValue.STATUS_FILE_NOT_AVAILABLE
 
 
 class StatusShareUnavailableError(NTStatusValueError):
-    DESCRIPTION = """The share is temporarily unavailable."""
     NT_STATUS = NTStatusValue.STATUS_SHARE_UNAVAILABLE
 
 
 class StatusCallbackReturnedThreadAffinityError(NTStatusValueError):
-    DESCRIPTION = """A threadpool worker thread entered a callback at thread affinity %p and exited at affinity %p.
-
-This is unexpected, indicating that the callback missed restoring the priority."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_RETURNED_THREAD_AFFINITY
 
 
 class StatusObjectNameExistsError(NTStatusValueError):
-    DESCRIPTION = """{Object Exists} An attempt was made to create an object but the object name already exists."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_NAME_EXISTS
 
 
 class StatusThreadWasSuspendedError(NTStatusValueError):
-    DESCRIPTION = """{Thread Suspended} A thread termination occurred while the thread was suspended. The thread resumed, and termination proceeded."""
     NT_STATUS = NTStatusValue.STATUS_THREAD_WAS_SUSPENDED
 
 
 class StatusWorkingSetLimitRangeError(NTStatusValueError):
-    DESCRIPTION = """{Working Set Range Error} An attempt was made to set the working set minimum or maximum to values that are outside the allowable range."""
     NT_STATUS = NTStatusValue.STATUS_WORKING_SET_LIMIT_RANGE
 
 
 class StatusImageNotAtBaseError(NTStatusValueError):
-    DESCRIPTION = """{Image Relocated} An image file could not be mapped at the address that is specified in the image file. Local fixes must be performed on this image."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_NOT_AT_BASE
 
 
 class StatusRxactStateCreatedError(NTStatusValueError):
-    DESCRIPTION = """This informational level status indicates that a specified registry subtree transaction state did not yet exist and had to be created."""
     NT_STATUS = NTStatusValue.STATUS_RXACT_STATE_CREATED
 
 
 class StatusSegmentNotificationError(NTStatusValueError):
-    DESCRIPTION = """{Segment Load} A virtual DOS machine (VDM) is loading, unloading, or moving an MS-DOS or Win16 program segment image. An exception is raised so that a debugger can load, unload, or track symbols and breakpoints within these 16-bit segments."""
     NT_STATUS = NTStatusValue.STATUS_SEGMENT_NOTIFICATION
 
 
 class StatusLocalUserSessionKeyError(NTStatusValueError):
-    DESCRIPTION = """{Local Session Key} A user session key was requested for a local remote procedure call (RPC) connection. The session key that is returned is a constant value and not unique to this connection."""
     NT_STATUS = NTStatusValue.STATUS_LOCAL_USER_SESSION_KEY
 
 
 class StatusBadCurrentDirectoryError(NTStatusValueError):
-    DESCRIPTION = """{Invalid Current Directory} The process cannot switch to the startup current directory %hs. Select OK to set the current directory to %hs, or select CANCEL to exit."""
     NT_STATUS = NTStatusValue.STATUS_BAD_CURRENT_DIRECTORY
 
 
 class StatusSerialMoreWritesError(NTStatusValueError):
-    DESCRIPTION = """{Serial IOCTL Complete} A serial I/O operation was completed by another write to a serial port. (The IOCTL_SERIAL_XOFF_COUNTER reached zero.)"""
     NT_STATUS = NTStatusValue.STATUS_SERIAL_MORE_WRITES
 
 
 class StatusRegistryRecoveredError(NTStatusValueError):
-    DESCRIPTION = """{Registry Recovery} One of the files that contains the system registry data had to be recovered by using a log or alternate copy. The recovery was successful."""
     NT_STATUS = NTStatusValue.STATUS_REGISTRY_RECOVERED
 
 
 class StatusFtReadRecoveryFromBackupError(NTStatusValueError):
-    DESCRIPTION = """{Redundant Read} To satisfy a read request, the Windows NT operating system fault-tolerant file system successfully read the requested data from a redundant copy. This was done because the file system encountered a failure on a member of the fault-tolerant volume but was unable to reassign the failing area of the device."""
     NT_STATUS = NTStatusValue.STATUS_FT_READ_RECOVERY_FROM_BACKUP
 
 
 class StatusFtWriteRecoveryError(NTStatusValueError):
-    DESCRIPTION = """{Redundant Write} To satisfy a write request, the Windows NT fault-tolerant file system successfully wrote a redundant copy of the information. This was done because the file system encountered a failure on a member of the fault-tolerant volume but was unable to reassign the failing area of the device."""
     NT_STATUS = NTStatusValue.STATUS_FT_WRITE_RECOVERY
 
 
 class StatusSerialCounterTimeoutError(NTStatusValueError):
-    DESCRIPTION = """{Serial IOCTL Timeout} A serial I/O operation completed because the time-out period expired. (The IOCTL_SERIAL_XOFF_COUNTER had not reached zero.)"""
     NT_STATUS = NTStatusValue.STATUS_SERIAL_COUNTER_TIMEOUT
 
 
 class StatusNullLmPasswordError(NTStatusValueError):
-    DESCRIPTION = """{Password Too Complex} The Windows password is too complex to be converted to a LAN Manager password. The LAN Manager password that returned is a NULL string."""
     NT_STATUS = NTStatusValue.STATUS_NULL_LM_PASSWORD
 
 
 class StatusImageMachineTypeMismatchError(NTStatusValueError):
-    DESCRIPTION = """{Machine Type Mismatch} The image file %hs is valid but is for a machine type other than the current machine. Select OK to continue, or CANCEL to fail the DLL load."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_MACHINE_TYPE_MISMATCH
 
 
 class StatusReceivePartialError(NTStatusValueError):
-    DESCRIPTION = """{Partial Data Received} The network transport returned partial data to its client. The remaining data will be sent later."""
     NT_STATUS = NTStatusValue.STATUS_RECEIVE_PARTIAL
 
 
 class StatusReceiveExpeditedError(NTStatusValueError):
-    DESCRIPTION = """{Expedited Data Received} The network transport returned data to its client that was marked as expedited by the remote system."""
     NT_STATUS = NTStatusValue.STATUS_RECEIVE_EXPEDITED
 
 
 class StatusReceivePartialExpeditedError(NTStatusValueError):
-    DESCRIPTION = """{Partial Expedited Data Received} The network transport returned partial data to its client and this data was marked as expedited by the remote system. The remaining data will be sent later."""
     NT_STATUS = NTStatusValue.STATUS_RECEIVE_PARTIAL_EXPEDITED
 
 
 class StatusEventDoneError(NTStatusValueError):
-    DESCRIPTION = """{TDI Event Done} The TDI indication has completed successfully."""
     NT_STATUS = NTStatusValue.STATUS_EVENT_DONE
 
 
 class StatusEventPendingError(NTStatusValueError):
-    DESCRIPTION = """{TDI Event Pending} The TDI indication has entered the pending state."""
     NT_STATUS = NTStatusValue.STATUS_EVENT_PENDING
 
 
 class StatusCheckingFileSystemError(NTStatusValueError):
-    DESCRIPTION = """Checking file system on %wZ."""
     NT_STATUS = NTStatusValue.STATUS_CHECKING_FILE_SYSTEM
 
 
 class StatusFatalAppExitError(NTStatusValueError):
-    DESCRIPTION = """{Fatal Application Exit} %hs"""
     NT_STATUS = NTStatusValue.STATUS_FATAL_APP_EXIT
 
 
 class StatusPredefinedHandleError(NTStatusValueError):
-    DESCRIPTION = """The specified registry key is referenced by a predefined handle."""
     NT_STATUS = NTStatusValue.STATUS_PREDEFINED_HANDLE
 
 
 class StatusWasUnlockedError(NTStatusValueError):
-    DESCRIPTION = """{Page Unlocked} The page protection of a locked page was changed to 'No Access' and the page was unlocked from memory and from the process."""
     NT_STATUS = NTStatusValue.STATUS_WAS_UNLOCKED
 
 
 class StatusServiceNotificationError(NTStatusValueError):
-    DESCRIPTION = """%hs"""
     NT_STATUS = NTStatusValue.STATUS_SERVICE_NOTIFICATION
 
 
 class StatusWasLockedError(NTStatusValueError):
-    DESCRIPTION = """{Page Locked} One of the pages to lock was already locked."""
     NT_STATUS = NTStatusValue.STATUS_WAS_LOCKED
 
 
 class StatusLogHardErrorError(NTStatusValueError):
-    DESCRIPTION = """Application popup: %1 : %2"""
     NT_STATUS = NTStatusValue.STATUS_LOG_HARD_ERROR
 
 
 class StatusAlreadyWin32Error(NTStatusValueError):
-    DESCRIPTION = """A Win32 process already exists."""
     NT_STATUS = NTStatusValue.STATUS_ALREADY_WIN32
 
 
 class StatusWx86UnsimulateError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_UNSIMULATE
 
 
 class StatusWx86ContinueError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_CONTINUE
 
 
 class StatusWx86SingleStepError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_SINGLE_STEP
 
 
 class StatusWx86BreakpointError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_BREAKPOINT
 
 
 class StatusWx86ExceptionContinueError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_EXCEPTION_CONTINUE
 
 
 class StatusWx86ExceptionLastchanceError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_EXCEPTION_LASTCHANCE
 
 
 class StatusWx86ExceptionChainError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_EXCEPTION_CHAIN
 
 
 class StatusImageMachineTypeMismatchExeError(NTStatusValueError):
-    DESCRIPTION = """{Machine Type Mismatch} The image file %hs is valid but is for a machine type other than the current machine."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_MACHINE_TYPE_MISMATCH_EXE
 
 
 class StatusNoYieldPerformedError(NTStatusValueError):
-    DESCRIPTION = """A yield execution was performed and no thread was available to run."""
     NT_STATUS = NTStatusValue.STATUS_NO_YIELD_PERFORMED
 
 
 class StatusTimerResumeIgnoredError(NTStatusValueError):
-    DESCRIPTION = """The resume flag to a timer API was ignored."""
     NT_STATUS = NTStatusValue.STATUS_TIMER_RESUME_IGNORED
 
 
 class StatusArbitrationUnhandledError(NTStatusValueError):
-    DESCRIPTION = """The arbiter has deferred arbitration of these resources to its parent."""
     NT_STATUS = NTStatusValue.STATUS_ARBITRATION_UNHANDLED
 
 
 class StatusCardbusNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The device has detected a CardBus card in its slot."""
     NT_STATUS = NTStatusValue.STATUS_CARDBUS_NOT_SUPPORTED
 
 
 class StatusWx86Createwx86tibError(NTStatusValueError):
-    DESCRIPTION = """An exception status code that is used by the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_CREATEWX86TIB
 
 
 class StatusMpProcessorMismatchError(NTStatusValueError):
-    DESCRIPTION = """The CPUs in this multiprocessor system are not all the same revision level. To use all processors, the operating system restricts itself to the features of the least capable processor in the system. If problems occur with this system, contact the CPU manufacturer to see if this mix of processors is supported."""
     NT_STATUS = NTStatusValue.STATUS_MP_PROCESSOR_MISMATCH
 
 
 class StatusHibernatedError(NTStatusValueError):
-    DESCRIPTION = """The system was put into hibernation."""
     NT_STATUS = NTStatusValue.STATUS_HIBERNATED
 
 
 class StatusResumeHibernationError(NTStatusValueError):
-    DESCRIPTION = """The system was resumed from hibernation."""
     NT_STATUS = NTStatusValue.STATUS_RESUME_HIBERNATION
 
 
 class StatusFirmwareUpdatedError(NTStatusValueError):
-    DESCRIPTION = """Windows has detected that the system firmware (BIOS) was updated [previous firmware date = %2, current firmware date %3]."""
     NT_STATUS = NTStatusValue.STATUS_FIRMWARE_UPDATED
 
 
 class StatusDriversLeakingLockedPagesError(NTStatusValueError):
-    DESCRIPTION = """A device driver is leaking locked I/O pages and is causing system degradation. The system has automatically enabled the tracking code to try and catch the culprit."""
     NT_STATUS = NTStatusValue.STATUS_DRIVERS_LEAKING_LOCKED_PAGES
 
 
 class StatusMessageRetrievedError(NTStatusValueError):
-    DESCRIPTION = """The ALPC message being canceled has already been retrieved from the queue on the other side."""
     NT_STATUS = NTStatusValue.STATUS_MESSAGE_RETRIEVED
 
 
 class StatusSystemPowerstateTransitionError(NTStatusValueError):
-    DESCRIPTION = """The system power state is transitioning from %2 to %3."""
     NT_STATUS = NTStatusValue.STATUS_SYSTEM_POWERSTATE_TRANSITION
 
 
 class StatusAlpcCheckCompletionListError(NTStatusValueError):
-    DESCRIPTION = """The receive operation was successful. Check the ALPC completion list for the received message."""
     NT_STATUS = NTStatusValue.STATUS_ALPC_CHECK_COMPLETION_LIST
 
 
 class StatusSystemPowerstateComplexTransitionError(NTStatusValueError):
-    DESCRIPTION = """The system power state is transitioning from %2 to %3 but could enter %4."""
     NT_STATUS = NTStatusValue.STATUS_SYSTEM_POWERSTATE_COMPLEX_TRANSITION
 
 
 class StatusAccessAuditByPolicyError(NTStatusValueError):
-    DESCRIPTION = """Access to %1 is monitored by policy rule %2."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_AUDIT_BY_POLICY
 
 
 class StatusAbandonHiberfileError(NTStatusValueError):
-    DESCRIPTION = """A valid hibernation file has been invalidated and should be abandoned."""
     NT_STATUS = NTStatusValue.STATUS_ABANDON_HIBERFILE
 
 
 class StatusBizrulesNotEnabledError(NTStatusValueError):
-    DESCRIPTION = """Business rule scripts are disabled for the calling application."""
     NT_STATUS = NTStatusValue.STATUS_BIZRULES_NOT_ENABLED
 
 
 class StatusWakeSystemError(NTStatusValueError):
-    DESCRIPTION = """The system has awoken."""
     NT_STATUS = NTStatusValue.STATUS_WAKE_SYSTEM
 
 
 class StatusDsShuttingDownError(NTStatusValueError):
-    DESCRIPTION = """The directory service is shutting down."""
     NT_STATUS = NTStatusValue.STATUS_DS_SHUTTING_DOWN
 
 
 class DbgReplyLaterError(NTStatusValueError):
-    DESCRIPTION = """Debugger will reply later."""
     NT_STATUS = NTStatusValue.DBG_REPLY_LATER
 
 
 class DbgUnableToProvideHandleError(NTStatusValueError):
-    DESCRIPTION = """Debugger cannot provide a handle."""
     NT_STATUS = NTStatusValue.DBG_UNABLE_TO_PROVIDE_HANDLE
 
 
 class DbgTerminateThreadError(NTStatusValueError):
-    DESCRIPTION = """Debugger terminated the thread."""
     NT_STATUS = NTStatusValue.DBG_TERMINATE_THREAD
 
 
 class DbgTerminateProcessError(NTStatusValueError):
-    DESCRIPTION = """Debugger terminated the process."""
     NT_STATUS = NTStatusValue.DBG_TERMINATE_PROCESS
 
 
 class DbgControlCError(NTStatusValueError):
-    DESCRIPTION = """Debugger obtained control of C."""
     NT_STATUS = NTStatusValue.DBG_CONTROL_C
 
 
 class DbgPrintexceptionCError(NTStatusValueError):
-    DESCRIPTION = """Debugger printed an exception on control C."""
     NT_STATUS = NTStatusValue.DBG_PRINTEXCEPTION_C
 
 
 class DbgRipexceptionError(NTStatusValueError):
-    DESCRIPTION = """Debugger received a RIP exception."""
     NT_STATUS = NTStatusValue.DBG_RIPEXCEPTION
 
 
 class DbgControlBreakError(NTStatusValueError):
-    DESCRIPTION = """Debugger received a control break."""
     NT_STATUS = NTStatusValue.DBG_CONTROL_BREAK
 
 
 class DbgCommandExceptionError(NTStatusValueError):
-    DESCRIPTION = """Debugger command communication exception."""
     NT_STATUS = NTStatusValue.DBG_COMMAND_EXCEPTION
 
 
 class RpcNtUuidLocalOnlyError(NTStatusValueError):
-    DESCRIPTION = """A UUID that is valid only on this computer has been allocated."""
     NT_STATUS = NTStatusValue.RPC_NT_UUID_LOCAL_ONLY
 
 
 class RpcNtSendIncompleteError(NTStatusValueError):
-    DESCRIPTION = """Some data remains to be sent in the request buffer."""
     NT_STATUS = NTStatusValue.RPC_NT_SEND_INCOMPLETE
 
 
 class StatusCtxCdmConnectError(NTStatusValueError):
-    DESCRIPTION = """The Client Drive Mapping Service has connected on Terminal Connection."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CDM_CONNECT
 
 
 class StatusCtxCdmDisconnectError(NTStatusValueError):
-    DESCRIPTION = """The Client Drive Mapping Service has disconnected on Terminal Connection."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CDM_DISCONNECT
 
 
 class StatusSxsReleaseActivationContextError(NTStatusValueError):
-    DESCRIPTION = """A kernel mode component is releasing a reference on an activation context."""
     NT_STATUS = NTStatusValue.STATUS_SXS_RELEASE_ACTIVATION_CONTEXT
 
 
 class StatusRecoveryNotNeededError(NTStatusValueError):
-    DESCRIPTION = """The transactional resource manager is already consistent. Recovery is not needed."""
     NT_STATUS = NTStatusValue.STATUS_RECOVERY_NOT_NEEDED
 
 
 class StatusRmAlreadyStartedError(NTStatusValueError):
-    DESCRIPTION = """The transactional resource manager has already been started."""
     NT_STATUS = NTStatusValue.STATUS_RM_ALREADY_STARTED
 
 
 class StatusLogNoRestartError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered a log stream with no restart area."""
     NT_STATUS = NTStatusValue.STATUS_LOG_NO_RESTART
 
 
 class StatusVideoDriverDebugReportRequestError(NTStatusValueError):
-    DESCRIPTION = """{Display Driver Recovered From Failure} The %hs display driver has detected a failure and recovered from it. Some graphical operations might have failed. The next time you restart the machine, a dialog box appears, giving you an opportunity to upload data about this failure to Microsoft."""
     NT_STATUS = NTStatusValue.STATUS_VIDEO_DRIVER_DEBUG_REPORT_REQUEST
 
 
 class StatusGraphicsPartialDataPopulatedError(NTStatusValueError):
-    DESCRIPTION = """The specified buffer is not big enough to contain the entire requested dataset. Partial data is populated up to the size of the buffer.
-
-The caller needs to provide a buffer of the size as specified in the partially populated buffer's content (interface specific)."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PARTIAL_DATA_POPULATED
 
 
 class StatusGraphicsDriverMismatchError(NTStatusValueError):
-    DESCRIPTION = """The kernel driver detected a version mismatch between it and the user mode driver."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DRIVER_MISMATCH
 
 
 class StatusGraphicsModeNotPinnedError(NTStatusValueError):
-    DESCRIPTION = """No mode is pinned on the specified VidPN source/target."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MODE_NOT_PINNED
 
 
 class StatusGraphicsNoPreferredModeError(NTStatusValueError):
-    DESCRIPTION = """The specified mode set does not specify a preference for one of its modes."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_PREFERRED_MODE
 
 
 class StatusGraphicsDatasetIsEmptyError(NTStatusValueError):
-    DESCRIPTION = """The specified dataset (for example, mode set, frequency range set, descriptor set, or topology) is empty."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DATASET_IS_EMPTY
 
 
 class StatusGraphicsNoMoreElementsInDatasetError(NTStatusValueError):
-    DESCRIPTION = """The specified dataset (for example, mode set, frequency range set, descriptor set, or topology) does not contain any more elements."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_MORE_ELEMENTS_IN_DATASET
 
 
 class StatusGraphicsPathContentGeometryTransformationNotPinnedError(NTStatusValueError):
-    DESCRIPTION = """The specified content transformation is not pinned on the specified VidPN present path."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PATH_CONTENT_GEOMETRY_TRANSFORMATION_NOT_PINNED
 
 
 class StatusGraphicsUnknownChildStatusError(NTStatusValueError):
-    DESCRIPTION = """The child device presence was not reliably detected."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_UNKNOWN_CHILD_STATUS
 
 
 class StatusGraphicsLeadlinkStartDeferredError(NTStatusValueError):
-    DESCRIPTION = """Starting the lead adapter in a linked configuration has been temporarily deferred."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_LEADLINK_START_DEFERRED
 
 
 class StatusGraphicsPollingTooFrequentlyError(NTStatusValueError):
-    DESCRIPTION = """The display adapter is being polled for children too frequently at the same polling level."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_POLLING_TOO_FREQUENTLY
 
 
 class StatusGraphicsStartDeferredError(NTStatusValueError):
-    DESCRIPTION = """Starting the adapter has been temporarily deferred."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_START_DEFERRED
 
 
 class StatusNdisIndicationRequiredError(NTStatusValueError):
-    DESCRIPTION = """The request will be completed later by an NDIS status indication."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INDICATION_REQUIRED
 
 
 class StatusGuardPageViolationError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Guard Page Exception A page of memory that marks the end of a data structure, such as a stack or an array, has been accessed."""
     NT_STATUS = NTStatusValue.STATUS_GUARD_PAGE_VIOLATION
 
 
 class StatusDatatypeMisalignmentError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Alignment Fault A data type misalignment was detected in a load or store instruction."""
     NT_STATUS = NTStatusValue.STATUS_DATATYPE_MISALIGNMENT
 
 
 class StatusBreakpointError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Breakpoint A breakpoint has been reached."""
     NT_STATUS = NTStatusValue.STATUS_BREAKPOINT
 
 
 class StatusSingleStepError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Single Step A single step or trace operation has just been completed."""
     NT_STATUS = NTStatusValue.STATUS_SINGLE_STEP
 
 
 class StatusBufferOverflowError(NTStatusValueError):
-    DESCRIPTION = """{Buffer Overflow} The data was too large to fit into the specified buffer."""
     NT_STATUS = NTStatusValue.STATUS_BUFFER_OVERFLOW
 
 
 class StatusNoMoreFilesError(NTStatusValueError):
-    DESCRIPTION = """{No More Files} No more files were found which match the file specification."""
     NT_STATUS = NTStatusValue.STATUS_NO_MORE_FILES
 
 
 class StatusWakeSystemDebuggerError(NTStatusValueError):
-    DESCRIPTION = """{Kernel Debugger Awakened} The system debugger was awakened by an interrupt."""
     NT_STATUS = NTStatusValue.STATUS_WAKE_SYSTEM_DEBUGGER
 
 
 class StatusHandlesClosedError(NTStatusValueError):
-    DESCRIPTION = """{Handles Closed} Handles to objects have been automatically closed because of the requested operation."""
     NT_STATUS = NTStatusValue.STATUS_HANDLES_CLOSED
 
 
 class StatusNoInheritanceError(NTStatusValueError):
-    DESCRIPTION = """{Non-Inheritable ACL} An access control list (ACL) contains no components that can be inherited."""
     NT_STATUS = NTStatusValue.STATUS_NO_INHERITANCE
 
 
 class StatusGuidSubstitutionMadeError(NTStatusValueError):
-    DESCRIPTION = """{GUID Substitution} During the translation of a globally unique identifier (GUID) to a Windows security ID (SID), no administratively defined GUID prefix was found. A substitute prefix was used, which will not compromise system security. However, this might provide a more restrictive access than intended."""
     NT_STATUS = NTStatusValue.STATUS_GUID_SUBSTITUTION_MADE
 
 
 class StatusPartialCopyError(NTStatusValueError):
-    DESCRIPTION = """Because of protection conflicts, not all the requested bytes could be copied."""
     NT_STATUS = NTStatusValue.STATUS_PARTIAL_COPY
 
 
 class StatusDevicePaperEmptyError(NTStatusValueError):
-    DESCRIPTION = """{Out of Paper} The printer is out of paper."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_PAPER_EMPTY
 
 
 class StatusDevicePoweredOffError(NTStatusValueError):
-    DESCRIPTION = """{Device Power Is Off} The printer power has been turned off."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_POWERED_OFF
 
 
 class StatusDeviceOffLineError(NTStatusValueError):
-    DESCRIPTION = """{Device Offline} The printer has been taken offline."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_OFF_LINE
 
 
 class StatusDeviceBusyError(NTStatusValueError):
-    DESCRIPTION = """{Device Busy} The device is currently busy."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_BUSY
 
 
 class StatusNoMoreEasError(NTStatusValueError):
-    DESCRIPTION = """{No More EAs} No more extended attributes (EAs) were found for the file."""
     NT_STATUS = NTStatusValue.STATUS_NO_MORE_EAS
 
 
 class StatusInvalidEaNameError(NTStatusValueError):
-    DESCRIPTION = """{Illegal EA} The specified extended attribute (EA) name contains at least one illegal character."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_EA_NAME
 
 
 class StatusEaListInconsistentError(NTStatusValueError):
-    DESCRIPTION = """{Inconsistent EA List} The extended attribute (EA) list is inconsistent."""
     NT_STATUS = NTStatusValue.STATUS_EA_LIST_INCONSISTENT
 
 
 class StatusInvalidEaFlagError(NTStatusValueError):
-    DESCRIPTION = """{Invalid EA Flag} An invalid extended attribute (EA) flag was set."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_EA_FLAG
 
 
 class StatusVerifyRequiredError(NTStatusValueError):
-    DESCRIPTION = """{Verifying Disk} The media has changed and a verify operation is in progress; therefore, no reads or writes can be performed to the device, except those that are used in the verify operation."""
     NT_STATUS = NTStatusValue.STATUS_VERIFY_REQUIRED
 
 
 class StatusExtraneousInformationError(NTStatusValueError):
-    DESCRIPTION = """{Too Much Information} The specified access control list (ACL) contained more information than was expected."""
     NT_STATUS = NTStatusValue.STATUS_EXTRANEOUS_INFORMATION
 
 
 class StatusRxactCommitNecessaryError(NTStatusValueError):
-    DESCRIPTION = """This warning level status indicates that the transaction state already exists for the registry subtree, but that a transaction commit was previously aborted. The commit has NOT been completed but has not been rolled back either; therefore, it can still be committed, if needed."""
     NT_STATUS = NTStatusValue.STATUS_RXACT_COMMIT_NECESSARY
 
 
 class StatusNoMoreEntriesError(NTStatusValueError):
-    DESCRIPTION = """{No More Entries} No more entries are available from an enumeration operation."""
     NT_STATUS = NTStatusValue.STATUS_NO_MORE_ENTRIES
 
 
 class StatusFilemarkDetectedError(NTStatusValueError):
-    DESCRIPTION = """{Filemark Found} A filemark was detected."""
     NT_STATUS = NTStatusValue.STATUS_FILEMARK_DETECTED
 
 
 class StatusMediaChangedError(NTStatusValueError):
-    DESCRIPTION = """{Media Changed} The media has changed."""
     NT_STATUS = NTStatusValue.STATUS_MEDIA_CHANGED
 
 
 class StatusBusResetError(NTStatusValueError):
-    DESCRIPTION = """{I/O Bus Reset} An I/O bus reset was detected."""
     NT_STATUS = NTStatusValue.STATUS_BUS_RESET
 
 
 class StatusEndOfMediaError(NTStatusValueError):
-    DESCRIPTION = """{End of Media} The end of the media was encountered."""
     NT_STATUS = NTStatusValue.STATUS_END_OF_MEDIA
 
 
 class StatusBeginningOfMediaError(NTStatusValueError):
-    DESCRIPTION = """The beginning of a tape or partition has been detected."""
     NT_STATUS = NTStatusValue.STATUS_BEGINNING_OF_MEDIA
 
 
 class StatusMediaCheckError(NTStatusValueError):
-    DESCRIPTION = """{Media Changed} The media might have changed."""
     NT_STATUS = NTStatusValue.STATUS_MEDIA_CHECK
 
 
 class StatusSetmarkDetectedError(NTStatusValueError):
-    DESCRIPTION = """A tape access reached a set mark."""
     NT_STATUS = NTStatusValue.STATUS_SETMARK_DETECTED
 
 
 class StatusNoDataDetectedError(NTStatusValueError):
-    DESCRIPTION = """During a tape access, the end of the data written is reached."""
     NT_STATUS = NTStatusValue.STATUS_NO_DATA_DETECTED
 
 
 class StatusRedirectorHasOpenHandlesError(NTStatusValueError):
-    DESCRIPTION = """The redirector is in use and cannot be unloaded."""
     NT_STATUS = NTStatusValue.STATUS_REDIRECTOR_HAS_OPEN_HANDLES
 
 
 class StatusServerHasOpenHandlesError(NTStatusValueError):
-    DESCRIPTION = """The server is in use and cannot be unloaded."""
     NT_STATUS = NTStatusValue.STATUS_SERVER_HAS_OPEN_HANDLES
 
 
 class StatusAlreadyDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """The specified connection has already been disconnected."""
     NT_STATUS = NTStatusValue.STATUS_ALREADY_DISCONNECTED
 
 
 class StatusLongjumpError(NTStatusValueError):
-    DESCRIPTION = """A long jump has been executed."""
     NT_STATUS = NTStatusValue.STATUS_LONGJUMP
 
 
 class StatusCleanerCartridgeInstalledError(NTStatusValueError):
-    DESCRIPTION = """A cleaner cartridge is present in the tape library."""
     NT_STATUS = NTStatusValue.STATUS_CLEANER_CARTRIDGE_INSTALLED
 
 
 class StatusPlugplayQueryVetoedError(NTStatusValueError):
-    DESCRIPTION = """The Plug and Play query operation was not successful."""
     NT_STATUS = NTStatusValue.STATUS_PLUGPLAY_QUERY_VETOED
 
 
 class StatusUnwindConsolidateError(NTStatusValueError):
-    DESCRIPTION = """A frame consolidation has been executed."""
     NT_STATUS = NTStatusValue.STATUS_UNWIND_CONSOLIDATE
 
 
 class StatusRegistryHiveRecoveredError(NTStatusValueError):
-    DESCRIPTION = """{Registry Hive Recovered} The registry hive (file): %hs was corrupted and it has been recovered. Some data might have been lost."""
     NT_STATUS = NTStatusValue.STATUS_REGISTRY_HIVE_RECOVERED
 
 
 class StatusDllMightBeInsecureError(NTStatusValueError):
-    DESCRIPTION = """The application is attempting to run executable code from the module %hs. This might be insecure. An alternative, %hs, is available. Should the application use the secure module %hs?"""
     NT_STATUS = NTStatusValue.STATUS_DLL_MIGHT_BE_INSECURE
 
 
 class StatusDllMightBeIncompatibleError(NTStatusValueError):
-    DESCRIPTION = """The application is loading executable code from the module %hs. This is secure but might be incompatible with previous releases of the operating system. An alternative, %hs, is available. Should the application use the secure module %hs?"""
     NT_STATUS = NTStatusValue.STATUS_DLL_MIGHT_BE_INCOMPATIBLE
 
 
 class StatusStoppedOnSymlinkError(NTStatusValueError):
-    DESCRIPTION = """The create operation stopped after reaching a symbolic link."""
     NT_STATUS = NTStatusValue.STATUS_STOPPED_ON_SYMLINK
 
 
 class StatusDeviceRequiresCleaningError(NTStatusValueError):
-    DESCRIPTION = """The device has indicated that cleaning is necessary."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_REQUIRES_CLEANING
 
 
 class StatusDeviceDoorOpenError(NTStatusValueError):
-    DESCRIPTION = """The device has indicated that its door is open. Further operations require it closed and secured."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_DOOR_OPEN
 
 
 class StatusDataLostRepairError(NTStatusValueError):
-    DESCRIPTION = """Windows discovered a corruption in the file %hs. This file has now been repaired. Check if any data in the file was lost because of the corruption."""
     NT_STATUS = NTStatusValue.STATUS_DATA_LOST_REPAIR
 
 
 class DbgExceptionNotHandledError(NTStatusValueError):
-    DESCRIPTION = """Debugger did not handle the exception."""
     NT_STATUS = NTStatusValue.DBG_EXCEPTION_NOT_HANDLED
 
 
 class StatusClusterNodeAlreadyUpError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is already up."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_ALREADY_UP
 
 
 class StatusClusterNodeAlreadyDownError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is already down."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_ALREADY_DOWN
 
 
 class StatusClusterNetworkAlreadyOnlineError(NTStatusValueError):
-    DESCRIPTION = """The cluster network is already online."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NETWORK_ALREADY_ONLINE
 
 
 class StatusClusterNetworkAlreadyOfflineError(NTStatusValueError):
-    DESCRIPTION = """The cluster network is already offline."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NETWORK_ALREADY_OFFLINE
 
 
 class StatusClusterNodeAlreadyMemberError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is already a member of the cluster."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_ALREADY_MEMBER
 
 
 class StatusCouldNotResizeLogError(NTStatusValueError):
-    DESCRIPTION = """The log could not be set to the requested size."""
     NT_STATUS = NTStatusValue.STATUS_COULD_NOT_RESIZE_LOG
 
 
 class StatusNoTxfMetadataError(NTStatusValueError):
-    DESCRIPTION = """There is no transaction metadata on the file."""
     NT_STATUS = NTStatusValue.STATUS_NO_TXF_METADATA
 
 
 class StatusCantRecoverWithHandleOpenError(NTStatusValueError):
-    DESCRIPTION = """The file cannot be recovered because there is a handle still open on it."""
     NT_STATUS = NTStatusValue.STATUS_CANT_RECOVER_WITH_HANDLE_OPEN
 
 
 class StatusTxfMetadataAlreadyPresentError(NTStatusValueError):
-    DESCRIPTION = """Transaction metadata is already present on this file and cannot be superseded."""
     NT_STATUS = NTStatusValue.STATUS_TXF_METADATA_ALREADY_PRESENT
 
 
 class StatusTransactionScopeCallbacksNotSetError(NTStatusValueError):
-    DESCRIPTION = """A transaction scope could not be entered because the scope handler has not been initialized."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_SCOPE_CALLBACKS_NOT_SET
 
 
 class StatusVideoHungDisplayDriverThreadRecoveredError(NTStatusValueError):
-    DESCRIPTION = """{Display Driver Stopped Responding and recovered} The %hs display driver has stopped working normally. The recovery had been performed."""
     NT_STATUS = NTStatusValue.STATUS_VIDEO_HUNG_DISPLAY_DRIVER_THREAD_RECOVERED
 
 
 class StatusFltBufferTooSmallError(NTStatusValueError):
-    DESCRIPTION = """{Buffer too small} The buffer is too small to contain the entry. No information has been written to the buffer."""
     NT_STATUS = NTStatusValue.STATUS_FLT_BUFFER_TOO_SMALL
 
 
 class StatusFvePartialMetadataError(NTStatusValueError):
-    DESCRIPTION = """Volume metadata read or write is incomplete."""
     NT_STATUS = NTStatusValue.STATUS_FVE_PARTIAL_METADATA
 
 
 class StatusFveTransientStateError(NTStatusValueError):
-    DESCRIPTION = """BitLocker encryption keys were ignored because the volume was in a transient state."""
     NT_STATUS = NTStatusValue.STATUS_FVE_TRANSIENT_STATE
 
 
 class StatusUnsuccessfulError(NTStatusValueError):
-    DESCRIPTION = """{Operation Failed} The requested operation was unsuccessful."""
     NT_STATUS = NTStatusValue.STATUS_UNSUCCESSFUL
 
 
 class StatusNotImplementedError(NTStatusValueError):
-    DESCRIPTION = """{Not Implemented} The requested operation is not implemented."""
     NT_STATUS = NTStatusValue.STATUS_NOT_IMPLEMENTED
 
 
 class StatusInvalidInfoClassError(NTStatusValueError):
-    DESCRIPTION = """{Invalid Parameter} The specified information class is not a valid information class for the specified object."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_INFO_CLASS
 
 
 class StatusInfoLengthMismatchError(NTStatusValueError):
-    DESCRIPTION = """The specified information record length does not match the length that is required for the specified information class."""
     NT_STATUS = NTStatusValue.STATUS_INFO_LENGTH_MISMATCH
 
 
 class StatusAccessViolationError(NTStatusValueError):
-    DESCRIPTION = """The instruction at 0x%08lx referenced memory at 0x%08lx. The memory could not be %s."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_VIOLATION
 
 
 class StatusInPageErrorError(NTStatusValueError):
-    DESCRIPTION = """The instruction at 0x%08lx referenced memory at 0x%08lx. The required data was not placed into memory because of an I/O error status of 0x%08lx."""
     NT_STATUS = NTStatusValue.STATUS_IN_PAGE_ERROR
 
 
 class StatusPagefileQuotaError(NTStatusValueError):
-    DESCRIPTION = """The page file quota for the process has been exhausted."""
     NT_STATUS = NTStatusValue.STATUS_PAGEFILE_QUOTA
 
 
 class StatusInvalidHandleError(NTStatusValueError):
-    DESCRIPTION = """An invalid HANDLE was specified."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_HANDLE
 
 
 class StatusBadInitialStackError(NTStatusValueError):
-    DESCRIPTION = """An invalid initial stack was specified in a call to NtCreateThread."""
     NT_STATUS = NTStatusValue.STATUS_BAD_INITIAL_STACK
 
 
 class StatusBadInitialPcError(NTStatusValueError):
-    DESCRIPTION = """An invalid initial start address was specified in a call to NtCreateThread."""
     NT_STATUS = NTStatusValue.STATUS_BAD_INITIAL_PC
 
 
 class StatusInvalidCidError(NTStatusValueError):
-    DESCRIPTION = """An invalid client ID was specified."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_CID
 
 
 class StatusTimerNotCanceledError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to cancel or set a timer that has an associated APC and the specified thread is not the thread that originally set the timer with an associated APC routine."""
     NT_STATUS = NTStatusValue.STATUS_TIMER_NOT_CANCELED
 
 
 class StatusInvalidParameterError(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER
 
 
 class StatusNoSuchDeviceError(NTStatusValueError):
-    DESCRIPTION = """A device that does not exist was specified."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_DEVICE
 
 
 class StatusNoSuchFileError(NTStatusValueError):
-    DESCRIPTION = """{File Not Found} The file %hs does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_FILE
 
 
 class StatusInvalidDeviceRequestError(NTStatusValueError):
-    DESCRIPTION = """The specified request is not a valid operation for the target device."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_DEVICE_REQUEST
 
 
 class StatusEndOfFileError(NTStatusValueError):
-    DESCRIPTION = """The end-of-file marker has been reached. There is no valid data in the file beyond this marker."""
     NT_STATUS = NTStatusValue.STATUS_END_OF_FILE
 
 
 class StatusWrongVolumeError(NTStatusValueError):
-    DESCRIPTION = """{Wrong Volume} The wrong volume is in the drive. Insert volume %hs into drive %hs."""
     NT_STATUS = NTStatusValue.STATUS_WRONG_VOLUME
 
 
 class StatusNoMediaInDeviceError(NTStatusValueError):
-    DESCRIPTION = """{No Disk} There is no disk in the drive. Insert a disk into drive %hs."""
     NT_STATUS = NTStatusValue.STATUS_NO_MEDIA_IN_DEVICE
 
 
 class StatusUnrecognizedMediaError(NTStatusValueError):
-    DESCRIPTION = """{Unknown Disk Format} The disk in drive %hs is not formatted properly. Check the disk, and reformat it, if needed."""
     NT_STATUS = NTStatusValue.STATUS_UNRECOGNIZED_MEDIA
 
 
 class StatusNonexistentSectorError(NTStatusValueError):
-    DESCRIPTION = """{Sector Not Found} The specified sector does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NONEXISTENT_SECTOR
 
 
 class StatusMoreProcessingRequiredError(NTStatusValueError):
-    DESCRIPTION = """{Still Busy} The specified I/O request packet (IRP) cannot be disposed of because the I/O operation is not complete."""
     NT_STATUS = NTStatusValue.STATUS_MORE_PROCESSING_REQUIRED
 
 
 class StatusNoMemoryError(NTStatusValueError):
-    DESCRIPTION = """{Not Enough Quota} Not enough virtual memory or paging file quota is available to complete the specified operation."""
     NT_STATUS = NTStatusValue.STATUS_NO_MEMORY
 
 
 class StatusConflictingAddressesError(NTStatusValueError):
-    DESCRIPTION = """{Conflicting Address Range} The specified address range conflicts with the address space."""
     NT_STATUS = NTStatusValue.STATUS_CONFLICTING_ADDRESSES
 
 
 class StatusNotMappedViewError(NTStatusValueError):
-    DESCRIPTION = """The address range to unmap is not a mapped view."""
     NT_STATUS = NTStatusValue.STATUS_NOT_MAPPED_VIEW
 
 
 class StatusUnableToFreeVmError(NTStatusValueError):
-    DESCRIPTION = """The virtual memory cannot be freed."""
     NT_STATUS = NTStatusValue.STATUS_UNABLE_TO_FREE_VM
 
 
 class StatusUnableToDeleteSectionError(NTStatusValueError):
-    DESCRIPTION = """The specified section cannot be deleted."""
     NT_STATUS = NTStatusValue.STATUS_UNABLE_TO_DELETE_SECTION
 
 
 class StatusInvalidSystemServiceError(NTStatusValueError):
-    DESCRIPTION = """An invalid system service was specified in a system service call."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_SYSTEM_SERVICE
 
 
 class StatusIllegalInstructionError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Illegal Instruction An attempt was made to execute an illegal instruction."""
     NT_STATUS = NTStatusValue.STATUS_ILLEGAL_INSTRUCTION
 
 
 class StatusInvalidLockSequenceError(NTStatusValueError):
-    DESCRIPTION = """{Invalid Lock Sequence} An attempt was made to execute an invalid lock sequence."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LOCK_SEQUENCE
 
 
 class StatusInvalidViewSizeError(NTStatusValueError):
-    DESCRIPTION = """{Invalid Mapping} An attempt was made to create a view for a section that is bigger than the section."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_VIEW_SIZE
 
 
 class StatusInvalidFileForSectionError(NTStatusValueError):
-    DESCRIPTION = """{Bad File} The attributes of the specified mapping file for a section of memory cannot be read."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_FILE_FOR_SECTION
 
 
 class StatusAlreadyCommittedError(NTStatusValueError):
-    DESCRIPTION = """{Already Committed} The specified address range is already committed."""
     NT_STATUS = NTStatusValue.STATUS_ALREADY_COMMITTED
 
 
 class StatusAccessDeniedError(NTStatusValueError):
-    DESCRIPTION = """{Access Denied} A process has requested access to an object but has not been granted those access rights."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_DENIED
 
 
 class StatusBufferTooSmallError(NTStatusValueError):
-    DESCRIPTION = """{Buffer Too Small} The buffer is too small to contain the entry. No information has been written to the buffer."""
     NT_STATUS = NTStatusValue.STATUS_BUFFER_TOO_SMALL
 
 
 class StatusObjectTypeMismatchError(NTStatusValueError):
-    DESCRIPTION = """{Wrong Type} There is a mismatch between the type of object that is required by the requested operation and the type of object that is specified in the request."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_TYPE_MISMATCH
 
 
 class StatusNoncontinuableExceptionError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Cannot Continue Windows cannot continue from this exception."""
     NT_STATUS = NTStatusValue.STATUS_NONCONTINUABLE_EXCEPTION
 
 
 class StatusInvalidDispositionError(NTStatusValueError):
-    DESCRIPTION = """An invalid exception disposition was returned by an exception handler."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_DISPOSITION
 
 
 class StatusUnwindError(NTStatusValueError):
-    DESCRIPTION = """Unwind exception code."""
     NT_STATUS = NTStatusValue.STATUS_UNWIND
 
 
 class StatusBadStackError(NTStatusValueError):
-    DESCRIPTION = """An invalid or unaligned stack was encountered during an unwind operation."""
     NT_STATUS = NTStatusValue.STATUS_BAD_STACK
 
 
 class StatusInvalidUnwindTargetError(NTStatusValueError):
-    DESCRIPTION = """An invalid unwind target was encountered during an unwind operation."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_UNWIND_TARGET
 
 
 class StatusNotLockedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to unlock a page of memory that was not locked."""
     NT_STATUS = NTStatusValue.STATUS_NOT_LOCKED
 
 
 class StatusParityErrorError(NTStatusValueError):
-    DESCRIPTION = """A device parity error on an I/O operation."""
     NT_STATUS = NTStatusValue.STATUS_PARITY_ERROR
 
 
 class StatusUnableToDecommitVmError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to decommit uncommitted virtual memory."""
     NT_STATUS = NTStatusValue.STATUS_UNABLE_TO_DECOMMIT_VM
 
 
 class StatusNotCommittedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to change the attributes on memory that has not been committed."""
     NT_STATUS = NTStatusValue.STATUS_NOT_COMMITTED
 
 
 class StatusInvalidPortAttributesError(NTStatusValueError):
-    DESCRIPTION = """Invalid object attributes specified to NtCreatePort or invalid port attributes specified to NtConnectPort."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PORT_ATTRIBUTES
 
 
 class StatusPortMessageTooLongError(NTStatusValueError):
-    DESCRIPTION = """The length of the message that was passed to NtRequestPort or NtRequestWaitReplyPort is longer than the maximum message that is allowed by the port."""
     NT_STATUS = NTStatusValue.STATUS_PORT_MESSAGE_TOO_LONG
 
 
 class StatusInvalidParameterMixError(NTStatusValueError):
-    DESCRIPTION = """An invalid combination of parameters was specified."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_MIX
 
 
 class StatusInvalidQuotaLowerError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to lower a quota limit below the current usage."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_QUOTA_LOWER
 
 
 class StatusDiskCorruptErrorError(NTStatusValueError):
-    DESCRIPTION = """{Corrupt Disk} The file system structure on the disk is corrupt and unusable. Run the Chkdsk utility on the volume %hs."""
     NT_STATUS = NTStatusValue.STATUS_DISK_CORRUPT_ERROR
 
 
 class StatusObjectNameInvalidError(NTStatusValueError):
-    DESCRIPTION = """The object name is invalid."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_NAME_INVALID
 
 
 class StatusObjectNameNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The object name is not found."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_NAME_NOT_FOUND
 
 
 class StatusObjectNameCollisionError(NTStatusValueError):
-    DESCRIPTION = """The object name already exists."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_NAME_COLLISION
 
 
 class StatusPortDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to send a message to a disconnected communication port."""
     NT_STATUS = NTStatusValue.STATUS_PORT_DISCONNECTED
 
 
 class StatusDeviceAlreadyAttachedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to attach to a device that was already attached to another device."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_ALREADY_ATTACHED
 
 
 class StatusObjectPathInvalidError(NTStatusValueError):
-    DESCRIPTION = """The object path component was not a directory object."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_PATH_INVALID
 
 
 class StatusObjectPathNotFoundError(NTStatusValueError):
-    DESCRIPTION = """{Path Not Found} The path %hs does not exist."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_PATH_NOT_FOUND
 
 
 class StatusObjectPathSyntaxBadError(NTStatusValueError):
-    DESCRIPTION = """The object path component was not a directory object."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_PATH_SYNTAX_BAD
 
 
 class StatusDataOverrunError(NTStatusValueError):
-    DESCRIPTION = """{Data Overrun} A data overrun error occurred."""
     NT_STATUS = NTStatusValue.STATUS_DATA_OVERRUN
 
 
 class StatusDataLateErrorError(NTStatusValueError):
-    DESCRIPTION = """{Data Late} A data late error occurred."""
     NT_STATUS = NTStatusValue.STATUS_DATA_LATE_ERROR
 
 
 class StatusDataErrorError(NTStatusValueError):
-    DESCRIPTION = """{Data Error} An error occurred in reading or writing data."""
     NT_STATUS = NTStatusValue.STATUS_DATA_ERROR
 
 
 class StatusCrcErrorError(NTStatusValueError):
-    DESCRIPTION = """{Bad CRC} A cyclic redundancy check (CRC) checksum error occurred."""
     NT_STATUS = NTStatusValue.STATUS_CRC_ERROR
 
 
 class StatusSectionTooBigError(NTStatusValueError):
-    DESCRIPTION = """{Section Too Large} The specified section is too big to map the file."""
     NT_STATUS = NTStatusValue.STATUS_SECTION_TOO_BIG
 
 
 class StatusPortConnectionRefusedError(NTStatusValueError):
-    DESCRIPTION = """The NtConnectPort request is refused."""
     NT_STATUS = NTStatusValue.STATUS_PORT_CONNECTION_REFUSED
 
 
 class StatusInvalidPortHandleError(NTStatusValueError):
-    DESCRIPTION = """The type of port handle is invalid for the operation that is requested."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PORT_HANDLE
 
 
 class StatusSharingViolationError(NTStatusValueError):
-    DESCRIPTION = """A file cannot be opened because the share access flags are incompatible."""
     NT_STATUS = NTStatusValue.STATUS_SHARING_VIOLATION
 
 
 class StatusQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """Insufficient quota exists to complete the operation."""
     NT_STATUS = NTStatusValue.STATUS_QUOTA_EXCEEDED
 
 
 class StatusInvalidPageProtectionError(NTStatusValueError):
-    DESCRIPTION = """The specified page protection was not valid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PAGE_PROTECTION
 
 
 class StatusMutantNotOwnedError(NTStatusValueError):
-    DESCRIPTION = """An attempt to release a mutant object was made by a thread that was not the owner of the mutant object."""
     NT_STATUS = NTStatusValue.STATUS_MUTANT_NOT_OWNED
 
 
 class StatusSemaphoreLimitExceededError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to release a semaphore such that its maximum count would have been exceeded."""
     NT_STATUS = NTStatusValue.STATUS_SEMAPHORE_LIMIT_EXCEEDED
 
 
 class StatusPortAlreadySetError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to set the DebugPort or ExceptionPort of a process, but a port already exists in the process, or an attempt was made to set the CompletionPort of a file but a port was already set in the file, or an attempt was made to set the associated completion port of an ALPC port but it is already set."""
     NT_STATUS = NTStatusValue.STATUS_PORT_ALREADY_SET
 
 
 class StatusSectionNotImageError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to query image information on a section that does not map an image."""
     NT_STATUS = NTStatusValue.STATUS_SECTION_NOT_IMAGE
 
 
 class StatusSuspendCountExceededError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to suspend a thread whose suspend count was at its maximum."""
     NT_STATUS = NTStatusValue.STATUS_SUSPEND_COUNT_EXCEEDED
 
 
 class StatusThreadIsTerminatingError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to suspend a thread that has begun termination."""
     NT_STATUS = NTStatusValue.STATUS_THREAD_IS_TERMINATING
 
 
 class StatusBadWorkingSetLimitError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to set the working set limit to an invalid value (for example, the minimum greater than maximum)."""
     NT_STATUS = NTStatusValue.STATUS_BAD_WORKING_SET_LIMIT
 
 
 class StatusIncompatibleFileMapError(NTStatusValueError):
-    DESCRIPTION = """A section was created to map a file that is not compatible with an already existing section that maps the same file."""
     NT_STATUS = NTStatusValue.STATUS_INCOMPATIBLE_FILE_MAP
 
 
 class StatusSectionProtectionError(NTStatusValueError):
-    DESCRIPTION = """A view to a section specifies a protection that is incompatible with the protection of the initial view."""
     NT_STATUS = NTStatusValue.STATUS_SECTION_PROTECTION
 
 
 class StatusEasNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """An operation involving EAs failed because the file system does not support EAs."""
     NT_STATUS = NTStatusValue.STATUS_EAS_NOT_SUPPORTED
 
 
 class StatusEaTooLargeError(NTStatusValueError):
-    DESCRIPTION = """An EA operation failed because the EA set is too large."""
     NT_STATUS = NTStatusValue.STATUS_EA_TOO_LARGE
 
 
 class StatusNonexistentEaEntryError(NTStatusValueError):
-    DESCRIPTION = """An EA operation failed because the name or EA index is invalid."""
     NT_STATUS = NTStatusValue.STATUS_NONEXISTENT_EA_ENTRY
 
 
 class StatusNoEasOnFileError(NTStatusValueError):
-    DESCRIPTION = """The file for which EAs were requested has no EAs."""
     NT_STATUS = NTStatusValue.STATUS_NO_EAS_ON_FILE
 
 
 class StatusEaCorruptErrorError(NTStatusValueError):
-    DESCRIPTION = """The EA is corrupt and cannot be read."""
     NT_STATUS = NTStatusValue.STATUS_EA_CORRUPT_ERROR
 
 
 class StatusFileLockConflictError(NTStatusValueError):
-    DESCRIPTION = """A requested read/write cannot be granted due to a conflicting file lock."""
     NT_STATUS = NTStatusValue.STATUS_FILE_LOCK_CONFLICT
 
 
 class StatusLockNotGrantedError(NTStatusValueError):
-    DESCRIPTION = """A requested file lock cannot be granted due to other existing locks."""
     NT_STATUS = NTStatusValue.STATUS_LOCK_NOT_GRANTED
 
 
 class StatusDeletePendingError(NTStatusValueError):
-    DESCRIPTION = """A non-close operation has been requested of a file object that has a delete pending."""
     NT_STATUS = NTStatusValue.STATUS_DELETE_PENDING
 
 
 class StatusCtlFileNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to set the control attribute on a file. This attribute is not supported in the destination file system."""
     NT_STATUS = NTStatusValue.STATUS_CTL_FILE_NOT_SUPPORTED
 
 
 class StatusUnknownRevisionError(NTStatusValueError):
-    DESCRIPTION = """Indicates a revision number that was encountered or specified is not one that is known by the service. It might be a more recent revision than the service is aware of."""
     NT_STATUS = NTStatusValue.STATUS_UNKNOWN_REVISION
 
 
 class StatusRevisionMismatchError(NTStatusValueError):
-    DESCRIPTION = """Indicates that two revision levels are incompatible."""
     NT_STATUS = NTStatusValue.STATUS_REVISION_MISMATCH
 
 
 class StatusInvalidOwnerError(NTStatusValueError):
-    DESCRIPTION = """Indicates a particular security ID cannot be assigned as the owner of an object."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_OWNER
 
 
 class StatusInvalidPrimaryGroupError(NTStatusValueError):
-    DESCRIPTION = """Indicates a particular security ID cannot be assigned as the primary group of an object."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PRIMARY_GROUP
 
 
 class StatusNoImpersonationTokenError(NTStatusValueError):
-    DESCRIPTION = """An attempt has been made to operate on an impersonation token by a thread that is not currently impersonating a client."""
     NT_STATUS = NTStatusValue.STATUS_NO_IMPERSONATION_TOKEN
 
 
 class StatusCantDisableMandatoryError(NTStatusValueError):
-    DESCRIPTION = """A mandatory group cannot be disabled."""
     NT_STATUS = NTStatusValue.STATUS_CANT_DISABLE_MANDATORY
 
 
 class StatusNoLogonServersError(NTStatusValueError):
-    DESCRIPTION = """No logon servers are currently available to service the logon request."""
     NT_STATUS = NTStatusValue.STATUS_NO_LOGON_SERVERS
 
 
 class StatusNoSuchLogonSessionError(NTStatusValueError):
-    DESCRIPTION = """A specified logon session does not exist. It might already have been terminated."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_LOGON_SESSION
 
 
 class StatusNoSuchPrivilegeError(NTStatusValueError):
-    DESCRIPTION = """A specified privilege does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_PRIVILEGE
 
 
 class StatusPrivilegeNotHeldError(NTStatusValueError):
-    DESCRIPTION = """A required privilege is not held by the client."""
     NT_STATUS = NTStatusValue.STATUS_PRIVILEGE_NOT_HELD
 
 
 class StatusInvalidAccountNameError(NTStatusValueError):
-    DESCRIPTION = """The name provided is not a properly formed account name."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_ACCOUNT_NAME
 
 
 class StatusUserExistsError(NTStatusValueError):
-    DESCRIPTION = """The specified account already exists."""
     NT_STATUS = NTStatusValue.STATUS_USER_EXISTS
 
 
 class StatusNoSuchUserError(NTStatusValueError):
-    DESCRIPTION = """The specified account does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_USER
 
 
 class StatusGroupExistsError(NTStatusValueError):
-    DESCRIPTION = """The specified group already exists."""
     NT_STATUS = NTStatusValue.STATUS_GROUP_EXISTS
 
 
 class StatusNoSuchGroupError(NTStatusValueError):
-    DESCRIPTION = """The specified group does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_GROUP
 
 
 class StatusMemberInGroupError(NTStatusValueError):
-    DESCRIPTION = """The specified user account is already in the specified group account. Also used to indicate a group cannot be deleted because it contains a member."""
     NT_STATUS = NTStatusValue.STATUS_MEMBER_IN_GROUP
 
 
 class StatusMemberNotInGroupError(NTStatusValueError):
-    DESCRIPTION = """The specified user account is not a member of the specified group account."""
     NT_STATUS = NTStatusValue.STATUS_MEMBER_NOT_IN_GROUP
 
 
 class StatusLastAdminError(NTStatusValueError):
-    DESCRIPTION = """Indicates the requested operation would disable or delete the last remaining administration account. This is not allowed to prevent creating a situation in which the system cannot be administrated."""
     NT_STATUS = NTStatusValue.STATUS_LAST_ADMIN
 
 
 class StatusWrongPasswordError(NTStatusValueError):
-    DESCRIPTION = """When trying to update a password, this return status indicates that the value provided as the current password is not correct."""
     NT_STATUS = NTStatusValue.STATUS_WRONG_PASSWORD
 
 
 class StatusIllFormedPasswordError(NTStatusValueError):
-    DESCRIPTION = """When trying to update a password, this return status indicates that the value provided for the new password contains values that are not allowed in passwords."""
     NT_STATUS = NTStatusValue.STATUS_ILL_FORMED_PASSWORD
 
 
 class StatusPasswordRestrictionError(NTStatusValueError):
-    DESCRIPTION = """When trying to update a password, this status indicates that some password update rule has been violated. For example, the password might not meet length criteria."""
     NT_STATUS = NTStatusValue.STATUS_PASSWORD_RESTRICTION
 
 
 class StatusLogonFailureError(NTStatusValueError):
-    DESCRIPTION = """The attempted logon is invalid. This is either due to a bad username or authentication information."""
     NT_STATUS = NTStatusValue.STATUS_LOGON_FAILURE
 
 
 class StatusAccountRestrictionError(NTStatusValueError):
-    DESCRIPTION = """Indicates a referenced user name and authentication information are valid, but some user account restriction has prevented successful authentication (such as time-of-day restrictions)."""
     NT_STATUS = NTStatusValue.STATUS_ACCOUNT_RESTRICTION
 
 
 class StatusInvalidLogonHoursError(NTStatusValueError):
-    DESCRIPTION = """The user account has time restrictions and cannot be logged onto at this time."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LOGON_HOURS
 
 
 class StatusInvalidWorkstationError(NTStatusValueError):
-    DESCRIPTION = """The user account is restricted so that it cannot be used to log on from the source workstation."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_WORKSTATION
 
 
 class StatusPasswordExpiredError(NTStatusValueError):
-    DESCRIPTION = """The user account password has expired."""
     NT_STATUS = NTStatusValue.STATUS_PASSWORD_EXPIRED
 
 
 class StatusAccountDisabledError(NTStatusValueError):
-    DESCRIPTION = """The referenced account is currently disabled and cannot be logged on to."""
     NT_STATUS = NTStatusValue.STATUS_ACCOUNT_DISABLED
 
 
 class StatusNoneMappedError(NTStatusValueError):
-    DESCRIPTION = """None of the information to be translated has been translated."""
     NT_STATUS = NTStatusValue.STATUS_NONE_MAPPED
 
 
 class StatusTooManyLuidsRequestedError(NTStatusValueError):
-    DESCRIPTION = """The number of LUIDs requested cannot be allocated with a single allocation."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_LUIDS_REQUESTED
 
 
 class StatusLuidsExhaustedError(NTStatusValueError):
-    DESCRIPTION = """Indicates there are no more LUIDs to allocate."""
     NT_STATUS = NTStatusValue.STATUS_LUIDS_EXHAUSTED
 
 
 class StatusInvalidSubAuthorityError(NTStatusValueError):
-    DESCRIPTION = """Indicates the sub-authority value is invalid for the particular use."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_SUB_AUTHORITY
 
 
 class StatusInvalidAclError(NTStatusValueError):
-    DESCRIPTION = """Indicates the ACL structure is not valid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_ACL
 
 
 class StatusInvalidSidError(NTStatusValueError):
-    DESCRIPTION = """Indicates the SID structure is not valid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_SID
 
 
 class StatusInvalidSecurityDescrError(NTStatusValueError):
-    DESCRIPTION = """Indicates the SECURITY_DESCRIPTOR structure is not valid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_SECURITY_DESCR
 
 
 class StatusProcedureNotFoundError(NTStatusValueError):
-    DESCRIPTION = """Indicates the specified procedure address cannot be found in the DLL."""
     NT_STATUS = NTStatusValue.STATUS_PROCEDURE_NOT_FOUND
 
 
 class StatusInvalidImageFormatError(NTStatusValueError):
-    DESCRIPTION = """{Bad Image} %hs is either not designed to run on Windows or it contains an error. Try installing the program again using the original installation media or contact your system administrator or the software vendor for support."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_FORMAT
 
 
 class StatusNoTokenError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to reference a token that does not exist. This is typically done by referencing the token that is associated with a thread when the thread is not impersonating a client."""
     NT_STATUS = NTStatusValue.STATUS_NO_TOKEN
 
 
 class StatusBadInheritanceAclError(NTStatusValueError):
-    DESCRIPTION = """Indicates that an attempt to build either an inherited ACL or ACE was not successful. This can be caused by a number of things. One of the more probable causes is the replacement of a CreatorId with a SID that did not fit into the ACE or ACL."""
     NT_STATUS = NTStatusValue.STATUS_BAD_INHERITANCE_ACL
 
 
 class StatusRangeNotLockedError(NTStatusValueError):
-    DESCRIPTION = """The range specified in NtUnlockFile was not locked."""
     NT_STATUS = NTStatusValue.STATUS_RANGE_NOT_LOCKED
 
 
 class StatusDiskFullError(NTStatusValueError):
-    DESCRIPTION = """An operation failed because the disk was full."""
     NT_STATUS = NTStatusValue.STATUS_DISK_FULL
 
 
 class StatusServerDisabledError(NTStatusValueError):
-    DESCRIPTION = """The GUID allocation server is disabled at the moment."""
     NT_STATUS = NTStatusValue.STATUS_SERVER_DISABLED
 
 
 class StatusServerNotDisabledError(NTStatusValueError):
-    DESCRIPTION = """The GUID allocation server is enabled at the moment."""
     NT_STATUS = NTStatusValue.STATUS_SERVER_NOT_DISABLED
 
 
 class StatusTooManyGuidsRequestedError(NTStatusValueError):
-    DESCRIPTION = """Too many GUIDs were requested from the allocation server at once."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_GUIDS_REQUESTED
 
 
 class StatusGuidsExhaustedError(NTStatusValueError):
-    DESCRIPTION = """The GUIDs could not be allocated because the Authority Agent was exhausted."""
     NT_STATUS = NTStatusValue.STATUS_GUIDS_EXHAUSTED
 
 
 class StatusInvalidIdAuthorityError(NTStatusValueError):
-    DESCRIPTION = """The value provided was an invalid value for an identifier authority."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_ID_AUTHORITY
 
 
 class StatusAgentsExhaustedError(NTStatusValueError):
-    DESCRIPTION = """No more authority agent values are available for the particular identifier authority value."""
     NT_STATUS = NTStatusValue.STATUS_AGENTS_EXHAUSTED
 
 
 class StatusInvalidVolumeLabelError(NTStatusValueError):
-    DESCRIPTION = """An invalid volume label has been specified."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_VOLUME_LABEL
 
 
 class StatusSectionNotExtendedError(NTStatusValueError):
-    DESCRIPTION = """A mapped section could not be extended."""
     NT_STATUS = NTStatusValue.STATUS_SECTION_NOT_EXTENDED
 
 
 class StatusNotMappedDataError(NTStatusValueError):
-    DESCRIPTION = """Specified section to flush does not map a data file."""
     NT_STATUS = NTStatusValue.STATUS_NOT_MAPPED_DATA
 
 
 class StatusResourceDataNotFoundError(NTStatusValueError):
-    DESCRIPTION = """Indicates the specified image file did not contain a resource section."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_DATA_NOT_FOUND
 
 
 class StatusResourceTypeNotFoundError(NTStatusValueError):
-    DESCRIPTION = """Indicates the specified resource type cannot be found in the image file."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_TYPE_NOT_FOUND
 
 
 class StatusResourceNameNotFoundError(NTStatusValueError):
-    DESCRIPTION = """Indicates the specified resource name cannot be found in the image file."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_NAME_NOT_FOUND
 
 
 class StatusArrayBoundsExceededError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Array bounds exceeded."""
     NT_STATUS = NTStatusValue.STATUS_ARRAY_BOUNDS_EXCEEDED
 
 
 class StatusFloatDenormalOperandError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Floating-point denormal operand."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_DENORMAL_OPERAND
 
 
 class StatusFloatDivideByZeroError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Floating-point division by zero."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_DIVIDE_BY_ZERO
 
 
 class StatusFloatInexactResultError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Floating-point inexact result."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_INEXACT_RESULT
 
 
 class StatusFloatInvalidOperationError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Floating-point invalid operation."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_INVALID_OPERATION
 
 
 class StatusFloatOverflowError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Floating-point overflow."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_OVERFLOW
 
 
 class StatusFloatStackCheckError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Floating-point stack check."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_STACK_CHECK
 
 
 class StatusFloatUnderflowError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Floating-point underflow."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_UNDERFLOW
 
 
 class StatusIntegerDivideByZeroError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Integer division by zero."""
     NT_STATUS = NTStatusValue.STATUS_INTEGER_DIVIDE_BY_ZERO
 
 
 class StatusIntegerOverflowError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Integer overflow."""
     NT_STATUS = NTStatusValue.STATUS_INTEGER_OVERFLOW
 
 
 class StatusPrivilegedInstructionError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Privileged instruction."""
     NT_STATUS = NTStatusValue.STATUS_PRIVILEGED_INSTRUCTION
 
 
 class StatusTooManyPagingFilesError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to install more paging files than the system supports."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_PAGING_FILES
 
 
 class StatusFileInvalidError(NTStatusValueError):
-    DESCRIPTION = """The volume for a file has been externally altered such that the opened file is no longer valid."""
     NT_STATUS = NTStatusValue.STATUS_FILE_INVALID
 
 
 class StatusAllottedSpaceExceededError(NTStatusValueError):
-    DESCRIPTION = """When a block of memory is allotted for future updates, such as the memory allocated to hold discretionary access control and primary group information, successive updates might exceed the amount of memory originally allotted. Because a quota might already have been charged to several processes that have handles to the object, it is not reasonable to alter the size of the allocated memory. Instead, a request that requires more memory than has been allotted must fail and the STATUS_ALLOTTED_SPACE_EXCEEDED error returned."""
     NT_STATUS = NTStatusValue.STATUS_ALLOTTED_SPACE_EXCEEDED
 
 
 class StatusInsufficientResourcesError(NTStatusValueError):
-    DESCRIPTION = """Insufficient system resources exist to complete the API."""
     NT_STATUS = NTStatusValue.STATUS_INSUFFICIENT_RESOURCES
 
 
 class StatusDfsExitPathFoundError(NTStatusValueError):
-    DESCRIPTION = """An attempt has been made to open a DFS exit path control file."""
     NT_STATUS = NTStatusValue.STATUS_DFS_EXIT_PATH_FOUND
 
 
 class StatusDeviceDataErrorError(NTStatusValueError):
-    DESCRIPTION = """There are bad blocks (sectors) on the hard disk."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_DATA_ERROR
 
 
 class StatusDeviceNotConnectedError(NTStatusValueError):
-    DESCRIPTION = """There is bad cabling, non-termination, or the controller is not able to obtain access to the hard disk."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_NOT_CONNECTED
 
 
 class StatusFreeVmNotAtBaseError(NTStatusValueError):
-    DESCRIPTION = """Virtual memory cannot be freed because the base address is not the base of the region and a region size of zero was specified."""
     NT_STATUS = NTStatusValue.STATUS_FREE_VM_NOT_AT_BASE
 
 
 class StatusMemoryNotAllocatedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to free virtual memory that is not allocated."""
     NT_STATUS = NTStatusValue.STATUS_MEMORY_NOT_ALLOCATED
 
 
 class StatusWorkingSetQuotaError(NTStatusValueError):
-    DESCRIPTION = """The working set is not big enough to allow the requested pages to be locked."""
     NT_STATUS = NTStatusValue.STATUS_WORKING_SET_QUOTA
 
 
 class StatusMediaWriteProtectedError(NTStatusValueError):
-    DESCRIPTION = """{Write Protect Error} The disk cannot be written to because it is write-protected. Remove the write protection from the volume %hs in drive %hs."""
     NT_STATUS = NTStatusValue.STATUS_MEDIA_WRITE_PROTECTED
 
 
 class StatusDeviceNotReadyError(NTStatusValueError):
-    DESCRIPTION = """{Drive Not Ready} The drive is not ready for use; its door might be open. Check drive %hs and make sure that a disk is inserted and that the drive door is closed."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_NOT_READY
 
 
 class StatusInvalidGroupAttributesError(NTStatusValueError):
-    DESCRIPTION = """The specified attributes are invalid or are incompatible with the attributes for the group as a whole."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_GROUP_ATTRIBUTES
 
 
 class StatusBadImpersonationLevelError(NTStatusValueError):
-    DESCRIPTION = """A specified impersonation level is invalid. Also used to indicate that a required impersonation level was not provided."""
     NT_STATUS = NTStatusValue.STATUS_BAD_IMPERSONATION_LEVEL
 
 
 class StatusCantOpenAnonymousError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to open an anonymous-level token. Anonymous tokens cannot be opened."""
     NT_STATUS = NTStatusValue.STATUS_CANT_OPEN_ANONYMOUS
 
 
 class StatusBadValidationClassError(NTStatusValueError):
-    DESCRIPTION = """The validation information class requested was invalid."""
     NT_STATUS = NTStatusValue.STATUS_BAD_VALIDATION_CLASS
 
 
 class StatusBadTokenTypeError(NTStatusValueError):
-    DESCRIPTION = """The type of a token object is inappropriate for its attempted use."""
     NT_STATUS = NTStatusValue.STATUS_BAD_TOKEN_TYPE
 
 
 class StatusBadMasterBootRecordError(NTStatusValueError):
-    DESCRIPTION = """The type of a token object is inappropriate for its attempted use."""
     NT_STATUS = NTStatusValue.STATUS_BAD_MASTER_BOOT_RECORD
 
 
 class StatusInstructionMisalignmentError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to execute an instruction at an unaligned address and the host system does not support unaligned instruction references."""
     NT_STATUS = NTStatusValue.STATUS_INSTRUCTION_MISALIGNMENT
 
 
 class StatusInstanceNotAvailableError(NTStatusValueError):
-    DESCRIPTION = """The maximum named pipe instance count has been reached."""
     NT_STATUS = NTStatusValue.STATUS_INSTANCE_NOT_AVAILABLE
 
 
 class StatusPipeNotAvailableError(NTStatusValueError):
-    DESCRIPTION = """An instance of a named pipe cannot be found in the listening state."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_NOT_AVAILABLE
 
 
 class StatusInvalidPipeStateError(NTStatusValueError):
-    DESCRIPTION = """The named pipe is not in the connected or closing state."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PIPE_STATE
 
 
 class StatusPipeBusyError(NTStatusValueError):
-    DESCRIPTION = """The specified pipe is set to complete operations and there are current I/O operations queued so that it cannot be changed to queue operations."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_BUSY
 
 
 class StatusIllegalFunctionError(NTStatusValueError):
-    DESCRIPTION = """The specified handle is not open to the server end of the named pipe."""
     NT_STATUS = NTStatusValue.STATUS_ILLEGAL_FUNCTION
 
 
 class StatusPipeDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """The specified named pipe is in the disconnected state."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_DISCONNECTED
 
 
 class StatusPipeClosingError(NTStatusValueError):
-    DESCRIPTION = """The specified named pipe is in the closing state."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_CLOSING
 
 
 class StatusPipeConnectedError(NTStatusValueError):
-    DESCRIPTION = """The specified named pipe is in the connected state."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_CONNECTED
 
 
 class StatusPipeListeningError(NTStatusValueError):
-    DESCRIPTION = """The specified named pipe is in the listening state."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_LISTENING
 
 
 class StatusInvalidReadModeError(NTStatusValueError):
-    DESCRIPTION = """The specified named pipe is not in message mode."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_READ_MODE
 
 
 class StatusIoTimeoutError(NTStatusValueError):
-    DESCRIPTION = """{Device Timeout} The specified I/O operation on %hs was not completed before the time-out period expired."""
     NT_STATUS = NTStatusValue.STATUS_IO_TIMEOUT
 
 
 class StatusFileForcedClosedError(NTStatusValueError):
-    DESCRIPTION = """The specified file has been closed by another process."""
     NT_STATUS = NTStatusValue.STATUS_FILE_FORCED_CLOSED
 
 
 class StatusProfilingNotStartedError(NTStatusValueError):
-    DESCRIPTION = """Profiling is not started."""
     NT_STATUS = NTStatusValue.STATUS_PROFILING_NOT_STARTED
 
 
 class StatusProfilingNotStoppedError(NTStatusValueError):
-    DESCRIPTION = """Profiling is not stopped."""
     NT_STATUS = NTStatusValue.STATUS_PROFILING_NOT_STOPPED
 
 
 class StatusCouldNotInterpretError(NTStatusValueError):
-    DESCRIPTION = """The passed ACL did not contain the minimum required information."""
     NT_STATUS = NTStatusValue.STATUS_COULD_NOT_INTERPRET
 
 
 class StatusFileIsADirectoryError(NTStatusValueError):
-    DESCRIPTION = """The file that was specified as a target is a directory, and the caller specified that it could be anything but a directory."""
     NT_STATUS = NTStatusValue.STATUS_FILE_IS_A_DIRECTORY
 
 
 class StatusNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The request is not supported."""
     NT_STATUS = NTStatusValue.STATUS_NOT_SUPPORTED
 
 
 class StatusRemoteNotListeningError(NTStatusValueError):
-    DESCRIPTION = """This remote computer is not listening."""
     NT_STATUS = NTStatusValue.STATUS_REMOTE_NOT_LISTENING
 
 
 class StatusDuplicateNameError(NTStatusValueError):
-    DESCRIPTION = """A duplicate name exists on the network."""
     NT_STATUS = NTStatusValue.STATUS_DUPLICATE_NAME
 
 
 class StatusBadNetworkPathError(NTStatusValueError):
-    DESCRIPTION = """The network path cannot be located."""
     NT_STATUS = NTStatusValue.STATUS_BAD_NETWORK_PATH
 
 
 class StatusNetworkBusyError(NTStatusValueError):
-    DESCRIPTION = """The network is busy."""
     NT_STATUS = NTStatusValue.STATUS_NETWORK_BUSY
 
 
 class StatusDeviceDoesNotExistError(NTStatusValueError):
-    DESCRIPTION = """This device does not exist."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_DOES_NOT_EXIST
 
 
 class StatusTooManyCommandsError(NTStatusValueError):
-    DESCRIPTION = """The network BIOS command limit has been reached."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_COMMANDS
 
 
 class StatusAdapterHardwareErrorError(NTStatusValueError):
-    DESCRIPTION = """An I/O adapter hardware error has occurred."""
     NT_STATUS = NTStatusValue.STATUS_ADAPTER_HARDWARE_ERROR
 
 
 class StatusInvalidNetworkResponseError(NTStatusValueError):
-    DESCRIPTION = """The network responded incorrectly."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_NETWORK_RESPONSE
 
 
 class StatusUnexpectedNetworkErrorError(NTStatusValueError):
-    DESCRIPTION = """An unexpected network error occurred."""
     NT_STATUS = NTStatusValue.STATUS_UNEXPECTED_NETWORK_ERROR
 
 
 class StatusBadRemoteAdapterError(NTStatusValueError):
-    DESCRIPTION = """The remote adapter is not compatible."""
     NT_STATUS = NTStatusValue.STATUS_BAD_REMOTE_ADAPTER
 
 
 class StatusPrintQueueFullError(NTStatusValueError):
-    DESCRIPTION = """The print queue is full."""
     NT_STATUS = NTStatusValue.STATUS_PRINT_QUEUE_FULL
 
 
 class StatusNoSpoolSpaceError(NTStatusValueError):
-    DESCRIPTION = """Space to store the file that is waiting to be printed is not available on the server."""
     NT_STATUS = NTStatusValue.STATUS_NO_SPOOL_SPACE
 
 
 class StatusPrintCancelledError(NTStatusValueError):
-    DESCRIPTION = """The requested print file has been canceled."""
     NT_STATUS = NTStatusValue.STATUS_PRINT_CANCELLED
 
 
 class StatusNetworkNameDeletedError(NTStatusValueError):
-    DESCRIPTION = """The network name was deleted."""
     NT_STATUS = NTStatusValue.STATUS_NETWORK_NAME_DELETED
 
 
 class StatusNetworkAccessDeniedError(NTStatusValueError):
-    DESCRIPTION = """Network access is denied."""
     NT_STATUS = NTStatusValue.STATUS_NETWORK_ACCESS_DENIED
 
 
 class StatusBadDeviceTypeError(NTStatusValueError):
-    DESCRIPTION = """{Incorrect Network Resource Type} The specified device type (LPT, for example) conflicts with the actual device type on the remote resource."""
     NT_STATUS = NTStatusValue.STATUS_BAD_DEVICE_TYPE
 
 
 class StatusBadNetworkNameError(NTStatusValueError):
-    DESCRIPTION = """{Network Name Not Found} The specified share name cannot be found on the remote server."""
     NT_STATUS = NTStatusValue.STATUS_BAD_NETWORK_NAME
 
 
 class StatusTooManyNamesError(NTStatusValueError):
-    DESCRIPTION = """The name limit for the network adapter card of the local computer was exceeded."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_NAMES
 
 
 class StatusTooManySessionsError(NTStatusValueError):
-    DESCRIPTION = """The network BIOS session limit was exceeded."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_SESSIONS
 
 
 class StatusSharingPausedError(NTStatusValueError):
-    DESCRIPTION = """File sharing has been temporarily paused."""
     NT_STATUS = NTStatusValue.STATUS_SHARING_PAUSED
 
 
 class StatusRequestNotAcceptedError(NTStatusValueError):
-    DESCRIPTION = """No more connections can be made to this remote computer at this time because the computer has already accepted the maximum number of connections."""
     NT_STATUS = NTStatusValue.STATUS_REQUEST_NOT_ACCEPTED
 
 
 class StatusRedirectorPausedError(NTStatusValueError):
-    DESCRIPTION = """Print or disk redirection is temporarily paused."""
     NT_STATUS = NTStatusValue.STATUS_REDIRECTOR_PAUSED
 
 
 class StatusNetWriteFaultError(NTStatusValueError):
-    DESCRIPTION = """A network data fault occurred."""
     NT_STATUS = NTStatusValue.STATUS_NET_WRITE_FAULT
 
 
 class StatusProfilingAtLimitError(NTStatusValueError):
-    DESCRIPTION = """The number of active profiling objects is at the maximum and no more can be started."""
     NT_STATUS = NTStatusValue.STATUS_PROFILING_AT_LIMIT
 
 
 class StatusNotSameDeviceError(NTStatusValueError):
-    DESCRIPTION = """{Incorrect Volume} The destination file of a rename request is located on a different device than the source of the rename request."""
     NT_STATUS = NTStatusValue.STATUS_NOT_SAME_DEVICE
 
 
 class StatusFileRenamedError(NTStatusValueError):
-    DESCRIPTION = """The specified file has been renamed and thus cannot be modified."""
     NT_STATUS = NTStatusValue.STATUS_FILE_RENAMED
 
 
 class StatusVirtualCircuitClosedError(NTStatusValueError):
-    DESCRIPTION = """{Network Request Timeout} The session with a remote server has been disconnected because the time-out interval for a request has expired."""
     NT_STATUS = NTStatusValue.STATUS_VIRTUAL_CIRCUIT_CLOSED
 
 
 class StatusNoSecurityOnObjectError(NTStatusValueError):
-    DESCRIPTION = """Indicates an attempt was made to operate on the security of an object that does not have security associated with it."""
     NT_STATUS = NTStatusValue.STATUS_NO_SECURITY_ON_OBJECT
 
 
 class StatusCantWaitError(NTStatusValueError):
-    DESCRIPTION = """Used to indicate that an operation cannot continue without blocking for I/O."""
     NT_STATUS = NTStatusValue.STATUS_CANT_WAIT
 
 
 class StatusPipeEmptyError(NTStatusValueError):
-    DESCRIPTION = """Used to indicate that a read operation was done on an empty pipe."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_EMPTY
 
 
 class StatusCantAccessDomainInfoError(NTStatusValueError):
-    DESCRIPTION = """Configuration information could not be read from the domain controller, either because the machine is unavailable or access has been denied."""
     NT_STATUS = NTStatusValue.STATUS_CANT_ACCESS_DOMAIN_INFO
 
 
 class StatusCantTerminateSelfError(NTStatusValueError):
-    DESCRIPTION = """Indicates that a thread attempted to terminate itself by default (called NtTerminateThread with NULL) and it was the last thread in the current process."""
     NT_STATUS = NTStatusValue.STATUS_CANT_TERMINATE_SELF
 
 
 class StatusInvalidServerStateError(NTStatusValueError):
-    DESCRIPTION = """Indicates the Sam Server was in the wrong state to perform the desired operation."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_SERVER_STATE
 
 
 class StatusInvalidDomainStateError(NTStatusValueError):
-    DESCRIPTION = """Indicates the domain was in the wrong state to perform the desired operation."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_DOMAIN_STATE
 
 
 class StatusInvalidDomainRoleError(NTStatusValueError):
-    DESCRIPTION = """This operation is only allowed for the primary domain controller of the domain."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_DOMAIN_ROLE
 
 
 class StatusNoSuchDomainError(NTStatusValueError):
-    DESCRIPTION = """The specified domain did not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_DOMAIN
 
 
 class StatusDomainExistsError(NTStatusValueError):
-    DESCRIPTION = """The specified domain already exists."""
     NT_STATUS = NTStatusValue.STATUS_DOMAIN_EXISTS
 
 
 class StatusDomainLimitExceededError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to exceed the limit on the number of domains per server for this release."""
     NT_STATUS = NTStatusValue.STATUS_DOMAIN_LIMIT_EXCEEDED
 
 
 class StatusOplockNotGrantedError(NTStatusValueError):
-    DESCRIPTION = """An error status returned when the opportunistic lock (oplock) request is denied."""
     NT_STATUS = NTStatusValue.STATUS_OPLOCK_NOT_GRANTED
 
 
 class StatusInvalidOplockProtocolError(NTStatusValueError):
-    DESCRIPTION = """An error status returned when an invalid opportunistic lock (oplock) acknowledgment is received by a file system."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_OPLOCK_PROTOCOL
 
 
 class StatusInternalDbCorruptionError(NTStatusValueError):
-    DESCRIPTION = """This error indicates that the requested operation cannot be completed due to a catastrophic media failure or an on-disk data structure corruption."""
     NT_STATUS = NTStatusValue.STATUS_INTERNAL_DB_CORRUPTION
 
 
 class StatusInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """An internal error occurred."""
     NT_STATUS = NTStatusValue.STATUS_INTERNAL_ERROR
 
 
 class StatusGenericNotMappedError(NTStatusValueError):
-    DESCRIPTION = """Indicates generic access types were contained in an access mask which should already be mapped to non-generic access types."""
     NT_STATUS = NTStatusValue.STATUS_GENERIC_NOT_MAPPED
 
 
 class StatusBadDescriptorFormatError(NTStatusValueError):
-    DESCRIPTION = """Indicates a security descriptor is not in the necessary format (absolute or self-relative)."""
     NT_STATUS = NTStatusValue.STATUS_BAD_DESCRIPTOR_FORMAT
 
 
 class StatusInvalidUserBufferError(NTStatusValueError):
-    DESCRIPTION = """An access to a user buffer failed at an expected point in time. This code is defined because the caller does not want to accept STATUS_ACCESS_VIOLATION in its filter."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_USER_BUFFER
 
 
 class StatusUnexpectedIoErrorError(NTStatusValueError):
-    DESCRIPTION = """If an I/O error that is not defined in the standard FsRtl filter is returned, it is converted to the following error, which is guaranteed to be in the filter. In this case, information is lost; however, the filter correctly handles the exception."""
     NT_STATUS = NTStatusValue.STATUS_UNEXPECTED_IO_ERROR
 
 
 class StatusUnexpectedMmCreateErrError(NTStatusValueError):
-    DESCRIPTION = """If an MM error that is not defined in the standard FsRtl filter is returned, it is converted to one of the following errors, which are guaranteed to be in the filter. In this case, information is lost; however, the filter correctly handles the exception."""
     NT_STATUS = NTStatusValue.STATUS_UNEXPECTED_MM_CREATE_ERR
 
 
 class StatusUnexpectedMmMapErrorError(NTStatusValueError):
-    DESCRIPTION = """If an MM error that is not defined in the standard FsRtl filter is returned, it is converted to one of the following errors, which are guaranteed to be in the filter. In this case, information is lost; however, the filter correctly handles the exception."""
     NT_STATUS = NTStatusValue.STATUS_UNEXPECTED_MM_MAP_ERROR
 
 
 class StatusUnexpectedMmExtendErrError(NTStatusValueError):
-    DESCRIPTION = """If an MM error that is not defined in the standard FsRtl filter is returned, it is converted to one of the following errors, which are guaranteed to be in the filter. In this case, information is lost; however, the filter correctly handles the exception."""
     NT_STATUS = NTStatusValue.STATUS_UNEXPECTED_MM_EXTEND_ERR
 
 
 class StatusNotLogonProcessError(NTStatusValueError):
-    DESCRIPTION = """The requested action is restricted for use by logon processes only. The calling process has not registered as a logon process."""
     NT_STATUS = NTStatusValue.STATUS_NOT_LOGON_PROCESS
 
 
 class StatusLogonSessionExistsError(NTStatusValueError):
-    DESCRIPTION = """An attempt has been made to start a new session manager or LSA logon session by using an ID that is already in use."""
     NT_STATUS = NTStatusValue.STATUS_LOGON_SESSION_EXISTS
 
 
 class StatusInvalidParameter1Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the first argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_1
 
 
 class StatusInvalidParameter2Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the second argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_2
 
 
 class StatusInvalidParameter3Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the third argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_3
 
 
 class StatusInvalidParameter4Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the fourth argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_4
 
 
 class StatusInvalidParameter5Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the fifth argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_5
 
 
 class StatusInvalidParameter6Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the sixth argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_6
 
 
 class StatusInvalidParameter7Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the seventh argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_7
 
 
 class StatusInvalidParameter8Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the eighth argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_8
 
 
 class StatusInvalidParameter9Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the ninth argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_9
 
 
 class StatusInvalidParameter10Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the tenth argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_10
 
 
 class StatusInvalidParameter11Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the eleventh argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_11
 
 
 class StatusInvalidParameter12Error(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a service or function as the twelfth argument."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PARAMETER_12
 
 
 class StatusRedirectorNotStartedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to access a network file, but the network software was not yet started."""
     NT_STATUS = NTStatusValue.STATUS_REDIRECTOR_NOT_STARTED
 
 
 class StatusRedirectorStartedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to start the redirector, but the redirector has already been started."""
     NT_STATUS = NTStatusValue.STATUS_REDIRECTOR_STARTED
 
 
 class StatusStackOverflowError(NTStatusValueError):
-    DESCRIPTION = """A new guard page for the stack cannot be created."""
     NT_STATUS = NTStatusValue.STATUS_STACK_OVERFLOW
 
 
 class StatusNoSuchPackageError(NTStatusValueError):
-    DESCRIPTION = """A specified authentication package is unknown."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_PACKAGE
 
 
 class StatusBadFunctionTableError(NTStatusValueError):
-    DESCRIPTION = """A malformed function table was encountered during an unwind operation."""
     NT_STATUS = NTStatusValue.STATUS_BAD_FUNCTION_TABLE
 
 
 class StatusVariableNotFoundError(NTStatusValueError):
-    DESCRIPTION = """Indicates the specified environment variable name was not found in the specified environment block."""
     NT_STATUS = NTStatusValue.STATUS_VARIABLE_NOT_FOUND
 
 
 class StatusDirectoryNotEmptyError(NTStatusValueError):
-    DESCRIPTION = """Indicates that the directory trying to be deleted is not empty."""
     NT_STATUS = NTStatusValue.STATUS_DIRECTORY_NOT_EMPTY
 
 
 class StatusFileCorruptErrorError(NTStatusValueError):
-    DESCRIPTION = """{Corrupt File} The file or directory %hs is corrupt and unreadable. Run the Chkdsk utility."""
     NT_STATUS = NTStatusValue.STATUS_FILE_CORRUPT_ERROR
 
 
 class StatusNotADirectoryError(NTStatusValueError):
-    DESCRIPTION = """A requested opened file is not a directory."""
     NT_STATUS = NTStatusValue.STATUS_NOT_A_DIRECTORY
 
 
 class StatusBadLogonSessionStateError(NTStatusValueError):
-    DESCRIPTION = """The logon session is not in a state that is consistent with the requested operation."""
     NT_STATUS = NTStatusValue.STATUS_BAD_LOGON_SESSION_STATE
 
 
 class StatusLogonSessionCollisionError(NTStatusValueError):
-    DESCRIPTION = """An internal LSA error has occurred. An authentication package has requested the creation of a logon session but the ID of an already existing logon session has been specified."""
     NT_STATUS = NTStatusValue.STATUS_LOGON_SESSION_COLLISION
 
 
 class StatusNameTooLongError(NTStatusValueError):
-    DESCRIPTION = """A specified name string is too long for its intended use."""
     NT_STATUS = NTStatusValue.STATUS_NAME_TOO_LONG
 
 
 class StatusFilesOpenError(NTStatusValueError):
-    DESCRIPTION = """The user attempted to force close the files on a redirected drive, but there were opened files on the drive, and the user did not specify a sufficient level of force."""
     NT_STATUS = NTStatusValue.STATUS_FILES_OPEN
 
 
 class StatusConnectionInUseError(NTStatusValueError):
-    DESCRIPTION = """The user attempted to force close the files on a redirected drive, but there were opened directories on the drive, and the user did not specify a sufficient level of force."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_IN_USE
 
 
 class StatusMessageNotFoundError(NTStatusValueError):
-    DESCRIPTION = """RtlFindMessage could not locate the requested message ID in the message table resource."""
     NT_STATUS = NTStatusValue.STATUS_MESSAGE_NOT_FOUND
 
 
 class StatusProcessIsTerminatingError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to duplicate an object handle into or out of an exiting process."""
     NT_STATUS = NTStatusValue.STATUS_PROCESS_IS_TERMINATING
 
 
 class StatusInvalidLogonTypeError(NTStatusValueError):
-    DESCRIPTION = """Indicates an invalid value has been provided for the LogonType requested."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LOGON_TYPE
 
 
 class StatusNoGuidTranslationError(NTStatusValueError):
-    DESCRIPTION = """Indicates that an attempt was made to assign protection to a file system file or directory and one of the SIDs in the security descriptor could not be translated into a GUID that could be stored by the file system. This causes the protection attempt to fail, which might cause a file creation attempt to fail."""
     NT_STATUS = NTStatusValue.STATUS_NO_GUID_TRANSLATION
 
 
 class StatusCannotImpersonateError(NTStatusValueError):
-    DESCRIPTION = """Indicates that an attempt has been made to impersonate via a named pipe that has not yet been read from."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_IMPERSONATE
 
 
 class StatusImageAlreadyLoadedError(NTStatusValueError):
-    DESCRIPTION = """Indicates that the specified image is already loaded."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_ALREADY_LOADED
 
 
 class StatusNoLdtError(NTStatusValueError):
-    DESCRIPTION = """Indicates that an attempt was made to change the size of the LDT for a process that has no LDT."""
     NT_STATUS = NTStatusValue.STATUS_NO_LDT
 
 
 class StatusInvalidLdtSizeError(NTStatusValueError):
-    DESCRIPTION = """Indicates that an attempt was made to grow an LDT by setting its size, or that the size was not an even number of selectors."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LDT_SIZE
 
 
 class StatusInvalidLdtOffsetError(NTStatusValueError):
-    DESCRIPTION = """Indicates that the starting value for the LDT information was not an integral multiple of the selector size."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LDT_OFFSET
 
 
 class StatusInvalidLdtDescriptorError(NTStatusValueError):
-    DESCRIPTION = """Indicates that the user supplied an invalid descriptor when trying to set up LDT descriptors."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LDT_DESCRIPTOR
 
 
 class StatusInvalidImageNeFormatError(NTStatusValueError):
-    DESCRIPTION = """The specified image file did not have the correct format. It appears to be NE format."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_NE_FORMAT
 
 
 class StatusRxactInvalidStateError(NTStatusValueError):
-    DESCRIPTION = """Indicates that the transaction state of a registry subtree is incompatible with the requested operation. For example, a request has been made to start a new transaction with one already in progress, or a request has been made to apply a transaction when one is not currently in progress."""
     NT_STATUS = NTStatusValue.STATUS_RXACT_INVALID_STATE
 
 
 class StatusRxactCommitFailureError(NTStatusValueError):
-    DESCRIPTION = """Indicates an error has occurred during a registry transaction commit. The database has been left in an unknown, but probably inconsistent, state. The state of the registry transaction is left as COMMITTING."""
     NT_STATUS = NTStatusValue.STATUS_RXACT_COMMIT_FAILURE
 
 
 class StatusMappedFileSizeZeroError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to map a file of size zero with the maximum size specified as zero."""
     NT_STATUS = NTStatusValue.STATUS_MAPPED_FILE_SIZE_ZERO
 
 
 class StatusTooManyOpenedFilesError(NTStatusValueError):
-    DESCRIPTION = """Too many files are opened on a remote server. This error should only be returned by the Windows redirector on a remote drive."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_OPENED_FILES
 
 
 class StatusCancelledError(NTStatusValueError):
-    DESCRIPTION = """The I/O request was canceled."""
     NT_STATUS = NTStatusValue.STATUS_CANCELLED
 
 
 class StatusCannotDeleteError(NTStatusValueError):
-    DESCRIPTION = """An attempt has been made to remove a file or directory that cannot be deleted."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_DELETE
 
 
 class StatusInvalidComputerNameError(NTStatusValueError):
-    DESCRIPTION = """Indicates a name that was specified as a remote computer name is syntactically invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_COMPUTER_NAME
 
 
 class StatusFileDeletedError(NTStatusValueError):
-    DESCRIPTION = """An I/O request other than close was performed on a file after it was deleted, which can only happen to a request that did not complete before the last handle was closed via NtClose."""
     NT_STATUS = NTStatusValue.STATUS_FILE_DELETED
 
 
 class StatusSpecialAccountError(NTStatusValueError):
-    DESCRIPTION = """Indicates an operation that is incompatible with built-in accounts has been attempted on a built-in (special) SAM account. For example, built-in accounts cannot be deleted."""
     NT_STATUS = NTStatusValue.STATUS_SPECIAL_ACCOUNT
 
 
 class StatusSpecialGroupError(NTStatusValueError):
-    DESCRIPTION = """The operation requested cannot be performed on the specified group because it is a built-in special group."""
     NT_STATUS = NTStatusValue.STATUS_SPECIAL_GROUP
 
 
 class StatusSpecialUserError(NTStatusValueError):
-    DESCRIPTION = """The operation requested cannot be performed on the specified user because it is a built-in special user."""
     NT_STATUS = NTStatusValue.STATUS_SPECIAL_USER
 
 
 class StatusMembersPrimaryGroupError(NTStatusValueError):
-    DESCRIPTION = """Indicates a member cannot be removed from a group because the group is currently the member's primary group."""
     NT_STATUS = NTStatusValue.STATUS_MEMBERS_PRIMARY_GROUP
 
 
 class StatusFileClosedError(NTStatusValueError):
-    DESCRIPTION = """An I/O request other than close and several other special case operations was attempted using a file object that had already been closed."""
     NT_STATUS = NTStatusValue.STATUS_FILE_CLOSED
 
 
 class StatusTooManyThreadsError(NTStatusValueError):
-    DESCRIPTION = """Indicates a process has too many threads to perform the requested action. For example, assignment of a primary token can be performed only when a process has zero or one threads."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_THREADS
 
 
 class StatusThreadNotInProcessError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to operate on a thread within a specific process, but the specified thread is not in the specified process."""
     NT_STATUS = NTStatusValue.STATUS_THREAD_NOT_IN_PROCESS
 
 
 class StatusTokenAlreadyInUseError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to establish a token for use as a primary token but the token is already in use. A token can only be the primary token of one process at a time."""
     NT_STATUS = NTStatusValue.STATUS_TOKEN_ALREADY_IN_USE
 
 
 class StatusPagefileQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """The page file quota was exceeded."""
     NT_STATUS = NTStatusValue.STATUS_PAGEFILE_QUOTA_EXCEEDED
 
 
 class StatusCommitmentLimitError(NTStatusValueError):
-    DESCRIPTION = """{Out of Virtual Memory} Your system is low on virtual memory. To ensure that Windows runs correctly, increase the size of your virtual memory paging file. For more information, see Help."""
     NT_STATUS = NTStatusValue.STATUS_COMMITMENT_LIMIT
 
 
 class StatusInvalidImageLeFormatError(NTStatusValueError):
-    DESCRIPTION = """The specified image file did not have the correct format: it appears to be LE format."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_LE_FORMAT
 
 
 class StatusInvalidImageNotMzError(NTStatusValueError):
-    DESCRIPTION = """The specified image file did not have the correct format: it did not have an initial MZ."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_NOT_MZ
 
 
 class StatusInvalidImageProtectError(NTStatusValueError):
-    DESCRIPTION = """The specified image file did not have the correct format: it did not have a proper e_lfarlc in the MZ header."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_PROTECT
 
 
 class StatusInvalidImageWin16Error(NTStatusValueError):
-    DESCRIPTION = """The specified image file did not have the correct format: it appears to be a 16-bit Windows image."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_WIN_16
 
 
 class StatusLogonServerConflictError(NTStatusValueError):
-    DESCRIPTION = """The Netlogon service cannot start because another Netlogon service running in the domain conflicts with the specified role."""
     NT_STATUS = NTStatusValue.STATUS_LOGON_SERVER_CONFLICT
 
 
 class StatusTimeDifferenceAtDcError(NTStatusValueError):
-    DESCRIPTION = """The time at the primary domain controller is different from the time at the backup domain controller or member server by too large an amount."""
     NT_STATUS = NTStatusValue.STATUS_TIME_DIFFERENCE_AT_DC
 
 
 class StatusSynchronizationRequiredError(NTStatusValueError):
-    DESCRIPTION = """On applicable Windows Server releases, the SAM database is significantly out of synchronization with the copy on the domain controller. A complete synchronization is required."""
     NT_STATUS = NTStatusValue.STATUS_SYNCHRONIZATION_REQUIRED
 
 
 class StatusDllNotFoundError(NTStatusValueError):
-    DESCRIPTION = """{Unable To Locate Component} This application has failed to start because %hs was not found. Reinstalling the application might fix this problem."""
     NT_STATUS = NTStatusValue.STATUS_DLL_NOT_FOUND
 
 
 class StatusOpenFailedError(NTStatusValueError):
-    DESCRIPTION = """The NtCreateFile API failed. This error should never be returned to an application; it is a place holder for the Windows LAN Manager Redirector to use in its internal error-mapping routines."""
     NT_STATUS = NTStatusValue.STATUS_OPEN_FAILED
 
 
 class StatusIoPrivilegeFailedError(NTStatusValueError):
-    DESCRIPTION = """{Privilege Failed} The I/O permissions for the process could not be changed."""
     NT_STATUS = NTStatusValue.STATUS_IO_PRIVILEGE_FAILED
 
 
 class StatusOrdinalNotFoundError(NTStatusValueError):
-    DESCRIPTION = """{Ordinal Not Found} The ordinal %ld could not be located in the dynamic link library %hs."""
     NT_STATUS = NTStatusValue.STATUS_ORDINAL_NOT_FOUND
 
 
 class StatusEntrypointNotFoundError(NTStatusValueError):
-    DESCRIPTION = """{Entry Point Not Found} The procedure entry point %hs could not be located in the dynamic link library %hs."""
     NT_STATUS = NTStatusValue.STATUS_ENTRYPOINT_NOT_FOUND
 
 
 class StatusControlCExitError(NTStatusValueError):
-    DESCRIPTION = """{Application Exit by CTRL+C} The application terminated as a result of a CTRL+C."""
     NT_STATUS = NTStatusValue.STATUS_CONTROL_C_EXIT
 
 
 class StatusLocalDisconnectError(NTStatusValueError):
-    DESCRIPTION = """{Virtual Circuit Closed} The network transport on your computer has closed a network connection. There might or might not be I/O requests outstanding."""
     NT_STATUS = NTStatusValue.STATUS_LOCAL_DISCONNECT
 
 
 class StatusRemoteDisconnectError(NTStatusValueError):
-    DESCRIPTION = """{Virtual Circuit Closed} The network transport on a remote computer has closed a network connection. There might or might not be I/O requests outstanding."""
     NT_STATUS = NTStatusValue.STATUS_REMOTE_DISCONNECT
 
 
 class StatusRemoteResourcesError(NTStatusValueError):
-    DESCRIPTION = """{Insufficient Resources on Remote Computer} The remote computer has insufficient resources to complete the network request. For example, the remote computer might not have enough available memory to carry out the request at this time."""
     NT_STATUS = NTStatusValue.STATUS_REMOTE_RESOURCES
 
 
 class StatusLinkFailedError(NTStatusValueError):
-    DESCRIPTION = """{Virtual Circuit Closed} An existing connection (virtual circuit) has been broken at the remote computer. There is probably something wrong with the network software protocol or the network hardware on the remote computer."""
     NT_STATUS = NTStatusValue.STATUS_LINK_FAILED
 
 
 class StatusLinkTimeoutError(NTStatusValueError):
-    DESCRIPTION = """{Virtual Circuit Closed} The network transport on your computer has closed a network connection because it had to wait too long for a response from the remote computer."""
     NT_STATUS = NTStatusValue.STATUS_LINK_TIMEOUT
 
 
 class StatusInvalidConnectionError(NTStatusValueError):
-    DESCRIPTION = """The connection handle that was given to the transport was invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_CONNECTION
 
 
 class StatusInvalidAddressError(NTStatusValueError):
-    DESCRIPTION = """The address handle that was given to the transport was invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_ADDRESS
 
 
 class StatusDllInitFailedError(NTStatusValueError):
-    DESCRIPTION = """{DLL Initialization Failed} Initialization of the dynamic link library %hs failed. The process is terminating abnormally."""
     NT_STATUS = NTStatusValue.STATUS_DLL_INIT_FAILED
 
 
 class StatusMissingSystemfileError(NTStatusValueError):
-    DESCRIPTION = """{Missing System File} The required system file %hs is bad or missing."""
     NT_STATUS = NTStatusValue.STATUS_MISSING_SYSTEMFILE
 
 
 class StatusUnhandledExceptionError(NTStatusValueError):
-    DESCRIPTION = """{Application Error} The exception %s (0x%08lx) occurred in the application at location 0x%08lx."""
     NT_STATUS = NTStatusValue.STATUS_UNHANDLED_EXCEPTION
 
 
 class StatusAppInitFailureError(NTStatusValueError):
-    DESCRIPTION = """{Application Error} The application failed to initialize properly (0x%lx). Click OK to terminate the application."""
     NT_STATUS = NTStatusValue.STATUS_APP_INIT_FAILURE
 
 
 class StatusPagefileCreateFailedError(NTStatusValueError):
-    DESCRIPTION = """{Unable to Create Paging File} The creation of the paging file %hs failed (%lx). The requested size was %ld."""
     NT_STATUS = NTStatusValue.STATUS_PAGEFILE_CREATE_FAILED
 
 
 class StatusNoPagefileError(NTStatusValueError):
-    DESCRIPTION = """{No Paging File Specified} No paging file was specified in the system configuration."""
     NT_STATUS = NTStatusValue.STATUS_NO_PAGEFILE
 
 
 class StatusInvalidLevelError(NTStatusValueError):
-    DESCRIPTION = """{Incorrect System Call Level} An invalid level was passed into the specified system call."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LEVEL
 
 
 class StatusWrongPasswordCoreError(NTStatusValueError):
-    DESCRIPTION = """{Incorrect Password to LAN Manager Server} You specified an incorrect password to a LAN Manager 2.x or MS-NET server."""
     NT_STATUS = NTStatusValue.STATUS_WRONG_PASSWORD_CORE
 
 
 class StatusIllegalFloatContextError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} A real-mode application issued a floating-point instruction and floating-point hardware is not present."""
     NT_STATUS = NTStatusValue.STATUS_ILLEGAL_FLOAT_CONTEXT
 
 
 class StatusPipeBrokenError(NTStatusValueError):
-    DESCRIPTION = """The pipe operation has failed because the other end of the pipe has been closed."""
     NT_STATUS = NTStatusValue.STATUS_PIPE_BROKEN
 
 
 class StatusRegistryCorruptError(NTStatusValueError):
-    DESCRIPTION = """{The Registry Is Corrupt} The structure of one of the files that contains registry data is corrupt; the image of the file in memory is corrupt; or the file could not be recovered because the alternate copy or log was absent or corrupt."""
     NT_STATUS = NTStatusValue.STATUS_REGISTRY_CORRUPT
 
 
 class StatusRegistryIoFailedError(NTStatusValueError):
-    DESCRIPTION = """An I/O operation initiated by the Registry failed and cannot be recovered. The registry could not read in, write out, or flush one of the files that contain the system's image of the registry."""
     NT_STATUS = NTStatusValue.STATUS_REGISTRY_IO_FAILED
 
 
 class StatusNoEventPairError(NTStatusValueError):
-    DESCRIPTION = """An event pair synchronization operation was performed using the thread-specific client/server event pair object, but no event pair object was associated with the thread."""
     NT_STATUS = NTStatusValue.STATUS_NO_EVENT_PAIR
 
 
 class StatusUnrecognizedVolumeError(NTStatusValueError):
-    DESCRIPTION = """The volume does not contain a recognized file system. Be sure that all required file system drivers are loaded and that the volume is not corrupt."""
     NT_STATUS = NTStatusValue.STATUS_UNRECOGNIZED_VOLUME
 
 
 class StatusSerialNoDeviceInitedError(NTStatusValueError):
-    DESCRIPTION = """No serial device was successfully initialized. The serial driver will unload."""
     NT_STATUS = NTStatusValue.STATUS_SERIAL_NO_DEVICE_INITED
 
 
 class StatusNoSuchAliasError(NTStatusValueError):
-    DESCRIPTION = """The specified local group does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_ALIAS
 
 
 class StatusMemberNotInAliasError(NTStatusValueError):
-    DESCRIPTION = """The specified account name is not a member of the group."""
     NT_STATUS = NTStatusValue.STATUS_MEMBER_NOT_IN_ALIAS
 
 
 class StatusMemberInAliasError(NTStatusValueError):
-    DESCRIPTION = """The specified account name is already a member of the group."""
     NT_STATUS = NTStatusValue.STATUS_MEMBER_IN_ALIAS
 
 
 class StatusAliasExistsError(NTStatusValueError):
-    DESCRIPTION = """The specified local group already exists."""
     NT_STATUS = NTStatusValue.STATUS_ALIAS_EXISTS
 
 
 class StatusLogonNotGrantedError(NTStatusValueError):
-    DESCRIPTION = """A requested type of logon (for example, interactive, network, and service) is not granted by the local security policy of the target system. Ask the system administrator to grant the necessary form of logon."""
     NT_STATUS = NTStatusValue.STATUS_LOGON_NOT_GRANTED
 
 
 class StatusTooManySecretsError(NTStatusValueError):
-    DESCRIPTION = """The maximum number of secrets that can be stored in a single system was exceeded. The length and number of secrets is limited to satisfy U.S. State Department export restrictions."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_SECRETS
 
 
 class StatusSecretTooLongError(NTStatusValueError):
-    DESCRIPTION = """The length of a secret exceeds the maximum allowable length. The length and number of secrets is limited to satisfy U.S. State Department export restrictions."""
     NT_STATUS = NTStatusValue.STATUS_SECRET_TOO_LONG
 
 
 class StatusInternalDbErrorError(NTStatusValueError):
-    DESCRIPTION = """The local security authority (LSA) database contains an internal inconsistency."""
     NT_STATUS = NTStatusValue.STATUS_INTERNAL_DB_ERROR
 
 
 class StatusFullscreenModeError(NTStatusValueError):
-    DESCRIPTION = """The requested operation cannot be performed in full-screen mode."""
     NT_STATUS = NTStatusValue.STATUS_FULLSCREEN_MODE
 
 
 class StatusTooManyContextIdsError(NTStatusValueError):
-    DESCRIPTION = """During a logon attempt, the user's security context accumulated too many security IDs. This is a very unusual situation. Remove the user from some global or local groups to reduce the number of security IDs to incorporate into the security context."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_CONTEXT_IDS
 
 
 class StatusLogonTypeNotGrantedError(NTStatusValueError):
-    DESCRIPTION = """A user has requested a type of logon (for example, interactive or network) that has not been granted. An administrator has control over who can logon interactively and through the network."""
     NT_STATUS = NTStatusValue.STATUS_LOGON_TYPE_NOT_GRANTED
 
 
 class StatusNotRegistryFileError(NTStatusValueError):
-    DESCRIPTION = """The system has attempted to load or restore a file into the registry, and the specified file is not in the format of a registry file."""
     NT_STATUS = NTStatusValue.STATUS_NOT_REGISTRY_FILE
 
 
 class StatusNtCrossEncryptionRequiredError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to change a user password in the security account manager without providing the necessary Windows cross-encrypted password."""
     NT_STATUS = NTStatusValue.STATUS_NT_CROSS_ENCRYPTION_REQUIRED
 
 
 class StatusDomainCtrlrConfigErrorError(NTStatusValueError):
-    DESCRIPTION = """A domain server has an incorrect configuration."""
     NT_STATUS = NTStatusValue.STATUS_DOMAIN_CTRLR_CONFIG_ERROR
 
 
 class StatusFtMissingMemberError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to explicitly access the secondary copy of information via a device control to the fault tolerance driver and the secondary copy is not present in the system."""
     NT_STATUS = NTStatusValue.STATUS_FT_MISSING_MEMBER
 
 
 class StatusIllFormedServiceEntryError(NTStatusValueError):
-    DESCRIPTION = """A configuration registry node that represents a driver service entry was ill-formed and did not contain the required value entries."""
     NT_STATUS = NTStatusValue.STATUS_ILL_FORMED_SERVICE_ENTRY
 
 
 class StatusIllegalCharacterError(NTStatusValueError):
-    DESCRIPTION = """An illegal character was encountered. For a multibyte character set, this includes a lead byte without a succeeding trail byte. For the Unicode character set this includes the characters 0xFFFF and 0xFFFE."""
     NT_STATUS = NTStatusValue.STATUS_ILLEGAL_CHARACTER
 
 
 class StatusUnmappableCharacterError(NTStatusValueError):
-    DESCRIPTION = """No mapping for the Unicode character exists in the target multibyte code page."""
     NT_STATUS = NTStatusValue.STATUS_UNMAPPABLE_CHARACTER
 
 
 class StatusUndefinedCharacterError(NTStatusValueError):
-    DESCRIPTION = """The Unicode character is not defined in the Unicode character set that is installed on the system."""
     NT_STATUS = NTStatusValue.STATUS_UNDEFINED_CHARACTER
 
 
 class StatusFloppyVolumeError(NTStatusValueError):
-    DESCRIPTION = """The paging file cannot be created on a floppy disk."""
     NT_STATUS = NTStatusValue.STATUS_FLOPPY_VOLUME
 
 
 class StatusFloppyIdMarkNotFoundError(NTStatusValueError):
-    DESCRIPTION = """{Floppy Disk Error} While accessing a floppy disk, an ID address mark was not found."""
     NT_STATUS = NTStatusValue.STATUS_FLOPPY_ID_MARK_NOT_FOUND
 
 
 class StatusFloppyWrongCylinderError(NTStatusValueError):
-    DESCRIPTION = """{Floppy Disk Error} While accessing a floppy disk, the track address from the sector ID field was found to be different from the track address that is maintained by the controller."""
     NT_STATUS = NTStatusValue.STATUS_FLOPPY_WRONG_CYLINDER
 
 
 class StatusFloppyUnknownErrorError(NTStatusValueError):
-    DESCRIPTION = """{Floppy Disk Error} The floppy disk controller reported an error that is not recognized by the floppy disk driver."""
     NT_STATUS = NTStatusValue.STATUS_FLOPPY_UNKNOWN_ERROR
 
 
 class StatusFloppyBadRegistersError(NTStatusValueError):
-    DESCRIPTION = """{Floppy Disk Error} While accessing a floppy-disk, the controller returned inconsistent results via its registers."""
     NT_STATUS = NTStatusValue.STATUS_FLOPPY_BAD_REGISTERS
 
 
 class StatusDiskRecalibrateFailedError(NTStatusValueError):
-    DESCRIPTION = """{Hard Disk Error} While accessing the hard disk, a recalibrate operation failed, even after retries."""
     NT_STATUS = NTStatusValue.STATUS_DISK_RECALIBRATE_FAILED
 
 
 class StatusDiskOperationFailedError(NTStatusValueError):
-    DESCRIPTION = """{Hard Disk Error} While accessing the hard disk, a disk operation failed even after retries."""
     NT_STATUS = NTStatusValue.STATUS_DISK_OPERATION_FAILED
 
 
 class StatusDiskResetFailedError(NTStatusValueError):
-    DESCRIPTION = """{Hard Disk Error} While accessing the hard disk, a disk controller reset was needed, but even that failed."""
     NT_STATUS = NTStatusValue.STATUS_DISK_RESET_FAILED
 
 
 class StatusSharedIrqBusyError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to open a device that was sharing an interrupt request (IRQ) with other devices. At least one other device that uses that IRQ was already opened. Two concurrent opens of devices that share an IRQ and only work via interrupts is not supported for the particular bus type that the devices use."""
     NT_STATUS = NTStatusValue.STATUS_SHARED_IRQ_BUSY
 
 
 class StatusFtOrphaningError(NTStatusValueError):
-    DESCRIPTION = """{FT Orphaning} A disk that is part of a fault-tolerant volume can no longer be accessed."""
     NT_STATUS = NTStatusValue.STATUS_FT_ORPHANING
 
 
 class StatusBiosFailedToConnectInterruptError(NTStatusValueError):
-    DESCRIPTION = """The basic input/output system (BIOS) failed to connect a system interrupt to the device or bus for which the device is connected."""
     NT_STATUS = NTStatusValue.STATUS_BIOS_FAILED_TO_CONNECT_INTERRUPT
 
 
 class StatusPartitionFailureError(NTStatusValueError):
-    DESCRIPTION = """The tape could not be partitioned."""
     NT_STATUS = NTStatusValue.STATUS_PARTITION_FAILURE
 
 
 class StatusInvalidBlockLengthError(NTStatusValueError):
-    DESCRIPTION = """When accessing a new tape of a multi-volume partition, the current blocksize is incorrect."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_BLOCK_LENGTH
 
 
 class StatusDeviceNotPartitionedError(NTStatusValueError):
-    DESCRIPTION = """The tape partition information could not be found when loading a tape."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_NOT_PARTITIONED
 
 
 class StatusUnableToLockMediaError(NTStatusValueError):
-    DESCRIPTION = """An attempt to lock the eject media mechanism failed."""
     NT_STATUS = NTStatusValue.STATUS_UNABLE_TO_LOCK_MEDIA
 
 
 class StatusUnableToUnloadMediaError(NTStatusValueError):
-    DESCRIPTION = """An attempt to unload media failed."""
     NT_STATUS = NTStatusValue.STATUS_UNABLE_TO_UNLOAD_MEDIA
 
 
 class StatusEomOverflowError(NTStatusValueError):
-    DESCRIPTION = """The physical end of tape was detected."""
     NT_STATUS = NTStatusValue.STATUS_EOM_OVERFLOW
 
 
 class StatusNoMediaError(NTStatusValueError):
-    DESCRIPTION = """{No Media} There is no media in the drive. Insert media into drive %hs."""
     NT_STATUS = NTStatusValue.STATUS_NO_MEDIA
 
 
 class StatusNoSuchMemberError(NTStatusValueError):
-    DESCRIPTION = """A member could not be added to or removed from the local group because the member does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SUCH_MEMBER
 
 
 class StatusInvalidMemberError(NTStatusValueError):
-    DESCRIPTION = """A new member could not be added to a local group because the member has the wrong account type."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_MEMBER
 
 
 class StatusKeyDeletedError(NTStatusValueError):
-    DESCRIPTION = """An illegal operation was attempted on a registry key that has been marked for deletion."""
     NT_STATUS = NTStatusValue.STATUS_KEY_DELETED
 
 
 class StatusNoLogSpaceError(NTStatusValueError):
-    DESCRIPTION = """The system could not allocate the required space in a registry log."""
     NT_STATUS = NTStatusValue.STATUS_NO_LOG_SPACE
 
 
 class StatusTooManySidsError(NTStatusValueError):
-    DESCRIPTION = """Too many SIDs have been specified."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_SIDS
 
 
 class StatusLmCrossEncryptionRequiredError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to change a user password in the security account manager without providing the necessary LM cross-encrypted password."""
     NT_STATUS = NTStatusValue.STATUS_LM_CROSS_ENCRYPTION_REQUIRED
 
 
 class StatusKeyHasChildrenError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to create a symbolic link in a registry key that already has subkeys or values."""
     NT_STATUS = NTStatusValue.STATUS_KEY_HAS_CHILDREN
 
 
 class StatusChildMustBeVolatileError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to create a stable subkey under a volatile parent key."""
     NT_STATUS = NTStatusValue.STATUS_CHILD_MUST_BE_VOLATILE
 
 
 class StatusDeviceConfigurationErrorError(NTStatusValueError):
-    DESCRIPTION = """The I/O device is configured incorrectly or the configuration parameters to the driver are incorrect."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_CONFIGURATION_ERROR
 
 
 class StatusDriverInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """An error was detected between two drivers or within an I/O driver."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_INTERNAL_ERROR
 
 
 class StatusInvalidDeviceStateError(NTStatusValueError):
-    DESCRIPTION = """The device is not in a valid state to perform this request."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_DEVICE_STATE
 
 
 class StatusIoDeviceErrorError(NTStatusValueError):
-    DESCRIPTION = """The I/O device reported an I/O error."""
     NT_STATUS = NTStatusValue.STATUS_IO_DEVICE_ERROR
 
 
 class StatusDeviceProtocolErrorError(NTStatusValueError):
-    DESCRIPTION = """A protocol error was detected between the driver and the device."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_PROTOCOL_ERROR
 
 
 class StatusBackupControllerError(NTStatusValueError):
-    DESCRIPTION = """This operation is only allowed for the primary domain controller of the domain."""
     NT_STATUS = NTStatusValue.STATUS_BACKUP_CONTROLLER
 
 
 class StatusLogFileFullError(NTStatusValueError):
-    DESCRIPTION = """The log file space is insufficient to support this operation."""
     NT_STATUS = NTStatusValue.STATUS_LOG_FILE_FULL
 
 
 class StatusTooLateError(NTStatusValueError):
-    DESCRIPTION = """A write operation was attempted to a volume after it was dismounted."""
     NT_STATUS = NTStatusValue.STATUS_TOO_LATE
 
 
 class StatusNoTrustLsaSecretError(NTStatusValueError):
-    DESCRIPTION = """The workstation does not have a trust secret for the primary domain in the local LSA database."""
     NT_STATUS = NTStatusValue.STATUS_NO_TRUST_LSA_SECRET
 
 
 class StatusNoTrustSamAccountError(NTStatusValueError):
-    DESCRIPTION = """On applicable Windows Server releases, the SAM database does not have a computer account for this workstation trust relationship."""
     NT_STATUS = NTStatusValue.STATUS_NO_TRUST_SAM_ACCOUNT
 
 
 class StatusTrustedDomainFailureError(NTStatusValueError):
-    DESCRIPTION = """The logon request failed because the trust relationship between the primary domain and the trusted domain failed."""
     NT_STATUS = NTStatusValue.STATUS_TRUSTED_DOMAIN_FAILURE
 
 
 class StatusTrustedRelationshipFailureError(NTStatusValueError):
-    DESCRIPTION = """The logon request failed because the trust relationship between this workstation and the primary domain failed."""
     NT_STATUS = NTStatusValue.STATUS_TRUSTED_RELATIONSHIP_FAILURE
 
 
 class StatusEventlogFileCorruptError(NTStatusValueError):
-    DESCRIPTION = """The Eventlog log file is corrupt."""
     NT_STATUS = NTStatusValue.STATUS_EVENTLOG_FILE_CORRUPT
 
 
 class StatusEventlogCantStartError(NTStatusValueError):
-    DESCRIPTION = """No Eventlog log file could be opened. The Eventlog service did not start."""
     NT_STATUS = NTStatusValue.STATUS_EVENTLOG_CANT_START
 
 
 class StatusTrustFailureError(NTStatusValueError):
-    DESCRIPTION = """The network logon failed. This might be because the validation authority cannot be reached."""
     NT_STATUS = NTStatusValue.STATUS_TRUST_FAILURE
 
 
 class StatusMutantLimitExceededError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to acquire a mutant such that its maximum count would have been exceeded."""
     NT_STATUS = NTStatusValue.STATUS_MUTANT_LIMIT_EXCEEDED
 
 
 class StatusNetlogonNotStartedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to logon, but the NetLogon service was not started."""
     NT_STATUS = NTStatusValue.STATUS_NETLOGON_NOT_STARTED
 
 
 class StatusAccountExpiredError(NTStatusValueError):
-    DESCRIPTION = """The user account has expired."""
     NT_STATUS = NTStatusValue.STATUS_ACCOUNT_EXPIRED
 
 
 class StatusPossibleDeadlockError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Possible deadlock condition."""
     NT_STATUS = NTStatusValue.STATUS_POSSIBLE_DEADLOCK
 
 
 class StatusNetworkCredentialConflictError(NTStatusValueError):
-    DESCRIPTION = """Multiple connections to a server or shared resource by the same user, using more than one user name, are not allowed. Disconnect all previous connections to the server or shared resource and try again."""
     NT_STATUS = NTStatusValue.STATUS_NETWORK_CREDENTIAL_CONFLICT
 
 
 class StatusRemoteSessionLimitError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to establish a session to a network server, but there are already too many sessions established to that server."""
     NT_STATUS = NTStatusValue.STATUS_REMOTE_SESSION_LIMIT
 
 
 class StatusEventlogFileChangedError(NTStatusValueError):
-    DESCRIPTION = """The log file has changed between reads."""
     NT_STATUS = NTStatusValue.STATUS_EVENTLOG_FILE_CHANGED
 
 
 class StatusNologonInterdomainTrustAccountError(NTStatusValueError):
-    DESCRIPTION = """The account used is an interdomain trust account. Use your global user account or local user account to access this server."""
     NT_STATUS = NTStatusValue.STATUS_NOLOGON_INTERDOMAIN_TRUST_ACCOUNT
 
 
 class StatusNologonWorkstationTrustAccountError(NTStatusValueError):
-    DESCRIPTION = """The account used is a computer account. Use your global user account or local user account to access this server."""
     NT_STATUS = NTStatusValue.STATUS_NOLOGON_WORKSTATION_TRUST_ACCOUNT
 
 
 class StatusNologonServerTrustAccountError(NTStatusValueError):
-    DESCRIPTION = """The account used is a server trust account. Use your global user account or local user account to access this server."""
     NT_STATUS = NTStatusValue.STATUS_NOLOGON_SERVER_TRUST_ACCOUNT
 
 
 class StatusDomainTrustInconsistentError(NTStatusValueError):
-    DESCRIPTION = """The name or SID of the specified domain is inconsistent with the trust information for that domain."""
     NT_STATUS = NTStatusValue.STATUS_DOMAIN_TRUST_INCONSISTENT
 
 
 class StatusFsDriverRequiredError(NTStatusValueError):
-    DESCRIPTION = """A volume has been accessed for which a file system driver is required that has not yet been loaded."""
     NT_STATUS = NTStatusValue.STATUS_FS_DRIVER_REQUIRED
 
 
 class StatusImageAlreadyLoadedAsDllError(NTStatusValueError):
-    DESCRIPTION = """Indicates that the specified image is already loaded as a DLL."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_ALREADY_LOADED_AS_DLL
 
 
 class StatusIncompatibleWithGlobalShortNameRegistrySettingError(NTStatusValueError):
-    DESCRIPTION = """Short name settings cannot be changed on this volume due to the global registry setting."""
     NT_STATUS = NTStatusValue.STATUS_INCOMPATIBLE_WITH_GLOBAL_SHORT_NAME_REGISTRY_SETTING
 
 
 class StatusShortNamesNotEnabledOnVolumeError(NTStatusValueError):
-    DESCRIPTION = """Short names are not enabled on this volume."""
     NT_STATUS = NTStatusValue.STATUS_SHORT_NAMES_NOT_ENABLED_ON_VOLUME
 
 
 class StatusSecurityStreamIsInconsistentError(NTStatusValueError):
-    DESCRIPTION = """The security stream for the given volume is in an inconsistent state. Please run CHKDSK on the volume."""
     NT_STATUS = NTStatusValue.STATUS_SECURITY_STREAM_IS_INCONSISTENT
 
 
 class StatusInvalidLockRangeError(NTStatusValueError):
-    DESCRIPTION = """A requested file lock operation cannot be processed due to an invalid byte range."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LOCK_RANGE
 
 
 class StatusInvalidAceConditionError(NTStatusValueError):
-    DESCRIPTION = """The specified access control entry (ACE) contains an invalid condition."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_ACE_CONDITION
 
 
 class StatusImageSubsystemNotPresentError(NTStatusValueError):
-    DESCRIPTION = """The subsystem needed to support the image type is not present."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_SUBSYSTEM_NOT_PRESENT
 
 
 class StatusNotificationGuidAlreadyDefinedError(NTStatusValueError):
-    DESCRIPTION = """The specified file already has a notification GUID associated with it."""
     NT_STATUS = NTStatusValue.STATUS_NOTIFICATION_GUID_ALREADY_DEFINED
 
 
 class StatusNetworkOpenRestrictionError(NTStatusValueError):
-    DESCRIPTION = """A remote open failed because the network open restrictions were not satisfied."""
     NT_STATUS = NTStatusValue.STATUS_NETWORK_OPEN_RESTRICTION
 
 
 class StatusNoUserSessionKeyError(NTStatusValueError):
-    DESCRIPTION = """There is no user session key for the specified logon session."""
     NT_STATUS = NTStatusValue.STATUS_NO_USER_SESSION_KEY
 
 
 class StatusUserSessionDeletedError(NTStatusValueError):
-    DESCRIPTION = """The remote user session has been deleted."""
     NT_STATUS = NTStatusValue.STATUS_USER_SESSION_DELETED
 
 
 class StatusResourceLangNotFoundError(NTStatusValueError):
-    DESCRIPTION = """Indicates the specified resource language ID cannot be found in the image file."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_LANG_NOT_FOUND
 
 
 class StatusInsuffServerResourcesError(NTStatusValueError):
-    DESCRIPTION = """Insufficient server resources exist to complete the request."""
     NT_STATUS = NTStatusValue.STATUS_INSUFF_SERVER_RESOURCES
 
 
 class StatusInvalidBufferSizeError(NTStatusValueError):
-    DESCRIPTION = """The size of the buffer is invalid for the specified operation."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_BUFFER_SIZE
 
 
 class StatusInvalidAddressComponentError(NTStatusValueError):
-    DESCRIPTION = """The transport rejected the specified network address as invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_ADDRESS_COMPONENT
 
 
 class StatusInvalidAddressWildcardError(NTStatusValueError):
-    DESCRIPTION = """The transport rejected the specified network address due to invalid use of a wildcard."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_ADDRESS_WILDCARD
 
 
 class StatusTooManyAddressesError(NTStatusValueError):
-    DESCRIPTION = """The transport address could not be opened because all the available addresses are in use."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_ADDRESSES
 
 
 class StatusAddressAlreadyExistsError(NTStatusValueError):
-    DESCRIPTION = """The transport address could not be opened because it already exists."""
     NT_STATUS = NTStatusValue.STATUS_ADDRESS_ALREADY_EXISTS
 
 
 class StatusAddressClosedError(NTStatusValueError):
-    DESCRIPTION = """The transport address is now closed."""
     NT_STATUS = NTStatusValue.STATUS_ADDRESS_CLOSED
 
 
 class StatusConnectionDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """The transport connection is now disconnected."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_DISCONNECTED
 
 
 class StatusConnectionResetError(NTStatusValueError):
-    DESCRIPTION = """The transport connection has been reset."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_RESET
 
 
 class StatusTooManyNodesError(NTStatusValueError):
-    DESCRIPTION = """The transport cannot dynamically acquire any more nodes."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_NODES
 
 
 class StatusTransactionAbortedError(NTStatusValueError):
-    DESCRIPTION = """The transport aborted a pending transaction."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_ABORTED
 
 
 class StatusTransactionTimedOutError(NTStatusValueError):
-    DESCRIPTION = """The transport timed out a request that is waiting for a response."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_TIMED_OUT
 
 
 class StatusTransactionNoReleaseError(NTStatusValueError):
-    DESCRIPTION = """The transport did not receive a release for a pending response."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NO_RELEASE
 
 
 class StatusTransactionNoMatchError(NTStatusValueError):
-    DESCRIPTION = """The transport did not find a transaction that matches the specific token."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NO_MATCH
 
 
 class StatusTransactionRespondedError(NTStatusValueError):
-    DESCRIPTION = """The transport had previously responded to a transaction request."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_RESPONDED
 
 
 class StatusTransactionInvalidIdError(NTStatusValueError):
-    DESCRIPTION = """The transport does not recognize the specified transaction request ID."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_INVALID_ID
 
 
 class StatusTransactionInvalidTypeError(NTStatusValueError):
-    DESCRIPTION = """The transport does not recognize the specified transaction request type."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_INVALID_TYPE
 
 
 class StatusNotServerSessionError(NTStatusValueError):
-    DESCRIPTION = """The transport can only process the specified request on the server side of a session."""
     NT_STATUS = NTStatusValue.STATUS_NOT_SERVER_SESSION
 
 
 class StatusNotClientSessionError(NTStatusValueError):
-    DESCRIPTION = """The transport can only process the specified request on the client side of a session."""
     NT_STATUS = NTStatusValue.STATUS_NOT_CLIENT_SESSION
 
 
 class StatusCannotLoadRegistryFileError(NTStatusValueError):
-    DESCRIPTION = """{Registry File Failure} The registry cannot load the hive (file): %hs or its log or alternate. It is corrupt, absent, or not writable."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_LOAD_REGISTRY_FILE
 
 
 class StatusDebugAttachFailedError(NTStatusValueError):
-    DESCRIPTION = """{Unexpected Failure in DebugActiveProcess} An unexpected failure occurred while processing a DebugActiveProcess API request. Choosing OK will terminate the process, and choosing Cancel will ignore the error."""
     NT_STATUS = NTStatusValue.STATUS_DEBUG_ATTACH_FAILED
 
 
 class StatusSystemProcessTerminatedError(NTStatusValueError):
-    DESCRIPTION = """{Fatal System Error} The %hs system process terminated unexpectedly with a status of 0x%08x (0x%08x 0x%08x). The system has been shut down."""
     NT_STATUS = NTStatusValue.STATUS_SYSTEM_PROCESS_TERMINATED
 
 
 class StatusDataNotAcceptedError(NTStatusValueError):
-    DESCRIPTION = """{Data Not Accepted} The TDI client could not handle the data received during an indication."""
     NT_STATUS = NTStatusValue.STATUS_DATA_NOT_ACCEPTED
 
 
 class StatusNoBrowserServersFoundError(NTStatusValueError):
-    DESCRIPTION = """{Unable to Retrieve Browser Server List} The list of servers for this workgroup is not currently available."""
     NT_STATUS = NTStatusValue.STATUS_NO_BROWSER_SERVERS_FOUND
 
 
 class StatusVdmHardErrorError(NTStatusValueError):
-    DESCRIPTION = """NTVDM encountered a hard error."""
     NT_STATUS = NTStatusValue.STATUS_VDM_HARD_ERROR
 
 
 class StatusDriverCancelTimeoutError(NTStatusValueError):
-    DESCRIPTION = """{Cancel Timeout} The driver %hs failed to complete a canceled I/O request in the allotted time."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_CANCEL_TIMEOUT
 
 
 class StatusReplyMessageMismatchError(NTStatusValueError):
-    DESCRIPTION = """{Reply Message Mismatch} An attempt was made to reply to an LPC message, but the thread specified by the client ID in the message was not waiting on that message."""
     NT_STATUS = NTStatusValue.STATUS_REPLY_MESSAGE_MISMATCH
 
 
 class StatusMappedAlignmentError(NTStatusValueError):
-    DESCRIPTION = """{Mapped View Alignment Incorrect} An attempt was made to map a view of a file, but either the specified base address or the offset into the file were not aligned on the proper allocation granularity."""
     NT_STATUS = NTStatusValue.STATUS_MAPPED_ALIGNMENT
 
 
 class StatusImageChecksumMismatchError(NTStatusValueError):
-    DESCRIPTION = """{Bad Image Checksum} The image %hs is possibly corrupt. The header checksum does not match the computed checksum."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_CHECKSUM_MISMATCH
 
 
 class StatusLostWritebehindDataError(NTStatusValueError):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs. The data has been lost. This error might be caused by a failure of your computer hardware or network connection. Try to save this file elsewhere."""
     NT_STATUS = NTStatusValue.STATUS_LOST_WRITEBEHIND_DATA
 
 
 class StatusClientServerParametersInvalidError(NTStatusValueError):
-    DESCRIPTION = """The parameters passed to the server in the client/server shared memory window were invalid. Too much data might have been put in the shared memory window."""
     NT_STATUS = NTStatusValue.STATUS_CLIENT_SERVER_PARAMETERS_INVALID
 
 
 class StatusPasswordMustChangeError(NTStatusValueError):
-    DESCRIPTION = """The user password must be changed before logging on the first time."""
     NT_STATUS = NTStatusValue.STATUS_PASSWORD_MUST_CHANGE
 
 
 class StatusNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The object was not found."""
     NT_STATUS = NTStatusValue.STATUS_NOT_FOUND
 
 
 class StatusNotTinyStreamError(NTStatusValueError):
-    DESCRIPTION = """The stream is not a tiny stream."""
     NT_STATUS = NTStatusValue.STATUS_NOT_TINY_STREAM
 
 
 class StatusRecoveryFailureError(NTStatusValueError):
-    DESCRIPTION = """A transaction recovery failed."""
     NT_STATUS = NTStatusValue.STATUS_RECOVERY_FAILURE
 
 
 class StatusStackOverflowReadError(NTStatusValueError):
-    DESCRIPTION = """The request must be handled by the stack overflow code."""
     NT_STATUS = NTStatusValue.STATUS_STACK_OVERFLOW_READ
 
 
 class StatusFailCheckError(NTStatusValueError):
-    DESCRIPTION = """A consistency check failed."""
     NT_STATUS = NTStatusValue.STATUS_FAIL_CHECK
 
 
 class StatusDuplicateObjectidError(NTStatusValueError):
-    DESCRIPTION = """The attempt to insert the ID in the index failed because the ID is already in the index."""
     NT_STATUS = NTStatusValue.STATUS_DUPLICATE_OBJECTID
 
 
 class StatusObjectidExistsError(NTStatusValueError):
-    DESCRIPTION = """The attempt to set the object ID failed because the object already has an ID."""
     NT_STATUS = NTStatusValue.STATUS_OBJECTID_EXISTS
 
 
 class StatusConvertToLargeError(NTStatusValueError):
-    DESCRIPTION = """Internal OFS status codes indicating how an allocation operation is handled. Either it is retried after the containing oNode is moved or the extent stream is converted to a large stream."""
     NT_STATUS = NTStatusValue.STATUS_CONVERT_TO_LARGE
 
 
 class StatusRetryError(NTStatusValueError):
-    DESCRIPTION = """The request needs to be retried."""
     NT_STATUS = NTStatusValue.STATUS_RETRY
 
 
 class StatusFoundOutOfScopeError(NTStatusValueError):
-    DESCRIPTION = """The attempt to find the object found an object on the volume that matches by ID; however, it is out of the scope of the handle that is used for the operation."""
     NT_STATUS = NTStatusValue.STATUS_FOUND_OUT_OF_SCOPE
 
 
 class StatusAllocateBucketError(NTStatusValueError):
-    DESCRIPTION = """The bucket array must be grown. Retry the transaction after doing so."""
     NT_STATUS = NTStatusValue.STATUS_ALLOCATE_BUCKET
 
 
 class StatusPropsetNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified property set does not exist on the object."""
     NT_STATUS = NTStatusValue.STATUS_PROPSET_NOT_FOUND
 
 
 class StatusMarshallOverflowError(NTStatusValueError):
-    DESCRIPTION = """The user/kernel marshaling buffer has overflowed."""
     NT_STATUS = NTStatusValue.STATUS_MARSHALL_OVERFLOW
 
 
 class StatusInvalidVariantError(NTStatusValueError):
-    DESCRIPTION = """The supplied variant structure contains invalid data."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_VARIANT
 
 
 class StatusDomainControllerNotFoundError(NTStatusValueError):
-    DESCRIPTION = """A domain controller for this domain was not found."""
     NT_STATUS = NTStatusValue.STATUS_DOMAIN_CONTROLLER_NOT_FOUND
 
 
 class StatusAccountLockedOutError(NTStatusValueError):
-    DESCRIPTION = """The user account has been automatically locked because too many invalid logon attempts or password change attempts have been requested."""
     NT_STATUS = NTStatusValue.STATUS_ACCOUNT_LOCKED_OUT
 
 
 class StatusHandleNotClosableError(NTStatusValueError):
-    DESCRIPTION = """NtClose was called on a handle that was protected from close via NtSetInformationObject."""
     NT_STATUS = NTStatusValue.STATUS_HANDLE_NOT_CLOSABLE
 
 
 class StatusConnectionRefusedError(NTStatusValueError):
-    DESCRIPTION = """The transport-connection attempt was refused by the remote system."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_REFUSED
 
 
 class StatusGracefulDisconnectError(NTStatusValueError):
-    DESCRIPTION = """The transport connection was gracefully closed."""
     NT_STATUS = NTStatusValue.STATUS_GRACEFUL_DISCONNECT
 
 
 class StatusAddressAlreadyAssociatedError(NTStatusValueError):
-    DESCRIPTION = """The transport endpoint already has an address associated with it."""
     NT_STATUS = NTStatusValue.STATUS_ADDRESS_ALREADY_ASSOCIATED
 
 
 class StatusAddressNotAssociatedError(NTStatusValueError):
-    DESCRIPTION = """An address has not yet been associated with the transport endpoint."""
     NT_STATUS = NTStatusValue.STATUS_ADDRESS_NOT_ASSOCIATED
 
 
 class StatusConnectionInvalidError(NTStatusValueError):
-    DESCRIPTION = """An operation was attempted on a nonexistent transport connection."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_INVALID
 
 
 class StatusConnectionActiveError(NTStatusValueError):
-    DESCRIPTION = """An invalid operation was attempted on an active transport connection."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_ACTIVE
 
 
 class StatusNetworkUnreachableError(NTStatusValueError):
-    DESCRIPTION = """The remote network is not reachable by the transport."""
     NT_STATUS = NTStatusValue.STATUS_NETWORK_UNREACHABLE
 
 
 class StatusHostUnreachableError(NTStatusValueError):
-    DESCRIPTION = """The remote system is not reachable by the transport."""
     NT_STATUS = NTStatusValue.STATUS_HOST_UNREACHABLE
 
 
 class StatusProtocolUnreachableError(NTStatusValueError):
-    DESCRIPTION = """The remote system does not support the transport protocol."""
     NT_STATUS = NTStatusValue.STATUS_PROTOCOL_UNREACHABLE
 
 
 class StatusPortUnreachableError(NTStatusValueError):
-    DESCRIPTION = """No service is operating at the destination port of the transport on the remote system."""
     NT_STATUS = NTStatusValue.STATUS_PORT_UNREACHABLE
 
 
 class StatusRequestAbortedError(NTStatusValueError):
-    DESCRIPTION = """The request was aborted."""
     NT_STATUS = NTStatusValue.STATUS_REQUEST_ABORTED
 
 
 class StatusConnectionAbortedError(NTStatusValueError):
-    DESCRIPTION = """The transport connection was aborted by the local system."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_ABORTED
 
 
 class StatusBadCompressionBufferError(NTStatusValueError):
-    DESCRIPTION = """The specified buffer contains ill-formed data."""
     NT_STATUS = NTStatusValue.STATUS_BAD_COMPRESSION_BUFFER
 
 
 class StatusUserMappedFileError(NTStatusValueError):
-    DESCRIPTION = """The requested operation cannot be performed on a file with a user mapped section open."""
     NT_STATUS = NTStatusValue.STATUS_USER_MAPPED_FILE
 
 
 class StatusAuditFailedError(NTStatusValueError):
-    DESCRIPTION = """{Audit Failed} An attempt to generate a security audit failed."""
     NT_STATUS = NTStatusValue.STATUS_AUDIT_FAILED
 
 
 class StatusTimerResolutionNotSetError(NTStatusValueError):
-    DESCRIPTION = """The timer resolution was not previously set by the current process."""
     NT_STATUS = NTStatusValue.STATUS_TIMER_RESOLUTION_NOT_SET
 
 
 class StatusConnectionCountLimitError(NTStatusValueError):
-    DESCRIPTION = """A connection to the server could not be made because the limit on the number of concurrent connections for this account has been reached."""
     NT_STATUS = NTStatusValue.STATUS_CONNECTION_COUNT_LIMIT
 
 
 class StatusLoginTimeRestrictionError(NTStatusValueError):
-    DESCRIPTION = """Attempting to log on during an unauthorized time of day for this account."""
     NT_STATUS = NTStatusValue.STATUS_LOGIN_TIME_RESTRICTION
 
 
 class StatusLoginWkstaRestrictionError(NTStatusValueError):
-    DESCRIPTION = """The account is not authorized to log on from this station."""
     NT_STATUS = NTStatusValue.STATUS_LOGIN_WKSTA_RESTRICTION
 
 
 class StatusImageMpUpMismatchError(NTStatusValueError):
-    DESCRIPTION = """{UP/MP Image Mismatch} The image %hs has been modified for use on a uniprocessor system, but you are running it on a multiprocessor machine. Reinstall the image file."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_MP_UP_MISMATCH
 
 
 class StatusInsufficientLogonInfoError(NTStatusValueError):
-    DESCRIPTION = """There is insufficient account information to log you on."""
     NT_STATUS = NTStatusValue.STATUS_INSUFFICIENT_LOGON_INFO
 
 
 class StatusBadDllEntrypointError(NTStatusValueError):
-    DESCRIPTION = """{Invalid DLL Entrypoint} The dynamic link library %hs is not written correctly. The stack pointer has been left in an inconsistent state. The entry point should be declared as WINAPI or STDCALL. Select YES to fail the DLL load. Select NO to continue execution. Selecting NO might cause the application to operate incorrectly."""
     NT_STATUS = NTStatusValue.STATUS_BAD_DLL_ENTRYPOINT
 
 
 class StatusBadServiceEntrypointError(NTStatusValueError):
-    DESCRIPTION = """{Invalid Service Callback Entrypoint} The %hs service is not written correctly. The stack pointer has been left in an inconsistent state. The callback entry point should be declared as WINAPI or STDCALL. Selecting OK will cause the service to continue operation. However, the service process might operate incorrectly."""
     NT_STATUS = NTStatusValue.STATUS_BAD_SERVICE_ENTRYPOINT
 
 
 class StatusLpcReplyLostError(NTStatusValueError):
-    DESCRIPTION = """The server received the messages but did not send a reply."""
     NT_STATUS = NTStatusValue.STATUS_LPC_REPLY_LOST
 
 
 class StatusIpAddressConflict1Error(NTStatusValueError):
-    DESCRIPTION = """There is an IP address conflict with another system on the network."""
     NT_STATUS = NTStatusValue.STATUS_IP_ADDRESS_CONFLICT1
 
 
 class StatusIpAddressConflict2Error(NTStatusValueError):
-    DESCRIPTION = """There is an IP address conflict with another system on the network."""
     NT_STATUS = NTStatusValue.STATUS_IP_ADDRESS_CONFLICT2
 
 
 class StatusRegistryQuotaLimitError(NTStatusValueError):
-    DESCRIPTION = """{Low On Registry Space} The system has reached the maximum size that is allowed for the system part of the registry. Additional storage requests will be ignored."""
     NT_STATUS = NTStatusValue.STATUS_REGISTRY_QUOTA_LIMIT
 
 
 class StatusPathNotCoveredError(NTStatusValueError):
-    DESCRIPTION = """The contacted server does not support the indicated part of the DFS namespace."""
     NT_STATUS = NTStatusValue.STATUS_PATH_NOT_COVERED
 
 
 class StatusNoCallbackActiveError(NTStatusValueError):
-    DESCRIPTION = """A callback return system service cannot be executed when no callback is active."""
     NT_STATUS = NTStatusValue.STATUS_NO_CALLBACK_ACTIVE
 
 
 class StatusLicenseQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """The service being accessed is licensed for a particular number of connections. No more connections can be made to the service at this time because the service has already accepted the maximum number of connections."""
     NT_STATUS = NTStatusValue.STATUS_LICENSE_QUOTA_EXCEEDED
 
 
 class StatusPwdTooShortError(NTStatusValueError):
-    DESCRIPTION = """The password provided is too short to meet the policy of your user account. Choose a longer password."""
     NT_STATUS = NTStatusValue.STATUS_PWD_TOO_SHORT
 
 
 class StatusPwdTooRecentError(NTStatusValueError):
-    DESCRIPTION = """The policy of your user account does not allow you to change passwords too frequently. This is done to prevent users from changing back to a familiar, but potentially discovered, password. If you feel your password has been compromised, contact your administrator immediately to have a new one assigned."""
     NT_STATUS = NTStatusValue.STATUS_PWD_TOO_RECENT
 
 
 class StatusPwdHistoryConflictError(NTStatusValueError):
-    DESCRIPTION = """You have attempted to change your password to one that you have used in the past. The policy of your user account does not allow this. Select a password that you have not previously used."""
     NT_STATUS = NTStatusValue.STATUS_PWD_HISTORY_CONFLICT
 
 
 class StatusPlugplayNoDeviceError(NTStatusValueError):
-    DESCRIPTION = """You have attempted to load a legacy device driver while its device instance had been disabled."""
     NT_STATUS = NTStatusValue.STATUS_PLUGPLAY_NO_DEVICE
 
 
 class StatusUnsupportedCompressionError(NTStatusValueError):
-    DESCRIPTION = """The specified compression format is unsupported."""
     NT_STATUS = NTStatusValue.STATUS_UNSUPPORTED_COMPRESSION
 
 
 class StatusInvalidHwProfileError(NTStatusValueError):
-    DESCRIPTION = """The specified hardware profile configuration is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_HW_PROFILE
 
 
 class StatusInvalidPlugplayDevicePathError(NTStatusValueError):
-    DESCRIPTION = """The specified Plug and Play registry device path is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_PLUGPLAY_DEVICE_PATH
 
 
 class StatusDriverOrdinalNotFoundError(NTStatusValueError):
-    DESCRIPTION = """{Driver Entry Point Not Found} The %hs device driver could not locate the ordinal %ld in driver %hs."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_ORDINAL_NOT_FOUND
 
 
 class StatusDriverEntrypointNotFoundError(NTStatusValueError):
-    DESCRIPTION = """{Driver Entry Point Not Found} The %hs device driver could not locate the entry point %hs in driver %hs."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_ENTRYPOINT_NOT_FOUND
 
 
 class StatusResourceNotOwnedError(NTStatusValueError):
-    DESCRIPTION = """{Application Error} The application attempted to release a resource it did not own. Click OK to terminate the application."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_NOT_OWNED
 
 
 class StatusTooManyLinksError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to create more links on a file than the file system supports."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_LINKS
 
 
 class StatusQuotaListInconsistentError(NTStatusValueError):
-    DESCRIPTION = """The specified quota list is internally inconsistent with its descriptor."""
     NT_STATUS = NTStatusValue.STATUS_QUOTA_LIST_INCONSISTENT
 
 
 class StatusFileIsOfflineError(NTStatusValueError):
-    DESCRIPTION = """The specified file has been relocated to offline storage."""
     NT_STATUS = NTStatusValue.STATUS_FILE_IS_OFFLINE
 
 
 class StatusEvaluationExpirationError(NTStatusValueError):
-    DESCRIPTION = """{Windows Evaluation Notification} The evaluation period for this installation of Windows has expired. This system will shutdown in 1 hour. To restore access to this installation of Windows, upgrade this installation by using a licensed distribution of this product."""
     NT_STATUS = NTStatusValue.STATUS_EVALUATION_EXPIRATION
 
 
 class StatusIllegalDllRelocationError(NTStatusValueError):
-    DESCRIPTION = """{Illegal System DLL Relocation} The system DLL %hs was relocated in memory. The application will not run properly. The relocation occurred because the DLL %hs occupied an address range that is reserved for Windows system DLLs. The vendor supplying the DLL should be contacted for a new DLL."""
     NT_STATUS = NTStatusValue.STATUS_ILLEGAL_DLL_RELOCATION
 
 
 class StatusLicenseViolationError(NTStatusValueError):
-    DESCRIPTION = """{License Violation} The system has detected tampering with your registered product type. This is a violation of your software license. Tampering with the product type is not permitted."""
     NT_STATUS = NTStatusValue.STATUS_LICENSE_VIOLATION
 
 
 class StatusDllInitFailedLogoffError(NTStatusValueError):
-    DESCRIPTION = """{DLL Initialization Failed} The application failed to initialize because the window station is shutting down."""
     NT_STATUS = NTStatusValue.STATUS_DLL_INIT_FAILED_LOGOFF
 
 
 class StatusDriverUnableToLoadError(NTStatusValueError):
-    DESCRIPTION = """{Unable to Load Device Driver} %hs device driver could not be loaded. Error Status was 0x%x."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_UNABLE_TO_LOAD
 
 
 class StatusDfsUnavailableError(NTStatusValueError):
-    DESCRIPTION = """DFS is unavailable on the contacted server."""
     NT_STATUS = NTStatusValue.STATUS_DFS_UNAVAILABLE
 
 
 class StatusVolumeDismountedError(NTStatusValueError):
-    DESCRIPTION = """An operation was attempted to a volume after it was dismounted."""
     NT_STATUS = NTStatusValue.STATUS_VOLUME_DISMOUNTED
 
 
 class StatusWx86InternalErrorError(NTStatusValueError):
-    DESCRIPTION = """An internal error occurred in the Win32 x86 emulation subsystem."""
     NT_STATUS = NTStatusValue.STATUS_WX86_INTERNAL_ERROR
 
 
 class StatusWx86FloatStackCheckError(NTStatusValueError):
-    DESCRIPTION = """Win32 x86 emulation subsystem floating-point stack check."""
     NT_STATUS = NTStatusValue.STATUS_WX86_FLOAT_STACK_CHECK
 
 
 class StatusValidateContinueError(NTStatusValueError):
-    DESCRIPTION = """The validation process needs to continue on to the next step."""
     NT_STATUS = NTStatusValue.STATUS_VALIDATE_CONTINUE
 
 
 class StatusNoMatchError(NTStatusValueError):
-    DESCRIPTION = """There was no match for the specified key in the index."""
     NT_STATUS = NTStatusValue.STATUS_NO_MATCH
 
 
 class StatusNoMoreMatchesError(NTStatusValueError):
-    DESCRIPTION = """There are no more matches for the current index enumeration."""
     NT_STATUS = NTStatusValue.STATUS_NO_MORE_MATCHES
 
 
 class StatusNotAReparsePointError(NTStatusValueError):
-    DESCRIPTION = """The NTFS file or directory is not a reparse point."""
     NT_STATUS = NTStatusValue.STATUS_NOT_A_REPARSE_POINT
 
 
 class StatusIoReparseTagInvalidError(NTStatusValueError):
-    DESCRIPTION = """The Windows I/O reparse tag passed for the NTFS reparse point is invalid."""
     NT_STATUS = NTStatusValue.STATUS_IO_REPARSE_TAG_INVALID
 
 
 class StatusIoReparseTagMismatchError(NTStatusValueError):
-    DESCRIPTION = """The Windows I/O reparse tag does not match the one that is in the NTFS reparse point."""
     NT_STATUS = NTStatusValue.STATUS_IO_REPARSE_TAG_MISMATCH
 
 
 class StatusIoReparseDataInvalidError(NTStatusValueError):
-    DESCRIPTION = """The user data passed for the NTFS reparse point is invalid."""
     NT_STATUS = NTStatusValue.STATUS_IO_REPARSE_DATA_INVALID
 
 
 class StatusIoReparseTagNotHandledError(NTStatusValueError):
-    DESCRIPTION = """The layered file system driver for this I/O tag did not handle it when needed."""
     NT_STATUS = NTStatusValue.STATUS_IO_REPARSE_TAG_NOT_HANDLED
 
 
 class StatusReparsePointNotResolvedError(NTStatusValueError):
-    DESCRIPTION = """The NTFS symbolic link could not be resolved even though the initial file name is valid."""
     NT_STATUS = NTStatusValue.STATUS_REPARSE_POINT_NOT_RESOLVED
 
 
 class StatusDirectoryIsAReparsePointError(NTStatusValueError):
-    DESCRIPTION = """The NTFS directory is a reparse point."""
     NT_STATUS = NTStatusValue.STATUS_DIRECTORY_IS_A_REPARSE_POINT
 
 
 class StatusRangeListConflictError(NTStatusValueError):
-    DESCRIPTION = """The range could not be added to the range list because of a conflict."""
     NT_STATUS = NTStatusValue.STATUS_RANGE_LIST_CONFLICT
 
 
 class StatusSourceElementEmptyError(NTStatusValueError):
-    DESCRIPTION = """The specified medium changer source element contains no media."""
     NT_STATUS = NTStatusValue.STATUS_SOURCE_ELEMENT_EMPTY
 
 
 class StatusDestinationElementFullError(NTStatusValueError):
-    DESCRIPTION = """The specified medium changer destination element already contains media."""
     NT_STATUS = NTStatusValue.STATUS_DESTINATION_ELEMENT_FULL
 
 
 class StatusIllegalElementAddressError(NTStatusValueError):
-    DESCRIPTION = """The specified medium changer element does not exist."""
     NT_STATUS = NTStatusValue.STATUS_ILLEGAL_ELEMENT_ADDRESS
 
 
 class StatusMagazineNotPresentError(NTStatusValueError):
-    DESCRIPTION = """The specified element is contained in a magazine that is no longer present."""
     NT_STATUS = NTStatusValue.STATUS_MAGAZINE_NOT_PRESENT
 
 
 class StatusReinitializationNeededError(NTStatusValueError):
-    DESCRIPTION = """The device requires re-initialization due to hardware errors."""
     NT_STATUS = NTStatusValue.STATUS_REINITIALIZATION_NEEDED
 
 
 class StatusEncryptionFailedError(NTStatusValueError):
-    DESCRIPTION = """The file encryption attempt failed."""
     NT_STATUS = NTStatusValue.STATUS_ENCRYPTION_FAILED
 
 
 class StatusDecryptionFailedError(NTStatusValueError):
-    DESCRIPTION = """The file decryption attempt failed."""
     NT_STATUS = NTStatusValue.STATUS_DECRYPTION_FAILED
 
 
 class StatusRangeNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified range could not be found in the range list."""
     NT_STATUS = NTStatusValue.STATUS_RANGE_NOT_FOUND
 
 
 class StatusNoRecoveryPolicyError(NTStatusValueError):
-    DESCRIPTION = """There is no encryption recovery policy configured for this system."""
     NT_STATUS = NTStatusValue.STATUS_NO_RECOVERY_POLICY
 
 
 class StatusNoEfsError(NTStatusValueError):
-    DESCRIPTION = """The required encryption driver is not loaded for this system."""
     NT_STATUS = NTStatusValue.STATUS_NO_EFS
 
 
 class StatusWrongEfsError(NTStatusValueError):
-    DESCRIPTION = """The file was encrypted with a different encryption driver than is currently loaded."""
     NT_STATUS = NTStatusValue.STATUS_WRONG_EFS
 
 
 class StatusNoUserKeysError(NTStatusValueError):
-    DESCRIPTION = """There are no EFS keys defined for the user."""
     NT_STATUS = NTStatusValue.STATUS_NO_USER_KEYS
 
 
 class StatusFileNotEncryptedError(NTStatusValueError):
-    DESCRIPTION = """The specified file is not encrypted."""
     NT_STATUS = NTStatusValue.STATUS_FILE_NOT_ENCRYPTED
 
 
 class StatusNotExportFormatError(NTStatusValueError):
-    DESCRIPTION = """The specified file is not in the defined EFS export format."""
     NT_STATUS = NTStatusValue.STATUS_NOT_EXPORT_FORMAT
 
 
 class StatusFileEncryptedError(NTStatusValueError):
-    DESCRIPTION = """The specified file is encrypted and the user does not have the ability to decrypt it."""
     NT_STATUS = NTStatusValue.STATUS_FILE_ENCRYPTED
 
 
 class StatusWmiGuidNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The GUID passed was not recognized as valid by a WMI data provider."""
     NT_STATUS = NTStatusValue.STATUS_WMI_GUID_NOT_FOUND
 
 
 class StatusWmiInstanceNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The instance name passed was not recognized as valid by a WMI data provider."""
     NT_STATUS = NTStatusValue.STATUS_WMI_INSTANCE_NOT_FOUND
 
 
 class StatusWmiItemidNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The data item ID passed was not recognized as valid by a WMI data provider."""
     NT_STATUS = NTStatusValue.STATUS_WMI_ITEMID_NOT_FOUND
 
 
 class StatusWmiTryAgainError(NTStatusValueError):
-    DESCRIPTION = """The WMI request could not be completed and should be retried."""
     NT_STATUS = NTStatusValue.STATUS_WMI_TRY_AGAIN
 
 
 class StatusSharedPolicyError(NTStatusValueError):
-    DESCRIPTION = """The policy object is shared and can only be modified at the root."""
     NT_STATUS = NTStatusValue.STATUS_SHARED_POLICY
 
 
 class StatusPolicyObjectNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The policy object does not exist when it should."""
     NT_STATUS = NTStatusValue.STATUS_POLICY_OBJECT_NOT_FOUND
 
 
 class StatusPolicyOnlyInDsError(NTStatusValueError):
-    DESCRIPTION = """The requested policy information only lives in the Ds."""
     NT_STATUS = NTStatusValue.STATUS_POLICY_ONLY_IN_DS
 
 
 class StatusVolumeNotUpgradedError(NTStatusValueError):
-    DESCRIPTION = """The volume must be upgraded to enable this feature."""
     NT_STATUS = NTStatusValue.STATUS_VOLUME_NOT_UPGRADED
 
 
 class StatusRemoteStorageNotActiveError(NTStatusValueError):
-    DESCRIPTION = """The remote storage service is not operational at this time."""
     NT_STATUS = NTStatusValue.STATUS_REMOTE_STORAGE_NOT_ACTIVE
 
 
 class StatusRemoteStorageMediaErrorError(NTStatusValueError):
-    DESCRIPTION = """The remote storage service encountered a media error."""
     NT_STATUS = NTStatusValue.STATUS_REMOTE_STORAGE_MEDIA_ERROR
 
 
 class StatusNoTrackingServiceError(NTStatusValueError):
-    DESCRIPTION = """The tracking (workstation) service is not running."""
     NT_STATUS = NTStatusValue.STATUS_NO_TRACKING_SERVICE
 
 
 class StatusServerSidMismatchError(NTStatusValueError):
-    DESCRIPTION = """The server process is running under a SID that is different from the SID that is required by client."""
     NT_STATUS = NTStatusValue.STATUS_SERVER_SID_MISMATCH
 
 
 class StatusDsNoAttributeOrValueError(NTStatusValueError):
-    DESCRIPTION = """The specified directory service attribute or value does not exist."""
     NT_STATUS = NTStatusValue.STATUS_DS_NO_ATTRIBUTE_OR_VALUE
 
 
 class StatusDsInvalidAttributeSyntaxError(NTStatusValueError):
-    DESCRIPTION = """The attribute syntax specified to the directory service is invalid."""
     NT_STATUS = NTStatusValue.STATUS_DS_INVALID_ATTRIBUTE_SYNTAX
 
 
 class StatusDsAttributeTypeUndefinedError(NTStatusValueError):
-    DESCRIPTION = """The attribute type specified to the directory service is not defined."""
     NT_STATUS = NTStatusValue.STATUS_DS_ATTRIBUTE_TYPE_UNDEFINED
 
 
 class StatusDsAttributeOrValueExistsError(NTStatusValueError):
-    DESCRIPTION = """The specified directory service attribute or value already exists."""
     NT_STATUS = NTStatusValue.STATUS_DS_ATTRIBUTE_OR_VALUE_EXISTS
 
 
 class StatusDsBusyError(NTStatusValueError):
-    DESCRIPTION = """The directory service is busy."""
     NT_STATUS = NTStatusValue.STATUS_DS_BUSY
 
 
 class StatusDsUnavailableError(NTStatusValueError):
-    DESCRIPTION = """The directory service is unavailable."""
     NT_STATUS = NTStatusValue.STATUS_DS_UNAVAILABLE
 
 
 class StatusDsNoRidsAllocatedError(NTStatusValueError):
-    DESCRIPTION = """The directory service was unable to allocate a relative identifier."""
     NT_STATUS = NTStatusValue.STATUS_DS_NO_RIDS_ALLOCATED
 
 
 class StatusDsNoMoreRidsError(NTStatusValueError):
-    DESCRIPTION = """The directory service has exhausted the pool of relative identifiers."""
     NT_STATUS = NTStatusValue.STATUS_DS_NO_MORE_RIDS
 
 
 class StatusDsIncorrectRoleOwnerError(NTStatusValueError):
-    DESCRIPTION = """The requested operation could not be performed because the directory service is not the master for that type of operation."""
     NT_STATUS = NTStatusValue.STATUS_DS_INCORRECT_ROLE_OWNER
 
 
 class StatusDsRidmgrInitErrorError(NTStatusValueError):
-    DESCRIPTION = """The directory service was unable to initialize the subsystem that allocates relative identifiers."""
     NT_STATUS = NTStatusValue.STATUS_DS_RIDMGR_INIT_ERROR
 
 
 class StatusDsObjClassViolationError(NTStatusValueError):
-    DESCRIPTION = """The requested operation did not satisfy one or more constraints that are associated with the class of the object."""
     NT_STATUS = NTStatusValue.STATUS_DS_OBJ_CLASS_VIOLATION
 
 
 class StatusDsCantOnNonLeafError(NTStatusValueError):
-    DESCRIPTION = """The directory service can perform the requested operation only on a leaf object."""
     NT_STATUS = NTStatusValue.STATUS_DS_CANT_ON_NON_LEAF
 
 
 class StatusDsCantOnRdnError(NTStatusValueError):
-    DESCRIPTION = """The directory service cannot perform the requested operation on the Relatively Defined Name (RDN) attribute of an object."""
     NT_STATUS = NTStatusValue.STATUS_DS_CANT_ON_RDN
 
 
 class StatusDsCantModObjClassError(NTStatusValueError):
-    DESCRIPTION = """The directory service detected an attempt to modify the object class of an object."""
     NT_STATUS = NTStatusValue.STATUS_DS_CANT_MOD_OBJ_CLASS
 
 
 class StatusDsCrossDomMoveFailedError(NTStatusValueError):
-    DESCRIPTION = """An error occurred while performing a cross domain move operation."""
     NT_STATUS = NTStatusValue.STATUS_DS_CROSS_DOM_MOVE_FAILED
 
 
 class StatusDsGcNotAvailableError(NTStatusValueError):
-    DESCRIPTION = """Unable to contact the global catalog server."""
     NT_STATUS = NTStatusValue.STATUS_DS_GC_NOT_AVAILABLE
 
 
 class StatusDirectoryServiceRequiredError(NTStatusValueError):
-    DESCRIPTION = """The requested operation requires a directory service, and none was available."""
     NT_STATUS = NTStatusValue.STATUS_DIRECTORY_SERVICE_REQUIRED
 
 
 class StatusReparseAttributeConflictError(NTStatusValueError):
-    DESCRIPTION = """The reparse attribute cannot be set because it is incompatible with an existing attribute."""
     NT_STATUS = NTStatusValue.STATUS_REPARSE_ATTRIBUTE_CONFLICT
 
 
 class StatusCantEnableDenyOnlyError(NTStatusValueError):
-    DESCRIPTION = """A group marked "use for deny only" cannot be enabled."""
     NT_STATUS = NTStatusValue.STATUS_CANT_ENABLE_DENY_ONLY
 
 
 class StatusFloatMultipleFaultsError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Multiple floating-point faults."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_MULTIPLE_FAULTS
 
 
 class StatusFloatMultipleTrapsError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Multiple floating-point traps."""
     NT_STATUS = NTStatusValue.STATUS_FLOAT_MULTIPLE_TRAPS
 
 
 class StatusDeviceRemovedError(NTStatusValueError):
-    DESCRIPTION = """The device has been removed."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_REMOVED
 
 
 class StatusJournalDeleteInProgressError(NTStatusValueError):
-    DESCRIPTION = """The volume change journal is being deleted."""
     NT_STATUS = NTStatusValue.STATUS_JOURNAL_DELETE_IN_PROGRESS
 
 
 class StatusJournalNotActiveError(NTStatusValueError):
-    DESCRIPTION = """The volume change journal is not active."""
     NT_STATUS = NTStatusValue.STATUS_JOURNAL_NOT_ACTIVE
 
 
 class StatusNointerfaceError(NTStatusValueError):
-    DESCRIPTION = """The requested interface is not supported."""
     NT_STATUS = NTStatusValue.STATUS_NOINTERFACE
 
 
 class StatusDsAdminLimitExceededError(NTStatusValueError):
-    DESCRIPTION = """A directory service resource limit has been exceeded."""
     NT_STATUS = NTStatusValue.STATUS_DS_ADMIN_LIMIT_EXCEEDED
 
 
 class StatusDriverFailedSleepError(NTStatusValueError):
-    DESCRIPTION = """{System Standby Failed} The driver %hs does not support standby mode. Updating this driver allows the system to go to standby mode."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_FAILED_SLEEP
 
 
 class StatusMutualAuthenticationFailedError(NTStatusValueError):
-    DESCRIPTION = """Mutual Authentication failed. The server password is out of date at the domain controller."""
     NT_STATUS = NTStatusValue.STATUS_MUTUAL_AUTHENTICATION_FAILED
 
 
 class StatusCorruptSystemFileError(NTStatusValueError):
-    DESCRIPTION = """The system file %1 has become corrupt and has been replaced."""
     NT_STATUS = NTStatusValue.STATUS_CORRUPT_SYSTEM_FILE
 
 
 class StatusDatatypeMisalignmentErrorError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Alignment Error A data type misalignment error was detected in a load or store instruction."""
     NT_STATUS = NTStatusValue.STATUS_DATATYPE_MISALIGNMENT_ERROR
 
 
 class StatusWmiReadOnlyError(NTStatusValueError):
-    DESCRIPTION = """The WMI data item or data block is read-only."""
     NT_STATUS = NTStatusValue.STATUS_WMI_READ_ONLY
 
 
 class StatusWmiSetFailureError(NTStatusValueError):
-    DESCRIPTION = """The WMI data item or data block could not be changed."""
     NT_STATUS = NTStatusValue.STATUS_WMI_SET_FAILURE
 
 
 class StatusCommitmentMinimumError(NTStatusValueError):
-    DESCRIPTION = """{Virtual Memory Minimum Too Low} Your system is low on virtual memory. Windows is increasing the size of your virtual memory paging file. During this process, memory requests for some applications might be denied. For more information, see Help."""
     NT_STATUS = NTStatusValue.STATUS_COMMITMENT_MINIMUM
 
 
 class StatusRegNatConsumptionError(NTStatusValueError):
-    DESCRIPTION = """{EXCEPTION} Register NaT consumption faults. A NaT value is consumed on a non-speculative instruction."""
     NT_STATUS = NTStatusValue.STATUS_REG_NAT_CONSUMPTION
 
 
 class StatusTransportFullError(NTStatusValueError):
-    DESCRIPTION = """The transport element of the medium changer contains media, which is causing the operation to fail."""
     NT_STATUS = NTStatusValue.STATUS_TRANSPORT_FULL
 
 
 class StatusDsSamInitFailureError(NTStatusValueError):
-    DESCRIPTION = """Security Accounts Manager initialization failed because of the following error: %hs Error Status: 0x%x. Click OK to shut down this system and restart in Directory Services Restore Mode. Check the event log for more detailed information."""
     NT_STATUS = NTStatusValue.STATUS_DS_SAM_INIT_FAILURE
 
 
 class StatusOnlyIfConnectedError(NTStatusValueError):
-    DESCRIPTION = """This operation is supported only when you are connected to the server."""
     NT_STATUS = NTStatusValue.STATUS_ONLY_IF_CONNECTED
 
 
 class StatusDsSensitiveGroupViolationError(NTStatusValueError):
-    DESCRIPTION = """Only an administrator can modify the membership list of an administrative group."""
     NT_STATUS = NTStatusValue.STATUS_DS_SENSITIVE_GROUP_VIOLATION
 
 
 class StatusPnpRestartEnumerationError(NTStatusValueError):
-    DESCRIPTION = """A device was removed so enumeration must be restarted."""
     NT_STATUS = NTStatusValue.STATUS_PNP_RESTART_ENUMERATION
 
 
 class StatusJournalEntryDeletedError(NTStatusValueError):
-    DESCRIPTION = """The journal entry has been deleted from the journal."""
     NT_STATUS = NTStatusValue.STATUS_JOURNAL_ENTRY_DELETED
 
 
 class StatusDsCantModPrimarygroupidError(NTStatusValueError):
-    DESCRIPTION = """Cannot change the primary group ID of a domain controller account."""
     NT_STATUS = NTStatusValue.STATUS_DS_CANT_MOD_PRIMARYGROUPID
 
 
 class StatusSystemImageBadSignatureError(NTStatusValueError):
-    DESCRIPTION = """{Fatal System Error} The system image %s is not properly signed. The file has been replaced with the signed file. The system has been shut down."""
     NT_STATUS = NTStatusValue.STATUS_SYSTEM_IMAGE_BAD_SIGNATURE
 
 
 class StatusPnpRebootRequiredError(NTStatusValueError):
-    DESCRIPTION = """The device will not start without a reboot."""
     NT_STATUS = NTStatusValue.STATUS_PNP_REBOOT_REQUIRED
 
 
 class StatusPowerStateInvalidError(NTStatusValueError):
-    DESCRIPTION = """The power state of the current device cannot support this request."""
     NT_STATUS = NTStatusValue.STATUS_POWER_STATE_INVALID
 
 
 class StatusDsInvalidGroupTypeError(NTStatusValueError):
-    DESCRIPTION = """The specified group type is invalid."""
     NT_STATUS = NTStatusValue.STATUS_DS_INVALID_GROUP_TYPE
 
 
 class StatusDsNoNestGlobalgroupInMixeddomainError(NTStatusValueError):
-    DESCRIPTION = """In a mixed domain, no nesting of a global group if the group is security enabled."""
     NT_STATUS = NTStatusValue.STATUS_DS_NO_NEST_GLOBALGROUP_IN_MIXEDDOMAIN
 
 
 class StatusDsNoNestLocalgroupInMixeddomainError(NTStatusValueError):
-    DESCRIPTION = """In a mixed domain, cannot nest local groups with other local groups, if the group is security enabled."""
     NT_STATUS = NTStatusValue.STATUS_DS_NO_NEST_LOCALGROUP_IN_MIXEDDOMAIN
 
 
 class StatusDsGlobalCantHaveLocalMemberError(NTStatusValueError):
-    DESCRIPTION = """A global group cannot have a local group as a member."""
     NT_STATUS = NTStatusValue.STATUS_DS_GLOBAL_CANT_HAVE_LOCAL_MEMBER
 
 
 class StatusDsGlobalCantHaveUniversalMemberError(NTStatusValueError):
-    DESCRIPTION = """A global group cannot have a universal group as a member."""
     NT_STATUS = NTStatusValue.STATUS_DS_GLOBAL_CANT_HAVE_UNIVERSAL_MEMBER
 
 
 class StatusDsUniversalCantHaveLocalMemberError(NTStatusValueError):
-    DESCRIPTION = """A universal group cannot have a local group as a member."""
     NT_STATUS = NTStatusValue.STATUS_DS_UNIVERSAL_CANT_HAVE_LOCAL_MEMBER
 
 
 class StatusDsGlobalCantHaveCrossdomainMemberError(NTStatusValueError):
-    DESCRIPTION = """A global group cannot have a cross-domain member."""
     NT_STATUS = NTStatusValue.STATUS_DS_GLOBAL_CANT_HAVE_CROSSDOMAIN_MEMBER
 
 
 class StatusDsLocalCantHaveCrossdomainLocalMemberError(NTStatusValueError):
-    DESCRIPTION = """A local group cannot have another cross-domain local group as a member."""
     NT_STATUS = NTStatusValue.STATUS_DS_LOCAL_CANT_HAVE_CROSSDOMAIN_LOCAL_MEMBER
 
 
 class StatusDsHavePrimaryMembersError(NTStatusValueError):
-    DESCRIPTION = """Cannot change to a security-disabled group because primary members are in this group."""
     NT_STATUS = NTStatusValue.STATUS_DS_HAVE_PRIMARY_MEMBERS
 
 
 class StatusWmiNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The WMI operation is not supported by the data block or method."""
     NT_STATUS = NTStatusValue.STATUS_WMI_NOT_SUPPORTED
 
 
 class StatusInsufficientPowerError(NTStatusValueError):
-    DESCRIPTION = """There is not enough power to complete the requested operation."""
     NT_STATUS = NTStatusValue.STATUS_INSUFFICIENT_POWER
 
 
 class StatusSamNeedBootkeyPasswordError(NTStatusValueError):
-    DESCRIPTION = """The Security Accounts Manager needs to get the boot password."""
     NT_STATUS = NTStatusValue.STATUS_SAM_NEED_BOOTKEY_PASSWORD
 
 
 class StatusSamNeedBootkeyFloppyError(NTStatusValueError):
-    DESCRIPTION = """The Security Accounts Manager needs to get the boot key from the floppy disk."""
     NT_STATUS = NTStatusValue.STATUS_SAM_NEED_BOOTKEY_FLOPPY
 
 
 class StatusDsCantStartError(NTStatusValueError):
-    DESCRIPTION = """The directory service cannot start."""
     NT_STATUS = NTStatusValue.STATUS_DS_CANT_START
 
 
 class StatusDsInitFailureError(NTStatusValueError):
-    DESCRIPTION = """The directory service could not start because of the following error: %hs Error Status: 0x%x. Click OK to shut down this system and restart in Directory Services Restore Mode. Check the event log for more detailed information."""
     NT_STATUS = NTStatusValue.STATUS_DS_INIT_FAILURE
 
 
 class StatusSamInitFailureError(NTStatusValueError):
-    DESCRIPTION = """The Security Accounts Manager initialization failed because of the following error: %hs Error Status: 0x%x. Click OK to shut down this system and restart in Safe Mode. Check the event log for more detailed information."""
     NT_STATUS = NTStatusValue.STATUS_SAM_INIT_FAILURE
 
 
 class StatusDsGcRequiredError(NTStatusValueError):
-    DESCRIPTION = """The requested operation can be performed only on a global catalog server."""
     NT_STATUS = NTStatusValue.STATUS_DS_GC_REQUIRED
 
 
 class StatusDsLocalMemberOfLocalOnlyError(NTStatusValueError):
-    DESCRIPTION = """A local group can only be a member of other local groups in the same domain."""
     NT_STATUS = NTStatusValue.STATUS_DS_LOCAL_MEMBER_OF_LOCAL_ONLY
 
 
 class StatusDsNoFpoInUniversalGroupsError(NTStatusValueError):
-    DESCRIPTION = """Foreign security principals cannot be members of universal groups."""
     NT_STATUS = NTStatusValue.STATUS_DS_NO_FPO_IN_UNIVERSAL_GROUPS
 
 
 class StatusDsMachineAccountQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """Your computer could not be joined to the domain. You have exceeded the maximum number of computer accounts you are allowed to create in this domain. Contact your system administrator to have this limit reset or increased."""
     NT_STATUS = NTStatusValue.STATUS_DS_MACHINE_ACCOUNT_QUOTA_EXCEEDED
 
 
 class StatusCurrentDomainNotAllowedError(NTStatusValueError):
-    DESCRIPTION = """This operation cannot be performed on the current domain."""
     NT_STATUS = NTStatusValue.STATUS_CURRENT_DOMAIN_NOT_ALLOWED
 
 
 class StatusCannotMakeError(NTStatusValueError):
-    DESCRIPTION = """The directory or file cannot be created."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_MAKE
 
 
 class StatusSystemShutdownError(NTStatusValueError):
-    DESCRIPTION = """The system is in the process of shutting down."""
     NT_STATUS = NTStatusValue.STATUS_SYSTEM_SHUTDOWN
 
 
 class StatusDsInitFailureConsoleError(NTStatusValueError):
-    DESCRIPTION = """Directory Services could not start because of the following error: %hs Error Status: 0x%x. Click OK to shut down the system. You can use the recovery console to diagnose the system further."""
     NT_STATUS = NTStatusValue.STATUS_DS_INIT_FAILURE_CONSOLE
 
 
 class StatusDsSamInitFailureConsoleError(NTStatusValueError):
-    DESCRIPTION = """Security Accounts Manager initialization failed because of the following error: %hs Error Status: 0x%x. Click OK to shut down the system. You can use the recovery console to diagnose the system further."""
     NT_STATUS = NTStatusValue.STATUS_DS_SAM_INIT_FAILURE_CONSOLE
 
 
 class StatusUnfinishedContextDeletedError(NTStatusValueError):
-    DESCRIPTION = """A security context was deleted before the context was completed. This is considered a logon failure."""
     NT_STATUS = NTStatusValue.STATUS_UNFINISHED_CONTEXT_DELETED
 
 
 class StatusNoTgtReplyError(NTStatusValueError):
-    DESCRIPTION = """The client is trying to negotiate a context and the server requires user-to-user but did not send a TGT reply."""
     NT_STATUS = NTStatusValue.STATUS_NO_TGT_REPLY
 
 
 class StatusObjectidNotFoundError(NTStatusValueError):
-    DESCRIPTION = """An object ID was not found in the file."""
     NT_STATUS = NTStatusValue.STATUS_OBJECTID_NOT_FOUND
 
 
 class StatusNoIpAddressesError(NTStatusValueError):
-    DESCRIPTION = """Unable to accomplish the requested task because the local machine does not have any IP addresses."""
     NT_STATUS = NTStatusValue.STATUS_NO_IP_ADDRESSES
 
 
 class StatusWrongCredentialHandleError(NTStatusValueError):
-    DESCRIPTION = """The supplied credential handle does not match the credential that is associated with the security context."""
     NT_STATUS = NTStatusValue.STATUS_WRONG_CREDENTIAL_HANDLE
 
 
 class StatusCryptoSystemInvalidError(NTStatusValueError):
-    DESCRIPTION = """The crypto system or checksum function is invalid because a required function is unavailable."""
     NT_STATUS = NTStatusValue.STATUS_CRYPTO_SYSTEM_INVALID
 
 
 class StatusMaxReferralsExceededError(NTStatusValueError):
-    DESCRIPTION = """The number of maximum ticket referrals has been exceeded."""
     NT_STATUS = NTStatusValue.STATUS_MAX_REFERRALS_EXCEEDED
 
 
 class StatusMustBeKdcError(NTStatusValueError):
-    DESCRIPTION = """The local machine must be a Kerberos KDC (domain controller) and it is not."""
     NT_STATUS = NTStatusValue.STATUS_MUST_BE_KDC
 
 
 class StatusStrongCryptoNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The other end of the security negotiation requires strong crypto but it is not supported on the local machine."""
     NT_STATUS = NTStatusValue.STATUS_STRONG_CRYPTO_NOT_SUPPORTED
 
 
 class StatusTooManyPrincipalsError(NTStatusValueError):
-    DESCRIPTION = """The KDC reply contained more than one principal name."""
     NT_STATUS = NTStatusValue.STATUS_TOO_MANY_PRINCIPALS
 
 
 class StatusNoPaDataError(NTStatusValueError):
-    DESCRIPTION = """Expected to find PA data for a hint of what etype to use, but it was not found."""
     NT_STATUS = NTStatusValue.STATUS_NO_PA_DATA
 
 
 class StatusPkinitNameMismatchError(NTStatusValueError):
-    DESCRIPTION = """The client certificate does not contain a valid UPN, or does not match the client name in the logon request. Contact your administrator."""
     NT_STATUS = NTStatusValue.STATUS_PKINIT_NAME_MISMATCH
 
 
 class StatusSmartcardLogonRequiredError(NTStatusValueError):
-    DESCRIPTION = """Smart card logon is required and was not used."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_LOGON_REQUIRED
 
 
 class StatusKdcInvalidRequestError(NTStatusValueError):
-    DESCRIPTION = """An invalid request was sent to the KDC."""
     NT_STATUS = NTStatusValue.STATUS_KDC_INVALID_REQUEST
 
 
 class StatusKdcUnableToReferError(NTStatusValueError):
-    DESCRIPTION = """The KDC was unable to generate a referral for the service requested."""
     NT_STATUS = NTStatusValue.STATUS_KDC_UNABLE_TO_REFER
 
 
 class StatusKdcUnknownEtypeError(NTStatusValueError):
-    DESCRIPTION = """The encryption type requested is not supported by the KDC."""
     NT_STATUS = NTStatusValue.STATUS_KDC_UNKNOWN_ETYPE
 
 
 class StatusShutdownInProgressError(NTStatusValueError):
-    DESCRIPTION = """A system shutdown is in progress."""
     NT_STATUS = NTStatusValue.STATUS_SHUTDOWN_IN_PROGRESS
 
 
 class StatusServerShutdownInProgressError(NTStatusValueError):
-    DESCRIPTION = """The server machine is shutting down."""
     NT_STATUS = NTStatusValue.STATUS_SERVER_SHUTDOWN_IN_PROGRESS
 
 
 class StatusNotSupportedOnSbsError(NTStatusValueError):
-    DESCRIPTION = """This operation is not supported on a computer running Windows Server 2003 operating system for Small Business Server."""
     NT_STATUS = NTStatusValue.STATUS_NOT_SUPPORTED_ON_SBS
 
 
 class StatusWmiGuidDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """The WMI GUID is no longer available."""
     NT_STATUS = NTStatusValue.STATUS_WMI_GUID_DISCONNECTED
 
 
 class StatusWmiAlreadyDisabledError(NTStatusValueError):
-    DESCRIPTION = """Collection or events for the WMI GUID is already disabled."""
     NT_STATUS = NTStatusValue.STATUS_WMI_ALREADY_DISABLED
 
 
 class StatusWmiAlreadyEnabledError(NTStatusValueError):
-    DESCRIPTION = """Collection or events for the WMI GUID is already enabled."""
     NT_STATUS = NTStatusValue.STATUS_WMI_ALREADY_ENABLED
 
 
 class StatusMftTooFragmentedError(NTStatusValueError):
-    DESCRIPTION = """The master file table on the volume is too fragmented to complete this operation."""
     NT_STATUS = NTStatusValue.STATUS_MFT_TOO_FRAGMENTED
 
 
 class StatusCopyProtectionFailureError(NTStatusValueError):
-    DESCRIPTION = """Copy protection failure."""
     NT_STATUS = NTStatusValue.STATUS_COPY_PROTECTION_FAILURE
 
 
 class StatusCssAuthenticationFailureError(NTStatusValueError):
-    DESCRIPTION = """Copy protection error—DVD CSS Authentication failed."""
     NT_STATUS = NTStatusValue.STATUS_CSS_AUTHENTICATION_FAILURE
 
 
 class StatusCssKeyNotPresentError(NTStatusValueError):
-    DESCRIPTION = """Copy protection error—The specified sector does not contain a valid key."""
     NT_STATUS = NTStatusValue.STATUS_CSS_KEY_NOT_PRESENT
 
 
 class StatusCssKeyNotEstablishedError(NTStatusValueError):
-    DESCRIPTION = """Copy protection error—DVD session key not established."""
     NT_STATUS = NTStatusValue.STATUS_CSS_KEY_NOT_ESTABLISHED
 
 
 class StatusCssScrambledSectorError(NTStatusValueError):
-    DESCRIPTION = """Copy protection error—The read failed because the sector is encrypted."""
     NT_STATUS = NTStatusValue.STATUS_CSS_SCRAMBLED_SECTOR
 
 
 class StatusCssRegionMismatchError(NTStatusValueError):
-    DESCRIPTION = """Copy protection error—The region of the specified DVD does not correspond to the region setting of the drive."""
     NT_STATUS = NTStatusValue.STATUS_CSS_REGION_MISMATCH
 
 
 class StatusCssResetsExhaustedError(NTStatusValueError):
-    DESCRIPTION = """Copy protection error—The region setting of the drive might be permanent."""
     NT_STATUS = NTStatusValue.STATUS_CSS_RESETS_EXHAUSTED
 
 
 class StatusPkinitFailureError(NTStatusValueError):
-    DESCRIPTION = """The Kerberos protocol encountered an error while validating the KDC certificate during smart card logon. There is more information in the system event log."""
     NT_STATUS = NTStatusValue.STATUS_PKINIT_FAILURE
 
 
 class StatusSmartcardSubsystemFailureError(NTStatusValueError):
-    DESCRIPTION = """The Kerberos protocol encountered an error while attempting to use the smart card subsystem."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_SUBSYSTEM_FAILURE
 
 
 class StatusNoKerbKeyError(NTStatusValueError):
-    DESCRIPTION = """The target server does not have acceptable Kerberos credentials."""
     NT_STATUS = NTStatusValue.STATUS_NO_KERB_KEY
 
 
 class StatusHostDownError(NTStatusValueError):
-    DESCRIPTION = """The transport determined that the remote system is down."""
     NT_STATUS = NTStatusValue.STATUS_HOST_DOWN
 
 
 class StatusUnsupportedPreauthError(NTStatusValueError):
-    DESCRIPTION = """An unsupported pre-authentication mechanism was presented to the Kerberos package."""
     NT_STATUS = NTStatusValue.STATUS_UNSUPPORTED_PREAUTH
 
 
 class StatusEfsAlgBlobTooBigError(NTStatusValueError):
-    DESCRIPTION = """The encryption algorithm that is used on the source file needs a bigger key buffer than the one that is used on the destination file."""
     NT_STATUS = NTStatusValue.STATUS_EFS_ALG_BLOB_TOO_BIG
 
 
 class StatusPortNotSetError(NTStatusValueError):
-    DESCRIPTION = """An attempt to remove a processes DebugPort was made, but a port was not already associated with the process."""
     NT_STATUS = NTStatusValue.STATUS_PORT_NOT_SET
 
 
 class StatusDebuggerInactiveError(NTStatusValueError):
-    DESCRIPTION = """An attempt to do an operation on a debug port failed because the port is in the process of being deleted."""
     NT_STATUS = NTStatusValue.STATUS_DEBUGGER_INACTIVE
 
 
 class StatusDsVersionCheckFailureError(NTStatusValueError):
-    DESCRIPTION = """This version of Windows is not compatible with the behavior version of the directory forest, domain, or domain controller."""
     NT_STATUS = NTStatusValue.STATUS_DS_VERSION_CHECK_FAILURE
 
 
 class StatusAuditingDisabledError(NTStatusValueError):
-    DESCRIPTION = """The specified event is currently not being audited."""
     NT_STATUS = NTStatusValue.STATUS_AUDITING_DISABLED
 
 
 class StatusPrent4MachineAccountError(NTStatusValueError):
-    DESCRIPTION = """The machine account was created prior to Windows NT 4.0 operating system. The account needs to be recreated."""
     NT_STATUS = NTStatusValue.STATUS_PRENT4_MACHINE_ACCOUNT
 
 
 class StatusDsAgCantHaveUniversalMemberError(NTStatusValueError):
-    DESCRIPTION = """An account group cannot have a universal group as a member."""
     NT_STATUS = NTStatusValue.STATUS_DS_AG_CANT_HAVE_UNIVERSAL_MEMBER
 
 
 class StatusInvalidImageWin32Error(NTStatusValueError):
-    DESCRIPTION = """The specified image file did not have the correct format; it appears to be a 32-bit Windows image."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_WIN_32
 
 
 class StatusInvalidImageWin64Error(NTStatusValueError):
-    DESCRIPTION = """The specified image file did not have the correct format; it appears to be a 64-bit Windows image."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_WIN_64
 
 
 class StatusBadBindingsError(NTStatusValueError):
-    DESCRIPTION = """The client's supplied SSPI channel bindings were incorrect."""
     NT_STATUS = NTStatusValue.STATUS_BAD_BINDINGS
 
 
 class StatusNetworkSessionExpiredError(NTStatusValueError):
-    DESCRIPTION = """The client session has expired; so the client must re-authenticate to continue accessing the remote resources."""
     NT_STATUS = NTStatusValue.STATUS_NETWORK_SESSION_EXPIRED
 
 
 class StatusApphelpBlockError(NTStatusValueError):
-    DESCRIPTION = """The AppHelp dialog box canceled; thus preventing the application from starting."""
     NT_STATUS = NTStatusValue.STATUS_APPHELP_BLOCK
 
 
 class StatusAllSidsFilteredError(NTStatusValueError):
-    DESCRIPTION = """The SID filtering operation removed all SIDs."""
     NT_STATUS = NTStatusValue.STATUS_ALL_SIDS_FILTERED
 
 
 class StatusNotSafeModeDriverError(NTStatusValueError):
-    DESCRIPTION = """The driver was not loaded because the system is starting in safe mode."""
     NT_STATUS = NTStatusValue.STATUS_NOT_SAFE_MODE_DRIVER
 
 
 class StatusAccessDisabledByPolicyDefaultError(NTStatusValueError):
-    DESCRIPTION = """Access to %1 has been restricted by your Administrator by the default software restriction policy level."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_DISABLED_BY_POLICY_DEFAULT
 
 
 class StatusAccessDisabledByPolicyPathError(NTStatusValueError):
-    DESCRIPTION = """Access to %1 has been restricted by your Administrator by location with policy rule %2 placed on path %3."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_DISABLED_BY_POLICY_PATH
 
 
 class StatusAccessDisabledByPolicyPublisherError(NTStatusValueError):
-    DESCRIPTION = """Access to %1 has been restricted by your Administrator by software publisher policy."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_DISABLED_BY_POLICY_PUBLISHER
 
 
 class StatusAccessDisabledByPolicyOtherError(NTStatusValueError):
-    DESCRIPTION = """Access to %1 has been restricted by your Administrator by policy rule %2."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_DISABLED_BY_POLICY_OTHER
 
 
 class StatusFailedDriverEntryError(NTStatusValueError):
-    DESCRIPTION = """The driver was not loaded because it failed its initialization call."""
     NT_STATUS = NTStatusValue.STATUS_FAILED_DRIVER_ENTRY
 
 
 class StatusDeviceEnumerationErrorError(NTStatusValueError):
-    DESCRIPTION = """The device encountered an error while applying power or reading the device configuration. This might be caused by a failure of your hardware or by a poor connection."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_ENUMERATION_ERROR
 
 
 class StatusMountPointNotResolvedError(NTStatusValueError):
-    DESCRIPTION = """The create operation failed because the name contained at least one mount point that resolves to a volume to which the specified device object is not attached."""
     NT_STATUS = NTStatusValue.STATUS_MOUNT_POINT_NOT_RESOLVED
 
 
 class StatusInvalidDeviceObjectParameterError(NTStatusValueError):
-    DESCRIPTION = """The device object parameter is either not a valid device object or is not attached to the volume that is specified by the file name."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_DEVICE_OBJECT_PARAMETER
 
 
 class StatusMcaOccuredError(NTStatusValueError):
-    DESCRIPTION = """A machine check error has occurred. Check the system event log for additional information."""
     NT_STATUS = NTStatusValue.STATUS_MCA_OCCURED
 
 
 class StatusDriverBlockedCriticalError(NTStatusValueError):
-    DESCRIPTION = """Driver %2 has been blocked from loading."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_BLOCKED_CRITICAL
 
 
 class StatusDriverBlockedError(NTStatusValueError):
-    DESCRIPTION = """Driver %2 has been blocked from loading."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_BLOCKED
 
 
 class StatusDriverDatabaseErrorError(NTStatusValueError):
-    DESCRIPTION = """There was error [%2] processing the driver database."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_DATABASE_ERROR
 
 
 class StatusSystemHiveTooLargeError(NTStatusValueError):
-    DESCRIPTION = """System hive size has exceeded its limit."""
     NT_STATUS = NTStatusValue.STATUS_SYSTEM_HIVE_TOO_LARGE
 
 
 class StatusInvalidImportOfNonDllError(NTStatusValueError):
-    DESCRIPTION = """A dynamic link library (DLL) referenced a module that was neither a DLL nor the process's executable image."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMPORT_OF_NON_DLL
 
 
 class StatusNoSecretsError(NTStatusValueError):
-    DESCRIPTION = """The local account store does not contain secret material for the specified account."""
     NT_STATUS = NTStatusValue.STATUS_NO_SECRETS
 
 
 class StatusAccessDisabledNoSaferUiByPolicyError(NTStatusValueError):
-    DESCRIPTION = """Access to %1 has been restricted by your Administrator by policy rule %2."""
     NT_STATUS = NTStatusValue.STATUS_ACCESS_DISABLED_NO_SAFER_UI_BY_POLICY
 
 
 class StatusFailedStackSwitchError(NTStatusValueError):
-    DESCRIPTION = """The system was not able to allocate enough memory to perform a stack switch."""
     NT_STATUS = NTStatusValue.STATUS_FAILED_STACK_SWITCH
 
 
 class StatusHeapCorruptionError(NTStatusValueError):
-    DESCRIPTION = """A heap has been corrupted."""
     NT_STATUS = NTStatusValue.STATUS_HEAP_CORRUPTION
 
 
 class StatusSmartcardWrongPinError(NTStatusValueError):
-    DESCRIPTION = """An incorrect PIN was presented to the smart card."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_WRONG_PIN
 
 
 class StatusSmartcardCardBlockedError(NTStatusValueError):
-    DESCRIPTION = """The smart card is blocked."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_CARD_BLOCKED
 
 
 class StatusSmartcardCardNotAuthenticatedError(NTStatusValueError):
-    DESCRIPTION = """No PIN was presented to the smart card."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_CARD_NOT_AUTHENTICATED
 
 
 class StatusSmartcardNoCardError(NTStatusValueError):
-    DESCRIPTION = """No smart card is available."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_NO_CARD
 
 
 class StatusSmartcardNoKeyContainerError(NTStatusValueError):
-    DESCRIPTION = """The requested key container does not exist on the smart card."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_NO_KEY_CONTAINER
 
 
 class StatusSmartcardNoCertificateError(NTStatusValueError):
-    DESCRIPTION = """The requested certificate does not exist on the smart card."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_NO_CERTIFICATE
 
 
 class StatusSmartcardNoKeysetError(NTStatusValueError):
-    DESCRIPTION = """The requested keyset does not exist."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_NO_KEYSET
 
 
 class StatusSmartcardIoErrorError(NTStatusValueError):
-    DESCRIPTION = """A communication error with the smart card has been detected."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_IO_ERROR
 
 
 class StatusDowngradeDetectedError(NTStatusValueError):
-    DESCRIPTION = """The system detected a possible attempt to compromise security. Ensure that you can contact the server that authenticated you."""
     NT_STATUS = NTStatusValue.STATUS_DOWNGRADE_DETECTED
 
 
 class StatusSmartcardCertRevokedError(NTStatusValueError):
-    DESCRIPTION = """The smart card certificate used for authentication has been revoked. Contact your system administrator. There might be additional information in the event log."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_CERT_REVOKED
 
 
 class StatusIssuingCaUntrustedError(NTStatusValueError):
-    DESCRIPTION = """An untrusted certificate authority was detected while processing the smart card certificate that is used for authentication. Contact your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_ISSUING_CA_UNTRUSTED
 
 
 class StatusRevocationOfflineCError(NTStatusValueError):
-    DESCRIPTION = """The revocation status of the smart card certificate that is used for authentication could not be determined. Contact your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_REVOCATION_OFFLINE_C
 
 
 class StatusPkinitClientFailureError(NTStatusValueError):
-    DESCRIPTION = """The smart card certificate used for authentication was not trusted. Contact your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_PKINIT_CLIENT_FAILURE
 
 
 class StatusSmartcardCertExpiredError(NTStatusValueError):
-    DESCRIPTION = """The smart card certificate used for authentication has expired. Contact your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_CERT_EXPIRED
 
 
 class StatusDriverFailedPriorUnloadError(NTStatusValueError):
-    DESCRIPTION = """The driver could not be loaded because a previous version of the driver is still in memory."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_FAILED_PRIOR_UNLOAD
 
 
 class StatusSmartcardSilentContextError(NTStatusValueError):
-    DESCRIPTION = """The smart card provider could not perform the action because the context was acquired as silent."""
     NT_STATUS = NTStatusValue.STATUS_SMARTCARD_SILENT_CONTEXT
 
 
 class StatusPerUserTrustQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """The delegated trust creation quota of the current user has been exceeded."""
     NT_STATUS = NTStatusValue.STATUS_PER_USER_TRUST_QUOTA_EXCEEDED
 
 
 class StatusAllUserTrustQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """The total delegated trust creation quota has been exceeded."""
     NT_STATUS = NTStatusValue.STATUS_ALL_USER_TRUST_QUOTA_EXCEEDED
 
 
 class StatusUserDeleteTrustQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """The delegated trust deletion quota of the current user has been exceeded."""
     NT_STATUS = NTStatusValue.STATUS_USER_DELETE_TRUST_QUOTA_EXCEEDED
 
 
 class StatusDsNameNotUniqueError(NTStatusValueError):
-    DESCRIPTION = """The requested name already exists as a unique identifier."""
     NT_STATUS = NTStatusValue.STATUS_DS_NAME_NOT_UNIQUE
 
 
 class StatusDsDuplicateIdFoundError(NTStatusValueError):
-    DESCRIPTION = """The requested object has a non-unique identifier and cannot be retrieved."""
     NT_STATUS = NTStatusValue.STATUS_DS_DUPLICATE_ID_FOUND
 
 
 class StatusDsGroupConversionErrorError(NTStatusValueError):
-    DESCRIPTION = """The group cannot be converted due to attribute restrictions on the requested group type."""
     NT_STATUS = NTStatusValue.STATUS_DS_GROUP_CONVERSION_ERROR
 
 
 class StatusVolsnapPrepareHibernateError(NTStatusValueError):
-    DESCRIPTION = """{Volume Shadow Copy Service} Wait while the Volume Shadow Copy Service prepares volume %hs for hibernation."""
     NT_STATUS = NTStatusValue.STATUS_VOLSNAP_PREPARE_HIBERNATE
 
 
 class StatusUser2userRequiredError(NTStatusValueError):
-    DESCRIPTION = """Kerberos sub-protocol User2User is required."""
     NT_STATUS = NTStatusValue.STATUS_USER2USER_REQUIRED
 
 
 class StatusStackBufferOverrunError(NTStatusValueError):
-    DESCRIPTION = """The system detected an overrun of a stack-based buffer in this application. This overrun could potentially allow a malicious user to gain control of this application."""
     NT_STATUS = NTStatusValue.STATUS_STACK_BUFFER_OVERRUN
 
 
 class StatusNoS4uProtSupportError(NTStatusValueError):
-    DESCRIPTION = """The Kerberos subsystem encountered an error. A service for user protocol request was made against a domain controller which does not support service for user."""
     NT_STATUS = NTStatusValue.STATUS_NO_S4U_PROT_SUPPORT
 
 
 class StatusCrossrealmDelegationFailureError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made by this server to make a Kerberos constrained delegation request for a target that is outside the server realm. This action is not supported and the resulting error indicates a misconfiguration on the allowed-to-delegate-to list for this server. Contact your administrator."""
     NT_STATUS = NTStatusValue.STATUS_CROSSREALM_DELEGATION_FAILURE
 
 
 class StatusRevocationOfflineKdcError(NTStatusValueError):
-    DESCRIPTION = """The revocation status of the domain controller certificate used for smart card authentication could not be determined. There is additional information in the system event log. Contact your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_REVOCATION_OFFLINE_KDC
 
 
 class StatusIssuingCaUntrustedKdcError(NTStatusValueError):
-    DESCRIPTION = """An untrusted certificate authority was detected while processing the domain controller certificate used for authentication. There is additional information in the system event log. Contact your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_ISSUING_CA_UNTRUSTED_KDC
 
 
 class StatusKdcCertExpiredError(NTStatusValueError):
-    DESCRIPTION = """The domain controller certificate used for smart card logon has expired. Contact your system administrator with the contents of your system event log."""
     NT_STATUS = NTStatusValue.STATUS_KDC_CERT_EXPIRED
 
 
 class StatusKdcCertRevokedError(NTStatusValueError):
-    DESCRIPTION = """The domain controller certificate used for smart card logon has been revoked. Contact your system administrator with the contents of your system event log."""
     NT_STATUS = NTStatusValue.STATUS_KDC_CERT_REVOKED
 
 
 class StatusParameterQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """Data present in one of the parameters is more than the function can operate on."""
     NT_STATUS = NTStatusValue.STATUS_PARAMETER_QUOTA_EXCEEDED
 
 
 class StatusHibernationFailureError(NTStatusValueError):
-    DESCRIPTION = """The system has failed to hibernate (The error code is %hs). Hibernation will be disabled until the system is restarted."""
     NT_STATUS = NTStatusValue.STATUS_HIBERNATION_FAILURE
 
 
 class StatusDelayLoadFailedError(NTStatusValueError):
-    DESCRIPTION = """An attempt to delay-load a .dll or get a function address in a delay-loaded .dll failed."""
     NT_STATUS = NTStatusValue.STATUS_DELAY_LOAD_FAILED
 
 
 class StatusAuthenticationFirewallFailedError(NTStatusValueError):
-    DESCRIPTION = """Logon Failure: The machine you are logging onto is protected by an authentication firewall. The specified account is not allowed to authenticate to the machine."""
     NT_STATUS = NTStatusValue.STATUS_AUTHENTICATION_FIREWALL_FAILED
 
 
 class StatusVdmDisallowedError(NTStatusValueError):
-    DESCRIPTION = """%hs is a 16-bit application. You do not have permissions to execute 16-bit applications. Check your permissions with your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_VDM_DISALLOWED
 
 
 class StatusHungDisplayDriverThreadError(NTStatusValueError):
-    DESCRIPTION = """{Display Driver Stopped Responding} The %hs display driver has stopped working normally. Save your work and reboot the system to restore full display functionality. The next time you reboot the machine a dialog will be displayed giving you a chance to report this failure to Microsoft."""
     NT_STATUS = NTStatusValue.STATUS_HUNG_DISPLAY_DRIVER_THREAD
 
 
 class StatusInsufficientResourceForSpecifiedSharedSectionSizeError(NTStatusValueError):
-    DESCRIPTION = """The Desktop heap encountered an error while allocating session memory. There is more information in the system event log."""
     NT_STATUS = NTStatusValue.STATUS_INSUFFICIENT_RESOURCE_FOR_SPECIFIED_SHARED_SECTION_SIZE
 
 
 class StatusInvalidCruntimeParameterError(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was passed to a C runtime function."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_CRUNTIME_PARAMETER
 
 
 class StatusNtlmBlockedError(NTStatusValueError):
-    DESCRIPTION = """The authentication failed because NTLM was blocked."""
     NT_STATUS = NTStatusValue.STATUS_NTLM_BLOCKED
 
 
 class StatusDsSrcSidExistsInForestError(NTStatusValueError):
-    DESCRIPTION = """The source object's SID already exists in destination forest."""
     NT_STATUS = NTStatusValue.STATUS_DS_SRC_SID_EXISTS_IN_FOREST
 
 
 class StatusDsDomainNameExistsInForestError(NTStatusValueError):
-    DESCRIPTION = """The domain name of the trusted domain already exists in the forest."""
     NT_STATUS = NTStatusValue.STATUS_DS_DOMAIN_NAME_EXISTS_IN_FOREST
 
 
 class StatusDsFlatNameExistsInForestError(NTStatusValueError):
-    DESCRIPTION = """The flat name of the trusted domain already exists in the forest."""
     NT_STATUS = NTStatusValue.STATUS_DS_FLAT_NAME_EXISTS_IN_FOREST
 
 
 class StatusInvalidUserPrincipalNameError(NTStatusValueError):
-    DESCRIPTION = """The User Principal Name (UPN) is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_USER_PRINCIPAL_NAME
 
 
 class StatusAssertionFailureError(NTStatusValueError):
-    DESCRIPTION = """There has been an assertion failure."""
     NT_STATUS = NTStatusValue.STATUS_ASSERTION_FAILURE
 
 
 class StatusVerifierStopError(NTStatusValueError):
-    DESCRIPTION = """Application verifier has found an error in the current process."""
     NT_STATUS = NTStatusValue.STATUS_VERIFIER_STOP
 
 
 class StatusCallbackPopStackError(NTStatusValueError):
-    DESCRIPTION = """A user mode unwind is in progress."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_POP_STACK
 
 
 class StatusIncompatibleDriverBlockedError(NTStatusValueError):
-    DESCRIPTION = """%2 has been blocked from loading due to incompatibility with this system. Contact your software vendor for a compatible version of the driver."""
     NT_STATUS = NTStatusValue.STATUS_INCOMPATIBLE_DRIVER_BLOCKED
 
 
 class StatusHiveUnloadedError(NTStatusValueError):
-    DESCRIPTION = """Illegal operation attempted on a registry key which has already been unloaded."""
     NT_STATUS = NTStatusValue.STATUS_HIVE_UNLOADED
 
 
 class StatusCompressionDisabledError(NTStatusValueError):
-    DESCRIPTION = """Compression is disabled for this volume."""
     NT_STATUS = NTStatusValue.STATUS_COMPRESSION_DISABLED
 
 
 class StatusFileSystemLimitationError(NTStatusValueError):
-    DESCRIPTION = """The requested operation could not be completed due to a file system limitation."""
     NT_STATUS = NTStatusValue.STATUS_FILE_SYSTEM_LIMITATION
 
 
 class StatusInvalidImageHashError(NTStatusValueError):
-    DESCRIPTION = """The hash for image %hs cannot be found in the system catalogs. The image is likely corrupt or the victim of tampering."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IMAGE_HASH
 
 
 class StatusNotCapableError(NTStatusValueError):
-    DESCRIPTION = """The implementation is not capable of performing the request."""
     NT_STATUS = NTStatusValue.STATUS_NOT_CAPABLE
 
 
 class StatusRequestOutOfSequenceError(NTStatusValueError):
-    DESCRIPTION = """The requested operation is out of order with respect to other operations."""
     NT_STATUS = NTStatusValue.STATUS_REQUEST_OUT_OF_SEQUENCE
 
 
 class StatusImplementationLimitError(NTStatusValueError):
-    DESCRIPTION = """An operation attempted to exceed an implementation-defined limit."""
     NT_STATUS = NTStatusValue.STATUS_IMPLEMENTATION_LIMIT
 
 
 class StatusElevationRequiredError(NTStatusValueError):
-    DESCRIPTION = """The requested operation requires elevation."""
     NT_STATUS = NTStatusValue.STATUS_ELEVATION_REQUIRED
 
 
 class StatusNoSecurityContextError(NTStatusValueError):
-    DESCRIPTION = """The required security context does not exist."""
     NT_STATUS = NTStatusValue.STATUS_NO_SECURITY_CONTEXT
 
 
 class StatusPku2uCertFailureError(NTStatusValueError):
-    DESCRIPTION = """The PKU2U protocol encountered an error while attempting to utilize the associated certificates."""
     NT_STATUS = NTStatusValue.STATUS_PKU2U_CERT_FAILURE
 
 
 class StatusBeyondVdlError(NTStatusValueError):
-    DESCRIPTION = """The operation was attempted beyond the valid data length of the file."""
     NT_STATUS = NTStatusValue.STATUS_BEYOND_VDL
 
 
 class StatusEncounteredWriteInProgressError(NTStatusValueError):
-    DESCRIPTION = """The attempted write operation encountered a write already in progress for some portion of the range."""
     NT_STATUS = NTStatusValue.STATUS_ENCOUNTERED_WRITE_IN_PROGRESS
 
 
 class StatusPteChangedError(NTStatusValueError):
-    DESCRIPTION = """The page fault mappings changed in the middle of processing a fault so the operation must be retried."""
     NT_STATUS = NTStatusValue.STATUS_PTE_CHANGED
 
 
 class StatusPurgeFailedError(NTStatusValueError):
-    DESCRIPTION = """The attempt to purge this file from memory failed to purge some or all the data from memory."""
     NT_STATUS = NTStatusValue.STATUS_PURGE_FAILED
 
 
 class StatusCredRequiresConfirmationError(NTStatusValueError):
-    DESCRIPTION = """The requested credential requires confirmation."""
     NT_STATUS = NTStatusValue.STATUS_CRED_REQUIRES_CONFIRMATION
 
 
 class StatusCsEncryptionInvalidServerResponseError(NTStatusValueError):
-    DESCRIPTION = """The remote server sent an invalid response for a file being opened with Client Side Encryption."""
     NT_STATUS = NTStatusValue.STATUS_CS_ENCRYPTION_INVALID_SERVER_RESPONSE
 
 
 class StatusCsEncryptionUnsupportedServerError(NTStatusValueError):
-    DESCRIPTION = """Client Side Encryption is not supported by the remote server even though it claims to support it."""
     NT_STATUS = NTStatusValue.STATUS_CS_ENCRYPTION_UNSUPPORTED_SERVER
 
 
 class StatusCsEncryptionExistingEncryptedFileError(NTStatusValueError):
-    DESCRIPTION = """File is encrypted and should be opened in Client Side Encryption mode."""
     NT_STATUS = NTStatusValue.STATUS_CS_ENCRYPTION_EXISTING_ENCRYPTED_FILE
 
 
 class StatusCsEncryptionNewEncryptedFileError(NTStatusValueError):
-    DESCRIPTION = """A new encrypted file is being created and a $EFS needs to be provided."""
     NT_STATUS = NTStatusValue.STATUS_CS_ENCRYPTION_NEW_ENCRYPTED_FILE
 
 
 class StatusCsEncryptionFileNotCseError(NTStatusValueError):
-    DESCRIPTION = """The SMB client requested a CSE FSCTL on a non-CSE file."""
     NT_STATUS = NTStatusValue.STATUS_CS_ENCRYPTION_FILE_NOT_CSE
 
 
 class StatusInvalidLabelError(NTStatusValueError):
-    DESCRIPTION = """Indicates a particular Security ID cannot be assigned as the label of an object."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_LABEL
 
 
 class StatusDriverProcessTerminatedError(NTStatusValueError):
-    DESCRIPTION = """The process hosting the driver for this device has terminated."""
     NT_STATUS = NTStatusValue.STATUS_DRIVER_PROCESS_TERMINATED
 
 
 class StatusAmbiguousSystemDeviceError(NTStatusValueError):
-    DESCRIPTION = """The requested system device cannot be identified due to multiple indistinguishable devices potentially matching the identification criteria."""
     NT_STATUS = NTStatusValue.STATUS_AMBIGUOUS_SYSTEM_DEVICE
 
 
 class StatusSystemDeviceNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The requested system device cannot be found."""
     NT_STATUS = NTStatusValue.STATUS_SYSTEM_DEVICE_NOT_FOUND
 
 
 class StatusRestartBootApplicationError(NTStatusValueError):
-    DESCRIPTION = """This boot application must be restarted."""
     NT_STATUS = NTStatusValue.STATUS_RESTART_BOOT_APPLICATION
 
 
 class StatusInsufficientNvramResourcesError(NTStatusValueError):
-    DESCRIPTION = """Insufficient NVRAM resources exist to complete the API.  A reboot might be required."""
     NT_STATUS = NTStatusValue.STATUS_INSUFFICIENT_NVRAM_RESOURCES
 
 
 class StatusNoRangesProcessedError(NTStatusValueError):
-    DESCRIPTION = """No ranges for the specified operation were able to be processed."""
     NT_STATUS = NTStatusValue.STATUS_NO_RANGES_PROCESSED
 
 
 class StatusDeviceFeatureNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The storage device does not support Offload Write."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_FEATURE_NOT_SUPPORTED
 
 
 class StatusDeviceUnreachableError(NTStatusValueError):
-    DESCRIPTION = """Data cannot be moved because the source device cannot communicate with the destination device."""
     NT_STATUS = NTStatusValue.STATUS_DEVICE_UNREACHABLE
 
 
 class StatusInvalidTokenError(NTStatusValueError):
-    DESCRIPTION = """The token representing the data is invalid or expired."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_TOKEN
 
 
 class StatusServerUnavailableError(NTStatusValueError):
-    DESCRIPTION = """The file server is temporarily unavailable."""
     NT_STATUS = NTStatusValue.STATUS_SERVER_UNAVAILABLE
 
 
 class StatusInvalidTaskNameError(NTStatusValueError):
-    DESCRIPTION = """The specified task name is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_TASK_NAME
 
 
 class StatusInvalidTaskIndexError(NTStatusValueError):
-    DESCRIPTION = """The specified task index is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_TASK_INDEX
 
 
 class StatusThreadAlreadyInTaskError(NTStatusValueError):
-    DESCRIPTION = """The specified thread is already joining a task."""
     NT_STATUS = NTStatusValue.STATUS_THREAD_ALREADY_IN_TASK
 
 
 class StatusCallbackBypassError(NTStatusValueError):
-    DESCRIPTION = """A callback has requested to bypass native code."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_BYPASS
 
 
 class StatusFailFastExceptionError(NTStatusValueError):
-    DESCRIPTION = """A fail fast exception occurred. Exception handlers will not be invoked and the process will be terminated immediately."""
     NT_STATUS = NTStatusValue.STATUS_FAIL_FAST_EXCEPTION
 
 
 class StatusImageCertRevokedError(NTStatusValueError):
-    DESCRIPTION = """Windows cannot verify the digital signature for this file. The signing certificate for this file has been revoked."""
     NT_STATUS = NTStatusValue.STATUS_IMAGE_CERT_REVOKED
 
 
 class StatusPortClosedError(NTStatusValueError):
-    DESCRIPTION = """The ALPC port is closed."""
     NT_STATUS = NTStatusValue.STATUS_PORT_CLOSED
 
 
 class StatusMessageLostError(NTStatusValueError):
-    DESCRIPTION = """The ALPC message requested is no longer available."""
     NT_STATUS = NTStatusValue.STATUS_MESSAGE_LOST
 
 
 class StatusInvalidMessageError(NTStatusValueError):
-    DESCRIPTION = """The ALPC message supplied is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_MESSAGE
 
 
 class StatusRequestCanceledError(NTStatusValueError):
-    DESCRIPTION = """The ALPC message has been canceled."""
     NT_STATUS = NTStatusValue.STATUS_REQUEST_CANCELED
 
 
 class StatusRecursiveDispatchError(NTStatusValueError):
-    DESCRIPTION = """Invalid recursive dispatch attempt."""
     NT_STATUS = NTStatusValue.STATUS_RECURSIVE_DISPATCH
 
 
 class StatusLpcReceiveBufferExpectedError(NTStatusValueError):
-    DESCRIPTION = """No receive buffer has been supplied in a synchronous request."""
     NT_STATUS = NTStatusValue.STATUS_LPC_RECEIVE_BUFFER_EXPECTED
 
 
 class StatusLpcInvalidConnectionUsageError(NTStatusValueError):
-    DESCRIPTION = """The connection port is used in an invalid context."""
     NT_STATUS = NTStatusValue.STATUS_LPC_INVALID_CONNECTION_USAGE
 
 
 class StatusLpcRequestsNotAllowedError(NTStatusValueError):
-    DESCRIPTION = """The ALPC port does not accept new request messages."""
     NT_STATUS = NTStatusValue.STATUS_LPC_REQUESTS_NOT_ALLOWED
 
 
 class StatusResourceInUseError(NTStatusValueError):
-    DESCRIPTION = """The resource requested is already in use."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_IN_USE
 
 
 class StatusHardwareMemoryErrorError(NTStatusValueError):
-    DESCRIPTION = """The hardware has reported an uncorrectable memory error."""
     NT_STATUS = NTStatusValue.STATUS_HARDWARE_MEMORY_ERROR
 
 
 class StatusThreadpoolHandleExceptionError(NTStatusValueError):
-    DESCRIPTION = """Status 0x%08x was returned, waiting on handle 0x%x for wait 0x%p, in waiter 0x%p."""
     NT_STATUS = NTStatusValue.STATUS_THREADPOOL_HANDLE_EXCEPTION
 
 
 class StatusThreadpoolSetEventOnCompletionFailedError(NTStatusValueError):
-    DESCRIPTION = """After a callback to 0x%p(0x%p), a completion call to Set event(0x%p) failed with status 0x%08x."""
     NT_STATUS = NTStatusValue.STATUS_THREADPOOL_SET_EVENT_ON_COMPLETION_FAILED
 
 
 class StatusThreadpoolReleaseSemaphoreOnCompletionFailedError(NTStatusValueError):
-    DESCRIPTION = """After a callback to 0x%p(0x%p), a completion call to ReleaseSemaphore(0x%p, %d) failed with status 0x%08x."""
     NT_STATUS = NTStatusValue.STATUS_THREADPOOL_RELEASE_SEMAPHORE_ON_COMPLETION_FAILED
 
 
 class StatusThreadpoolReleaseMutexOnCompletionFailedError(NTStatusValueError):
-    DESCRIPTION = """After a callback to 0x%p(0x%p), a completion call to ReleaseMutex(%p) failed with status 0x%08x."""
     NT_STATUS = NTStatusValue.STATUS_THREADPOOL_RELEASE_MUTEX_ON_COMPLETION_FAILED
 
 
 class StatusThreadpoolFreeLibraryOnCompletionFailedError(NTStatusValueError):
-    DESCRIPTION = """After a callback to 0x%p(0x%p), a completion call to FreeLibrary(%p) failed with status 0x%08x."""
     NT_STATUS = NTStatusValue.STATUS_THREADPOOL_FREE_LIBRARY_ON_COMPLETION_FAILED
 
 
 class StatusThreadpoolReleasedDuringOperationError(NTStatusValueError):
-    DESCRIPTION = """The thread pool 0x%p was released while a thread was posting a callback to 0x%p(0x%p) to it."""
     NT_STATUS = NTStatusValue.STATUS_THREADPOOL_RELEASED_DURING_OPERATION
 
 
 class StatusCallbackReturnedWhileImpersonatingError(NTStatusValueError):
-    DESCRIPTION = """A thread pool worker thread is impersonating a client, after a callback to 0x%p(0x%p). This is unexpected, indicating that the callback is missing a call to revert the impersonation."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_RETURNED_WHILE_IMPERSONATING
 
 
 class StatusApcReturnedWhileImpersonatingError(NTStatusValueError):
-    DESCRIPTION = """A thread pool worker thread is impersonating a client, after executing an APC. This is unexpected, indicating that the APC is missing a call to revert the impersonation."""
     NT_STATUS = NTStatusValue.STATUS_APC_RETURNED_WHILE_IMPERSONATING
 
 
 class StatusProcessIsProtectedError(NTStatusValueError):
-    DESCRIPTION = """Either the target process, or the target thread's containing process, is a protected process."""
     NT_STATUS = NTStatusValue.STATUS_PROCESS_IS_PROTECTED
 
 
 class StatusMcaExceptionError(NTStatusValueError):
-    DESCRIPTION = """A thread is getting dispatched with MCA EXCEPTION because of MCA."""
     NT_STATUS = NTStatusValue.STATUS_MCA_EXCEPTION
 
 
 class StatusCertificateMappingNotUniqueError(NTStatusValueError):
-    DESCRIPTION = """The client certificate account mapping is not unique."""
     NT_STATUS = NTStatusValue.STATUS_CERTIFICATE_MAPPING_NOT_UNIQUE
 
 
 class StatusSymlinkClassDisabledError(NTStatusValueError):
-    DESCRIPTION = """The symbolic link cannot be followed because its type is disabled."""
     NT_STATUS = NTStatusValue.STATUS_SYMLINK_CLASS_DISABLED
 
 
 class StatusInvalidIdnNormalizationError(NTStatusValueError):
-    DESCRIPTION = """Indicates that the specified string is not valid for IDN normalization."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_IDN_NORMALIZATION
 
 
 class StatusNoUnicodeTranslationError(NTStatusValueError):
-    DESCRIPTION = """No mapping for the Unicode character exists in the target multi-byte code page."""
     NT_STATUS = NTStatusValue.STATUS_NO_UNICODE_TRANSLATION
 
 
 class StatusAlreadyRegisteredError(NTStatusValueError):
-    DESCRIPTION = """The provided callback is already registered."""
     NT_STATUS = NTStatusValue.STATUS_ALREADY_REGISTERED
 
 
 class StatusContextMismatchError(NTStatusValueError):
-    DESCRIPTION = """The provided context did not match the target."""
     NT_STATUS = NTStatusValue.STATUS_CONTEXT_MISMATCH
 
 
 class StatusPortAlreadyHasCompletionListError(NTStatusValueError):
-    DESCRIPTION = """The specified port already has a completion list."""
     NT_STATUS = NTStatusValue.STATUS_PORT_ALREADY_HAS_COMPLETION_LIST
 
 
 class StatusCallbackReturnedThreadPriorityError(NTStatusValueError):
-    DESCRIPTION = """A threadpool worker thread entered a callback at thread base priority 0x%x and exited at priority 0x%x.
-
-This is unexpected, indicating that the callback missed restoring the priority."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_RETURNED_THREAD_PRIORITY
 
 
 class StatusInvalidThreadError(NTStatusValueError):
-    DESCRIPTION = """An invalid thread, handle %p, is specified for this operation. Possibly, a threadpool worker thread was specified."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_THREAD
 
 
 class StatusCallbackReturnedTransactionError(NTStatusValueError):
-    DESCRIPTION = """A threadpool worker thread entered a callback, which left transaction state.
-
-This is unexpected, indicating that the callback missed clearing the transaction."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_RETURNED_TRANSACTION
 
 
 class StatusCallbackReturnedLdrLockError(NTStatusValueError):
-    DESCRIPTION = """A threadpool worker thread entered a callback, which left the loader lock held.
-
-This is unexpected, indicating that the callback missed releasing the lock."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_RETURNED_LDR_LOCK
 
 
 class StatusCallbackReturnedLangError(NTStatusValueError):
-    DESCRIPTION = """A threadpool worker thread entered a callback, which left with preferred languages set.
-
-This is unexpected, indicating that the callback missed clearing them."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_RETURNED_LANG
 
 
 class StatusCallbackReturnedPriBackError(NTStatusValueError):
-    DESCRIPTION = """A threadpool worker thread entered a callback, which left with background priorities set.
-
-This is unexpected, indicating that the callback missed restoring the original priorities."""
     NT_STATUS = NTStatusValue.STATUS_CALLBACK_RETURNED_PRI_BACK
 
 
 class StatusDiskRepairDisabledError(NTStatusValueError):
-    DESCRIPTION = """The attempted operation required self healing to be enabled."""
     NT_STATUS = NTStatusValue.STATUS_DISK_REPAIR_DISABLED
 
 
 class StatusDsDomainRenameInProgressError(NTStatusValueError):
-    DESCRIPTION = """The directory service cannot perform the requested operation because a domain rename operation is in progress."""
     NT_STATUS = NTStatusValue.STATUS_DS_DOMAIN_RENAME_IN_PROGRESS
 
 
 class StatusDiskQuotaExceededError(NTStatusValueError):
-    DESCRIPTION = """An operation failed because the storage quota was exceeded."""
     NT_STATUS = NTStatusValue.STATUS_DISK_QUOTA_EXCEEDED
 
 
 class StatusContentBlockedError(NTStatusValueError):
-    DESCRIPTION = """An operation failed because the content was blocked."""
     NT_STATUS = NTStatusValue.STATUS_CONTENT_BLOCKED
 
 
 class StatusBadClustersError(NTStatusValueError):
-    DESCRIPTION = """The operation could not be completed due to bad clusters on disk."""
     NT_STATUS = NTStatusValue.STATUS_BAD_CLUSTERS
 
 
 class StatusVolumeDirtyError(NTStatusValueError):
-    DESCRIPTION = """The operation could not be completed because the volume is dirty. Please run the Chkdsk utility and try again."""
     NT_STATUS = NTStatusValue.STATUS_VOLUME_DIRTY
 
 
 class StatusFileCheckedOutError(NTStatusValueError):
-    DESCRIPTION = """This file is checked out or locked for editing by another user."""
     NT_STATUS = NTStatusValue.STATUS_FILE_CHECKED_OUT
 
 
 class StatusCheckoutRequiredError(NTStatusValueError):
-    DESCRIPTION = """The file must be checked out before saving changes."""
     NT_STATUS = NTStatusValue.STATUS_CHECKOUT_REQUIRED
 
 
 class StatusBadFileTypeError(NTStatusValueError):
-    DESCRIPTION = """The file type being saved or retrieved has been blocked."""
     NT_STATUS = NTStatusValue.STATUS_BAD_FILE_TYPE
 
 
 class StatusFileTooLargeError(NTStatusValueError):
-    DESCRIPTION = """The file size exceeds the limit allowed and cannot be saved."""
     NT_STATUS = NTStatusValue.STATUS_FILE_TOO_LARGE
 
 
 class StatusFormsAuthRequiredError(NTStatusValueError):
-    DESCRIPTION = """Access Denied. Before opening files in this location, you must first browse to the e.g. site and select the option to log on automatically."""
     NT_STATUS = NTStatusValue.STATUS_FORMS_AUTH_REQUIRED
 
 
 class StatusVirusInfectedError(NTStatusValueError):
-    DESCRIPTION = """The operation did not complete successfully because the file contains a virus."""
     NT_STATUS = NTStatusValue.STATUS_VIRUS_INFECTED
 
 
 class StatusVirusDeletedError(NTStatusValueError):
-    DESCRIPTION = """This file contains a virus and cannot be opened. Due to the nature of this virus, the file has been removed from this location."""
     NT_STATUS = NTStatusValue.STATUS_VIRUS_DELETED
 
 
 class StatusBadMcfgTableError(NTStatusValueError):
-    DESCRIPTION = """The resources required for this device conflict with the MCFG table."""
     NT_STATUS = NTStatusValue.STATUS_BAD_MCFG_TABLE
 
 
 class StatusCannotBreakOplockError(NTStatusValueError):
-    DESCRIPTION = """The operation did not complete successfully because it would cause an oplock to be broken. The caller has requested that existing oplocks not be broken."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_BREAK_OPLOCK
 
 
 class StatusWowAssertionError(NTStatusValueError):
-    DESCRIPTION = """WOW Assertion Error."""
     NT_STATUS = NTStatusValue.STATUS_WOW_ASSERTION
 
 
 class StatusInvalidSignatureError(NTStatusValueError):
-    DESCRIPTION = """The cryptographic signature is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_SIGNATURE
 
 
 class StatusHmacNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The cryptographic provider does not support HMAC."""
     NT_STATUS = NTStatusValue.STATUS_HMAC_NOT_SUPPORTED
 
 
 class StatusIpsecQueueOverflowError(NTStatusValueError):
-    DESCRIPTION = """The IPsec queue overflowed."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_QUEUE_OVERFLOW
 
 
 class StatusNdQueueOverflowError(NTStatusValueError):
-    DESCRIPTION = """The neighbor discovery queue overflowed."""
     NT_STATUS = NTStatusValue.STATUS_ND_QUEUE_OVERFLOW
 
 
 class StatusHoplimitExceededError(NTStatusValueError):
-    DESCRIPTION = """An Internet Control Message Protocol (ICMP) hop limit exceeded error was received."""
     NT_STATUS = NTStatusValue.STATUS_HOPLIMIT_EXCEEDED
 
 
 class StatusProtocolNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The protocol is not installed on the local machine."""
     NT_STATUS = NTStatusValue.STATUS_PROTOCOL_NOT_SUPPORTED
 
 
 class StatusLostWritebehindDataNetworkDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs; the data has been lost. This error might be caused by network connectivity issues. Try to save this file elsewhere."""
     NT_STATUS = NTStatusValue.STATUS_LOST_WRITEBEHIND_DATA_NETWORK_DISCONNECTED
 
 
 class StatusLostWritebehindDataNetworkServerErrorError(NTStatusValueError):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs; the data has been lost. This error was returned by the server on which the file exists. Try to save this file elsewhere."""
     NT_STATUS = NTStatusValue.STATUS_LOST_WRITEBEHIND_DATA_NETWORK_SERVER_ERROR
 
 
 class StatusLostWritebehindDataLocalDiskErrorError(NTStatusValueError):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs; the data has been lost. This error might be caused if the device has been removed or the media is write-protected."""
     NT_STATUS = NTStatusValue.STATUS_LOST_WRITEBEHIND_DATA_LOCAL_DISK_ERROR
 
 
 class StatusXmlParseErrorError(NTStatusValueError):
-    DESCRIPTION = """Windows was unable to parse the requested XML data."""
     NT_STATUS = NTStatusValue.STATUS_XML_PARSE_ERROR
 
 
 class StatusXmldsigErrorError(NTStatusValueError):
-    DESCRIPTION = """An error was encountered while processing an XML digital signature."""
     NT_STATUS = NTStatusValue.STATUS_XMLDSIG_ERROR
 
 
 class StatusWrongCompartmentError(NTStatusValueError):
-    DESCRIPTION = """This indicates that the caller made the connection request in the wrong routing compartment."""
     NT_STATUS = NTStatusValue.STATUS_WRONG_COMPARTMENT
 
 
 class StatusAuthipFailureError(NTStatusValueError):
-    DESCRIPTION = """This indicates that there was an AuthIP failure when attempting to connect to the remote host."""
     NT_STATUS = NTStatusValue.STATUS_AUTHIP_FAILURE
 
 
 class StatusDsOidMappedGroupCantHaveMembersError(NTStatusValueError):
-    DESCRIPTION = """OID mapped groups cannot have members."""
     NT_STATUS = NTStatusValue.STATUS_DS_OID_MAPPED_GROUP_CANT_HAVE_MEMBERS
 
 
 class StatusDsOidNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified OID cannot be found."""
     NT_STATUS = NTStatusValue.STATUS_DS_OID_NOT_FOUND
 
 
 class StatusHashNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """Hash generation for the specified version and hash type is not enabled on server."""
     NT_STATUS = NTStatusValue.STATUS_HASH_NOT_SUPPORTED
 
 
 class StatusHashNotPresentError(NTStatusValueError):
-    DESCRIPTION = """The hash requests is not present or not up to date with the current file contents."""
     NT_STATUS = NTStatusValue.STATUS_HASH_NOT_PRESENT
 
 
 class StatusOffloadReadFltNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """A file system filter on the server has not opted in for Offload Read support."""
     NT_STATUS = NTStatusValue.STATUS_OFFLOAD_READ_FLT_NOT_SUPPORTED
 
 
 class StatusOffloadWriteFltNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """A file system filter on the server has not opted in for Offload Write support."""
     NT_STATUS = NTStatusValue.STATUS_OFFLOAD_WRITE_FLT_NOT_SUPPORTED
 
 
 class StatusOffloadReadFileNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """Offload read operations cannot be performed on:
-
-Compressed files
-
-Sparse files
-
-Encrypted files
-
-File system metadata files"""
     NT_STATUS = NTStatusValue.STATUS_OFFLOAD_READ_FILE_NOT_SUPPORTED
 
 
 class StatusOffloadWriteFileNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """Offload write operations cannot be performed on:
-
-Compressed files
-
-Sparse files
-
-Encrypted files
-
-File system metadata files"""
     NT_STATUS = NTStatusValue.STATUS_OFFLOAD_WRITE_FILE_NOT_SUPPORTED
 
 
 class DbgNoStateChangeError(NTStatusValueError):
-    DESCRIPTION = """The debugger did not perform a state change."""
     NT_STATUS = NTStatusValue.DBG_NO_STATE_CHANGE
 
 
 class DbgAppNotIdleError(NTStatusValueError):
-    DESCRIPTION = """The debugger found that the application is not idle."""
     NT_STATUS = NTStatusValue.DBG_APP_NOT_IDLE
 
 
 class RpcNtInvalidStringBindingError(NTStatusValueError):
-    DESCRIPTION = """The string binding is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_STRING_BINDING
 
 
 class RpcNtWrongKindOfBindingError(NTStatusValueError):
-    DESCRIPTION = """The binding handle is not the correct type."""
     NT_STATUS = NTStatusValue.RPC_NT_WRONG_KIND_OF_BINDING
 
 
 class RpcNtInvalidBindingError(NTStatusValueError):
-    DESCRIPTION = """The binding handle is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_BINDING
 
 
 class RpcNtProtseqNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The RPC protocol sequence is not supported."""
     NT_STATUS = NTStatusValue.RPC_NT_PROTSEQ_NOT_SUPPORTED
 
 
 class RpcNtInvalidRpcProtseqError(NTStatusValueError):
-    DESCRIPTION = """The RPC protocol sequence is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_RPC_PROTSEQ
 
 
 class RpcNtInvalidStringUuidError(NTStatusValueError):
-    DESCRIPTION = """The string UUID is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_STRING_UUID
 
 
 class RpcNtInvalidEndpointFormatError(NTStatusValueError):
-    DESCRIPTION = """The endpoint format is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_ENDPOINT_FORMAT
 
 
 class RpcNtInvalidNetAddrError(NTStatusValueError):
-    DESCRIPTION = """The network address is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_NET_ADDR
 
 
 class RpcNtNoEndpointFoundError(NTStatusValueError):
-    DESCRIPTION = """No endpoint was found."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_ENDPOINT_FOUND
 
 
 class RpcNtInvalidTimeoutError(NTStatusValueError):
-    DESCRIPTION = """The time-out value is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_TIMEOUT
 
 
 class RpcNtObjectNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The object UUID was not found."""
     NT_STATUS = NTStatusValue.RPC_NT_OBJECT_NOT_FOUND
 
 
 class RpcNtAlreadyRegisteredError(NTStatusValueError):
-    DESCRIPTION = """The object UUID has already been registered."""
     NT_STATUS = NTStatusValue.RPC_NT_ALREADY_REGISTERED
 
 
 class RpcNtTypeAlreadyRegisteredError(NTStatusValueError):
-    DESCRIPTION = """The type UUID has already been registered."""
     NT_STATUS = NTStatusValue.RPC_NT_TYPE_ALREADY_REGISTERED
 
 
 class RpcNtAlreadyListeningError(NTStatusValueError):
-    DESCRIPTION = """The RPC server is already listening."""
     NT_STATUS = NTStatusValue.RPC_NT_ALREADY_LISTENING
 
 
 class RpcNtNoProtseqsRegisteredError(NTStatusValueError):
-    DESCRIPTION = """No protocol sequences have been registered."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_PROTSEQS_REGISTERED
 
 
 class RpcNtNotListeningError(NTStatusValueError):
-    DESCRIPTION = """The RPC server is not listening."""
     NT_STATUS = NTStatusValue.RPC_NT_NOT_LISTENING
 
 
 class RpcNtUnknownMgrTypeError(NTStatusValueError):
-    DESCRIPTION = """The manager type is unknown."""
     NT_STATUS = NTStatusValue.RPC_NT_UNKNOWN_MGR_TYPE
 
 
 class RpcNtUnknownIfError(NTStatusValueError):
-    DESCRIPTION = """The interface is unknown."""
     NT_STATUS = NTStatusValue.RPC_NT_UNKNOWN_IF
 
 
 class RpcNtNoBindingsError(NTStatusValueError):
-    DESCRIPTION = """There are no bindings."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_BINDINGS
 
 
 class RpcNtNoProtseqsError(NTStatusValueError):
-    DESCRIPTION = """There are no protocol sequences."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_PROTSEQS
 
 
 class RpcNtCantCreateEndpointError(NTStatusValueError):
-    DESCRIPTION = """The endpoint cannot be created."""
     NT_STATUS = NTStatusValue.RPC_NT_CANT_CREATE_ENDPOINT
 
 
 class RpcNtOutOfResourcesError(NTStatusValueError):
-    DESCRIPTION = """Insufficient resources are available to complete this operation."""
     NT_STATUS = NTStatusValue.RPC_NT_OUT_OF_RESOURCES
 
 
 class RpcNtServerUnavailableError(NTStatusValueError):
-    DESCRIPTION = """The RPC server is unavailable."""
     NT_STATUS = NTStatusValue.RPC_NT_SERVER_UNAVAILABLE
 
 
 class RpcNtServerTooBusyError(NTStatusValueError):
-    DESCRIPTION = """The RPC server is too busy to complete this operation."""
     NT_STATUS = NTStatusValue.RPC_NT_SERVER_TOO_BUSY
 
 
 class RpcNtInvalidNetworkOptionsError(NTStatusValueError):
-    DESCRIPTION = """The network options are invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_NETWORK_OPTIONS
 
 
 class RpcNtNoCallActiveError(NTStatusValueError):
-    DESCRIPTION = """No RPCs are active on this thread."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_CALL_ACTIVE
 
 
 class RpcNtCallFailedError(NTStatusValueError):
-    DESCRIPTION = """The RPC failed."""
     NT_STATUS = NTStatusValue.RPC_NT_CALL_FAILED
 
 
 class RpcNtCallFailedDneError(NTStatusValueError):
-    DESCRIPTION = """The RPC failed and did not execute."""
     NT_STATUS = NTStatusValue.RPC_NT_CALL_FAILED_DNE
 
 
 class RpcNtProtocolErrorError(NTStatusValueError):
-    DESCRIPTION = """An RPC protocol error occurred."""
     NT_STATUS = NTStatusValue.RPC_NT_PROTOCOL_ERROR
 
 
 class RpcNtUnsupportedTransSynError(NTStatusValueError):
-    DESCRIPTION = """The RPC server does not support the transfer syntax."""
     NT_STATUS = NTStatusValue.RPC_NT_UNSUPPORTED_TRANS_SYN
 
 
 class RpcNtUnsupportedTypeError(NTStatusValueError):
-    DESCRIPTION = """The type UUID is not supported."""
     NT_STATUS = NTStatusValue.RPC_NT_UNSUPPORTED_TYPE
 
 
 class RpcNtInvalidTagError(NTStatusValueError):
-    DESCRIPTION = """The tag is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_TAG
 
 
 class RpcNtInvalidBoundError(NTStatusValueError):
-    DESCRIPTION = """The array bounds are invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_BOUND
 
 
 class RpcNtNoEntryNameError(NTStatusValueError):
-    DESCRIPTION = """The binding does not contain an entry name."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_ENTRY_NAME
 
 
 class RpcNtInvalidNameSyntaxError(NTStatusValueError):
-    DESCRIPTION = """The name syntax is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_NAME_SYNTAX
 
 
 class RpcNtUnsupportedNameSyntaxError(NTStatusValueError):
-    DESCRIPTION = """The name syntax is not supported."""
     NT_STATUS = NTStatusValue.RPC_NT_UNSUPPORTED_NAME_SYNTAX
 
 
 class RpcNtUuidNoAddressError(NTStatusValueError):
-    DESCRIPTION = """No network address is available to construct a UUID."""
     NT_STATUS = NTStatusValue.RPC_NT_UUID_NO_ADDRESS
 
 
 class RpcNtDuplicateEndpointError(NTStatusValueError):
-    DESCRIPTION = """The endpoint is a duplicate."""
     NT_STATUS = NTStatusValue.RPC_NT_DUPLICATE_ENDPOINT
 
 
 class RpcNtUnknownAuthnTypeError(NTStatusValueError):
-    DESCRIPTION = """The authentication type is unknown."""
     NT_STATUS = NTStatusValue.RPC_NT_UNKNOWN_AUTHN_TYPE
 
 
 class RpcNtMaxCallsTooSmallError(NTStatusValueError):
-    DESCRIPTION = """The maximum number of calls is too small."""
     NT_STATUS = NTStatusValue.RPC_NT_MAX_CALLS_TOO_SMALL
 
 
 class RpcNtStringTooLongError(NTStatusValueError):
-    DESCRIPTION = """The string is too long."""
     NT_STATUS = NTStatusValue.RPC_NT_STRING_TOO_LONG
 
 
 class RpcNtProtseqNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The RPC protocol sequence was not found."""
     NT_STATUS = NTStatusValue.RPC_NT_PROTSEQ_NOT_FOUND
 
 
 class RpcNtProcnumOutOfRangeError(NTStatusValueError):
-    DESCRIPTION = """The procedure number is out of range."""
     NT_STATUS = NTStatusValue.RPC_NT_PROCNUM_OUT_OF_RANGE
 
 
 class RpcNtBindingHasNoAuthError(NTStatusValueError):
-    DESCRIPTION = """The binding does not contain any authentication information."""
     NT_STATUS = NTStatusValue.RPC_NT_BINDING_HAS_NO_AUTH
 
 
 class RpcNtUnknownAuthnServiceError(NTStatusValueError):
-    DESCRIPTION = """The authentication service is unknown."""
     NT_STATUS = NTStatusValue.RPC_NT_UNKNOWN_AUTHN_SERVICE
 
 
 class RpcNtUnknownAuthnLevelError(NTStatusValueError):
-    DESCRIPTION = """The authentication level is unknown."""
     NT_STATUS = NTStatusValue.RPC_NT_UNKNOWN_AUTHN_LEVEL
 
 
 class RpcNtInvalidAuthIdentityError(NTStatusValueError):
-    DESCRIPTION = """The security context is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_AUTH_IDENTITY
 
 
 class RpcNtUnknownAuthzServiceError(NTStatusValueError):
-    DESCRIPTION = """The authorization service is unknown."""
     NT_STATUS = NTStatusValue.RPC_NT_UNKNOWN_AUTHZ_SERVICE
 
 
 class EptNtInvalidEntryError(NTStatusValueError):
-    DESCRIPTION = """The entry is invalid."""
     NT_STATUS = NTStatusValue.EPT_NT_INVALID_ENTRY
 
 
 class EptNtCantPerformOpError(NTStatusValueError):
-    DESCRIPTION = """The operation cannot be performed."""
     NT_STATUS = NTStatusValue.EPT_NT_CANT_PERFORM_OP
 
 
 class EptNtNotRegisteredError(NTStatusValueError):
-    DESCRIPTION = """No more endpoints are available from the endpoint mapper."""
     NT_STATUS = NTStatusValue.EPT_NT_NOT_REGISTERED
 
 
 class RpcNtNothingToExportError(NTStatusValueError):
-    DESCRIPTION = """No interfaces have been exported."""
     NT_STATUS = NTStatusValue.RPC_NT_NOTHING_TO_EXPORT
 
 
 class RpcNtIncompleteNameError(NTStatusValueError):
-    DESCRIPTION = """The entry name is incomplete."""
     NT_STATUS = NTStatusValue.RPC_NT_INCOMPLETE_NAME
 
 
 class RpcNtInvalidVersOptionError(NTStatusValueError):
-    DESCRIPTION = """The version option is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_VERS_OPTION
 
 
 class RpcNtNoMoreMembersError(NTStatusValueError):
-    DESCRIPTION = """There are no more members."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_MORE_MEMBERS
 
 
 class RpcNtNotAllObjsUnexportedError(NTStatusValueError):
-    DESCRIPTION = """There is nothing to unexport."""
     NT_STATUS = NTStatusValue.RPC_NT_NOT_ALL_OBJS_UNEXPORTED
 
 
 class RpcNtInterfaceNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The interface was not found."""
     NT_STATUS = NTStatusValue.RPC_NT_INTERFACE_NOT_FOUND
 
 
 class RpcNtEntryAlreadyExistsError(NTStatusValueError):
-    DESCRIPTION = """The entry already exists."""
     NT_STATUS = NTStatusValue.RPC_NT_ENTRY_ALREADY_EXISTS
 
 
 class RpcNtEntryNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The entry was not found."""
     NT_STATUS = NTStatusValue.RPC_NT_ENTRY_NOT_FOUND
 
 
 class RpcNtNameServiceUnavailableError(NTStatusValueError):
-    DESCRIPTION = """The name service is unavailable."""
     NT_STATUS = NTStatusValue.RPC_NT_NAME_SERVICE_UNAVAILABLE
 
 
 class RpcNtInvalidNafIdError(NTStatusValueError):
-    DESCRIPTION = """The network address family is invalid."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_NAF_ID
 
 
 class RpcNtCannotSupportError(NTStatusValueError):
-    DESCRIPTION = """The requested operation is not supported."""
     NT_STATUS = NTStatusValue.RPC_NT_CANNOT_SUPPORT
 
 
 class RpcNtNoContextAvailableError(NTStatusValueError):
-    DESCRIPTION = """No security context is available to allow impersonation."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_CONTEXT_AVAILABLE
 
 
 class RpcNtInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """An internal error occurred in the RPC."""
     NT_STATUS = NTStatusValue.RPC_NT_INTERNAL_ERROR
 
 
 class RpcNtZeroDivideError(NTStatusValueError):
-    DESCRIPTION = """The RPC server attempted to divide an integer by zero."""
     NT_STATUS = NTStatusValue.RPC_NT_ZERO_DIVIDE
 
 
 class RpcNtAddressErrorError(NTStatusValueError):
-    DESCRIPTION = """An addressing error occurred in the RPC server."""
     NT_STATUS = NTStatusValue.RPC_NT_ADDRESS_ERROR
 
 
 class RpcNtFpDivZeroError(NTStatusValueError):
-    DESCRIPTION = """A floating point operation at the RPC server caused a divide by zero."""
     NT_STATUS = NTStatusValue.RPC_NT_FP_DIV_ZERO
 
 
 class RpcNtFpUnderflowError(NTStatusValueError):
-    DESCRIPTION = """A floating point underflow occurred at the RPC server."""
     NT_STATUS = NTStatusValue.RPC_NT_FP_UNDERFLOW
 
 
 class RpcNtFpOverflowError(NTStatusValueError):
-    DESCRIPTION = """A floating point overflow occurred at the RPC server."""
     NT_STATUS = NTStatusValue.RPC_NT_FP_OVERFLOW
 
 
 class RpcNtCallInProgressError(NTStatusValueError):
-    DESCRIPTION = """An RPC is already in progress for this thread."""
     NT_STATUS = NTStatusValue.RPC_NT_CALL_IN_PROGRESS
 
 
 class RpcNtNoMoreBindingsError(NTStatusValueError):
-    DESCRIPTION = """There are no more bindings."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_MORE_BINDINGS
 
 
 class RpcNtGroupMemberNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The group member was not found."""
     NT_STATUS = NTStatusValue.RPC_NT_GROUP_MEMBER_NOT_FOUND
 
 
 class EptNtCantCreateError(NTStatusValueError):
-    DESCRIPTION = """The endpoint mapper database entry could not be created."""
     NT_STATUS = NTStatusValue.EPT_NT_CANT_CREATE
 
 
 class RpcNtInvalidObjectError(NTStatusValueError):
-    DESCRIPTION = """The object UUID is the nil UUID."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_OBJECT
 
 
 class RpcNtNoInterfacesError(NTStatusValueError):
-    DESCRIPTION = """No interfaces have been registered."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_INTERFACES
 
 
 class RpcNtCallCancelledError(NTStatusValueError):
-    DESCRIPTION = """The RPC was canceled."""
     NT_STATUS = NTStatusValue.RPC_NT_CALL_CANCELLED
 
 
 class RpcNtBindingIncompleteError(NTStatusValueError):
-    DESCRIPTION = """The binding handle does not contain all the required information."""
     NT_STATUS = NTStatusValue.RPC_NT_BINDING_INCOMPLETE
 
 
 class RpcNtCommFailureError(NTStatusValueError):
-    DESCRIPTION = """A communications failure occurred during an RPC."""
     NT_STATUS = NTStatusValue.RPC_NT_COMM_FAILURE
 
 
 class RpcNtUnsupportedAuthnLevelError(NTStatusValueError):
-    DESCRIPTION = """The requested authentication level is not supported."""
     NT_STATUS = NTStatusValue.RPC_NT_UNSUPPORTED_AUTHN_LEVEL
 
 
 class RpcNtNoPrincNameError(NTStatusValueError):
-    DESCRIPTION = """No principal name was registered."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_PRINC_NAME
 
 
 class RpcNtNotRpcErrorError(NTStatusValueError):
-    DESCRIPTION = """The error specified is not a valid Windows RPC error code."""
     NT_STATUS = NTStatusValue.RPC_NT_NOT_RPC_ERROR
 
 
 class RpcNtSecPkgErrorError(NTStatusValueError):
-    DESCRIPTION = """A security package-specific error occurred."""
     NT_STATUS = NTStatusValue.RPC_NT_SEC_PKG_ERROR
 
 
 class RpcNtNotCancelledError(NTStatusValueError):
-    DESCRIPTION = """The thread was not canceled."""
     NT_STATUS = NTStatusValue.RPC_NT_NOT_CANCELLED
 
 
 class RpcNtInvalidAsyncHandleError(NTStatusValueError):
-    DESCRIPTION = """Invalid asynchronous RPC handle."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_ASYNC_HANDLE
 
 
 class RpcNtInvalidAsyncCallError(NTStatusValueError):
-    DESCRIPTION = """Invalid asynchronous RPC call handle for this operation."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_ASYNC_CALL
 
 
 class RpcNtProxyAccessDeniedError(NTStatusValueError):
-    DESCRIPTION = """Access to the HTTP proxy is denied."""
     NT_STATUS = NTStatusValue.RPC_NT_PROXY_ACCESS_DENIED
 
 
 class RpcNtNoMoreEntriesError(NTStatusValueError):
-    DESCRIPTION = """The list of RPC servers available for auto-handle binding has been exhausted."""
     NT_STATUS = NTStatusValue.RPC_NT_NO_MORE_ENTRIES
 
 
 class RpcNtSsCharTransOpenFailError(NTStatusValueError):
-    DESCRIPTION = """The file designated by DCERPCCHARTRANS cannot be opened."""
     NT_STATUS = NTStatusValue.RPC_NT_SS_CHAR_TRANS_OPEN_FAIL
 
 
 class RpcNtSsCharTransShortFileError(NTStatusValueError):
-    DESCRIPTION = """The file containing the character translation table has fewer than 512 bytes."""
     NT_STATUS = NTStatusValue.RPC_NT_SS_CHAR_TRANS_SHORT_FILE
 
 
 class RpcNtSsInNullContextError(NTStatusValueError):
-    DESCRIPTION = """A null context handle is passed as an [in] parameter."""
     NT_STATUS = NTStatusValue.RPC_NT_SS_IN_NULL_CONTEXT
 
 
 class RpcNtSsContextMismatchError(NTStatusValueError):
-    DESCRIPTION = """The context handle does not match any known context handles."""
     NT_STATUS = NTStatusValue.RPC_NT_SS_CONTEXT_MISMATCH
 
 
 class RpcNtSsContextDamagedError(NTStatusValueError):
-    DESCRIPTION = """The context handle changed during a call."""
     NT_STATUS = NTStatusValue.RPC_NT_SS_CONTEXT_DAMAGED
 
 
 class RpcNtSsHandlesMismatchError(NTStatusValueError):
-    DESCRIPTION = """The binding handles passed to an RPC do not match."""
     NT_STATUS = NTStatusValue.RPC_NT_SS_HANDLES_MISMATCH
 
 
 class RpcNtSsCannotGetCallHandleError(NTStatusValueError):
-    DESCRIPTION = """The stub is unable to get the call handle."""
     NT_STATUS = NTStatusValue.RPC_NT_SS_CANNOT_GET_CALL_HANDLE
 
 
 class RpcNtNullRefPointerError(NTStatusValueError):
-    DESCRIPTION = """A null reference pointer was passed to the stub."""
     NT_STATUS = NTStatusValue.RPC_NT_NULL_REF_POINTER
 
 
 class RpcNtEnumValueOutOfRangeError(NTStatusValueError):
-    DESCRIPTION = """The enumeration value is out of range."""
     NT_STATUS = NTStatusValue.RPC_NT_ENUM_VALUE_OUT_OF_RANGE
 
 
 class RpcNtByteCountTooSmallError(NTStatusValueError):
-    DESCRIPTION = """The byte count is too small."""
     NT_STATUS = NTStatusValue.RPC_NT_BYTE_COUNT_TOO_SMALL
 
 
 class RpcNtBadStubDataError(NTStatusValueError):
-    DESCRIPTION = """The stub received bad data."""
     NT_STATUS = NTStatusValue.RPC_NT_BAD_STUB_DATA
 
 
 class RpcNtInvalidEsActionError(NTStatusValueError):
-    DESCRIPTION = """Invalid operation on the encoding/decoding handle."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_ES_ACTION
 
 
 class RpcNtWrongEsVersionError(NTStatusValueError):
-    DESCRIPTION = """Incompatible version of the serializing package."""
     NT_STATUS = NTStatusValue.RPC_NT_WRONG_ES_VERSION
 
 
 class RpcNtWrongStubVersionError(NTStatusValueError):
-    DESCRIPTION = """Incompatible version of the RPC stub."""
     NT_STATUS = NTStatusValue.RPC_NT_WRONG_STUB_VERSION
 
 
 class RpcNtInvalidPipeObjectError(NTStatusValueError):
-    DESCRIPTION = """The RPC pipe object is invalid or corrupt."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_PIPE_OBJECT
 
 
 class RpcNtInvalidPipeOperationError(NTStatusValueError):
-    DESCRIPTION = """An invalid operation was attempted on an RPC pipe object."""
     NT_STATUS = NTStatusValue.RPC_NT_INVALID_PIPE_OPERATION
 
 
 class RpcNtWrongPipeVersionError(NTStatusValueError):
-    DESCRIPTION = """Unsupported RPC pipe version."""
     NT_STATUS = NTStatusValue.RPC_NT_WRONG_PIPE_VERSION
 
 
 class RpcNtPipeClosedError(NTStatusValueError):
-    DESCRIPTION = """The RPC pipe object has already been closed."""
     NT_STATUS = NTStatusValue.RPC_NT_PIPE_CLOSED
 
 
 class RpcNtPipeDisciplineErrorError(NTStatusValueError):
-    DESCRIPTION = """The RPC call completed before all pipes were processed."""
     NT_STATUS = NTStatusValue.RPC_NT_PIPE_DISCIPLINE_ERROR
 
 
 class RpcNtPipeEmptyError(NTStatusValueError):
-    DESCRIPTION = """No more data is available from the RPC pipe."""
     NT_STATUS = NTStatusValue.RPC_NT_PIPE_EMPTY
 
 
 class StatusPnpBadMpsTableError(NTStatusValueError):
-    DESCRIPTION = """A device is missing in the system BIOS MPS table. This device will not be used. Contact your system vendor for a system BIOS update."""
     NT_STATUS = NTStatusValue.STATUS_PNP_BAD_MPS_TABLE
 
 
 class StatusPnpTranslationFailedError(NTStatusValueError):
-    DESCRIPTION = """A translator failed to translate resources."""
     NT_STATUS = NTStatusValue.STATUS_PNP_TRANSLATION_FAILED
 
 
 class StatusPnpIrqTranslationFailedError(NTStatusValueError):
-    DESCRIPTION = """An IRQ translator failed to translate resources."""
     NT_STATUS = NTStatusValue.STATUS_PNP_IRQ_TRANSLATION_FAILED
 
 
 class StatusPnpInvalidIdError(NTStatusValueError):
-    DESCRIPTION = """Driver %2 returned an invalid ID for a child device (%3)."""
     NT_STATUS = NTStatusValue.STATUS_PNP_INVALID_ID
 
 
 class StatusIoReissueAsCachedError(NTStatusValueError):
-    DESCRIPTION = """Reissue the given operation as a cached I/O operation"""
     NT_STATUS = NTStatusValue.STATUS_IO_REISSUE_AS_CACHED
 
 
 class StatusCtxWinstationNameInvalidError(NTStatusValueError):
-    DESCRIPTION = """Session name %1 is invalid."""
     NT_STATUS = NTStatusValue.STATUS_CTX_WINSTATION_NAME_INVALID
 
 
 class StatusCtxInvalidPdError(NTStatusValueError):
-    DESCRIPTION = """The protocol driver %1 is invalid."""
     NT_STATUS = NTStatusValue.STATUS_CTX_INVALID_PD
 
 
 class StatusCtxPdNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The protocol driver %1 was not found in the system path."""
     NT_STATUS = NTStatusValue.STATUS_CTX_PD_NOT_FOUND
 
 
 class StatusCtxClosePendingError(NTStatusValueError):
-    DESCRIPTION = """A close operation is pending on the terminal connection."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CLOSE_PENDING
 
 
 class StatusCtxNoOutbufError(NTStatusValueError):
-    DESCRIPTION = """No free output buffers are available."""
     NT_STATUS = NTStatusValue.STATUS_CTX_NO_OUTBUF
 
 
 class StatusCtxModemInfNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The MODEM.INF file was not found."""
     NT_STATUS = NTStatusValue.STATUS_CTX_MODEM_INF_NOT_FOUND
 
 
 class StatusCtxInvalidModemnameError(NTStatusValueError):
-    DESCRIPTION = """The modem (%1) was not found in the MODEM.INF file."""
     NT_STATUS = NTStatusValue.STATUS_CTX_INVALID_MODEMNAME
 
 
 class StatusCtxResponseErrorError(NTStatusValueError):
-    DESCRIPTION = """The modem did not accept the command sent to it. Verify that the configured modem name matches the attached modem."""
     NT_STATUS = NTStatusValue.STATUS_CTX_RESPONSE_ERROR
 
 
 class StatusCtxModemResponseTimeoutError(NTStatusValueError):
-    DESCRIPTION = """The modem did not respond to the command sent to it. Verify that the modem cable is properly attached and the modem is turned on."""
     NT_STATUS = NTStatusValue.STATUS_CTX_MODEM_RESPONSE_TIMEOUT
 
 
 class StatusCtxModemResponseNoCarrierError(NTStatusValueError):
-    DESCRIPTION = """Carrier detection has failed or the carrier has been dropped due to disconnection."""
     NT_STATUS = NTStatusValue.STATUS_CTX_MODEM_RESPONSE_NO_CARRIER
 
 
 class StatusCtxModemResponseNoDialtoneError(NTStatusValueError):
-    DESCRIPTION = """A dial tone was not detected within the required time. Verify that the phone cable is properly attached and functional."""
     NT_STATUS = NTStatusValue.STATUS_CTX_MODEM_RESPONSE_NO_DIALTONE
 
 
 class StatusCtxModemResponseBusyError(NTStatusValueError):
-    DESCRIPTION = """A busy signal was detected at a remote site on callback."""
     NT_STATUS = NTStatusValue.STATUS_CTX_MODEM_RESPONSE_BUSY
 
 
 class StatusCtxModemResponseVoiceError(NTStatusValueError):
-    DESCRIPTION = """A voice was detected at a remote site on callback."""
     NT_STATUS = NTStatusValue.STATUS_CTX_MODEM_RESPONSE_VOICE
 
 
 class StatusCtxTdErrorError(NTStatusValueError):
-    DESCRIPTION = """Transport driver error."""
     NT_STATUS = NTStatusValue.STATUS_CTX_TD_ERROR
 
 
 class StatusCtxLicenseClientInvalidError(NTStatusValueError):
-    DESCRIPTION = """The client you are using is not licensed to use this system. Your logon request is denied."""
     NT_STATUS = NTStatusValue.STATUS_CTX_LICENSE_CLIENT_INVALID
 
 
 class StatusCtxLicenseNotAvailableError(NTStatusValueError):
-    DESCRIPTION = """The system has reached its licensed logon limit. Try again later."""
     NT_STATUS = NTStatusValue.STATUS_CTX_LICENSE_NOT_AVAILABLE
 
 
 class StatusCtxLicenseExpiredError(NTStatusValueError):
-    DESCRIPTION = """The system license has expired. Your logon request is denied."""
     NT_STATUS = NTStatusValue.STATUS_CTX_LICENSE_EXPIRED
 
 
 class StatusCtxWinstationNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified session cannot be found."""
     NT_STATUS = NTStatusValue.STATUS_CTX_WINSTATION_NOT_FOUND
 
 
 class StatusCtxWinstationNameCollisionError(NTStatusValueError):
-    DESCRIPTION = """The specified session name is already in use."""
     NT_STATUS = NTStatusValue.STATUS_CTX_WINSTATION_NAME_COLLISION
 
 
 class StatusCtxWinstationBusyError(NTStatusValueError):
-    DESCRIPTION = """The requested operation cannot be completed because the terminal connection is currently processing a connect, disconnect, reset, or delete operation."""
     NT_STATUS = NTStatusValue.STATUS_CTX_WINSTATION_BUSY
 
 
 class StatusCtxBadVideoModeError(NTStatusValueError):
-    DESCRIPTION = """An attempt has been made to connect to a session whose video mode is not supported by the current client."""
     NT_STATUS = NTStatusValue.STATUS_CTX_BAD_VIDEO_MODE
 
 
 class StatusCtxGraphicsInvalidError(NTStatusValueError):
-    DESCRIPTION = """The application attempted to enable DOS graphics mode. DOS graphics mode is not supported."""
     NT_STATUS = NTStatusValue.STATUS_CTX_GRAPHICS_INVALID
 
 
 class StatusCtxNotConsoleError(NTStatusValueError):
-    DESCRIPTION = """The requested operation can be performed only on the system console. This is most often the result of a driver or system DLL requiring direct console access."""
     NT_STATUS = NTStatusValue.STATUS_CTX_NOT_CONSOLE
 
 
 class StatusCtxClientQueryTimeoutError(NTStatusValueError):
-    DESCRIPTION = """The client failed to respond to the server connect message."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CLIENT_QUERY_TIMEOUT
 
 
 class StatusCtxConsoleDisconnectError(NTStatusValueError):
-    DESCRIPTION = """Disconnecting the console session is not supported."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CONSOLE_DISCONNECT
 
 
 class StatusCtxConsoleConnectError(NTStatusValueError):
-    DESCRIPTION = """Reconnecting a disconnected session to the console is not supported."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CONSOLE_CONNECT
 
 
 class StatusCtxShadowDeniedError(NTStatusValueError):
-    DESCRIPTION = """The request to control another session remotely was denied."""
     NT_STATUS = NTStatusValue.STATUS_CTX_SHADOW_DENIED
 
 
 class StatusCtxWinstationAccessDeniedError(NTStatusValueError):
-    DESCRIPTION = """A process has requested access to a session, but has not been granted those access rights."""
     NT_STATUS = NTStatusValue.STATUS_CTX_WINSTATION_ACCESS_DENIED
 
 
 class StatusCtxInvalidWdError(NTStatusValueError):
-    DESCRIPTION = """The terminal connection driver %1 is invalid."""
     NT_STATUS = NTStatusValue.STATUS_CTX_INVALID_WD
 
 
 class StatusCtxWdNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The terminal connection driver %1 was not found in the system path."""
     NT_STATUS = NTStatusValue.STATUS_CTX_WD_NOT_FOUND
 
 
 class StatusCtxShadowInvalidError(NTStatusValueError):
-    DESCRIPTION = """The requested session cannot be controlled remotely. You cannot control your own session, a session that is trying to control your session, a session that has no user logged on, or other sessions from the console."""
     NT_STATUS = NTStatusValue.STATUS_CTX_SHADOW_INVALID
 
 
 class StatusCtxShadowDisabledError(NTStatusValueError):
-    DESCRIPTION = """The requested session is not configured to allow remote control."""
     NT_STATUS = NTStatusValue.STATUS_CTX_SHADOW_DISABLED
 
 
 class StatusRdpProtocolErrorError(NTStatusValueError):
-    DESCRIPTION = """The RDP protocol component %2 detected an error in the protocol stream and has disconnected the client."""
     NT_STATUS = NTStatusValue.STATUS_RDP_PROTOCOL_ERROR
 
 
 class StatusCtxClientLicenseNotSetError(NTStatusValueError):
-    DESCRIPTION = """Your request to connect to this terminal server has been rejected. Your terminal server client license number has not been entered for this copy of the terminal client. Contact your system administrator for help in entering a valid, unique license number for this terminal server client. Click OK to continue."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CLIENT_LICENSE_NOT_SET
 
 
 class StatusCtxClientLicenseInUseError(NTStatusValueError):
-    DESCRIPTION = """Your request to connect to this terminal server has been rejected. Your terminal server client license number is currently being used by another user. Contact your system administrator to obtain a new copy of the terminal server client with a valid, unique license number. Click OK to continue."""
     NT_STATUS = NTStatusValue.STATUS_CTX_CLIENT_LICENSE_IN_USE
 
 
 class StatusCtxShadowEndedByModeChangeError(NTStatusValueError):
-    DESCRIPTION = """The remote control of the console was terminated because the display mode was changed. Changing the display mode in a remote control session is not supported."""
     NT_STATUS = NTStatusValue.STATUS_CTX_SHADOW_ENDED_BY_MODE_CHANGE
 
 
 class StatusCtxShadowNotRunningError(NTStatusValueError):
-    DESCRIPTION = """Remote control could not be terminated because the specified session is not currently being remotely controlled."""
     NT_STATUS = NTStatusValue.STATUS_CTX_SHADOW_NOT_RUNNING
 
 
 class StatusCtxLogonDisabledError(NTStatusValueError):
-    DESCRIPTION = """Your interactive logon privilege has been disabled. Contact your system administrator."""
     NT_STATUS = NTStatusValue.STATUS_CTX_LOGON_DISABLED
 
 
 class StatusCtxSecurityLayerErrorError(NTStatusValueError):
-    DESCRIPTION = """The terminal server security layer detected an error in the protocol stream and has disconnected the client."""
     NT_STATUS = NTStatusValue.STATUS_CTX_SECURITY_LAYER_ERROR
 
 
 class StatusTsIncompatibleSessionsError(NTStatusValueError):
-    DESCRIPTION = """The target session is incompatible with the current session."""
     NT_STATUS = NTStatusValue.STATUS_TS_INCOMPATIBLE_SESSIONS
 
 
 class StatusMuiFileNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The resource loader failed to find an MUI file."""
     NT_STATUS = NTStatusValue.STATUS_MUI_FILE_NOT_FOUND
 
 
 class StatusMuiInvalidFileError(NTStatusValueError):
-    DESCRIPTION = """The resource loader failed to load an MUI file because the file failed to pass validation."""
     NT_STATUS = NTStatusValue.STATUS_MUI_INVALID_FILE
 
 
 class StatusMuiInvalidRcConfigError(NTStatusValueError):
-    DESCRIPTION = """The RC manifest is corrupted with garbage data, is an unsupported version, or is missing a required item."""
     NT_STATUS = NTStatusValue.STATUS_MUI_INVALID_RC_CONFIG
 
 
 class StatusMuiInvalidLocaleNameError(NTStatusValueError):
-    DESCRIPTION = """The RC manifest has an invalid culture name."""
     NT_STATUS = NTStatusValue.STATUS_MUI_INVALID_LOCALE_NAME
 
 
 class StatusMuiInvalidUltimatefallbackNameError(NTStatusValueError):
-    DESCRIPTION = """The RC manifest has and invalid ultimate fallback name."""
     NT_STATUS = NTStatusValue.STATUS_MUI_INVALID_ULTIMATEFALLBACK_NAME
 
 
 class StatusMuiFileNotLoadedError(NTStatusValueError):
-    DESCRIPTION = """The resource loader cache does not have a loaded MUI entry."""
     NT_STATUS = NTStatusValue.STATUS_MUI_FILE_NOT_LOADED
 
 
 class StatusResourceEnumUserStopError(NTStatusValueError):
-    DESCRIPTION = """The user stopped resource enumeration."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCE_ENUM_USER_STOP
 
 
 class StatusClusterInvalidNodeError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is not valid."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_INVALID_NODE
 
 
 class StatusClusterNodeExistsError(NTStatusValueError):
-    DESCRIPTION = """The cluster node already exists."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_EXISTS
 
 
 class StatusClusterJoinInProgressError(NTStatusValueError):
-    DESCRIPTION = """A node is in the process of joining the cluster."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_JOIN_IN_PROGRESS
 
 
 class StatusClusterNodeNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The cluster node was not found."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_NOT_FOUND
 
 
 class StatusClusterLocalNodeNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The cluster local node information was not found."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_LOCAL_NODE_NOT_FOUND
 
 
 class StatusClusterNetworkExistsError(NTStatusValueError):
-    DESCRIPTION = """The cluster network already exists."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NETWORK_EXISTS
 
 
 class StatusClusterNetworkNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The cluster network was not found."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NETWORK_NOT_FOUND
 
 
 class StatusClusterNetinterfaceExistsError(NTStatusValueError):
-    DESCRIPTION = """The cluster network interface already exists."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NETINTERFACE_EXISTS
 
 
 class StatusClusterNetinterfaceNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The cluster network interface was not found."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NETINTERFACE_NOT_FOUND
 
 
 class StatusClusterInvalidRequestError(NTStatusValueError):
-    DESCRIPTION = """The cluster request is not valid for this object."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_INVALID_REQUEST
 
 
 class StatusClusterInvalidNetworkProviderError(NTStatusValueError):
-    DESCRIPTION = """The cluster network provider is not valid."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_INVALID_NETWORK_PROVIDER
 
 
 class StatusClusterNodeDownError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is down."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_DOWN
 
 
 class StatusClusterNodeUnreachableError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is not reachable."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_UNREACHABLE
 
 
 class StatusClusterNodeNotMemberError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is not a member of the cluster."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_NOT_MEMBER
 
 
 class StatusClusterJoinNotInProgressError(NTStatusValueError):
-    DESCRIPTION = """A cluster join operation is not in progress."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_JOIN_NOT_IN_PROGRESS
 
 
 class StatusClusterInvalidNetworkError(NTStatusValueError):
-    DESCRIPTION = """The cluster network is not valid."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_INVALID_NETWORK
 
 
 class StatusClusterNoNetAdaptersError(NTStatusValueError):
-    DESCRIPTION = """No network adapters are available."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NO_NET_ADAPTERS
 
 
 class StatusClusterNodeUpError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is up."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_UP
 
 
 class StatusClusterNodePausedError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is paused."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_PAUSED
 
 
 class StatusClusterNodeNotPausedError(NTStatusValueError):
-    DESCRIPTION = """The cluster node is not paused."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NODE_NOT_PAUSED
 
 
 class StatusClusterNoSecurityContextError(NTStatusValueError):
-    DESCRIPTION = """No cluster security context is available."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NO_SECURITY_CONTEXT
 
 
 class StatusClusterNetworkNotInternalError(NTStatusValueError):
-    DESCRIPTION = """The cluster network is not configured for internal cluster communication."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_NETWORK_NOT_INTERNAL
 
 
 class StatusClusterPoisonedError(NTStatusValueError):
-    DESCRIPTION = """The cluster node has been poisoned."""
     NT_STATUS = NTStatusValue.STATUS_CLUSTER_POISONED
 
 
 class StatusAcpiInvalidOpcodeError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to run an invalid AML opcode."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_OPCODE
 
 
 class StatusAcpiStackOverflowError(NTStatusValueError):
-    DESCRIPTION = """The AML interpreter stack has overflowed."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_STACK_OVERFLOW
 
 
 class StatusAcpiAssertFailedError(NTStatusValueError):
-    DESCRIPTION = """An inconsistent state has occurred."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_ASSERT_FAILED
 
 
 class StatusAcpiInvalidIndexError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to access an array outside its bounds."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_INDEX
 
 
 class StatusAcpiInvalidArgumentError(NTStatusValueError):
-    DESCRIPTION = """A required argument was not specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_ARGUMENT
 
 
 class StatusAcpiFatalError(NTStatusValueError):
-    DESCRIPTION = """A fatal error has occurred."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_FATAL
 
 
 class StatusAcpiInvalidSupernameError(NTStatusValueError):
-    DESCRIPTION = """An invalid SuperName was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_SUPERNAME
 
 
 class StatusAcpiInvalidArgtypeError(NTStatusValueError):
-    DESCRIPTION = """An argument with an incorrect type was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_ARGTYPE
 
 
 class StatusAcpiInvalidObjtypeError(NTStatusValueError):
-    DESCRIPTION = """An object with an incorrect type was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_OBJTYPE
 
 
 class StatusAcpiInvalidTargettypeError(NTStatusValueError):
-    DESCRIPTION = """A target with an incorrect type was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_TARGETTYPE
 
 
 class StatusAcpiIncorrectArgumentCountError(NTStatusValueError):
-    DESCRIPTION = """An incorrect number of arguments was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INCORRECT_ARGUMENT_COUNT
 
 
 class StatusAcpiAddressNotMappedError(NTStatusValueError):
-    DESCRIPTION = """An address failed to translate."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_ADDRESS_NOT_MAPPED
 
 
 class StatusAcpiInvalidEventtypeError(NTStatusValueError):
-    DESCRIPTION = """An incorrect event type was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_EVENTTYPE
 
 
 class StatusAcpiHandlerCollisionError(NTStatusValueError):
-    DESCRIPTION = """A handler for the target already exists."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_HANDLER_COLLISION
 
 
 class StatusAcpiInvalidDataError(NTStatusValueError):
-    DESCRIPTION = """Invalid data for the target was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_DATA
 
 
 class StatusAcpiInvalidRegionError(NTStatusValueError):
-    DESCRIPTION = """An invalid region for the target was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_REGION
 
 
 class StatusAcpiInvalidAccessSizeError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to access a field outside the defined range."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_ACCESS_SIZE
 
 
 class StatusAcpiAcquireGlobalLockError(NTStatusValueError):
-    DESCRIPTION = """The global system lock could not be acquired."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_ACQUIRE_GLOBAL_LOCK
 
 
 class StatusAcpiAlreadyInitializedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to reinitialize the ACPI subsystem."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_ALREADY_INITIALIZED
 
 
 class StatusAcpiNotInitializedError(NTStatusValueError):
-    DESCRIPTION = """The ACPI subsystem has not been initialized."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_NOT_INITIALIZED
 
 
 class StatusAcpiInvalidMutexLevelError(NTStatusValueError):
-    DESCRIPTION = """An incorrect mutex was specified."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_MUTEX_LEVEL
 
 
 class StatusAcpiMutexNotOwnedError(NTStatusValueError):
-    DESCRIPTION = """The mutex is not currently owned."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_MUTEX_NOT_OWNED
 
 
 class StatusAcpiMutexNotOwnerError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to access the mutex by a process that was not the owner."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_MUTEX_NOT_OWNER
 
 
 class StatusAcpiRsAccessError(NTStatusValueError):
-    DESCRIPTION = """An error occurred during an access to region space."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_RS_ACCESS
 
 
 class StatusAcpiInvalidTableError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to use an incorrect table."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_INVALID_TABLE
 
 
 class StatusAcpiRegHandlerFailedError(NTStatusValueError):
-    DESCRIPTION = """The registration of an ACPI event failed."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_REG_HANDLER_FAILED
 
 
 class StatusAcpiPowerRequestFailedError(NTStatusValueError):
-    DESCRIPTION = """An ACPI power object failed to transition state."""
     NT_STATUS = NTStatusValue.STATUS_ACPI_POWER_REQUEST_FAILED
 
 
 class StatusSxsSectionNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The requested section is not present in the activation context."""
     NT_STATUS = NTStatusValue.STATUS_SXS_SECTION_NOT_FOUND
 
 
 class StatusSxsCantGenActctxError(NTStatusValueError):
-    DESCRIPTION = """Windows was unble to process the application binding information. Refer to the system event log for further information."""
     NT_STATUS = NTStatusValue.STATUS_SXS_CANT_GEN_ACTCTX
 
 
 class StatusSxsInvalidActctxdataFormatError(NTStatusValueError):
-    DESCRIPTION = """The application binding data format is invalid."""
     NT_STATUS = NTStatusValue.STATUS_SXS_INVALID_ACTCTXDATA_FORMAT
 
 
 class StatusSxsAssemblyNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The referenced assembly is not installed on the system."""
     NT_STATUS = NTStatusValue.STATUS_SXS_ASSEMBLY_NOT_FOUND
 
 
 class StatusSxsManifestFormatErrorError(NTStatusValueError):
-    DESCRIPTION = """The manifest file does not begin with the required tag and format information."""
     NT_STATUS = NTStatusValue.STATUS_SXS_MANIFEST_FORMAT_ERROR
 
 
 class StatusSxsManifestParseErrorError(NTStatusValueError):
-    DESCRIPTION = """The manifest file contains one or more syntax errors."""
     NT_STATUS = NTStatusValue.STATUS_SXS_MANIFEST_PARSE_ERROR
 
 
 class StatusSxsActivationContextDisabledError(NTStatusValueError):
-    DESCRIPTION = """The application attempted to activate a disabled activation context."""
     NT_STATUS = NTStatusValue.STATUS_SXS_ACTIVATION_CONTEXT_DISABLED
 
 
 class StatusSxsKeyNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The requested lookup key was not found in any active activation context."""
     NT_STATUS = NTStatusValue.STATUS_SXS_KEY_NOT_FOUND
 
 
 class StatusSxsVersionConflictError(NTStatusValueError):
-    DESCRIPTION = """A component version required by the application conflicts with another component version that is already active."""
     NT_STATUS = NTStatusValue.STATUS_SXS_VERSION_CONFLICT
 
 
 class StatusSxsWrongSectionTypeError(NTStatusValueError):
-    DESCRIPTION = """The type requested activation context section does not match the query API used."""
     NT_STATUS = NTStatusValue.STATUS_SXS_WRONG_SECTION_TYPE
 
 
 class StatusSxsThreadQueriesDisabledError(NTStatusValueError):
-    DESCRIPTION = """Lack of system resources has required isolated activation to be disabled for the current thread of execution."""
     NT_STATUS = NTStatusValue.STATUS_SXS_THREAD_QUERIES_DISABLED
 
 
 class StatusSxsAssemblyMissingError(NTStatusValueError):
-    DESCRIPTION = """The referenced assembly could not be found."""
     NT_STATUS = NTStatusValue.STATUS_SXS_ASSEMBLY_MISSING
 
 
 class StatusSxsProcessDefaultAlreadySetError(NTStatusValueError):
-    DESCRIPTION = """An attempt to set the process default activation context failed because the process default activation context was already set."""
     NT_STATUS = NTStatusValue.STATUS_SXS_PROCESS_DEFAULT_ALREADY_SET
 
 
 class StatusSxsEarlyDeactivationError(NTStatusValueError):
-    DESCRIPTION = """The activation context being deactivated is not the most recently activated one."""
     NT_STATUS = NTStatusValue.STATUS_SXS_EARLY_DEACTIVATION
 
 
 class StatusSxsInvalidDeactivationError(NTStatusValueError):
-    DESCRIPTION = """The activation context being deactivated is not active for the current thread of execution."""
     NT_STATUS = NTStatusValue.STATUS_SXS_INVALID_DEACTIVATION
 
 
 class StatusSxsMultipleDeactivationError(NTStatusValueError):
-    DESCRIPTION = """The activation context being deactivated has already been deactivated."""
     NT_STATUS = NTStatusValue.STATUS_SXS_MULTIPLE_DEACTIVATION
 
 
 class StatusSxsSystemDefaultActivationContextEmptyError(NTStatusValueError):
-    DESCRIPTION = """The activation context of the system default assembly could not be generated."""
     NT_STATUS = NTStatusValue.STATUS_SXS_SYSTEM_DEFAULT_ACTIVATION_CONTEXT_EMPTY
 
 
 class StatusSxsProcessTerminationRequestedError(NTStatusValueError):
-    DESCRIPTION = """A component used by the isolation facility has requested that the process be terminated."""
     NT_STATUS = NTStatusValue.STATUS_SXS_PROCESS_TERMINATION_REQUESTED
 
 
 class StatusSxsCorruptActivationStackError(NTStatusValueError):
-    DESCRIPTION = """The activation context activation stack for the running thread of execution is corrupt."""
     NT_STATUS = NTStatusValue.STATUS_SXS_CORRUPT_ACTIVATION_STACK
 
 
 class StatusSxsCorruptionError(NTStatusValueError):
-    DESCRIPTION = """The application isolation metadata for this process or thread has become corrupt."""
     NT_STATUS = NTStatusValue.STATUS_SXS_CORRUPTION
 
 
 class StatusSxsInvalidIdentityAttributeValueError(NTStatusValueError):
-    DESCRIPTION = """The value of an attribute in an identity is not within the legal range."""
     NT_STATUS = NTStatusValue.STATUS_SXS_INVALID_IDENTITY_ATTRIBUTE_VALUE
 
 
 class StatusSxsInvalidIdentityAttributeNameError(NTStatusValueError):
-    DESCRIPTION = """The name of an attribute in an identity is not within the legal range."""
     NT_STATUS = NTStatusValue.STATUS_SXS_INVALID_IDENTITY_ATTRIBUTE_NAME
 
 
 class StatusSxsIdentityDuplicateAttributeError(NTStatusValueError):
-    DESCRIPTION = """An identity contains two definitions for the same attribute."""
     NT_STATUS = NTStatusValue.STATUS_SXS_IDENTITY_DUPLICATE_ATTRIBUTE
 
 
 class StatusSxsIdentityParseErrorError(NTStatusValueError):
-    DESCRIPTION = """The identity string is malformed. This might be due to a trailing comma, more than two unnamed attributes, a missing attribute name, or a missing attribute value."""
     NT_STATUS = NTStatusValue.STATUS_SXS_IDENTITY_PARSE_ERROR
 
 
 class StatusSxsComponentStoreCorruptError(NTStatusValueError):
-    DESCRIPTION = """The component store has become corrupted."""
     NT_STATUS = NTStatusValue.STATUS_SXS_COMPONENT_STORE_CORRUPT
 
 
 class StatusSxsFileHashMismatchError(NTStatusValueError):
-    DESCRIPTION = """A component's file does not match the verification information present in the component manifest."""
     NT_STATUS = NTStatusValue.STATUS_SXS_FILE_HASH_MISMATCH
 
 
 class StatusSxsManifestIdentitySameButContentsDifferentError(NTStatusValueError):
-    DESCRIPTION = """The identities of the manifests are identical, but their contents are different."""
     NT_STATUS = NTStatusValue.STATUS_SXS_MANIFEST_IDENTITY_SAME_BUT_CONTENTS_DIFFERENT
 
 
 class StatusSxsIdentitiesDifferentError(NTStatusValueError):
-    DESCRIPTION = """The component identities are different."""
     NT_STATUS = NTStatusValue.STATUS_SXS_IDENTITIES_DIFFERENT
 
 
 class StatusSxsAssemblyIsNotADeploymentError(NTStatusValueError):
-    DESCRIPTION = """The assembly is not a deployment."""
     NT_STATUS = NTStatusValue.STATUS_SXS_ASSEMBLY_IS_NOT_A_DEPLOYMENT
 
 
 class StatusSxsFileNotPartOfAssemblyError(NTStatusValueError):
-    DESCRIPTION = """The file is not a part of the assembly."""
     NT_STATUS = NTStatusValue.STATUS_SXS_FILE_NOT_PART_OF_ASSEMBLY
 
 
 class StatusAdvancedInstallerFailedError(NTStatusValueError):
-    DESCRIPTION = """An advanced installer failed during setup or servicing."""
     NT_STATUS = NTStatusValue.STATUS_ADVANCED_INSTALLER_FAILED
 
 
 class StatusXmlEncodingMismatchError(NTStatusValueError):
-    DESCRIPTION = """The character encoding in the XML declaration did not match the encoding used in the document."""
     NT_STATUS = NTStatusValue.STATUS_XML_ENCODING_MISMATCH
 
 
 class StatusSxsManifestTooBigError(NTStatusValueError):
-    DESCRIPTION = """The size of the manifest exceeds the maximum allowed."""
     NT_STATUS = NTStatusValue.STATUS_SXS_MANIFEST_TOO_BIG
 
 
 class StatusSxsSettingNotRegisteredError(NTStatusValueError):
-    DESCRIPTION = """The setting is not registered."""
     NT_STATUS = NTStatusValue.STATUS_SXS_SETTING_NOT_REGISTERED
 
 
 class StatusSxsTransactionClosureIncompleteError(NTStatusValueError):
-    DESCRIPTION = """One or more required transaction members are not present."""
     NT_STATUS = NTStatusValue.STATUS_SXS_TRANSACTION_CLOSURE_INCOMPLETE
 
 
 class StatusSmiPrimitiveInstallerFailedError(NTStatusValueError):
-    DESCRIPTION = """The SMI primitive installer failed during setup or servicing."""
     NT_STATUS = NTStatusValue.STATUS_SMI_PRIMITIVE_INSTALLER_FAILED
 
 
 class StatusGenericCommandFailedError(NTStatusValueError):
-    DESCRIPTION = """A generic command executable returned a result that indicates failure."""
     NT_STATUS = NTStatusValue.STATUS_GENERIC_COMMAND_FAILED
 
 
 class StatusSxsFileHashMissingError(NTStatusValueError):
-    DESCRIPTION = """A component is missing file verification information in its manifest."""
     NT_STATUS = NTStatusValue.STATUS_SXS_FILE_HASH_MISSING
 
 
 class StatusTransactionalConflictError(NTStatusValueError):
-    DESCRIPTION = """The function attempted to use a name that is reserved for use by another transaction."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTIONAL_CONFLICT
 
 
 class StatusInvalidTransactionError(NTStatusValueError):
-    DESCRIPTION = """The transaction handle associated with this operation is invalid."""
     NT_STATUS = NTStatusValue.STATUS_INVALID_TRANSACTION
 
 
 class StatusTransactionNotActiveError(NTStatusValueError):
-    DESCRIPTION = """The requested operation was made in the context of a transaction that is no longer active."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NOT_ACTIVE
 
 
 class StatusTmInitializationFailedError(NTStatusValueError):
-    DESCRIPTION = """The transaction manager was unable to be successfully initialized. Transacted operations are not supported."""
     NT_STATUS = NTStatusValue.STATUS_TM_INITIALIZATION_FAILED
 
 
 class StatusRmNotActiveError(NTStatusValueError):
-    DESCRIPTION = """Transaction support within the specified file system resource manager was not started or was shut down due to an error."""
     NT_STATUS = NTStatusValue.STATUS_RM_NOT_ACTIVE
 
 
 class StatusRmMetadataCorruptError(NTStatusValueError):
-    DESCRIPTION = """The metadata of the resource manager has been corrupted. The resource manager will not function."""
     NT_STATUS = NTStatusValue.STATUS_RM_METADATA_CORRUPT
 
 
 class StatusTransactionNotJoinedError(NTStatusValueError):
-    DESCRIPTION = """The resource manager attempted to prepare a transaction that it has not successfully joined."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NOT_JOINED
 
 
 class StatusDirectoryNotRmError(NTStatusValueError):
-    DESCRIPTION = """The specified directory does not contain a file system resource manager."""
     NT_STATUS = NTStatusValue.STATUS_DIRECTORY_NOT_RM
 
 
 class StatusTransactionsUnsupportedRemoteError(NTStatusValueError):
-    DESCRIPTION = """The remote server or share does not support transacted file operations."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTIONS_UNSUPPORTED_REMOTE
 
 
 class StatusLogResizeInvalidSizeError(NTStatusValueError):
-    DESCRIPTION = """The requested log size for the file system resource manager is invalid."""
     NT_STATUS = NTStatusValue.STATUS_LOG_RESIZE_INVALID_SIZE
 
 
 class StatusRemoteFileVersionMismatchError(NTStatusValueError):
-    DESCRIPTION = """The remote server sent mismatching version number or Fid for a file opened with transactions."""
     NT_STATUS = NTStatusValue.STATUS_REMOTE_FILE_VERSION_MISMATCH
 
 
 class StatusCrmProtocolAlreadyExistsError(NTStatusValueError):
-    DESCRIPTION = """The resource manager tried to register a protocol that already exists."""
     NT_STATUS = NTStatusValue.STATUS_CRM_PROTOCOL_ALREADY_EXISTS
 
 
 class StatusTransactionPropagationFailedError(NTStatusValueError):
-    DESCRIPTION = """The attempt to propagate the transaction failed."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_PROPAGATION_FAILED
 
 
 class StatusCrmProtocolNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The requested propagation protocol was not registered as a CRM."""
     NT_STATUS = NTStatusValue.STATUS_CRM_PROTOCOL_NOT_FOUND
 
 
 class StatusTransactionSuperiorExistsError(NTStatusValueError):
-    DESCRIPTION = """The transaction object already has a superior enlistment, and the caller attempted an operation that would have created a new superior. Only a single superior enlistment is allowed."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_SUPERIOR_EXISTS
 
 
 class StatusTransactionRequestNotValidError(NTStatusValueError):
-    DESCRIPTION = """The requested operation is not valid on the transaction object in its current state."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_REQUEST_NOT_VALID
 
 
 class StatusTransactionNotRequestedError(NTStatusValueError):
-    DESCRIPTION = """The caller has called a response API, but the response is not expected because the transaction manager did not issue the corresponding request to the caller."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NOT_REQUESTED
 
 
 class StatusTransactionAlreadyAbortedError(NTStatusValueError):
-    DESCRIPTION = """It is too late to perform the requested operation, because the transaction has already been aborted."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_ALREADY_ABORTED
 
 
 class StatusTransactionAlreadyCommittedError(NTStatusValueError):
-    DESCRIPTION = """It is too late to perform the requested operation, because the transaction has already been committed."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_ALREADY_COMMITTED
 
 
 class StatusTransactionInvalidMarshallBufferError(NTStatusValueError):
-    DESCRIPTION = """The buffer passed in to NtPushTransaction or NtPullTransaction is not in a valid format."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_INVALID_MARSHALL_BUFFER
 
 
 class StatusCurrentTransactionNotValidError(NTStatusValueError):
-    DESCRIPTION = """The current transaction context associated with the thread is not a valid handle to a transaction object."""
     NT_STATUS = NTStatusValue.STATUS_CURRENT_TRANSACTION_NOT_VALID
 
 
 class StatusLogGrowthFailedError(NTStatusValueError):
-    DESCRIPTION = """An attempt to create space in the transactional resource manager's log failed. The failure status has been recorded in the event log."""
     NT_STATUS = NTStatusValue.STATUS_LOG_GROWTH_FAILED
 
 
 class StatusObjectNoLongerExistsError(NTStatusValueError):
-    DESCRIPTION = """The object (file, stream, or link) that corresponds to the handle has been deleted by a transaction savepoint rollback."""
     NT_STATUS = NTStatusValue.STATUS_OBJECT_NO_LONGER_EXISTS
 
 
 class StatusStreamMiniversionNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified file miniversion was not found for this transacted file open."""
     NT_STATUS = NTStatusValue.STATUS_STREAM_MINIVERSION_NOT_FOUND
 
 
 class StatusStreamMiniversionNotValidError(NTStatusValueError):
-    DESCRIPTION = """The specified file miniversion was found but has been invalidated. The most likely cause is a transaction savepoint rollback."""
     NT_STATUS = NTStatusValue.STATUS_STREAM_MINIVERSION_NOT_VALID
 
 
 class StatusMiniversionInaccessibleFromSpecifiedTransactionError(NTStatusValueError):
-    DESCRIPTION = """A miniversion can be opened only in the context of the transaction that created it."""
     NT_STATUS = NTStatusValue.STATUS_MINIVERSION_INACCESSIBLE_FROM_SPECIFIED_TRANSACTION
 
 
 class StatusCantOpenMiniversionWithModifyIntentError(NTStatusValueError):
-    DESCRIPTION = """It is not possible to open a miniversion with modify access."""
     NT_STATUS = NTStatusValue.STATUS_CANT_OPEN_MINIVERSION_WITH_MODIFY_INTENT
 
 
 class StatusCantCreateMoreStreamMiniversionsError(NTStatusValueError):
-    DESCRIPTION = """It is not possible to create any more miniversions for this stream."""
     NT_STATUS = NTStatusValue.STATUS_CANT_CREATE_MORE_STREAM_MINIVERSIONS
 
 
 class StatusHandleNoLongerValidError(NTStatusValueError):
-    DESCRIPTION = """The handle has been invalidated by a transaction. The most likely cause is the presence of memory mapping on a file or an open handle when the transaction ended or rolled back to savepoint."""
     NT_STATUS = NTStatusValue.STATUS_HANDLE_NO_LONGER_VALID
 
 
 class StatusLogCorruptionDetectedError(NTStatusValueError):
-    DESCRIPTION = """The log data is corrupt."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CORRUPTION_DETECTED
 
 
 class StatusRmDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """The transaction outcome is unavailable because the resource manager responsible for it is disconnected."""
     NT_STATUS = NTStatusValue.STATUS_RM_DISCONNECTED
 
 
 class StatusEnlistmentNotSuperiorError(NTStatusValueError):
-    DESCRIPTION = """The request was rejected because the enlistment in question is not a superior enlistment."""
     NT_STATUS = NTStatusValue.STATUS_ENLISTMENT_NOT_SUPERIOR
 
 
 class StatusFileIdentityNotPersistentError(NTStatusValueError):
-    DESCRIPTION = """The file cannot be opened in a transaction because its identity depends on the outcome of an unresolved transaction."""
     NT_STATUS = NTStatusValue.STATUS_FILE_IDENTITY_NOT_PERSISTENT
 
 
 class StatusCantBreakTransactionalDependencyError(NTStatusValueError):
-    DESCRIPTION = """The operation cannot be performed because another transaction is depending on this property not changing."""
     NT_STATUS = NTStatusValue.STATUS_CANT_BREAK_TRANSACTIONAL_DEPENDENCY
 
 
 class StatusCantCrossRmBoundaryError(NTStatusValueError):
-    DESCRIPTION = """The operation would involve a single file with two transactional resource managers and is, therefore, not allowed."""
     NT_STATUS = NTStatusValue.STATUS_CANT_CROSS_RM_BOUNDARY
 
 
 class StatusTxfDirNotEmptyError(NTStatusValueError):
-    DESCRIPTION = """The $Txf directory must be empty for this operation to succeed."""
     NT_STATUS = NTStatusValue.STATUS_TXF_DIR_NOT_EMPTY
 
 
 class StatusIndoubtTransactionsExistError(NTStatusValueError):
-    DESCRIPTION = """The operation would leave a transactional resource manager in an inconsistent state and is therefore not allowed."""
     NT_STATUS = NTStatusValue.STATUS_INDOUBT_TRANSACTIONS_EXIST
 
 
 class StatusTmVolatileError(NTStatusValueError):
-    DESCRIPTION = """The operation could not be completed because the transaction manager does not have a log."""
     NT_STATUS = NTStatusValue.STATUS_TM_VOLATILE
 
 
 class StatusRollbackTimerExpiredError(NTStatusValueError):
-    DESCRIPTION = """A rollback could not be scheduled because a previously scheduled rollback has already executed or been queued for execution."""
     NT_STATUS = NTStatusValue.STATUS_ROLLBACK_TIMER_EXPIRED
 
 
 class StatusTxfAttributeCorruptError(NTStatusValueError):
-    DESCRIPTION = """The transactional metadata attribute on the file or directory %hs is corrupt and unreadable."""
     NT_STATUS = NTStatusValue.STATUS_TXF_ATTRIBUTE_CORRUPT
 
 
 class StatusEfsNotAllowedInTransactionError(NTStatusValueError):
-    DESCRIPTION = """The encryption operation could not be completed because a transaction is active."""
     NT_STATUS = NTStatusValue.STATUS_EFS_NOT_ALLOWED_IN_TRANSACTION
 
 
 class StatusTransactionalOpenNotAllowedError(NTStatusValueError):
-    DESCRIPTION = """This object is not allowed to be opened in a transaction."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTIONAL_OPEN_NOT_ALLOWED
 
 
 class StatusTransactedMappingUnsupportedRemoteError(NTStatusValueError):
-    DESCRIPTION = """Memory mapping (creating a mapped section) a remote file under a transaction is not supported."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTED_MAPPING_UNSUPPORTED_REMOTE
 
 
 class StatusTransactionRequiredPromotionError(NTStatusValueError):
-    DESCRIPTION = """Promotion was required to allow the resource manager to enlist, but the transaction was set to disallow it."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_REQUIRED_PROMOTION
 
 
 class StatusCannotExecuteFileInTransactionError(NTStatusValueError):
-    DESCRIPTION = """This file is open for modification in an unresolved transaction and can be opened for execute only by a transacted reader."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_EXECUTE_FILE_IN_TRANSACTION
 
 
 class StatusTransactionsNotFrozenError(NTStatusValueError):
-    DESCRIPTION = """The request to thaw frozen transactions was ignored because transactions were not previously frozen."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTIONS_NOT_FROZEN
 
 
 class StatusTransactionFreezeInProgressError(NTStatusValueError):
-    DESCRIPTION = """Transactions cannot be frozen because a freeze is already in progress."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_FREEZE_IN_PROGRESS
 
 
 class StatusNotSnapshotVolumeError(NTStatusValueError):
-    DESCRIPTION = """The target volume is not a snapshot volume. This operation is valid only on a volume mounted as a snapshot."""
     NT_STATUS = NTStatusValue.STATUS_NOT_SNAPSHOT_VOLUME
 
 
 class StatusNoSavepointWithOpenFilesError(NTStatusValueError):
-    DESCRIPTION = """The savepoint operation failed because files are open on the transaction, which is not permitted."""
     NT_STATUS = NTStatusValue.STATUS_NO_SAVEPOINT_WITH_OPEN_FILES
 
 
 class StatusSparseNotAllowedInTransactionError(NTStatusValueError):
-    DESCRIPTION = """The sparse operation could not be completed because a transaction is active on the file."""
     NT_STATUS = NTStatusValue.STATUS_SPARSE_NOT_ALLOWED_IN_TRANSACTION
 
 
 class StatusTmIdentityMismatchError(NTStatusValueError):
-    DESCRIPTION = """The call to create a transaction manager object failed because the Tm Identity that is stored in the log file does not match the Tm Identity that was passed in as an argument."""
     NT_STATUS = NTStatusValue.STATUS_TM_IDENTITY_MISMATCH
 
 
 class StatusFloatedSectionError(NTStatusValueError):
-    DESCRIPTION = """I/O was attempted on a section object that has been floated as a result of a transaction ending. There is no valid data."""
     NT_STATUS = NTStatusValue.STATUS_FLOATED_SECTION
 
 
 class StatusCannotAcceptTransactedWorkError(NTStatusValueError):
-    DESCRIPTION = """The transactional resource manager cannot currently accept transacted work due to a transient condition, such as low resources."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_ACCEPT_TRANSACTED_WORK
 
 
 class StatusCannotAbortTransactionsError(NTStatusValueError):
-    DESCRIPTION = """The transactional resource manager had too many transactions outstanding that could not be aborted. The transactional resource manager has been shut down."""
     NT_STATUS = NTStatusValue.STATUS_CANNOT_ABORT_TRANSACTIONS
 
 
 class StatusTransactionNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified transaction was unable to be opened because it was not found."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NOT_FOUND
 
 
 class StatusResourcemanagerNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified resource manager was unable to be opened because it was not found."""
     NT_STATUS = NTStatusValue.STATUS_RESOURCEMANAGER_NOT_FOUND
 
 
 class StatusEnlistmentNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified enlistment was unable to be opened because it was not found."""
     NT_STATUS = NTStatusValue.STATUS_ENLISTMENT_NOT_FOUND
 
 
 class StatusTransactionmanagerNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The specified transaction manager was unable to be opened because it was not found."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTIONMANAGER_NOT_FOUND
 
 
 class StatusTransactionmanagerNotOnlineError(NTStatusValueError):
-    DESCRIPTION = """The specified resource manager was unable to create an enlistment because its associated transaction manager is not online."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTIONMANAGER_NOT_ONLINE
 
 
 class StatusTransactionmanagerRecoveryNameCollisionError(NTStatusValueError):
-    DESCRIPTION = """The specified transaction manager was unable to create the objects contained in its log file in the Ob namespace. Therefore, the transaction manager was unable to recover."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTIONMANAGER_RECOVERY_NAME_COLLISION
 
 
 class StatusTransactionNotRootError(NTStatusValueError):
-    DESCRIPTION = """The call to create a superior enlistment on this transaction object could not be completed because the transaction object specified for the enlistment is a subordinate branch of the transaction. Only the root of the transaction can be enlisted as a superior."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NOT_ROOT
 
 
 class StatusTransactionObjectExpiredError(NTStatusValueError):
-    DESCRIPTION = """Because the associated transaction manager or resource manager has been closed, the handle is no longer valid."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_OBJECT_EXPIRED
 
 
 class StatusCompressionNotAllowedInTransactionError(NTStatusValueError):
-    DESCRIPTION = """The compression operation could not be completed because a transaction is active on the file."""
     NT_STATUS = NTStatusValue.STATUS_COMPRESSION_NOT_ALLOWED_IN_TRANSACTION
 
 
 class StatusTransactionResponseNotEnlistedError(NTStatusValueError):
-    DESCRIPTION = """The specified operation could not be performed on this superior enlistment because the enlistment was not created with the corresponding completion response in the NotificationMask."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_RESPONSE_NOT_ENLISTED
 
 
 class StatusTransactionRecordTooLongError(NTStatusValueError):
-    DESCRIPTION = """The specified operation could not be performed because the record to be logged was too long. This can occur because either there are too many enlistments on this transaction or the combined RecoveryInformation being logged on behalf of those enlistments is too long."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_RECORD_TOO_LONG
 
 
 class StatusNoLinkTrackingInTransactionError(NTStatusValueError):
-    DESCRIPTION = """The link-tracking operation could not be completed because a transaction is active."""
     NT_STATUS = NTStatusValue.STATUS_NO_LINK_TRACKING_IN_TRANSACTION
 
 
 class StatusOperationNotSupportedInTransactionError(NTStatusValueError):
-    DESCRIPTION = """This operation cannot be performed in a transaction."""
     NT_STATUS = NTStatusValue.STATUS_OPERATION_NOT_SUPPORTED_IN_TRANSACTION
 
 
 class StatusTransactionIntegrityViolatedError(NTStatusValueError):
-    DESCRIPTION = """The kernel transaction manager had to abort or forget the transaction because it blocked forward progress."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_INTEGRITY_VIOLATED
 
 
 class StatusExpiredHandleError(NTStatusValueError):
-    DESCRIPTION = """The handle is no longer properly associated with its transaction.  It might have been opened in a transactional resource manager that was subsequently forced to restart.  Please close the handle and open a new one."""
     NT_STATUS = NTStatusValue.STATUS_EXPIRED_HANDLE
 
 
 class StatusTransactionNotEnlistedError(NTStatusValueError):
-    DESCRIPTION = """The specified operation could not be performed because the resource manager is not enlisted in the transaction."""
     NT_STATUS = NTStatusValue.STATUS_TRANSACTION_NOT_ENLISTED
 
 
 class StatusLogSectorInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service found an invalid log sector."""
     NT_STATUS = NTStatusValue.STATUS_LOG_SECTOR_INVALID
 
 
 class StatusLogSectorParityInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered a log sector with invalid block parity."""
     NT_STATUS = NTStatusValue.STATUS_LOG_SECTOR_PARITY_INVALID
 
 
 class StatusLogSectorRemappedError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered a remapped log sector."""
     NT_STATUS = NTStatusValue.STATUS_LOG_SECTOR_REMAPPED
 
 
 class StatusLogBlockIncompleteError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered a partial or incomplete log block."""
     NT_STATUS = NTStatusValue.STATUS_LOG_BLOCK_INCOMPLETE
 
 
 class StatusLogInvalidRangeError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an attempt to access data outside the active log range."""
     NT_STATUS = NTStatusValue.STATUS_LOG_INVALID_RANGE
 
 
 class StatusLogBlocksExhaustedError(NTStatusValueError):
-    DESCRIPTION = """The log service user-log marshaling buffers are exhausted."""
     NT_STATUS = NTStatusValue.STATUS_LOG_BLOCKS_EXHAUSTED
 
 
 class StatusLogReadContextInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an attempt to read from a marshaling area with an invalid read context."""
     NT_STATUS = NTStatusValue.STATUS_LOG_READ_CONTEXT_INVALID
 
 
 class StatusLogRestartInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an invalid log restart area."""
     NT_STATUS = NTStatusValue.STATUS_LOG_RESTART_INVALID
 
 
 class StatusLogBlockVersionError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an invalid log block version."""
     NT_STATUS = NTStatusValue.STATUS_LOG_BLOCK_VERSION
 
 
 class StatusLogBlockInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an invalid log block."""
     NT_STATUS = NTStatusValue.STATUS_LOG_BLOCK_INVALID
 
 
 class StatusLogReadModeInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an attempt to read the log with an invalid read mode."""
     NT_STATUS = NTStatusValue.STATUS_LOG_READ_MODE_INVALID
 
 
 class StatusLogMetadataCorruptError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered a corrupted metadata file."""
     NT_STATUS = NTStatusValue.STATUS_LOG_METADATA_CORRUPT
 
 
 class StatusLogMetadataInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered a metadata file that could not be created by the log file system."""
     NT_STATUS = NTStatusValue.STATUS_LOG_METADATA_INVALID
 
 
 class StatusLogMetadataInconsistentError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered a metadata file with inconsistent data."""
     NT_STATUS = NTStatusValue.STATUS_LOG_METADATA_INCONSISTENT
 
 
 class StatusLogReservationInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an attempt to erroneously allocate or dispose reservation space."""
     NT_STATUS = NTStatusValue.STATUS_LOG_RESERVATION_INVALID
 
 
 class StatusLogCantDeleteError(NTStatusValueError):
-    DESCRIPTION = """The log service cannot delete the log file or the file system container."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CANT_DELETE
 
 
 class StatusLogContainerLimitExceededError(NTStatusValueError):
-    DESCRIPTION = """The log service has reached the maximum allowable containers allocated to a log file."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CONTAINER_LIMIT_EXCEEDED
 
 
 class StatusLogStartOfLogError(NTStatusValueError):
-    DESCRIPTION = """The log service has attempted to read or write backward past the start of the log."""
     NT_STATUS = NTStatusValue.STATUS_LOG_START_OF_LOG
 
 
 class StatusLogPolicyAlreadyInstalledError(NTStatusValueError):
-    DESCRIPTION = """The log policy could not be installed because a policy of the same type is already present."""
     NT_STATUS = NTStatusValue.STATUS_LOG_POLICY_ALREADY_INSTALLED
 
 
 class StatusLogPolicyNotInstalledError(NTStatusValueError):
-    DESCRIPTION = """The log policy in question was not installed at the time of the request."""
     NT_STATUS = NTStatusValue.STATUS_LOG_POLICY_NOT_INSTALLED
 
 
 class StatusLogPolicyInvalidError(NTStatusValueError):
-    DESCRIPTION = """The installed set of policies on the log is invalid."""
     NT_STATUS = NTStatusValue.STATUS_LOG_POLICY_INVALID
 
 
 class StatusLogPolicyConflictError(NTStatusValueError):
-    DESCRIPTION = """A policy on the log in question prevented the operation from completing."""
     NT_STATUS = NTStatusValue.STATUS_LOG_POLICY_CONFLICT
 
 
 class StatusLogPinnedArchiveTailError(NTStatusValueError):
-    DESCRIPTION = """The log space cannot be reclaimed because the log is pinned by the archive tail."""
     NT_STATUS = NTStatusValue.STATUS_LOG_PINNED_ARCHIVE_TAIL
 
 
 class StatusLogRecordNonexistentError(NTStatusValueError):
-    DESCRIPTION = """The log record is not a record in the log file."""
     NT_STATUS = NTStatusValue.STATUS_LOG_RECORD_NONEXISTENT
 
 
 class StatusLogRecordsReservedInvalidError(NTStatusValueError):
-    DESCRIPTION = """The number of reserved log records or the adjustment of the number of reserved log records is invalid."""
     NT_STATUS = NTStatusValue.STATUS_LOG_RECORDS_RESERVED_INVALID
 
 
 class StatusLogSpaceReservedInvalidError(NTStatusValueError):
-    DESCRIPTION = """The reserved log space or the adjustment of the log space is invalid."""
     NT_STATUS = NTStatusValue.STATUS_LOG_SPACE_RESERVED_INVALID
 
 
 class StatusLogTailInvalidError(NTStatusValueError):
-    DESCRIPTION = """A new or existing archive tail or the base of the active log is invalid."""
     NT_STATUS = NTStatusValue.STATUS_LOG_TAIL_INVALID
 
 
 class StatusLogFullError(NTStatusValueError):
-    DESCRIPTION = """The log space is exhausted."""
     NT_STATUS = NTStatusValue.STATUS_LOG_FULL
 
 
 class StatusLogMultiplexedError(NTStatusValueError):
-    DESCRIPTION = """The log is multiplexed; no direct writes to the physical log are allowed."""
     NT_STATUS = NTStatusValue.STATUS_LOG_MULTIPLEXED
 
 
 class StatusLogDedicatedError(NTStatusValueError):
-    DESCRIPTION = """The operation failed because the log is dedicated."""
     NT_STATUS = NTStatusValue.STATUS_LOG_DEDICATED
 
 
 class StatusLogArchiveNotInProgressError(NTStatusValueError):
-    DESCRIPTION = """The operation requires an archive context."""
     NT_STATUS = NTStatusValue.STATUS_LOG_ARCHIVE_NOT_IN_PROGRESS
 
 
 class StatusLogArchiveInProgressError(NTStatusValueError):
-    DESCRIPTION = """Log archival is in progress."""
     NT_STATUS = NTStatusValue.STATUS_LOG_ARCHIVE_IN_PROGRESS
 
 
 class StatusLogEphemeralError(NTStatusValueError):
-    DESCRIPTION = """The operation requires a nonephemeral log, but the log is ephemeral."""
     NT_STATUS = NTStatusValue.STATUS_LOG_EPHEMERAL
 
 
 class StatusLogNotEnoughContainersError(NTStatusValueError):
-    DESCRIPTION = """The log must have at least two containers before it can be read from or written to."""
     NT_STATUS = NTStatusValue.STATUS_LOG_NOT_ENOUGH_CONTAINERS
 
 
 class StatusLogClientAlreadyRegisteredError(NTStatusValueError):
-    DESCRIPTION = """A log client has already registered on the stream."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CLIENT_ALREADY_REGISTERED
 
 
 class StatusLogClientNotRegisteredError(NTStatusValueError):
-    DESCRIPTION = """A log client has not been registered on the stream."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CLIENT_NOT_REGISTERED
 
 
 class StatusLogFullHandlerInProgressError(NTStatusValueError):
-    DESCRIPTION = """A request has already been made to handle the log full condition."""
     NT_STATUS = NTStatusValue.STATUS_LOG_FULL_HANDLER_IN_PROGRESS
 
 
 class StatusLogContainerReadFailedError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an error when attempting to read from a log container."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CONTAINER_READ_FAILED
 
 
 class StatusLogContainerWriteFailedError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an error when attempting to write to a log container."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CONTAINER_WRITE_FAILED
 
 
 class StatusLogContainerOpenFailedError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an error when attempting to open a log container."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CONTAINER_OPEN_FAILED
 
 
 class StatusLogContainerStateInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service encountered an invalid container state when attempting a requested action."""
     NT_STATUS = NTStatusValue.STATUS_LOG_CONTAINER_STATE_INVALID
 
 
 class StatusLogStateInvalidError(NTStatusValueError):
-    DESCRIPTION = """The log service is not in the correct state to perform a requested action."""
     NT_STATUS = NTStatusValue.STATUS_LOG_STATE_INVALID
 
 
 class StatusLogPinnedError(NTStatusValueError):
-    DESCRIPTION = """The log space cannot be reclaimed because the log is pinned."""
     NT_STATUS = NTStatusValue.STATUS_LOG_PINNED
 
 
 class StatusLogMetadataFlushFailedError(NTStatusValueError):
-    DESCRIPTION = """The log metadata flush failed."""
     NT_STATUS = NTStatusValue.STATUS_LOG_METADATA_FLUSH_FAILED
 
 
 class StatusLogInconsistentSecurityError(NTStatusValueError):
-    DESCRIPTION = """Security on the log and its containers is inconsistent."""
     NT_STATUS = NTStatusValue.STATUS_LOG_INCONSISTENT_SECURITY
 
 
 class StatusLogAppendedFlushFailedError(NTStatusValueError):
-    DESCRIPTION = """Records were appended to the log or reservation changes were made, but the log could not be flushed."""
     NT_STATUS = NTStatusValue.STATUS_LOG_APPENDED_FLUSH_FAILED
 
 
 class StatusLogPinnedReservationError(NTStatusValueError):
-    DESCRIPTION = """The log is pinned due to reservation consuming most of the log space. Free some reserved records to make space available."""
     NT_STATUS = NTStatusValue.STATUS_LOG_PINNED_RESERVATION
 
 
 class StatusVideoHungDisplayDriverThreadError(NTStatusValueError):
-    DESCRIPTION = """{Display Driver Stopped Responding} The %hs display driver has stopped working normally. Save your work and reboot the system to restore full display functionality. The next time you reboot the computer, a dialog box will allow you to upload data about this failure to Microsoft."""
     NT_STATUS = NTStatusValue.STATUS_VIDEO_HUNG_DISPLAY_DRIVER_THREAD
 
 
 class StatusFltNoHandlerDefinedError(NTStatusValueError):
-    DESCRIPTION = """A handler was not defined by the filter for this operation."""
     NT_STATUS = NTStatusValue.STATUS_FLT_NO_HANDLER_DEFINED
 
 
 class StatusFltContextAlreadyDefinedError(NTStatusValueError):
-    DESCRIPTION = """A context is already defined for this object."""
     NT_STATUS = NTStatusValue.STATUS_FLT_CONTEXT_ALREADY_DEFINED
 
 
 class StatusFltInvalidAsynchronousRequestError(NTStatusValueError):
-    DESCRIPTION = """Asynchronous requests are not valid for this operation."""
     NT_STATUS = NTStatusValue.STATUS_FLT_INVALID_ASYNCHRONOUS_REQUEST
 
 
 class StatusFltDisallowFastIoError(NTStatusValueError):
-    DESCRIPTION = """This is an internal error code used by the filter manager to determine if a fast I/O operation should be forced down the input/output request packet (IRP) path. Minifilters should never return this value."""
     NT_STATUS = NTStatusValue.STATUS_FLT_DISALLOW_FAST_IO
 
 
 class StatusFltInvalidNameRequestError(NTStatusValueError):
-    DESCRIPTION = """An invalid name request was made. The name requested cannot be retrieved at this time."""
     NT_STATUS = NTStatusValue.STATUS_FLT_INVALID_NAME_REQUEST
 
 
 class StatusFltNotSafeToPostOperationError(NTStatusValueError):
-    DESCRIPTION = """Posting this operation to a worker thread for further processing is not safe at this time because it could lead to a system deadlock."""
     NT_STATUS = NTStatusValue.STATUS_FLT_NOT_SAFE_TO_POST_OPERATION
 
 
 class StatusFltNotInitializedError(NTStatusValueError):
-    DESCRIPTION = """The Filter Manager was not initialized when a filter tried to register. Make sure that the Filter Manager is loaded as a driver."""
     NT_STATUS = NTStatusValue.STATUS_FLT_NOT_INITIALIZED
 
 
 class StatusFltFilterNotReadyError(NTStatusValueError):
-    DESCRIPTION = """The filter is not ready for attachment to volumes because it has not finished initializing (FltStartFiltering has not been called)."""
     NT_STATUS = NTStatusValue.STATUS_FLT_FILTER_NOT_READY
 
 
 class StatusFltPostOperationCleanupError(NTStatusValueError):
-    DESCRIPTION = """The filter must clean up any operation-specific context at this time because it is being removed from the system before the operation is completed by the lower drivers."""
     NT_STATUS = NTStatusValue.STATUS_FLT_POST_OPERATION_CLEANUP
 
 
 class StatusFltInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """The Filter Manager had an internal error from which it cannot recover; therefore, the operation has failed. This is usually the result of a filter returning an invalid value from a pre-operation callback."""
     NT_STATUS = NTStatusValue.STATUS_FLT_INTERNAL_ERROR
 
 
 class StatusFltDeletingObjectError(NTStatusValueError):
-    DESCRIPTION = """The object specified for this action is in the process of being deleted; therefore, the action requested cannot be completed at this time."""
     NT_STATUS = NTStatusValue.STATUS_FLT_DELETING_OBJECT
 
 
 class StatusFltMustBeNonpagedPoolError(NTStatusValueError):
-    DESCRIPTION = """A nonpaged pool must be used for this type of context."""
     NT_STATUS = NTStatusValue.STATUS_FLT_MUST_BE_NONPAGED_POOL
 
 
 class StatusFltDuplicateEntryError(NTStatusValueError):
-    DESCRIPTION = """A duplicate handler definition has been provided for an operation."""
     NT_STATUS = NTStatusValue.STATUS_FLT_DUPLICATE_ENTRY
 
 
 class StatusFltCbdqDisabledError(NTStatusValueError):
-    DESCRIPTION = """The callback data queue has been disabled."""
     NT_STATUS = NTStatusValue.STATUS_FLT_CBDQ_DISABLED
 
 
 class StatusFltDoNotAttachError(NTStatusValueError):
-    DESCRIPTION = """Do not attach the filter to the volume at this time."""
     NT_STATUS = NTStatusValue.STATUS_FLT_DO_NOT_ATTACH
 
 
 class StatusFltDoNotDetachError(NTStatusValueError):
-    DESCRIPTION = """Do not detach the filter from the volume at this time."""
     NT_STATUS = NTStatusValue.STATUS_FLT_DO_NOT_DETACH
 
 
 class StatusFltInstanceAltitudeCollisionError(NTStatusValueError):
-    DESCRIPTION = """An instance already exists at this altitude on the volume specified."""
     NT_STATUS = NTStatusValue.STATUS_FLT_INSTANCE_ALTITUDE_COLLISION
 
 
 class StatusFltInstanceNameCollisionError(NTStatusValueError):
-    DESCRIPTION = """An instance already exists with this name on the volume specified."""
     NT_STATUS = NTStatusValue.STATUS_FLT_INSTANCE_NAME_COLLISION
 
 
 class StatusFltFilterNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The system could not find the filter specified."""
     NT_STATUS = NTStatusValue.STATUS_FLT_FILTER_NOT_FOUND
 
 
 class StatusFltVolumeNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The system could not find the volume specified."""
     NT_STATUS = NTStatusValue.STATUS_FLT_VOLUME_NOT_FOUND
 
 
 class StatusFltInstanceNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The system could not find the instance specified."""
     NT_STATUS = NTStatusValue.STATUS_FLT_INSTANCE_NOT_FOUND
 
 
 class StatusFltContextAllocationNotFoundError(NTStatusValueError):
-    DESCRIPTION = """No registered context allocation definition was found for the given request."""
     NT_STATUS = NTStatusValue.STATUS_FLT_CONTEXT_ALLOCATION_NOT_FOUND
 
 
 class StatusFltInvalidContextRegistrationError(NTStatusValueError):
-    DESCRIPTION = """An invalid parameter was specified during context registration."""
     NT_STATUS = NTStatusValue.STATUS_FLT_INVALID_CONTEXT_REGISTRATION
 
 
 class StatusFltNameCacheMissError(NTStatusValueError):
-    DESCRIPTION = """The name requested was not found in the Filter Manager name cache and could not be retrieved from the file system."""
     NT_STATUS = NTStatusValue.STATUS_FLT_NAME_CACHE_MISS
 
 
 class StatusFltNoDeviceObjectError(NTStatusValueError):
-    DESCRIPTION = """The requested device object does not exist for the given volume."""
     NT_STATUS = NTStatusValue.STATUS_FLT_NO_DEVICE_OBJECT
 
 
 class StatusFltVolumeAlreadyMountedError(NTStatusValueError):
-    DESCRIPTION = """The specified volume is already mounted."""
     NT_STATUS = NTStatusValue.STATUS_FLT_VOLUME_ALREADY_MOUNTED
 
 
 class StatusFltAlreadyEnlistedError(NTStatusValueError):
-    DESCRIPTION = """The specified transaction context is already enlisted in a transaction."""
     NT_STATUS = NTStatusValue.STATUS_FLT_ALREADY_ENLISTED
 
 
 class StatusFltContextAlreadyLinkedError(NTStatusValueError):
-    DESCRIPTION = """The specified context is already attached to another object."""
     NT_STATUS = NTStatusValue.STATUS_FLT_CONTEXT_ALREADY_LINKED
 
 
 class StatusFltNoWaiterForReplyError(NTStatusValueError):
-    DESCRIPTION = """No waiter is present for the filter's reply to this message."""
     NT_STATUS = NTStatusValue.STATUS_FLT_NO_WAITER_FOR_REPLY
 
 
 class StatusMonitorNoDescriptorError(NTStatusValueError):
-    DESCRIPTION = """A monitor descriptor could not be obtained."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_NO_DESCRIPTOR
 
 
 class StatusMonitorUnknownDescriptorFormatError(NTStatusValueError):
-    DESCRIPTION = """This release does not support the format of the obtained monitor descriptor."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_UNKNOWN_DESCRIPTOR_FORMAT
 
 
 class StatusMonitorInvalidDescriptorChecksumError(NTStatusValueError):
-    DESCRIPTION = """The checksum of the obtained monitor descriptor is invalid."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_INVALID_DESCRIPTOR_CHECKSUM
 
 
 class StatusMonitorInvalidStandardTimingBlockError(NTStatusValueError):
-    DESCRIPTION = """The monitor descriptor contains an invalid standard timing block."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_INVALID_STANDARD_TIMING_BLOCK
 
 
 class StatusMonitorWmiDatablockRegistrationFailedError(NTStatusValueError):
-    DESCRIPTION = """WMI data-block registration failed for one of the MSMonitorClass WMI subclasses."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_WMI_DATABLOCK_REGISTRATION_FAILED
 
 
 class StatusMonitorInvalidSerialNumberMondscBlockError(NTStatusValueError):
-    DESCRIPTION = """The provided monitor descriptor block is either corrupted or does not contain the monitor's detailed serial number."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_INVALID_SERIAL_NUMBER_MONDSC_BLOCK
 
 
 class StatusMonitorInvalidUserFriendlyMondscBlockError(NTStatusValueError):
-    DESCRIPTION = """The provided monitor descriptor block is either corrupted or does not contain the monitor's user-friendly name."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_INVALID_USER_FRIENDLY_MONDSC_BLOCK
 
 
 class StatusMonitorNoMoreDescriptorDataError(NTStatusValueError):
-    DESCRIPTION = """There is no monitor descriptor data at the specified (offset or size) region."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_NO_MORE_DESCRIPTOR_DATA
 
 
 class StatusMonitorInvalidDetailedTimingBlockError(NTStatusValueError):
-    DESCRIPTION = """The monitor descriptor contains an invalid detailed timing block."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_INVALID_DETAILED_TIMING_BLOCK
 
 
 class StatusMonitorInvalidManufactureDateError(NTStatusValueError):
-    DESCRIPTION = """Monitor descriptor contains invalid manufacture date."""
     NT_STATUS = NTStatusValue.STATUS_MONITOR_INVALID_MANUFACTURE_DATE
 
 
 class StatusGraphicsNotExclusiveModeOwnerError(NTStatusValueError):
-    DESCRIPTION = """Exclusive mode ownership is needed to create an unmanaged primary allocation."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NOT_EXCLUSIVE_MODE_OWNER
 
 
 class StatusGraphicsInsufficientDmaBufferError(NTStatusValueError):
-    DESCRIPTION = """The driver needs more DMA buffer space to complete the requested operation."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INSUFFICIENT_DMA_BUFFER
 
 
 class StatusGraphicsInvalidDisplayAdapterError(NTStatusValueError):
-    DESCRIPTION = """The specified display adapter handle is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_DISPLAY_ADAPTER
 
 
 class StatusGraphicsAdapterWasResetError(NTStatusValueError):
-    DESCRIPTION = """The specified display adapter and all of its state have been reset."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ADAPTER_WAS_RESET
 
 
 class StatusGraphicsInvalidDriverModelError(NTStatusValueError):
-    DESCRIPTION = """The driver stack does not match the expected driver model."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_DRIVER_MODEL
 
 
 class StatusGraphicsPresentModeChangedError(NTStatusValueError):
-    DESCRIPTION = """Present happened but ended up into the changed desktop mode."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PRESENT_MODE_CHANGED
 
 
 class StatusGraphicsPresentOccludedError(NTStatusValueError):
-    DESCRIPTION = """Nothing to present due to desktop occlusion."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PRESENT_OCCLUDED
 
 
 class StatusGraphicsPresentDeniedError(NTStatusValueError):
-    DESCRIPTION = """Not able to present due to denial of desktop access."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PRESENT_DENIED
 
 
 class StatusGraphicsCannotcolorconvertError(NTStatusValueError):
-    DESCRIPTION = """Not able to present with color conversion."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CANNOTCOLORCONVERT
 
 
 class StatusGraphicsPresentRedirectionDisabledError(NTStatusValueError):
-    DESCRIPTION = """Present redirection is disabled (desktop windowing management subsystem is off)."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PRESENT_REDIRECTION_DISABLED
 
 
 class StatusGraphicsPresentUnoccludedError(NTStatusValueError):
-    DESCRIPTION = """Previous exclusive VidPn source owner has released its ownership"""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PRESENT_UNOCCLUDED
 
 
 class StatusGraphicsNoVideoMemoryError(NTStatusValueError):
-    DESCRIPTION = """Not enough video memory is available to complete the operation."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_VIDEO_MEMORY
 
 
 class StatusGraphicsCantLockMemoryError(NTStatusValueError):
-    DESCRIPTION = """Could not probe and lock the underlying memory of an allocation."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CANT_LOCK_MEMORY
 
 
 class StatusGraphicsAllocationBusyError(NTStatusValueError):
-    DESCRIPTION = """The allocation is currently busy."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ALLOCATION_BUSY
 
 
 class StatusGraphicsTooManyReferencesError(NTStatusValueError):
-    DESCRIPTION = """An object being referenced has already reached the maximum reference count and cannot be referenced further."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_TOO_MANY_REFERENCES
 
 
 class StatusGraphicsTryAgainLaterError(NTStatusValueError):
-    DESCRIPTION = """A problem could not be solved due to an existing condition. Try again later."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_TRY_AGAIN_LATER
 
 
 class StatusGraphicsTryAgainNowError(NTStatusValueError):
-    DESCRIPTION = """A problem could not be solved due to an existing condition. Try again now."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_TRY_AGAIN_NOW
 
 
 class StatusGraphicsAllocationInvalidError(NTStatusValueError):
-    DESCRIPTION = """The allocation is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ALLOCATION_INVALID
 
 
 class StatusGraphicsUnswizzlingApertureUnavailableError(NTStatusValueError):
-    DESCRIPTION = """No more unswizzling apertures are currently available."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_UNSWIZZLING_APERTURE_UNAVAILABLE
 
 
 class StatusGraphicsUnswizzlingApertureUnsupportedError(NTStatusValueError):
-    DESCRIPTION = """The current allocation cannot be unswizzled by an aperture."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_UNSWIZZLING_APERTURE_UNSUPPORTED
 
 
 class StatusGraphicsCantEvictPinnedAllocationError(NTStatusValueError):
-    DESCRIPTION = """The request failed because a pinned allocation cannot be evicted."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CANT_EVICT_PINNED_ALLOCATION
 
 
 class StatusGraphicsInvalidAllocationUsageError(NTStatusValueError):
-    DESCRIPTION = """The allocation cannot be used from its current segment location for the specified operation."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_ALLOCATION_USAGE
 
 
 class StatusGraphicsCantRenderLockedAllocationError(NTStatusValueError):
-    DESCRIPTION = """A locked allocation cannot be used in the current command buffer."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CANT_RENDER_LOCKED_ALLOCATION
 
 
 class StatusGraphicsAllocationClosedError(NTStatusValueError):
-    DESCRIPTION = """The allocation being referenced has been closed permanently."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ALLOCATION_CLOSED
 
 
 class StatusGraphicsInvalidAllocationInstanceError(NTStatusValueError):
-    DESCRIPTION = """An invalid allocation instance is being referenced."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_ALLOCATION_INSTANCE
 
 
 class StatusGraphicsInvalidAllocationHandleError(NTStatusValueError):
-    DESCRIPTION = """An invalid allocation handle is being referenced."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_ALLOCATION_HANDLE
 
 
 class StatusGraphicsWrongAllocationDeviceError(NTStatusValueError):
-    DESCRIPTION = """The allocation being referenced does not belong to the current device."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_WRONG_ALLOCATION_DEVICE
 
 
 class StatusGraphicsAllocationContentLostError(NTStatusValueError):
-    DESCRIPTION = """The specified allocation lost its content."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ALLOCATION_CONTENT_LOST
 
 
 class StatusGraphicsGpuExceptionOnDeviceError(NTStatusValueError):
-    DESCRIPTION = """A GPU exception was detected on the given device. The device cannot be scheduled."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_GPU_EXCEPTION_ON_DEVICE
 
 
 class StatusGraphicsInvalidVidpnTopologyError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN topology is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDPN_TOPOLOGY
 
 
 class StatusGraphicsVidpnTopologyNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN topology is valid but is not supported by this model of the display adapter."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_VIDPN_TOPOLOGY_NOT_SUPPORTED
 
 
 class StatusGraphicsVidpnTopologyCurrentlyNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN topology is valid but is not currently supported by the display adapter due to allocation of its resources."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_VIDPN_TOPOLOGY_CURRENTLY_NOT_SUPPORTED
 
 
 class StatusGraphicsInvalidVidpnError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN handle is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDPN
 
 
 class StatusGraphicsInvalidVideoPresentSourceError(NTStatusValueError):
-    DESCRIPTION = """The specified video present source is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDEO_PRESENT_SOURCE
 
 
 class StatusGraphicsInvalidVideoPresentTargetError(NTStatusValueError):
-    DESCRIPTION = """The specified video present target is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDEO_PRESENT_TARGET
 
 
 class StatusGraphicsVidpnModalityNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN modality is not supported (for example, at least two of the pinned modes are not co-functional)."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_VIDPN_MODALITY_NOT_SUPPORTED
 
 
 class StatusGraphicsInvalidVidpnSourcemodesetError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN source mode set is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDPN_SOURCEMODESET
 
 
 class StatusGraphicsInvalidVidpnTargetmodesetError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN target mode set is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDPN_TARGETMODESET
 
 
 class StatusGraphicsInvalidFrequencyError(NTStatusValueError):
-    DESCRIPTION = """The specified video signal frequency is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_FREQUENCY
 
 
 class StatusGraphicsInvalidActiveRegionError(NTStatusValueError):
-    DESCRIPTION = """The specified video signal active region is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_ACTIVE_REGION
 
 
 class StatusGraphicsInvalidTotalRegionError(NTStatusValueError):
-    DESCRIPTION = """The specified video signal total region is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_TOTAL_REGION
 
 
 class StatusGraphicsInvalidVideoPresentSourceModeError(NTStatusValueError):
-    DESCRIPTION = """The specified video present source mode is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDEO_PRESENT_SOURCE_MODE
 
 
 class StatusGraphicsInvalidVideoPresentTargetModeError(NTStatusValueError):
-    DESCRIPTION = """The specified video present target mode is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDEO_PRESENT_TARGET_MODE
 
 
 class StatusGraphicsPinnedModeMustRemainInSetError(NTStatusValueError):
-    DESCRIPTION = """The pinned mode must remain in the set on the VidPN's co-functional modality enumeration."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PINNED_MODE_MUST_REMAIN_IN_SET
 
 
 class StatusGraphicsPathAlreadyInTopologyError(NTStatusValueError):
-    DESCRIPTION = """The specified video present path is already in the VidPN's topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PATH_ALREADY_IN_TOPOLOGY
 
 
 class StatusGraphicsModeAlreadyInModesetError(NTStatusValueError):
-    DESCRIPTION = """The specified mode is already in the mode set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MODE_ALREADY_IN_MODESET
 
 
 class StatusGraphicsInvalidVideopresentsourcesetError(NTStatusValueError):
-    DESCRIPTION = """The specified video present source set is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDEOPRESENTSOURCESET
 
 
 class StatusGraphicsInvalidVideopresenttargetsetError(NTStatusValueError):
-    DESCRIPTION = """The specified video present target set is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDEOPRESENTTARGETSET
 
 
 class StatusGraphicsSourceAlreadyInSetError(NTStatusValueError):
-    DESCRIPTION = """The specified video present source is already in the video present source set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_SOURCE_ALREADY_IN_SET
 
 
 class StatusGraphicsTargetAlreadyInSetError(NTStatusValueError):
-    DESCRIPTION = """The specified video present target is already in the video present target set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_TARGET_ALREADY_IN_SET
 
 
 class StatusGraphicsInvalidVidpnPresentPathError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN present path is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDPN_PRESENT_PATH
 
 
 class StatusGraphicsNoRecommendedVidpnTopologyError(NTStatusValueError):
-    DESCRIPTION = """The miniport has no recommendation for augmenting the specified VidPN's topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_RECOMMENDED_VIDPN_TOPOLOGY
 
 
 class StatusGraphicsInvalidMonitorFrequencyrangesetError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor frequency range set is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITOR_FREQUENCYRANGESET
 
 
 class StatusGraphicsInvalidMonitorFrequencyrangeError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor frequency range is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITOR_FREQUENCYRANGE
 
 
 class StatusGraphicsFrequencyrangeNotInSetError(NTStatusValueError):
-    DESCRIPTION = """The specified frequency range is not in the specified monitor frequency range set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_FREQUENCYRANGE_NOT_IN_SET
 
 
 class StatusGraphicsFrequencyrangeAlreadyInSetError(NTStatusValueError):
-    DESCRIPTION = """The specified frequency range is already in the specified monitor frequency range set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_FREQUENCYRANGE_ALREADY_IN_SET
 
 
 class StatusGraphicsStaleModesetError(NTStatusValueError):
-    DESCRIPTION = """The specified mode set is stale. Reacquire the new mode set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_STALE_MODESET
 
 
 class StatusGraphicsInvalidMonitorSourcemodesetError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor source mode set is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITOR_SOURCEMODESET
 
 
 class StatusGraphicsInvalidMonitorSourceModeError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor source mode is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITOR_SOURCE_MODE
 
 
 class StatusGraphicsNoRecommendedFunctionalVidpnError(NTStatusValueError):
-    DESCRIPTION = """The miniport does not have a recommendation regarding the request to provide a functional VidPN given the current display adapter configuration."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_RECOMMENDED_FUNCTIONAL_VIDPN
 
 
 class StatusGraphicsModeIdMustBeUniqueError(NTStatusValueError):
-    DESCRIPTION = """The ID of the specified mode is being used by another mode in the set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MODE_ID_MUST_BE_UNIQUE
 
 
 class StatusGraphicsEmptyAdapterMonitorModeSupportIntersectionError(NTStatusValueError):
-    DESCRIPTION = """The system failed to determine a mode that is supported by both the display adapter and the monitor connected to it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_EMPTY_ADAPTER_MONITOR_MODE_SUPPORT_INTERSECTION
 
 
 class StatusGraphicsVideoPresentTargetsLessThanSourcesError(NTStatusValueError):
-    DESCRIPTION = """The number of video present targets must be greater than or equal to the number of video present sources."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_VIDEO_PRESENT_TARGETS_LESS_THAN_SOURCES
 
 
 class StatusGraphicsPathNotInTopologyError(NTStatusValueError):
-    DESCRIPTION = """The specified present path is not in the VidPN's topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PATH_NOT_IN_TOPOLOGY
 
 
 class StatusGraphicsAdapterMustHaveAtLeastOneSourceError(NTStatusValueError):
-    DESCRIPTION = """The display adapter must have at least one video present source."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ADAPTER_MUST_HAVE_AT_LEAST_ONE_SOURCE
 
 
 class StatusGraphicsAdapterMustHaveAtLeastOneTargetError(NTStatusValueError):
-    DESCRIPTION = """The display adapter must have at least one video present target."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ADAPTER_MUST_HAVE_AT_LEAST_ONE_TARGET
 
 
 class StatusGraphicsInvalidMonitordescriptorsetError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor descriptor set is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITORDESCRIPTORSET
 
 
 class StatusGraphicsInvalidMonitordescriptorError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor descriptor is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITORDESCRIPTOR
 
 
 class StatusGraphicsMonitordescriptorNotInSetError(NTStatusValueError):
-    DESCRIPTION = """The specified descriptor is not in the specified monitor descriptor set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MONITORDESCRIPTOR_NOT_IN_SET
 
 
 class StatusGraphicsMonitordescriptorAlreadyInSetError(NTStatusValueError):
-    DESCRIPTION = """The specified descriptor is already in the specified monitor descriptor set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MONITORDESCRIPTOR_ALREADY_IN_SET
 
 
 class StatusGraphicsMonitordescriptorIdMustBeUniqueError(NTStatusValueError):
-    DESCRIPTION = """The ID of the specified monitor descriptor is being used by another descriptor in the set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MONITORDESCRIPTOR_ID_MUST_BE_UNIQUE
 
 
 class StatusGraphicsInvalidVidpnTargetSubsetTypeError(NTStatusValueError):
-    DESCRIPTION = """The specified video present target subset type is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDPN_TARGET_SUBSET_TYPE
 
 
 class StatusGraphicsResourcesNotRelatedError(NTStatusValueError):
-    DESCRIPTION = """Two or more of the specified resources are not related to each other, as defined by the interface semantics."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_RESOURCES_NOT_RELATED
 
 
 class StatusGraphicsSourceIdMustBeUniqueError(NTStatusValueError):
-    DESCRIPTION = """The ID of the specified video present source is being used by another source in the set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_SOURCE_ID_MUST_BE_UNIQUE
 
 
 class StatusGraphicsTargetIdMustBeUniqueError(NTStatusValueError):
-    DESCRIPTION = """The ID of the specified video present target is being used by another target in the set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_TARGET_ID_MUST_BE_UNIQUE
 
 
 class StatusGraphicsNoAvailableVidpnTargetError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN source cannot be used because there is no available VidPN target to connect it to."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_AVAILABLE_VIDPN_TARGET
 
 
 class StatusGraphicsMonitorCouldNotBeAssociatedWithAdapterError(NTStatusValueError):
-    DESCRIPTION = """The newly arrived monitor could not be associated with a display adapter."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MONITOR_COULD_NOT_BE_ASSOCIATED_WITH_ADAPTER
 
 
 class StatusGraphicsNoVidpnmgrError(NTStatusValueError):
-    DESCRIPTION = """The particular display adapter does not have an associated VidPN manager."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_VIDPNMGR
 
 
 class StatusGraphicsNoActiveVidpnError(NTStatusValueError):
-    DESCRIPTION = """The VidPN manager of the particular display adapter does not have an active VidPN."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_ACTIVE_VIDPN
 
 
 class StatusGraphicsStaleVidpnTopologyError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN topology is stale; obtain the new topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_STALE_VIDPN_TOPOLOGY
 
 
 class StatusGraphicsMonitorNotConnectedError(NTStatusValueError):
-    DESCRIPTION = """No monitor is connected on the specified video present target."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MONITOR_NOT_CONNECTED
 
 
 class StatusGraphicsSourceNotInTopologyError(NTStatusValueError):
-    DESCRIPTION = """The specified source is not part of the specified VidPN's topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_SOURCE_NOT_IN_TOPOLOGY
 
 
 class StatusGraphicsInvalidPrimarysurfaceSizeError(NTStatusValueError):
-    DESCRIPTION = """The specified primary surface size is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_PRIMARYSURFACE_SIZE
 
 
 class StatusGraphicsInvalidVisibleregionSizeError(NTStatusValueError):
-    DESCRIPTION = """The specified visible region size is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VISIBLEREGION_SIZE
 
 
 class StatusGraphicsInvalidStrideError(NTStatusValueError):
-    DESCRIPTION = """The specified stride is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_STRIDE
 
 
 class StatusGraphicsInvalidPixelformatError(NTStatusValueError):
-    DESCRIPTION = """The specified pixel format is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_PIXELFORMAT
 
 
 class StatusGraphicsInvalidColorbasisError(NTStatusValueError):
-    DESCRIPTION = """The specified color basis is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_COLORBASIS
 
 
 class StatusGraphicsInvalidPixelvalueaccessmodeError(NTStatusValueError):
-    DESCRIPTION = """The specified pixel value access mode is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_PIXELVALUEACCESSMODE
 
 
 class StatusGraphicsTargetNotInTopologyError(NTStatusValueError):
-    DESCRIPTION = """The specified target is not part of the specified VidPN's topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_TARGET_NOT_IN_TOPOLOGY
 
 
 class StatusGraphicsNoDisplayModeManagementSupportError(NTStatusValueError):
-    DESCRIPTION = """Failed to acquire the display mode management interface."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_DISPLAY_MODE_MANAGEMENT_SUPPORT
 
 
 class StatusGraphicsVidpnSourceInUseError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN source is already owned by a DMM client and cannot be used until that client releases it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_VIDPN_SOURCE_IN_USE
 
 
 class StatusGraphicsCantAccessActiveVidpnError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN is active and cannot be accessed."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CANT_ACCESS_ACTIVE_VIDPN
 
 
 class StatusGraphicsInvalidPathImportanceOrdinalError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN's present path importance ordinal is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_PATH_IMPORTANCE_ORDINAL
 
 
 class StatusGraphicsInvalidPathContentGeometryTransformationError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN's present path content geometry transformation is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_PATH_CONTENT_GEOMETRY_TRANSFORMATION
 
 
 class StatusGraphicsPathContentGeometryTransformationNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The specified content geometry transformation is not supported on the respective VidPN present path."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PATH_CONTENT_GEOMETRY_TRANSFORMATION_NOT_SUPPORTED
 
 
 class StatusGraphicsInvalidGammaRampError(NTStatusValueError):
-    DESCRIPTION = """The specified gamma ramp is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_GAMMA_RAMP
 
 
 class StatusGraphicsGammaRampNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The specified gamma ramp is not supported on the respective VidPN present path."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_GAMMA_RAMP_NOT_SUPPORTED
 
 
 class StatusGraphicsMultisamplingNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """Multisampling is not supported on the respective VidPN present path."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MULTISAMPLING_NOT_SUPPORTED
 
 
 class StatusGraphicsModeNotInModesetError(NTStatusValueError):
-    DESCRIPTION = """The specified mode is not in the specified mode set."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MODE_NOT_IN_MODESET
 
 
 class StatusGraphicsInvalidVidpnTopologyRecommendationReasonError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN topology recommendation reason is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_VIDPN_TOPOLOGY_RECOMMENDATION_REASON
 
 
 class StatusGraphicsInvalidPathContentTypeError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN present path content type is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_PATH_CONTENT_TYPE
 
 
 class StatusGraphicsInvalidCopyprotectionTypeError(NTStatusValueError):
-    DESCRIPTION = """The specified VidPN present path copy protection type is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_COPYPROTECTION_TYPE
 
 
 class StatusGraphicsUnassignedModesetAlreadyExistsError(NTStatusValueError):
-    DESCRIPTION = """Only one unassigned mode set can exist at any one time for a particular VidPN source or target."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_UNASSIGNED_MODESET_ALREADY_EXISTS
 
 
 class StatusGraphicsInvalidScanlineOrderingError(NTStatusValueError):
-    DESCRIPTION = """The specified scan line ordering type is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_SCANLINE_ORDERING
 
 
 class StatusGraphicsTopologyChangesNotAllowedError(NTStatusValueError):
-    DESCRIPTION = """The topology changes are not allowed for the specified VidPN."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_TOPOLOGY_CHANGES_NOT_ALLOWED
 
 
 class StatusGraphicsNoAvailableImportanceOrdinalsError(NTStatusValueError):
-    DESCRIPTION = """All available importance ordinals are being used in the specified topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_AVAILABLE_IMPORTANCE_ORDINALS
 
 
 class StatusGraphicsIncompatiblePrivateFormatError(NTStatusValueError):
-    DESCRIPTION = """The specified primary surface has a different private-format attribute than the current primary surface."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INCOMPATIBLE_PRIVATE_FORMAT
 
 
 class StatusGraphicsInvalidModePruningAlgorithmError(NTStatusValueError):
-    DESCRIPTION = """The specified mode-pruning algorithm is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MODE_PRUNING_ALGORITHM
 
 
 class StatusGraphicsInvalidMonitorCapabilityOriginError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor-capability origin is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITOR_CAPABILITY_ORIGIN
 
 
 class StatusGraphicsInvalidMonitorFrequencyrangeConstraintError(NTStatusValueError):
-    DESCRIPTION = """The specified monitor-frequency range constraint is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_MONITOR_FREQUENCYRANGE_CONSTRAINT
 
 
 class StatusGraphicsMaxNumPathsReachedError(NTStatusValueError):
-    DESCRIPTION = """The maximum supported number of present paths has been reached."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MAX_NUM_PATHS_REACHED
 
 
 class StatusGraphicsCancelVidpnTopologyAugmentationError(NTStatusValueError):
-    DESCRIPTION = """The miniport requested that augmentation be canceled for the specified source of the specified VidPN's topology."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CANCEL_VIDPN_TOPOLOGY_AUGMENTATION
 
 
 class StatusGraphicsInvalidClientTypeError(NTStatusValueError):
-    DESCRIPTION = """The specified client type was not recognized."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_CLIENT_TYPE
 
 
 class StatusGraphicsClientvidpnNotSetError(NTStatusValueError):
-    DESCRIPTION = """The client VidPN is not set on this adapter (for example, no user mode-initiated mode changes have taken place on this adapter)."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CLIENTVIDPN_NOT_SET
 
 
 class StatusGraphicsSpecifiedChildAlreadyConnectedError(NTStatusValueError):
-    DESCRIPTION = """The specified display adapter child device already has an external device connected to it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_SPECIFIED_CHILD_ALREADY_CONNECTED
 
 
 class StatusGraphicsChildDescriptorNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The display adapter child device does not support reporting a descriptor."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CHILD_DESCRIPTOR_NOT_SUPPORTED
 
 
 class StatusGraphicsNotALinkedAdapterError(NTStatusValueError):
-    DESCRIPTION = """The display adapter is not linked to any other adapters."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NOT_A_LINKED_ADAPTER
 
 
 class StatusGraphicsLeadlinkNotEnumeratedError(NTStatusValueError):
-    DESCRIPTION = """The lead adapter in a linked configuration was not enumerated yet."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_LEADLINK_NOT_ENUMERATED
 
 
 class StatusGraphicsChainlinksNotEnumeratedError(NTStatusValueError):
-    DESCRIPTION = """Some chain adapters in a linked configuration have not yet been enumerated."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CHAINLINKS_NOT_ENUMERATED
 
 
 class StatusGraphicsAdapterChainNotReadyError(NTStatusValueError):
-    DESCRIPTION = """The chain of linked adapters is not ready to start because of an unknown failure."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ADAPTER_CHAIN_NOT_READY
 
 
 class StatusGraphicsChainlinksNotStartedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to start a lead link display adapter when the chain links had not yet started."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CHAINLINKS_NOT_STARTED
 
 
 class StatusGraphicsChainlinksNotPoweredOnError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to turn on a lead link display adapter when the chain links were turned off."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_CHAINLINKS_NOT_POWERED_ON
 
 
 class StatusGraphicsInconsistentDeviceLinkStateError(NTStatusValueError):
-    DESCRIPTION = """The adapter link was found in an inconsistent state. Not all adapters are in an expected PNP/power state."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INCONSISTENT_DEVICE_LINK_STATE
 
 
 class StatusGraphicsNotPostDeviceDriverError(NTStatusValueError):
-    DESCRIPTION = """The driver trying to start is not the same as the driver for the posted display adapter."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NOT_POST_DEVICE_DRIVER
 
 
 class StatusGraphicsAdapterAccessNotExcludedError(NTStatusValueError):
-    DESCRIPTION = """An operation is being attempted that requires the display adapter to be in a quiescent state."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ADAPTER_ACCESS_NOT_EXCLUDED
 
 
 class StatusGraphicsOpmNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The driver does not support OPM."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_NOT_SUPPORTED
 
 
 class StatusGraphicsCoppNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The driver does not support COPP."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_COPP_NOT_SUPPORTED
 
 
 class StatusGraphicsUabNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The driver does not support UAB."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_UAB_NOT_SUPPORTED
 
 
 class StatusGraphicsOpmInvalidEncryptedParametersError(NTStatusValueError):
-    DESCRIPTION = """The specified encrypted parameters are invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_INVALID_ENCRYPTED_PARAMETERS
 
 
 class StatusGraphicsOpmParameterArrayTooSmallError(NTStatusValueError):
-    DESCRIPTION = """An array passed to a function cannot hold all of the data that the function wants to put in it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_PARAMETER_ARRAY_TOO_SMALL
 
 
 class StatusGraphicsOpmNoProtectedOutputsExistError(NTStatusValueError):
-    DESCRIPTION = """The GDI display device passed to this function does not have any active protected outputs."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_NO_PROTECTED_OUTPUTS_EXIST
 
 
 class StatusGraphicsPvpNoDisplayDeviceCorrespondsToNameError(NTStatusValueError):
-    DESCRIPTION = """The PVP cannot find an actual GDI display device that corresponds to the passed-in GDI display device name."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PVP_NO_DISPLAY_DEVICE_CORRESPONDS_TO_NAME
 
 
 class StatusGraphicsPvpDisplayDeviceNotAttachedToDesktopError(NTStatusValueError):
-    DESCRIPTION = """This function failed because the GDI display device passed to it was not attached to the Windows desktop."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PVP_DISPLAY_DEVICE_NOT_ATTACHED_TO_DESKTOP
 
 
 class StatusGraphicsPvpMirroringDevicesNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The PVP does not support mirroring display devices because they do not have any protected outputs."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PVP_MIRRORING_DEVICES_NOT_SUPPORTED
 
 
 class StatusGraphicsOpmInvalidPointerError(NTStatusValueError):
-    DESCRIPTION = """The function failed because an invalid pointer parameter was passed to it. A pointer parameter is invalid if it is null, is not correctly aligned, or it points to an invalid address or a kernel mode address."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_INVALID_POINTER
 
 
 class StatusGraphicsOpmInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """An internal error caused an operation to fail."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_INTERNAL_ERROR
 
 
 class StatusGraphicsOpmInvalidHandleError(NTStatusValueError):
-    DESCRIPTION = """The function failed because the caller passed in an invalid OPM user-mode handle."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_INVALID_HANDLE
 
 
 class StatusGraphicsPvpNoMonitorsCorrespondToDisplayDeviceError(NTStatusValueError):
-    DESCRIPTION = """This function failed because the GDI device passed to it did not have any monitors associated with it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PVP_NO_MONITORS_CORRESPOND_TO_DISPLAY_DEVICE
 
 
 class StatusGraphicsPvpInvalidCertificateLengthError(NTStatusValueError):
-    DESCRIPTION = """A certificate could not be returned because the certificate buffer passed to the function was too small."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PVP_INVALID_CERTIFICATE_LENGTH
 
 
 class StatusGraphicsOpmSpanningModeEnabledError(NTStatusValueError):
-    DESCRIPTION = """DxgkDdiOpmCreateProtectedOutput() could not create a protected output because the video present yarget is in spanning mode."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_SPANNING_MODE_ENABLED
 
 
 class StatusGraphicsOpmTheaterModeEnabledError(NTStatusValueError):
-    DESCRIPTION = """DxgkDdiOpmCreateProtectedOutput() could not create a protected output because the video present target is in theater mode."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_THEATER_MODE_ENABLED
 
 
 class StatusGraphicsPvpHfsFailedError(NTStatusValueError):
-    DESCRIPTION = """The function call failed because the display adapter's hardware functionality scan (HFS) failed to validate the graphics hardware."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PVP_HFS_FAILED
 
 
 class StatusGraphicsOpmInvalidSrmError(NTStatusValueError):
-    DESCRIPTION = """The HDCP SRM passed to this function did not comply with section 5 of the HDCP 1.1 specification."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_INVALID_SRM
 
 
 class StatusGraphicsOpmOutputDoesNotSupportHdcpError(NTStatusValueError):
-    DESCRIPTION = """The protected output cannot enable the HDCP system because it does not support it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_OUTPUT_DOES_NOT_SUPPORT_HDCP
 
 
 class StatusGraphicsOpmOutputDoesNotSupportAcpError(NTStatusValueError):
-    DESCRIPTION = """The protected output cannot enable analog copy protection because it does not support it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_OUTPUT_DOES_NOT_SUPPORT_ACP
 
 
 class StatusGraphicsOpmOutputDoesNotSupportCgmsaError(NTStatusValueError):
-    DESCRIPTION = """The protected output cannot enable the CGMS-A protection technology because it does not support it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_OUTPUT_DOES_NOT_SUPPORT_CGMSA
 
 
 class StatusGraphicsOpmHdcpSrmNeverSetError(NTStatusValueError):
-    DESCRIPTION = """DxgkDdiOPMGetInformation() cannot return the version of the SRM being used because the application never successfully passed an SRM to the protected output."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_HDCP_SRM_NEVER_SET
 
 
 class StatusGraphicsOpmResolutionTooHighError(NTStatusValueError):
-    DESCRIPTION = """DxgkDdiOPMConfigureProtectedOutput() cannot enable the specified output protection technology because the output's screen resolution is too high."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_RESOLUTION_TOO_HIGH
 
 
 class StatusGraphicsOpmAllHdcpHardwareAlreadyInUseError(NTStatusValueError):
-    DESCRIPTION = """DxgkDdiOPMConfigureProtectedOutput() cannot enable HDCP because other physical outputs are using the display adapter's HDCP hardware."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_ALL_HDCP_HARDWARE_ALREADY_IN_USE
 
 
 class StatusGraphicsOpmProtectedOutputNoLongerExistsError(NTStatusValueError):
-    DESCRIPTION = """The operating system asynchronously destroyed this OPM-protected output because the operating system state changed. This error typically occurs because the monitor PDO associated with this protected output was removed or stopped, the protected output's session became a nonconsole session, or the protected output's desktop became inactive."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_PROTECTED_OUTPUT_NO_LONGER_EXISTS
 
 
 class StatusGraphicsOpmSessionTypeChangeInProgressError(NTStatusValueError):
-    DESCRIPTION = """OPM functions cannot be called when a session is changing its type. Three types of sessions currently exist: console, disconnected, and remote (RDP or ICA)."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_SESSION_TYPE_CHANGE_IN_PROGRESS
 
 
 class StatusGraphicsOpmProtectedOutputDoesNotHaveCoppSemanticsError(NTStatusValueError):
-    DESCRIPTION = """The DxgkDdiOPMGetCOPPCompatibleInformation, DxgkDdiOPMGetInformation, or DxgkDdiOPMConfigureProtectedOutput function failed. This error is returned only if a protected output has OPM semantics.
-
-DxgkDdiOPMGetCOPPCompatibleInformation always returns this error if a protected output has OPM semantics.
-
-DxgkDdiOPMGetInformation returns this error code if the caller requested COPP-specific information.
-
-DxgkDdiOPMConfigureProtectedOutput returns this error when the caller tries to use a COPP-specific command."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_PROTECTED_OUTPUT_DOES_NOT_HAVE_COPP_SEMANTICS
 
 
 class StatusGraphicsOpmInvalidInformationRequestError(NTStatusValueError):
-    DESCRIPTION = """The DxgkDdiOPMGetInformation and DxgkDdiOPMGetCOPPCompatibleInformation functions return this error code if the passed-in sequence number is not the expected sequence number or the passed-in OMAC value is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_INVALID_INFORMATION_REQUEST
 
 
 class StatusGraphicsOpmDriverInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """The function failed because an unexpected error occurred inside a display driver."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_DRIVER_INTERNAL_ERROR
 
 
 class StatusGraphicsOpmProtectedOutputDoesNotHaveOpmSemanticsError(NTStatusValueError):
-    DESCRIPTION = """The DxgkDdiOPMGetCOPPCompatibleInformation, DxgkDdiOPMGetInformation, or DxgkDdiOPMConfigureProtectedOutput function failed. This error is returned only if a protected output has COPP semantics.
-
-DxgkDdiOPMGetCOPPCompatibleInformation returns this error code if the caller requested OPM-specific information.
-
-DxgkDdiOPMGetInformation always returns this error if a protected output has COPP semantics.
-
-DxgkDdiOPMConfigureProtectedOutput returns this error when the caller tries to use an OPM-specific command."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_PROTECTED_OUTPUT_DOES_NOT_HAVE_OPM_SEMANTICS
 
 
 class StatusGraphicsOpmSignalingNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The DxgkDdiOPMGetCOPPCompatibleInformation and DxgkDdiOPMConfigureProtectedOutput functions return this error if the display driver does not support the DXGKMDT_OPM_GET_ACP_AND_CGMSA_SIGNALING and DXGKMDT_OPM_SET_ACP_AND_CGMSA_SIGNALING GUIDs."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_SIGNALING_NOT_SUPPORTED
 
 
 class StatusGraphicsOpmInvalidConfigurationRequestError(NTStatusValueError):
-    DESCRIPTION = """The DxgkDdiOPMConfigureProtectedOutput function returns this error code if the passed-in sequence number is not the expected sequence number or the passed-in OMAC value is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_OPM_INVALID_CONFIGURATION_REQUEST
 
 
 class StatusGraphicsI2cNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The monitor connected to the specified video output does not have an I2C bus."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_I2C_NOT_SUPPORTED
 
 
 class StatusGraphicsI2cDeviceDoesNotExistError(NTStatusValueError):
-    DESCRIPTION = """No device on the I2C bus has the specified address."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_I2C_DEVICE_DOES_NOT_EXIST
 
 
 class StatusGraphicsI2cErrorTransmittingDataError(NTStatusValueError):
-    DESCRIPTION = """An error occurred while transmitting data to the device on the I2C bus."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_I2C_ERROR_TRANSMITTING_DATA
 
 
 class StatusGraphicsI2cErrorReceivingDataError(NTStatusValueError):
-    DESCRIPTION = """An error occurred while receiving data from the device on the I2C bus."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_I2C_ERROR_RECEIVING_DATA
 
 
 class StatusGraphicsDdcciVcpNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The monitor does not support the specified VCP code."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DDCCI_VCP_NOT_SUPPORTED
 
 
 class StatusGraphicsDdcciInvalidDataError(NTStatusValueError):
-    DESCRIPTION = """The data received from the monitor is invalid."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DDCCI_INVALID_DATA
 
 
 class StatusGraphicsDdcciMonitorReturnedInvalidTimingStatusByteError(NTStatusValueError):
-    DESCRIPTION = """A function call failed because a monitor returned an invalid timing status byte when the operating system used the DDC/CI get timing report and timing message command to get a timing report from a monitor."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DDCCI_MONITOR_RETURNED_INVALID_TIMING_STATUS_BYTE
 
 
 class StatusGraphicsDdcciInvalidCapabilitiesStringError(NTStatusValueError):
-    DESCRIPTION = """A monitor returned a DDC/CI capabilities string that did not comply with the ACCESS.bus 3.0, DDC/CI 1.1, or MCCS 2 Revision 1 specification."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DDCCI_INVALID_CAPABILITIES_STRING
 
 
 class StatusGraphicsMcaInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """An internal error caused an operation to fail."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MCA_INTERNAL_ERROR
 
 
 class StatusGraphicsDdcciInvalidMessageCommandError(NTStatusValueError):
-    DESCRIPTION = """An operation failed because a DDC/CI message had an invalid value in its command field."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DDCCI_INVALID_MESSAGE_COMMAND
 
 
 class StatusGraphicsDdcciInvalidMessageLengthError(NTStatusValueError):
-    DESCRIPTION = """This error occurred because a DDC/CI message had an invalid value in its length field."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DDCCI_INVALID_MESSAGE_LENGTH
 
 
 class StatusGraphicsDdcciInvalidMessageChecksumError(NTStatusValueError):
-    DESCRIPTION = """This error occurred because the value in a DDC/CI message's checksum field did not match the message's computed checksum value. This error implies that the data was corrupted while it was being transmitted from a monitor to a computer."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DDCCI_INVALID_MESSAGE_CHECKSUM
 
 
 class StatusGraphicsInvalidPhysicalMonitorHandleError(NTStatusValueError):
-    DESCRIPTION = """This function failed because an invalid monitor handle was passed to it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_PHYSICAL_MONITOR_HANDLE
 
 
 class StatusGraphicsMonitorNoLongerExistsError(NTStatusValueError):
-    DESCRIPTION = """The operating system asynchronously destroyed the monitor that corresponds to this handle because the operating system's state changed. This error typically occurs because the monitor PDO associated with this handle was removed or stopped, or a display mode change occurred. A display mode change occurs when Windows sends a WM_DISPLAYCHANGE message to applications."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MONITOR_NO_LONGER_EXISTS
 
 
 class StatusGraphicsOnlyConsoleSessionSupportedError(NTStatusValueError):
-    DESCRIPTION = """This function can be used only if a program is running in the local console session. It cannot be used if a program is running on a remote desktop session or on a terminal server session."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_ONLY_CONSOLE_SESSION_SUPPORTED
 
 
 class StatusGraphicsNoDisplayDeviceCorrespondsToNameError(NTStatusValueError):
-    DESCRIPTION = """This function cannot find an actual GDI display device that corresponds to the specified GDI display device name."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_DISPLAY_DEVICE_CORRESPONDS_TO_NAME
 
 
 class StatusGraphicsDisplayDeviceNotAttachedToDesktopError(NTStatusValueError):
-    DESCRIPTION = """The function failed because the specified GDI display device was not attached to the Windows desktop."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_DISPLAY_DEVICE_NOT_ATTACHED_TO_DESKTOP
 
 
 class StatusGraphicsMirroringDevicesNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """This function does not support GDI mirroring display devices because GDI mirroring display devices do not have any physical monitors associated with them."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_MIRRORING_DEVICES_NOT_SUPPORTED
 
 
 class StatusGraphicsInvalidPointerError(NTStatusValueError):
-    DESCRIPTION = """The function failed because an invalid pointer parameter was passed to it. A pointer parameter is invalid if it is null, is not correctly aligned, or points to an invalid address or to a kernel mode address."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INVALID_POINTER
 
 
 class StatusGraphicsNoMonitorsCorrespondToDisplayDeviceError(NTStatusValueError):
-    DESCRIPTION = """This function failed because the GDI device passed to it did not have a monitor associated with it."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_NO_MONITORS_CORRESPOND_TO_DISPLAY_DEVICE
 
 
 class StatusGraphicsParameterArrayTooSmallError(NTStatusValueError):
-    DESCRIPTION = """An array passed to the function cannot hold all of the data that the function must copy into the array."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_PARAMETER_ARRAY_TOO_SMALL
 
 
 class StatusGraphicsInternalErrorError(NTStatusValueError):
-    DESCRIPTION = """An internal error caused an operation to fail."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_INTERNAL_ERROR
 
 
 class StatusGraphicsSessionTypeChangeInProgressError(NTStatusValueError):
-    DESCRIPTION = """The function failed because the current session is changing its type. This function cannot be called when the current session is changing its type. Three types of sessions currently exist: console, disconnected, and remote (RDP or ICA)."""
     NT_STATUS = NTStatusValue.STATUS_GRAPHICS_SESSION_TYPE_CHANGE_IN_PROGRESS
 
 
 class StatusFveLockedVolumeError(NTStatusValueError):
-    DESCRIPTION = """The volume must be unlocked before it can be used."""
     NT_STATUS = NTStatusValue.STATUS_FVE_LOCKED_VOLUME
 
 
 class StatusFveNotEncryptedError(NTStatusValueError):
-    DESCRIPTION = """The volume is fully decrypted and no key is available."""
     NT_STATUS = NTStatusValue.STATUS_FVE_NOT_ENCRYPTED
 
 
 class StatusFveBadInformationError(NTStatusValueError):
-    DESCRIPTION = """The control block for the encrypted volume is not valid."""
     NT_STATUS = NTStatusValue.STATUS_FVE_BAD_INFORMATION
 
 
 class StatusFveTooSmallError(NTStatusValueError):
-    DESCRIPTION = """Not enough free space remains on the volume to allow encryption."""
     NT_STATUS = NTStatusValue.STATUS_FVE_TOO_SMALL
 
 
 class StatusFveFailedWrongFsError(NTStatusValueError):
-    DESCRIPTION = """The partition cannot be encrypted because the file system is not supported."""
     NT_STATUS = NTStatusValue.STATUS_FVE_FAILED_WRONG_FS
 
 
 class StatusFveFailedBadFsError(NTStatusValueError):
-    DESCRIPTION = """The file system is inconsistent. Run the Check Disk utility."""
     NT_STATUS = NTStatusValue.STATUS_FVE_FAILED_BAD_FS
 
 
 class StatusFveFsNotExtendedError(NTStatusValueError):
-    DESCRIPTION = """The file system does not extend to the end of the volume."""
     NT_STATUS = NTStatusValue.STATUS_FVE_FS_NOT_EXTENDED
 
 
 class StatusFveFsMountedError(NTStatusValueError):
-    DESCRIPTION = """This operation cannot be performed while a file system is mounted on the volume."""
     NT_STATUS = NTStatusValue.STATUS_FVE_FS_MOUNTED
 
 
 class StatusFveNoLicenseError(NTStatusValueError):
-    DESCRIPTION = """BitLocker Drive Encryption is not included with this version of Windows."""
     NT_STATUS = NTStatusValue.STATUS_FVE_NO_LICENSE
 
 
 class StatusFveActionNotAllowedError(NTStatusValueError):
-    DESCRIPTION = """The requested action was denied by the FVE control engine."""
     NT_STATUS = NTStatusValue.STATUS_FVE_ACTION_NOT_ALLOWED
 
 
 class StatusFveBadDataError(NTStatusValueError):
-    DESCRIPTION = """The data supplied is malformed."""
     NT_STATUS = NTStatusValue.STATUS_FVE_BAD_DATA
 
 
 class StatusFveVolumeNotBoundError(NTStatusValueError):
-    DESCRIPTION = """The volume is not bound to the system."""
     NT_STATUS = NTStatusValue.STATUS_FVE_VOLUME_NOT_BOUND
 
 
 class StatusFveNotDataVolumeError(NTStatusValueError):
-    DESCRIPTION = """The volume specified is not a data volume."""
     NT_STATUS = NTStatusValue.STATUS_FVE_NOT_DATA_VOLUME
 
 
 class StatusFveConvReadErrorError(NTStatusValueError):
-    DESCRIPTION = """A read operation failed while converting the volume."""
     NT_STATUS = NTStatusValue.STATUS_FVE_CONV_READ_ERROR
 
 
 class StatusFveConvWriteErrorError(NTStatusValueError):
-    DESCRIPTION = """A write operation failed while converting the volume."""
     NT_STATUS = NTStatusValue.STATUS_FVE_CONV_WRITE_ERROR
 
 
 class StatusFveOverlappedUpdateError(NTStatusValueError):
-    DESCRIPTION = """The control block for the encrypted volume was updated by another thread. Try again."""
     NT_STATUS = NTStatusValue.STATUS_FVE_OVERLAPPED_UPDATE
 
 
 class StatusFveFailedSectorSizeError(NTStatusValueError):
-    DESCRIPTION = """The volume encryption algorithm cannot be used on this sector size."""
     NT_STATUS = NTStatusValue.STATUS_FVE_FAILED_SECTOR_SIZE
 
 
 class StatusFveFailedAuthenticationError(NTStatusValueError):
-    DESCRIPTION = """BitLocker recovery authentication failed."""
     NT_STATUS = NTStatusValue.STATUS_FVE_FAILED_AUTHENTICATION
 
 
 class StatusFveNotOsVolumeError(NTStatusValueError):
-    DESCRIPTION = """The volume specified is not the boot operating system volume."""
     NT_STATUS = NTStatusValue.STATUS_FVE_NOT_OS_VOLUME
 
 
 class StatusFveKeyfileNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The BitLocker startup key or recovery password could not be read from external media."""
     NT_STATUS = NTStatusValue.STATUS_FVE_KEYFILE_NOT_FOUND
 
 
 class StatusFveKeyfileInvalidError(NTStatusValueError):
-    DESCRIPTION = """The BitLocker startup key or recovery password file is corrupt or invalid."""
     NT_STATUS = NTStatusValue.STATUS_FVE_KEYFILE_INVALID
 
 
 class StatusFveKeyfileNoVmkError(NTStatusValueError):
-    DESCRIPTION = """The BitLocker encryption key could not be obtained from the startup key or the recovery password."""
     NT_STATUS = NTStatusValue.STATUS_FVE_KEYFILE_NO_VMK
 
 
 class StatusFveTpmDisabledError(NTStatusValueError):
-    DESCRIPTION = """The TPM is disabled."""
     NT_STATUS = NTStatusValue.STATUS_FVE_TPM_DISABLED
 
 
 class StatusFveTpmSrkAuthNotZeroError(NTStatusValueError):
-    DESCRIPTION = """The authorization data for the SRK of the TPM is not zero."""
     NT_STATUS = NTStatusValue.STATUS_FVE_TPM_SRK_AUTH_NOT_ZERO
 
 
 class StatusFveTpmInvalidPcrError(NTStatusValueError):
-    DESCRIPTION = """The system boot information changed or the TPM locked out access to BitLocker encryption keys until the computer is restarted."""
     NT_STATUS = NTStatusValue.STATUS_FVE_TPM_INVALID_PCR
 
 
 class StatusFveTpmNoVmkError(NTStatusValueError):
-    DESCRIPTION = """The BitLocker encryption key could not be obtained from the TPM."""
     NT_STATUS = NTStatusValue.STATUS_FVE_TPM_NO_VMK
 
 
 class StatusFvePinInvalidError(NTStatusValueError):
-    DESCRIPTION = """The BitLocker encryption key could not be obtained from the TPM and PIN."""
     NT_STATUS = NTStatusValue.STATUS_FVE_PIN_INVALID
 
 
 class StatusFveAuthInvalidApplicationError(NTStatusValueError):
-    DESCRIPTION = """A boot application hash does not match the hash computed when BitLocker was turned on."""
     NT_STATUS = NTStatusValue.STATUS_FVE_AUTH_INVALID_APPLICATION
 
 
 class StatusFveAuthInvalidConfigError(NTStatusValueError):
-    DESCRIPTION = """The Boot Configuration Data (BCD) settings are not supported or have changed because BitLocker was enabled."""
     NT_STATUS = NTStatusValue.STATUS_FVE_AUTH_INVALID_CONFIG
 
 
 class StatusFveDebuggerEnabledError(NTStatusValueError):
-    DESCRIPTION = """Boot debugging is enabled. Run Windows Boot Configuration Data Store Editor (bcdedit.exe) to turn it off."""
     NT_STATUS = NTStatusValue.STATUS_FVE_DEBUGGER_ENABLED
 
 
 class StatusFveDryRunFailedError(NTStatusValueError):
-    DESCRIPTION = """The BitLocker encryption key could not be obtained."""
     NT_STATUS = NTStatusValue.STATUS_FVE_DRY_RUN_FAILED
 
 
 class StatusFveBadMetadataPointerError(NTStatusValueError):
-    DESCRIPTION = """The metadata disk region pointer is incorrect."""
     NT_STATUS = NTStatusValue.STATUS_FVE_BAD_METADATA_POINTER
 
 
 class StatusFveOldMetadataCopyError(NTStatusValueError):
-    DESCRIPTION = """The backup copy of the metadata is out of date."""
     NT_STATUS = NTStatusValue.STATUS_FVE_OLD_METADATA_COPY
 
 
 class StatusFveRebootRequiredError(NTStatusValueError):
-    DESCRIPTION = """No action was taken because a system restart is required."""
     NT_STATUS = NTStatusValue.STATUS_FVE_REBOOT_REQUIRED
 
 
 class StatusFveRawAccessError(NTStatusValueError):
-    DESCRIPTION = """No action was taken because BitLocker Drive Encryption is in RAW access mode."""
     NT_STATUS = NTStatusValue.STATUS_FVE_RAW_ACCESS
 
 
 class StatusFveRawBlockedError(NTStatusValueError):
-    DESCRIPTION = """BitLocker Drive Encryption cannot enter RAW access mode for this volume."""
     NT_STATUS = NTStatusValue.STATUS_FVE_RAW_BLOCKED
 
 
 class StatusFveNoFeatureLicenseError(NTStatusValueError):
-    DESCRIPTION = """This feature of BitLocker Drive Encryption is not included with this version of Windows."""
     NT_STATUS = NTStatusValue.STATUS_FVE_NO_FEATURE_LICENSE
 
 
 class StatusFvePolicyUserDisableRdvNotAllowedError(NTStatusValueError):
-    DESCRIPTION = """Group policy does not permit turning off BitLocker Drive Encryption on roaming data volumes."""
     NT_STATUS = NTStatusValue.STATUS_FVE_POLICY_USER_DISABLE_RDV_NOT_ALLOWED
 
 
 class StatusFveConvRecoveryFailedError(NTStatusValueError):
-    DESCRIPTION = """Bitlocker Drive Encryption failed to recover from aborted conversion. This could be due to either all conversion logs being corrupted or the media being write-protected."""
     NT_STATUS = NTStatusValue.STATUS_FVE_CONV_RECOVERY_FAILED
 
 
 class StatusFveVirtualizedSpaceTooBigError(NTStatusValueError):
-    DESCRIPTION = """The requested virtualization size is too big."""
     NT_STATUS = NTStatusValue.STATUS_FVE_VIRTUALIZED_SPACE_TOO_BIG
 
 
 class StatusFveVolumeTooSmallError(NTStatusValueError):
-    DESCRIPTION = """The drive is too small to be protected using BitLocker Drive Encryption."""
     NT_STATUS = NTStatusValue.STATUS_FVE_VOLUME_TOO_SMALL
 
 
 class StatusFwpCalloutNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The callout does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_CALLOUT_NOT_FOUND
 
 
 class StatusFwpConditionNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The filter condition does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_CONDITION_NOT_FOUND
 
 
 class StatusFwpFilterNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The filter does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_FILTER_NOT_FOUND
 
 
 class StatusFwpLayerNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The layer does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_LAYER_NOT_FOUND
 
 
 class StatusFwpProviderNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The provider does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_PROVIDER_NOT_FOUND
 
 
 class StatusFwpProviderContextNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The provider context does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_PROVIDER_CONTEXT_NOT_FOUND
 
 
 class StatusFwpSublayerNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The sublayer does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_SUBLAYER_NOT_FOUND
 
 
 class StatusFwpNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The object does not exist."""
     NT_STATUS = NTStatusValue.STATUS_FWP_NOT_FOUND
 
 
 class StatusFwpAlreadyExistsError(NTStatusValueError):
-    DESCRIPTION = """An object with that GUID or LUID already exists."""
     NT_STATUS = NTStatusValue.STATUS_FWP_ALREADY_EXISTS
 
 
 class StatusFwpInUseError(NTStatusValueError):
-    DESCRIPTION = """The object is referenced by other objects and cannot be deleted."""
     NT_STATUS = NTStatusValue.STATUS_FWP_IN_USE
 
 
 class StatusFwpDynamicSessionInProgressError(NTStatusValueError):
-    DESCRIPTION = """The call is not allowed from within a dynamic session."""
     NT_STATUS = NTStatusValue.STATUS_FWP_DYNAMIC_SESSION_IN_PROGRESS
 
 
 class StatusFwpWrongSessionError(NTStatusValueError):
-    DESCRIPTION = """The call was made from the wrong session and cannot be completed."""
     NT_STATUS = NTStatusValue.STATUS_FWP_WRONG_SESSION
 
 
 class StatusFwpNoTxnInProgressError(NTStatusValueError):
-    DESCRIPTION = """The call must be made from within an explicit transaction."""
     NT_STATUS = NTStatusValue.STATUS_FWP_NO_TXN_IN_PROGRESS
 
 
 class StatusFwpTxnInProgressError(NTStatusValueError):
-    DESCRIPTION = """The call is not allowed from within an explicit transaction."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TXN_IN_PROGRESS
 
 
 class StatusFwpTxnAbortedError(NTStatusValueError):
-    DESCRIPTION = """The explicit transaction has been forcibly canceled."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TXN_ABORTED
 
 
 class StatusFwpSessionAbortedError(NTStatusValueError):
-    DESCRIPTION = """The session has been canceled."""
     NT_STATUS = NTStatusValue.STATUS_FWP_SESSION_ABORTED
 
 
 class StatusFwpIncompatibleTxnError(NTStatusValueError):
-    DESCRIPTION = """The call is not allowed from within a read-only transaction."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INCOMPATIBLE_TXN
 
 
 class StatusFwpTimeoutError(NTStatusValueError):
-    DESCRIPTION = """The call timed out while waiting to acquire the transaction lock."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TIMEOUT
 
 
 class StatusFwpNetEventsDisabledError(NTStatusValueError):
-    DESCRIPTION = """The collection of network diagnostic events is disabled."""
     NT_STATUS = NTStatusValue.STATUS_FWP_NET_EVENTS_DISABLED
 
 
 class StatusFwpIncompatibleLayerError(NTStatusValueError):
-    DESCRIPTION = """The operation is not supported by the specified layer."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INCOMPATIBLE_LAYER
 
 
 class StatusFwpKmClientsOnlyError(NTStatusValueError):
-    DESCRIPTION = """The call is allowed for kernel-mode callers only."""
     NT_STATUS = NTStatusValue.STATUS_FWP_KM_CLIENTS_ONLY
 
 
 class StatusFwpLifetimeMismatchError(NTStatusValueError):
-    DESCRIPTION = """The call tried to associate two objects with incompatible lifetimes."""
     NT_STATUS = NTStatusValue.STATUS_FWP_LIFETIME_MISMATCH
 
 
 class StatusFwpBuiltinObjectError(NTStatusValueError):
-    DESCRIPTION = """The object is built-in and cannot be deleted."""
     NT_STATUS = NTStatusValue.STATUS_FWP_BUILTIN_OBJECT
 
 
 class StatusFwpTooManyBoottimeFiltersError(NTStatusValueError):
-    DESCRIPTION = """The maximum number of boot-time filters has been reached."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TOO_MANY_BOOTTIME_FILTERS
 
 
 class StatusFwpTooManyCalloutsError(NTStatusValueError):
-    DESCRIPTION = """The maximum number of callouts has been reached."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TOO_MANY_CALLOUTS
 
 
 class StatusFwpNotificationDroppedError(NTStatusValueError):
-    DESCRIPTION = """A notification could not be delivered because a message queue has reached maximum capacity."""
     NT_STATUS = NTStatusValue.STATUS_FWP_NOTIFICATION_DROPPED
 
 
 class StatusFwpTrafficMismatchError(NTStatusValueError):
-    DESCRIPTION = """The traffic parameters do not match those for the security association context."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TRAFFIC_MISMATCH
 
 
 class StatusFwpIncompatibleSaStateError(NTStatusValueError):
-    DESCRIPTION = """The call is not allowed for the current security association state."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INCOMPATIBLE_SA_STATE
 
 
 class StatusFwpNullPointerError(NTStatusValueError):
-    DESCRIPTION = """A required pointer is null."""
     NT_STATUS = NTStatusValue.STATUS_FWP_NULL_POINTER
 
 
 class StatusFwpInvalidEnumeratorError(NTStatusValueError):
-    DESCRIPTION = """An enumerator is not valid."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_ENUMERATOR
 
 
 class StatusFwpInvalidFlagsError(NTStatusValueError):
-    DESCRIPTION = """The flags field contains an invalid value."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_FLAGS
 
 
 class StatusFwpInvalidNetMaskError(NTStatusValueError):
-    DESCRIPTION = """A network mask is not valid."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_NET_MASK
 
 
 class StatusFwpInvalidRangeError(NTStatusValueError):
-    DESCRIPTION = """An FWP_RANGE is not valid."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_RANGE
 
 
 class StatusFwpInvalidIntervalError(NTStatusValueError):
-    DESCRIPTION = """The time interval is not valid."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_INTERVAL
 
 
 class StatusFwpZeroLengthArrayError(NTStatusValueError):
-    DESCRIPTION = """An array that must contain at least one element has a zero length."""
     NT_STATUS = NTStatusValue.STATUS_FWP_ZERO_LENGTH_ARRAY
 
 
 class StatusFwpNullDisplayNameError(NTStatusValueError):
-    DESCRIPTION = """The displayData.name field cannot be null."""
     NT_STATUS = NTStatusValue.STATUS_FWP_NULL_DISPLAY_NAME
 
 
 class StatusFwpInvalidActionTypeError(NTStatusValueError):
-    DESCRIPTION = """The action type is not one of the allowed action types for a filter."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_ACTION_TYPE
 
 
 class StatusFwpInvalidWeightError(NTStatusValueError):
-    DESCRIPTION = """The filter weight is not valid."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_WEIGHT
 
 
 class StatusFwpMatchTypeMismatchError(NTStatusValueError):
-    DESCRIPTION = """A filter condition contains a match type that is not compatible with the operands."""
     NT_STATUS = NTStatusValue.STATUS_FWP_MATCH_TYPE_MISMATCH
 
 
 class StatusFwpTypeMismatchError(NTStatusValueError):
-    DESCRIPTION = """An FWP_VALUE or FWPM_CONDITION_VALUE is of the wrong type."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TYPE_MISMATCH
 
 
 class StatusFwpOutOfBoundsError(NTStatusValueError):
-    DESCRIPTION = """An integer value is outside the allowed range."""
     NT_STATUS = NTStatusValue.STATUS_FWP_OUT_OF_BOUNDS
 
 
 class StatusFwpReservedError(NTStatusValueError):
-    DESCRIPTION = """A reserved field is nonzero."""
     NT_STATUS = NTStatusValue.STATUS_FWP_RESERVED
 
 
 class StatusFwpDuplicateConditionError(NTStatusValueError):
-    DESCRIPTION = """A filter cannot contain multiple conditions operating on a single field."""
     NT_STATUS = NTStatusValue.STATUS_FWP_DUPLICATE_CONDITION
 
 
 class StatusFwpDuplicateKeymodError(NTStatusValueError):
-    DESCRIPTION = """A policy cannot contain the same keying module more than once."""
     NT_STATUS = NTStatusValue.STATUS_FWP_DUPLICATE_KEYMOD
 
 
 class StatusFwpActionIncompatibleWithLayerError(NTStatusValueError):
-    DESCRIPTION = """The action type is not compatible with the layer."""
     NT_STATUS = NTStatusValue.STATUS_FWP_ACTION_INCOMPATIBLE_WITH_LAYER
 
 
 class StatusFwpActionIncompatibleWithSublayerError(NTStatusValueError):
-    DESCRIPTION = """The action type is not compatible with the sublayer."""
     NT_STATUS = NTStatusValue.STATUS_FWP_ACTION_INCOMPATIBLE_WITH_SUBLAYER
 
 
 class StatusFwpContextIncompatibleWithLayerError(NTStatusValueError):
-    DESCRIPTION = """The raw context or the provider context is not compatible with the layer."""
     NT_STATUS = NTStatusValue.STATUS_FWP_CONTEXT_INCOMPATIBLE_WITH_LAYER
 
 
 class StatusFwpContextIncompatibleWithCalloutError(NTStatusValueError):
-    DESCRIPTION = """The raw context or the provider context is not compatible with the callout."""
     NT_STATUS = NTStatusValue.STATUS_FWP_CONTEXT_INCOMPATIBLE_WITH_CALLOUT
 
 
 class StatusFwpIncompatibleAuthMethodError(NTStatusValueError):
-    DESCRIPTION = """The authentication method is not compatible with the policy type."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INCOMPATIBLE_AUTH_METHOD
 
 
 class StatusFwpIncompatibleDhGroupError(NTStatusValueError):
-    DESCRIPTION = """The Diffie-Hellman group is not compatible with the policy type."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INCOMPATIBLE_DH_GROUP
 
 
 class StatusFwpEmNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """An IKE policy cannot contain an Extended Mode policy."""
     NT_STATUS = NTStatusValue.STATUS_FWP_EM_NOT_SUPPORTED
 
 
 class StatusFwpNeverMatchError(NTStatusValueError):
-    DESCRIPTION = """The enumeration template or subscription will never match any objects."""
     NT_STATUS = NTStatusValue.STATUS_FWP_NEVER_MATCH
 
 
 class StatusFwpProviderContextMismatchError(NTStatusValueError):
-    DESCRIPTION = """The provider context is of the wrong type."""
     NT_STATUS = NTStatusValue.STATUS_FWP_PROVIDER_CONTEXT_MISMATCH
 
 
 class StatusFwpInvalidParameterError(NTStatusValueError):
-    DESCRIPTION = """The parameter is incorrect."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INVALID_PARAMETER
 
 
 class StatusFwpTooManySublayersError(NTStatusValueError):
-    DESCRIPTION = """The maximum number of sublayers has been reached."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TOO_MANY_SUBLAYERS
 
 
 class StatusFwpCalloutNotificationFailedError(NTStatusValueError):
-    DESCRIPTION = """The notification function for a callout returned an error."""
     NT_STATUS = NTStatusValue.STATUS_FWP_CALLOUT_NOTIFICATION_FAILED
 
 
 class StatusFwpIncompatibleAuthConfigError(NTStatusValueError):
-    DESCRIPTION = """The IPsec authentication configuration is not compatible with the authentication type."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INCOMPATIBLE_AUTH_CONFIG
 
 
 class StatusFwpIncompatibleCipherConfigError(NTStatusValueError):
-    DESCRIPTION = """The IPsec cipher configuration is not compatible with the cipher type."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INCOMPATIBLE_CIPHER_CONFIG
 
 
 class StatusFwpDuplicateAuthMethodError(NTStatusValueError):
-    DESCRIPTION = """A policy cannot contain the same auth method more than once."""
     NT_STATUS = NTStatusValue.STATUS_FWP_DUPLICATE_AUTH_METHOD
 
 
 class StatusFwpTcpipNotReadyError(NTStatusValueError):
-    DESCRIPTION = """The TCP/IP stack is not ready."""
     NT_STATUS = NTStatusValue.STATUS_FWP_TCPIP_NOT_READY
 
 
 class StatusFwpInjectHandleClosingError(NTStatusValueError):
-    DESCRIPTION = """The injection handle is being closed by another thread."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INJECT_HANDLE_CLOSING
 
 
 class StatusFwpInjectHandleStaleError(NTStatusValueError):
-    DESCRIPTION = """The injection handle is stale."""
     NT_STATUS = NTStatusValue.STATUS_FWP_INJECT_HANDLE_STALE
 
 
 class StatusFwpCannotPendError(NTStatusValueError):
-    DESCRIPTION = """The classify cannot be pended."""
     NT_STATUS = NTStatusValue.STATUS_FWP_CANNOT_PEND
 
 
 class StatusNdisClosingError(NTStatusValueError):
-    DESCRIPTION = """The binding to the network interface is being closed."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_CLOSING
 
 
 class StatusNdisBadVersionError(NTStatusValueError):
-    DESCRIPTION = """An invalid version was specified."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_BAD_VERSION
 
 
 class StatusNdisBadCharacteristicsError(NTStatusValueError):
-    DESCRIPTION = """An invalid characteristics table was used."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_BAD_CHARACTERISTICS
 
 
 class StatusNdisAdapterNotFoundError(NTStatusValueError):
-    DESCRIPTION = """Failed to find the network interface or the network interface is not ready."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_ADAPTER_NOT_FOUND
 
 
 class StatusNdisOpenFailedError(NTStatusValueError):
-    DESCRIPTION = """Failed to open the network interface."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_OPEN_FAILED
 
 
 class StatusNdisDeviceFailedError(NTStatusValueError):
-    DESCRIPTION = """The network interface has encountered an internal unrecoverable failure."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_DEVICE_FAILED
 
 
 class StatusNdisMulticastFullError(NTStatusValueError):
-    DESCRIPTION = """The multicast list on the network interface is full."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_MULTICAST_FULL
 
 
 class StatusNdisMulticastExistsError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to add a duplicate multicast address to the list."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_MULTICAST_EXISTS
 
 
 class StatusNdisMulticastNotFoundError(NTStatusValueError):
-    DESCRIPTION = """At attempt was made to remove a multicast address that was never added."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_MULTICAST_NOT_FOUND
 
 
 class StatusNdisRequestAbortedError(NTStatusValueError):
-    DESCRIPTION = """The network interface aborted the request."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_REQUEST_ABORTED
 
 
 class StatusNdisResetInProgressError(NTStatusValueError):
-    DESCRIPTION = """The network interface cannot process the request because it is being reset."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_RESET_IN_PROGRESS
 
 
 class StatusNdisInvalidPacketError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to send an invalid packet on a network interface."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_PACKET
 
 
 class StatusNdisInvalidDeviceRequestError(NTStatusValueError):
-    DESCRIPTION = """The specified request is not a valid operation for the target device."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_DEVICE_REQUEST
 
 
 class StatusNdisAdapterNotReadyError(NTStatusValueError):
-    DESCRIPTION = """The network interface is not ready to complete this operation."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_ADAPTER_NOT_READY
 
 
 class StatusNdisInvalidLengthError(NTStatusValueError):
-    DESCRIPTION = """The length of the buffer submitted for this operation is not valid."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_LENGTH
 
 
 class StatusNdisInvalidDataError(NTStatusValueError):
-    DESCRIPTION = """The data used for this operation is not valid."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_DATA
 
 
 class StatusNdisBufferTooShortError(NTStatusValueError):
-    DESCRIPTION = """The length of the submitted buffer for this operation is too small."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_BUFFER_TOO_SHORT
 
 
 class StatusNdisInvalidOidError(NTStatusValueError):
-    DESCRIPTION = """The network interface does not support this object identifier."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_OID
 
 
 class StatusNdisAdapterRemovedError(NTStatusValueError):
-    DESCRIPTION = """The network interface has been removed."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_ADAPTER_REMOVED
 
 
 class StatusNdisUnsupportedMediaError(NTStatusValueError):
-    DESCRIPTION = """The network interface does not support this media type."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_UNSUPPORTED_MEDIA
 
 
 class StatusNdisGroupAddressInUseError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to remove a token ring group address that is in use by other components."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_GROUP_ADDRESS_IN_USE
 
 
 class StatusNdisFileNotFoundError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to map a file that cannot be found."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_FILE_NOT_FOUND
 
 
 class StatusNdisErrorReadingFileError(NTStatusValueError):
-    DESCRIPTION = """An error occurred while NDIS tried to map the file."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_ERROR_READING_FILE
 
 
 class StatusNdisAlreadyMappedError(NTStatusValueError):
-    DESCRIPTION = """An attempt was made to map a file that is already mapped."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_ALREADY_MAPPED
 
 
 class StatusNdisResourceConflictError(NTStatusValueError):
-    DESCRIPTION = """An attempt to allocate a hardware resource failed because the resource is used by another component."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_RESOURCE_CONFLICT
 
 
 class StatusNdisMediaDisconnectedError(NTStatusValueError):
-    DESCRIPTION = """The I/O operation failed because the network media is disconnected or the wireless access point is out of range."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_MEDIA_DISCONNECTED
 
 
 class StatusNdisInvalidAddressError(NTStatusValueError):
-    DESCRIPTION = """The network address used in the request is invalid."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_ADDRESS
 
 
 class StatusNdisPausedError(NTStatusValueError):
-    DESCRIPTION = """The offload operation on the network interface has been paused."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_PAUSED
 
 
 class StatusNdisInterfaceNotFoundError(NTStatusValueError):
-    DESCRIPTION = """The network interface was not found."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INTERFACE_NOT_FOUND
 
 
 class StatusNdisUnsupportedRevisionError(NTStatusValueError):
-    DESCRIPTION = """The revision number specified in the structure is not supported."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_UNSUPPORTED_REVISION
 
 
 class StatusNdisInvalidPortError(NTStatusValueError):
-    DESCRIPTION = """The specified port does not exist on this network interface."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_PORT
 
 
 class StatusNdisInvalidPortStateError(NTStatusValueError):
-    DESCRIPTION = """The current state of the specified port on this network interface does not support the requested operation."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_INVALID_PORT_STATE
 
 
 class StatusNdisLowPowerStateError(NTStatusValueError):
-    DESCRIPTION = """The miniport adapter is in a lower power state."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_LOW_POWER_STATE
 
 
 class StatusNdisNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The network interface does not support this request."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_NOT_SUPPORTED
 
 
 class StatusNdisOffloadPolicyError(NTStatusValueError):
-    DESCRIPTION = """The TCP connection is not offloadable because of a local policy setting."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_OFFLOAD_POLICY
 
 
 class StatusNdisOffloadConnectionRejectedError(NTStatusValueError):
-    DESCRIPTION = """The TCP connection is not offloadable by the Chimney offload target."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_OFFLOAD_CONNECTION_REJECTED
 
 
 class StatusNdisOffloadPathRejectedError(NTStatusValueError):
-    DESCRIPTION = """The IP Path object is not in an offloadable state."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_OFFLOAD_PATH_REJECTED
 
 
 class StatusNdisDot11AutoConfigEnabledError(NTStatusValueError):
-    DESCRIPTION = """The wireless LAN interface is in auto-configuration mode and does not support the requested parameter change operation."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_DOT11_AUTO_CONFIG_ENABLED
 
 
 class StatusNdisDot11MediaInUseError(NTStatusValueError):
-    DESCRIPTION = """The wireless LAN interface is busy and cannot perform the requested operation."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_DOT11_MEDIA_IN_USE
 
 
 class StatusNdisDot11PowerStateInvalidError(NTStatusValueError):
-    DESCRIPTION = """The wireless LAN interface is power down and does not support the requested operation."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_DOT11_POWER_STATE_INVALID
 
 
 class StatusNdisPmWolPatternListFullError(NTStatusValueError):
-    DESCRIPTION = """The list of wake on LAN patterns is full."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_PM_WOL_PATTERN_LIST_FULL
 
 
 class StatusNdisPmProtocolOffloadListFullError(NTStatusValueError):
-    DESCRIPTION = """The list of low power protocol offloads is full."""
     NT_STATUS = NTStatusValue.STATUS_NDIS_PM_PROTOCOL_OFFLOAD_LIST_FULL
 
 
 class StatusIpsecBadSpiError(NTStatusValueError):
-    DESCRIPTION = """The SPI in the packet does not match a valid IPsec SA."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_BAD_SPI
 
 
 class StatusIpsecSaLifetimeExpiredError(NTStatusValueError):
-    DESCRIPTION = """The packet was received on an IPsec SA whose lifetime has expired."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_SA_LIFETIME_EXPIRED
 
 
 class StatusIpsecWrongSaError(NTStatusValueError):
-    DESCRIPTION = """The packet was received on an IPsec SA that does not match the packet characteristics."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_WRONG_SA
 
 
 class StatusIpsecReplayCheckFailedError(NTStatusValueError):
-    DESCRIPTION = """The packet sequence number replay check failed."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_REPLAY_CHECK_FAILED
 
 
 class StatusIpsecInvalidPacketError(NTStatusValueError):
-    DESCRIPTION = """The IPsec header and/or trailer in the packet is invalid."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_INVALID_PACKET
 
 
 class StatusIpsecIntegrityCheckFailedError(NTStatusValueError):
-    DESCRIPTION = """The IPsec integrity check failed."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_INTEGRITY_CHECK_FAILED
 
 
 class StatusIpsecClearTextDropError(NTStatusValueError):
-    DESCRIPTION = """IPsec dropped a clear text packet."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_CLEAR_TEXT_DROP
 
 
 class StatusIpsecAuthFirewallDropError(NTStatusValueError):
-    DESCRIPTION = """IPsec dropped an incoming ESP packet in authenticated firewall mode.  This drop is benign."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_AUTH_FIREWALL_DROP
 
 
 class StatusIpsecThrottleDropError(NTStatusValueError):
-    DESCRIPTION = """IPsec dropped a packet due to DOS throttle."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_THROTTLE_DROP
 
 
 class StatusIpsecDospBlockError(NTStatusValueError):
-    DESCRIPTION = """IPsec Dos Protection matched an explicit block rule."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_DOSP_BLOCK
 
 
 class StatusIpsecDospReceivedMulticastError(NTStatusValueError):
-    DESCRIPTION = """IPsec Dos Protection received an IPsec specific multicast packet which is not allowed."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_DOSP_RECEIVED_MULTICAST
 
 
 class StatusIpsecDospInvalidPacketError(NTStatusValueError):
-    DESCRIPTION = """IPsec Dos Protection received an incorrectly formatted packet."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_DOSP_INVALID_PACKET
 
 
 class StatusIpsecDospStateLookupFailedError(NTStatusValueError):
-    DESCRIPTION = """IPsec Dos Protection failed to lookup state."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_DOSP_STATE_LOOKUP_FAILED
 
 
 class StatusIpsecDospMaxEntriesError(NTStatusValueError):
-    DESCRIPTION = """IPsec Dos Protection failed to create state because there are already maximum number of entries allowed by policy."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_DOSP_MAX_ENTRIES
 
 
 class StatusIpsecDospKeymodNotAllowedError(NTStatusValueError):
-    DESCRIPTION = """IPsec Dos Protection received an IPsec negotiation packet for a keying module which is not allowed by policy."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_DOSP_KEYMOD_NOT_ALLOWED
 
 
 class StatusIpsecDospMaxPerIpRatelimitQueuesError(NTStatusValueError):
-    DESCRIPTION = """IPsec Dos Protection failed to create per internal IP ratelimit queue because there is already maximum number of queues allowed by policy."""
     NT_STATUS = NTStatusValue.STATUS_IPSEC_DOSP_MAX_PER_IP_RATELIMIT_QUEUES
 
 
 class StatusVolmgrMirrorNotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The system does not support mirrored volumes."""
     NT_STATUS = NTStatusValue.STATUS_VOLMGR_MIRROR_NOT_SUPPORTED
 
 
 class StatusVolmgrRaid5NotSupportedError(NTStatusValueError):
-    DESCRIPTION = """The system does not support RAID-5 volumes."""
     NT_STATUS = NTStatusValue.STATUS_VOLMGR_RAID5_NOT_SUPPORTED
 
 
 class StatusVirtdiskProviderNotFoundError(NTStatusValueError):
-    DESCRIPTION = """A virtual disk support provider for the specified file was not found."""
     NT_STATUS = NTStatusValue.STATUS_VIRTDISK_PROVIDER_NOT_FOUND
 
 
 class StatusVirtdiskNotVirtualDiskError(NTStatusValueError):
-    DESCRIPTION = """The specified disk is not a virtual disk."""
     NT_STATUS = NTStatusValue.STATUS_VIRTDISK_NOT_VIRTUAL_DISK
 
 
 class StatusVhdParentVhdAccessDeniedError(NTStatusValueError):
-    DESCRIPTION = """The chain of virtual hard disks is inaccessible. The process has not been granted access rights to the parent virtual hard disk for the differencing disk."""
     NT_STATUS = NTStatusValue.STATUS_VHD_PARENT_VHD_ACCESS_DENIED
 
 
 class StatusVhdChildParentSizeMismatchError(NTStatusValueError):
-    DESCRIPTION = """The chain of virtual hard disks is corrupted. There is a mismatch in the virtual sizes of the parent virtual hard disk and differencing disk."""
     NT_STATUS = NTStatusValue.STATUS_VHD_CHILD_PARENT_SIZE_MISMATCH
 
 
 class StatusVhdDifferencingChainCycleDetectedError(NTStatusValueError):
-    DESCRIPTION = """The chain of virtual hard disks is corrupted. A differencing disk is indicated in its own parent chain."""
     NT_STATUS = NTStatusValue.STATUS_VHD_DIFFERENCING_CHAIN_CYCLE_DETECTED
 
 
 class StatusVhdDifferencingChainErrorInParentError(NTStatusValueError):
-    DESCRIPTION = """The chain of virtual hard disks is inaccessible. There was an error opening a virtual hard disk further up the chain."""
     NT_STATUS = NTStatusValue.STATUS_VHD_DIFFERENCING_CHAIN_ERROR_IN_PARENT
 
 
+# `__mro__` is checked rather than using `issubclass`, which would fill the ABC caches of every error class.
 NTStatusValueError.NT_STATUS_TO_ERROR_CLASS = {
     error_class.NT_STATUS: error_class
     for _, error_class in inspect_getmembers(
         sys_modules[__name__],
-        lambda value: inspect_isclass(value) and issubclass(value, NTStatusValueError)
+        lambda value: (
+            inspect_isclass(value) and NTStatusValueError in value.__mro__
+            and value.NT_STATUS is not NotImplemented
+        )
     )
 }
+
+NTStatusValueError.NT_STATUS_INT_TO_ERROR_CLASS = {
+    int(nt_status): error_class for nt_status, error_class in NTStatusValueError.NT_STATUS_TO_ERROR_CLASS.items()
+}
@@ -1,11 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import ByteString
-from struct import pack, unpack_from
+from typing import ByteString, ClassVar, Optional
+from struct import unpack_from, Struct
 
 from ndr.structures import NDRType
+from ndr.structures.pointer import Pointer
 
 from msdsalgs.rpc.rpc_security_descriptor import RPCSecurityDescriptor
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
 
 
 @dataclass
@@ -13,6 +15,9 @@ class RPCSecurityAttributes(NDRType):
     rpc_security_descriptor: RPCSecurityDescriptor = field(default_factory=RPCSecurityDescriptor)
     inherit_handle: bool = False
 
+    _HEADER_STRUCT: ClassVar[Struct] = Struct('<I')
+    _INHERIT_HANDLE_STRUCT: ClassVar[Struct] = Struct('<B')
+
     @classmethod
     def from_bytes(cls, data: ByteString, base_offset: int = 0) -> RPCSecurityAttributes:
         data = memoryview(data)[base_offset:]
@@ -26,19 +31,124 @@ class RPCSecurityAttributes(NDRType):
 
         return cls(
             rpc_security_descriptor=rpc_security_descriptor,
-            inherit_handle=bool(bytes(data[offset]))
+            inherit_handle=data[offset] != 0
         )
 
     def __bytes__(self) -> bytes:
-        rpc_security_descriptor_bytes = bytes(self.rpc_security_descriptor)
-        security_descriptor_len = self.rpc_security_descriptor.in_security_descriptor
-
+        # The length of the security descriptor is calculated without serializing it, so it is serialized only once.
         return b''.join([
-            pack('<I', security_descriptor_len),
-            rpc_security_descriptor_bytes,
-            pack('<B', int(self.inherit_handle))
+            self._HEADER_STRUCT.pack(self.rpc_security_descriptor.in_security_descriptor),
+            bytes(self.rpc_security_descriptor),
+            self._INHERIT_HANDLE_STRUCT.pack(int(self.inherit_handle))
         ])
 
     def __len__(self) -> int:
         return 4 + len(self.rpc_security_descriptor) + 1
 
+
+class RPCSecurityAttributesView:
+    """
+    An `RPC_SECURITY_ATTRIBUTES` structure read in place from a buffer, e.g. a PDU.
+
+    Only the fixed-size fields are read when the view is made; the security descriptor is decoded from the buffer,
+    without copying it, when it is first accessed.
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_security_descriptor_offset',
+        '_security_descriptor_len',
+        'in_security_descriptor',
+        'out_security_descriptor',
+        'inherit_handle',
+        '_security_descriptor'
+    )
+
+    # The length of the security descriptor, and the referent ID of its pointer.
+    _HEADER_STRUCT: ClassVar[Struct] = Struct('<I')
+    _REFERENT_ID_STRUCT: ClassVar[Struct] = Struct('<I')
+    # `cbInSecurityDescriptor` and `cbOutSecurityDescriptor`.
+    _SECURITY_DESCRIPTOR_LENGTHS_STRUCT: ClassVar[Struct] = Struct('<II')
+
+    def __init__(
+        self,
+        buffer: memoryview,
+        security_descriptor_offset: Optional[int],
+        security_descriptor_len: int,
+        in_security_descriptor: int,
+        out_security_descriptor: int,
+        inherit_handle: bool
+    ):
+        self._buffer: memoryview = buffer
+        self._security_descriptor_offset: Optional[int] = security_descriptor_offset
+        self._security_descriptor_len: int = security_descriptor_len
+        self.in_security_descriptor: int = in_security_descriptor
+        self.out_security_descriptor: int = out_security_descriptor
+        self.inherit_handle: bool = inherit_handle
+        self._security_descriptor: Optional[SecurityDescriptor] = None
+
+    @classmethod
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> RPCSecurityAttributesView:
+        buffer = memoryview(data).cast('B')
+        offset: int = base_offset
+
+        security_descriptor_len: int = cls._HEADER_STRUCT.unpack_from(buffer, offset)[0]
+        offset += cls._HEADER_STRUCT.size
+
+        referent_id: int = cls._REFERENT_ID_STRUCT.unpack_from(buffer, offset)[0]
+        offset += Pointer.structure_size
+
+        if referent_id != 0:
+            security_descriptor_offset: Optional[int] = offset
+            offset += security_descriptor_len
+        else:
+            security_descriptor_offset = None
+
+        in_security_descriptor, out_security_descriptor = cls._SECURITY_DESCRIPTOR_LENGTHS_STRUCT.unpack_from(
+            buffer,
+            offset
+        )
+        offset += cls._SECURITY_DESCRIPTOR_LENGTHS_STRUCT.size
+
+        return cls(
+            buffer=buffer,
+            security_descriptor_offset=security_descriptor_offset,
+            security_descriptor_len=security_descriptor_len,
+            in_security_descriptor=in_security_descriptor,
+            out_security_descriptor=out_security_descriptor,
+            # Indexing a `memoryview` yields an `int`; no buffer is allocated.
+            inherit_handle=buffer[offset] != 0
+        )
+
+    @property
+    def raw_security_descriptor(self) -> Optional[memoryview]:
+        if self._security_descriptor_offset is None:
+            return None
+
+        return self._buffer[
+            self._security_descriptor_offset:self._security_descriptor_offset + self._security_descriptor_len
+        ]
+
+    @property
+    def security_descriptor(self) -> Optional[SecurityDescriptor]:
+        if self._security_descriptor is None and self._security_descriptor_offset is not None:
+            self._security_descriptor = SecurityDescriptor.from_bytes(
+                data=self._buffer,
+                base_offset=self._security_descriptor_offset
+            )
+        return self._security_descriptor
+
+    def to_rpc_security_attributes(self) -> RPCSecurityAttributes:
+        return RPCSecurityAttributes(
+            rpc_security_descriptor=RPCSecurityDescriptor(security_descriptor=self.security_descriptor),
+            inherit_handle=self.inherit_handle
+        )
+
+    def __len__(self) -> int:
+        return (
+            self._HEADER_STRUCT.size
+            + Pointer.structure_size
+            + (self._security_descriptor_len if self._security_descriptor_offset is not None else 0)
+            + self._SECURITY_DESCRIPTOR_LENGTHS_STRUCT.size
+            + 1
+        )
@@ -16,13 +16,15 @@ class RPCSecurityDescriptor(NDRType):
 
     security_descriptor: Optional[SecurityDescriptor] = None
 
+    # The lengths are calculated from the components of the security descriptor, without serializing it.
+
     @property
     def in_security_descriptor(self) -> int:
-        return len(bytes(self.security_descriptor)) if self.security_descriptor is not None else 0
+        return len(self.security_descriptor) if self.security_descriptor is not None else 0
 
     @property
     def out_security_descriptor(self) -> int:
-        return len(bytes(self.security_descriptor)) if self.security_descriptor is not None else 0
+        return len(self.security_descriptor) if self.security_descriptor is not None else 0
 
     _IN_SECURITY_DESCRIPTOR_STRUCT = Struct('<I')
     _OUT_SECURITY_DESCRIPTOR_STRUCT = Struct('<I')
@@ -42,13 +44,18 @@ class RPCSecurityDescriptor(NDRType):
         return cls(security_descriptor=security_descriptor)
 
     def __bytes__(self) -> bytes:
-        security_descriptor_len = self.in_security_descriptor
+        # The security descriptor is serialized once, and its length is taken from the result.
+        if self.security_descriptor is not None:
+            security_descriptor_bytes: bytes = bytes(self.security_descriptor)
+            pointer = Pointer(representation=security_descriptor_bytes)
+        else:
+            security_descriptor_bytes = b''
+            pointer = NullPointer()
+
+        security_descriptor_len: int = len(security_descriptor_bytes)
 
         return b''.join([
-            bytes(
-                Pointer(representation=bytes(self.security_descriptor)) if self.security_descriptor is not None
-                else NullPointer()
-            ),
+            bytes(pointer),
             self._IN_SECURITY_DESCRIPTOR_STRUCT.pack(security_descriptor_len),
             self._OUT_SECURITY_DESCRIPTOR_STRUCT.pack(security_descriptor_len)
         ])
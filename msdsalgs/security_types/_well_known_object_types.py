@@ -0,0 +1,84 @@
+# The GUIDs of well-known Active Directory schema classes and attributes, property sets, extended rights and validated
+# writes, their names and their kinds. A validated write whose GUID is that of an attribute, e.g. `Validated-SPN` and
+# `Service-Principal-Name`, is listed as the attribute.
+#
+# https://docs.microsoft.com/en-us/windows/win32/adschema/active-directory-schema
+# https://docs.microsoft.com/en-us/windows/win32/adschema/extended-rights
+
+WELL_KNOWN_OBJECT_TYPES = (
+    # Classes
+    ('bf967a8b-0de6-11d0-a285-00aa003049e2', 'Container', 'class'),
+    ('5cb41ed0-0e4c-11d0-a286-00aa003049e2', 'Contact', 'class'),
+    ('bf967a86-0de6-11d0-a285-00aa003049e2', 'Computer', 'class'),
+    ('19195a5b-6da0-11d0-afd3-00c04fd930c9', 'Domain-DNS', 'class'),
+    ('bf967a9c-0de6-11d0-a285-00aa003049e2', 'Group', 'class'),
+    ('f30e3bc2-9ff0-11d1-b603-0000f80367c1', 'Group-Policy-Container', 'class'),
+    ('4828cc14-1437-45bc-9b07-ad6f015e5f28', 'inetOrgPerson', 'class'),
+    ('7b8b558a-93a5-4af7-adca-c017e67f1057', 'ms-DS-Group-Managed-Service-Account', 'class'),
+    ('ce206244-5827-4a86-ba1c-1c0c386c1b64', 'ms-DS-Managed-Service-Account', 'class'),
+    ('bf967aa5-0de6-11d0-a285-00aa003049e2', 'Organizational-Unit', 'class'),
+    ('bf967aa8-0de6-11d0-a285-00aa003049e2', 'Print-Queue', 'class'),
+    ('bf967aba-0de6-11d0-a285-00aa003049e2', 'User', 'class'),
+    # Attributes
+    ('00fbf30c-91fe-11d1-aebc-0000f80367c1', 'Alt-Security-Identities', 'attribute'),
+    ('72e39547-7b18-11d1-adef-00c04fd8d5cd', 'DNS-Host-Name', 'attribute'),
+    ('f30e3bbe-9ff0-11d1-b603-0000f80367c1', 'GP-Link', 'attribute'),
+    ('bf9679c0-0de6-11d0-a285-00aa003049e2', 'Member', 'attribute'),
+    ('3f78c3e5-f79a-46bd-a0b8-9d18116ddc79', 'ms-DS-Allowed-To-Act-On-Behalf-Of-Other-Identity', 'attribute'),
+    ('800d94d7-b7a1-42a1-b14d-7cae1423d07f', 'ms-DS-Allowed-To-Delegate-To', 'attribute'),
+    ('5b47d60f-6090-40b2-9f37-2a4de88f3063', 'ms-DS-Key-Credential-Link', 'attribute'),
+    ('20119867-1d04-4ab7-9371-cfc3d5df0afd', 'ms-DS-Supported-Encryption-Types', 'attribute'),
+    ('ea1b7b93-5e48-46d5-bc6c-4df4fda78a35', 'ms-TPM-Tpm-Information-For-Computer', 'attribute'),
+    ('bf967a0a-0de6-11d0-a285-00aa003049e2', 'Pwd-Last-Set', 'attribute'),
+    ('bf9679a8-0de6-11d0-a285-00aa003049e2', 'Script-Path', 'attribute'),
+    ('f3a64788-5306-11d1-a9c5-0000f80367c1', 'Service-Principal-Name', 'attribute'),
+    ('6db69a1c-9422-11d1-aebd-0000f80367c1', 'Terminal-Server', 'attribute'),
+    ('bf967a68-0de6-11d0-a285-00aa003049e2', 'User-Account-Control', 'attribute'),
+    # Property sets
+    ('4c164200-20c0-11d0-a768-00aa006e0529', 'User-Account-Restrictions', 'property_set'),
+    ('b8119fd0-04f6-4762-ab7a-4986c76b3f9a', 'Domain-Other-Parameters', 'property_set'),
+    ('c7407360-20bf-11d0-a768-00aa006e0529', 'Domain-Password', 'property_set'),
+    ('59ba2f42-79a2-11d0-9020-00c04fc2d3cf', 'General-Information', 'property_set'),
+    ('bc0ac240-79a9-11d0-9020-00c04fc2d4cf', 'Membership', 'property_set'),
+    ('5f202010-79a5-11d0-9020-00c04fc2d4cf', 'User-Logon', 'property_set'),
+    ('77b5b886-944a-11d1-aebd-0000f80367c1', 'Personal-Information', 'property_set'),
+    ('e45795b2-9455-11d1-aebd-0000f80367c1', 'Email-Information', 'property_set'),
+    ('91e647de-d96f-4b70-9557-d63ff4f3ccd8', 'Private-Information', 'property_set'),
+    ('e48d0154-bcf8-11d1-8702-00c04fb96050', 'Public-Information', 'property_set'),
+    ('037088f8-0ae1-11d2-b422-00a0c968f939', 'RAS-Information', 'property_set'),
+    ('5805bc62-bdc9-4428-a5e2-856a0f4c185e', 'Terminal-Server-License-Server', 'property_set'),
+    ('e45795b3-9455-11d1-aebd-0000f80367c1', 'Web-Information', 'property_set'),
+    # Extended rights
+    ('ee914b82-0a98-11d1-adbb-00c04fd8d5cd', 'Abandon-Replication', 'extended_right'),
+    ('440820ad-65b4-11d1-a3da-0000f875ae0d', 'Add-GUID', 'extended_right'),
+    ('1abd7cf8-0a99-11d1-adbb-00c04fd8d5cd', 'Allocate-Rids', 'extended_right'),
+    ('68b1d179-0d15-4d4f-ab71-46152e79a7bc', 'Allowed-To-Authenticate', 'extended_right'),
+    ('edacfd8f-ffb3-11d1-b41d-00a0c968f939', 'Apply-Group-Policy', 'extended_right'),
+    ('0e10c968-78fb-11d2-90d4-00c04f79dc55', 'Certificate-Enrollment', 'extended_right'),
+    ('a05b8cc2-17bc-4802-a710-e7c15ab866a2', 'Certificate-AutoEnrollment', 'extended_right'),
+    ('014bf69c-7b3b-11d1-85f6-08002be74fab', 'Change-Domain-Master', 'extended_right'),
+    ('cc17b1fb-33d9-11d2-97d4-00c04fd8d5cd', 'Change-Infrastructure-Master', 'extended_right'),
+    ('bae50096-4752-11d1-9052-00c04fc2d4cf', 'Change-PDC', 'extended_right'),
+    ('d58d5f36-0a98-11d1-adbb-00c04fd8d5cd', 'Change-Rid-Master', 'extended_right'),
+    ('e12b56b6-0a95-11d1-adbb-00c04fd8d5cd', 'Change-Schema-Master', 'extended_right'),
+    ('1131f6aa-9c07-11d1-f79f-00c04fc2dcd2', 'DS-Replication-Get-Changes', 'extended_right'),
+    ('1131f6ad-9c07-11d1-f79f-00c04fc2dcd2', 'DS-Replication-Get-Changes-All', 'extended_right'),
+    ('89e95b76-444d-4c62-991a-0facbeda640c', 'DS-Replication-Get-Changes-In-Filtered-Set', 'extended_right'),
+    ('1131f6ac-9c07-11d1-f79f-00c04fc2dcd2', 'DS-Replication-Manage-Topology', 'extended_right'),
+    ('1131f6ab-9c07-11d1-f79f-00c04fc2dcd2', 'DS-Replication-Synchronize', 'extended_right'),
+    ('05c74c5e-4deb-43b4-bd9f-86664c2a7fd5', 'Enable-Per-User-Reversibly-Encrypted-Password', 'extended_right'),
+    ('b7b1b3de-ab09-4242-9e30-9980e5d322f7', 'Generate-RSoP-Logging', 'extended_right'),
+    ('b7b1b3dd-ab09-4242-9e30-9980e5d322f7', 'Generate-RSoP-Planning', 'extended_right'),
+    ('ba33815a-4f93-4c76-87f3-57574bff8109', 'Migrate-SID-History', 'extended_right'),
+    ('1131f6ae-9c07-11d1-f79f-00c04fc2dcd2', 'Read-Only-Replication-Secret-Synchronization', 'extended_right'),
+    ('45ec5156-db7e-47bb-b53f-dbeb2d03c40f', 'Reanimate-Tombstones', 'extended_right'),
+    ('ab721a56-1e2f-11d0-9819-00aa0040529b', 'Receive-As', 'extended_right'),
+    ('9432c620-033c-4db7-8b58-14ef6d0bf477', 'Refresh-Group-Cache', 'extended_right'),
+    ('ab721a54-1e2f-11d0-9819-00aa0040529b', 'Send-As', 'extended_right'),
+    ('ccc2dc7d-a6ad-4a7a-8846-c04e3cc53501', 'Unexpire-Password', 'extended_right'),
+    ('280f369c-67c7-438e-ae98-1d46f3c6f541', 'Update-Password-Not-Required-Bit', 'extended_right'),
+    ('ab721a53-1e2f-11d0-9819-00aa0040529b', 'User-Change-Password', 'extended_right'),
+    ('00299570-246d-11d0-a768-00aa006e0529', 'User-Force-Change-Password', 'extended_right'),
+    # Validated writes
+    ('9b026da6-0d3c-465c-8bee-5199d7165cba', 'DS-Validated-Write-Computer', 'validated_write'),
+)
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from enum import IntFlag, IntEnum
-from struct import unpack as struct_unpack, pack as struct_pack
+from struct import unpack as struct_unpack, pack as struct_pack, pack_into as struct_pack_into
 from uuid import UUID
-from typing import Optional
+from typing import Optional, Callable, ByteString
 
 from .sid import SID
+from .object_types import intern_guid
+from msdsalgs.utils import Mask
 
 
 class ACEType(IntEnum):
@@ -131,6 +133,12 @@ class ActiveDirectoryRightsMask(IntFlag):
         return 4
 
 
+ActiveDirectoryRights = Mask.make_class(
+    int_flag_class=ActiveDirectoryRightsMask,
+    prefix='ADS_RIGHT_'
+)
+
+
 class ACEObjectFlagMask(IntFlag):
     ACE_OBJECT_TYPE_PRESENT = 0x1
     ACE_INHERITED_OBJECT_TYPE_PRESENT = 0x2
@@ -146,7 +154,18 @@ class ACE:
     trustee_sid: SID
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'ACE':
+    def from_bytes(cls, data: bytes, decode_sid: Optional[Callable[[bytes], SID]] = None) -> 'ACE':
+        """
+        Construct an ACE from a byte stream.
+
+        :param data: The bytes constituting the ACE.
+        :param decode_sid: The function with which to decode the trustee SID from the bytes starting with it, e.g. one
+            that interns the SIDs. Defaults to `SID.from_bytes`.
+        :return: An ACE.
+        """
+
+        decode_sid = decode_sid or SID.from_bytes
+
         header: ACEHeader = ACEHeader.from_bytes(data[0:4])
         access_mask: ActiveDirectoryRightsMask = ActiveDirectoryRightsMask(struct_unpack('<I', data[4:8])[0])
 
@@ -155,7 +174,7 @@ class ACE:
         remaining_ace_size: int = header.ace_size - len(header) - len(access_mask)
 
         if header.ace_type in BASIC_ACE_TYPES:
-            ace_kwargs['trustee_sid'] = SID.from_bytes(data[8:8+remaining_ace_size])
+            ace_kwargs['trustee_sid'] = decode_sid(data[8:8+remaining_ace_size])
         else:
             if header.ace_type in OBJECT_ACE_TYPES:
                 flags = ACEObjectFlagMask(struct_unpack('<I', data[8:12])[0])
@@ -178,10 +197,10 @@ class ACE:
                     inherited_object_type_offset: Optional[int] = None
                     sid_start_offset: int = 12
 
-                object_type: Optional[UUID] = UUID(bytes=data[object_type_offset:object_type_offset + 16]) \
+                object_type: Optional[UUID] = intern_guid(data[object_type_offset:object_type_offset + 16]) \
                     if object_type_offset is not None else None
-                inherited_object_type: Optional[UUID] = UUID(
-                    bytes=data[inherited_object_type_offset:inherited_object_type_offset + 16]) \
+                inherited_object_type: Optional[UUID] = intern_guid(
+                    data[inherited_object_type_offset:inherited_object_type_offset + 16]) \
                     if inherited_object_type_offset is not None else None
 
                 ace_kwargs['object_type'] = object_type
@@ -191,19 +210,88 @@ class ACE:
             else:
                 sid_start_offset = 8
 
-            truestee_sid: SID = SID.from_bytes(data[sid_start_offset:])
+            truestee_sid: SID = decode_sid(data[sid_start_offset:])
             ace_kwargs['trustee_sid'] = truestee_sid
             remaining_ace_size -= len(truestee_sid)
 
             if header.ace_type in DATA_ACE_TYPES:
                 ace_kwargs[
                     'attribute_data' if header.ace_type == ACEType.SYSTEM_RESOURCE_ATTRIBUTE_ACE_TYPE else 'application_data'
-                ] = data[
+                ] = bytes(data[
                     sid_start_offset+len(truestee_sid):sid_start_offset+len(truestee_sid)+remaining_ace_size
-                ]
+                ])
 
         return ACE_TYPE_TO_ACE_CLASS[header.ace_type](**ace_kwargs)
 
+    def _data(self) -> ByteString:
+        # NOTE: The data is returned as is, without being copied, so that measuring it is cheap.
+        if self.header.ace_type not in DATA_ACE_TYPES:
+            return b''
+        if self.header.ace_type == ACEType.SYSTEM_RESOURCE_ATTRIBUTE_ACE_TYPE:
+            return self.attribute_data
+        return self.application_data
+
+    def pack_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Write the ACE into a buffer.
+
+        The header's `ace_size` is recalculated from the contents, padded to a multiple of four.
+
+        :param buffer: The buffer to write into.
+        :param offset: The offset in `buffer` at which to write the ACE.
+        :return: The offset following the ACE.
+        """
+
+        ace_offset: int = offset
+
+        struct_pack_into('<I', buffer, ace_offset + 4, int(self.access_mask))
+        offset += 8
+
+        if self.header.ace_type in OBJECT_ACE_TYPES:
+            struct_pack_into('<I', buffer, offset, int(self.flags))
+            offset += 4
+            for guid in (self.object_type, self.inherited_object_type):
+                if guid is not None:
+                    buffer[offset:offset + 16] = guid.bytes_le
+                    offset += 16
+
+        offset = self.trustee_sid.pack_into(buffer, offset)
+
+        data: ByteString = self._data()
+        if data:
+            buffer[offset:offset + len(data)] = data
+            offset += len(data)
+
+        padding_len: int = -(offset - ace_offset) % 4
+        if padding_len:
+            buffer[offset:offset + padding_len] = bytes(padding_len)
+            offset += padding_len
+
+        struct_pack_into(
+            '<BBH',
+            buffer,
+            ace_offset,
+            self.header.ace_type.value,
+            int(self.header.ace_flags),
+            offset - ace_offset
+        )
+
+        return offset
+
+    def __bytes__(self) -> bytes:
+        buffer = bytearray(len(self))
+        self.pack_into(buffer)
+        return bytes(buffer)
+
+    def __len__(self) -> int:
+        ace_size: int = 8 + len(self.trustee_sid) + len(self._data())
+        if self.header.ace_type in OBJECT_ACE_TYPES:
+            ace_size += 4 + (16 if self.object_type is not None else 0) + (
+                16 if self.inherited_object_type is not None else 0
+            )
+
+        return ace_size + -ace_size % 4
+
 
 @dataclass
 class AccessAllowedACE(ACE):
@@ -0,0 +1,196 @@
+"""
+Selective decoding of the ACEs of ACLs and security descriptors.
+
+An `ACEFilter` is checked against the raw bytes of each ACE, i.e. its header, its access mask, the object type of an
+object ACE and its trustee SID, before any `ACE` or `SID` object is built; the ACEs that do not match are skipped by
+their size. Scans that ask narrow questions, e.g. which trustees are granted `GENERIC_ALL`, thus only decode the few
+ACEs that answer them.
+"""
+
+from __future__ import annotations
+from struct import Struct
+from typing import Optional, Iterable, Iterator, List, ByteString, Union, FrozenSet, Dict
+from uuid import UUID
+
+from msdsalgs.security_types.ace import ACE, ACEType, ACEObjectFlagMask, OBJECT_ACE_TYPES
+from msdsalgs.security_types.sid import SID
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+
+# The type, flags, size and access mask of an ACE.
+_ACE_PREFIX_STRUCT = Struct('<BBHI')
+_ACE_COUNT_STRUCT = Struct('<H')
+_OBJECT_FLAGS_STRUCT = Struct('<I')
+
+_OBJECT_ACE_TYPE_VALUES: FrozenSet[int] = frozenset(int(ace_type) for ace_type in OBJECT_ACE_TYPES)
+
+
+def _trustee_sid_offset(data: ByteString, ace_offset: int, ace_type: int) -> int:
+    if ace_type not in _OBJECT_ACE_TYPE_VALUES:
+        return ace_offset + 8
+
+    flags: int = _OBJECT_FLAGS_STRUCT.unpack_from(data, ace_offset + 8)[0]
+    return ace_offset + 12 + (
+        16 if flags & ACEObjectFlagMask.ACE_OBJECT_TYPE_PRESENT else 0
+    ) + (
+        16 if flags & ACEObjectFlagMask.ACE_INHERITED_OBJECT_TYPE_PRESENT else 0
+    )
+
+
+class ACEFilter:
+    """
+    A predicate on ACEs, checked against their raw bytes.
+
+    An ACE matches if it satisfies all the criteria that are specified; a filter without criteria matches all ACEs.
+    """
+
+    def __init__(
+        self,
+        ace_types: Optional[Iterable[ACEType]] = None,
+        access_mask: int = 0,
+        all_access_mask_bits: bool = False,
+        object_types: Optional[Iterable[UUID]] = None,
+        trustee_sids: Optional[Iterable[Union[SID, str]]] = None
+    ):
+        """
+        :param ace_types: The types of the ACEs to match.
+        :param access_mask: Bits of the access mask, e.g. `ActiveDirectoryRightsMask` values, of which ACEs must have
+            any bit set; `0` for no criterion.
+        :param all_access_mask_bits: Whether ACEs must have all the bits of `access_mask` set, rather than any.
+        :param object_types: The object types of the object ACEs to match; ACEs without an object type do not match.
+        :param trustee_sids: The trustees of the ACEs to match, as `SID` objects or SID strings.
+        """
+
+        self.ace_types: Optional[FrozenSet[int]] = frozenset(
+            int(ace_type) for ace_type in ace_types
+        ) if ace_types is not None else None
+
+        self.access_mask = int(access_mask)
+        self.all_access_mask_bits = all_access_mask_bits
+
+        self.object_types: Optional[FrozenSet[bytes]] = frozenset(
+            object_type.bytes_le for object_type in object_types
+        ) if object_types is not None else None
+
+        self.trustee_sids: Optional[FrozenSet[bytes]] = frozenset(
+            bytes(SID.from_string(sid) if isinstance(sid, str) else sid) for sid in trustee_sids
+        ) if trustee_sids is not None else None
+
+    def matches(self, data: ByteString, offset: int = 0) -> bool:
+        """
+        Check whether the ACE at an offset matches the filter.
+
+        :param data: The bytes containing the ACE.
+        :param offset: The offset of the ACE in `data`.
+        :return: Whether the ACE matches.
+        """
+
+        ace_type, _, _, access_mask = _ACE_PREFIX_STRUCT.unpack_from(data, offset)
+
+        if self.ace_types is not None and ace_type not in self.ace_types:
+            return False
+
+        if self.access_mask:
+            masked_access_mask: int = access_mask & self.access_mask
+            if masked_access_mask == 0 or (self.all_access_mask_bits and masked_access_mask != self.access_mask):
+                return False
+
+        if self.object_types is not None:
+            if ace_type not in _OBJECT_ACE_TYPE_VALUES:
+                return False
+            if not _OBJECT_FLAGS_STRUCT.unpack_from(data, offset + 8)[0] & ACEObjectFlagMask.ACE_OBJECT_TYPE_PRESENT:
+                return False
+            if bytes(data[offset + 12:offset + 28]) not in self.object_types:
+                return False
+
+        if self.trustee_sids is not None:
+            sid_offset: int = _trustee_sid_offset(data=data, ace_offset=offset, ace_type=ace_type)
+            if bytes(data[sid_offset:sid_offset + 8 + 4 * data[sid_offset + 1]]) not in self.trustee_sids:
+                return False
+
+        return True
+
+
+def iter_matching_ace_offsets(data: ByteString, ace_filter: ACEFilter) -> Iterator[int]:
+    """
+    Iterate over the offsets of the ACEs of an ACL that match a filter, without decoding any of them.
+
+    :param data: The bytes of the ACL.
+    :param ace_filter: The filter that the ACEs must match.
+    :return: An iterator of the offsets of the matching ACEs in `data`.
+    """
+
+    data = memoryview(data)
+
+    ace_offset = 8
+    for _ in range(_ACE_COUNT_STRUCT.unpack_from(data, 4)[0]):
+        if ace_filter.matches(data, ace_offset):
+            yield ace_offset
+        ace_offset += _ACE_PREFIX_STRUCT.unpack_from(data, ace_offset)[2]
+
+
+def filter_acl(data: ByteString, ace_filter: ACEFilter) -> List[ACE]:
+    """
+    Decode the ACEs of an ACL that match a filter.
+
+    :param data: The bytes of the ACL.
+    :param ace_filter: The filter that the ACEs must match.
+    :return: The matching ACEs, in the order of the ACL.
+    """
+
+    data = memoryview(data)
+    return [
+        ACE.from_bytes(data[ace_offset:ace_offset + _ACE_PREFIX_STRUCT.unpack_from(data, ace_offset)[2]])
+        for ace_offset in iter_matching_ace_offsets(data=data, ace_filter=ace_filter)
+    ]
+
+
+def _acl_views(data: ByteString, dacl: bool, sacl: bool) -> List[memoryview]:
+    data = memoryview(data)
+    _, _, _, sacl_offset, dacl_offset = SecurityDescriptor.unpack_header(data)
+
+    return [
+        data[acl_offset:]
+        for acl_offset, included in ((dacl_offset, dacl), (sacl_offset, sacl))
+        if included and acl_offset != 0
+    ]
+
+
+def find_aces(data: ByteString, ace_filter: ACEFilter, dacl: bool = True, sacl: bool = False) -> List[ACE]:
+    """
+    Decode the ACEs of a security descriptor that match a filter.
+
+    :param data: The bytes of the security descriptor.
+    :param ace_filter: The filter that the ACEs must match.
+    :param dacl: Whether to search the DACL.
+    :param sacl: Whether to search the SACL.
+    :return: The matching ACEs, those of the DACL first.
+    """
+
+    return [
+        ace
+        for acl_data in _acl_views(data=data, dacl=dacl, sacl=sacl)
+        for ace in filter_acl(data=acl_data, ace_filter=ace_filter)
+    ]
+
+
+def find_trustees(data: ByteString, ace_filter: ACEFilter, dacl: bool = True, sacl: bool = False) -> List[SID]:
+    """
+    Decode the distinct trustees of the ACEs of a security descriptor that match a filter, without decoding the ACEs.
+
+    :param data: The bytes of the security descriptor.
+    :param ace_filter: The filter that the ACEs must match.
+    :param dacl: Whether to search the DACL.
+    :param sacl: Whether to search the SACL.
+    :return: The trustee SIDs of the matching ACEs, in order of first appearance, those of the DACL first.
+    """
+
+    trustee_sids: Dict[bytes, SID] = {}
+
+    for acl_data in _acl_views(data=data, dacl=dacl, sacl=sacl):
+        for ace_offset in iter_matching_ace_offsets(data=acl_data, ace_filter=ace_filter):
+            sid_offset: int = _trustee_sid_offset(data=acl_data, ace_offset=ace_offset, ace_type=acl_data[ace_offset])
+            sid_bytes: bytes = bytes(acl_data[sid_offset:sid_offset + 8 + 4 * acl_data[sid_offset + 1]])
+            if sid_bytes not in trustee_sids:
+                trustee_sids[sid_bytes] = SID.from_bytes(sid_bytes)
+
+    return list(trustee_sids.values())
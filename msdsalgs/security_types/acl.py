@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import Tuple, List
-from struct import unpack as struct_unpack
+from struct import unpack as struct_unpack, pack_into as struct_pack_into
 
 from .ace import ACE
 
@@ -79,6 +79,35 @@ class ACL:
             aces=tuple(aces)
         )
 
+    def pack_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Write the ACL into a buffer.
+
+        The header's `AclSize` and `AceCount` are recalculated from the ACEs.
+
+        :param buffer: The buffer to write into.
+        :param offset: The offset in `buffer` at which to write the ACL.
+        :return: The offset following the ACL.
+        """
+
+        acl_offset: int = offset
+        offset += 8
+
+        for ace in self.aces:
+            offset = ace.pack_into(buffer, offset)
+
+        struct_pack_into('<BBHHH', buffer, acl_offset, self._packet.revision, 0, offset - acl_offset, len(self.aces), 0)
+
+        return offset
+
+    def __bytes__(self) -> bytes:
+        buffer = bytearray(len(self))
+        self.pack_into(buffer)
+        return bytes(buffer)
+
+    def __len__(self) -> int:
+        return 8 + sum(len(ace) for ace in self.aces)
+
 
 @dataclass
 class SACL(ACL):
@@ -0,0 +1,722 @@
+"""
+Conditional expressions of callback ACEs, and the resource attributes of resource attribute ACEs.
+
+The binary format of a conditional expression ([MS-DTYP] 2.4.4.17.4), the application data of a callback ACE starting
+with `artx`, is a sequence of tokens in postfix notation. An expression is compiled once into a tree of closures, which
+is cached by the bytes of the expression, so that evaluating it again, against another `ConditionalContext`, does not
+interpret the bytes again.
+
+The evaluation follows the three-valued logic of [MS-DTYP] 2.4.4.17: an expression evaluates to `TRUE`, `FALSE` or
+`UNKNOWN`, e.g. when an attribute is missing or when values of different types are compared. String comparisons are
+case-insensitive, unless an attribute that is compared has the `VALUE_CASE_SENSITIVE` flag.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import Enum, IntFlag
+from functools import lru_cache
+from operator import attrgetter, lt, le, gt, ge
+from struct import Struct
+from typing import Optional, Tuple, Any, Callable, Dict, List, Mapping, Iterable, Union, ByteString, FrozenSet
+
+from msdsalgs.security_types.ace import ACE, ACEType
+from msdsalgs.security_types.acl import ACL
+from msdsalgs.security_types.sid import SID
+
+CONDITIONAL_EXPRESSION_SIGNATURE = b'artx'
+
+# The maximum number of compiled expressions that are cached.
+COMPILED_EXPRESSION_CACHE_SIZE = 4096
+
+
+class ConditionalExpressionError(Exception):
+    def __init__(self, offset: int, msg: Optional[str] = None):
+        super().__init__(msg or f'Bad conditional expression token at offset {offset}.')
+        self.offset = offset
+
+
+class ConditionalResult(Enum):
+    FALSE = 0
+    TRUE = 1
+    UNKNOWN = 2
+
+
+_TRUE = ConditionalResult.TRUE
+_FALSE = ConditionalResult.FALSE
+_UNKNOWN = ConditionalResult.UNKNOWN
+
+_NEGATED_RESULTS: Dict[ConditionalResult, ConditionalResult] = {_TRUE: _FALSE, _FALSE: _TRUE, _UNKNOWN: _UNKNOWN}
+
+
+class _SIDValue(bytes):
+    """
+    The bytes of a SID, distinguished from octet strings.
+    """
+
+
+class _StringValues(tuple):
+    """
+    The values of an operand that has strings, with the strings case-folded for case-insensitive comparisons.
+
+    :ivar exact_values: The values with the strings as they are, for case-sensitive comparisons.
+    """
+
+    exact_values: Tuple[Any, ...]
+
+
+class _CaseSensitiveStringValues(_StringValues):
+    """
+    The values of a case-sensitive attribute that has strings.
+    """
+
+
+# Values
+
+def _make_values(values: Tuple[Any, ...], case_sensitive: bool = False) -> Tuple[Any, ...]:
+    if not any(type(value) is str for value in values):
+        return values
+
+    string_values_class = _CaseSensitiveStringValues if case_sensitive else _StringValues
+    string_values = string_values_class(value.casefold() if type(value) is str else value for value in values)
+    string_values.exact_values = values
+    return string_values
+
+
+def _exact_values(
+    left_values: Tuple[Any, ...],
+    right_values: Tuple[Any, ...]
+) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+    # The values to compare when either operand is a case-sensitive attribute.
+    return (
+        left_values.exact_values if isinstance(left_values, _StringValues) else left_values,
+        right_values.exact_values if isinstance(right_values, _StringValues) else right_values
+    )
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, SID):
+        return _SIDValue(bytes(value))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+
+    raise TypeError(f'Unsupported attribute value type: {type(value).__name__}.')
+
+
+def _normalize_values(values: Any, case_sensitive: bool = False) -> Optional[Tuple[Any, ...]]:
+    if isinstance(values, (bool, int, str, SID, bytes, bytearray, memoryview)):
+        return _make_values((_normalize_value(values),), case_sensitive=case_sensitive)
+
+    normalized_values: Tuple[Any, ...] = tuple(_normalize_value(value) for value in values)
+    return _make_values(normalized_values, case_sensitive=case_sensitive) if normalized_values else None
+
+
+def _normalize_attributes(attributes: Optional[Mapping[str, Any]]) -> Dict[str, Tuple[Any, ...]]:
+    normalized_attributes: Dict[str, Tuple[Any, ...]] = {}
+    for name, values in (attributes or {}).items():
+        case_sensitive = False
+        if isinstance(values, ClaimSecurityAttribute):
+            case_sensitive = ClaimSecurityAttributeFlag.VALUE_CASE_SENSITIVE in values.flags
+            values = values.values
+
+        normalized_values: Optional[Tuple[Any, ...]] = _normalize_values(values, case_sensitive=case_sensitive)
+        if normalized_values is not None:
+            normalized_attributes[name.casefold()] = normalized_values
+
+    return normalized_attributes
+
+
+def _normalize_sids(sids: Iterable[Union[SID, str]]) -> FrozenSet[_SIDValue]:
+    return frozenset(_SIDValue(bytes(SID.from_string(sid) if isinstance(sid, str) else sid)) for sid in sids)
+
+
+class ConditionalContext:
+    """
+    The claims, resource attributes and group memberships against which conditional expressions are evaluated.
+
+    The value of an attribute is a value or a collection of values; a value is an `int`, a `bool`, a `str`, a `SID` or
+    an octet string. The value of an attribute may also be a `ClaimSecurityAttribute`, whose flags then apply, e.g.
+    `VALUE_CASE_SENSITIVE` for its strings to be compared case-sensitively. The names of the attributes are
+    case-insensitive.
+    """
+
+    __slots__ = ('user_claims', 'device_claims', 'local_claims', 'resource_attributes', 'user_sids', 'device_sids')
+
+    def __init__(
+        self,
+        user_claims: Optional[Mapping[str, Any]] = None,
+        device_claims: Optional[Mapping[str, Any]] = None,
+        local_claims: Optional[Mapping[str, Any]] = None,
+        resource_attributes: Optional[Mapping[str, Any]] = None,
+        user_sids: Iterable[Union[SID, str]] = (),
+        device_sids: Iterable[Union[SID, str]] = ()
+    ):
+        """
+        :param user_claims: The claims of the user, referred to by `@User.` attributes.
+        :param device_claims: The claims of the device, referred to by `@Device.` attributes.
+        :param local_claims: The local claims, referred to by attributes without a prefix.
+        :param resource_attributes: The attributes of the resource, referred to by `@Resource.` attributes, e.g. from
+            `resource_attributes_from_acl`.
+        :param user_sids: The SIDs of the user and of its groups, for the `Member_of` operators.
+        :param device_sids: The SIDs of the device and of its groups, for the `Device_Member_of` operators.
+        """
+
+        self.user_claims = _normalize_attributes(user_claims)
+        self.device_claims = _normalize_attributes(device_claims)
+        self.local_claims = _normalize_attributes(local_claims)
+        self.resource_attributes = _normalize_attributes(resource_attributes)
+        self.user_sids = _normalize_sids(user_sids)
+        self.device_sids = _normalize_sids(device_sids)
+
+
+# Tokens
+
+_PADDING_TOKEN = 0x00
+_INTEGER_TOKENS = frozenset((0x01, 0x02, 0x03, 0x04))
+_UNICODE_STRING_TOKEN = 0x10
+_OCTET_STRING_TOKEN = 0x18
+_COMPOSITE_TOKEN = 0x50
+_SID_TOKEN = 0x51
+_LITERAL_TOKENS = frozenset((
+    *_INTEGER_TOKENS,
+    _UNICODE_STRING_TOKEN,
+    _OCTET_STRING_TOKEN,
+    _COMPOSITE_TOKEN,
+    _SID_TOKEN
+))
+
+_ATTRIBUTE_SOURCES: Dict[int, Callable[[ConditionalContext], Dict[str, Tuple[Any, ...]]]] = {
+    0xF8: attrgetter('local_claims'),
+    0xF9: attrgetter('user_claims'),
+    0xFA: attrgetter('resource_attributes'),
+    0xFB: attrgetter('device_claims')
+}
+
+_EQUALS_TOKEN = 0x80
+_NOT_EQUALS_TOKEN = 0x81
+_ORDERING_TOKENS: Dict[int, Callable[[Any, Any], bool]] = {0x82: lt, 0x83: le, 0x84: gt, 0x85: ge}
+
+# The `Contains` and `Any_of` operators, and their negations.
+_CONTAINS_TOKENS: Dict[int, Tuple[bool, bool]] = {
+    0x86: (True, False),
+    0x88: (False, False),
+    0x8E: (True, True),
+    0x8F: (False, True)
+}
+
+# The `Member_of` operators: whether all SIDs must be members, whether the device SIDs are checked, and whether the
+# result is negated.
+_MEMBER_OF_TOKENS: Dict[int, Tuple[bool, bool, bool]] = {
+    0x89: (True, False, False),
+    0x8A: (True, True, False),
+    0x8B: (False, False, False),
+    0x8C: (False, True, False),
+    0x90: (True, False, True),
+    0x91: (True, True, True),
+    0x92: (False, False, True),
+    0x93: (False, True, True)
+}
+
+_EXISTS_TOKEN = 0x87
+_NOT_EXISTS_TOKEN = 0x8D
+
+_AND_TOKEN = 0xA0
+_OR_TOKEN = 0xA1
+_NOT_TOKEN = 0xA2
+
+# The 64-bit value, the sign and the base of an integer literal.
+_INTEGER_STRUCT = Struct('<qBB')
+_LENGTH_STRUCT = Struct('<I')
+
+
+def _unpack_length_prefixed(data: bytes, offset: int) -> Tuple[bytes, int]:
+    if offset + _LENGTH_STRUCT.size > len(data):
+        raise ConditionalExpressionError(offset=offset, msg=f'Truncated length at offset {offset}.')
+
+    length: int = _LENGTH_STRUCT.unpack_from(data, offset)[0]
+    start: int = offset + _LENGTH_STRUCT.size
+    if start + length > len(data):
+        raise ConditionalExpressionError(offset=offset, msg=f'Truncated value at offset {offset}.')
+
+    return data[start:start + length], start + length
+
+
+def _parse_literal(data: bytes, offset: int) -> Tuple[Tuple[Any, ...], int]:
+    """
+    Parse a literal token.
+
+    :param data: The bytes of the expression.
+    :param offset: The offset of the token.
+    :return: The values of the literal, several for a composite, and the offset of the next token.
+    """
+
+    token: int = data[offset]
+
+    if token in _INTEGER_TOKENS:
+        if offset + 1 + _INTEGER_STRUCT.size > len(data):
+            raise ConditionalExpressionError(offset=offset, msg=f'Truncated integer at offset {offset}.')
+        return (_INTEGER_STRUCT.unpack_from(data, offset + 1)[0],), offset + 1 + _INTEGER_STRUCT.size
+
+    value_bytes, next_offset = _unpack_length_prefixed(data=data, offset=offset + 1)
+
+    if token == _UNICODE_STRING_TOKEN:
+        return (value_bytes.decode(encoding='utf-16-le'),), next_offset
+    if token == _OCTET_STRING_TOKEN:
+        return (value_bytes,), next_offset
+    if token == _SID_TOKEN:
+        return (_SIDValue(value_bytes),), next_offset
+    if token == _COMPOSITE_TOKEN:
+        values: List[Any] = []
+        element_offset = 0
+        while element_offset < len(value_bytes):
+            element_values, element_offset = _parse_literal(data=value_bytes, offset=element_offset)
+            values.extend(element_values)
+        return tuple(values), next_offset
+
+    raise ConditionalExpressionError(offset=offset, msg=f'Not a literal token at offset {offset}: {token:#04x}.')
+
+
+# Compilation
+#
+# An expression is compiled into a tree of nodes, each a function of a `ConditionalContext`. An operand node, a literal
+# or an attribute, returns a tuple of values, or `None` if an attribute is missing; a boolean node, an operator,
+# returns a `ConditionalResult`.
+
+Node = Callable[[ConditionalContext], Any]
+
+
+def _literal_node(values: Tuple[Any, ...]) -> Node:
+    values = _make_values(values)
+    return lambda context: values
+
+
+def _attribute_node(source: Callable[[ConditionalContext], Dict[str, Tuple[Any, ...]]], name: str) -> Node:
+    return lambda context: source(context).get(name)
+
+
+def _as_boolean_node(node: Node) -> Node:
+    # An operand of a logical operator that is not the result of an operator is `TRUE` if it is a non-zero integer.
+    def evaluate(context: ConditionalContext) -> ConditionalResult:
+        values: Optional[Tuple[Any, ...]] = node(context)
+        if values is None or len(values) != 1 or type(values[0]) is not int:
+            return _UNKNOWN
+        return _TRUE if values[0] else _FALSE
+
+    return evaluate
+
+
+def _equality_node(left: Node, right: Node, negated: bool) -> Node:
+    equal_result, unequal_result = (_FALSE, _TRUE) if negated else (_TRUE, _FALSE)
+
+    def evaluate(context: ConditionalContext) -> ConditionalResult:
+        left_values: Optional[Tuple[Any, ...]] = left(context)
+        right_values: Optional[Tuple[Any, ...]] = right(context)
+        if left_values is None or right_values is None:
+            return _UNKNOWN
+
+        if type(left_values) is _CaseSensitiveStringValues or type(right_values) is _CaseSensitiveStringValues:
+            left_values, right_values = _exact_values(left_values, right_values)
+        if len(left_values) == 1 and len(right_values) == 1:
+            left_value, right_value = left_values[0], right_values[0]
+            if type(left_value) is not type(right_value):
+                return _UNKNOWN
+            return equal_result if left_value == right_value else unequal_result
+
+        return equal_result if set(left_values) == set(right_values) else unequal_result
+
+    return evaluate
+
+
+def _ordering_node(left: Node, right: Node, compare: Callable[[Any, Any], bool]) -> Node:
+    def evaluate(context: ConditionalContext) -> ConditionalResult:
+        left_values: Optional[Tuple[Any, ...]] = left(context)
+        right_values: Optional[Tuple[Any, ...]] = right(context)
+        if left_values is None or right_values is None or len(left_values) != 1 or len(right_values) != 1:
+            return _UNKNOWN
+
+        if type(left_values) is _CaseSensitiveStringValues or type(right_values) is _CaseSensitiveStringValues:
+            left_values, right_values = _exact_values(left_values, right_values)
+        left_value, right_value = left_values[0], right_values[0]
+        if type(left_value) is not type(right_value) or type(left_value) is _SIDValue:
+            return _UNKNOWN
+
+        return _TRUE if compare(left_value, right_value) else _FALSE
+
+    return evaluate
+
+
+def _contains_node(left: Node, right: Node, all_values: bool, negated: bool) -> Node:
+    match_result, mismatch_result = (_FALSE, _TRUE) if negated else (_TRUE, _FALSE)
+
+    def evaluate(context: ConditionalContext) -> ConditionalResult:
+        left_values: Optional[Tuple[Any, ...]] = left(context)
+        right_values: Optional[Tuple[Any, ...]] = right(context)
+        if left_values is None or right_values is None:
+            return _UNKNOWN
+
+        if type(left_values) is _CaseSensitiveStringValues or type(right_values) is _CaseSensitiveStringValues:
+            left_values, right_values = _exact_values(left_values, right_values)
+        if all_values:
+            matches: bool = set(right_values).issubset(left_values)
+        else:
+            matches: bool = not set(right_values).isdisjoint(left_values)
+
+        return match_result if matches else mismatch_result
+
+    return evaluate
+
+
+def _member_of_node(operand: Node, all_sids: bool, device: bool, negated: bool) -> Node:
+    member_sids: Callable[[ConditionalContext], FrozenSet[_SIDValue]] = attrgetter(
+        'device_sids' if device else 'user_sids'
+    )
+    match_result, mismatch_result = (_FALSE, _TRUE) if negated else (_TRUE, _FALSE)
+
+    def evaluate(context: ConditionalContext) -> ConditionalResult:
+        sids: Optional[Tuple[Any, ...]] = operand(context)
+        if sids is None or not all(type(sid) is _SIDValue for sid in sids):
+            return _UNKNOWN
+
+        if all_sids:
+            matches: bool = member_sids(context).issuperset(sids)
+        else:
+            matches: bool = not member_sids(context).isdisjoint(sids)
+
+        return match_result if matches else mismatch_result
+
+    return evaluate
+
+
+def _exists_node(operand: Node, negated: bool) -> Node:
+    exists_result, missing_result = (_FALSE, _TRUE) if negated else (_TRUE, _FALSE)
+    return lambda context: exists_result if operand(context) is not None else missing_result
+
+
+def _and_node(left: Node, right: Node) -> Node:
+    def evaluate(context: ConditionalContext) -> ConditionalResult:
+        left_result: ConditionalResult = left(context)
+        if left_result is _FALSE:
+            return _FALSE
+
+        right_result: ConditionalResult = right(context)
+        if right_result is _FALSE:
+            return _FALSE
+
+        return _TRUE if left_result is _TRUE and right_result is _TRUE else _UNKNOWN
+
+    return evaluate
+
+
+def _or_node(left: Node, right: Node) -> Node:
+    def evaluate(context: ConditionalContext) -> ConditionalResult:
+        left_result: ConditionalResult = left(context)
+        if left_result is _TRUE:
+            return _TRUE
+
+        right_result: ConditionalResult = right(context)
+        if right_result is _TRUE:
+            return _TRUE
+
+        return _FALSE if left_result is _FALSE and right_result is _FALSE else _UNKNOWN
+
+    return evaluate
+
+
+def _not_node(operand: Node) -> Node:
+    return lambda context: _NEGATED_RESULTS[operand(context)]
+
+
+class _NodeKind(Enum):
+    LITERAL = 0
+    ATTRIBUTE = 1
+    BOOLEAN = 2
+
+
+class ConditionalExpression:
+    """
+    A compiled conditional expression.
+    """
+
+    __slots__ = ('data', '_evaluate')
+
+    def __init__(self, data: bytes, evaluate: Node):
+        self.data = data
+        self._evaluate = evaluate
+
+    def evaluate(self, context: ConditionalContext) -> ConditionalResult:
+        """
+        Evaluate the expression.
+
+        :param context: The claims, resource attributes and group memberships to evaluate the expression against.
+        :return: The result of the expression.
+        """
+
+        return self._evaluate(context)
+
+    __call__ = evaluate
+
+
+def _compile(data: bytes) -> ConditionalExpression:
+    if not data.startswith(CONDITIONAL_EXPRESSION_SIGNATURE):
+        raise ConditionalExpressionError(offset=0, msg='The data does not start with the `artx` signature.')
+
+    # The nodes of the operands that have yet to be consumed by operators, and the kind of each.
+    stack: List[Tuple[Node, _NodeKind]] = []
+
+    def pop(offset: int) -> Tuple[Node, _NodeKind]:
+        if not stack:
+            raise ConditionalExpressionError(offset=offset, msg=f'Missing operand of the operator at offset {offset}.')
+        return stack.pop()
+
+    def pop_operand(offset: int) -> Node:
+        node, kind = pop(offset)
+        if kind is _NodeKind.BOOLEAN:
+            raise ConditionalExpressionError(
+                offset=offset,
+                msg=f'The operand of the operator at offset {offset} is not a literal or an attribute.'
+            )
+        return node
+
+    def pop_attribute(offset: int) -> Node:
+        node, kind = pop(offset)
+        if kind is not _NodeKind.ATTRIBUTE:
+            raise ConditionalExpressionError(
+                offset=offset,
+                msg=f'The operand of the operator at offset {offset} is not an attribute.'
+            )
+        return node
+
+    def pop_boolean(offset: int) -> Node:
+        node, kind = pop(offset)
+        return node if kind is _NodeKind.BOOLEAN else _as_boolean_node(node)
+
+    offset: int = len(CONDITIONAL_EXPRESSION_SIGNATURE)
+    while offset < len(data):
+        token: int = data[offset]
+
+        if token == _PADDING_TOKEN:
+            offset += 1
+        elif token in _LITERAL_TOKENS:
+            values, offset = _parse_literal(data=data, offset=offset)
+            stack.append((_literal_node(values), _NodeKind.LITERAL))
+        elif token in _ATTRIBUTE_SOURCES:
+            name_bytes, next_offset = _unpack_length_prefixed(data=data, offset=offset + 1)
+            stack.append((
+                _attribute_node(_ATTRIBUTE_SOURCES[token], name_bytes.decode(encoding='utf-16-le').casefold()),
+                _NodeKind.ATTRIBUTE
+            ))
+            offset = next_offset
+        elif token in (_EQUALS_TOKEN, _NOT_EQUALS_TOKEN):
+            right: Node = pop_operand(offset)
+            stack.append((
+                _equality_node(pop_operand(offset), right, negated=token == _NOT_EQUALS_TOKEN),
+                _NodeKind.BOOLEAN
+            ))
+            offset += 1
+        elif token in _ORDERING_TOKENS:
+            right: Node = pop_operand(offset)
+            stack.append((
+                _ordering_node(pop_operand(offset), right, compare=_ORDERING_TOKENS[token]),
+                _NodeKind.BOOLEAN
+            ))
+            offset += 1
+        elif token in _CONTAINS_TOKENS:
+            all_values, negated = _CONTAINS_TOKENS[token]
+            right: Node = pop_operand(offset)
+            stack.append((
+                _contains_node(pop_operand(offset), right, all_values=all_values, negated=negated),
+                _NodeKind.BOOLEAN
+            ))
+            offset += 1
+        elif token in _MEMBER_OF_TOKENS:
+            all_sids, device, negated = _MEMBER_OF_TOKENS[token]
+            stack.append((
+                _member_of_node(pop_operand(offset), all_sids=all_sids, device=device, negated=negated),
+                _NodeKind.BOOLEAN
+            ))
+            offset += 1
+        elif token in (_EXISTS_TOKEN, _NOT_EXISTS_TOKEN):
+            stack.append((_exists_node(pop_attribute(offset), negated=token == _NOT_EXISTS_TOKEN), _NodeKind.BOOLEAN))
+            offset += 1
+        elif token in (_AND_TOKEN, _OR_TOKEN):
+            right: Node = pop_boolean(offset)
+            left: Node = pop_boolean(offset)
+            stack.append((_and_node(left, right) if token == _AND_TOKEN else _or_node(left, right), _NodeKind.BOOLEAN))
+            offset += 1
+        elif token == _NOT_TOKEN:
+            stack.append((_not_node(pop_boolean(offset)), _NodeKind.BOOLEAN))
+            offset += 1
+        else:
+            raise ConditionalExpressionError(offset=offset, msg=f'Unknown token at offset {offset}: {token:#04x}.')
+
+    if len(stack) != 1:
+        raise ConditionalExpressionError(
+            offset=len(data),
+            msg=f'The expression does not reduce to a single result, but to {len(stack)}.'
+        )
+
+    node, kind = stack[0]
+    return ConditionalExpression(data=data, evaluate=node if kind is _NodeKind.BOOLEAN else _as_boolean_node(node))
+
+
+_compile_cached: Callable[[bytes], ConditionalExpression] = lru_cache(maxsize=COMPILED_EXPRESSION_CACHE_SIZE)(_compile)
+
+
+def is_conditional_expression(data: ByteString) -> bool:
+    return bytes(data[:len(CONDITIONAL_EXPRESSION_SIGNATURE)]) == CONDITIONAL_EXPRESSION_SIGNATURE
+
+
+def compile_conditional_expression(data: ByteString) -> ConditionalExpression:
+    """
+    Compile a conditional expression, or retrieve it from the cache of compiled expressions.
+
+    :param data: The bytes of the expression, e.g. the application data of a callback ACE.
+    :return: The compiled expression.
+    """
+
+    return _compile_cached(bytes(data))
+
+
+# ACEs
+
+_DENIED_CALLBACK_ACE_TYPES = {ACEType.ACCESS_DENIED_CALLBACK_ACE_TYPE, ACEType.ACCESS_DENIED_CALLBACK_OBJECT_ACE_TYPE}
+
+
+def evaluate_ace_condition(ace: ACE, context: ConditionalContext) -> ConditionalResult:
+    """
+    Evaluate the conditional expression of a callback ACE.
+
+    :param ace: A callback ACE whose application data is a conditional expression.
+    :param context: The claims, resource attributes and group memberships to evaluate the expression against.
+    :return: The result of the expression.
+    """
+
+    return compile_conditional_expression(ace.application_data).evaluate(context)
+
+
+def ace_applies(ace: ACE, context: ConditionalContext) -> bool:
+    """
+    Determine whether a conditional ACE applies in an access check.
+
+    An access-denied ACE applies if its expression is `TRUE` or `UNKNOWN`; other ACEs apply only if it is `TRUE`.
+
+    :param ace: A callback ACE whose application data is a conditional expression.
+    :param context: The claims, resource attributes and group memberships to evaluate the expression against.
+    :return: Whether the ACE applies.
+    """
+
+    result: ConditionalResult = evaluate_ace_condition(ace=ace, context=context)
+    return result is _TRUE or (result is _UNKNOWN and ace.header.ace_type in _DENIED_CALLBACK_ACE_TYPES)
+
+
+# Resource attributes
+
+class ClaimSecurityAttributeType(Enum):
+    INT64 = 0x0001
+    UINT64 = 0x0002
+    STRING = 0x0003
+    SID = 0x0005
+    BOOLEAN = 0x0006
+    OCTET_STRING = 0x0010
+
+
+class ClaimSecurityAttributeFlag(IntFlag):
+    NON_INHERITABLE = 0x0001
+    VALUE_CASE_SENSITIVE = 0x0002
+    USE_FOR_DENY_ONLY = 0x0004
+    DISABLED_BY_DEFAULT = 0x0008
+    DISABLED = 0x0010
+    MANDATORY = 0x0020
+
+
+@dataclass(frozen=True)
+class ClaimSecurityAttribute:
+    """
+    A claim security attribute, e.g. a resource attribute.
+
+    :ivar name: The name of the attribute.
+    :ivar values: The values of the attribute, as `int`, `bool`, `str`, `SID` or `bytes` objects.
+    :ivar flags: The flags of the attribute.
+    """
+
+    name: str
+    values: Tuple[Any, ...]
+    flags: ClaimSecurityAttributeFlag = ClaimSecurityAttributeFlag(0)
+
+
+# The offset of the name, the value type, `Reserved`, the flags and the number of values.
+_CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1_STRUCT = Struct('<IHHII')
+_INT64_STRUCT = Struct('<q')
+_UINT64_STRUCT = Struct('<Q')
+
+
+def _unpack_utf16_string(data: bytes, offset: int) -> str:
+    end: int = offset
+    while end + 1 < len(data) and data[end:end + 2] != b'\x00\x00':
+        end += 2
+    return data[offset:end].decode(encoding='utf-16-le')
+
+
+def parse_claim_security_attribute(data: ByteString) -> ClaimSecurityAttribute:
+    """
+    Parse a `CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1` structure ([MS-DTYP] 2.4.10.1), the attribute data of a resource
+    attribute ACE.
+
+    :param data: The bytes of the structure.
+    :return: The attribute, with its name, values and flags.
+    """
+
+    data = bytes(data)
+
+    name_offset, value_type, _, flags, value_count = _CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1_STRUCT.unpack_from(data)
+    value_offsets: Tuple[int, ...] = Struct(f'<{value_count}I').unpack_from(
+        data,
+        _CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1_STRUCT.size
+    )
+
+    attribute_type = ClaimSecurityAttributeType(value_type)
+
+    values: List[Any] = []
+    for value_offset in value_offsets:
+        if attribute_type is ClaimSecurityAttributeType.INT64:
+            values.append(_INT64_STRUCT.unpack_from(data, value_offset)[0])
+        elif attribute_type is ClaimSecurityAttributeType.UINT64:
+            values.append(_UINT64_STRUCT.unpack_from(data, value_offset)[0])
+        elif attribute_type is ClaimSecurityAttributeType.BOOLEAN:
+            values.append(_UINT64_STRUCT.unpack_from(data, value_offset)[0] != 0)
+        elif attribute_type is ClaimSecurityAttributeType.STRING:
+            values.append(_unpack_utf16_string(data=data, offset=value_offset))
+        else:
+            length: int = _LENGTH_STRUCT.unpack_from(data, value_offset)[0]
+            value_bytes: bytes = data[value_offset + 4:value_offset + 4 + length]
+            values.append(
+                SID.from_bytes(value_bytes) if attribute_type is ClaimSecurityAttributeType.SID else value_bytes
+            )
+
+    return ClaimSecurityAttribute(
+        name=_unpack_utf16_string(data=data, offset=name_offset),
+        values=tuple(values),
+        flags=ClaimSecurityAttributeFlag(flags)
+    )
+
+
+def resource_attributes_from_acl(acl: ACL) -> Dict[str, ClaimSecurityAttribute]:
+    """
+    Collect the resource attributes of the resource attribute ACEs of a SACL.
+
+    :param acl: A SACL.
+    :return: The resource attributes, by name, to be passed as the `resource_attributes` of a `ConditionalContext`.
+    """
+
+    resource_attributes: Dict[str, ClaimSecurityAttribute] = {}
+    for ace in acl.aces:
+        if ace.header.ace_type == ACEType.SYSTEM_RESOURCE_ATTRIBUTE_ACE_TYPE:
+            attribute: ClaimSecurityAttribute = parse_claim_security_attribute(ace.attribute_data)
+            resource_attributes[attribute.name] = attribute
+
+    return resource_attributes
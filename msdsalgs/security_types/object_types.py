@@ -0,0 +1,119 @@
+"""
+The object types of object ACEs: interning of their GUIDs, and a table of well-known Active Directory object types.
+
+In Active Directory, a handful of GUIDs, those of property sets, extended rights and schema attributes, make up nearly
+all the object types of object ACEs. The GUIDs decoded by `ACE.from_bytes` are interned by their raw bytes, so that each
+distinct GUID is built once and equal GUIDs are the same object; the GUIDs of the table of well-known object types are
+interned as well, so that an object type can be classified by an identity check.
+
+The table is loaded when first used.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Dict, Optional, ByteString
+from uuid import UUID
+
+# The maximum number of interned GUIDs; further GUIDs are built but not interned, so that the memory of the cache is
+# bounded when decoding untrusted data.
+MAX_INTERNED_GUIDS = 65536
+
+# The interned GUIDs, by their raw bytes in the little-endian GUID packet representation of [MS-DTYP] 2.3.4.2.
+_INTERNED_GUIDS: Dict[bytes, UUID] = {}
+
+
+def intern_guid(data: ByteString) -> UUID:
+    """
+    Retrieve the interned GUID of raw GUID bytes, interning it if it is not already.
+
+    :param data: The 16 bytes of a GUID, in the little-endian GUID packet representation.
+    :return: The GUID.
+    """
+
+    guid_bytes: bytes = bytes(data)
+
+    guid: Optional[UUID] = _INTERNED_GUIDS.get(guid_bytes)
+    if guid is None:
+        guid = UUID(bytes_le=guid_bytes)
+        if len(_INTERNED_GUIDS) < MAX_INTERNED_GUIDS:
+            guid = _INTERNED_GUIDS.setdefault(guid_bytes, guid)
+
+    return guid
+
+
+def clear_interned_guids() -> None:
+    """
+    Discard the interned GUIDs. The GUIDs of the table of well-known object types are kept interned.
+    """
+
+    _INTERNED_GUIDS.clear()
+    if _well_known_object_types is not None:
+        for guid in _well_known_object_types:
+            _INTERNED_GUIDS[guid.bytes_le] = guid
+
+
+class ObjectTypeKind(Enum):
+    CLASS = 'class'
+    ATTRIBUTE = 'attribute'
+    PROPERTY_SET = 'property_set'
+    EXTENDED_RIGHT = 'extended_right'
+    VALIDATED_WRITE = 'validated_write'
+
+
+@dataclass(frozen=True)
+class WellKnownObjectType:
+    guid: UUID
+    name: str
+    kind: ObjectTypeKind
+
+
+_well_known_object_types: Optional[Dict[UUID, WellKnownObjectType]] = None
+_well_known_object_types_lock = Lock()
+
+
+def well_known_object_types() -> Dict[UUID, WellKnownObjectType]:
+    """
+    Retrieve the table of well-known Active Directory object types, loading it if it has not been loaded.
+
+    :return: The well-known object types, by their interned GUIDs.
+    """
+
+    global _well_known_object_types
+
+    if _well_known_object_types is None:
+        with _well_known_object_types_lock:
+            if _well_known_object_types is None:
+                from msdsalgs.security_types._well_known_object_types import WELL_KNOWN_OBJECT_TYPES
+
+                object_types: Dict[UUID, WellKnownObjectType] = {}
+                for guid_string, name, kind in WELL_KNOWN_OBJECT_TYPES:
+                    guid: UUID = UUID(guid_string)
+                    guid = _INTERNED_GUIDS.setdefault(guid.bytes_le, guid)
+                    object_types[guid] = WellKnownObjectType(guid=guid, name=name, kind=ObjectTypeKind(kind))
+
+                _well_known_object_types = object_types
+
+    return _well_known_object_types
+
+
+def well_known_object_type(guid: UUID) -> Optional[WellKnownObjectType]:
+    """
+    Classify an object type GUID.
+
+    :param guid: The GUID of an object type.
+    :return: The well-known object type with the GUID; `None` if it is not well-known.
+    """
+
+    return well_known_object_types().get(guid)
+
+
+def object_type_name(guid: UUID) -> Optional[str]:
+    """
+    :param guid: The GUID of an object type.
+    :return: The name of the well-known object type with the GUID; `None` if it is not well-known.
+    """
+
+    object_type: Optional[WellKnownObjectType] = well_known_object_type(guid)
+    return object_type.name if object_type is not None else None
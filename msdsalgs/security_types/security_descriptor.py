@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, ClassVar, ByteString
+from typing import Optional, ClassVar, ByteString, List, Tuple
 from enum import IntFlag
-from struct import unpack_from, pack
+from struct import Struct
 
 from msdsalgs.security_types.sid import SID
 from msdsalgs.security_types.acl import SACL, DACL
@@ -70,30 +70,25 @@ class SecurityDescriptor:
     dacl: Optional[DACL]
 
     REVISION: ClassVar[int] = 1
-    SBZ_1: ClassVar[int] = 1
+    SBZ_1: ClassVar[int] = 0
 
-    @classmethod
-    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> SecurityDescriptor:
-        data = memoryview(data)[base_offset:]
-        offset = 0
+    # The revision, `Sbz1`, the control flags and the offsets of the owner, the group, the SACL and the DACL.
+    _HEADER_STRUCT: ClassVar[Struct] = Struct('<BBHIIII')
 
-        # TODO: Parse `Revision` and `Sbz1`?
-        offset += 2
-
-        control_mask = SecurityDescriptorControl.from_int(value=unpack_from('<H', buffer=data, offset=offset)[0])
-        offset += 2
-
-        owner_offset: int = unpack_from('<I', buffer=data, offset=offset)[0]
-        offset += 4
+    @classmethod
+    def unpack_header(cls, data: ByteString) -> Tuple[Mask, int, int, int, int]:
+        """
+        Unpack and validate the header of a security descriptor.
 
-        group_offset: int = unpack_from('<I', buffer=data, offset=offset)[0]
-        offset += 4
+        :param data: The bytes of the security descriptor, starting with its header.
+        :return: The control flags, and the offsets of the owner, the group, the SACL and the DACL, `0` for absent
+            components.
+        """
 
-        sacl_offset: int = unpack_from('<I', buffer=data, offset=offset)[0]
-        offset += 4
+        # TODO: Parse `Revision` and `Sbz1`?
+        control, owner_offset, group_offset, sacl_offset, dacl_offset = cls._HEADER_STRUCT.unpack_from(data)[2:]
 
-        dacl_offset: int = unpack_from('<I', buffer=data, offset=offset)[0]
-        offset += 4
+        control_mask = SecurityDescriptorControl.from_int(value=control)
 
         if owner_offset == 0 and not control_mask.owner_defaulted:
             raise BadOwnerOffsetError(
@@ -114,53 +109,69 @@ class SecurityDescriptor:
             )
 
         if dacl_offset == 0 and control_mask.dacl_present:
-            raise BadSACLOffsetError(
+            raise BadDACLOffsetError(
                 offset=dacl_offset,
                 msg='The DACL offset is 0 even though `SE_DACL_PRESENT` is set.'
             )
 
+        return control_mask, owner_offset, group_offset, sacl_offset, dacl_offset
+
+    @classmethod
+    def from_bytes(cls, data: ByteString, base_offset: int = 0) -> SecurityDescriptor:
+        data = memoryview(data)[base_offset:]
+
+        control_mask, owner_offset, group_offset, sacl_offset, dacl_offset = cls.unpack_header(data)
+
         return cls(
             control=control_mask,
-            owner_sid=SID.from_bytes(data=data[owner_offset:group_offset]) if owner_offset != 0 else None,
+            owner_sid=SID.from_bytes(data=data[owner_offset:]) if owner_offset != 0 else None,
             group_sid=SID.from_bytes(data=data[group_offset:]) if group_offset != 0 else None,
             dacl=DACL.from_bytes(data=data[dacl_offset:]) if dacl_offset != 0 else None,
             sacl=SACL.from_bytes(data=data[sacl_offset:]) if sacl_offset != 0 else None
         )
 
-    def __bytes__(self) -> bytes:
+    def pack_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Write the security descriptor into a buffer, in self-relative form.
+
+        The components are written one after the other following the header, whose offsets are filled in last.
+
+        :param buffer: The buffer to write into.
+        :param offset: The offset in `buffer` at which to write the security descriptor.
+        :return: The offset following the security descriptor.
+        """
+
+        header_offset: int = offset
+        offset += self._HEADER_STRUCT.size
 
-        structures_offset = 20
-
-        if self.owner_sid is not None:
-            owner_sid_offset = structures_offset
-            structures_offset += len(self.owner_sid)
-        else:
-            owner_sid_offset = 0
-
-        if self.group_sid is not None:
-            group_sid_offset = structures_offset
-            structures_offset += len(self.group_sid)
-        else:
-            group_sid_offset = 0
-
-        if self.sacl is not None:
-            sacl_offset = structures_offset
-            structures_offset += len(self.sacl)
-        else:
-            sacl_offset = 0
-
-        if self.dacl is not None:
-            dacl_offset = structures_offset
-            structures_offset += len(self.dacl)
-        else:
-            dacl_offset = 0
-
-        return b''.join([
+        component_offsets: List[int] = []
+        for component in (self.owner_sid, self.group_sid, self.sacl, self.dacl):
+            if component is None:
+                component_offsets.append(0)
+            else:
+                component_offsets.append(offset - header_offset)
+                offset = component.pack_into(buffer, offset)
+
+        self._HEADER_STRUCT.pack_into(
+            buffer,
+            header_offset,
             self.REVISION,
             self.SBZ_1,
-            pack('<H', int(self.control)),
-            pack('<I', owner_sid_offset),
-            pack('<I', group_sid_offset),
-            pack('<I', sacl_offset),
-            pack('<I', dacl_offset)
-        ])
+            int(self.control),
+            *component_offsets
+        )
+
+        return offset
+
+    def __bytes__(self) -> bytes:
+        # The length is calculated from the components, so that they are serialized only once, into a single buffer.
+        buffer = bytearray(len(self))
+        self.pack_into(buffer)
+        return bytes(buffer)
+
+    def __len__(self) -> int:
+        return self._HEADER_STRUCT.size + sum(
+            len(component)
+            for component in (self.owner_sid, self.group_sid, self.sacl, self.dacl)
+            if component is not None
+        )
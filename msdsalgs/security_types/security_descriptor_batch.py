@@ -0,0 +1,311 @@
+"""
+Batch decoding of many security descriptors, e.g. the `nTSecurityDescriptor` values of the objects of LDAP result
+pages.
+
+The security descriptors of a directory share most of their components: a few owners and groups, and ACEs that are
+inherited by whole subtrees. A `SecurityDescriptorBatchDecoder` decodes each distinct SID, ACE and ACL of a batch once,
+keyed by its raw bytes, and only decodes the components that are asked for. The decoded components are kept private to
+the decoder; each result gets its own copies of them, which may be modified freely, and the read-only `DACLSummary`
+objects, which are shared between the results.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntFlag
+from struct import Struct
+from types import MappingProxyType
+from typing import Optional, Dict, List, Sequence, ByteString, Type, Tuple, Mapping, Any, TypeVar
+
+from msdsalgs.security_types.sid import SID
+from msdsalgs.security_types.ace import ACE, ACEType, ACEFlagsMask, OBJECT_ACE_TYPES
+from msdsalgs.security_types.acl import ACL, ACLPacket, SACL, DACL
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+from msdsalgs.utils import Mask
+
+
+class SecurityDescriptorField(IntFlag):
+    CONTROL = 0x01
+    OWNER = 0x02
+    GROUP = 0x04
+    SACL = 0x08
+    DACL = 0x10
+    DACL_SUMMARY = 0x20
+    ALL = CONTROL | OWNER | GROUP | SACL | DACL
+
+
+# The unconditional ACE types that grant or deny access to an object, which are accounted for in a `DACLSummary`.
+ALLOWED_ACE_TYPES = {ACEType.ACCESS_ALLOWED_ACE_TYPE, ACEType.ACCESS_ALLOWED_OBJECT_ACE_TYPE}
+DENIED_ACE_TYPES = {ACEType.ACCESS_DENIED_ACE_TYPE, ACEType.ACCESS_DENIED_OBJECT_ACE_TYPE}
+
+# The number of blobs below which a batch is decoded in the calling process, and the number of blobs per task of a
+# process pool.
+DEFAULT_CHUNK_SIZE = 1024
+
+# The default maximum number of SIDs, ACEs, ACLs and DACL summaries that a decoder keeps cached, each; the least
+# recently used ones are discarded beyond it, so that the memory of a decoder is bounded.
+DEFAULT_MAX_CACHED_COMPONENTS = 65536
+
+_T = TypeVar('_T')
+
+
+def _shallow_copy(obj: _T) -> _T:
+    copied_obj = object.__new__(obj.__class__)
+    copied_obj.__dict__.update(obj.__dict__)
+    return copied_obj
+
+
+class _LRUCache(OrderedDict):
+    """
+    A mapping that discards its least recently used items beyond a maximum size.
+    """
+
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+
+    def lookup(self, key: Any) -> Any:
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, key: Any, value: _T) -> _T:
+        self[key] = value
+        if len(self) > self.max_size:
+            self.popitem(last=False)
+        return value
+
+
+@dataclass(frozen=True)
+class DACLSummary:
+    """
+    A compact, read-only summary of a DACL.
+
+    The access masks are those of the unconditional access-allowed and access-denied ACEs that apply to the object
+    itself, i.e. that are not inherit-only and, for object ACEs, have no object type.
+
+    :ivar num_aces: The number of ACEs of the DACL.
+    :ivar num_inherited_aces: The number of ACEs of the DACL that were inherited.
+    :ivar allowed: The combined access mask granted to each trustee, by the string representation of its SID.
+    :ivar denied: The combined access mask denied to each trustee, by the string representation of its SID.
+    """
+
+    num_aces: int
+    num_inherited_aces: int
+    allowed: Mapping[str, int] = field(default_factory=dict)
+    denied: Mapping[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'allowed', MappingProxyType(dict(self.allowed)))
+        object.__setattr__(self, 'denied', MappingProxyType(dict(self.denied)))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.num_aces, self.num_inherited_aces, dict(self.allowed), dict(self.denied))
+
+    @classmethod
+    def from_acl(cls, acl: ACL) -> DACLSummary:
+        num_inherited_aces = 0
+        allowed: Dict[str, int] = {}
+        denied: Dict[str, int] = {}
+
+        for ace in acl.aces:
+            ace_flags = ace.header.ace_flags
+            if ACEFlagsMask.INHERITED_ACE in ace_flags:
+                num_inherited_aces += 1
+
+            ace_type: ACEType = ace.header.ace_type
+            if ace_type in ALLOWED_ACE_TYPES:
+                access_masks: Dict[str, int] = allowed
+            elif ace_type in DENIED_ACE_TYPES:
+                access_masks: Dict[str, int] = denied
+            else:
+                continue
+
+            if ACEFlagsMask.INHERIT_ONLY_ACE in ace_flags:
+                continue
+            if ace_type in OBJECT_ACE_TYPES and ace.object_type is not None:
+                continue
+
+            trustee: str = str(ace.trustee_sid)
+            access_masks[trustee] = access_masks.get(trustee, 0) | int(ace.access_mask)
+
+        return cls(num_aces=len(acl.aces), num_inherited_aces=num_inherited_aces, allowed=allowed, denied=denied)
+
+
+@dataclass
+class DecodedSecurityDescriptor:
+    """
+    The components of a security descriptor that were asked for; the others are `None`, as are absent components.
+    """
+
+    control: Optional[Mask] = None
+    owner_sid: Optional[SID] = None
+    group_sid: Optional[SID] = None
+    sacl: Optional[SACL] = None
+    dacl: Optional[DACL] = None
+    dacl_summary: Optional[DACLSummary] = None
+
+
+class SecurityDescriptorBatchDecoder:
+    """
+    A decoder of security descriptors that decodes each distinct SID, ACE and ACL once while it is cached, and hands out
+    copies of them.
+
+    A decoder may be kept across batches, e.g. the pages of an LDAP search, so that components shared between the
+    batches are decoded once. Its caches are bounded: beyond `max_cached_components` of a kind, the least recently used
+    components are discarded.
+    """
+
+    _ACE_HEADER_STRUCT = Struct('<BBH')
+    _ACL_SIZE_STRUCT = Struct('<H')
+
+    def __init__(
+        self,
+        fields: SecurityDescriptorField = SecurityDescriptorField.ALL,
+        max_cached_components: int = DEFAULT_MAX_CACHED_COMPONENTS
+    ):
+        """
+        :param fields: The components of the security descriptors to decode.
+        :param max_cached_components: The maximum number of SIDs, ACEs, ACLs and DACL summaries, each, to keep cached.
+        """
+
+        self.fields = fields
+        self._sids: _LRUCache = _LRUCache(max_size=max_cached_components)
+        self._aces: _LRUCache = _LRUCache(max_size=max_cached_components)
+        self._acls: _LRUCache = _LRUCache(max_size=max_cached_components)
+        self._dacl_summaries: _LRUCache = _LRUCache(max_size=max_cached_components)
+
+    def clear(self) -> None:
+        """
+        Discard the cached components.
+        """
+
+        for cache in (self._sids, self._aces, self._acls, self._dacl_summaries):
+            cache.clear()
+
+    def _decode_sid(self, data: ByteString) -> SID:
+        sid_bytes: bytes = bytes(data[:8 + 4 * data[1]])
+
+        sid: Optional[SID] = self._sids.lookup(sid_bytes)
+        if sid is None:
+            sid = self._sids.store(sid_bytes, SID.from_bytes(sid_bytes))
+        return sid
+
+    def _decode_ace(self, ace_bytes: bytes) -> ACE:
+        ace: Optional[ACE] = self._aces.lookup(ace_bytes)
+        if ace is None:
+            ace = self._aces.store(ace_bytes, ACE.from_bytes(ace_bytes, decode_sid=self._decode_sid))
+        return ace
+
+    def _decode_acl(self, data: memoryview, acl_class: Type[ACL]) -> ACL:
+        acl_bytes: bytes = bytes(data[:self._ACL_SIZE_STRUCT.unpack_from(data, 2)[0]])
+
+        acl: Optional[ACL] = self._acls.lookup((acl_class, acl_bytes))
+        if acl is not None:
+            return acl
+
+        acl_packet = ACLPacket.from_bytes(acl_bytes[0:8])
+
+        aces: List[ACE] = []
+        ace_data_offset = 8
+        for _ in range(acl_packet.ace_count):
+            ace_size: int = self._ACE_HEADER_STRUCT.unpack_from(acl_bytes, ace_data_offset)[2]
+            aces.append(self._decode_ace(acl_bytes[ace_data_offset:ace_data_offset + ace_size]))
+            ace_data_offset += ace_size
+
+        return self._acls.store((acl_class, acl_bytes), acl_class(_packet=acl_packet, aces=tuple(aces)))
+
+    def _summarize_dacl(self, data: memoryview) -> DACLSummary:
+        dacl_bytes: bytes = bytes(data[:self._ACL_SIZE_STRUCT.unpack_from(data, 2)[0]])
+
+        summary: Optional[DACLSummary] = self._dacl_summaries.lookup(dacl_bytes)
+        if summary is None:
+            summary = self._dacl_summaries.store(dacl_bytes, DACLSummary.from_acl(self._decode_acl(data, DACL)))
+        return summary
+
+    @staticmethod
+    def _copy_acl(acl: ACL) -> ACL:
+        aces: List[ACE] = []
+        for ace in acl.aces:
+            copied_ace: ACE = _shallow_copy(ace)
+            copied_ace.header = _shallow_copy(ace.header)
+            copied_ace.trustee_sid = _shallow_copy(ace.trustee_sid)
+            aces.append(copied_ace)
+
+        return acl.__class__(_packet=_shallow_copy(acl._packet), aces=tuple(aces))
+
+    def decode(self, data: ByteString) -> DecodedSecurityDescriptor:
+        """
+        Decode the components of a security descriptor that were asked for.
+
+        The SIDs and ACLs of the result are copies that it does not share with other results.
+
+        :param data: The bytes of the security descriptor.
+        :return: The decoded components.
+        """
+
+        data = memoryview(data)
+        fields: SecurityDescriptorField = self.fields
+
+        control_mask, owner_offset, group_offset, sacl_offset, dacl_offset = SecurityDescriptor.unpack_header(data)
+
+        decoded = DecodedSecurityDescriptor()
+
+        if SecurityDescriptorField.CONTROL in fields:
+            decoded.control = control_mask
+        if SecurityDescriptorField.OWNER in fields and owner_offset != 0:
+            decoded.owner_sid = _shallow_copy(self._decode_sid(data[owner_offset:]))
+        if SecurityDescriptorField.GROUP in fields and group_offset != 0:
+            decoded.group_sid = _shallow_copy(self._decode_sid(data[group_offset:]))
+        if SecurityDescriptorField.SACL in fields and sacl_offset != 0:
+            decoded.sacl = self._copy_acl(self._decode_acl(data[sacl_offset:], SACL))
+        if dacl_offset != 0:
+            if SecurityDescriptorField.DACL in fields:
+                decoded.dacl = self._copy_acl(self._decode_acl(data[dacl_offset:], DACL))
+            if SecurityDescriptorField.DACL_SUMMARY in fields:
+                decoded.dacl_summary = self._summarize_dacl(data[dacl_offset:])
+
+        return decoded
+
+    def decode_many(self, blobs: Sequence[ByteString]) -> List[DecodedSecurityDescriptor]:
+        return [self.decode(data=data) for data in blobs]
+
+
+def _decode_chunk(blobs: List[bytes], fields: SecurityDescriptorField) -> List[DecodedSecurityDescriptor]:
+    return SecurityDescriptorBatchDecoder(fields=fields).decode_many(blobs)
+
+
+def decode_many(
+    blobs: Sequence[ByteString],
+    *,
+    fields: SecurityDescriptorField = SecurityDescriptorField.ALL,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> List[DecodedSecurityDescriptor]:
+    """
+    Decode a batch of security descriptors.
+
+    :param blobs: The bytes of each security descriptor.
+    :param fields: The components of the security descriptors to decode.
+    :param processes: The number of processes among which to spread the batch if it has more than `chunk_size`
+        security descriptors; by default, the batch is decoded in the calling process.
+    :param chunk_size: The number of security descriptors decoded by each task of the process pool.
+    :return: The decoded components of each security descriptor, in the order of the blobs.
+    """
+
+    if not processes or len(blobs) <= chunk_size:
+        return SecurityDescriptorBatchDecoder(fields=fields).decode_many(blobs)
+
+    chunks: List[List[bytes]] = [
+        [bytes(data) for data in blobs[start:start + chunk_size]]
+        for start in range(0, len(blobs), chunk_size)
+    ]
+
+    decoded_list: List[DecodedSecurityDescriptor] = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for decoded_chunk in executor.map(_decode_chunk, chunks, [fields] * len(chunks)):
+            decoded_list.extend(decoded_chunk)
+
+    return decoded_list
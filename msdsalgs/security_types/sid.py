@@ -28,6 +28,10 @@ class IdentifierAuthority(Enum):
         return pack('<BBBBBB', *self.value)
 
 
+# The layouts of SIDs, by number of sub-authorities.
+_SID_STRUCTS: tuple[Struct, ...] = tuple(Struct(f'<BB6B{num_sub_authorities}I') for num_sub_authorities in range(16))
+
+
 class SID:
     def __init__(
         self,
@@ -120,10 +124,31 @@ class SID:
         return b''.join([
             self._REVISION_NUMBER_STRUCT.pack(self._revision_number),
             self._NUM_SUB_AUTHORITIES_STRUCT.pack(len(self.sub_authorities)),
-            self._IDENTIFIER_AUTHORITY_STRUCT.pack(self.identifier_authority.value),
+            self._IDENTIFIER_AUTHORITY_STRUCT.pack(*self.identifier_authority.value),
             pack('<' + len(self.sub_authorities) * self._SUB_AUTHORITY_STRUCT_FORMAT, *self.sub_authorities)
         ])
 
+    def pack_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Write the SID into a buffer.
+
+        :param buffer: The buffer to write into.
+        :param offset: The offset in `buffer` at which to write the SID.
+        :return: The offset following the SID.
+        """
+
+        sid_struct: Struct = _SID_STRUCTS[len(self.sub_authorities)]
+        sid_struct.pack_into(
+            buffer,
+            offset,
+            self._revision_number,
+            len(self.sub_authorities),
+            *self.identifier_authority.value,
+            *self.sub_authorities
+        )
+
+        return offset + sid_struct.size
+
     def __len__(self) -> int:
         return (
             self._REVISION_NUMBER_STRUCT.size
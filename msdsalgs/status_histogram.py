@@ -0,0 +1,153 @@
+"""
+Histograms of large numbers of raw `NTSTATUS` values and Win32 error codes, e.g. from captured traffic.
+
+The values are counted with NumPy, which is required, and are only looked up in the status tables for the most
+common values that are asked for.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, List, Tuple, Optional
+
+from msdsalgs.status_metadata import StatusTable, NT_STATUS_TABLE, WIN32_ERROR_TABLE
+
+
+def _as_uint32_array(values: Any):
+    import numpy
+
+    if isinstance(values, numpy.ndarray):
+        return values.astype(numpy.uint32, copy=False)
+
+    # `array('I')` objects, and other objects supporting the buffer protocol, are viewed without copying.
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return numpy.asarray(values, dtype=numpy.uint32)
+
+    if view.format in ('I', '<I', '=I') or (view.format in ('L', '=L') and view.itemsize == 4):
+        return numpy.frombuffer(view, dtype=numpy.uint32)
+
+    return numpy.asarray(view, dtype=numpy.uint32)
+
+
+def _count_values(values: Any) -> Tuple[Any, Any]:
+    import numpy
+
+    distinct_values, counts = numpy.unique(_as_uint32_array(values), return_counts=True)
+    return distinct_values, counts.astype(numpy.int64, copy=False)
+
+
+@dataclass
+class StatusHistogram:
+    """
+    The number of occurrences of each distinct value of a collection of status values.
+
+    :ivar values: The distinct values, in ascending order, as a NumPy `uint32` array.
+    :ivar counts: The number of occurrences of each distinct value, as a NumPy `int64` array.
+    :ivar table: The table with which the values are named.
+    """
+
+    values: Any
+    counts: Any
+    table: StatusTable
+
+    @classmethod
+    def from_values(cls, values: Any, table: StatusTable) -> StatusHistogram:
+        """
+        Count the occurrences of status values.
+
+        :param values: A NumPy array, an `array('I')` or another sequence of raw status values.
+        :param table: The table with which the values are to be named.
+        :return: The histogram of the values.
+        """
+
+        distinct_values, counts = _count_values(values)
+        return cls(values=distinct_values, counts=counts, table=table)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def top(self, n: int) -> List[Tuple[int, int, Optional[str]]]:
+        """
+        Retrieve the most common values, along with their names.
+
+        :param n: The number of values to retrieve.
+        :return: The value, the number of occurrences and the name of each of the `n` most common values, most common
+            first; the names of unknown values are `None`.
+        """
+
+        import numpy
+
+        # A stable sort of the negated counts orders values with equal counts in ascending order.
+        indices = numpy.argsort(-self.counts, kind='stable')[:n]
+
+        return [
+            (value, count, self.table.name(value))
+            for value, count in zip(self.values[indices].tolist(), self.counts[indices].tolist())
+        ]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class NTStatusHistogram(StatusHistogram):
+    """
+    A histogram of `NTSTATUS` values, with the number of occurrences of each severity and facility.
+
+    :ivar severity_counts: The number of occurrences of each severity, indexed by `NTStatusSeverity` value.
+    :ivar facility_counts: The number of occurrences of each facility, indexed by facility value.
+    """
+
+    severity_counts: Any = None
+    facility_counts: Any = None
+
+    @classmethod
+    def from_values(cls, values: Any, table: StatusTable = NT_STATUS_TABLE) -> NTStatusHistogram:
+        import numpy
+
+        distinct_values, counts = _count_values(values)
+
+        # The fields are extracted from the distinct values only, weighted by their counts.
+        return cls(
+            values=distinct_values,
+            counts=counts,
+            table=table,
+            severity_counts=numpy.bincount(
+                distinct_values >> 30,
+                weights=counts,
+                minlength=4
+            ).astype(numpy.int64),
+            facility_counts=numpy.bincount(
+                (distinct_values >> 16) & 0x0FFF,
+                weights=counts,
+                minlength=0x1000
+            ).astype(numpy.int64)
+        )
+
+
+def nt_status_histogram(nt_statuses: Any) -> NTStatusHistogram:
+    """
+    Count the occurrences of `NTSTATUS` values, and of their severities and facilities.
+
+    Requires NumPy.
+
+    :param nt_statuses: A NumPy array, an `array('I')` or another sequence of raw `NTSTATUS` values.
+    :return: The histogram of the values.
+    """
+
+    return NTStatusHistogram.from_values(values=nt_statuses, table=NT_STATUS_TABLE)
+
+
+def win32_error_histogram(win32_error_codes: Any) -> StatusHistogram:
+    """
+    Count the occurrences of Win32 error codes.
+
+    Requires NumPy.
+
+    :param win32_error_codes: A NumPy array, an `array('I')` or another sequence of raw Win32 error codes.
+    :return: The histogram of the codes.
+    """
+
+    return StatusHistogram.from_values(values=win32_error_codes, table=WIN32_ERROR_TABLE)
@@ -0,0 +1,171 @@
+"""
+Precomputed metadata of the known `NTSTATUS` values and Win32 error codes.
+
+The accessors work on raw integers, whether the values are known or not, without creating enumeration members.
+
+https://docs.microsoft.com/en-us/openspecs/windows_protocols/ms-erref/87fba13e-bf06-450e-83b1-9241dc81e781
+"""
+
+from __future__ import annotations
+from array import array
+from enum import IntEnum
+from typing import Optional, Dict, Type, Tuple, List
+
+from msdsalgs.description_store import DescriptionStore
+from msdsalgs.ntstatus_value import NTStatusValue, NTStatusValueError, NT_STATUS_DESCRIPTIONS
+from msdsalgs.win32_error import Win32ErrorCode, Win32Error, WIN32_ERROR_DESCRIPTIONS
+
+
+class NTStatusSeverity(IntEnum):
+    STATUS_SEVERITY_SUCCESS = 0x0
+    STATUS_SEVERITY_INFORMATIONAL = 0x1
+    STATUS_SEVERITY_WARNING = 0x2
+    STATUS_SEVERITY_ERROR = 0x3
+
+
+def nt_status_severity(value: int) -> int:
+    """Return the `Sev` field of an `NTSTATUS` value, corresponding to an `NTStatusSeverity` value."""
+    return (value >> 30) & 0x3
+
+
+def nt_status_is_customer(value: int) -> bool:
+    """Return whether the `C` (customer) bit of an `NTSTATUS` value is set."""
+    return value & 0x20000000 != 0
+
+
+def nt_status_facility(value: int) -> int:
+    """Return the `Facility` field of an `NTSTATUS` value."""
+    return (value >> 16) & 0x0FFF
+
+
+def nt_status_code(value: int) -> int:
+    """Return the `Code` field of an `NTSTATUS` value."""
+    return value & 0xFFFF
+
+
+def nt_success(value: int) -> bool:
+    """Return whether an `NTSTATUS` value is a success or informational value, like the `NT_SUCCESS` macro."""
+    return value & 0x80000000 == 0
+
+
+def nt_information(value: int) -> bool:
+    return (value >> 30) & 0x3 == NTStatusSeverity.STATUS_SEVERITY_INFORMATIONAL
+
+
+def nt_warning(value: int) -> bool:
+    return (value >> 30) & 0x3 == NTStatusSeverity.STATUS_SEVERITY_WARNING
+
+
+def nt_error(value: int) -> bool:
+    return (value >> 30) & 0x3 == NTStatusSeverity.STATUS_SEVERITY_ERROR
+
+
+class StatusTable:
+    """
+    A table of the names and descriptions of the known values of a status catalog.
+
+    The values are stored in ascending order in an `array`, along with the index of each value's description among the
+    distinct descriptions of a `DescriptionStore`; `-1` if the value has no description. The descriptions themselves
+    are only decoded when requested.
+    """
+
+    __slots__ = ('values', 'names', 'description_indices', 'description_store', '_value_to_index')
+
+    def __init__(
+        self,
+        values: array,
+        names: Tuple[str, ...],
+        description_indices: array,
+        description_store: DescriptionStore
+    ):
+        self.values: array = values
+        self.names: Tuple[str, ...] = names
+        self.description_indices: array = description_indices
+        self.description_store: DescriptionStore = description_store
+
+        self._value_to_index: Dict[int, int] = {value: index for index, value in enumerate(values)}
+
+    @classmethod
+    def from_catalog(
+        cls,
+        enum_class: Type[IntEnum],
+        value_to_error_class: Dict[IntEnum, Type[Exception]],
+        description_store: DescriptionStore
+    ) -> StatusTable:
+        """
+        Make a table from a status enumeration and its mapping of values to exception classes.
+
+        :param enum_class: An enumeration of status values, e.g. `NTStatusValue`.
+        :param value_to_error_class: A mapping of the enumeration's members to exception classes, e.g.
+            `NTStatusValueError.NT_STATUS_TO_ERROR_CLASS`.
+        :param description_store: A store of the descriptions of the exception classes, keyed by class name.
+        :return: A table of the enumeration's values.
+        """
+
+        key_to_store_index: Dict[str, int] = {key: index for index, key in enumerate(description_store.keys())}
+        rows: List[Tuple[int, str, int]] = []
+
+        # Iterating over the enumeration yields the first defined name of each value.
+        for enum_member in enum_class:
+            error_class: Optional[Type[Exception]] = value_to_error_class.get(enum_member)
+            store_index: Optional[int] = key_to_store_index.get(error_class.__name__) if error_class else None
+
+            rows.append((
+                enum_member.value,
+                enum_member.name,
+                description_store.description_index(store_index) if store_index is not None else -1
+            ))
+
+        rows.sort()
+
+        return cls(
+            values=array('I', (value for value, _, _ in rows)),
+            names=tuple(name for _, name, _ in rows),
+            description_indices=array('i', (description_index for _, _, description_index in rows)),
+            description_store=description_store
+        )
+
+    def index(self, value: int) -> Optional[int]:
+        """
+        Find the row of a value in the table.
+
+        :param value: A raw status value.
+        :return: The index of the value's row; `None` if the value is unknown.
+        """
+
+        return self._value_to_index.get(value)
+
+    def name(self, value: int) -> Optional[str]:
+        index: Optional[int] = self._value_to_index.get(value)
+        return self.names[index] if index is not None else None
+
+    def description_index(self, value: int) -> Optional[int]:
+        index: Optional[int] = self._value_to_index.get(value)
+        if index is None:
+            return None
+
+        description_index: int = self.description_indices[index]
+        return description_index if description_index != -1 else None
+
+    def description(self, value: int) -> Optional[str]:
+        description_index: Optional[int] = self.description_index(value)
+        return self.description_store.description_at(description_index) if description_index is not None else None
+
+    def __contains__(self, value: int) -> bool:
+        return value in self._value_to_index
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+NT_STATUS_TABLE = StatusTable.from_catalog(
+    enum_class=NTStatusValue,
+    value_to_error_class=NTStatusValueError.NT_STATUS_TO_ERROR_CLASS,
+    description_store=NT_STATUS_DESCRIPTIONS.store
+)
+
+WIN32_ERROR_TABLE = StatusTable.from_catalog(
+    enum_class=Win32ErrorCode,
+    value_to_error_class=Win32Error.WIN32_ERROR_CODE_TO_ERROR_CLASS,
+    description_store=WIN32_ERROR_DESCRIPTIONS.store
+)
@@ -0,0 +1,121 @@
+"""
+Translation of `NTSTATUS` values into Win32 error codes, and of both into `HRESULT` values.
+
+`nt_status_to_win32_error_code` behaves like `RtlNtStatusToDosError`: values with the customer bit set are returned
+unchanged, values of `FACILITY_NTWIN32` carry their Win32 error code in their `Code` field, and the remaining values
+are looked up in a table; values without a translation become `ERROR_MR_MID_NOT_FOUND`. The table is generated by
+`msdsalgs.status_translation_generation` and stored as two parallel `array`s sorted by `NTSTATUS` value, so that it
+can also be searched in bulk with NumPy.
+"""
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+
+from msdsalgs.win32_error import Win32ErrorCode
+from msdsalgs._nt_status_translation_table import NT_STATUS_TRANSLATIONS
+
+FACILITY_NT_BIT = 0x10000000
+FACILITY_WIN32 = 0x7
+FACILITY_NTWIN32 = 0x7
+
+# The `NTSTATUS` values of the table, in ascending order, and the Win32 error codes they translate into.
+NT_STATUS_TRANSLATION_KEYS = array('I', (nt_status for nt_status, _ in NT_STATUS_TRANSLATIONS))
+NT_STATUS_TRANSLATION_VALUES = array('I', (win32_error_code for _, win32_error_code in NT_STATUS_TRANSLATIONS))
+
+
+def nt_status_to_win32_error_code(nt_status: int) -> int:
+    """
+    Translate an `NTSTATUS` value into a Win32 error code, like `RtlNtStatusToDosError`.
+
+    :param nt_status: A raw `NTSTATUS` value.
+    :return: The corresponding Win32 error code; `ERROR_MR_MID_NOT_FOUND` if the value has no translation.
+    """
+
+    if nt_status == 0 or nt_status & 0x20000000:
+        return nt_status
+
+    # An `NTSTATUS` value with the `N` bit set is an `HRESULT_FROM_NT` value.
+    nt_status &= ~FACILITY_NT_BIT
+
+    if (nt_status >> 16) in (0x8007, 0xC007):
+        return nt_status & 0xFFFF
+
+    index: int = bisect_left(NT_STATUS_TRANSLATION_KEYS, nt_status)
+    if index < len(NT_STATUS_TRANSLATION_KEYS) and NT_STATUS_TRANSLATION_KEYS[index] == nt_status:
+        return NT_STATUS_TRANSLATION_VALUES[index]
+
+    return Win32ErrorCode.ERROR_MR_MID_NOT_FOUND.value
+
+
+def nt_statuses_to_win32_error_codes(nt_statuses):
+    """
+    Translate `NTSTATUS` values into Win32 error codes in bulk, like `nt_status_to_win32_error_code`.
+
+    Requires NumPy.
+
+    :param nt_statuses: An array-like of raw `NTSTATUS` values.
+    :return: A NumPy `uint32` array of the corresponding Win32 error codes.
+    """
+
+    import numpy
+
+    nt_statuses = numpy.asarray(nt_statuses, dtype=numpy.uint32)
+    keys = numpy.frombuffer(NT_STATUS_TRANSLATION_KEYS, dtype=numpy.uint32)
+    values = numpy.frombuffer(NT_STATUS_TRANSLATION_VALUES, dtype=numpy.uint32)
+
+    unchanged = (nt_statuses == 0) | (nt_statuses & 0x20000000 != 0)
+    folded = nt_statuses & numpy.uint32(~FACILITY_NT_BIT & 0xFFFFFFFF)
+    high_words = folded >> 16
+    ntwin32 = (high_words == 0x8007) | (high_words == 0xC007)
+
+    indices = numpy.minimum(numpy.searchsorted(keys, folded), len(keys) - 1)
+    found = keys[indices] == folded
+
+    win32_error_codes = numpy.full(nt_statuses.shape, Win32ErrorCode.ERROR_MR_MID_NOT_FOUND.value, dtype=numpy.uint32)
+    win32_error_codes[found] = values[indices[found]]
+    win32_error_codes[ntwin32] = folded[ntwin32] & 0xFFFF
+    win32_error_codes[unchanged] = nt_statuses[unchanged]
+
+    return win32_error_codes
+
+
+def hresult_from_win32(win32_error_code: int) -> int:
+    """
+    Make an `HRESULT` value from a Win32 error code, like the `HRESULT_FROM_WIN32` macro.
+
+    :param win32_error_code: A Win32 error code.
+    :return: The `HRESULT` value, as an unsigned integer.
+    """
+
+    if win32_error_code == 0 or win32_error_code & 0x80000000:
+        return win32_error_code
+
+    return (win32_error_code & 0xFFFF) | (FACILITY_WIN32 << 16) | 0x80000000
+
+
+def hresult_from_nt(nt_status: int) -> int:
+    """
+    Make an `HRESULT` value from an `NTSTATUS` value, like the `HRESULT_FROM_NT` macro.
+
+    :param nt_status: An `NTSTATUS` value.
+    :return: The `HRESULT` value, as an unsigned integer.
+    """
+
+    return nt_status | FACILITY_NT_BIT
+
+
+def nt_status_from_win32(win32_error_code: int) -> int:
+    """
+    Make an `NTSTATUS` value from a Win32 error code, like the `NTSTATUS_FROM_WIN32` macro.
+
+    The value is translated back into the Win32 error code by `nt_status_to_win32_error_code`.
+
+    :param win32_error_code: A Win32 error code.
+    :return: The `NTSTATUS` value, of `FACILITY_NTWIN32`.
+    """
+
+    if win32_error_code == 0 or win32_error_code & 0x80000000:
+        return win32_error_code
+
+    return (win32_error_code & 0xFFFF) | (FACILITY_NTWIN32 << 16) | 0xC0000000
@@ -0,0 +1,240 @@
+"""
+Generation of the table of translations of `NTSTATUS` values into Win32 error codes used by
+`nt_status_to_win32_error_code`.
+
+The table is made of the translations of `RtlNtStatusToDosError` that pair differently named values, e.g.
+`STATUS_OBJECT_NAME_NOT_FOUND` and `ERROR_FILE_NOT_FOUND`, and, for every other value of `NTStatusValue`, of the
+translation into the Win32 error code with the corresponding name, e.g. `STATUS_COMMITMENT_LIMIT` and
+`ERROR_COMMITMENT_LIMIT`, or `RPC_NT_CALL_FAILED` and `RPC_S_CALL_FAILED`. It is emitted into
+`msdsalgs/_nt_status_translation_table.py`.
+
+Regenerate the table with:
+
+    python -m msdsalgs.status_translation_generation
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Tuple, Dict, Optional
+
+from msdsalgs.ntstatus_value import NTStatusValue
+from msdsalgs.win32_error import Win32ErrorCode
+
+GENERATED_MODULE_PATH = Path(__file__).parent / '_nt_status_translation_table.py'
+
+# The prefixes of the names of `NTSTATUS` values and those of the corresponding Win32 error codes.
+NAME_PREFIX_PAIRS: Tuple[Tuple[str, str], ...] = (
+    ('STATUS_', 'ERROR_'),
+    ('RPC_NT_', 'RPC_S_'),
+    ('EPT_NT_', 'EPT_S_'),
+)
+
+# The translations of `NTSTATUS` values into differently named Win32 error codes, by name, in order of `NTSTATUS`
+# value.
+EXPLICIT_TRANSLATIONS: Tuple[Tuple[str, str], ...] = (
+    ('STATUS_PENDING', 'ERROR_IO_PENDING'),
+    ('STATUS_MORE_ENTRIES', 'ERROR_MORE_DATA'),
+    ('STATUS_DATATYPE_MISALIGNMENT', 'ERROR_NOACCESS'),
+    ('STATUS_BUFFER_OVERFLOW', 'ERROR_MORE_DATA'),
+    ('STATUS_DEVICE_PAPER_EMPTY', 'ERROR_OUT_OF_PAPER'),
+    ('STATUS_NO_MORE_EAS', 'ERROR_NO_MORE_ITEMS'),
+    ('STATUS_INVALID_EA_FLAG', 'ERROR_EA_LIST_INCONSISTENT'),
+    ('STATUS_NO_MORE_ENTRIES', 'ERROR_NO_MORE_ITEMS'),
+    ('STATUS_UNSUCCESSFUL', 'ERROR_GEN_FAILURE'),
+    ('STATUS_NOT_IMPLEMENTED', 'ERROR_INVALID_FUNCTION'),
+    ('STATUS_INVALID_INFO_CLASS', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_INFO_LENGTH_MISMATCH', 'ERROR_BAD_LENGTH'),
+    ('STATUS_ACCESS_VIOLATION', 'ERROR_NOACCESS'),
+    ('STATUS_IN_PAGE_ERROR', 'ERROR_SWAPERROR'),
+    ('STATUS_BAD_INITIAL_STACK', 'ERROR_STACK_OVERFLOW'),
+    ('STATUS_INVALID_CID', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_NO_SUCH_DEVICE', 'ERROR_FILE_NOT_FOUND'),
+    ('STATUS_NO_SUCH_FILE', 'ERROR_FILE_NOT_FOUND'),
+    ('STATUS_INVALID_DEVICE_REQUEST', 'ERROR_INVALID_FUNCTION'),
+    ('STATUS_END_OF_FILE', 'ERROR_HANDLE_EOF'),
+    ('STATUS_WRONG_VOLUME', 'ERROR_WRONG_DISK'),
+    ('STATUS_NO_MEDIA_IN_DEVICE', 'ERROR_NOT_READY'),
+    ('STATUS_NONEXISTENT_SECTOR', 'ERROR_SECTOR_NOT_FOUND'),
+    ('STATUS_MORE_PROCESSING_REQUIRED', 'ERROR_MORE_DATA'),
+    ('STATUS_NO_MEMORY', 'ERROR_NOT_ENOUGH_MEMORY'),
+    ('STATUS_CONFLICTING_ADDRESSES', 'ERROR_INVALID_ADDRESS'),
+    ('STATUS_NOT_MAPPED_VIEW', 'ERROR_INVALID_ADDRESS'),
+    ('STATUS_UNABLE_TO_FREE_VM', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_UNABLE_TO_DELETE_SECTION', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_INVALID_SYSTEM_SERVICE', 'ERROR_INVALID_FUNCTION'),
+    ('STATUS_INVALID_LOCK_SEQUENCE', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_INVALID_VIEW_SIZE', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_INVALID_FILE_FOR_SECTION', 'ERROR_BAD_EXE_FORMAT'),
+    ('STATUS_ALREADY_COMMITTED', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_BUFFER_TOO_SMALL', 'ERROR_INSUFFICIENT_BUFFER'),
+    ('STATUS_OBJECT_TYPE_MISMATCH', 'ERROR_INVALID_HANDLE'),
+    ('STATUS_UNABLE_TO_DECOMMIT_VM', 'ERROR_INVALID_ADDRESS'),
+    ('STATUS_NOT_COMMITTED', 'ERROR_INVALID_ADDRESS'),
+    ('STATUS_INVALID_PORT_ATTRIBUTES', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_PORT_MESSAGE_TOO_LONG', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_INVALID_PARAMETER_MIX', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_INVALID_QUOTA_LOWER', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_DISK_CORRUPT_ERROR', 'ERROR_DISK_CORRUPT'),
+    ('STATUS_OBJECT_NAME_INVALID', 'ERROR_INVALID_NAME'),
+    ('STATUS_OBJECT_NAME_NOT_FOUND', 'ERROR_FILE_NOT_FOUND'),
+    ('STATUS_OBJECT_NAME_COLLISION', 'ERROR_ALREADY_EXISTS'),
+    ('STATUS_PORT_DISCONNECTED', 'ERROR_INVALID_HANDLE'),
+    ('STATUS_OBJECT_PATH_INVALID', 'ERROR_BAD_PATHNAME'),
+    ('STATUS_OBJECT_PATH_NOT_FOUND', 'ERROR_PATH_NOT_FOUND'),
+    ('STATUS_OBJECT_PATH_SYNTAX_BAD', 'ERROR_BAD_PATHNAME'),
+    ('STATUS_DATA_OVERRUN', 'ERROR_IO_DEVICE'),
+    ('STATUS_DATA_LATE_ERROR', 'ERROR_IO_DEVICE'),
+    ('STATUS_DATA_ERROR', 'ERROR_CRC'),
+    ('STATUS_CRC_ERROR', 'ERROR_CRC'),
+    ('STATUS_SECTION_TOO_BIG', 'ERROR_NOT_ENOUGH_MEMORY'),
+    ('STATUS_PORT_CONNECTION_REFUSED', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_INVALID_PORT_HANDLE', 'ERROR_INVALID_HANDLE'),
+    ('STATUS_QUOTA_EXCEEDED', 'ERROR_NOT_ENOUGH_QUOTA'),
+    ('STATUS_INVALID_PAGE_PROTECTION', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_MUTANT_NOT_OWNED', 'ERROR_NOT_OWNER'),
+    ('STATUS_SEMAPHORE_LIMIT_EXCEEDED', 'ERROR_TOO_MANY_POSTS'),
+    ('STATUS_PORT_ALREADY_SET', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_SECTION_NOT_IMAGE', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_SUSPEND_COUNT_EXCEEDED', 'ERROR_SIGNAL_REFUSED'),
+    ('STATUS_THREAD_IS_TERMINATING', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_BAD_WORKING_SET_LIMIT', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_INCOMPATIBLE_FILE_MAP', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_SECTION_PROTECTION', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_EA_TOO_LARGE', 'ERROR_EA_LIST_INCONSISTENT'),
+    ('STATUS_NONEXISTENT_EA_ENTRY', 'ERROR_FILE_CORRUPT'),
+    ('STATUS_NO_EAS_ON_FILE', 'ERROR_FILE_CORRUPT'),
+    ('STATUS_EA_CORRUPT_ERROR', 'ERROR_FILE_CORRUPT'),
+    ('STATUS_FILE_LOCK_CONFLICT', 'ERROR_LOCK_VIOLATION'),
+    ('STATUS_LOCK_NOT_GRANTED', 'ERROR_LOCK_VIOLATION'),
+    ('STATUS_DELETE_PENDING', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_CTL_FILE_NOT_SUPPORTED', 'ERROR_NOT_SUPPORTED'),
+    ('STATUS_WRONG_PASSWORD', 'ERROR_INVALID_PASSWORD'),
+    ('STATUS_PROCEDURE_NOT_FOUND', 'ERROR_PROC_NOT_FOUND'),
+    ('STATUS_INVALID_IMAGE_FORMAT', 'ERROR_BAD_EXE_FORMAT'),
+    ('STATUS_RANGE_NOT_LOCKED', 'ERROR_NOT_LOCKED'),
+    ('STATUS_INTEGER_OVERFLOW', 'ERROR_ARITHMETIC_OVERFLOW'),
+    ('STATUS_INSUFFICIENT_RESOURCES', 'ERROR_NO_SYSTEM_RESOURCES'),
+    ('STATUS_MEDIA_WRITE_PROTECTED', 'ERROR_WRITE_PROTECT'),
+    ('STATUS_DEVICE_NOT_READY', 'ERROR_NOT_READY'),
+    ('STATUS_INSTANCE_NOT_AVAILABLE', 'ERROR_PIPE_BUSY'),
+    ('STATUS_PIPE_NOT_AVAILABLE', 'ERROR_PIPE_BUSY'),
+    ('STATUS_INVALID_PIPE_STATE', 'ERROR_BAD_PIPE'),
+    ('STATUS_ILLEGAL_FUNCTION', 'ERROR_INVALID_FUNCTION'),
+    ('STATUS_PIPE_DISCONNECTED', 'ERROR_PIPE_NOT_CONNECTED'),
+    ('STATUS_PIPE_CLOSING', 'ERROR_NO_DATA'),
+    ('STATUS_INVALID_READ_MODE', 'ERROR_BAD_PIPE'),
+    ('STATUS_IO_TIMEOUT', 'ERROR_SEM_TIMEOUT'),
+    ('STATUS_FILE_FORCED_CLOSED', 'ERROR_HANDLE_EOF'),
+    ('STATUS_FILE_IS_A_DIRECTORY', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_REMOTE_NOT_LISTENING', 'ERROR_REM_NOT_LIST'),
+    ('STATUS_DUPLICATE_NAME', 'ERROR_DUP_NAME'),
+    ('STATUS_BAD_NETWORK_PATH', 'ERROR_BAD_NETPATH'),
+    ('STATUS_TOO_MANY_COMMANDS', 'ERROR_TOO_MANY_CMDS'),
+    ('STATUS_ADAPTER_HARDWARE_ERROR', 'ERROR_ADAP_HDW_ERR'),
+    ('STATUS_INVALID_NETWORK_RESPONSE', 'ERROR_BAD_NET_RESP'),
+    ('STATUS_UNEXPECTED_NETWORK_ERROR', 'ERROR_UNEXP_NET_ERR'),
+    ('STATUS_BAD_REMOTE_ADAPTER', 'ERROR_BAD_REM_ADAP'),
+    ('STATUS_PRINT_QUEUE_FULL', 'ERROR_PRINTQ_FULL'),
+    ('STATUS_NETWORK_NAME_DELETED', 'ERROR_NETNAME_DELETED'),
+    ('STATUS_BAD_DEVICE_TYPE', 'ERROR_BAD_DEV_TYPE'),
+    ('STATUS_BAD_NETWORK_NAME', 'ERROR_BAD_NET_NAME'),
+    ('STATUS_TOO_MANY_SESSIONS', 'ERROR_TOO_MANY_SESS'),
+    ('STATUS_REQUEST_NOT_ACCEPTED', 'ERROR_REQ_NOT_ACCEP'),
+    ('STATUS_PIPE_EMPTY', 'ERROR_NO_DATA'),
+    ('STATUS_REDIRECTOR_NOT_STARTED', 'ERROR_PATH_NOT_FOUND'),
+    ('STATUS_DIRECTORY_NOT_EMPTY', 'ERROR_DIR_NOT_EMPTY'),
+    ('STATUS_FILE_CORRUPT_ERROR', 'ERROR_FILE_CORRUPT'),
+    ('STATUS_NOT_A_DIRECTORY', 'ERROR_DIRECTORY'),
+    ('STATUS_TOO_MANY_OPENED_FILES', 'ERROR_TOO_MANY_OPEN_FILES'),
+    ('STATUS_CANCELLED', 'ERROR_OPERATION_ABORTED'),
+    ('STATUS_CANNOT_DELETE', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_INVALID_COMPUTER_NAME', 'ERROR_INVALID_COMPUTERNAME'),
+    ('STATUS_FILE_DELETED', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_FILE_CLOSED', 'ERROR_INVALID_HANDLE'),
+    ('STATUS_TIME_DIFFERENCE_AT_DC', 'ERROR_TIME_SKEW'),
+    ('STATUS_DLL_NOT_FOUND', 'ERROR_MOD_NOT_FOUND'),
+    ('STATUS_ENTRYPOINT_NOT_FOUND', 'ERROR_PROC_NOT_FOUND'),
+    ('STATUS_INVALID_ADDRESS', 'ERROR_UNEXP_NET_ERR'),
+    ('STATUS_WRONG_PASSWORD_CORE', 'ERROR_INVALID_PASSWORD'),
+    ('STATUS_PIPE_BROKEN', 'ERROR_BROKEN_PIPE'),
+    ('STATUS_INVALID_DEVICE_STATE', 'ERROR_BAD_COMMAND'),
+    ('STATUS_USER_SESSION_DELETED', 'ERROR_UNEXP_NET_ERR'),
+    ('STATUS_ADDRESS_ALREADY_EXISTS', 'ERROR_DUP_NAME'),
+    ('STATUS_CONNECTION_DISCONNECTED', 'ERROR_NETNAME_DELETED'),
+    ('STATUS_CONNECTION_RESET', 'ERROR_NETNAME_DELETED'),
+    ('STATUS_VOLUME_DISMOUNTED', 'ERROR_NOT_READY'),
+)
+
+
+def corresponding_win32_error_code_name(nt_status_name: str) -> Optional[str]:
+    """
+    :param nt_status_name: The name of an `NTSTATUS` value.
+    :return: The name of the Win32 error code corresponding to the name; `None` if its prefix has no counterpart.
+    """
+
+    for nt_status_prefix, win32_error_code_prefix in NAME_PREFIX_PAIRS:
+        if nt_status_name.startswith(nt_status_prefix):
+            return win32_error_code_prefix + nt_status_name[len(nt_status_prefix):]
+
+    return None
+
+
+def make_translations() -> Dict[int, Tuple[int, str, str]]:
+    """
+    Make the translations of the table.
+
+    :return: The Win32 error codes that `NTSTATUS` values translate into, together with the names of both, by
+        `NTSTATUS` value.
+    """
+
+    translations: Dict[int, Tuple[int, str, str]] = {}
+
+    for nt_status_name, win32_error_code_name in EXPLICIT_TRANSLATIONS:
+        translations[NTStatusValue[nt_status_name].value] = (
+            Win32ErrorCode[win32_error_code_name].value,
+            nt_status_name,
+            win32_error_code_name
+        )
+
+    for nt_status_name, nt_status in NTStatusValue.__members__.items():
+        if nt_status.value in translations:
+            continue
+
+        win32_error_code_name: Optional[str] = corresponding_win32_error_code_name(nt_status_name)
+        if win32_error_code_name in Win32ErrorCode.__members__:
+            translations[nt_status.value] = (
+                Win32ErrorCode[win32_error_code_name].value,
+                nt_status_name,
+                win32_error_code_name
+            )
+
+    return translations
+
+
+def generate_module_source() -> str:
+    translations: Dict[int, Tuple[int, str, str]] = make_translations()
+
+    lines = []
+    for nt_status, (win32_error_code, nt_status_name, win32_error_code_name) in sorted(translations.items()):
+        # The name of the Win32 error code is only spelled out if it does not correspond to that of the value.
+        comment: str = nt_status_name if corresponding_win32_error_code_name(nt_status_name) == win32_error_code_name \
+            else f'{nt_status_name} -> {win32_error_code_name}'
+        lines.append(f'    (0x{nt_status:08X}, 0x{win32_error_code:08X}),  # {comment}')
+
+    return '\n'.join([
+        '# This file is generated by `python -m msdsalgs.status_translation_generation`. Do not edit.',
+        '',
+        '# The translations of `NTSTATUS` values into Win32 error codes, in ascending order of `NTSTATUS` value.',
+        'NT_STATUS_TRANSLATIONS = (',
+        *lines,
+        ')',
+        ''
+    ])
+
+
+def main():
+    GENERATED_MODULE_PATH.write_text(generate_module_source())
+
+
+if __name__ == '__main__':
+    main()
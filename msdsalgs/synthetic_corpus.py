@@ -0,0 +1,691 @@
+"""
+Generators of synthetic, valid binary inputs for benchmarking and fuzzing the parsers: self-relative security
+descriptors, `QUERY_DIRECTORY` response buffers and `CHANGE_NOTIFY` response buffers.
+
+The shape of the generated inputs is controlled by profiles. Each item of a corpus is generated from its own random
+number generator, seeded with the corpus seed and the item's index, so a corpus is the same on every run and
+platform, and any single item can be regenerated on its own.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from os import PathLike, makedirs
+from os.path import join as path_join
+from random import Random
+from struct import pack as struct_pack, Struct
+from typing import Dict, Tuple, List, Optional, Iterator, Iterable, Sequence, Mapping, Union
+from uuid import UUID
+
+from msdsalgs.security_types.ace import ACEType, ACEFlagsMask, ACEObjectFlagMask, ActiveDirectoryRightsMask
+from msdsalgs.security_types.security_descriptor import SecurityDescriptorControlMask
+from msdsalgs.fscc.file_information_classes import FileInformationClass, FILE_INFORMATION_CLASS_TO_DECODER
+from msdsalgs.fscc.file_attributes import FileAttributesFlag
+from msdsalgs.fscc.file_notify_information import FileNotifyAction
+
+# Security descriptors
+
+DACL_ACE_TYPE_WEIGHTS: Dict[ACEType, float] = {
+    ACEType.ACCESS_ALLOWED_ACE_TYPE: 50.0,
+    ACEType.ACCESS_DENIED_ACE_TYPE: 5.0,
+    ACEType.ACCESS_ALLOWED_OBJECT_ACE_TYPE: 30.0,
+    ACEType.ACCESS_DENIED_OBJECT_ACE_TYPE: 3.0,
+    ACEType.ACCESS_ALLOWED_CALLBACK_ACE_TYPE: 5.0,
+    ACEType.ACCESS_DENIED_CALLBACK_ACE_TYPE: 1.0,
+    ACEType.ACCESS_ALLOWED_CALLBACK_OBJECT_ACE_TYPE: 4.0,
+    ACEType.ACCESS_DENIED_CALLBACK_OBJECT_ACE_TYPE: 2.0
+}
+
+SACL_ACE_TYPE_WEIGHTS: Dict[ACEType, float] = {
+    ACEType.SYSTEM_AUDIT_ACE_TYPE: 40.0,
+    ACEType.SYSTEM_AUDIT_OBJECT_ACE_TYPE: 25.0,
+    ACEType.SYSTEM_AUDIT_CALLBACK_ACE_TYPE: 5.0,
+    ACEType.SYSTEM_AUDIT_CALLBACK_OBJECT_ACE_TYPE: 5.0,
+    ACEType.SYSTEM_MANDATORY_LABEL_ACE_TYPE: 10.0,
+    ACEType.SYSTEM_RESOURCE_ATTRIBUTE_ACE_TYPE: 10.0,
+    ACEType.SYSTEM_SCOPED_POLICY_ID_ACE_TYPE: 5.0
+}
+
+WELL_KNOWN_TRUSTEE_SIDS: Tuple[str, ...] = (
+    'S-1-1-0',
+    'S-1-3-0',
+    'S-1-5-9',
+    'S-1-5-10',
+    'S-1-5-11',
+    'S-1-5-18',
+    'S-1-5-32-544',
+    'S-1-5-32-545',
+    'S-1-5-32-548',
+    'S-1-5-32-554'
+)
+
+# Schema class, property set and extended right GUIDs that commonly appear in the ACEs of Active Directory objects.
+OBJECT_TYPES: Tuple[UUID, ...] = tuple(UUID(guid_string) for guid_string in (
+    'bf967aba-0de6-11d0-a285-00aa003049e2',
+    'bf967a86-0de6-11d0-a285-00aa003049e2',
+    'bf967a9c-0de6-11d0-a285-00aa003049e2',
+    '4828cc14-1437-45bc-9b07-ad6f015e5f28',
+    'bf967aa5-0de6-11d0-a285-00aa003049e2',
+    '4c164200-20c0-11d0-a768-00aa006e0529',
+    '5f202010-79a5-11d0-9020-00c04fc2d4cf',
+    'bc0ac240-79a9-11d0-9020-00c04fc2d4cf',
+    '77b5b886-944a-11d1-aebd-0000f80367c1',
+    'e48d0154-bcf8-11d1-8702-00c04fb96050',
+    '00299570-246d-11d0-a768-00aa006e0529',
+    'ab721a53-1e2f-11d0-9819-00aa0040529b',
+    '1131f6aa-9c07-11d1-f79f-00c04fc2dcd2',
+    '1131f6ad-9c07-11d1-f79f-00c04fc2dcd2',
+    'bf9679c0-0de6-11d0-a285-00aa003049e2',
+    'f3a64788-5306-11d1-a9c5-0000f80367c1'
+))
+
+# Common access masks; the rights of Active Directory objects and of files.
+ACCESS_MASKS: Tuple[int, ...] = (
+    ActiveDirectoryRightsMask.ADS_RIGHT_GENERIC_ALL,
+    ActiveDirectoryRightsMask.ADS_RIGHT_GENERIC_READ,
+    ActiveDirectoryRightsMask.ADS_RIGHT_DS_READ_PROP,
+    ActiveDirectoryRightsMask.ADS_RIGHT_DS_READ_PROP | ActiveDirectoryRightsMask.ADS_RIGHT_DS_WRITE_PROP,
+    ActiveDirectoryRightsMask.ADS_RIGHT_DS_CONTROL_ACCESS,
+    ActiveDirectoryRightsMask.ADS_RIGHT_DS_CREATE_CHILD | ActiveDirectoryRightsMask.ADS_RIGHT_DS_DELETE_CHILD,
+    ActiveDirectoryRightsMask.ADS_RIGHT_DS_SELF,
+    ActiveDirectoryRightsMask.ADS_RIGHT_READ_CONTROL,
+    ActiveDirectoryRightsMask.ADS_RIGHT_WRITE_DAC | ActiveDirectoryRightsMask.ADS_RIGHT_WRITE_OWNER,
+    0x000F01FF,
+    0x001F01FF,
+    0x00120089,
+    0x001301BF
+)
+
+_OBJECT_ACE_TYPES = frozenset((
+    ACEType.ACCESS_ALLOWED_OBJECT_ACE_TYPE,
+    ACEType.ACCESS_DENIED_OBJECT_ACE_TYPE,
+    ACEType.SYSTEM_AUDIT_OBJECT_ACE_TYPE,
+    ACEType.ACCESS_ALLOWED_CALLBACK_OBJECT_ACE_TYPE,
+    ACEType.ACCESS_DENIED_CALLBACK_OBJECT_ACE_TYPE,
+    ACEType.SYSTEM_AUDIT_CALLBACK_OBJECT_ACE_TYPE
+))
+
+# The ACE types whose application data is a conditional expression.
+_CALLBACK_ACE_TYPES = frozenset((
+    ACEType.ACCESS_ALLOWED_CALLBACK_ACE_TYPE,
+    ACEType.ACCESS_DENIED_CALLBACK_ACE_TYPE,
+    ACEType.ACCESS_ALLOWED_CALLBACK_OBJECT_ACE_TYPE,
+    ACEType.ACCESS_DENIED_CALLBACK_OBJECT_ACE_TYPE,
+    ACEType.SYSTEM_AUDIT_CALLBACK_ACE_TYPE,
+    ACEType.SYSTEM_AUDIT_CALLBACK_OBJECT_ACE_TYPE
+))
+
+_SACL_ACE_TYPES = frozenset(SACL_ACE_TYPE_WEIGHTS)
+
+_CLAIM_NAMES: Tuple[str, ...] = ('Department', 'Project', 'Secrecy', 'Country', 'Clearance', 'CostCenter')
+_CLAIM_STRING_VALUES: Tuple[str, ...] = ('Sales', 'Engineering', 'Finance', 'HR', 'Legal', 'Operations')
+
+# The conditional expression tokens of [MS-DTYP] 2.4.4.17.4 that are generated.
+_CONDITIONAL_ACE_SIGNATURE = b'artx'
+_USER_ATTRIBUTE_TOKEN = 0xF9
+_RESOURCE_ATTRIBUTE_TOKEN = 0xFA
+_INT64_TOKEN = 0x04
+_UNICODE_STRING_TOKEN = 0x10
+_RELATIONAL_OPERATOR_TOKENS: Tuple[int, ...] = (0x80, 0x81, 0x82, 0x83, 0x84, 0x85)
+_EQUALS_OPERATOR_TOKEN = 0x80
+_LOGICAL_OPERATOR_TOKENS: Tuple[int, ...] = (0xA0, 0xA1)
+_SIGN_NONE = 0x03
+_BASE_DECIMAL = 0x02
+
+_CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64 = 0x0001
+_CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING = 0x0003
+
+# The offset of the name, the value type, `Reserved`, the flags and the number of values.
+_CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1_STRUCT = Struct('<IHHII')
+
+
+@dataclass
+class SecurityDescriptorProfile:
+    """
+    The shape of generated security descriptors.
+
+    :ivar dacl_ace_type_weights: The relative frequency of each ACE type in DACLs.
+    :ivar sacl_ace_type_weights: The relative frequency of each ACE type in SACLs.
+    :ivar dacl_probability: The probability that a security descriptor has a DACL.
+    :ivar sacl_probability: The probability that a security descriptor has a SACL.
+    :ivar owner_probability: The probability that a security descriptor has an owner.
+    :ivar group_probability: The probability that a security descriptor has a group.
+    :ivar num_dacl_aces: The inclusive range of the number of ACEs of a DACL.
+    :ivar num_sacl_aces: The inclusive range of the number of ACEs of a SACL.
+    :ivar num_sub_authorities: The inclusive range of the number of sub-authorities of a generated SID, the first
+        being `21` and the last a RID when there are at least two.
+    :ivar well_known_sid_probability: The probability that a trustee is a well-known SID rather than a generated one.
+    :ivar object_type_probability: The probability that an object ACE has an object type.
+    :ivar inherited_object_type_probability: The probability that an object ACE has an inherited object type.
+    :ivar object_types: The GUIDs from which the object types and inherited object types are chosen.
+    :ivar num_conditions: The inclusive range of the number of comparisons of a conditional expression.
+    """
+
+    dacl_ace_type_weights: Mapping[ACEType, float] = field(default_factory=lambda: dict(DACL_ACE_TYPE_WEIGHTS))
+    sacl_ace_type_weights: Mapping[ACEType, float] = field(default_factory=lambda: dict(SACL_ACE_TYPE_WEIGHTS))
+    dacl_probability: float = 1.0
+    sacl_probability: float = 0.25
+    owner_probability: float = 1.0
+    group_probability: float = 1.0
+    num_dacl_aces: Tuple[int, int] = (4, 24)
+    num_sacl_aces: Tuple[int, int] = (1, 4)
+    num_sub_authorities: Tuple[int, int] = (5, 5)
+    well_known_sid_probability: float = 0.4
+    object_type_probability: float = 0.9
+    inherited_object_type_probability: float = 0.3
+    object_types: Sequence[UUID] = OBJECT_TYPES
+    num_conditions: Tuple[int, int] = (1, 3)
+
+
+def _sid_string_bytes(sid_string: str) -> bytes:
+    _, revision, identifier_authority, *sub_authorities = sid_string.split('-')
+    return struct_pack(
+        f'<BB6s{len(sub_authorities)}I',
+        int(revision),
+        len(sub_authorities),
+        int(identifier_authority).to_bytes(length=6, byteorder='big'),
+        *(int(sub_authority) for sub_authority in sub_authorities)
+    )
+
+
+_WELL_KNOWN_TRUSTEE_SID_BYTES: Tuple[bytes, ...] = tuple(
+    _sid_string_bytes(sid_string) for sid_string in WELL_KNOWN_TRUSTEE_SIDS
+)
+
+_MEDIUM_MANDATORY_LEVEL_SID_BYTES: bytes = _sid_string_bytes('S-1-16-8192')
+
+
+def _generate_sid(random: Random, profile: SecurityDescriptorProfile) -> bytes:
+    if random.random() < profile.well_known_sid_probability:
+        return random.choice(_WELL_KNOWN_TRUSTEE_SID_BYTES)
+
+    num_sub_authorities: int = random.randint(*profile.num_sub_authorities)
+    sub_authorities: List[int] = [random.getrandbits(32) for _ in range(num_sub_authorities)]
+    if num_sub_authorities >= 2:
+        sub_authorities[0] = 21
+        sub_authorities[-1] = random.randrange(500, 100_000)
+
+    return struct_pack(
+        f'<BB6s{num_sub_authorities}I',
+        1,
+        num_sub_authorities,
+        b'\x00\x00\x00\x00\x00\x05',
+        *sub_authorities
+    )
+
+
+def _unicode_token(token: int, string: str) -> bytes:
+    string_bytes: bytes = string.encode(encoding='utf-16-le')
+    return struct_pack('<BI', token, len(string_bytes)) + string_bytes
+
+
+def _generate_conditional_expression(random: Random, profile: SecurityDescriptorProfile) -> bytes:
+    """
+    Generate the application data of a callback ACE: a conditional expression in postfix notation, comparing user
+    claims to literals and combining the comparisons with `&&` and `||`.
+    """
+
+    tokens: List[bytes] = [_CONDITIONAL_ACE_SIGNATURE]
+
+    for i in range(random.randint(*profile.num_conditions)):
+        tokens.append(_unicode_token(_USER_ATTRIBUTE_TOKEN, random.choice(_CLAIM_NAMES)))
+        if random.random() < 0.5:
+            tokens.append(
+                struct_pack('<BqBB', _INT64_TOKEN, random.randrange(0, 1000), _SIGN_NONE, _BASE_DECIMAL)
+            )
+            tokens.append(bytes((random.choice(_RELATIONAL_OPERATOR_TOKENS),)))
+        else:
+            tokens.append(_unicode_token(_UNICODE_STRING_TOKEN, random.choice(_CLAIM_STRING_VALUES)))
+            tokens.append(bytes((_EQUALS_OPERATOR_TOKEN,)))
+
+        if i != 0:
+            tokens.append(bytes((random.choice(_LOGICAL_OPERATOR_TOKENS),)))
+
+    return b''.join(tokens)
+
+
+def _generate_resource_attribute(random: Random) -> bytes:
+    """
+    Generate the attribute data of a resource attribute ACE: a `CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1` structure with
+    one or more 64-bit integer or string values.
+    """
+
+    num_values: int = random.randint(1, 3)
+    value_type: int = random.choice((_CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64, _CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING))
+
+    offset: int = _CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1_STRUCT.size + 4 * num_values
+    name_bytes: bytes = random.choice(_CLAIM_NAMES).encode(encoding='utf-16-le') + b'\x00\x00'
+    name_offset: int = offset
+    offset += len(name_bytes)
+
+    value_offsets: List[int] = []
+    values: List[bytes] = []
+    for _ in range(num_values):
+        if value_type == _CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64:
+            value_bytes: bytes = struct_pack('<q', random.randrange(0, 1000))
+        else:
+            value_bytes = random.choice(_CLAIM_STRING_VALUES).encode(encoding='utf-16-le') + b'\x00\x00'
+        value_offsets.append(offset)
+        values.append(value_bytes)
+        offset += len(value_bytes)
+
+    return b''.join([
+        _CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1_STRUCT.pack(name_offset, value_type, 0, 0, num_values),
+        struct_pack(f'<{num_values}I', *value_offsets),
+        name_bytes,
+        *values
+    ])
+
+
+def _generate_ace(random: Random, ace_type: ACEType, profile: SecurityDescriptorProfile) -> bytes:
+    if ace_type in _SACL_ACE_TYPES:
+        ace_flags: int = random.choice((
+            ACEFlagsMask.SUCCESSFUL_ACCESS_ACE_FLAG,
+            ACEFlagsMask.FAILED_ACCESS_ACE_FLAG,
+            ACEFlagsMask.SUCCESSFUL_ACCESS_ACE_FLAG | ACEFlagsMask.FAILED_ACCESS_ACE_FLAG
+        ))
+    else:
+        ace_flags = random.choice((
+            0,
+            0,
+            ACEFlagsMask.CONTAINER_INHERIT_ACE,
+            ACEFlagsMask.CONTAINER_INHERIT_ACE | ACEFlagsMask.INHERIT_ONLY_ACE,
+            ACEFlagsMask.INHERITED_ACE,
+            ACEFlagsMask.CONTAINER_INHERIT_ACE | ACEFlagsMask.INHERITED_ACE
+        ))
+
+    parts: List[bytes] = []
+
+    if ace_type is ACEType.SYSTEM_MANDATORY_LABEL_ACE_TYPE:
+        # `SYSTEM_MANDATORY_LABEL_NO_WRITE_UP` on the medium integrity level.
+        access_mask: int = 0x1
+        parts.append(_MEDIUM_MANDATORY_LEVEL_SID_BYTES)
+    elif ace_type is ACEType.SYSTEM_RESOURCE_ATTRIBUTE_ACE_TYPE:
+        access_mask = 0
+        parts.append(_WELL_KNOWN_TRUSTEE_SID_BYTES[0])
+        parts.append(_generate_resource_attribute(random))
+    elif ace_type is ACEType.SYSTEM_SCOPED_POLICY_ID_ACE_TYPE:
+        access_mask = 0
+        parts.append(_sid_string_bytes(f'S-1-17-{random.randrange(1, 1000)}'))
+    else:
+        access_mask = random.choice(ACCESS_MASKS)
+
+        if ace_type in _OBJECT_ACE_TYPES:
+            object_type: Optional[UUID] = random.choice(profile.object_types) \
+                if random.random() < profile.object_type_probability else None
+            inherited_object_type: Optional[UUID] = random.choice(profile.object_types) \
+                if random.random() < profile.inherited_object_type_probability else None
+
+            parts.append(struct_pack(
+                '<I',
+                (ACEObjectFlagMask.ACE_OBJECT_TYPE_PRESENT if object_type is not None else 0)
+                | (ACEObjectFlagMask.ACE_INHERITED_OBJECT_TYPE_PRESENT if inherited_object_type is not None else 0)
+            ))
+            if object_type is not None:
+                parts.append(object_type.bytes_le)
+            if inherited_object_type is not None:
+                parts.append(inherited_object_type.bytes_le)
+
+        parts.append(_generate_sid(random, profile))
+
+        if ace_type in _CALLBACK_ACE_TYPES:
+            parts.append(_generate_conditional_expression(random, profile))
+
+    body: bytes = b''.join(parts)
+    body += bytes(-len(body) % 4)
+
+    return struct_pack('<BBHI', ace_type, ace_flags, 8 + len(body), access_mask) + body
+
+
+def _generate_acl(
+    random: Random,
+    num_aces: Tuple[int, int],
+    ace_type_weights: Mapping[ACEType, float],
+    profile: SecurityDescriptorProfile
+) -> bytes:
+    ace_types: List[ACEType] = random.choices(
+        population=list(ace_type_weights),
+        weights=list(ace_type_weights.values()),
+        k=random.randint(*num_aces)
+    )
+    aces: List[bytes] = [_generate_ace(random, ace_type, profile) for ace_type in ace_types]
+
+    return struct_pack('<BBHHH', 4, 0, 8 + sum(len(ace) for ace in aces), len(aces), 0) + b''.join(aces)
+
+
+def generate_security_descriptor(random: Random, profile: Optional[SecurityDescriptorProfile] = None) -> bytes:
+    """
+    Generate a self-relative security descriptor.
+
+    The components are laid out in the order Windows uses: the SACL, the DACL, the owner and the group.
+
+    :param random: The random number generator with which to generate the security descriptor.
+    :param profile: The shape of the security descriptor; the default profile if `None`.
+    :return: The security descriptor.
+    """
+
+    profile = profile or SecurityDescriptorProfile()
+
+    control: int = SecurityDescriptorControlMask.SE_SELF_RELATIVE
+    components: List[Optional[bytes]] = []
+
+    if random.random() < profile.sacl_probability:
+        control |= SecurityDescriptorControlMask.SE_SACL_PRESENT
+        components.append(_generate_acl(random, profile.num_sacl_aces, profile.sacl_ace_type_weights, profile))
+    else:
+        components.append(None)
+
+    if random.random() < profile.dacl_probability:
+        control |= SecurityDescriptorControlMask.SE_DACL_PRESENT
+        components.append(_generate_acl(random, profile.num_dacl_aces, profile.dacl_ace_type_weights, profile))
+    else:
+        components.append(None)
+
+    if random.random() < profile.owner_probability:
+        components.append(_generate_sid(random, profile))
+    else:
+        control |= SecurityDescriptorControlMask.SE_OWNER_DEFAULTED
+        components.append(None)
+
+    if random.random() < profile.group_probability:
+        components.append(_generate_sid(random, profile))
+    else:
+        control |= SecurityDescriptorControlMask.SE_GROUP_DEFAULTED
+        components.append(None)
+
+    offsets: List[int] = []
+    offset = 20
+    for component in components:
+        offsets.append(offset if component is not None else 0)
+        offset += len(component or b'')
+
+    sacl_offset, dacl_offset, owner_offset, group_offset = offsets
+
+    return struct_pack(
+        '<BBHIIII',
+        1,
+        0,
+        control,
+        owner_offset,
+        group_offset,
+        sacl_offset,
+        dacl_offset
+    ) + b''.join(component for component in components if component is not None)
+
+
+# File names
+
+@dataclass
+class FileNameProfile:
+    """
+    The shape of generated file names.
+
+    The lengths of the names are drawn from a log-normal distribution, or from explicit weights if provided.
+
+    :ivar name_length_mu: The mean of the logarithm of the name lengths.
+    :ivar name_length_sigma: The standard deviation of the logarithm of the name lengths.
+    :ivar name_length_weights: A mapping of name lengths to their relative frequencies, used instead of the log-normal
+        distribution if provided.
+    :ivar max_name_length: The maximum length of a name, in characters.
+    :ivar non_ascii_probability: The probability of each character of a name being a non-ASCII character.
+    """
+
+    name_length_mu: float = 2.6
+    name_length_sigma: float = 0.6
+    name_length_weights: Optional[Mapping[int, float]] = None
+    max_name_length: int = 255
+    non_ascii_probability: float = 0.02
+
+
+_ASCII_NAME_CHARACTERS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-.()'
+_NON_ASCII_NAME_CHARACTERS = 'åäöéèüñßçøæ日本語文件'
+_EXTENSIONS: Tuple[str, ...] = ('.txt', '.docx', '.xlsx', '.pdf', '.dll', '.exe', '.log', '.jpg', '')
+
+
+def _generate_file_name(random: Random, profile: FileNameProfile) -> str:
+    if profile.name_length_weights is not None:
+        length: int = random.choices(
+            population=list(profile.name_length_weights),
+            weights=list(profile.name_length_weights.values())
+        )[0]
+    else:
+        length = round(random.lognormvariate(profile.name_length_mu, profile.name_length_sigma))
+
+    extension: str = random.choice(_EXTENSIONS)
+    length = max(1, min(length, profile.max_name_length) - len(extension))
+
+    return ''.join(
+        random.choice(_NON_ASCII_NAME_CHARACTERS) if random.random() < profile.non_ascii_probability
+        else random.choice(_ASCII_NAME_CHARACTERS)
+        for _ in range(length)
+    ).strip(' .') + extension or 'x'
+
+
+def _link_entries(entries: List[bytes], alignment: int) -> bytes:
+    """
+    Pad chained entries to an alignment and set their `NextEntryOffset`s, the last one's being `0`.
+    """
+
+    for i, entry in enumerate(entries):
+        if i != len(entries) - 1:
+            entry += bytes(-len(entry) % alignment)
+            entries[i] = struct_pack('<I', len(entry)) + entry[4:]
+
+    return b''.join(entries)
+
+
+# Directory buffers
+
+@dataclass
+class DirectoryBufferProfile(FileNameProfile):
+    """
+    The shape of generated `QUERY_DIRECTORY` response buffers.
+
+    :ivar file_information_class: The file information class of the entries.
+    :ivar num_entries: The inclusive range of the number of entries of a buffer.
+    :ivar dot_entries: Whether the buffers start with `.` and `..` entries.
+    :ivar directory_probability: The probability that an entry is a directory.
+    """
+
+    file_information_class: FileInformationClass = FileInformationClass.FileIdBothDirectoryInformation
+    num_entries: Tuple[int, int] = (1, 128)
+    dot_entries: bool = True
+    directory_probability: float = 0.15
+
+
+def _generate_short_name(random: Random, file_name: str, file_index: int) -> bytes:
+    if len(file_name) <= 12 and file_name.isascii():
+        return b''
+
+    stem: str = ''.join(character for character in file_name.upper() if character.isascii() and character.isalnum())
+    return f'{stem[:6] or "FILE"}~{file_index % 10 or 1}.{random.choice(("TXT", "DOC", "DAT"))}'.encode(
+        encoding='utf-16-le'
+    )
+
+
+def _generate_directory_entry(
+    random: Random,
+    file_information_class: FileInformationClass,
+    file_index: int,
+    file_name: str,
+    is_directory: bool
+) -> bytes:
+    file_name_bytes: bytes = file_name.encode(encoding='utf-16-le')
+    entry_struct: Struct = FILE_INFORMATION_CLASS_TO_DECODER[file_information_class]._STRUCT
+
+    if file_information_class is FileInformationClass.FileNamesInformation:
+        return entry_struct.pack(0, file_index, len(file_name_bytes)) + file_name_bytes
+
+    creation_time: int = random.randrange(128_000_000_000_000_000, 134_000_000_000_000_000)
+    last_write_time: int = creation_time + random.randrange(0, 10_000_000_000_000_000)
+    endof_file: int = 0 if is_directory else int(random.lognormvariate(9.0, 2.5))
+    file_information_fields = (
+        creation_time,
+        last_write_time + random.randrange(0, 1_000_000_000_000),
+        last_write_time,
+        last_write_time,
+        endof_file,
+        0 if is_directory else -(-endof_file // 4096) * 4096,
+        FileAttributesFlag.FILE_ATTRIBUTE_DIRECTORY if is_directory else FileAttributesFlag.FILE_ATTRIBUTE_ARCHIVE,
+        len(file_name_bytes)
+    )
+    file_id: bytes = random.randbytes(8)
+
+    if file_information_class is FileInformationClass.FileDirectoryInformation:
+        specific_fields = ()
+    elif file_information_class is FileInformationClass.FileFullDirectoryInformation:
+        specific_fields = (0,)
+    elif file_information_class is FileInformationClass.FileIdFullDirectoryInformation:
+        specific_fields = (0, file_id)
+    elif file_information_class is FileInformationClass.FileBothDirectoryInformation:
+        short_name_bytes: bytes = _generate_short_name(random, file_name, file_index)
+        specific_fields = (0, len(short_name_bytes), short_name_bytes)
+    elif file_information_class is FileInformationClass.FileIdBothDirectoryInformation:
+        short_name_bytes = _generate_short_name(random, file_name, file_index)
+        specific_fields = (0, len(short_name_bytes), short_name_bytes, file_id)
+    elif file_information_class is FileInformationClass.FileIdExtdDirectoryInformation:
+        specific_fields = (0, 0, file_id + bytes(8))
+    else:
+        raise ValueError(f'Unsupported file information class: {file_information_class!r}.')
+
+    return entry_struct.pack(0, file_index, *file_information_fields, *specific_fields) + file_name_bytes
+
+
+def generate_directory_buffer(random: Random, profile: Optional[DirectoryBufferProfile] = None) -> bytes:
+    """
+    Generate the buffer of chained entries of a `QUERY_DIRECTORY` response.
+
+    :param random: The random number generator with which to generate the buffer.
+    :param profile: The shape of the buffer; the default profile if `None`.
+    :return: The buffer.
+    """
+
+    profile = profile or DirectoryBufferProfile()
+    file_information_class = FileInformationClass(profile.file_information_class)
+
+    num_entries: int = random.randint(*profile.num_entries)
+    file_names: List[str] = ['.', '..'] if profile.dot_entries else []
+    file_names.extend(_generate_file_name(random, profile) for _ in range(num_entries - len(file_names)))
+
+    return _link_entries(
+        entries=[
+            _generate_directory_entry(
+                random=random,
+                file_information_class=file_information_class,
+                file_index=file_index,
+                file_name=file_name,
+                is_directory=file_name in ('.', '..') or random.random() < profile.directory_probability
+            )
+            for file_index, file_name in enumerate(file_names)
+        ],
+        alignment=8
+    )
+
+
+# Change notification buffers
+
+@dataclass
+class NotifyBufferProfile(FileNameProfile):
+    """
+    The shape of generated `CHANGE_NOTIFY` response buffers.
+
+    :ivar num_records: The inclusive range of the number of records of a buffer.
+    :ivar action_weights: The relative frequency of each action.
+    :ivar max_depth: The maximum number of directories in the relative path of a record.
+    """
+
+    num_records: Tuple[int, int] = (1, 64)
+    action_weights: Mapping[FileNotifyAction, float] = field(default_factory=lambda: {
+        FileNotifyAction.FILE_ACTION_ADDED: 20.0,
+        FileNotifyAction.FILE_ACTION_REMOVED: 10.0,
+        FileNotifyAction.FILE_ACTION_MODIFIED: 60.0,
+        FileNotifyAction.FILE_ACTION_RENAMED_OLD_NAME: 5.0,
+        FileNotifyAction.FILE_ACTION_RENAMED_NEW_NAME: 5.0
+    })
+    max_depth: int = 3
+
+
+def generate_notify_buffer(random: Random, profile: Optional[NotifyBufferProfile] = None) -> bytes:
+    """
+    Generate the buffer of chained `FILE_NOTIFY_INFORMATION` records of a `CHANGE_NOTIFY` response.
+
+    :param random: The random number generator with which to generate the buffer.
+    :param profile: The shape of the buffer; the default profile if `None`.
+    :return: The buffer.
+    """
+
+    profile = profile or NotifyBufferProfile()
+
+    actions: List[FileNotifyAction] = random.choices(
+        population=list(profile.action_weights),
+        weights=list(profile.action_weights.values()),
+        k=random.randint(*profile.num_records)
+    )
+
+    records: List[bytes] = []
+    for action in actions:
+        file_name_bytes: bytes = '\\'.join(
+            _generate_file_name(random, profile) for _ in range(random.randint(0, profile.max_depth) + 1)
+        ).encode(encoding='utf-16-le')
+        records.append(struct_pack('<III', 0, action, len(file_name_bytes)) + file_name_bytes)
+
+    return _link_entries(entries=records, alignment=4)
+
+
+# Corpora
+
+Profile = Union[SecurityDescriptorProfile, DirectoryBufferProfile, NotifyBufferProfile]
+
+_PROFILE_CLASS_TO_GENERATOR = {
+    SecurityDescriptorProfile: generate_security_descriptor,
+    DirectoryBufferProfile: generate_directory_buffer,
+    NotifyBufferProfile: generate_notify_buffer
+}
+
+
+def corpus_item(profile: Profile, seed: int, index: int) -> bytes:
+    """
+    Generate a single item of a corpus.
+
+    :param profile: The shape of the items of the corpus.
+    :param seed: The seed of the corpus.
+    :param index: The index of the item in the corpus.
+    :return: The item.
+    """
+
+    # A string seed is hashed with SHA-512, independently of `PYTHONHASHSEED`.
+    return _PROFILE_CLASS_TO_GENERATOR[type(profile)](Random(f'{type(profile).__name__}:{seed}:{index}'), profile)
+
+
+def generate_corpus(profile: Profile, count: int, seed: int = 0) -> Iterator[bytes]:
+    """
+    Generate a corpus of security descriptors, directory buffers or change notification buffers.
+
+    :param profile: The shape of the items, whose type determines the kind of items.
+    :param count: The number of items to generate.
+    :param seed: The seed of the corpus.
+    :return: An iterator of the items.
+    """
+
+    return (corpus_item(profile=profile, seed=seed, index=index) for index in range(count))
+
+
+def write_corpus(directory: Union[str, PathLike], items: Iterable[bytes], prefix: str = 'item') -> List[str]:
+    """
+    Write the items of a corpus to a directory, one file per item, e.g. as the seed corpus of a fuzzer.
+
+    :param directory: The directory to write the files to, created if it does not exist.
+    :param items: The items to write.
+    :param prefix: The prefix of the file names, which are followed by the zero-padded index of the item.
+    :return: The paths of the written files.
+    """
+
+    makedirs(directory, exist_ok=True)
+
+    paths: List[str] = []
+    for index, item in enumerate(items):
+        path: str = path_join(directory, f'{prefix}-{index:06d}.bin')
+        with open(path, 'wb') as file:
+            file.write(item)
+        paths.append(path)
+
+    return paths
@@ -1,51 +1,126 @@
 from __future__ import annotations
-from typing import Type, Optional, Callable, Any, List, Dict, Final, Tuple
-from inspect import getmembers
+from typing import Type, Optional, Callable, Any, List, Dict, Final, Tuple, Union, ByteString, TYPE_CHECKING
 from enum import IntFlag
 from re import sub as re_sub
 from abc import ABC
+from importlib import import_module
+from os import environ
 
 from string_utils_py import to_snake_case
 
+from msdsalgs.instrumentation import instrumented, count_elements
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
 
 class Mask(ABC):
     INT_FLAG_CLASS: Final[Type[IntFlag]] = NotImplemented
-
-    def __init__(self):
-        self._mask: IntFlag = self.INT_FLAG_CLASS(0)
+    # An ordered table of the mask's attribute names and their corresponding bit values, populated by `make_class`.
+    FLAG_TABLE: Final[Tuple[Tuple[str, int], ...]] = ()
+    # The union of all the bit values in `FLAG_TABLE`.
+    ALL_FLAGS_VALUE: Final[int] = 0
+    # A mapping of the mask's attribute names to their corresponding bit values.
+    ATTRIBUTE_NAME_TO_BIT: Final[Dict[str, int]] = {}
+
+    # The mask value is stored as a plain integer; an `IntFlag` is only materialized by `to_int_flag` and `__repr__`.
+    __slots__ = ('_mask',)
+
+    def __init__(self, **kwargs):
+        value = 0
+        for attribute_name, attribute_value in kwargs.items():
+            bit: Optional[int] = self.ATTRIBUTE_NAME_TO_BIT.get(attribute_name)
+            if bit is None:
+                raise ValueError(f'{attribute_name} is not part of the mask.')
+            if attribute_value:
+                value |= bit
+
+        self._mask: int = value
 
     @classmethod
     def from_int(cls, value: int):
-        cls_instance = cls()
-        cls_instance._mask |= value
+        cls_instance = cls.__new__(cls)
+        cls_instance._mask = int(value)
         return cls_instance
 
     def to_int_flag(self) -> IntFlag:
-        return self.INT_FLAG_CLASS(self._mask.value)
+        return self.INT_FLAG_CLASS(self._mask)
 
     def set_all(self) -> None:
-        for key, _ in self.items():
-            setattr(self, key, True)
+        self._mask |= self.ALL_FLAGS_VALUE
 
     def clear_all(self) -> None:
-        for key, _ in self.items():
-            setattr(self, key, False)
+        self._mask &= ~self.ALL_FLAGS_VALUE
 
     def items(self) -> Tuple[Tuple[str, bool], ...]:
-        return tuple(
-            (name, value)
-            for name, value in getmembers(self, lambda value: not callable(value))
-            if not name.startswith('_')
-        )
+        value: int = self._mask
+        return tuple((name, value & bit == bit) for name, bit in self.FLAG_TABLE)
 
     def __repr__(self) -> str:
-        return repr(self._mask)
+        return repr(self.to_int_flag())
 
     def __eq__(self, other: Mask) -> bool:
-        return self.to_int_flag() == other.to_int_flag()
+        if not isinstance(other, Mask):
+            return NotImplemented
+        return self._mask == other._mask
 
     def __int__(self) -> int:
-        return self._mask.value
+        return self._mask
+
+    @classmethod
+    def flag_matrix(
+        cls,
+        values: Union[ndarray, ByteString],
+        stride: int = 4,
+        offset: int = 0
+    ) -> ndarray:
+        """
+        Decode many mask values at once, without creating a `Mask` instance per value.
+
+        Requires NumPy.
+
+        :param values: A NumPy array of mask values, or a buffer from which little-endian 32-bit mask values are read.
+        :param stride: The distance in bytes between consecutive mask values in `values`, in case it is a buffer.
+        :param offset: The offset of the first mask value in `values`, in case it is a buffer.
+        :return: A boolean matrix with a row per mask value and a column per entry in `FLAG_TABLE`.
+        """
+
+        from numpy import empty as numpy_empty, equal as numpy_equal, bitwise_and as numpy_bitwise_and
+
+        values: ndarray = _mask_values_array(values=values, stride=stride, offset=offset)
+
+        matrix: ndarray = numpy_empty(shape=(len(values), len(cls.FLAG_TABLE)), dtype=bool)
+        for column, (_, bit) in enumerate(cls.FLAG_TABLE):
+            numpy_equal(numpy_bitwise_and(values, bit), bit, out=matrix[:, column])
+
+        return matrix
+
+    @classmethod
+    def flag_counts(
+        cls,
+        values: Union[ndarray, ByteString],
+        stride: int = 4,
+        offset: int = 0
+    ) -> Dict[str, int]:
+        """
+        Count how many of many mask values have each flag set, without creating a `Mask` instance per value.
+
+        Requires NumPy.
+
+        :param values: A NumPy array of mask values, or a buffer from which little-endian 32-bit mask values are read.
+        :param stride: The distance in bytes between consecutive mask values in `values`, in case it is a buffer.
+        :param offset: The offset of the first mask value in `values`, in case it is a buffer.
+        :return: A mapping of each attribute name in `FLAG_TABLE` to the number of mask values with the flag set.
+        """
+
+        from numpy import count_nonzero as numpy_count_nonzero, bitwise_and as numpy_bitwise_and
+
+        values: ndarray = _mask_values_array(values=values, stride=stride, offset=offset)
+
+        return {
+            attribute_name: int(numpy_count_nonzero(numpy_bitwise_and(values, bit) == bit))
+            for attribute_name, bit in cls.FLAG_TABLE
+        }
 
     @classmethod
     def make_class(
@@ -54,6 +129,44 @@ class Mask(ABC):
         name: Optional[str] = None,
         prefix: str = '',
         attribute_name_formatter: Optional[Callable[[str], str]] = None
+    ) -> Type[Mask]:
+        """
+        Create a new `Mask` child class from an `IntFlag` class.
+
+        If an up-to-date, ahead-of-time generated class exists for the `IntFlag` class (see
+        `msdsalgs.mask_generation`), it is used; otherwise the class is created dynamically. The use of generated
+        classes can be disabled by setting the environment variable `MSDSALGS_NO_GENERATED_MASKS`.
+
+        :param int_flag_class: An `IntFlag` class with enumeration members to be added to the class to be created.
+        :param name: The name of the class to be created.
+        :param prefix: A prefix of the enumeration member attributes in `int_flag_class` that is to be ignored.
+        :param attribute_name_formatter: A function that will format the attribute names.
+        :return: A mask class with attributes corresponding to those in the provided `IntFlag` class.
+        """
+
+        if cls is Mask and attribute_name_formatter is None and USE_GENERATED_MASKS:
+            generated_mask_class: Optional[Type[Mask]] = _load_generated_mask_class(
+                int_flag_class=int_flag_class,
+                name=name,
+                prefix=prefix
+            )
+            if generated_mask_class is not None:
+                return generated_mask_class
+
+        return cls.make_dynamic_class(
+            int_flag_class=int_flag_class,
+            name=name,
+            prefix=prefix,
+            attribute_name_formatter=attribute_name_formatter
+        )
+
+    @classmethod
+    def make_dynamic_class(
+        cls,
+        int_flag_class: Type[IntFlag],
+        name: Optional[str] = None,
+        prefix: str = '',
+        attribute_name_formatter: Optional[Callable[[str], str]] = None
     ) -> Type[Mask]:
         """
         Dynamically create a new `Mask` child class from an `IntFlag` class.
@@ -66,46 +179,156 @@ class Mask(ABC):
         """
 
         mask_class = type(
-            name or re_sub(r'(Flag|Mask)+$', '', int_flag_class.__name__),
+            name or mask_class_name(int_flag_class=int_flag_class),
             (cls,),
-            dict()
+            dict(__slots__=())
         )
 
         attribute_name_formatter: Callable[[str], str] = attribute_name_formatter or to_snake_case
 
-        def make_field_property_accessor(enum_member: IntFlag):
+        def make_field_property_accessor(bit: int):
             def field_getter(self) -> bool:
-                return enum_member in self._mask
+                return self._mask & bit == bit
 
             def field_setter(self, value: bool) -> None:
                 if value:
-                    self._mask |= enum_member
+                    self._mask |= bit
                 else:
-                    self._mask &= ~enum_member
+                    self._mask &= ~bit
 
             return property(field_getter, field_setter)
 
-        attribute_name_to_false: Dict[str, bool] = {}
+        attribute_name_to_bit: Dict[str, int] = {}
         for enum_member in int_flag_class:
             attribute_name: str = attribute_name_formatter(
                 re_sub(pattern=f'^{prefix}', repl='', string=enum_member.name)
             )
-            setattr(mask_class, attribute_name, make_field_property_accessor(enum_member=enum_member))
-            attribute_name_to_false[attribute_name] = False
+            bit: int = enum_member.value
+            setattr(mask_class, attribute_name, make_field_property_accessor(bit=bit))
+            attribute_name_to_bit[attribute_name] = bit
+
+        # Ordered by attribute name, which is the order in which attributes used to be listed by `items()`.
+        flag_table: Tuple[Tuple[str, int], ...] = tuple(sorted(attribute_name_to_bit.items()))
 
-        def constructor(self, **kwargs):
-            super(mask_class, self).__init__()
-            for attribute_name, value in {**attribute_name_to_false, **kwargs}.items():
-                if attribute_name not in attribute_name_to_false:
-                    raise ValueError(f'{attribute_name} is not part of the mask.')
-                setattr(self, attribute_name, value)
+        all_flags_value = 0
+        for _, bit in flag_table:
+            all_flags_value |= bit
 
-        setattr(mask_class, '__init__', constructor)
         setattr(mask_class, 'INT_FLAG_CLASS', int_flag_class)
+        setattr(mask_class, 'FLAG_TABLE', flag_table)
+        setattr(mask_class, 'ALL_FLAGS_VALUE', all_flags_value)
+        setattr(mask_class, 'ATTRIBUTE_NAME_TO_BIT', dict(flag_table))
 
         return mask_class
 
 
+def mask_class_name(int_flag_class: Type[IntFlag]) -> str:
+    """
+    Derive the default name of a `Mask` class from the name of its `IntFlag` class.
+
+    :param int_flag_class: The `IntFlag` class from which the mask class is created.
+    :return: The name of the `IntFlag` class without its `Flag` or `Mask` suffix.
+    """
+
+    return re_sub(r'(Flag|Mask)+$', '', int_flag_class.__name__)
+
+
+def _mask_values_array(values: Union[ndarray, ByteString], stride: int = 4, offset: int = 0) -> ndarray:
+    from numpy import ndarray as numpy_ndarray, asarray as numpy_asarray, uint32 as numpy_uint32
+
+    if isinstance(values, numpy_ndarray):
+        return numpy_asarray(values, dtype=numpy_uint32)
+
+    values = memoryview(values).cast('B')
+    num_values: int = (len(values) - offset - 4) // stride + 1 if len(values) >= offset + 4 else 0
+
+    return numpy_ndarray(shape=(num_values,), dtype='<u4', buffer=values, offset=offset, strides=(stride,))
+
+
+USE_GENERATED_MASKS: bool = not environ.get('MSDSALGS_NO_GENERATED_MASKS')
+
+
+def mask_class_fingerprint(
+    int_flag_class: Type[IntFlag],
+    name: Optional[str] = None,
+    prefix: str = ''
+) -> Tuple[str, str, Tuple[Tuple[str, int], ...]]:
+    """
+    Make a fingerprint of the `IntFlag` class and options from which a `Mask` class is created.
+
+    :param int_flag_class: The `IntFlag` class from which the mask class is created.
+    :param name: The name of the mask class.
+    :param prefix: The prefix of the enumeration members that is to be ignored.
+    :return: A value that changes whenever the members of the `IntFlag` class or the options change.
+    """
+
+    return (
+        name or mask_class_name(int_flag_class=int_flag_class),
+        prefix,
+        tuple((enum_member.name, enum_member.value) for enum_member in int_flag_class)
+    )
+
+
+class IntFlagClassReference:
+    """
+    The `INT_FLAG_CLASS` of an ahead-of-time generated `Mask` class: a reference to the `IntFlag` class it was generated
+    from, by module and name, which is imported when first accessed.
+    """
+
+    __slots__ = ('module_name', 'qualified_name', '_int_flag_class')
+
+    def __init__(self, module_name: str, qualified_name: str):
+        self.module_name = module_name
+        self.qualified_name = qualified_name
+        self._int_flag_class: Optional[Type[IntFlag]] = None
+
+    def refers_to(self, int_flag_class: Type[IntFlag]) -> bool:
+        return (int_flag_class.__module__, int_flag_class.__qualname__) == (self.module_name, self.qualified_name)
+
+    def __get__(self, instance: Optional[Mask], owner: Type[Mask]) -> Type[IntFlag]:
+        if self._int_flag_class is None:
+            self._int_flag_class = getattr(import_module(self.module_name), self.qualified_name)
+        return self._int_flag_class
+
+
+_generated_mask_classes: Optional[Dict[str, Tuple[Type[Mask], Tuple]]] = None
+
+
+def _load_generated_mask_class(
+    int_flag_class: Type[IntFlag],
+    name: Optional[str] = None,
+    prefix: str = ''
+) -> Optional[Type[Mask]]:
+    global _generated_mask_classes
+
+    if _generated_mask_classes is None:
+        try:
+            from msdsalgs._generated_masks import GENERATED_MASK_CLASSES
+            _generated_mask_classes = GENERATED_MASK_CLASSES
+        except ImportError:
+            _generated_mask_classes = {}
+
+    entry: Optional[Tuple[Type[Mask], Tuple]] = _generated_mask_classes.get(
+        name or mask_class_name(int_flag_class=int_flag_class)
+    )
+    if entry is None:
+        return None
+
+    mask_class, fingerprint = entry
+    if fingerprint != mask_class_fingerprint(int_flag_class=int_flag_class, name=name, prefix=prefix):
+        return None
+
+    # A generated class is only used for the `IntFlag` class it was generated from, whose members may be the same as
+    # those of another one.
+    int_flag_class_reference = mask_class.__dict__.get('INT_FLAG_CLASS')
+    if not isinstance(int_flag_class_reference, IntFlagClassReference) \
+            or not int_flag_class_reference.refers_to(int_flag_class):
+        return None
+
+    return mask_class
+
+
+@instrumented('extract_elements', on_result=count_elements)
 def extract_elements(
     data: bytes,
     create_element: Callable[[bytes], Any],
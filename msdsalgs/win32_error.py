@@ -5,6 +5,8 @@ from sys import modules as sys_modules
 from inspect import getmembers as inspect_getmembers, isclass as inspect_isclass
 from abc import ABC
 
+from msdsalgs.description_store import StoredDescription
+
 
 class Win32ErrorCode(IntEnum):
     ERROR_SUCCESS = 0x00000000
@@ -2712,13530 +2714,10899 @@ class Win32ErrorCode(IntEnum):
     ERROR_SYSTEM_DEVICE_NOT_FOUND = 0x00003BC3
 
 
+# The descriptions of the exception classes, read on demand from a compressed resource.
+WIN32_ERROR_DESCRIPTIONS = StoredDescription(package='msdsalgs', resource_name='win32_error_descriptions.bin')
+
+
 class Win32Error(Exception, ABC):
-    DESCRIPTION: str = NotImplemented
+    DESCRIPTION: str = WIN32_ERROR_DESCRIPTIONS
     WIN32_ERROR_CODE: Win32ErrorCode = NotImplemented
 
     WIN32_ERROR_CODE_TO_ERROR_CLASS: Dict[Win32ErrorCode, Type[Win32Error]] = NotImplemented
+    # The same mapping keyed by plain integers, for looking up raw codes without constructing enumeration members.
+    WIN32_ERROR_CODE_INT_TO_ERROR_CLASS: Dict[int, Type[Win32Error]] = NotImplemented
 
     def __init__(self, response: Optional[Any] = None, description: Optional[str] = None):
-        super().__init__(description or self.DESCRIPTION)
+        # The class description is only read from the store when the message is needed.
+        super().__init__(*((description,) if description else ()))
         self.response: Optional[Any] = response
 
+    def __str__(self) -> str:
+        return self.args[0] if self.args else str(self.DESCRIPTION)
+
     @classmethod
     def from_win32_error_code(cls, win32_error_code: Win32ErrorCode, **error_options) -> Win32Error:
         return cls.WIN32_ERROR_CODE_TO_ERROR_CLASS[win32_error_code](**error_options)
 
+    @classmethod
+    def from_win32_error_code_int(cls, win32_error_code: int, **error_options) -> Win32Error:
+        """
+        Make an exception from a raw Win32 error code, which need not be a known code.
+
+        :param win32_error_code: A raw Win32 error code, e.g. from a response.
+        :param error_options: Keyword arguments passed to the exception class.
+        :return: An instance of the code's exception class; an `UnknownWin32Error` if it has none.
+        """
+
+        error_class: Optional[Type[Win32Error]] = cls.WIN32_ERROR_CODE_INT_TO_ERROR_CLASS.get(win32_error_code)
+        if error_class is None:
+            return UnknownWin32Error(win32_error_code=win32_error_code, **error_options)
+
+        return error_class(**error_options)
+
+    @classmethod
+    def raise_for_win32_error_code(
+        cls,
+        win32_error_code: int,
+        response: Optional[Any] = None,
+        description: Optional[str] = None
+    ) -> None:
+        """
+        Raise the exception of a raw Win32 error code, unless it is `ERROR_SUCCESS`.
+
+        The `ERROR_SUCCESS` check is done first and allocates nothing, so that the method can be called on every
+        response.
+
+        :param win32_error_code: A raw Win32 error code, e.g. from a response.
+        :param response: The response in which the code was returned.
+        :param description: A description overriding that of the exception class.
+        :return: None
+        """
+
+        if win32_error_code == 0:
+            return
+
+        raise cls.from_win32_error_code_int(win32_error_code, response=response, description=description)
+
+
+class UnknownWin32Error(Win32Error):
+    """An exception for Win32 error codes that have no exception class of their own."""
+
+    def __init__(self, win32_error_code: int, response: Optional[Any] = None, description: Optional[str] = None):
+        super().__init__(
+            response=response,
+            description=description or f'An unknown Win32 error code was encountered: 0x{win32_error_code:08X}.'
+        )
+        self.win32_error_code: int = win32_error_code
+
 
 class ErrorInvalidFunctionError(Win32Error):
-    DESCRIPTION = """Incorrect function."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_FUNCTION
 
 
 class ErrorFileNotFoundError(Win32Error):
-    DESCRIPTION = """The system cannot find the file specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_NOT_FOUND
 
 
 class ErrorPathNotFoundError(Win32Error):
-    DESCRIPTION = """The system cannot find the path specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATH_NOT_FOUND
 
 
 class ErrorTooManyOpenFilesError(Win32Error):
-    DESCRIPTION = """The system cannot open the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_OPEN_FILES
 
 
 class ErrorAccessDeniedError(Win32Error):
-    DESCRIPTION = """Access is denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCESS_DENIED
 
 
 class ErrorInvalidHandleError(Win32Error):
-    DESCRIPTION = """The handle is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_HANDLE
 
 
 class ErrorArenaTrashedError(Win32Error):
-    DESCRIPTION = """The storage control blocks were destroyed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ARENA_TRASHED
 
 
 class ErrorNotEnoughMemoryError(Win32Error):
-    DESCRIPTION = """Not enough storage is available to process this command."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_ENOUGH_MEMORY
 
 
 class ErrorInvalidBlockError(Win32Error):
-    DESCRIPTION = """The storage control block address is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_BLOCK
 
 
 class ErrorBadEnvironmentError(Win32Error):
-    DESCRIPTION = """The environment is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_ENVIRONMENT
 
 
 class ErrorBadFormatError(Win32Error):
-    DESCRIPTION = """An attempt was made to load a program with an incorrect format."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_FORMAT
 
 
 class ErrorInvalidAccessError(Win32Error):
-    DESCRIPTION = """The access code is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ACCESS
 
 
 class ErrorInvalidDataError(Win32Error):
-    DESCRIPTION = """The data is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DATA
 
 
 class ErrorOutofmemoryError(Win32Error):
-    DESCRIPTION = """Not enough storage is available to complete this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OUTOFMEMORY
 
 
 class ErrorInvalidDriveError(Win32Error):
-    DESCRIPTION = """The system cannot find the drive specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DRIVE
 
 
 class ErrorCurrentDirectoryError(Win32Error):
-    DESCRIPTION = """The directory cannot be removed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CURRENT_DIRECTORY
 
 
 class ErrorNotSameDeviceError(Win32Error):
-    DESCRIPTION = """The system cannot move the file to a different disk drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SAME_DEVICE
 
 
 class ErrorNoMoreFilesError(Win32Error):
-    DESCRIPTION = """There are no more files."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MORE_FILES
 
 
 class ErrorWriteProtectError(Win32Error):
-    DESCRIPTION = """The media is write-protected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WRITE_PROTECT
 
 
 class ErrorBadUnitError(Win32Error):
-    DESCRIPTION = """The system cannot find the device specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_UNIT
 
 
 class ErrorNotReadyError(Win32Error):
-    DESCRIPTION = """The device is not ready."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_READY
 
 
 class ErrorBadCommandError(Win32Error):
-    DESCRIPTION = """The device does not recognize the command."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_COMMAND
 
 
 class ErrorCrcError(Win32Error):
-    DESCRIPTION = """Data error (cyclic redundancy check)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CRC
 
 
 class ErrorBadLengthError(Win32Error):
-    DESCRIPTION = """The program issued a command but the command length is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_LENGTH
 
 
 class ErrorSeekError(Win32Error):
-    DESCRIPTION = """The drive cannot locate a specific area or track on the disk."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEEK
 
 
 class ErrorNotDosDiskError(Win32Error):
-    DESCRIPTION = """The specified disk cannot be accessed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_DOS_DISK
 
 
 class ErrorSectorNotFoundError(Win32Error):
-    DESCRIPTION = """The drive cannot find the sector requested."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SECTOR_NOT_FOUND
 
 
 class ErrorOutOfPaperError(Win32Error):
-    DESCRIPTION = """The printer is out of paper."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OUT_OF_PAPER
 
 
 class ErrorWriteFaultError(Win32Error):
-    DESCRIPTION = """The system cannot write to the specified device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WRITE_FAULT
 
 
 class ErrorReadFaultError(Win32Error):
-    DESCRIPTION = """The system cannot read from the specified device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_READ_FAULT
 
 
 class ErrorGenFailureError(Win32Error):
-    DESCRIPTION = """A device attached to the system is not functioning."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GEN_FAILURE
 
 
 class ErrorSharingViolationError(Win32Error):
-    DESCRIPTION = """The process cannot access the file because it is being used by another process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHARING_VIOLATION
 
 
 class ErrorLockViolationError(Win32Error):
-    DESCRIPTION = """The process cannot access the file because another process has locked a portion of the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOCK_VIOLATION
 
 
 class ErrorWrongDiskError(Win32Error):
-    DESCRIPTION = """The wrong disk is in the drive. Insert %2 (Volume Serial Number: %3) into drive %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WRONG_DISK
 
 
 class ErrorSharingBufferExceededError(Win32Error):
-    DESCRIPTION = """Too many files opened for sharing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHARING_BUFFER_EXCEEDED
 
 
 class ErrorHandleEofError(Win32Error):
-    DESCRIPTION = """Reached the end of the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HANDLE_EOF
 
 
 class ErrorHandleDiskFullError(Win32Error):
-    DESCRIPTION = """The disk is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HANDLE_DISK_FULL
 
 
 class ErrorNotSupportedError(Win32Error):
-    DESCRIPTION = """The request is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SUPPORTED
 
 
 class ErrorRemNotListError(Win32Error):
-    DESCRIPTION = """Windows cannot find the network path. Verify that the network path is correct and the destination computer is not busy or turned off. If Windows still cannot find the network path, contact your network administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REM_NOT_LIST
 
 
 class ErrorDupNameError(Win32Error):
-    DESCRIPTION = """You were not connected because a duplicate name exists on the network. Go to System in Control Panel to change the computer name, and then try again."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DUP_NAME
 
 
 class ErrorBadNetpathError(Win32Error):
-    DESCRIPTION = """The network path was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_NETPATH
 
 
 class ErrorNetworkBusyError(Win32Error):
-    DESCRIPTION = """The network is busy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NETWORK_BUSY
 
 
 class ErrorDevNotExistError(Win32Error):
-    DESCRIPTION = """The specified network resource or device is no longer available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEV_NOT_EXIST
 
 
 class ErrorTooManyCmdsError(Win32Error):
-    DESCRIPTION = """The network BIOS command limit has been reached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_CMDS
 
 
 class ErrorAdapHdwErrError(Win32Error):
-    DESCRIPTION = """A network adapter hardware error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ADAP_HDW_ERR
 
 
 class ErrorBadNetRespError(Win32Error):
-    DESCRIPTION = """The specified server cannot perform the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_NET_RESP
 
 
 class ErrorUnexpNetErrError(Win32Error):
-    DESCRIPTION = """An unexpected network error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNEXP_NET_ERR
 
 
 class ErrorBadRemAdapError(Win32Error):
-    DESCRIPTION = """The remote adapter is not compatible."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_REM_ADAP
 
 
 class ErrorPrintqFullError(Win32Error):
-    DESCRIPTION = """The print queue is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTQ_FULL
 
 
 class ErrorNoSpoolSpaceError(Win32Error):
-    DESCRIPTION = """Space to store the file waiting to be printed is not available on the server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SPOOL_SPACE
 
 
 class ErrorPrintCancelledError(Win32Error):
-    DESCRIPTION = """Your file waiting to be printed was deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINT_CANCELLED
 
 
 class ErrorNetnameDeletedError(Win32Error):
-    DESCRIPTION = """The specified network name is no longer available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NETNAME_DELETED
 
 
 class ErrorNetworkAccessDeniedError(Win32Error):
-    DESCRIPTION = """Network access is denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NETWORK_ACCESS_DENIED
 
 
 class ErrorBadDevTypeError(Win32Error):
-    DESCRIPTION = """The network resource type is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_DEV_TYPE
 
 
 class ErrorBadNetNameError(Win32Error):
-    DESCRIPTION = """The network name cannot be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_NET_NAME
 
 
 class ErrorTooManyNamesError(Win32Error):
-    DESCRIPTION = """The name limit for the local computer network adapter card was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_NAMES
 
 
 class ErrorTooManySessError(Win32Error):
-    DESCRIPTION = """The network BIOS session limit was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_SESS
 
 
 class ErrorSharingPausedError(Win32Error):
-    DESCRIPTION = """The remote server has been paused or is in the process of being started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHARING_PAUSED
 
 
 class ErrorReqNotAccepError(Win32Error):
-    DESCRIPTION = """No more connections can be made to this remote computer at this time because the computer has accepted the maximum number of connections."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REQ_NOT_ACCEP
 
 
 class ErrorRedirPausedError(Win32Error):
-    DESCRIPTION = """The specified printer or disk device has been paused."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REDIR_PAUSED
 
 
 class ErrorFileExistsError(Win32Error):
-    DESCRIPTION = """The file exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_EXISTS
 
 
 class ErrorCannotMakeError(Win32Error):
-    DESCRIPTION = """The directory or file cannot be created."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_MAKE
 
 
 class ErrorFailI24Error(Win32Error):
-    DESCRIPTION = """Fail on INT 24."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAIL_I24
 
 
 class ErrorOutOfStructuresError(Win32Error):
-    DESCRIPTION = """Storage to process this request is not available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OUT_OF_STRUCTURES
 
 
 class ErrorAlreadyAssignedError(Win32Error):
-    DESCRIPTION = """The local device name is already in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_ASSIGNED
 
 
 class ErrorInvalidPasswordError(Win32Error):
-    DESCRIPTION = """The specified network password is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PASSWORD
 
 
 class ErrorInvalidParameterError(Win32Error):
-    DESCRIPTION = """The parameter is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PARAMETER
 
 
 class ErrorNetWriteFaultError(Win32Error):
-    DESCRIPTION = """A write fault occurred on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NET_WRITE_FAULT
 
 
 class ErrorNoProcSlotsError(Win32Error):
-    DESCRIPTION = """The system cannot start another process at this time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_PROC_SLOTS
 
 
 class ErrorTooManySemaphoresError(Win32Error):
-    DESCRIPTION = """Cannot create another system semaphore."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_SEMAPHORES
 
 
 class ErrorExclSemAlreadyOwnedError(Win32Error):
-    DESCRIPTION = """The exclusive semaphore is owned by another process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXCL_SEM_ALREADY_OWNED
 
 
 class ErrorSemIsSetError(Win32Error):
-    DESCRIPTION = """The semaphore is set and cannot be closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEM_IS_SET
 
 
 class ErrorTooManySemRequestsError(Win32Error):
-    DESCRIPTION = """The semaphore cannot be set again."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_SEM_REQUESTS
 
 
 class ErrorInvalidAtInterruptTimeError(Win32Error):
-    DESCRIPTION = """Cannot request exclusive semaphores at interrupt time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_AT_INTERRUPT_TIME
 
 
 class ErrorSemOwnerDiedError(Win32Error):
-    DESCRIPTION = """The previous ownership of this semaphore has ended."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEM_OWNER_DIED
 
 
 class ErrorSemUserLimitError(Win32Error):
-    DESCRIPTION = """Insert the disk for drive %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEM_USER_LIMIT
 
 
 class ErrorDiskChangeError(Win32Error):
-    DESCRIPTION = """The program stopped because an alternate disk was not inserted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_CHANGE
 
 
 class ErrorDriveLockedError(Win32Error):
-    DESCRIPTION = """The disk is in use or locked by another process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVE_LOCKED
 
 
 class ErrorBrokenPipeError(Win32Error):
-    DESCRIPTION = """The pipe has been ended."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BROKEN_PIPE
 
 
 class ErrorOpenFailedError(Win32Error):
-    DESCRIPTION = """The system cannot open the device or file specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OPEN_FAILED
 
 
 class ErrorBufferOverflowError(Win32Error):
-    DESCRIPTION = """The file name is too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BUFFER_OVERFLOW
 
 
 class ErrorDiskFullError(Win32Error):
-    DESCRIPTION = """There is not enough space on the disk."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_FULL
 
 
 class ErrorNoMoreSearchHandlesError(Win32Error):
-    DESCRIPTION = """No more internal file identifiers are available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MORE_SEARCH_HANDLES
 
 
 class ErrorInvalidTargetHandleError(Win32Error):
-    DESCRIPTION = """The target internal file identifier is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_TARGET_HANDLE
 
 
 class ErrorInvalidCategoryError(Win32Error):
-    DESCRIPTION = """The Input Output Control (IOCTL) call made by the application program is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_CATEGORY
 
 
 class ErrorInvalidVerifySwitchError(Win32Error):
-    DESCRIPTION = """The verify-on-write switch parameter value is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_VERIFY_SWITCH
 
 
 class ErrorBadDriverLevelError(Win32Error):
-    DESCRIPTION = """The system does not support the command requested."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_DRIVER_LEVEL
 
 
 class ErrorCallNotImplementedError(Win32Error):
-    DESCRIPTION = """This function is not supported on this system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CALL_NOT_IMPLEMENTED
 
 
 class ErrorSemTimeoutError(Win32Error):
-    DESCRIPTION = """The semaphore time-out period has expired."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEM_TIMEOUT
 
 
 class ErrorInsufficientBufferError(Win32Error):
-    DESCRIPTION = """The data area passed to a system call is too small."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSUFFICIENT_BUFFER
 
 
 class ErrorInvalidNameError(Win32Error):
-    DESCRIPTION = """The file name, directory name, or volume label syntax is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_NAME
 
 
 class ErrorInvalidLevelError(Win32Error):
-    DESCRIPTION = """The system call level is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LEVEL
 
 
 class ErrorNoVolumeLabelError(Win32Error):
-    DESCRIPTION = """The disk has no volume label."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_VOLUME_LABEL
 
 
 class ErrorModNotFoundError(Win32Error):
-    DESCRIPTION = """The specified module could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MOD_NOT_FOUND
 
 
 class ErrorProcNotFoundError(Win32Error):
-    DESCRIPTION = """The specified procedure could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROC_NOT_FOUND
 
 
 class ErrorWaitNoChildrenError(Win32Error):
-    DESCRIPTION = """There are no child processes to wait for."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WAIT_NO_CHILDREN
 
 
 class ErrorChildNotCompleteError(Win32Error):
-    DESCRIPTION = """The %1 application cannot be run in Win32 mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CHILD_NOT_COMPLETE
 
 
 class ErrorDirectAccessHandleError(Win32Error):
-    DESCRIPTION = """Attempt to use a file handle to an open disk partition for an operation other than raw disk I/O."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DIRECT_ACCESS_HANDLE
 
 
 class ErrorNegativeSeekError(Win32Error):
-    DESCRIPTION = """An attempt was made to move the file pointer before the beginning of the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NEGATIVE_SEEK
 
 
 class ErrorSeekOnDeviceError(Win32Error):
-    DESCRIPTION = """The file pointer cannot be set on the specified device or file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEEK_ON_DEVICE
 
 
 class ErrorIsJoinTargetError(Win32Error):
-    DESCRIPTION = """A JOIN or SUBST command cannot be used for a drive that contains previously joined drives."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IS_JOIN_TARGET
 
 
 class ErrorIsJoinedError(Win32Error):
-    DESCRIPTION = """An attempt was made to use a JOIN or SUBST command on a drive that has already been joined."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IS_JOINED
 
 
 class ErrorIsSubstedError(Win32Error):
-    DESCRIPTION = """An attempt was made to use a JOIN or SUBST command on a drive that has already been substituted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IS_SUBSTED
 
 
 class ErrorNotJoinedError(Win32Error):
-    DESCRIPTION = """The system tried to delete the JOIN of a drive that is not joined."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_JOINED
 
 
 class ErrorNotSubstedError(Win32Error):
-    DESCRIPTION = """The system tried to delete the substitution of a drive that is not substituted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SUBSTED
 
 
 class ErrorJoinToJoinError(Win32Error):
-    DESCRIPTION = """The system tried to join a drive to a directory on a joined drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_JOIN_TO_JOIN
 
 
 class ErrorSubstToSubstError(Win32Error):
-    DESCRIPTION = """The system tried to substitute a drive to a directory on a substituted drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SUBST_TO_SUBST
 
 
 class ErrorJoinToSubstError(Win32Error):
-    DESCRIPTION = """The system tried to join a drive to a directory on a substituted drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_JOIN_TO_SUBST
 
 
 class ErrorSubstToJoinError(Win32Error):
-    DESCRIPTION = """The system tried to SUBST a drive to a directory on a joined drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SUBST_TO_JOIN
 
 
 class ErrorBusyDriveError(Win32Error):
-    DESCRIPTION = """The system cannot perform a JOIN or SUBST at this time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BUSY_DRIVE
 
 
 class ErrorSameDriveError(Win32Error):
-    DESCRIPTION = """The system cannot join or substitute a drive to or for a directory on the same drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SAME_DRIVE
 
 
 class ErrorDirNotRootError(Win32Error):
-    DESCRIPTION = """The directory is not a subdirectory of the root directory."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DIR_NOT_ROOT
 
 
 class ErrorDirNotEmptyError(Win32Error):
-    DESCRIPTION = """The directory is not empty."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DIR_NOT_EMPTY
 
 
 class ErrorIsSubstPathError(Win32Error):
-    DESCRIPTION = """The path specified is being used in a substitute."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IS_SUBST_PATH
 
 
 class ErrorIsJoinPathError(Win32Error):
-    DESCRIPTION = """Not enough resources are available to process this command."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IS_JOIN_PATH
 
 
 class ErrorPathBusyError(Win32Error):
-    DESCRIPTION = """The path specified cannot be used at this time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATH_BUSY
 
 
 class ErrorIsSubstTargetError(Win32Error):
-    DESCRIPTION = """An attempt was made to join or substitute a drive for which a directory on the drive is the target of a previous substitute."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IS_SUBST_TARGET
 
 
 class ErrorSystemTraceError(Win32Error):
-    DESCRIPTION = """System trace information was not specified in your CONFIG.SYS file, or tracing is disallowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_TRACE
 
 
 class ErrorInvalidEventCountError(Win32Error):
-    DESCRIPTION = """The number of specified semaphore events for DosMuxSemWait is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_EVENT_COUNT
 
 
 class ErrorTooManyMuxwaitersError(Win32Error):
-    DESCRIPTION = """DosMuxSemWait did not execute; too many semaphores are already set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_MUXWAITERS
 
 
 class ErrorInvalidListFormatError(Win32Error):
-    DESCRIPTION = """The DosMuxSemWait list is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LIST_FORMAT
 
 
 class ErrorLabelTooLongError(Win32Error):
-    DESCRIPTION = """The volume label you entered exceeds the label character limit of the destination file system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LABEL_TOO_LONG
 
 
 class ErrorTooManyTcbsError(Win32Error):
-    DESCRIPTION = """Cannot create another thread."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_TCBS
 
 
 class ErrorSignalRefusedError(Win32Error):
-    DESCRIPTION = """The recipient process has refused the signal."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SIGNAL_REFUSED
 
 
 class ErrorDiscardedError(Win32Error):
-    DESCRIPTION = """The segment is already discarded and cannot be locked."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISCARDED
 
 
 class ErrorNotLockedError(Win32Error):
-    DESCRIPTION = """The segment is already unlocked."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_LOCKED
 
 
 class ErrorBadThreadidAddrError(Win32Error):
-    DESCRIPTION = """The address for the thread ID is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_THREADID_ADDR
 
 
 class ErrorBadArgumentsError(Win32Error):
-    DESCRIPTION = """One or more arguments are not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_ARGUMENTS
 
 
 class ErrorBadPathnameError(Win32Error):
-    DESCRIPTION = """The specified path is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_PATHNAME
 
 
 class ErrorSignalPendingError(Win32Error):
-    DESCRIPTION = """A signal is already pending."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SIGNAL_PENDING
 
 
 class ErrorMaxThrdsReachedError(Win32Error):
-    DESCRIPTION = """No more threads can be created in the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MAX_THRDS_REACHED
 
 
 class ErrorLockFailedError(Win32Error):
-    DESCRIPTION = """Unable to lock a region of a file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOCK_FAILED
 
 
 class ErrorBusyError(Win32Error):
-    DESCRIPTION = """The requested resource is in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BUSY
 
 
 class ErrorCancelViolationError(Win32Error):
-    DESCRIPTION = """A lock request was not outstanding for the supplied cancel region."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANCEL_VIOLATION
 
 
 class ErrorAtomicLocksNotSupportedError(Win32Error):
-    DESCRIPTION = """The file system does not support atomic changes to the lock type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ATOMIC_LOCKS_NOT_SUPPORTED
 
 
 class ErrorInvalidSegmentNumberError(Win32Error):
-    DESCRIPTION = """The system detected a segment number that was not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SEGMENT_NUMBER
 
 
 class ErrorInvalidOrdinalError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ORDINAL
 
 
 class ErrorAlreadyExistsError(Win32Error):
-    DESCRIPTION = """Cannot create a file when that file already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_EXISTS
 
 
 class ErrorInvalidFlagNumberError(Win32Error):
-    DESCRIPTION = """The flag passed is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_FLAG_NUMBER
 
 
 class ErrorSemNotFoundError(Win32Error):
-    DESCRIPTION = """The specified system semaphore name was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEM_NOT_FOUND
 
 
 class ErrorInvalidStartingCodesegError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_STARTING_CODESEG
 
 
 class ErrorInvalidStacksegError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_STACKSEG
 
 
 class ErrorInvalidModuletypeError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MODULETYPE
 
 
 class ErrorInvalidExeSignatureError(Win32Error):
-    DESCRIPTION = """Cannot run %1 in Win32 mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_EXE_SIGNATURE
 
 
 class ErrorExeMarkedInvalidError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXE_MARKED_INVALID
 
 
 class ErrorBadExeFormatError(Win32Error):
-    DESCRIPTION = """%1 is not a valid Win32 application."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_EXE_FORMAT
 
 
 class ErrorIteratedDataExceeds64kError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ITERATED_DATA_EXCEEDS_64k
 
 
 class ErrorInvalidMinallocsizeError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MINALLOCSIZE
 
 
 class ErrorDynlinkFromInvalidRingError(Win32Error):
-    DESCRIPTION = """The operating system cannot run this application program."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DYNLINK_FROM_INVALID_RING
 
 
 class ErrorIoplNotEnabledError(Win32Error):
-    DESCRIPTION = """The operating system is not presently configured to run this application."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IOPL_NOT_ENABLED
 
 
 class ErrorInvalidSegdplError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SEGDPL
 
 
 class ErrorAutodatasegExceeds64kError(Win32Error):
-    DESCRIPTION = """The operating system cannot run this application program."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_AUTODATASEG_EXCEEDS_64k
 
 
 class ErrorRing2segMustBeMovableError(Win32Error):
-    DESCRIPTION = """The code segment cannot be greater than or equal to 64 KB."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RING2SEG_MUST_BE_MOVABLE
 
 
 class ErrorRelocChainXeedsSeglimError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RELOC_CHAIN_XEEDS_SEGLIM
 
 
 class ErrorInfloopInRelocChainError(Win32Error):
-    DESCRIPTION = """The operating system cannot run %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INFLOOP_IN_RELOC_CHAIN
 
 
 class ErrorEnvvarNotFoundError(Win32Error):
-    DESCRIPTION = """The system could not find the environment option that was entered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ENVVAR_NOT_FOUND
 
 
 class ErrorNoSignalSentError(Win32Error):
-    DESCRIPTION = """No process in the command subtree has a signal handler."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SIGNAL_SENT
 
 
 class ErrorFilenameExcedRangeError(Win32Error):
-    DESCRIPTION = """The file name or extension is too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILENAME_EXCED_RANGE
 
 
 class ErrorRing2StackInUseError(Win32Error):
-    DESCRIPTION = """The ring 2 stack is in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RING2_STACK_IN_USE
 
 
 class ErrorMetaExpansionTooLongError(Win32Error):
-    DESCRIPTION = """The asterisk (*) or question mark (?) global file name characters are entered incorrectly, or too many global file name characters are specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_META_EXPANSION_TOO_LONG
 
 
 class ErrorInvalidSignalNumberError(Win32Error):
-    DESCRIPTION = """The signal being posted is not correct."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SIGNAL_NUMBER
 
 
 class ErrorThread1InactiveError(Win32Error):
-    DESCRIPTION = """The signal handler cannot be set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_THREAD_1_INACTIVE
 
 
 class ErrorLockedError(Win32Error):
-    DESCRIPTION = """The segment is locked and cannot be reallocated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOCKED
 
 
 class ErrorTooManyModulesError(Win32Error):
-    DESCRIPTION = """Too many dynamic-link modules are attached to this program or dynamic-link module."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_MODULES
 
 
 class ErrorNestingNotAllowedError(Win32Error):
-    DESCRIPTION = """Cannot nest calls to LoadModule."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NESTING_NOT_ALLOWED
 
 
 class ErrorExeMachineTypeMismatchError(Win32Error):
-    DESCRIPTION = """This version of %1 is not compatible with the version of Windows you're running. Check your computer's system information to see whether you need an x86 (32-bit) or x64 (64-bit) version of the program, and then contact the software publisher."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXE_MACHINE_TYPE_MISMATCH
 
 
 class ErrorExeCannotModifySignedBinaryError(Win32Error):
-    DESCRIPTION = """The image file %1 is signed, unable to modify."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXE_CANNOT_MODIFY_SIGNED_BINARY
 
 
 class ErrorExeCannotModifyStrongSignedBinaryError(Win32Error):
-    DESCRIPTION = """The image file %1 is strong signed, unable to modify."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXE_CANNOT_MODIFY_STRONG_SIGNED_BINARY
 
 
 class ErrorFileCheckedOutError(Win32Error):
-    DESCRIPTION = """This file is checked out or locked for editing by another user."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_CHECKED_OUT
 
 
 class ErrorCheckoutRequiredError(Win32Error):
-    DESCRIPTION = """The file must be checked out before saving changes."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CHECKOUT_REQUIRED
 
 
 class ErrorBadFileTypeError(Win32Error):
-    DESCRIPTION = """The file type being saved or retrieved has been blocked."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_FILE_TYPE
 
 
 class ErrorFileTooLargeError(Win32Error):
-    DESCRIPTION = """The file size exceeds the limit allowed and cannot be saved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_TOO_LARGE
 
 
 class ErrorFormsAuthRequiredError(Win32Error):
-    DESCRIPTION = """Access denied. Before opening files in this location, you must first browse to the website and select the option to sign in automatically."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FORMS_AUTH_REQUIRED
 
 
 class ErrorVirusInfectedError(Win32Error):
-    DESCRIPTION = """Operation did not complete successfully because the file contains a virus."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VIRUS_INFECTED
 
 
 class ErrorVirusDeletedError(Win32Error):
-    DESCRIPTION = """This file contains a virus and cannot be opened. Due to the nature of this virus, the file has been removed from this location."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VIRUS_DELETED
 
 
 class ErrorPipeLocalError(Win32Error):
-    DESCRIPTION = """The pipe is local."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PIPE_LOCAL
 
 
 class ErrorBadPipeError(Win32Error):
-    DESCRIPTION = """The pipe state is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_PIPE
 
 
 class ErrorPipeBusyError(Win32Error):
-    DESCRIPTION = """All pipe instances are busy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PIPE_BUSY
 
 
 class ErrorNoDataError(Win32Error):
-    DESCRIPTION = """The pipe is being closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_DATA
 
 
 class ErrorPipeNotConnectedError(Win32Error):
-    DESCRIPTION = """No process is on the other end of the pipe."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PIPE_NOT_CONNECTED
 
 
 class ErrorMoreDataError(Win32Error):
-    DESCRIPTION = """More data is available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MORE_DATA
 
 
 class ErrorVcDisconnectedError(Win32Error):
-    DESCRIPTION = """The session was canceled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VC_DISCONNECTED
 
 
 class ErrorInvalidEaNameError(Win32Error):
-    DESCRIPTION = """The specified extended attribute name was invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_EA_NAME
 
 
 class ErrorEaListInconsistentError(Win32Error):
-    DESCRIPTION = """The extended attributes are inconsistent."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EA_LIST_INCONSISTENT
 
 
 class WaitTimeoutError(Win32Error):
-    DESCRIPTION = """The wait operation timed out."""
     WIN32_ERROR_CODE = Win32ErrorCode.WAIT_TIMEOUT
 
 
 class ErrorNoMoreItemsError(Win32Error):
-    DESCRIPTION = """No more data is available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MORE_ITEMS
 
 
 class ErrorCannotCopyError(Win32Error):
-    DESCRIPTION = """The copy functions cannot be used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_COPY
 
 
 class ErrorDirectoryError(Win32Error):
-    DESCRIPTION = """The directory name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DIRECTORY
 
 
 class ErrorEasDidntFitError(Win32Error):
-    DESCRIPTION = """The extended attributes did not fit in the buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EAS_DIDNT_FIT
 
 
 class ErrorEaFileCorruptError(Win32Error):
-    DESCRIPTION = """The extended attribute file on the mounted file system is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EA_FILE_CORRUPT
 
 
 class ErrorEaTableFullError(Win32Error):
-    DESCRIPTION = """The extended attribute table file is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EA_TABLE_FULL
 
 
 class ErrorInvalidEaHandleError(Win32Error):
-    DESCRIPTION = """The specified extended attribute handle is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_EA_HANDLE
 
 
 class ErrorEasNotSupportedError(Win32Error):
-    DESCRIPTION = """The mounted file system does not support extended attributes."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EAS_NOT_SUPPORTED
 
 
 class ErrorNotOwnerError(Win32Error):
-    DESCRIPTION = """Attempt to release mutex not owned by caller."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_OWNER
 
 
 class ErrorTooManyPostsError(Win32Error):
-    DESCRIPTION = """Too many posts were made to a semaphore."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_POSTS
 
 
 class ErrorPartialCopyError(Win32Error):
-    DESCRIPTION = """Only part of a ReadProcessMemory or WriteProcessMemory request was completed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PARTIAL_COPY
 
 
 class ErrorOplockNotGrantedError(Win32Error):
-    DESCRIPTION = """The oplock request is denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OPLOCK_NOT_GRANTED
 
 
 class ErrorInvalidOplockProtocolError(Win32Error):
-    DESCRIPTION = """An invalid oplock acknowledgment was received by the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_OPLOCK_PROTOCOL
 
 
 class ErrorDiskTooFragmentedError(Win32Error):
-    DESCRIPTION = """The volume is too fragmented to complete this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_TOO_FRAGMENTED
 
 
 class ErrorDeletePendingError(Win32Error):
-    DESCRIPTION = """The file cannot be opened because it is in the process of being deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DELETE_PENDING
 
 
 class ErrorMrMidNotFoundError(Win32Error):
-    DESCRIPTION = """The system cannot find message text for message number 0x%1 in the message file for %2."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MR_MID_NOT_FOUND
 
 
 class ErrorScopeNotFoundError(Win32Error):
-    DESCRIPTION = """The scope specified was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SCOPE_NOT_FOUND
 
 
 class ErrorFailNoactionRebootError(Win32Error):
-    DESCRIPTION = """No action was taken because a system reboot is required."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAIL_NOACTION_REBOOT
 
 
 class ErrorFailShutdownError(Win32Error):
-    DESCRIPTION = """The shutdown operation failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAIL_SHUTDOWN
 
 
 class ErrorFailRestartError(Win32Error):
-    DESCRIPTION = """The restart operation failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAIL_RESTART
 
 
 class ErrorMaxSessionsReachedError(Win32Error):
-    DESCRIPTION = """The maximum number of sessions has been reached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MAX_SESSIONS_REACHED
 
 
 class ErrorThreadModeAlreadyBackgroundError(Win32Error):
-    DESCRIPTION = """The thread is already in background processing mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_THREAD_MODE_ALREADY_BACKGROUND
 
 
 class ErrorThreadModeNotBackgroundError(Win32Error):
-    DESCRIPTION = """The thread is not in background processing mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_THREAD_MODE_NOT_BACKGROUND
 
 
 class ErrorProcessModeAlreadyBackgroundError(Win32Error):
-    DESCRIPTION = """The process is already in background processing mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROCESS_MODE_ALREADY_BACKGROUND
 
 
 class ErrorProcessModeNotBackgroundError(Win32Error):
-    DESCRIPTION = """The process is not in background processing mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROCESS_MODE_NOT_BACKGROUND
 
 
 class ErrorInvalidAddressError(Win32Error):
-    DESCRIPTION = """Attempt to access invalid address."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ADDRESS
 
 
 class ErrorUserProfileLoadError(Win32Error):
-    DESCRIPTION = """User profile cannot be loaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_USER_PROFILE_LOAD
 
 
 class ErrorArithmeticOverflowError(Win32Error):
-    DESCRIPTION = """Arithmetic result exceeded 32 bits."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ARITHMETIC_OVERFLOW
 
 
 class ErrorPipeConnectedError(Win32Error):
-    DESCRIPTION = """There is a process on the other end of the pipe."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PIPE_CONNECTED
 
 
 class ErrorPipeListeningError(Win32Error):
-    DESCRIPTION = """Waiting for a process to open the other end of the pipe."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PIPE_LISTENING
 
 
 class ErrorVerifierStopError(Win32Error):
-    DESCRIPTION = """Application verifier has found an error in the current process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VERIFIER_STOP
 
 
 class ErrorAbiosErrorError(Win32Error):
-    DESCRIPTION = """An error occurred in the ABIOS subsystem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ABIOS_ERROR
 
 
 class ErrorWx86WarningError(Win32Error):
-    DESCRIPTION = """A warning occurred in the WX86 subsystem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WX86_WARNING
 
 
 class ErrorWx86ErrorError(Win32Error):
-    DESCRIPTION = """An error occurred in the WX86 subsystem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WX86_ERROR
 
 
 class ErrorTimerNotCanceledError(Win32Error):
-    DESCRIPTION = """An attempt was made to cancel or set a timer that has an associated asynchronous procedure call (APC) and the subject thread is not the thread that originally set the timer with an associated APC routine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TIMER_NOT_CANCELED
 
 
 class ErrorUnwindError(Win32Error):
-    DESCRIPTION = """Unwind exception code."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNWIND
 
 
 class ErrorBadStackError(Win32Error):
-    DESCRIPTION = """An invalid or unaligned stack was encountered during an unwind operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_STACK
 
 
 class ErrorInvalidUnwindTargetError(Win32Error):
-    DESCRIPTION = """An invalid unwind target was encountered during an unwind operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_UNWIND_TARGET
 
 
 class ErrorInvalidPortAttributesError(Win32Error):
-    DESCRIPTION = """Invalid object attributes specified to NtCreatePort or invalid port attributes specified to NtConnectPort."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PORT_ATTRIBUTES
 
 
 class ErrorPortMessageTooLongError(Win32Error):
-    DESCRIPTION = """Length of message passed to NtRequestPort or NtRequestWaitReplyPort was longer than the maximum message allowed by the port."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PORT_MESSAGE_TOO_LONG
 
 
 class ErrorInvalidQuotaLowerError(Win32Error):
-    DESCRIPTION = """An attempt was made to lower a quota limit below the current usage."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_QUOTA_LOWER
 
 
 class ErrorDeviceAlreadyAttachedError(Win32Error):
-    DESCRIPTION = """An attempt was made to attach to a device that was already attached to another device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_ALREADY_ATTACHED
 
 
 class ErrorInstructionMisalignmentError(Win32Error):
-    DESCRIPTION = """An attempt was made to execute an instruction at an unaligned address, and the host system does not support unaligned instruction references."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTRUCTION_MISALIGNMENT
 
 
 class ErrorProfilingNotStartedError(Win32Error):
-    DESCRIPTION = """Profiling not started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROFILING_NOT_STARTED
 
 
 class ErrorProfilingNotStoppedError(Win32Error):
-    DESCRIPTION = """Profiling not stopped."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROFILING_NOT_STOPPED
 
 
 class ErrorCouldNotInterpretError(Win32Error):
-    DESCRIPTION = """The passed ACL did not contain the minimum required information."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_COULD_NOT_INTERPRET
 
 
 class ErrorProfilingAtLimitError(Win32Error):
-    DESCRIPTION = """The number of active profiling objects is at the maximum and no more can be started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROFILING_AT_LIMIT
 
 
 class ErrorCantWaitError(Win32Error):
-    DESCRIPTION = """Used to indicate that an operation cannot continue without blocking for I/O."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_WAIT
 
 
 class ErrorCantTerminateSelfError(Win32Error):
-    DESCRIPTION = """Indicates that a thread attempted to terminate itself by default (called NtTerminateThread with NULL) and it was the last thread in the current process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_TERMINATE_SELF
 
 
 class ErrorUnexpectedMmCreateErrError(Win32Error):
-    DESCRIPTION = """If an MM error is returned that is not defined in the standard FsRtl filter, it is converted to one of the following errors that is guaranteed to be in the filter. In this case, information is lost; however, the filter correctly handles the exception."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNEXPECTED_MM_CREATE_ERR
 
 
 class ErrorUnexpectedMmMapErrorError(Win32Error):
-    DESCRIPTION = """If an MM error is returned that is not defined in the standard FsRtl filter, it is converted to one of the following errors that is guaranteed to be in the filter. In this case, information is lost; however, the filter correctly handles the exception."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNEXPECTED_MM_MAP_ERROR
 
 
 class ErrorUnexpectedMmExtendErrError(Win32Error):
-    DESCRIPTION = """If an MM error is returned that is not defined in the standard FsRtl filter, it is converted to one of the following errors that is guaranteed to be in the filter. In this case, information is lost; however, the filter correctly handles the exception."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNEXPECTED_MM_EXTEND_ERR
 
 
 class ErrorBadFunctionTableError(Win32Error):
-    DESCRIPTION = """A malformed function table was encountered during an unwind operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_FUNCTION_TABLE
 
 
 class ErrorNoGuidTranslationError(Win32Error):
-    DESCRIPTION = """Indicates that an attempt was made to assign protection to a file system file or directory and one of the SIDs in the security descriptor could not be translated into a GUID that could be stored by the file system. This causes the protection attempt to fail, which might cause a file creation attempt to fail."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_GUID_TRANSLATION
 
 
 class ErrorInvalidLdtSizeError(Win32Error):
-    DESCRIPTION = """Indicates that an attempt was made to grow a local domain table (LDT) by setting its size, or that the size was not an even number of selectors."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LDT_SIZE
 
 
 class ErrorInvalidLdtOffsetError(Win32Error):
-    DESCRIPTION = """Indicates that the starting value for the LDT information was not an integral multiple of the selector size."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LDT_OFFSET
 
 
 class ErrorInvalidLdtDescriptorError(Win32Error):
-    DESCRIPTION = """Indicates that the user supplied an invalid descriptor when trying to set up LDT descriptors."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LDT_DESCRIPTOR
 
 
 class ErrorTooManyThreadsError(Win32Error):
-    DESCRIPTION = """Indicates a process has too many threads to perform the requested action. For example, assignment of a primary token can be performed only when a process has zero or one threads."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_THREADS
 
 
 class ErrorThreadNotInProcessError(Win32Error):
-    DESCRIPTION = """An attempt was made to operate on a thread within a specific process, but the thread specified is not in the process specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_THREAD_NOT_IN_PROCESS
 
 
 class ErrorPagefileQuotaExceededError(Win32Error):
-    DESCRIPTION = """Page file quota was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGEFILE_QUOTA_EXCEEDED
 
 
 class ErrorLogonServerConflictError(Win32Error):
-    DESCRIPTION = """The Netlogon service cannot start because another Netlogon service running in the domain conflicts with the specified role."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGON_SERVER_CONFLICT
 
 
 class ErrorSynchronizationRequiredError(Win32Error):
-    DESCRIPTION = """On applicable Windows Server releases, the Security Accounts Manager (SAM) database is significantly out of synchronization with the copy on the domain controller. A complete synchronization is required."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYNCHRONIZATION_REQUIRED
 
 
 class ErrorNetOpenFailedError(Win32Error):
-    DESCRIPTION = """The NtCreateFile API failed. This error should never be returned to an application, it is a place holder for the Windows LAN Manager Redirector to use in its internal error mapping routines."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NET_OPEN_FAILED
 
 
 class ErrorIoPrivilegeFailedError(Win32Error):
-    DESCRIPTION = """{Privilege Failed} The I/O permissions for the process could not be changed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IO_PRIVILEGE_FAILED
 
 
 class ErrorControlCExitError(Win32Error):
-    DESCRIPTION = """{Application Exit by CTRL+C} The application terminated as a result of a CTRL+C."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONTROL_C_EXIT
 
 
 class ErrorMissingSystemfileError(Win32Error):
-    DESCRIPTION = """{Missing System File} The required system file %hs is bad or missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MISSING_SYSTEMFILE
 
 
 class ErrorUnhandledExceptionError(Win32Error):
-    DESCRIPTION = """{Application Error} The exception %s (0x%08lx) occurred in the application at location 0x%08lx."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNHANDLED_EXCEPTION
 
 
 class ErrorAppInitFailureError(Win32Error):
-    DESCRIPTION = """{Application Error} The application failed to initialize properly (0x%lx). Click OK to terminate the application."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_APP_INIT_FAILURE
 
 
 class ErrorPagefileCreateFailedError(Win32Error):
-    DESCRIPTION = """{Unable to Create Paging File} The creation of the paging file %hs failed (%lx). The requested size was %ld."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGEFILE_CREATE_FAILED
 
 
 class ErrorInvalidImageHashError(Win32Error):
-    DESCRIPTION = """The hash for the image cannot be found in the system catalogs. The image is likely corrupt or the victim of tampering."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_IMAGE_HASH
 
 
 class ErrorNoPagefileError(Win32Error):
-    DESCRIPTION = """{No Paging File Specified} No paging file was specified in the system configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_PAGEFILE
 
 
 class ErrorIllegalFloatContextError(Win32Error):
-    DESCRIPTION = """{EXCEPTION} A real-mode application issued a floating-point instruction, and floating-point hardware is not present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ILLEGAL_FLOAT_CONTEXT
 
 
 class ErrorNoEventPairError(Win32Error):
-    DESCRIPTION = """An event pair synchronization operation was performed using the thread-specific client/server event pair object, but no event pair object was associated with the thread."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_EVENT_PAIR
 
 
 class ErrorDomainCtrlrConfigErrorError(Win32Error):
-    DESCRIPTION = """A domain server has an incorrect configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DOMAIN_CTRLR_CONFIG_ERROR
 
 
 class ErrorIllegalCharacterError(Win32Error):
-    DESCRIPTION = """An illegal character was encountered. For a multibyte character set, this includes a lead byte without a succeeding trail byte. For the Unicode character set, this includes the characters 0xFFFF and 0xFFFE."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ILLEGAL_CHARACTER
 
 
 class ErrorUndefinedCharacterError(Win32Error):
-    DESCRIPTION = """The Unicode character is not defined in the Unicode character set installed on the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNDEFINED_CHARACTER
 
 
 class ErrorFloppyVolumeError(Win32Error):
-    DESCRIPTION = """The paging file cannot be created on a floppy disk."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOPPY_VOLUME
 
 
 class ErrorBiosFailedToConnectInterruptError(Win32Error):
-    DESCRIPTION = """The system bios failed to connect a system interrupt to the device or bus for which the device is connected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BIOS_FAILED_TO_CONNECT_INTERRUPT
 
 
 class ErrorBackupControllerError(Win32Error):
-    DESCRIPTION = """This operation is only allowed for the primary domain controller (PDC) of the domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BACKUP_CONTROLLER
 
 
 class ErrorMutantLimitExceededError(Win32Error):
-    DESCRIPTION = """An attempt was made to acquire a mutant such that its maximum count would have been exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUTANT_LIMIT_EXCEEDED
 
 
 class ErrorFsDriverRequiredError(Win32Error):
-    DESCRIPTION = """A volume has been accessed for which a file system driver is required that has not yet been loaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FS_DRIVER_REQUIRED
 
 
 class ErrorCannotLoadRegistryFileError(Win32Error):
-    DESCRIPTION = """{Registry File Failure} The registry cannot load the hive (file): %hs or its log or alternate. It is corrupt, absent, or not writable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_LOAD_REGISTRY_FILE
 
 
 class ErrorDebugAttachFailedError(Win32Error):
-    DESCRIPTION = """{Unexpected Failure in DebugActiveProcess} An unexpected failure occurred while processing a DebugActiveProcess API request. Choosing OK will terminate the process, and choosing Cancel will ignore the error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEBUG_ATTACH_FAILED
 
 
 class ErrorSystemProcessTerminatedError(Win32Error):
-    DESCRIPTION = """{Fatal System Error} The %hs system process terminated unexpectedly with a status of 0x%08x (0x%08x 0x%08x). The system has been shut down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_PROCESS_TERMINATED
 
 
 class ErrorDataNotAcceptedError(Win32Error):
-    DESCRIPTION = """{Data Not Accepted} The transport driver interface (TDI) client could not handle the data received during an indication."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DATA_NOT_ACCEPTED
 
 
 class ErrorVdmHardErrorError(Win32Error):
-    DESCRIPTION = """The NT Virtual DOS Machine (NTVDM) encountered a hard error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VDM_HARD_ERROR
 
 
 class ErrorDriverCancelTimeoutError(Win32Error):
-    DESCRIPTION = """{Cancel Timeout} The driver %hs failed to complete a canceled I/O request in the allotted time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVER_CANCEL_TIMEOUT
 
 
 class ErrorReplyMessageMismatchError(Win32Error):
-    DESCRIPTION = """{Reply Message Mismatch} An attempt was made to reply to a local procedure call (LPC) message, but the thread specified by the client ID in the message was not waiting on that message."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REPLY_MESSAGE_MISMATCH
 
 
 class ErrorLostWritebehindDataError(Win32Error):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs. The data has been lost. This error might be caused by a failure of your computer hardware or network connection. Try to save this file elsewhere."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOST_WRITEBEHIND_DATA
 
 
 class ErrorClientServerParametersInvalidError(Win32Error):
-    DESCRIPTION = """The parameters passed to the server in the client/server shared memory window were invalid. Too much data might have been put in the shared memory window."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLIENT_SERVER_PARAMETERS_INVALID
 
 
 class ErrorNotTinyStreamError(Win32Error):
-    DESCRIPTION = """The stream is not a tiny stream."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_TINY_STREAM
 
 
 class ErrorStackOverflowReadError(Win32Error):
-    DESCRIPTION = """The request must be handled by the stack overflow code."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_STACK_OVERFLOW_READ
 
 
 class ErrorConvertToLargeError(Win32Error):
-    DESCRIPTION = """Internal OFS status codes indicating how an allocation operation is handled. Either it is retried after the containing onode is moved or the extent stream is converted to a large stream."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONVERT_TO_LARGE
 
 
 class ErrorFoundOutOfScopeError(Win32Error):
-    DESCRIPTION = """The attempt to find the object found an object matching by ID on the volume but it is out of the scope of the handle used for the operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FOUND_OUT_OF_SCOPE
 
 
 class ErrorAllocateBucketError(Win32Error):
-    DESCRIPTION = """The bucket array must be grown. Retry transaction after doing so."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALLOCATE_BUCKET
 
 
 class ErrorMarshallOverflowError(Win32Error):
-    DESCRIPTION = """The user/kernel marshaling buffer has overflowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MARSHALL_OVERFLOW
 
 
 class ErrorInvalidVariantError(Win32Error):
-    DESCRIPTION = """The supplied variant structure contains invalid data."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_VARIANT
 
 
 class ErrorBadCompressionBufferError(Win32Error):
-    DESCRIPTION = """The specified buffer contains ill-formed data."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_COMPRESSION_BUFFER
 
 
 class ErrorAuditFailedError(Win32Error):
-    DESCRIPTION = """{Audit Failed} An attempt to generate a security audit failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_AUDIT_FAILED
 
 
 class ErrorTimerResolutionNotSetError(Win32Error):
-    DESCRIPTION = """The timer resolution was not previously set by the current process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TIMER_RESOLUTION_NOT_SET
 
 
 class ErrorInsufficientLogonInfoError(Win32Error):
-    DESCRIPTION = """There is insufficient account information to log you on."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSUFFICIENT_LOGON_INFO
 
 
 class ErrorBadDllEntrypointError(Win32Error):
-    DESCRIPTION = """{Invalid DLL Entrypoint} The dynamic link library %hs is not written correctly. The stack pointer has been left in an inconsistent state. The entry point should be declared as WINAPI or STDCALL. Select YES to fail the DLL load. Select NO to continue execution. Selecting NO can cause the application to operate incorrectly."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_DLL_ENTRYPOINT
 
 
 class ErrorBadServiceEntrypointError(Win32Error):
-    DESCRIPTION = """{Invalid Service Callback Entrypoint} The %hs service is not written correctly. The stack pointer has been left in an inconsistent state. The callback entry point should be declared as WINAPI or STDCALL. Selecting OK will cause the service to continue operation. However, the service process might operate incorrectly."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_SERVICE_ENTRYPOINT
 
 
 class ErrorIpAddressConflict1Error(Win32Error):
-    DESCRIPTION = """There is an IP address conflict with another system on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IP_ADDRESS_CONFLICT1
 
 
 class ErrorIpAddressConflict2Error(Win32Error):
-    DESCRIPTION = """There is an IP address conflict with another system on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IP_ADDRESS_CONFLICT2
 
 
 class ErrorRegistryQuotaLimitError(Win32Error):
-    DESCRIPTION = """{Low On Registry Space} The system has reached the maximum size allowed for the system part of the registry. Additional storage requests will be ignored."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REGISTRY_QUOTA_LIMIT
 
 
 class ErrorNoCallbackActiveError(Win32Error):
-    DESCRIPTION = """A callback return system service cannot be executed when no callback is active."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_CALLBACK_ACTIVE
 
 
 class ErrorPwdTooShortError(Win32Error):
-    DESCRIPTION = """The password provided is too short to meet the policy of your user account. Choose a longer password."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PWD_TOO_SHORT
 
 
 class ErrorPwdTooRecentError(Win32Error):
-    DESCRIPTION = """The policy of your user account does not allow you to change passwords too frequently. This is done to prevent users from changing back to a familiar, but potentially discovered, password. If you feel your password has been compromised, contact your administrator immediately to have a new one assigned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PWD_TOO_RECENT
 
 
 class ErrorPwdHistoryConflictError(Win32Error):
-    DESCRIPTION = """You have attempted to change your password to one that you have used in the past. The policy of your user account does not allow this. Select a password that you have not previously used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PWD_HISTORY_CONFLICT
 
 
 class ErrorUnsupportedCompressionError(Win32Error):
-    DESCRIPTION = """The specified compression format is unsupported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNSUPPORTED_COMPRESSION
 
 
 class ErrorInvalidHwProfileError(Win32Error):
-    DESCRIPTION = """The specified hardware profile configuration is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_HW_PROFILE
 
 
 class ErrorInvalidPlugplayDevicePathError(Win32Error):
-    DESCRIPTION = """The specified Plug and Play registry device path is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PLUGPLAY_DEVICE_PATH
 
 
 class ErrorQuotaListInconsistentError(Win32Error):
-    DESCRIPTION = """The specified quota list is internally inconsistent with its descriptor."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_QUOTA_LIST_INCONSISTENT
 
 
 class ErrorEvaluationExpirationError(Win32Error):
-    DESCRIPTION = """{Windows Evaluation Notification} The evaluation period for this installation of Windows has expired. This system will shut down in 1 hour. To restore access to this installation of Windows, upgrade this installation using a licensed distribution of this product."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVALUATION_EXPIRATION
 
 
 class ErrorIllegalDllRelocationError(Win32Error):
-    DESCRIPTION = """{Illegal System DLL Relocation} The system DLL %hs was relocated in memory. The application will not run properly. The relocation occurred because the DLL %hs occupied an address range reserved for Windows system DLLs. The vendor supplying the DLL should be contacted for a new DLL."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ILLEGAL_DLL_RELOCATION
 
 
 class ErrorDllInitFailedLogoffError(Win32Error):
-    DESCRIPTION = """{DLL Initialization Failed} The application failed to initialize because the window station is shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DLL_INIT_FAILED_LOGOFF
 
 
 class ErrorValidateContinueError(Win32Error):
-    DESCRIPTION = """The validation process needs to continue on to the next step."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VALIDATE_CONTINUE
 
 
 class ErrorNoMoreMatchesError(Win32Error):
-    DESCRIPTION = """There are no more matches for the current index enumeration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MORE_MATCHES
 
 
 class ErrorRangeListConflictError(Win32Error):
-    DESCRIPTION = """The range could not be added to the range list because of a conflict."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RANGE_LIST_CONFLICT
 
 
 class ErrorServerSidMismatchError(Win32Error):
-    DESCRIPTION = """The server process is running under a SID different than that required by the client."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVER_SID_MISMATCH
 
 
 class ErrorCantEnableDenyOnlyError(Win32Error):
-    DESCRIPTION = """A group marked use for deny only cannot be enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_ENABLE_DENY_ONLY
 
 
 class ErrorFloatMultipleFaultsError(Win32Error):
-    DESCRIPTION = """{EXCEPTION} Multiple floating point faults."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOAT_MULTIPLE_FAULTS
 
 
 class ErrorFloatMultipleTrapsError(Win32Error):
-    DESCRIPTION = """{EXCEPTION} Multiple floating point traps."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOAT_MULTIPLE_TRAPS
 
 
 class ErrorNointerfaceError(Win32Error):
-    DESCRIPTION = """The requested interface is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOINTERFACE
 
 
 class ErrorDriverFailedSleepError(Win32Error):
-    DESCRIPTION = """{System Standby Failed} The driver %hs does not support standby mode. Updating this driver might allow the system to go to standby mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVER_FAILED_SLEEP
 
 
 class ErrorCorruptSystemFileError(Win32Error):
-    DESCRIPTION = """The system file %1 has become corrupt and has been replaced."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CORRUPT_SYSTEM_FILE
 
 
 class ErrorCommitmentMinimumError(Win32Error):
-    DESCRIPTION = """{Virtual Memory Minimum Too Low} Your system is low on virtual memory. Windows is increasing the size of your virtual memory paging file. During this process, memory requests for some applications might be denied. For more information, see Help."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_COMMITMENT_MINIMUM
 
 
 class ErrorPnpRestartEnumerationError(Win32Error):
-    DESCRIPTION = """A device was removed so enumeration must be restarted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PNP_RESTART_ENUMERATION
 
 
 class ErrorSystemImageBadSignatureError(Win32Error):
-    DESCRIPTION = """{Fatal System Error} The system image %s is not properly signed. The file has been replaced with the signed file. The system has been shut down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_IMAGE_BAD_SIGNATURE
 
 
 class ErrorPnpRebootRequiredError(Win32Error):
-    DESCRIPTION = """Device will not start without a reboot."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PNP_REBOOT_REQUIRED
 
 
 class ErrorInsufficientPowerError(Win32Error):
-    DESCRIPTION = """There is not enough power to complete the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSUFFICIENT_POWER
 
 
 class ErrorSystemShutdownError(Win32Error):
-    DESCRIPTION = """The system is in the process of shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_SHUTDOWN
 
 
 class ErrorPortNotSetError(Win32Error):
-    DESCRIPTION = """An attempt to remove a process DebugPort was made, but a port was not already associated with the process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PORT_NOT_SET
 
 
 class ErrorDsVersionCheckFailureError(Win32Error):
-    DESCRIPTION = """This version of Windows is not compatible with the behavior version of directory forest, domain, or domain controller."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_VERSION_CHECK_FAILURE
 
 
 class ErrorRangeNotFoundError(Win32Error):
-    DESCRIPTION = """The specified range could not be found in the range list."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RANGE_NOT_FOUND
 
 
 class ErrorNotSafeModeDriverError(Win32Error):
-    DESCRIPTION = """The driver was not loaded because the system is booting into safe mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SAFE_MODE_DRIVER
 
 
 class ErrorFailedDriverEntryError(Win32Error):
-    DESCRIPTION = """The driver was not loaded because it failed its initialization call."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAILED_DRIVER_ENTRY
 
 
 class ErrorDeviceEnumerationErrorError(Win32Error):
-    DESCRIPTION = """The device encountered an error while applying power or reading the device configuration. This might be caused by a failure of your hardware or by a poor connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_ENUMERATION_ERROR
 
 
 class ErrorMountPointNotResolvedError(Win32Error):
-    DESCRIPTION = """The create operation failed because the name contained at least one mount point that resolves to a volume to which the specified device object is not attached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MOUNT_POINT_NOT_RESOLVED
 
 
 class ErrorInvalidDeviceObjectParameterError(Win32Error):
-    DESCRIPTION = """The device object parameter is either not a valid device object or is not attached to the volume specified by the file name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DEVICE_OBJECT_PARAMETER
 
 
 class ErrorMcaOccuredError(Win32Error):
-    DESCRIPTION = """A machine check error has occurred. Check the system event log for additional information."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_OCCURED
 
 
 class ErrorDriverDatabaseErrorError(Win32Error):
-    DESCRIPTION = """There was an error [%2] processing the driver database."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVER_DATABASE_ERROR
 
 
 class ErrorSystemHiveTooLargeError(Win32Error):
-    DESCRIPTION = """The system hive size has exceeded its limit."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_HIVE_TOO_LARGE
 
 
 class ErrorDriverFailedPriorUnloadError(Win32Error):
-    DESCRIPTION = """The driver could not be loaded because a previous version of the driver is still in memory."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVER_FAILED_PRIOR_UNLOAD
 
 
 class ErrorVolsnapPrepareHibernateError(Win32Error):
-    DESCRIPTION = """{Volume Shadow Copy Service} Wait while the Volume Shadow Copy Service prepares volume %hs for hibernation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VOLSNAP_PREPARE_HIBERNATE
 
 
 class ErrorHibernationFailureError(Win32Error):
-    DESCRIPTION = """The system has failed to hibernate (the error code is %hs). Hibernation will be disabled until the system is restarted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HIBERNATION_FAILURE
 
 
 class ErrorFileSystemLimitationError(Win32Error):
-    DESCRIPTION = """The requested operation could not be completed due to a file system limitation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_SYSTEM_LIMITATION
 
 
 class ErrorAssertionFailureError(Win32Error):
-    DESCRIPTION = """An assertion failure has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ASSERTION_FAILURE
 
 
 class ErrorAcpiErrorError(Win32Error):
-    DESCRIPTION = """An error occurred in the Advanced Configuration and Power Interface (ACPI) subsystem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACPI_ERROR
 
 
 class ErrorWowAssertionError(Win32Error):
-    DESCRIPTION = """WOW assertion error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WOW_ASSERTION
 
 
 class ErrorPnpBadMpsTableError(Win32Error):
-    DESCRIPTION = """A device is missing in the system BIOS MultiProcessor Specification (MPS) table. This device will not be used. Contact your system vendor for system BIOS update."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PNP_BAD_MPS_TABLE
 
 
 class ErrorPnpTranslationFailedError(Win32Error):
-    DESCRIPTION = """A translator failed to translate resources."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PNP_TRANSLATION_FAILED
 
 
 class ErrorPnpIrqTranslationFailedError(Win32Error):
-    DESCRIPTION = """An interrupt request (IRQ) translator failed to translate resources."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PNP_IRQ_TRANSLATION_FAILED
 
 
 class ErrorPnpInvalidIdError(Win32Error):
-    DESCRIPTION = """Driver %2 returned invalid ID for a child device (%3)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PNP_INVALID_ID
 
 
 class ErrorWakeSystemDebuggerError(Win32Error):
-    DESCRIPTION = """{Kernel Debugger Awakened} the system debugger was awakened by an interrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WAKE_SYSTEM_DEBUGGER
 
 
 class ErrorHandlesClosedError(Win32Error):
-    DESCRIPTION = """{Handles Closed} Handles to objects have been automatically closed because of the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HANDLES_CLOSED
 
 
 class ErrorExtraneousInformationError(Win32Error):
-    DESCRIPTION = """{Too Much Information} The specified ACL contained more information than was expected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXTRANEOUS_INFORMATION
 
 
 class ErrorRxactCommitNecessaryError(Win32Error):
-    DESCRIPTION = """This warning level status indicates that the transaction state already exists for the registry subtree, but that a transaction commit was previously aborted. The commit has NOT been completed, but it has not been rolled back either (so it can still be committed if desired)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RXACT_COMMIT_NECESSARY
 
 
 class ErrorMediaCheckError(Win32Error):
-    DESCRIPTION = """{Media Changed} The media might have changed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEDIA_CHECK
 
 
 class ErrorGuidSubstitutionMadeError(Win32Error):
-    DESCRIPTION = """{GUID Substitution} During the translation of a GUID to a Windows SID, no administratively defined GUID prefix was found. A substitute prefix was used, which will not compromise system security. However, this might provide more restrictive access than intended."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GUID_SUBSTITUTION_MADE
 
 
 class ErrorStoppedOnSymlinkError(Win32Error):
-    DESCRIPTION = """The create operation stopped after reaching a symbolic link."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_STOPPED_ON_SYMLINK
 
 
 class ErrorLongjumpError(Win32Error):
-    DESCRIPTION = """A long jump has been executed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LONGJUMP
 
 
 class ErrorPlugplayQueryVetoedError(Win32Error):
-    DESCRIPTION = """The Plug and Play query operation was not successful."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PLUGPLAY_QUERY_VETOED
 
 
 class ErrorUnwindConsolidateError(Win32Error):
-    DESCRIPTION = """A frame consolidation has been executed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNWIND_CONSOLIDATE
 
 
 class ErrorRegistryHiveRecoveredError(Win32Error):
-    DESCRIPTION = """{Registry Hive Recovered} Registry hive (file): %hs was corrupted and it has been recovered. Some data might have been lost."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REGISTRY_HIVE_RECOVERED
 
 
 class ErrorDllMightBeInsecureError(Win32Error):
-    DESCRIPTION = """The application is attempting to run executable code from the module %hs. This might be insecure. An alternative, %hs, is available. Should the application use the secure module %hs?"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DLL_MIGHT_BE_INSECURE
 
 
 class ErrorDllMightBeIncompatibleError(Win32Error):
-    DESCRIPTION = """The application is loading executable code from the module %hs. This is secure, but might be incompatible with previous releases of the operating system. An alternative, %hs, is available. Should the application use the secure module %hs?"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DLL_MIGHT_BE_INCOMPATIBLE
 
 
 class ErrorDbgExceptionNotHandledError(Win32Error):
-    DESCRIPTION = """Debugger did not handle the exception."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_EXCEPTION_NOT_HANDLED
 
 
 class ErrorDbgReplyLaterError(Win32Error):
-    DESCRIPTION = """Debugger will reply later."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_REPLY_LATER
 
 
 class ErrorDbgUnableToProvideHandleError(Win32Error):
-    DESCRIPTION = """Debugger cannot provide handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_UNABLE_TO_PROVIDE_HANDLE
 
 
 class ErrorDbgTerminateThreadError(Win32Error):
-    DESCRIPTION = """Debugger terminated thread."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_TERMINATE_THREAD
 
 
 class ErrorDbgTerminateProcessError(Win32Error):
-    DESCRIPTION = """Debugger terminated process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_TERMINATE_PROCESS
 
 
 class ErrorDbgControlCError(Win32Error):
-    DESCRIPTION = """Debugger got control C."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_CONTROL_C
 
 
 class ErrorDbgPrintexceptionCError(Win32Error):
-    DESCRIPTION = """Debugger printed exception on control C."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_PRINTEXCEPTION_C
 
 
 class ErrorDbgRipexceptionError(Win32Error):
-    DESCRIPTION = """Debugger received Routing Information Protocol (RIP) exception."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_RIPEXCEPTION
 
 
 class ErrorDbgControlBreakError(Win32Error):
-    DESCRIPTION = """Debugger received control break."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_CONTROL_BREAK
 
 
 class ErrorDbgCommandExceptionError(Win32Error):
-    DESCRIPTION = """Debugger command communication exception."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_COMMAND_EXCEPTION
 
 
 class ErrorObjectNameExistsError(Win32Error):
-    DESCRIPTION = """{Object Exists} An attempt was made to create an object and the object name already existed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OBJECT_NAME_EXISTS
 
 
 class ErrorThreadWasSuspendedError(Win32Error):
-    DESCRIPTION = """{Thread Suspended} A thread termination occurred while the thread was suspended. The thread was resumed and termination proceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_THREAD_WAS_SUSPENDED
 
 
 class ErrorImageNotAtBaseError(Win32Error):
-    DESCRIPTION = """{Image Relocated} An image file could not be mapped at the address specified in the image file. Local fixes must be performed on this image."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IMAGE_NOT_AT_BASE
 
 
 class ErrorRxactStateCreatedError(Win32Error):
-    DESCRIPTION = """This informational level status indicates that a specified registry subtree transaction state did not yet exist and had to be created."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RXACT_STATE_CREATED
 
 
 class ErrorSegmentNotificationError(Win32Error):
-    DESCRIPTION = """{Segment Load} A virtual DOS machine (VDM) is loading, unloading, or moving an MS-DOS or Win16 program segment image. An exception is raised so a debugger can load, unload, or track symbols and breakpoints within these 16-bit segments."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SEGMENT_NOTIFICATION
 
 
 class ErrorBadCurrentDirectoryError(Win32Error):
-    DESCRIPTION = """{Invalid Current Directory} The process cannot switch to the startup current directory %hs. Select OK to set current directory to %hs, or select CANCEL to exit."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_CURRENT_DIRECTORY
 
 
 class ErrorFtReadRecoveryFromBackupError(Win32Error):
-    DESCRIPTION = """{Redundant Read} To satisfy a read request, the NT fault-tolerant file system successfully read the requested data from a redundant copy. This was done because the file system encountered a failure on a member of the fault-tolerant volume, but it was unable to reassign the failing area of the device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FT_READ_RECOVERY_FROM_BACKUP
 
 
 class ErrorFtWriteRecoveryError(Win32Error):
-    DESCRIPTION = """{Redundant Write} To satisfy a write request, the Windows NT operating system fault-tolerant file system successfully wrote a redundant copy of the information. This was done because the file system encountered a failure on a member of the fault-tolerant volume, but it was not able to reassign the failing area of the device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FT_WRITE_RECOVERY
 
 
 class ErrorImageMachineTypeMismatchError(Win32Error):
-    DESCRIPTION = """{Machine Type Mismatch} The image file %hs is valid, but is for a machine type other than the current machine. Select OK to continue, or CANCEL to fail the DLL load."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IMAGE_MACHINE_TYPE_MISMATCH
 
 
 class ErrorReceivePartialError(Win32Error):
-    DESCRIPTION = """{Partial Data Received} The network transport returned partial data to its client. The remaining data will be sent later."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RECEIVE_PARTIAL
 
 
 class ErrorReceiveExpeditedError(Win32Error):
-    DESCRIPTION = """{Expedited Data Received} The network transport returned data to its client that was marked as expedited by the remote system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RECEIVE_EXPEDITED
 
 
 class ErrorReceivePartialExpeditedError(Win32Error):
-    DESCRIPTION = """{Partial Expedited Data Received} The network transport returned partial data to its client and this data was marked as expedited by the remote system. The remaining data will be sent later."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RECEIVE_PARTIAL_EXPEDITED
 
 
 class ErrorEventDoneError(Win32Error):
-    DESCRIPTION = """{TDI Event Done} The TDI indication has completed successfully."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVENT_DONE
 
 
 class ErrorEventPendingError(Win32Error):
-    DESCRIPTION = """{TDI Event Pending} The TDI indication has entered the pending state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVENT_PENDING
 
 
 class ErrorCheckingFileSystemError(Win32Error):
-    DESCRIPTION = """Checking file system on %wZ."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CHECKING_FILE_SYSTEM
 
 
 class ErrorFatalAppExitError(Win32Error):
-    DESCRIPTION = """{Fatal Application Exit} %hs."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FATAL_APP_EXIT
 
 
 class ErrorPredefinedHandleError(Win32Error):
-    DESCRIPTION = """The specified registry key is referenced by a predefined handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PREDEFINED_HANDLE
 
 
 class ErrorWasUnlockedError(Win32Error):
-    DESCRIPTION = """{Page Unlocked} The page protection of a locked page was changed to 'No Access' and the page was unlocked from memory and from the process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WAS_UNLOCKED
 
 
 class ErrorWasLockedError(Win32Error):
-    DESCRIPTION = """{Page Locked} One of the pages to lock was already locked."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WAS_LOCKED
 
 
 class ErrorAlreadyWin32Error(Win32Error):
-    DESCRIPTION = """The value already corresponds with a Win 32 error code."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_WIN32
 
 
 class ErrorImageMachineTypeMismatchExeError(Win32Error):
-    DESCRIPTION = """{Machine Type Mismatch} The image file %hs is valid, but is for a machine type other than the current machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IMAGE_MACHINE_TYPE_MISMATCH_EXE
 
 
 class ErrorNoYieldPerformedError(Win32Error):
-    DESCRIPTION = """A yield execution was performed and no thread was available to run."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_YIELD_PERFORMED
 
 
 class ErrorTimerResumeIgnoredError(Win32Error):
-    DESCRIPTION = """The resume flag to a timer API was ignored."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TIMER_RESUME_IGNORED
 
 
 class ErrorArbitrationUnhandledError(Win32Error):
-    DESCRIPTION = """The arbiter has deferred arbitration of these resources to its parent."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ARBITRATION_UNHANDLED
 
 
 class ErrorCardbusNotSupportedError(Win32Error):
-    DESCRIPTION = """The inserted CardBus device cannot be started because of a configuration error on %hs\".\""""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CARDBUS_NOT_SUPPORTED
 
 
 class ErrorMpProcessorMismatchError(Win32Error):
-    DESCRIPTION = """The CPUs in this multiprocessor system are not all the same revision level. To use all processors the operating system restricts itself to the features of the least capable processor in the system. If problems occur with this system, contact the CPU manufacturer to see if this mix of processors is supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MP_PROCESSOR_MISMATCH
 
 
 class ErrorHibernatedError(Win32Error):
-    DESCRIPTION = """The system was put into hibernation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HIBERNATED
 
 
 class ErrorResumeHibernationError(Win32Error):
-    DESCRIPTION = """The system was resumed from hibernation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESUME_HIBERNATION
 
 
 class ErrorFirmwareUpdatedError(Win32Error):
-    DESCRIPTION = """Windows has detected that the system firmware (BIOS) was updated (previous firmware date = %2, current firmware date %3)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FIRMWARE_UPDATED
 
 
 class ErrorDriversLeakingLockedPagesError(Win32Error):
-    DESCRIPTION = """A device driver is leaking locked I/O pages, causing system degradation. The system has automatically enabled a tracking code to try and catch the culprit."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVERS_LEAKING_LOCKED_PAGES
 
 
 class ErrorWakeSystemError(Win32Error):
-    DESCRIPTION = """The system has awoken."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WAKE_SYSTEM
 
 
 class ErrorAbandonedWait0Error(Win32Error):
-    DESCRIPTION = """The call failed because the handle associated with it was closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ABANDONED_WAIT_0
 
 
 class ErrorElevationRequiredError(Win32Error):
-    DESCRIPTION = """The requested operation requires elevation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ELEVATION_REQUIRED
 
 
 class ErrorReparseError(Win32Error):
-    DESCRIPTION = """A reparse should be performed by the object manager because the name of the file resulted in a symbolic link."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REPARSE
 
 
 class ErrorOplockBreakInProgressError(Win32Error):
-    DESCRIPTION = """An open/create operation completed while an oplock break is underway."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OPLOCK_BREAK_IN_PROGRESS
 
 
 class ErrorVolumeMountedError(Win32Error):
-    DESCRIPTION = """A new volume has been mounted by a file system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VOLUME_MOUNTED
 
 
 class ErrorRxactCommittedError(Win32Error):
-    DESCRIPTION = """This success level status indicates that the transaction state already exists for the registry subtree, but that a transaction commit was previously aborted. The commit has now been completed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RXACT_COMMITTED
 
 
 class ErrorNotifyCleanupError(Win32Error):
-    DESCRIPTION = """This indicates that a notify change request has been completed due to closing the handle which made the notify change request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOTIFY_CLEANUP
 
 
 class ErrorPrimaryTransportConnectFailedError(Win32Error):
-    DESCRIPTION = """{Connect Failure on Primary Transport} An attempt was made to connect to the remote server %hs on the primary transport, but the connection failed. The computer was able to connect on a secondary transport."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRIMARY_TRANSPORT_CONNECT_FAILED
 
 
 class ErrorPageFaultTransitionError(Win32Error):
-    DESCRIPTION = """Page fault was a transition fault."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGE_FAULT_TRANSITION
 
 
 class ErrorPageFaultDemandZeroError(Win32Error):
-    DESCRIPTION = """Page fault was a demand zero fault."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGE_FAULT_DEMAND_ZERO
 
 
 class ErrorPageFaultCopyOnWriteError(Win32Error):
-    DESCRIPTION = """Page fault was a demand zero fault."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGE_FAULT_COPY_ON_WRITE
 
 
 class ErrorPageFaultGuardPageError(Win32Error):
-    DESCRIPTION = """Page fault was a demand zero fault."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGE_FAULT_GUARD_PAGE
 
 
 class ErrorPageFaultPagingFileError(Win32Error):
-    DESCRIPTION = """Page fault was satisfied by reading from a secondary storage device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGE_FAULT_PAGING_FILE
 
 
 class ErrorCachePageLockedError(Win32Error):
-    DESCRIPTION = """Cached page was locked during operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CACHE_PAGE_LOCKED
 
 
 class ErrorCrashDumpError(Win32Error):
-    DESCRIPTION = """Crash dump exists in paging file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CRASH_DUMP
 
 
 class ErrorBufferAllZerosError(Win32Error):
-    DESCRIPTION = """Specified buffer contains all zeros."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BUFFER_ALL_ZEROS
 
 
 class ErrorReparseObjectError(Win32Error):
-    DESCRIPTION = """A reparse should be performed by the object manager because the name of the file resulted in a symbolic link."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REPARSE_OBJECT
 
 
 class ErrorResourceRequirementsChangedError(Win32Error):
-    DESCRIPTION = """The device has succeeded a query-stop and its resource requirements have changed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_REQUIREMENTS_CHANGED
 
 
 class ErrorTranslationCompleteError(Win32Error):
-    DESCRIPTION = """The translator has translated these resources into the global space and no further translations should be performed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSLATION_COMPLETE
 
 
 class ErrorNothingToTerminateError(Win32Error):
-    DESCRIPTION = """A process being terminated has no threads to terminate."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOTHING_TO_TERMINATE
 
 
 class ErrorProcessNotInJobError(Win32Error):
-    DESCRIPTION = """The specified process is not part of a job."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROCESS_NOT_IN_JOB
 
 
 class ErrorProcessInJobError(Win32Error):
-    DESCRIPTION = """The specified process is part of a job."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROCESS_IN_JOB
 
 
 class ErrorVolsnapHibernateReadyError(Win32Error):
-    DESCRIPTION = """{Volume Shadow Copy Service} The system is now ready for hibernation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VOLSNAP_HIBERNATE_READY
 
 
 class ErrorFsfilterOpCompletedSuccessfullyError(Win32Error):
-    DESCRIPTION = """A file system or file system filter driver has successfully completed an FsFilter operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FSFILTER_OP_COMPLETED_SUCCESSFULLY
 
 
 class ErrorInterruptVectorAlreadyConnectedError(Win32Error):
-    DESCRIPTION = """The specified interrupt vector was already connected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INTERRUPT_VECTOR_ALREADY_CONNECTED
 
 
 class ErrorInterruptStillConnectedError(Win32Error):
-    DESCRIPTION = """The specified interrupt vector is still connected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INTERRUPT_STILL_CONNECTED
 
 
 class ErrorWaitForOplockError(Win32Error):
-    DESCRIPTION = """An operation is blocked waiting for an oplock."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WAIT_FOR_OPLOCK
 
 
 class ErrorDbgExceptionHandledError(Win32Error):
-    DESCRIPTION = """Debugger handled exception."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_EXCEPTION_HANDLED
 
 
 class ErrorDbgContinueError(Win32Error):
-    DESCRIPTION = """Debugger continued."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DBG_CONTINUE
 
 
 class ErrorCallbackPopStackError(Win32Error):
-    DESCRIPTION = """An exception occurred in a user mode callback and the kernel callback frame should be removed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CALLBACK_POP_STACK
 
 
 class ErrorCompressionDisabledError(Win32Error):
-    DESCRIPTION = """Compression is disabled for this volume."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_COMPRESSION_DISABLED
 
 
 class ErrorCantfetchbackwardsError(Win32Error):
-    DESCRIPTION = """The data provider cannot fetch backward through a result set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANTFETCHBACKWARDS
 
 
 class ErrorCantscrollbackwardsError(Win32Error):
-    DESCRIPTION = """The data provider cannot scroll backward through a result set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANTSCROLLBACKWARDS
 
 
 class ErrorRowsnotreleasedError(Win32Error):
-    DESCRIPTION = """The data provider requires that previously fetched data is released before asking for more data."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ROWSNOTRELEASED
 
 
 class ErrorBadAccessorFlagsError(Win32Error):
-    DESCRIPTION = """The data provider was not able to interpret the flags set for a column binding in an accessor."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_ACCESSOR_FLAGS
 
 
 class ErrorErrorsEncounteredError(Win32Error):
-    DESCRIPTION = """One or more errors occurred while processing the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ERRORS_ENCOUNTERED
 
 
 class ErrorNotCapableError(Win32Error):
-    DESCRIPTION = """The implementation is not capable of performing the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_CAPABLE
 
 
 class ErrorRequestOutOfSequenceError(Win32Error):
-    DESCRIPTION = """The client of a component requested an operation that is not valid given the state of the component instance."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REQUEST_OUT_OF_SEQUENCE
 
 
 class ErrorVersionParseErrorError(Win32Error):
-    DESCRIPTION = """A version number could not be parsed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VERSION_PARSE_ERROR
 
 
 class ErrorBadstartpositionError(Win32Error):
-    DESCRIPTION = """The iterator's start position is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BADSTARTPOSITION
 
 
 class ErrorMemoryHardwareError(Win32Error):
-    DESCRIPTION = """The hardware has reported an uncorrectable memory error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEMORY_HARDWARE
 
 
 class ErrorDiskRepairDisabledError(Win32Error):
-    DESCRIPTION = """The attempted operation required self-healing to be enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_REPAIR_DISABLED
 
 
 class ErrorInsufficientResourceForSpecifiedSharedSectionSizeError(Win32Error):
-    DESCRIPTION = """The Desktop heap encountered an error while allocating session memory. There is more information in the system event log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSUFFICIENT_RESOURCE_FOR_SPECIFIED_SHARED_SECTION_SIZE
 
 
 class ErrorSystemPowerstateTransitionError(Win32Error):
-    DESCRIPTION = """The system power state is transitioning from %2 to %3."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_POWERSTATE_TRANSITION
 
 
 class ErrorSystemPowerstateComplexTransitionError(Win32Error):
-    DESCRIPTION = """The system power state is transitioning from %2 to %3 but could enter %4."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_POWERSTATE_COMPLEX_TRANSITION
 
 
 class ErrorMcaExceptionError(Win32Error):
-    DESCRIPTION = """A thread is getting dispatched with MCA EXCEPTION because of MCA."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_EXCEPTION
 
 
 class ErrorAccessAuditByPolicyError(Win32Error):
-    DESCRIPTION = """Access to %1 is monitored by policy rule %2."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCESS_AUDIT_BY_POLICY
 
 
 class ErrorAccessDisabledNoSaferUiByPolicyError(Win32Error):
-    DESCRIPTION = """Access to %1 has been restricted by your administrator by policy rule %2."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCESS_DISABLED_NO_SAFER_UI_BY_POLICY
 
 
 class ErrorAbandonHiberfileError(Win32Error):
-    DESCRIPTION = """A valid hibernation file has been invalidated and should be abandoned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ABANDON_HIBERFILE
 
 
 class ErrorLostWritebehindDataNetworkDisconnectedError(Win32Error):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs; the data has been lost. This error can be caused by network connectivity issues. Try to save this file elsewhere."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOST_WRITEBEHIND_DATA_NETWORK_DISCONNECTED
 
 
 class ErrorLostWritebehindDataNetworkServerErrorError(Win32Error):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs; the data has been lost. This error was returned by the server on which the file exists. Try to save this file elsewhere."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOST_WRITEBEHIND_DATA_NETWORK_SERVER_ERROR
 
 
 class ErrorLostWritebehindDataLocalDiskErrorError(Win32Error):
-    DESCRIPTION = """{Delayed Write Failed} Windows was unable to save all the data for the file %hs; the data has been lost. This error can be caused if the device has been removed or the media is write-protected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOST_WRITEBEHIND_DATA_LOCAL_DISK_ERROR
 
 
 class ErrorEaAccessDeniedError(Win32Error):
-    DESCRIPTION = """Access to the extended attribute was denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EA_ACCESS_DENIED
 
 
 class ErrorOperationAbortedError(Win32Error):
-    DESCRIPTION = """The I/O operation has been aborted because of either a thread exit or an application request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OPERATION_ABORTED
 
 
 class ErrorIoIncompleteError(Win32Error):
-    DESCRIPTION = """Overlapped I/O event is not in a signaled state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IO_INCOMPLETE
 
 
 class ErrorIoPendingError(Win32Error):
-    DESCRIPTION = """Overlapped I/O operation is in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IO_PENDING
 
 
 class ErrorNoaccessError(Win32Error):
-    DESCRIPTION = """Invalid access to memory location."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOACCESS
 
 
 class ErrorSwaperrorError(Win32Error):
-    DESCRIPTION = """Error performing in-page operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SWAPERROR
 
 
 class ErrorStackOverflowError(Win32Error):
-    DESCRIPTION = """Recursion too deep; the stack overflowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_STACK_OVERFLOW
 
 
 class ErrorInvalidMessageError(Win32Error):
-    DESCRIPTION = """The window cannot act on the sent message."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MESSAGE
 
 
 class ErrorCanNotCompleteError(Win32Error):
-    DESCRIPTION = """Cannot complete this function."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CAN_NOT_COMPLETE
 
 
 class ErrorInvalidFlagsError(Win32Error):
-    DESCRIPTION = """Invalid flags."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_FLAGS
 
 
 class ErrorUnrecognizedVolumeError(Win32Error):
-    DESCRIPTION = """The volume does not contain a recognized file system. Be sure that all required file system drivers are loaded and that the volume is not corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNRECOGNIZED_VOLUME
 
 
 class ErrorFileInvalidError(Win32Error):
-    DESCRIPTION = """The volume for a file has been externally altered so that the opened file is no longer valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_INVALID
 
 
 class ErrorFullscreenModeError(Win32Error):
-    DESCRIPTION = """The requested operation cannot be performed in full-screen mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FULLSCREEN_MODE
 
 
 class ErrorNoTokenError(Win32Error):
-    DESCRIPTION = """An attempt was made to reference a token that does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_TOKEN
 
 
 class ErrorBaddbError(Win32Error):
-    DESCRIPTION = """The configuration registry database is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BADDB
 
 
 class ErrorBadkeyError(Win32Error):
-    DESCRIPTION = """The configuration registry key is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BADKEY
 
 
 class ErrorCantopenError(Win32Error):
-    DESCRIPTION = """The configuration registry key could not be opened."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANTOPEN
 
 
 class ErrorCantreadError(Win32Error):
-    DESCRIPTION = """The configuration registry key could not be read."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANTREAD
 
 
 class ErrorCantwriteError(Win32Error):
-    DESCRIPTION = """The configuration registry key could not be written."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANTWRITE
 
 
 class ErrorRegistryRecoveredError(Win32Error):
-    DESCRIPTION = """One of the files in the registry database had to be recovered by use of a log or alternate copy. The recovery was successful."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REGISTRY_RECOVERED
 
 
 class ErrorRegistryCorruptError(Win32Error):
-    DESCRIPTION = """The registry is corrupted. The structure of one of the files containing registry data is corrupted, or the system's memory image of the file is corrupted, or the file could not be recovered because the alternate copy or log was absent or corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REGISTRY_CORRUPT
 
 
 class ErrorRegistryIoFailedError(Win32Error):
-    DESCRIPTION = """An I/O operation initiated by the registry failed and cannot be recovered. The registry could not read in, write out, or flush one of the files that contain the system's image of the registry."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REGISTRY_IO_FAILED
 
 
 class ErrorNotRegistryFileError(Win32Error):
-    DESCRIPTION = """The system attempted to load or restore a file into the registry, but the specified file is not in a registry file format."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_REGISTRY_FILE
 
 
 class ErrorKeyDeletedError(Win32Error):
-    DESCRIPTION = """Illegal operation attempted on a registry key that has been marked for deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_KEY_DELETED
 
 
 class ErrorNoLogSpaceError(Win32Error):
-    DESCRIPTION = """System could not allocate the required space in a registry log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_LOG_SPACE
 
 
 class ErrorKeyHasChildrenError(Win32Error):
-    DESCRIPTION = """Cannot create a symbolic link in a registry key that already has subkeys or values."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_KEY_HAS_CHILDREN
 
 
 class ErrorChildMustBeVolatileError(Win32Error):
-    DESCRIPTION = """Cannot create a stable subkey under a volatile parent key."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CHILD_MUST_BE_VOLATILE
 
 
 class ErrorNotifyEnumDirError(Win32Error):
-    DESCRIPTION = """A notify change request is being completed and the information is not being returned in the caller's buffer. The caller now needs to enumerate the files to find the changes."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOTIFY_ENUM_DIR
 
 
 class ErrorDependentServicesRunningError(Win32Error):
-    DESCRIPTION = """A stop control has been sent to a service that other running services are dependent on."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEPENDENT_SERVICES_RUNNING
 
 
 class ErrorInvalidServiceControlError(Win32Error):
-    DESCRIPTION = """The requested control is not valid for this service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SERVICE_CONTROL
 
 
 class ErrorServiceRequestTimeoutError(Win32Error):
-    DESCRIPTION = """The service did not respond to the start or control request in a timely fashion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_REQUEST_TIMEOUT
 
 
 class ErrorServiceNoThreadError(Win32Error):
-    DESCRIPTION = """A thread could not be created for the service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_NO_THREAD
 
 
 class ErrorServiceDatabaseLockedError(Win32Error):
-    DESCRIPTION = """The service database is locked."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_DATABASE_LOCKED
 
 
 class ErrorServiceAlreadyRunningError(Win32Error):
-    DESCRIPTION = """An instance of the service is already running."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_ALREADY_RUNNING
 
 
 class ErrorInvalidServiceAccountError(Win32Error):
-    DESCRIPTION = """The account name is invalid or does not exist, or the password is invalid for the account name specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SERVICE_ACCOUNT
 
 
 class ErrorServiceDisabledError(Win32Error):
-    DESCRIPTION = """The service cannot be started, either because it is disabled or because it has no enabled devices associated with it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_DISABLED
 
 
 class ErrorCircularDependencyError(Win32Error):
-    DESCRIPTION = """Circular service dependency was specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CIRCULAR_DEPENDENCY
 
 
 class ErrorServiceDoesNotExistError(Win32Error):
-    DESCRIPTION = """The specified service does not exist as an installed service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_DOES_NOT_EXIST
 
 
 class ErrorServiceCannotAcceptCtrlError(Win32Error):
-    DESCRIPTION = """The service cannot accept control messages at this time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_CANNOT_ACCEPT_CTRL
 
 
 class ErrorServiceNotActiveError(Win32Error):
-    DESCRIPTION = """The service has not been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_NOT_ACTIVE
 
 
 class ErrorFailedServiceControllerConnectError(Win32Error):
-    DESCRIPTION = """The service process could not connect to the service controller."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAILED_SERVICE_CONTROLLER_CONNECT
 
 
 class ErrorExceptionInServiceError(Win32Error):
-    DESCRIPTION = """An exception occurred in the service when handling the control request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXCEPTION_IN_SERVICE
 
 
 class ErrorDatabaseDoesNotExistError(Win32Error):
-    DESCRIPTION = """The database specified does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DATABASE_DOES_NOT_EXIST
 
 
 class ErrorServiceSpecificErrorError(Win32Error):
-    DESCRIPTION = """The service has returned a service-specific error code."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_SPECIFIC_ERROR
 
 
 class ErrorProcessAbortedError(Win32Error):
-    DESCRIPTION = """The process terminated unexpectedly."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROCESS_ABORTED
 
 
 class ErrorServiceDependencyFailError(Win32Error):
-    DESCRIPTION = """The dependency service or group failed to start."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_DEPENDENCY_FAIL
 
 
 class ErrorServiceLogonFailedError(Win32Error):
-    DESCRIPTION = """The service did not start due to a logon failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_LOGON_FAILED
 
 
 class ErrorServiceStartHangError(Win32Error):
-    DESCRIPTION = """After starting, the service stopped responding in a start-pending state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_START_HANG
 
 
 class ErrorInvalidServiceLockError(Win32Error):
-    DESCRIPTION = """The specified service database lock is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SERVICE_LOCK
 
 
 class ErrorServiceMarkedForDeleteError(Win32Error):
-    DESCRIPTION = """The specified service has been marked for deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_MARKED_FOR_DELETE
 
 
 class ErrorServiceExistsError(Win32Error):
-    DESCRIPTION = """The specified service already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_EXISTS
 
 
 class ErrorAlreadyRunningLkgError(Win32Error):
-    DESCRIPTION = """The system is currently running with the last-known-good configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_RUNNING_LKG
 
 
 class ErrorServiceDependencyDeletedError(Win32Error):
-    DESCRIPTION = """The dependency service does not exist or has been marked for deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_DEPENDENCY_DELETED
 
 
 class ErrorBootAlreadyAcceptedError(Win32Error):
-    DESCRIPTION = """The current boot has already been accepted for use as the last-known-good control set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BOOT_ALREADY_ACCEPTED
 
 
 class ErrorServiceNeverStartedError(Win32Error):
-    DESCRIPTION = """No attempts to start the service have been made since the last boot."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_NEVER_STARTED
 
 
 class ErrorDuplicateServiceNameError(Win32Error):
-    DESCRIPTION = """The name is already in use as either a service name or a service display name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DUPLICATE_SERVICE_NAME
 
 
 class ErrorDifferentServiceAccountError(Win32Error):
-    DESCRIPTION = """The account specified for this service is different from the account specified for other services running in the same process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DIFFERENT_SERVICE_ACCOUNT
 
 
 class ErrorCannotDetectDriverFailureError(Win32Error):
-    DESCRIPTION = """Failure actions can only be set for Win32 services, not for drivers."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_DETECT_DRIVER_FAILURE
 
 
 class ErrorCannotDetectProcessAbortError(Win32Error):
-    DESCRIPTION = """This service runs in the same process as the service control manager. Therefore, the service control manager cannot take action if this service's process terminates unexpectedly."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_DETECT_PROCESS_ABORT
 
 
 class ErrorNoRecoveryProgramError(Win32Error):
-    DESCRIPTION = """No recovery program has been configured for this service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_RECOVERY_PROGRAM
 
 
 class ErrorServiceNotInExeError(Win32Error):
-    DESCRIPTION = """The executable program that this service is configured to run in does not implement the service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_NOT_IN_EXE
 
 
 class ErrorNotSafebootServiceError(Win32Error):
-    DESCRIPTION = """This service cannot be started in Safe Mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SAFEBOOT_SERVICE
 
 
 class ErrorEndOfMediaError(Win32Error):
-    DESCRIPTION = """The physical end of the tape has been reached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_END_OF_MEDIA
 
 
 class ErrorFilemarkDetectedError(Win32Error):
-    DESCRIPTION = """A tape access reached a filemark."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILEMARK_DETECTED
 
 
 class ErrorBeginningOfMediaError(Win32Error):
-    DESCRIPTION = """The beginning of the tape or a partition was encountered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BEGINNING_OF_MEDIA
 
 
 class ErrorSetmarkDetectedError(Win32Error):
-    DESCRIPTION = """A tape access reached the end of a set of files."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SETMARK_DETECTED
 
 
 class ErrorNoDataDetectedError(Win32Error):
-    DESCRIPTION = """No more data is on the tape."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_DATA_DETECTED
 
 
 class ErrorPartitionFailureError(Win32Error):
-    DESCRIPTION = """Tape could not be partitioned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PARTITION_FAILURE
 
 
 class ErrorInvalidBlockLengthError(Win32Error):
-    DESCRIPTION = """When accessing a new tape of a multivolume partition, the current block size is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_BLOCK_LENGTH
 
 
 class ErrorDeviceNotPartitionedError(Win32Error):
-    DESCRIPTION = """Tape partition information could not be found when loading a tape."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_NOT_PARTITIONED
 
 
 class ErrorUnableToLockMediaError(Win32Error):
-    DESCRIPTION = """Unable to lock the media eject mechanism."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_LOCK_MEDIA
 
 
 class ErrorUnableToUnloadMediaError(Win32Error):
-    DESCRIPTION = """Unable to unload the media."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_UNLOAD_MEDIA
 
 
 class ErrorMediaChangedError(Win32Error):
-    DESCRIPTION = """The media in the drive might have changed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEDIA_CHANGED
 
 
 class ErrorBusResetError(Win32Error):
-    DESCRIPTION = """The I/O bus was reset."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BUS_RESET
 
 
 class ErrorNoMediaInDriveError(Win32Error):
-    DESCRIPTION = """No media in drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MEDIA_IN_DRIVE
 
 
 class ErrorNoUnicodeTranslationError(Win32Error):
-    DESCRIPTION = """No mapping for the Unicode character exists in the target multibyte code page."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_UNICODE_TRANSLATION
 
 
 class ErrorDllInitFailedError(Win32Error):
-    DESCRIPTION = """A DLL initialization routine failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DLL_INIT_FAILED
 
 
 class ErrorShutdownInProgressError(Win32Error):
-    DESCRIPTION = """A system shutdown is in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHUTDOWN_IN_PROGRESS
 
 
 class ErrorNoShutdownInProgressError(Win32Error):
-    DESCRIPTION = """Unable to abort the system shutdown because no shutdown was in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SHUTDOWN_IN_PROGRESS
 
 
 class ErrorIoDeviceError(Win32Error):
-    DESCRIPTION = """The request could not be performed because of an I/O device error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IO_DEVICE
 
 
 class ErrorSerialNoDeviceError(Win32Error):
-    DESCRIPTION = """No serial device was successfully initialized. The serial driver will unload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERIAL_NO_DEVICE
 
 
 class ErrorIrqBusyError(Win32Error):
-    DESCRIPTION = """Unable to open a device that was sharing an IRQ with other devices. At least one other device that uses that IRQ was already opened."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IRQ_BUSY
 
 
 class ErrorMoreWritesError(Win32Error):
-    DESCRIPTION = """A serial I/O operation was completed by another write to the serial port. (The IOCTL_SERIAL_XOFF_COUNTER reached zero.)"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MORE_WRITES
 
 
 class ErrorCounterTimeoutError(Win32Error):
-    DESCRIPTION = """A serial I/O operation completed because the time-out period expired. (The IOCTL_SERIAL_XOFF_COUNTER did not reach zero.)"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_COUNTER_TIMEOUT
 
 
 class ErrorFloppyIdMarkNotFoundError(Win32Error):
-    DESCRIPTION = """No ID address mark was found on the floppy disk."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOPPY_ID_MARK_NOT_FOUND
 
 
 class ErrorFloppyWrongCylinderError(Win32Error):
-    DESCRIPTION = """Mismatch between the floppy disk sector ID field and the floppy disk controller track address."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOPPY_WRONG_CYLINDER
 
 
 class ErrorFloppyUnknownErrorError(Win32Error):
-    DESCRIPTION = """The floppy disk controller reported an error that is not recognized by the floppy disk driver."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOPPY_UNKNOWN_ERROR
 
 
 class ErrorFloppyBadRegistersError(Win32Error):
-    DESCRIPTION = """The floppy disk controller returned inconsistent results in its registers."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOPPY_BAD_REGISTERS
 
 
 class ErrorDiskRecalibrateFailedError(Win32Error):
-    DESCRIPTION = """While accessing the hard disk, a recalibrate operation failed, even after retries."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_RECALIBRATE_FAILED
 
 
 class ErrorDiskOperationFailedError(Win32Error):
-    DESCRIPTION = """While accessing the hard disk, a disk operation failed even after retries."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_OPERATION_FAILED
 
 
 class ErrorDiskResetFailedError(Win32Error):
-    DESCRIPTION = """While accessing the hard disk, a disk controller reset was needed, but that also failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_RESET_FAILED
 
 
 class ErrorEomOverflowError(Win32Error):
-    DESCRIPTION = """Physical end of tape encountered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EOM_OVERFLOW
 
 
 class ErrorNotEnoughServerMemoryError(Win32Error):
-    DESCRIPTION = """Not enough server storage is available to process this command."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_ENOUGH_SERVER_MEMORY
 
 
 class ErrorPossibleDeadlockError(Win32Error):
-    DESCRIPTION = """A potential deadlock condition has been detected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_POSSIBLE_DEADLOCK
 
 
 class ErrorMappedAlignmentError(Win32Error):
-    DESCRIPTION = """The base address or the file offset specified does not have the proper alignment."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MAPPED_ALIGNMENT
 
 
 class ErrorSetPowerStateVetoedError(Win32Error):
-    DESCRIPTION = """An attempt to change the system power state was vetoed by another application or driver."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SET_POWER_STATE_VETOED
 
 
 class ErrorSetPowerStateFailedError(Win32Error):
-    DESCRIPTION = """The system BIOS failed an attempt to change the system power state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SET_POWER_STATE_FAILED
 
 
 class ErrorTooManyLinksError(Win32Error):
-    DESCRIPTION = """An attempt was made to create more links on a file than the file system supports."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_LINKS
 
 
 class ErrorOldWinVersionError(Win32Error):
-    DESCRIPTION = """The specified program requires a newer version of Windows."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OLD_WIN_VERSION
 
 
 class ErrorAppWrongOsError(Win32Error):
-    DESCRIPTION = """The specified program is not a Windows or MS-DOS program."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_APP_WRONG_OS
 
 
 class ErrorSingleInstanceAppError(Win32Error):
-    DESCRIPTION = """Cannot start more than one instance of the specified program."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SINGLE_INSTANCE_APP
 
 
 class ErrorRmodeAppError(Win32Error):
-    DESCRIPTION = """The specified program was written for an earlier version of Windows."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RMODE_APP
 
 
 class ErrorInvalidDllError(Win32Error):
-    DESCRIPTION = """One of the library files needed to run this application is damaged."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DLL
 
 
 class ErrorNoAssociationError(Win32Error):
-    DESCRIPTION = """No application is associated with the specified file for this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_ASSOCIATION
 
 
 class ErrorDdeFailError(Win32Error):
-    DESCRIPTION = """An error occurred in sending the command to the application."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DDE_FAIL
 
 
 class ErrorDllNotFoundError(Win32Error):
-    DESCRIPTION = """One of the library files needed to run this application cannot be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DLL_NOT_FOUND
 
 
 class ErrorNoMoreUserHandlesError(Win32Error):
-    DESCRIPTION = """The current process has used all of its system allowance of handles for Windows manager objects."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MORE_USER_HANDLES
 
 
 class ErrorMessageSyncOnlyError(Win32Error):
-    DESCRIPTION = """The message can be used only with synchronous operations."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MESSAGE_SYNC_ONLY
 
 
 class ErrorSourceElementEmptyError(Win32Error):
-    DESCRIPTION = """The indicated source element has no media."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SOURCE_ELEMENT_EMPTY
 
 
 class ErrorDestinationElementFullError(Win32Error):
-    DESCRIPTION = """The indicated destination element already contains media."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DESTINATION_ELEMENT_FULL
 
 
 class ErrorIllegalElementAddressError(Win32Error):
-    DESCRIPTION = """The indicated element does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ILLEGAL_ELEMENT_ADDRESS
 
 
 class ErrorMagazineNotPresentError(Win32Error):
-    DESCRIPTION = """The indicated element is part of a magazine that is not present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MAGAZINE_NOT_PRESENT
 
 
 class ErrorDeviceReinitializationNeededError(Win32Error):
-    DESCRIPTION = """The indicated device requires re-initialization due to hardware errors."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_REINITIALIZATION_NEEDED
 
 
 class ErrorDeviceRequiresCleaningError(Win32Error):
-    DESCRIPTION = """The device has indicated that cleaning is required before further operations are attempted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_REQUIRES_CLEANING
 
 
 class ErrorDeviceDoorOpenError(Win32Error):
-    DESCRIPTION = """The device has indicated that its door is open."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_DOOR_OPEN
 
 
 class ErrorDeviceNotConnectedError(Win32Error):
-    DESCRIPTION = """The device is not connected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_NOT_CONNECTED
 
 
 class ErrorNotFoundError(Win32Error):
-    DESCRIPTION = """Element not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_FOUND
 
 
 class ErrorNoMatchError(Win32Error):
-    DESCRIPTION = """There was no match for the specified key in the index."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MATCH
 
 
 class ErrorSetNotFoundError(Win32Error):
-    DESCRIPTION = """The property set specified does not exist on the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SET_NOT_FOUND
 
 
 class ErrorPointNotFoundError(Win32Error):
-    DESCRIPTION = """The point passed to GetMouseMovePoints is not in the buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_POINT_NOT_FOUND
 
 
 class ErrorNoTrackingServiceError(Win32Error):
-    DESCRIPTION = """The tracking (workstation) service is not running."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_TRACKING_SERVICE
 
 
 class ErrorNoVolumeIdError(Win32Error):
-    DESCRIPTION = """The volume ID could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_VOLUME_ID
 
 
 class ErrorUnableToRemoveReplacedError(Win32Error):
-    DESCRIPTION = """Unable to remove the file to be replaced."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_REMOVE_REPLACED
 
 
 class ErrorUnableToMoveReplacementError(Win32Error):
-    DESCRIPTION = """Unable to move the replacement file to the file to be replaced. The file to be replaced has retained its original name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_MOVE_REPLACEMENT
 
 
 class ErrorUnableToMoveReplacement2Error(Win32Error):
-    DESCRIPTION = """Unable to move the replacement file to the file to be replaced. The file to be replaced has been renamed using the backup name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_MOVE_REPLACEMENT_2
 
 
 class ErrorJournalDeleteInProgressError(Win32Error):
-    DESCRIPTION = """The volume change journal is being deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_JOURNAL_DELETE_IN_PROGRESS
 
 
 class ErrorJournalNotActiveError(Win32Error):
-    DESCRIPTION = """The volume change journal is not active."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_JOURNAL_NOT_ACTIVE
 
 
 class ErrorPotentialFileFoundError(Win32Error):
-    DESCRIPTION = """A file was found, but it might not be the correct file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_POTENTIAL_FILE_FOUND
 
 
 class ErrorJournalEntryDeletedError(Win32Error):
-    DESCRIPTION = """The journal entry has been deleted from the journal."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_JOURNAL_ENTRY_DELETED
 
 
 class ErrorShutdownIsScheduledError(Win32Error):
-    DESCRIPTION = """A system shutdown has already been scheduled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHUTDOWN_IS_SCHEDULED
 
 
 class ErrorShutdownUsersLoggedOnError(Win32Error):
-    DESCRIPTION = """The system shutdown cannot be initiated because there are other users logged on to the computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHUTDOWN_USERS_LOGGED_ON
 
 
 class ErrorBadDeviceError(Win32Error):
-    DESCRIPTION = """The specified device name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_DEVICE
 
 
 class ErrorConnectionUnavailError(Win32Error):
-    DESCRIPTION = """The device is not currently connected but it is a remembered connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTION_UNAVAIL
 
 
 class ErrorDeviceAlreadyRememberedError(Win32Error):
-    DESCRIPTION = """The local device name has a remembered connection to another network resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_ALREADY_REMEMBERED
 
 
 class ErrorNoNetOrBadPathError(Win32Error):
-    DESCRIPTION = """The network path was either typed incorrectly, does not exist, or the network provider is not currently available. Try retyping the path or contact your network administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_NET_OR_BAD_PATH
 
 
 class ErrorBadProviderError(Win32Error):
-    DESCRIPTION = """The specified network provider name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_PROVIDER
 
 
 class ErrorCannotOpenProfileError(Win32Error):
-    DESCRIPTION = """Unable to open the network connection profile."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_OPEN_PROFILE
 
 
 class ErrorBadProfileError(Win32Error):
-    DESCRIPTION = """The network connection profile is corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_PROFILE
 
 
 class ErrorNotContainerError(Win32Error):
-    DESCRIPTION = """Cannot enumerate a noncontainer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_CONTAINER
 
 
 class ErrorExtendedErrorError(Win32Error):
-    DESCRIPTION = """An extended error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EXTENDED_ERROR
 
 
 class ErrorInvalidGroupnameError(Win32Error):
-    DESCRIPTION = """The format of the specified group name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_GROUPNAME
 
 
 class ErrorInvalidComputernameError(Win32Error):
-    DESCRIPTION = """The format of the specified computer name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_COMPUTERNAME
 
 
 class ErrorInvalidEventnameError(Win32Error):
-    DESCRIPTION = """The format of the specified event name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_EVENTNAME
 
 
 class ErrorInvalidDomainnameError(Win32Error):
-    DESCRIPTION = """The format of the specified domain name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DOMAINNAME
 
 
 class ErrorInvalidServicenameError(Win32Error):
-    DESCRIPTION = """The format of the specified service name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SERVICENAME
 
 
 class ErrorInvalidNetnameError(Win32Error):
-    DESCRIPTION = """The format of the specified network name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_NETNAME
 
 
 class ErrorInvalidSharenameError(Win32Error):
-    DESCRIPTION = """The format of the specified share name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SHARENAME
 
 
 class ErrorInvalidPasswordnameError(Win32Error):
-    DESCRIPTION = """The format of the specified password is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PASSWORDNAME
 
 
 class ErrorInvalidMessagenameError(Win32Error):
-    DESCRIPTION = """The format of the specified message name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MESSAGENAME
 
 
 class ErrorInvalidMessagedestError(Win32Error):
-    DESCRIPTION = """The format of the specified message destination is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MESSAGEDEST
 
 
 class ErrorSessionCredentialConflictError(Win32Error):
-    DESCRIPTION = """Multiple connections to a server or shared resource by the same user, using more than one user name, are not allowed. Disconnect all previous connections to the server or shared resource and try again."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SESSION_CREDENTIAL_CONFLICT
 
 
 class ErrorRemoteSessionLimitExceededError(Win32Error):
-    DESCRIPTION = """An attempt was made to establish a session to a network server, but there are already too many sessions established to that server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REMOTE_SESSION_LIMIT_EXCEEDED
 
 
 class ErrorDupDomainnameError(Win32Error):
-    DESCRIPTION = """The workgroup or domain name is already in use by another computer on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DUP_DOMAINNAME
 
 
 class ErrorNoNetworkError(Win32Error):
-    DESCRIPTION = """The network is not present or not started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_NETWORK
 
 
 class ErrorCancelledError(Win32Error):
-    DESCRIPTION = """The operation was canceled by the user."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANCELLED
 
 
 class ErrorUserMappedFileError(Win32Error):
-    DESCRIPTION = """The requested operation cannot be performed on a file with a user-mapped section open."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_USER_MAPPED_FILE
 
 
 class ErrorConnectionRefusedError(Win32Error):
-    DESCRIPTION = """The remote system refused the network connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTION_REFUSED
 
 
 class ErrorGracefulDisconnectError(Win32Error):
-    DESCRIPTION = """The network connection was gracefully closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GRACEFUL_DISCONNECT
 
 
 class ErrorAddressAlreadyAssociatedError(Win32Error):
-    DESCRIPTION = """The network transport endpoint already has an address associated with it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ADDRESS_ALREADY_ASSOCIATED
 
 
 class ErrorAddressNotAssociatedError(Win32Error):
-    DESCRIPTION = """An address has not yet been associated with the network endpoint."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ADDRESS_NOT_ASSOCIATED
 
 
 class ErrorConnectionInvalidError(Win32Error):
-    DESCRIPTION = """An operation was attempted on a nonexistent network connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTION_INVALID
 
 
 class ErrorConnectionActiveError(Win32Error):
-    DESCRIPTION = """An invalid operation was attempted on an active network connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTION_ACTIVE
 
 
 class ErrorNetworkUnreachableError(Win32Error):
-    DESCRIPTION = """The network location cannot be reached. For information about network troubleshooting, see Windows Help."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NETWORK_UNREACHABLE
 
 
 class ErrorHostUnreachableError(Win32Error):
-    DESCRIPTION = """The network location cannot be reached. For information about network troubleshooting, see Windows Help."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOST_UNREACHABLE
 
 
 class ErrorProtocolUnreachableError(Win32Error):
-    DESCRIPTION = """The network location cannot be reached. For information about network troubleshooting, see Windows Help."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROTOCOL_UNREACHABLE
 
 
 class ErrorPortUnreachableError(Win32Error):
-    DESCRIPTION = """No service is operating at the destination network endpoint on the remote system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PORT_UNREACHABLE
 
 
 class ErrorRequestAbortedError(Win32Error):
-    DESCRIPTION = """The request was aborted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REQUEST_ABORTED
 
 
 class ErrorConnectionAbortedError(Win32Error):
-    DESCRIPTION = """The network connection was aborted by the local system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTION_ABORTED
 
 
 class ErrorRetryError(Win32Error):
-    DESCRIPTION = """The operation could not be completed. A retry should be performed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RETRY
 
 
 class ErrorConnectionCountLimitError(Win32Error):
-    DESCRIPTION = """A connection to the server could not be made because the limit on the number of concurrent connections for this account has been reached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTION_COUNT_LIMIT
 
 
 class ErrorLoginTimeRestrictionError(Win32Error):
-    DESCRIPTION = """Attempting to log on during an unauthorized time of day for this account."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGIN_TIME_RESTRICTION
 
 
 class ErrorLoginWkstaRestrictionError(Win32Error):
-    DESCRIPTION = """The account is not authorized to log on from this station."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGIN_WKSTA_RESTRICTION
 
 
 class ErrorIncorrectAddressError(Win32Error):
-    DESCRIPTION = """The network address could not be used for the operation requested."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INCORRECT_ADDRESS
 
 
 class ErrorAlreadyRegisteredError(Win32Error):
-    DESCRIPTION = """The service is already registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_REGISTERED
 
 
 class ErrorServiceNotFoundError(Win32Error):
-    DESCRIPTION = """The specified service does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_NOT_FOUND
 
 
 class ErrorNotAuthenticatedError(Win32Error):
-    DESCRIPTION = """The operation being requested was not performed because the user has not been authenticated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_AUTHENTICATED
 
 
 class ErrorNotLoggedOnError(Win32Error):
-    DESCRIPTION = """The operation being requested was not performed because the user has not logged on to the network. The specified service does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_LOGGED_ON
 
 
 class ErrorContinueError(Win32Error):
-    DESCRIPTION = """Continue with work in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONTINUE
 
 
 class ErrorAlreadyInitializedError(Win32Error):
-    DESCRIPTION = """An attempt was made to perform an initialization operation when initialization has already been completed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_INITIALIZED
 
 
 class ErrorNoMoreDevicesError(Win32Error):
-    DESCRIPTION = """No more local devices."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_MORE_DEVICES
 
 
 class ErrorNoSuchSiteError(Win32Error):
-    DESCRIPTION = """The specified site does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_SITE
 
 
 class ErrorDomainControllerExistsError(Win32Error):
-    DESCRIPTION = """A domain controller with the specified name already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DOMAIN_CONTROLLER_EXISTS
 
 
 class ErrorOnlyIfConnectedError(Win32Error):
-    DESCRIPTION = """This operation is supported only when you are connected to the server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ONLY_IF_CONNECTED
 
 
 class ErrorOverrideNochangesError(Win32Error):
-    DESCRIPTION = """The group policy framework should call the extension even if there are no changes."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OVERRIDE_NOCHANGES
 
 
 class ErrorBadUserProfileError(Win32Error):
-    DESCRIPTION = """The specified user does not have a valid profile."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_USER_PROFILE
 
 
 class ErrorNotSupportedOnSbsError(Win32Error):
-    DESCRIPTION = """This operation is not supported on a computer running Windows Server 2003 operating system for Small Business Server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SUPPORTED_ON_SBS
 
 
 class ErrorServerShutdownInProgressError(Win32Error):
-    DESCRIPTION = """The server machine is shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVER_SHUTDOWN_IN_PROGRESS
 
 
 class ErrorHostDownError(Win32Error):
-    DESCRIPTION = """The remote system is not available. For information about network troubleshooting, see Windows Help."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOST_DOWN
 
 
 class ErrorNonAccountSidError(Win32Error):
-    DESCRIPTION = """The security identifier provided is not from an account domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NON_ACCOUNT_SID
 
 
 class ErrorNonDomainSidError(Win32Error):
-    DESCRIPTION = """The security identifier provided does not have a domain component."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NON_DOMAIN_SID
 
 
 class ErrorApphelpBlockError(Win32Error):
-    DESCRIPTION = """AppHelp dialog canceled, thus preventing the application from starting."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_APPHELP_BLOCK
 
 
 class ErrorAccessDisabledByPolicyError(Win32Error):
-    DESCRIPTION = """This program is blocked by Group Policy. For more information, contact your system administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCESS_DISABLED_BY_POLICY
 
 
 class ErrorRegNatConsumptionError(Win32Error):
-    DESCRIPTION = """A program attempt to use an invalid register value. Normally caused by an uninitialized register. This error is Itanium specific."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REG_NAT_CONSUMPTION
 
 
 class ErrorCscshareOfflineError(Win32Error):
-    DESCRIPTION = """The share is currently offline or does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CSCSHARE_OFFLINE
 
 
 class ErrorPkinitFailureError(Win32Error):
-    DESCRIPTION = """The Kerberos protocol encountered an error while validating the KDC certificate during smartcard logon. There is more information in the system event log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PKINIT_FAILURE
 
 
 class ErrorSmartcardSubsystemFailureError(Win32Error):
-    DESCRIPTION = """The Kerberos protocol encountered an error while attempting to utilize the smartcard subsystem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SMARTCARD_SUBSYSTEM_FAILURE
 
 
 class ErrorDowngradeDetectedError(Win32Error):
-    DESCRIPTION = """The system detected a possible attempt to compromise security. Ensure that you can contact the server that authenticated you."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DOWNGRADE_DETECTED
 
 
 class ErrorMachineLockedError(Win32Error):
-    DESCRIPTION = """The machine is locked and cannot be shut down without the force option."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MACHINE_LOCKED
 
 
 class ErrorCallbackSuppliedInvalidDataError(Win32Error):
-    DESCRIPTION = """An application-defined callback gave invalid data when called."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CALLBACK_SUPPLIED_INVALID_DATA
 
 
 class ErrorSyncForegroundRefreshRequiredError(Win32Error):
-    DESCRIPTION = """The Group Policy framework should call the extension in the synchronous foreground policy refresh."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYNC_FOREGROUND_REFRESH_REQUIRED
 
 
 class ErrorDriverBlockedError(Win32Error):
-    DESCRIPTION = """This driver has been blocked from loading."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVER_BLOCKED
 
 
 class ErrorInvalidImportOfNonDllError(Win32Error):
-    DESCRIPTION = """A DLL referenced a module that was neither a DLL nor the process's executable image."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_IMPORT_OF_NON_DLL
 
 
 class ErrorAccessDisabledWebbladeError(Win32Error):
-    DESCRIPTION = """Windows cannot open this program because it has been disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCESS_DISABLED_WEBBLADE
 
 
 class ErrorAccessDisabledWebbladeTamperError(Win32Error):
-    DESCRIPTION = """Windows cannot open this program because the license enforcement system has been tampered with or become corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCESS_DISABLED_WEBBLADE_TAMPER
 
 
 class ErrorRecoveryFailureError(Win32Error):
-    DESCRIPTION = """A transaction recover failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RECOVERY_FAILURE
 
 
 class ErrorAlreadyFiberError(Win32Error):
-    DESCRIPTION = """The current thread has already been converted to a fiber."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_FIBER
 
 
 class ErrorAlreadyThreadError(Win32Error):
-    DESCRIPTION = """The current thread has already been converted from a fiber."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_THREAD
 
 
 class ErrorStackBufferOverrunError(Win32Error):
-    DESCRIPTION = """The system detected an overrun of a stack-based buffer in this application. This overrun could potentially allow a malicious user to gain control of this application."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_STACK_BUFFER_OVERRUN
 
 
 class ErrorParameterQuotaExceededError(Win32Error):
-    DESCRIPTION = """Data present in one of the parameters is more than the function can operate on."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PARAMETER_QUOTA_EXCEEDED
 
 
 class ErrorDebuggerInactiveError(Win32Error):
-    DESCRIPTION = """An attempt to perform an operation on a debug object failed because the object is in the process of being deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEBUGGER_INACTIVE
 
 
 class ErrorDelayLoadFailedError(Win32Error):
-    DESCRIPTION = """An attempt to delay-load a .dll or get a function address in a delay-loaded .dll failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DELAY_LOAD_FAILED
 
 
 class ErrorVdmDisallowedError(Win32Error):
-    DESCRIPTION = """%1 is a 16-bit application. You do not have permissions to execute 16-bit applications. Check your permissions with your system administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VDM_DISALLOWED
 
 
 class ErrorUnidentifiedErrorError(Win32Error):
-    DESCRIPTION = """Insufficient information exists to identify the cause of failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNIDENTIFIED_ERROR
 
 
 class ErrorInvalidCruntimeParameterError(Win32Error):
-    DESCRIPTION = """The parameter passed to a C runtime function is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_CRUNTIME_PARAMETER
 
 
 class ErrorBeyondVdlError(Win32Error):
-    DESCRIPTION = """The operation occurred beyond the valid data length of the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BEYOND_VDL
 
 
 class ErrorIncompatibleServiceSidTypeError(Win32Error):
-    DESCRIPTION = """The service start failed because one or more services in the same process have an incompatible service SID type setting. A service with a restricted service SID type can only coexist in the same process with other services with a restricted SID type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INCOMPATIBLE_SERVICE_SID_TYPE
 
 
 class ErrorDriverProcessTerminatedError(Win32Error):
-    DESCRIPTION = """The process hosting the driver for this device has been terminated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVER_PROCESS_TERMINATED
 
 
 class ErrorImplementationLimitError(Win32Error):
-    DESCRIPTION = """An operation attempted to exceed an implementation-defined limit."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IMPLEMENTATION_LIMIT
 
 
 class ErrorProcessIsProtectedError(Win32Error):
-    DESCRIPTION = """Either the target process, or the target thread's containing process, is a protected process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROCESS_IS_PROTECTED
 
 
 class ErrorServiceNotifyClientLaggingError(Win32Error):
-    DESCRIPTION = """The service notification client is lagging too far behind the current state of services in the machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVICE_NOTIFY_CLIENT_LAGGING
 
 
 class ErrorDiskQuotaExceededError(Win32Error):
-    DESCRIPTION = """An operation failed because the storage quota was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_QUOTA_EXCEEDED
 
 
 class ErrorContentBlockedError(Win32Error):
-    DESCRIPTION = """An operation failed because the content was blocked."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONTENT_BLOCKED
 
 
 class ErrorIncompatibleServicePrivilegeError(Win32Error):
-    DESCRIPTION = """A privilege that the service requires to function properly does not exist in the service account configuration. The Services Microsoft Management Console (MMC) snap-in (Services.msc) and the Local Security Settings MMC snap-in (Secpol.msc) can be used to view the service configuration and the account configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INCOMPATIBLE_SERVICE_PRIVILEGE
 
 
 class ErrorInvalidLabelError(Win32Error):
-    DESCRIPTION = """Indicates a particular SID cannot be assigned as the label of an object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LABEL
 
 
 class ErrorNotAllAssignedError(Win32Error):
-    DESCRIPTION = """Not all privileges or groups referenced are assigned to the caller."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_ALL_ASSIGNED
 
 
 class ErrorSomeNotMappedError(Win32Error):
-    DESCRIPTION = """Some mapping between account names and SIDs was not done."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SOME_NOT_MAPPED
 
 
 class ErrorNoQuotasForAccountError(Win32Error):
-    DESCRIPTION = """No system quota limits are specifically set for this account."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_QUOTAS_FOR_ACCOUNT
 
 
 class ErrorLocalUserSessionKeyError(Win32Error):
-    DESCRIPTION = """No encryption key is available. A well-known encryption key was returned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOCAL_USER_SESSION_KEY
 
 
 class ErrorNullLmPasswordError(Win32Error):
-    DESCRIPTION = """The password is too complex to be converted to a LAN Manager password. The LAN Manager password returned is a null string."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NULL_LM_PASSWORD
 
 
 class ErrorUnknownRevisionError(Win32Error):
-    DESCRIPTION = """The revision level is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_REVISION
 
 
 class ErrorRevisionMismatchError(Win32Error):
-    DESCRIPTION = """Indicates two revision levels are incompatible."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REVISION_MISMATCH
 
 
 class ErrorInvalidOwnerError(Win32Error):
-    DESCRIPTION = """This SID cannot be assigned as the owner of this object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_OWNER
 
 
 class ErrorInvalidPrimaryGroupError(Win32Error):
-    DESCRIPTION = """This SID cannot be assigned as the primary group of an object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PRIMARY_GROUP
 
 
 class ErrorNoImpersonationTokenError(Win32Error):
-    DESCRIPTION = """An attempt has been made to operate on an impersonation token by a thread that is not currently impersonating a client."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_IMPERSONATION_TOKEN
 
 
 class ErrorCantDisableMandatoryError(Win32Error):
-    DESCRIPTION = """The group cannot be disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_DISABLE_MANDATORY
 
 
 class ErrorNoLogonServersError(Win32Error):
-    DESCRIPTION = """There are currently no logon servers available to service the logon request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_LOGON_SERVERS
 
 
 class ErrorNoSuchLogonSessionError(Win32Error):
-    DESCRIPTION = """A specified logon session does not exist. It might already have been terminated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_LOGON_SESSION
 
 
 class ErrorNoSuchPrivilegeError(Win32Error):
-    DESCRIPTION = """A specified privilege does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_PRIVILEGE
 
 
 class ErrorPrivilegeNotHeldError(Win32Error):
-    DESCRIPTION = """A required privilege is not held by the client."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRIVILEGE_NOT_HELD
 
 
 class ErrorInvalidAccountNameError(Win32Error):
-    DESCRIPTION = """The name provided is not a properly formed account name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ACCOUNT_NAME
 
 
 class ErrorUserExistsError(Win32Error):
-    DESCRIPTION = """The specified account already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_USER_EXISTS
 
 
 class ErrorNoSuchUserError(Win32Error):
-    DESCRIPTION = """The specified account does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_USER
 
 
 class ErrorGroupExistsError(Win32Error):
-    DESCRIPTION = """The specified group already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GROUP_EXISTS
 
 
 class ErrorNoSuchGroupError(Win32Error):
-    DESCRIPTION = """The specified group does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_GROUP
 
 
 class ErrorMemberInGroupError(Win32Error):
-    DESCRIPTION = """Either the specified user account is already a member of the specified group, or the specified group cannot be deleted because it contains a member."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEMBER_IN_GROUP
 
 
 class ErrorMemberNotInGroupError(Win32Error):
-    DESCRIPTION = """The specified user account is not a member of the specified group account."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEMBER_NOT_IN_GROUP
 
 
 class ErrorLastAdminError(Win32Error):
-    DESCRIPTION = """The last remaining administration account cannot be disabled or deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LAST_ADMIN
 
 
 class ErrorWrongPasswordError(Win32Error):
-    DESCRIPTION = """Unable to update the password. The value provided as the current password is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WRONG_PASSWORD
 
 
 class ErrorIllFormedPasswordError(Win32Error):
-    DESCRIPTION = """Unable to update the password. The value provided for the new password contains values that are not allowed in passwords."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ILL_FORMED_PASSWORD
 
 
 class ErrorPasswordRestrictionError(Win32Error):
-    DESCRIPTION = """Unable to update the password. The value provided for the new password does not meet the length, complexity, or history requirements of the domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PASSWORD_RESTRICTION
 
 
 class ErrorLogonFailureError(Win32Error):
-    DESCRIPTION = """Logon failure: Unknown user name or bad password."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGON_FAILURE
 
 
 class ErrorAccountRestrictionError(Win32Error):
-    DESCRIPTION = """Logon failure: User account restriction. Possible reasons are blank passwords not allowed, logon hour restrictions, or a policy restriction has been enforced."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCOUNT_RESTRICTION
 
 
 class ErrorInvalidLogonHoursError(Win32Error):
-    DESCRIPTION = """Logon failure: Account logon time restriction violation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LOGON_HOURS
 
 
 class ErrorInvalidWorkstationError(Win32Error):
-    DESCRIPTION = """Logon failure: User not allowed to log on to this computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_WORKSTATION
 
 
 class ErrorPasswordExpiredError(Win32Error):
-    DESCRIPTION = """Logon failure: The specified account password has expired."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PASSWORD_EXPIRED
 
 
 class ErrorAccountDisabledError(Win32Error):
-    DESCRIPTION = """Logon failure: Account currently disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCOUNT_DISABLED
 
 
 class ErrorNoneMappedError(Win32Error):
-    DESCRIPTION = """No mapping between account names and SIDs was done."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NONE_MAPPED
 
 
 class ErrorTooManyLuidsRequestedError(Win32Error):
-    DESCRIPTION = """Too many local user identifiers (LUIDs) were requested at one time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_LUIDS_REQUESTED
 
 
 class ErrorLuidsExhaustedError(Win32Error):
-    DESCRIPTION = """No more LUIDs are available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LUIDS_EXHAUSTED
 
 
 class ErrorInvalidSubAuthorityError(Win32Error):
-    DESCRIPTION = """The sub-authority part of an SID is invalid for this particular use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SUB_AUTHORITY
 
 
 class ErrorInvalidAclError(Win32Error):
-    DESCRIPTION = """The ACL structure is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ACL
 
 
 class ErrorInvalidSidError(Win32Error):
-    DESCRIPTION = """The SID structure is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SID
 
 
 class ErrorInvalidSecurityDescrError(Win32Error):
-    DESCRIPTION = """The security descriptor structure is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SECURITY_DESCR
 
 
 class ErrorBadInheritanceAclError(Win32Error):
-    DESCRIPTION = """The inherited ACL or ACE could not be built."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_INHERITANCE_ACL
 
 
 class ErrorServerDisabledError(Win32Error):
-    DESCRIPTION = """The server is currently disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVER_DISABLED
 
 
 class ErrorServerNotDisabledError(Win32Error):
-    DESCRIPTION = """The server is currently enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVER_NOT_DISABLED
 
 
 class ErrorInvalidIdAuthorityError(Win32Error):
-    DESCRIPTION = """The value provided was an invalid value for an identifier authority."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ID_AUTHORITY
 
 
 class ErrorAllottedSpaceExceededError(Win32Error):
-    DESCRIPTION = """No more memory is available for security information updates."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALLOTTED_SPACE_EXCEEDED
 
 
 class ErrorInvalidGroupAttributesError(Win32Error):
-    DESCRIPTION = """The specified attributes are invalid, or incompatible with the attributes for the group as a whole."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_GROUP_ATTRIBUTES
 
 
 class ErrorBadImpersonationLevelError(Win32Error):
-    DESCRIPTION = """Either a required impersonation level was not provided, or the provided impersonation level is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_IMPERSONATION_LEVEL
 
 
 class ErrorCantOpenAnonymousError(Win32Error):
-    DESCRIPTION = """Cannot open an anonymous level security token."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_OPEN_ANONYMOUS
 
 
 class ErrorBadValidationClassError(Win32Error):
-    DESCRIPTION = """The validation information class requested was invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_VALIDATION_CLASS
 
 
 class ErrorBadTokenTypeError(Win32Error):
-    DESCRIPTION = """The type of the token is inappropriate for its attempted use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_TOKEN_TYPE
 
 
 class ErrorNoSecurityOnObjectError(Win32Error):
-    DESCRIPTION = """Unable to perform a security operation on an object that has no associated security."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SECURITY_ON_OBJECT
 
 
 class ErrorCantAccessDomainInfoError(Win32Error):
-    DESCRIPTION = """Configuration information could not be read from the domain controller, either because the machine is unavailable, or access has been denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_ACCESS_DOMAIN_INFO
 
 
 class ErrorInvalidServerStateError(Win32Error):
-    DESCRIPTION = """The SAM or local security authority (LSA) server was in the wrong state to perform the security operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SERVER_STATE
 
 
 class ErrorInvalidDomainStateError(Win32Error):
-    DESCRIPTION = """The domain was in the wrong state to perform the security operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DOMAIN_STATE
 
 
 class ErrorInvalidDomainRoleError(Win32Error):
-    DESCRIPTION = """This operation is only allowed for the PDC of the domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DOMAIN_ROLE
 
 
 class ErrorNoSuchDomainError(Win32Error):
-    DESCRIPTION = """The specified domain either does not exist or could not be contacted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_DOMAIN
 
 
 class ErrorDomainExistsError(Win32Error):
-    DESCRIPTION = """The specified domain already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DOMAIN_EXISTS
 
 
 class ErrorDomainLimitExceededError(Win32Error):
-    DESCRIPTION = """An attempt was made to exceed the limit on the number of domains per server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DOMAIN_LIMIT_EXCEEDED
 
 
 class ErrorInternalDbCorruptionError(Win32Error):
-    DESCRIPTION = """Unable to complete the requested operation because of either a catastrophic media failure or a data structure corruption on the disk."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INTERNAL_DB_CORRUPTION
 
 
 class ErrorInternalErrorError(Win32Error):
-    DESCRIPTION = """An internal error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INTERNAL_ERROR
 
 
 class ErrorGenericNotMappedError(Win32Error):
-    DESCRIPTION = """Generic access types were contained in an access mask that should already be mapped to nongeneric types."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GENERIC_NOT_MAPPED
 
 
 class ErrorBadDescriptorFormatError(Win32Error):
-    DESCRIPTION = """A security descriptor is not in the right format (absolute or self-relative)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_DESCRIPTOR_FORMAT
 
 
 class ErrorNotLogonProcessError(Win32Error):
-    DESCRIPTION = """The requested action is restricted for use by logon processes only. The calling process has not registered as a logon process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_LOGON_PROCESS
 
 
 class ErrorLogonSessionExistsError(Win32Error):
-    DESCRIPTION = """Cannot start a new logon session with an ID that is already in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGON_SESSION_EXISTS
 
 
 class ErrorNoSuchPackageError(Win32Error):
-    DESCRIPTION = """A specified authentication package is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_PACKAGE
 
 
 class ErrorBadLogonSessionStateError(Win32Error):
-    DESCRIPTION = """The logon session is not in a state that is consistent with the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_LOGON_SESSION_STATE
 
 
 class ErrorLogonSessionCollisionError(Win32Error):
-    DESCRIPTION = """The logon session ID is already in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGON_SESSION_COLLISION
 
 
 class ErrorInvalidLogonTypeError(Win32Error):
-    DESCRIPTION = """A logon request contained an invalid logon type value."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LOGON_TYPE
 
 
 class ErrorCannotImpersonateError(Win32Error):
-    DESCRIPTION = """Unable to impersonate using a named pipe until data has been read from that pipe."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_IMPERSONATE
 
 
 class ErrorRxactInvalidStateError(Win32Error):
-    DESCRIPTION = """The transaction state of a registry subtree is incompatible with the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RXACT_INVALID_STATE
 
 
 class ErrorRxactCommitFailureError(Win32Error):
-    DESCRIPTION = """An internal security database corruption has been encountered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RXACT_COMMIT_FAILURE
 
 
 class ErrorSpecialAccountError(Win32Error):
-    DESCRIPTION = """Cannot perform this operation on built-in accounts."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SPECIAL_ACCOUNT
 
 
 class ErrorSpecialGroupError(Win32Error):
-    DESCRIPTION = """Cannot perform this operation on this built-in special group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SPECIAL_GROUP
 
 
 class ErrorSpecialUserError(Win32Error):
-    DESCRIPTION = """Cannot perform this operation on this built-in special user."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SPECIAL_USER
 
 
 class ErrorMembersPrimaryGroupError(Win32Error):
-    DESCRIPTION = """The user cannot be removed from a group because the group is currently the user's primary group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEMBERS_PRIMARY_GROUP
 
 
 class ErrorTokenAlreadyInUseError(Win32Error):
-    DESCRIPTION = """The token is already in use as a primary token."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOKEN_ALREADY_IN_USE
 
 
 class ErrorNoSuchAliasError(Win32Error):
-    DESCRIPTION = """The specified local group does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_ALIAS
 
 
 class ErrorMemberNotInAliasError(Win32Error):
-    DESCRIPTION = """The specified account name is not a member of the group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEMBER_NOT_IN_ALIAS
 
 
 class ErrorMemberInAliasError(Win32Error):
-    DESCRIPTION = """The specified account name is already a member of the group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEMBER_IN_ALIAS
 
 
 class ErrorAliasExistsError(Win32Error):
-    DESCRIPTION = """The specified local group already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALIAS_EXISTS
 
 
 class ErrorLogonNotGrantedError(Win32Error):
-    DESCRIPTION = """Logon failure: The user has not been granted the requested logon type at this computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGON_NOT_GRANTED
 
 
 class ErrorTooManySecretsError(Win32Error):
-    DESCRIPTION = """The maximum number of secrets that can be stored in a single system has been exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_SECRETS
 
 
 class ErrorSecretTooLongError(Win32Error):
-    DESCRIPTION = """The length of a secret exceeds the maximum length allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SECRET_TOO_LONG
 
 
 class ErrorInternalDbErrorError(Win32Error):
-    DESCRIPTION = """The local security authority database contains an internal inconsistency."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INTERNAL_DB_ERROR
 
 
 class ErrorTooManyContextIdsError(Win32Error):
-    DESCRIPTION = """During a logon attempt, the user's security context accumulated too many SIDs."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_CONTEXT_IDS
 
 
 class ErrorLogonTypeNotGrantedError(Win32Error):
-    DESCRIPTION = """Logon failure: The user has not been granted the requested logon type at this computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOGON_TYPE_NOT_GRANTED
 
 
 class ErrorNtCrossEncryptionRequiredError(Win32Error):
-    DESCRIPTION = """A cross-encrypted password is necessary to change a user password."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NT_CROSS_ENCRYPTION_REQUIRED
 
 
 class ErrorNoSuchMemberError(Win32Error):
-    DESCRIPTION = """A member could not be added to or removed from the local group because the member does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUCH_MEMBER
 
 
 class ErrorInvalidMemberError(Win32Error):
-    DESCRIPTION = """A new member could not be added to a local group because the member has the wrong account type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MEMBER
 
 
 class ErrorTooManySidsError(Win32Error):
-    DESCRIPTION = """Too many SIDs have been specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TOO_MANY_SIDS
 
 
 class ErrorLmCrossEncryptionRequiredError(Win32Error):
-    DESCRIPTION = """A cross-encrypted password is necessary to change this user password."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LM_CROSS_ENCRYPTION_REQUIRED
 
 
 class ErrorNoInheritanceError(Win32Error):
-    DESCRIPTION = """Indicates an ACL contains no inheritable components."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_INHERITANCE
 
 
 class ErrorFileCorruptError(Win32Error):
-    DESCRIPTION = """The file or directory is corrupted and unreadable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_CORRUPT
 
 
 class ErrorDiskCorruptError(Win32Error):
-    DESCRIPTION = """The disk structure is corrupted and unreadable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DISK_CORRUPT
 
 
 class ErrorNoUserSessionKeyError(Win32Error):
-    DESCRIPTION = """There is no user session key for the specified logon session."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_USER_SESSION_KEY
 
 
 class ErrorLicenseQuotaExceededError(Win32Error):
-    DESCRIPTION = """The service being accessed is licensed for a particular number of connections. No more connections can be made to the service at this time because the service has accepted the maximum number of connections."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LICENSE_QUOTA_EXCEEDED
 
 
 class ErrorWrongTargetNameError(Win32Error):
-    DESCRIPTION = """Logon failure: The target account name is incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WRONG_TARGET_NAME
 
 
 class ErrorMutualAuthFailedError(Win32Error):
-    DESCRIPTION = """Mutual authentication failed. The server's password is out of date at the domain controller."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUTUAL_AUTH_FAILED
 
 
 class ErrorTimeSkewError(Win32Error):
-    DESCRIPTION = """There is a time and/or date difference between the client and server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TIME_SKEW
 
 
 class ErrorCurrentDomainNotAllowedError(Win32Error):
-    DESCRIPTION = """This operation cannot be performed on the current domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CURRENT_DOMAIN_NOT_ALLOWED
 
 
 class ErrorInvalidWindowHandleError(Win32Error):
-    DESCRIPTION = """Invalid window handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_WINDOW_HANDLE
 
 
 class ErrorInvalidMenuHandleError(Win32Error):
-    DESCRIPTION = """Invalid menu handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MENU_HANDLE
 
 
 class ErrorInvalidCursorHandleError(Win32Error):
-    DESCRIPTION = """Invalid cursor handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_CURSOR_HANDLE
 
 
 class ErrorInvalidAccelHandleError(Win32Error):
-    DESCRIPTION = """Invalid accelerator table handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ACCEL_HANDLE
 
 
 class ErrorInvalidHookHandleError(Win32Error):
-    DESCRIPTION = """Invalid hook handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_HOOK_HANDLE
 
 
 class ErrorInvalidDwpHandleError(Win32Error):
-    DESCRIPTION = """Invalid handle to a multiple-window position structure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DWP_HANDLE
 
 
 class ErrorTlwWithWschildError(Win32Error):
-    DESCRIPTION = """Cannot create a top-level child window."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TLW_WITH_WSCHILD
 
 
 class ErrorCannotFindWndClassError(Win32Error):
-    DESCRIPTION = """Cannot find window class."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_FIND_WND_CLASS
 
 
 class ErrorWindowOfOtherThreadError(Win32Error):
-    DESCRIPTION = """Invalid window; it belongs to other thread."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WINDOW_OF_OTHER_THREAD
 
 
 class ErrorHotkeyAlreadyRegisteredError(Win32Error):
-    DESCRIPTION = """Hot key is already registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOTKEY_ALREADY_REGISTERED
 
 
 class ErrorClassAlreadyExistsError(Win32Error):
-    DESCRIPTION = """Class already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLASS_ALREADY_EXISTS
 
 
 class ErrorClassDoesNotExistError(Win32Error):
-    DESCRIPTION = """Class does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLASS_DOES_NOT_EXIST
 
 
 class ErrorClassHasWindowsError(Win32Error):
-    DESCRIPTION = """Class still has open windows."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLASS_HAS_WINDOWS
 
 
 class ErrorInvalidIndexError(Win32Error):
-    DESCRIPTION = """Invalid index."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_INDEX
 
 
 class ErrorInvalidIconHandleError(Win32Error):
-    DESCRIPTION = """Invalid icon handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ICON_HANDLE
 
 
 class ErrorPrivateDialogIndexError(Win32Error):
-    DESCRIPTION = """Using private DIALOG window words."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRIVATE_DIALOG_INDEX
 
 
 class ErrorListboxIdNotFoundError(Win32Error):
-    DESCRIPTION = """The list box identifier was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LISTBOX_ID_NOT_FOUND
 
 
 class ErrorNoWildcardCharactersError(Win32Error):
-    DESCRIPTION = """No wildcards were found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_WILDCARD_CHARACTERS
 
 
 class ErrorClipboardNotOpenError(Win32Error):
-    DESCRIPTION = """Thread does not have a clipboard open."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLIPBOARD_NOT_OPEN
 
 
 class ErrorHotkeyNotRegisteredError(Win32Error):
-    DESCRIPTION = """Hot key is not registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOTKEY_NOT_REGISTERED
 
 
 class ErrorWindowNotDialogError(Win32Error):
-    DESCRIPTION = """The window is not a valid dialog window."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WINDOW_NOT_DIALOG
 
 
 class ErrorControlIdNotFoundError(Win32Error):
-    DESCRIPTION = """Control ID not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONTROL_ID_NOT_FOUND
 
 
 class ErrorInvalidComboboxMessageError(Win32Error):
-    DESCRIPTION = """Invalid message for a combo box because it does not have an edit control."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_COMBOBOX_MESSAGE
 
 
 class ErrorWindowNotComboboxError(Win32Error):
-    DESCRIPTION = """The window is not a combo box."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WINDOW_NOT_COMBOBOX
 
 
 class ErrorInvalidEditHeightError(Win32Error):
-    DESCRIPTION = """Height must be less than 256."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_EDIT_HEIGHT
 
 
 class ErrorDcNotFoundError(Win32Error):
-    DESCRIPTION = """Invalid device context (DC) handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DC_NOT_FOUND
 
 
 class ErrorInvalidHookFilterError(Win32Error):
-    DESCRIPTION = """Invalid hook procedure type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_HOOK_FILTER
 
 
 class ErrorInvalidFilterProcError(Win32Error):
-    DESCRIPTION = """Invalid hook procedure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_FILTER_PROC
 
 
 class ErrorHookNeedsHmodError(Win32Error):
-    DESCRIPTION = """Cannot set nonlocal hook without a module handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOOK_NEEDS_HMOD
 
 
 class ErrorGlobalOnlyHookError(Win32Error):
-    DESCRIPTION = """This hook procedure can only be set globally."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GLOBAL_ONLY_HOOK
 
 
 class ErrorJournalHookSetError(Win32Error):
-    DESCRIPTION = """The journal hook procedure is already installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_JOURNAL_HOOK_SET
 
 
 class ErrorHookNotInstalledError(Win32Error):
-    DESCRIPTION = """The hook procedure is not installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOOK_NOT_INSTALLED
 
 
 class ErrorInvalidLbMessageError(Win32Error):
-    DESCRIPTION = """Invalid message for single-selection list box."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LB_MESSAGE
 
 
 class ErrorSetcountOnBadLbError(Win32Error):
-    DESCRIPTION = """LB_SETCOUNT sent to non-lazy list box."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SETCOUNT_ON_BAD_LB
 
 
 class ErrorLbWithoutTabstopsError(Win32Error):
-    DESCRIPTION = """This list box does not support tab stops."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LB_WITHOUT_TABSTOPS
 
 
 class ErrorDestroyObjectOfOtherThreadError(Win32Error):
-    DESCRIPTION = """Cannot destroy object created by another thread."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DESTROY_OBJECT_OF_OTHER_THREAD
 
 
 class ErrorChildWindowMenuError(Win32Error):
-    DESCRIPTION = """Child windows cannot have menus."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CHILD_WINDOW_MENU
 
 
 class ErrorNoSystemMenuError(Win32Error):
-    DESCRIPTION = """The window does not have a system menu."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SYSTEM_MENU
 
 
 class ErrorInvalidMsgboxStyleError(Win32Error):
-    DESCRIPTION = """Invalid message box style."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MSGBOX_STYLE
 
 
 class ErrorInvalidSpiValueError(Win32Error):
-    DESCRIPTION = """Invalid system-wide (SPI_*) parameter."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SPI_VALUE
 
 
 class ErrorScreenAlreadyLockedError(Win32Error):
-    DESCRIPTION = """Screen already locked."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SCREEN_ALREADY_LOCKED
 
 
 class ErrorHwndsHaveDiffParentError(Win32Error):
-    DESCRIPTION = """All handles to windows in a multiple-window position structure must have the same parent."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HWNDS_HAVE_DIFF_PARENT
 
 
 class ErrorNotChildWindowError(Win32Error):
-    DESCRIPTION = """The window is not a child window."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_CHILD_WINDOW
 
 
 class ErrorInvalidGwCommandError(Win32Error):
-    DESCRIPTION = """Invalid GW_* command."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_GW_COMMAND
 
 
 class ErrorInvalidThreadIdError(Win32Error):
-    DESCRIPTION = """Invalid thread identifier."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_THREAD_ID
 
 
 class ErrorNonMdichildWindowError(Win32Error):
-    DESCRIPTION = """Cannot process a message from a window that is not a multiple document interface (MDI) window."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NON_MDICHILD_WINDOW
 
 
 class ErrorPopupAlreadyActiveError(Win32Error):
-    DESCRIPTION = """Pop-up menu already active."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_POPUP_ALREADY_ACTIVE
 
 
 class ErrorNoScrollbarsError(Win32Error):
-    DESCRIPTION = """The window does not have scroll bars."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SCROLLBARS
 
 
 class ErrorInvalidScrollbarRangeError(Win32Error):
-    DESCRIPTION = """Scroll bar range cannot be greater than MAXLONG."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SCROLLBAR_RANGE
 
 
 class ErrorInvalidShowwinCommandError(Win32Error):
-    DESCRIPTION = """Cannot show or remove the window in the way specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SHOWWIN_COMMAND
 
 
 class ErrorNoSystemResourcesError(Win32Error):
-    DESCRIPTION = """Insufficient system resources exist to complete the requested service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SYSTEM_RESOURCES
 
 
 class ErrorNonpagedSystemResourcesError(Win32Error):
-    DESCRIPTION = """Insufficient system resources exist to complete the requested service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NONPAGED_SYSTEM_RESOURCES
 
 
 class ErrorPagedSystemResourcesError(Win32Error):
-    DESCRIPTION = """Insufficient system resources exist to complete the requested service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGED_SYSTEM_RESOURCES
 
 
 class ErrorWorkingSetQuotaError(Win32Error):
-    DESCRIPTION = """Insufficient quota to complete the requested service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WORKING_SET_QUOTA
 
 
 class ErrorPagefileQuotaError(Win32Error):
-    DESCRIPTION = """Insufficient quota to complete the requested service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PAGEFILE_QUOTA
 
 
 class ErrorCommitmentLimitError(Win32Error):
-    DESCRIPTION = """The paging file is too small for this operation to complete."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_COMMITMENT_LIMIT
 
 
 class ErrorMenuItemNotFoundError(Win32Error):
-    DESCRIPTION = """A menu item was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MENU_ITEM_NOT_FOUND
 
 
 class ErrorInvalidKeyboardHandleError(Win32Error):
-    DESCRIPTION = """Invalid keyboard layout handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_KEYBOARD_HANDLE
 
 
 class ErrorHookTypeNotAllowedError(Win32Error):
-    DESCRIPTION = """Hook type not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOOK_TYPE_NOT_ALLOWED
 
 
 class ErrorRequiresInteractiveWindowstationError(Win32Error):
-    DESCRIPTION = """This operation requires an interactive window station."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REQUIRES_INTERACTIVE_WINDOWSTATION
 
 
 class ErrorTimeoutError(Win32Error):
-    DESCRIPTION = """This operation returned because the time-out period expired."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TIMEOUT
 
 
 class ErrorInvalidMonitorHandleError(Win32Error):
-    DESCRIPTION = """Invalid monitor handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MONITOR_HANDLE
 
 
 class ErrorIncorrectSizeError(Win32Error):
-    DESCRIPTION = """Incorrect size argument."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INCORRECT_SIZE
 
 
 class ErrorSymlinkClassDisabledError(Win32Error):
-    DESCRIPTION = """The symbolic link cannot be followed because its type is disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYMLINK_CLASS_DISABLED
 
 
 class ErrorSymlinkNotSupportedError(Win32Error):
-    DESCRIPTION = """This application does not support the current operation on symbolic links."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYMLINK_NOT_SUPPORTED
 
 
 class ErrorEventlogFileCorruptError(Win32Error):
-    DESCRIPTION = """The event log file is corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVENTLOG_FILE_CORRUPT
 
 
 class ErrorEventlogCantStartError(Win32Error):
-    DESCRIPTION = """No event log file could be opened, so the event logging service did not start."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVENTLOG_CANT_START
 
 
 class ErrorLogFileFullError(Win32Error):
-    DESCRIPTION = """The event log file is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_FILE_FULL
 
 
 class ErrorEventlogFileChangedError(Win32Error):
-    DESCRIPTION = """The event log file has changed between read operations."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVENTLOG_FILE_CHANGED
 
 
 class ErrorInvalidTaskNameError(Win32Error):
-    DESCRIPTION = """The specified task name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_TASK_NAME
 
 
 class ErrorInvalidTaskIndexError(Win32Error):
-    DESCRIPTION = """The specified task index is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_TASK_INDEX
 
 
 class ErrorThreadAlreadyInTaskError(Win32Error):
-    DESCRIPTION = """The specified thread is already joining a task."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_THREAD_ALREADY_IN_TASK
 
 
 class ErrorInstallServiceFailureError(Win32Error):
-    DESCRIPTION = """The Windows Installer service could not be accessed. This can occur if the Windows Installer is not correctly installed. Contact your support personnel for assistance."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_SERVICE_FAILURE
 
 
 class ErrorInstallUserexitError(Win32Error):
-    DESCRIPTION = """User canceled installation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_USEREXIT
 
 
 class ErrorInstallFailureError(Win32Error):
-    DESCRIPTION = """Fatal error during installation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_FAILURE
 
 
 class ErrorInstallSuspendError(Win32Error):
-    DESCRIPTION = """Installation suspended, incomplete."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_SUSPEND
 
 
 class ErrorUnknownProductError(Win32Error):
-    DESCRIPTION = """This action is valid only for products that are currently installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_PRODUCT
 
 
 class ErrorUnknownFeatureError(Win32Error):
-    DESCRIPTION = """Feature ID not registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_FEATURE
 
 
 class ErrorUnknownComponentError(Win32Error):
-    DESCRIPTION = """Component ID not registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_COMPONENT
 
 
 class ErrorUnknownPropertyError(Win32Error):
-    DESCRIPTION = """Unknown property."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_PROPERTY
 
 
 class ErrorInvalidHandleStateError(Win32Error):
-    DESCRIPTION = """Handle is in an invalid state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_HANDLE_STATE
 
 
 class ErrorBadConfigurationError(Win32Error):
-    DESCRIPTION = """The configuration data for this product is corrupt. Contact your support personnel."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_CONFIGURATION
 
 
 class ErrorIndexAbsentError(Win32Error):
-    DESCRIPTION = """Component qualifier not present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INDEX_ABSENT
 
 
 class ErrorInstallSourceAbsentError(Win32Error):
-    DESCRIPTION = """The installation source for this product is not available. Verify that the source exists and that you can access it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_SOURCE_ABSENT
 
 
 class ErrorInstallPackageVersionError(Win32Error):
-    DESCRIPTION = """This installation package cannot be installed by the Windows Installer service. You must install a Windows service pack that contains a newer version of the Windows Installer service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_PACKAGE_VERSION
 
 
 class ErrorProductUninstalledError(Win32Error):
-    DESCRIPTION = """Product is uninstalled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRODUCT_UNINSTALLED
 
 
 class ErrorBadQuerySyntaxError(Win32Error):
-    DESCRIPTION = """SQL query syntax invalid or unsupported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_QUERY_SYNTAX
 
 
 class ErrorInvalidFieldError(Win32Error):
-    DESCRIPTION = """Record field does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_FIELD
 
 
 class ErrorDeviceRemovedError(Win32Error):
-    DESCRIPTION = """The device has been removed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_REMOVED
 
 
 class ErrorInstallAlreadyRunningError(Win32Error):
-    DESCRIPTION = """Another installation is already in progress. Complete that installation before proceeding with this install."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_ALREADY_RUNNING
 
 
 class ErrorInstallPackageOpenFailedError(Win32Error):
-    DESCRIPTION = """This installation package could not be opened. Verify that the package exists and that you can access it, or contact the application vendor to verify that this is a valid Windows Installer package."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_PACKAGE_OPEN_FAILED
 
 
 class ErrorInstallPackageInvalidError(Win32Error):
-    DESCRIPTION = """This installation package could not be opened. Contact the application vendor to verify that this is a valid Windows Installer package."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_PACKAGE_INVALID
 
 
 class ErrorInstallUiFailureError(Win32Error):
-    DESCRIPTION = """There was an error starting the Windows Installer service user interface. Contact your support personnel."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_UI_FAILURE
 
 
 class ErrorInstallLogFailureError(Win32Error):
-    DESCRIPTION = """Error opening installation log file. Verify that the specified log file location exists and that you can write to it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_LOG_FAILURE
 
 
 class ErrorInstallLanguageUnsupportedError(Win32Error):
-    DESCRIPTION = """The language of this installation package is not supported by your system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_LANGUAGE_UNSUPPORTED
 
 
 class ErrorInstallTransformFailureError(Win32Error):
-    DESCRIPTION = """Error applying transforms. Verify that the specified transform paths are valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_TRANSFORM_FAILURE
 
 
 class ErrorInstallPackageRejectedError(Win32Error):
-    DESCRIPTION = """This installation is forbidden by system policy. Contact your system administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_PACKAGE_REJECTED
 
 
 class ErrorFunctionNotCalledError(Win32Error):
-    DESCRIPTION = """Function could not be executed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FUNCTION_NOT_CALLED
 
 
 class ErrorFunctionFailedError(Win32Error):
-    DESCRIPTION = """Function failed during execution."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FUNCTION_FAILED
 
 
 class ErrorInvalidTableError(Win32Error):
-    DESCRIPTION = """Invalid or unknown table specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_TABLE
 
 
 class ErrorDatatypeMismatchError(Win32Error):
-    DESCRIPTION = """Data supplied is of wrong type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DATATYPE_MISMATCH
 
 
 class ErrorUnsupportedTypeError(Win32Error):
-    DESCRIPTION = """Data of this type is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNSUPPORTED_TYPE
 
 
 class ErrorCreateFailedError(Win32Error):
-    DESCRIPTION = """The Windows Installer service failed to start. Contact your support personnel."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CREATE_FAILED
 
 
 class ErrorInstallTempUnwritableError(Win32Error):
-    DESCRIPTION = """The Temp folder is on a drive that is full or is inaccessible. Free up space on the drive or verify that you have write permission on the Temp folder."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_TEMP_UNWRITABLE
 
 
 class ErrorInstallPlatformUnsupportedError(Win32Error):
-    DESCRIPTION = """This installation package is not supported by this processor type. Contact your product vendor."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_PLATFORM_UNSUPPORTED
 
 
 class ErrorInstallNotusedError(Win32Error):
-    DESCRIPTION = """Component not used on this computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_NOTUSED
 
 
 class ErrorPatchPackageOpenFailedError(Win32Error):
-    DESCRIPTION = """This update package could not be opened. Verify that the update package exists and that you can access it, or contact the application vendor to verify that this is a valid Windows Installer update package."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_PACKAGE_OPEN_FAILED
 
 
 class ErrorPatchPackageInvalidError(Win32Error):
-    DESCRIPTION = """This update package could not be opened. Contact the application vendor to verify that this is a valid Windows Installer update package."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_PACKAGE_INVALID
 
 
 class ErrorPatchPackageUnsupportedError(Win32Error):
-    DESCRIPTION = """This update package cannot be processed by the Windows Installer service. You must install a Windows service pack that contains a newer version of the Windows Installer service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_PACKAGE_UNSUPPORTED
 
 
 class ErrorProductVersionError(Win32Error):
-    DESCRIPTION = """Another version of this product is already installed. Installation of this version cannot continue. To configure or remove the existing version of this product, use Add/Remove Programs in Control Panel."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRODUCT_VERSION
 
 
 class ErrorInvalidCommandLineError(Win32Error):
-    DESCRIPTION = """Invalid command-line argument. Consult the Windows Installer SDK for detailed command line help."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_COMMAND_LINE
 
 
 class ErrorInstallRemoteDisallowedError(Win32Error):
-    DESCRIPTION = """Only administrators have permission to add, remove, or configure server software during a Terminal Services remote session. If you want to install or configure software on the server, contact your network administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_REMOTE_DISALLOWED
 
 
 class ErrorSuccessRebootInitiatedError(Win32Error):
-    DESCRIPTION = """The requested operation completed successfully. The system will be restarted so the changes can take effect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SUCCESS_REBOOT_INITIATED
 
 
 class ErrorPatchTargetNotFoundError(Win32Error):
-    DESCRIPTION = """The upgrade cannot be installed by the Windows Installer service because the program to be upgraded might be missing, or the upgrade might update a different version of the program. Verify that the program to be upgraded exists on your computer and that you have the correct upgrade."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_TARGET_NOT_FOUND
 
 
 class ErrorPatchPackageRejectedError(Win32Error):
-    DESCRIPTION = """The update package is not permitted by a software restriction policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_PACKAGE_REJECTED
 
 
 class ErrorInstallTransformRejectedError(Win32Error):
-    DESCRIPTION = """One or more customizations are not permitted by a software restriction policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_TRANSFORM_REJECTED
 
 
 class ErrorInstallRemoteProhibitedError(Win32Error):
-    DESCRIPTION = """The Windows Installer does not permit installation from a Remote Desktop Connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_REMOTE_PROHIBITED
 
 
 class ErrorPatchRemovalUnsupportedError(Win32Error):
-    DESCRIPTION = """Uninstallation of the update package is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_REMOVAL_UNSUPPORTED
 
 
 class ErrorUnknownPatchError(Win32Error):
-    DESCRIPTION = """The update is not applied to this product."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_PATCH
 
 
 class ErrorPatchNoSequenceError(Win32Error):
-    DESCRIPTION = """No valid sequence could be found for the set of updates."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_NO_SEQUENCE
 
 
 class ErrorPatchRemovalDisallowedError(Win32Error):
-    DESCRIPTION = """Update removal was disallowed by policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_REMOVAL_DISALLOWED
 
 
 class ErrorInvalidPatchXmlError(Win32Error):
-    DESCRIPTION = """The XML update data is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PATCH_XML
 
 
 class ErrorPatchManagedAdvertisedProductError(Win32Error):
-    DESCRIPTION = """Windows Installer does not permit updating of managed advertised products. At least one feature of the product must be installed before applying the update."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PATCH_MANAGED_ADVERTISED_PRODUCT
 
 
 class ErrorInstallServiceSafebootError(Win32Error):
-    DESCRIPTION = """The Windows Installer service is not accessible in Safe Mode. Try again when your computer is not in Safe Mode or you can use System Restore to return your machine to a previous good state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INSTALL_SERVICE_SAFEBOOT
 
 
 class RpcSInvalidStringBindingError(Win32Error):
-    DESCRIPTION = """The string binding is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_STRING_BINDING
 
 
 class RpcSWrongKindOfBindingError(Win32Error):
-    DESCRIPTION = """The binding handle is not the correct type."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_WRONG_KIND_OF_BINDING
 
 
 class RpcSInvalidBindingError(Win32Error):
-    DESCRIPTION = """The binding handle is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_BINDING
 
 
 class RpcSProtseqNotSupportedError(Win32Error):
-    DESCRIPTION = """The RPC protocol sequence is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PROTSEQ_NOT_SUPPORTED
 
 
 class RpcSInvalidRpcProtseqError(Win32Error):
-    DESCRIPTION = """The RPC protocol sequence is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_RPC_PROTSEQ
 
 
 class RpcSInvalidStringUuidError(Win32Error):
-    DESCRIPTION = """The string UUID is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_STRING_UUID
 
 
 class RpcSInvalidEndpointFormatError(Win32Error):
-    DESCRIPTION = """The endpoint format is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_ENDPOINT_FORMAT
 
 
 class RpcSInvalidNetAddrError(Win32Error):
-    DESCRIPTION = """The network address is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_NET_ADDR
 
 
 class RpcSNoEndpointFoundError(Win32Error):
-    DESCRIPTION = """No endpoint was found."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_ENDPOINT_FOUND
 
 
 class RpcSInvalidTimeoutError(Win32Error):
-    DESCRIPTION = """The time-out value is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_TIMEOUT
 
 
 class RpcSObjectNotFoundError(Win32Error):
-    DESCRIPTION = """The object UUID) was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_OBJECT_NOT_FOUND
 
 
 class RpcSAlreadyRegisteredError(Win32Error):
-    DESCRIPTION = """The object UUID) has already been registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_ALREADY_REGISTERED
 
 
 class RpcSTypeAlreadyRegisteredError(Win32Error):
-    DESCRIPTION = """The type UUID has already been registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_TYPE_ALREADY_REGISTERED
 
 
 class RpcSAlreadyListeningError(Win32Error):
-    DESCRIPTION = """The RPC server is already listening."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_ALREADY_LISTENING
 
 
 class RpcSNoProtseqsRegisteredError(Win32Error):
-    DESCRIPTION = """No protocol sequences have been registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_PROTSEQS_REGISTERED
 
 
 class RpcSNotListeningError(Win32Error):
-    DESCRIPTION = """The RPC server is not listening."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NOT_LISTENING
 
 
 class RpcSUnknownMgrTypeError(Win32Error):
-    DESCRIPTION = """The manager type is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNKNOWN_MGR_TYPE
 
 
 class RpcSUnknownIfError(Win32Error):
-    DESCRIPTION = """The interface is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNKNOWN_IF
 
 
 class RpcSNoBindingsError(Win32Error):
-    DESCRIPTION = """There are no bindings."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_BINDINGS
 
 
 class RpcSNoProtseqsError(Win32Error):
-    DESCRIPTION = """There are no protocol sequences."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_PROTSEQS
 
 
 class RpcSCantCreateEndpointError(Win32Error):
-    DESCRIPTION = """The endpoint cannot be created."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_CANT_CREATE_ENDPOINT
 
 
 class RpcSOutOfResourcesError(Win32Error):
-    DESCRIPTION = """Not enough resources are available to complete this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_OUT_OF_RESOURCES
 
 
 class RpcSServerUnavailableError(Win32Error):
-    DESCRIPTION = """The RPC server is unavailable."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_SERVER_UNAVAILABLE
 
 
 class RpcSServerTooBusyError(Win32Error):
-    DESCRIPTION = """The RPC server is too busy to complete this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_SERVER_TOO_BUSY
 
 
 class RpcSInvalidNetworkOptionsError(Win32Error):
-    DESCRIPTION = """The network options are invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_NETWORK_OPTIONS
 
 
 class RpcSNoCallActiveError(Win32Error):
-    DESCRIPTION = """There are no RPCs active on this thread."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_CALL_ACTIVE
 
 
 class RpcSCallFailedError(Win32Error):
-    DESCRIPTION = """The RPC failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_CALL_FAILED
 
 
 class RpcSCallFailedDneError(Win32Error):
-    DESCRIPTION = """The RPC failed and did not execute."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_CALL_FAILED_DNE
 
 
 class RpcSProtocolErrorError(Win32Error):
-    DESCRIPTION = """An RPC protocol error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PROTOCOL_ERROR
 
 
 class RpcSProxyAccessDeniedError(Win32Error):
-    DESCRIPTION = """Access to the HTTP proxy is denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PROXY_ACCESS_DENIED
 
 
 class RpcSUnsupportedTransSynError(Win32Error):
-    DESCRIPTION = """The transfer syntax is not supported by the RPC server."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNSUPPORTED_TRANS_SYN
 
 
 class RpcSUnsupportedTypeError(Win32Error):
-    DESCRIPTION = """The UUID type is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNSUPPORTED_TYPE
 
 
 class RpcSInvalidTagError(Win32Error):
-    DESCRIPTION = """The tag is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_TAG
 
 
 class RpcSInvalidBoundError(Win32Error):
-    DESCRIPTION = """The array bounds are invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_BOUND
 
 
 class RpcSNoEntryNameError(Win32Error):
-    DESCRIPTION = """The binding does not contain an entry name."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_ENTRY_NAME
 
 
 class RpcSInvalidNameSyntaxError(Win32Error):
-    DESCRIPTION = """The name syntax is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_NAME_SYNTAX
 
 
 class RpcSUnsupportedNameSyntaxError(Win32Error):
-    DESCRIPTION = """The name syntax is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNSUPPORTED_NAME_SYNTAX
 
 
 class RpcSUuidNoAddressError(Win32Error):
-    DESCRIPTION = """No network address is available to use to construct a UUID."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UUID_NO_ADDRESS
 
 
 class RpcSDuplicateEndpointError(Win32Error):
-    DESCRIPTION = """The endpoint is a duplicate."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_DUPLICATE_ENDPOINT
 
 
 class RpcSUnknownAuthnTypeError(Win32Error):
-    DESCRIPTION = """The authentication type is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNKNOWN_AUTHN_TYPE
 
 
 class RpcSMaxCallsTooSmallError(Win32Error):
-    DESCRIPTION = """The maximum number of calls is too small."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_MAX_CALLS_TOO_SMALL
 
 
 class RpcSStringTooLongError(Win32Error):
-    DESCRIPTION = """The string is too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_STRING_TOO_LONG
 
 
 class RpcSProtseqNotFoundError(Win32Error):
-    DESCRIPTION = """The RPC protocol sequence was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PROTSEQ_NOT_FOUND
 
 
 class RpcSProcnumOutOfRangeError(Win32Error):
-    DESCRIPTION = """The procedure number is out of range."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PROCNUM_OUT_OF_RANGE
 
 
 class RpcSBindingHasNoAuthError(Win32Error):
-    DESCRIPTION = """The binding does not contain any authentication information."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_BINDING_HAS_NO_AUTH
 
 
 class RpcSUnknownAuthnServiceError(Win32Error):
-    DESCRIPTION = """The authentication service is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNKNOWN_AUTHN_SERVICE
 
 
 class RpcSUnknownAuthnLevelError(Win32Error):
-    DESCRIPTION = """The authentication level is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNKNOWN_AUTHN_LEVEL
 
 
 class RpcSInvalidAuthIdentityError(Win32Error):
-    DESCRIPTION = """The security context is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_AUTH_IDENTITY
 
 
 class RpcSUnknownAuthzServiceError(Win32Error):
-    DESCRIPTION = """The authorization service is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNKNOWN_AUTHZ_SERVICE
 
 
 class EptSInvalidEntryError(Win32Error):
-    DESCRIPTION = """The entry is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.EPT_S_INVALID_ENTRY
 
 
 class EptSCantPerformOpError(Win32Error):
-    DESCRIPTION = """The server endpoint cannot perform the operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.EPT_S_CANT_PERFORM_OP
 
 
 class EptSNotRegisteredError(Win32Error):
-    DESCRIPTION = """There are no more endpoints available from the endpoint mapper."""
     WIN32_ERROR_CODE = Win32ErrorCode.EPT_S_NOT_REGISTERED
 
 
 class RpcSNothingToExportError(Win32Error):
-    DESCRIPTION = """No interfaces have been exported."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NOTHING_TO_EXPORT
 
 
 class RpcSIncompleteNameError(Win32Error):
-    DESCRIPTION = """The entry name is incomplete."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INCOMPLETE_NAME
 
 
 class RpcSInvalidVersOptionError(Win32Error):
-    DESCRIPTION = """The version option is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_VERS_OPTION
 
 
 class RpcSNoMoreMembersError(Win32Error):
-    DESCRIPTION = """There are no more members."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_MORE_MEMBERS
 
 
 class RpcSNotAllObjsUnexportedError(Win32Error):
-    DESCRIPTION = """There is nothing to unexport."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NOT_ALL_OBJS_UNEXPORTED
 
 
 class RpcSInterfaceNotFoundError(Win32Error):
-    DESCRIPTION = """The interface was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INTERFACE_NOT_FOUND
 
 
 class RpcSEntryAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The entry already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_ENTRY_ALREADY_EXISTS
 
 
 class RpcSEntryNotFoundError(Win32Error):
-    DESCRIPTION = """The entry is not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_ENTRY_NOT_FOUND
 
 
 class RpcSNameServiceUnavailableError(Win32Error):
-    DESCRIPTION = """The name service is unavailable."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NAME_SERVICE_UNAVAILABLE
 
 
 class RpcSInvalidNafIdError(Win32Error):
-    DESCRIPTION = """The network address family is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_NAF_ID
 
 
 class RpcSCannotSupportError(Win32Error):
-    DESCRIPTION = """The requested operation is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_CANNOT_SUPPORT
 
 
 class RpcSNoContextAvailableError(Win32Error):
-    DESCRIPTION = """No security context is available to allow impersonation."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_CONTEXT_AVAILABLE
 
 
 class RpcSInternalErrorError(Win32Error):
-    DESCRIPTION = """An internal error occurred in an RPC."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INTERNAL_ERROR
 
 
 class RpcSZeroDivideError(Win32Error):
-    DESCRIPTION = """The RPC server attempted an integer division by zero."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_ZERO_DIVIDE
 
 
 class RpcSAddressErrorError(Win32Error):
-    DESCRIPTION = """An addressing error occurred in the RPC server."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_ADDRESS_ERROR
 
 
 class RpcSFpDivZeroError(Win32Error):
-    DESCRIPTION = """A floating-point operation at the RPC server caused a division by zero."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_FP_DIV_ZERO
 
 
 class RpcSFpUnderflowError(Win32Error):
-    DESCRIPTION = """A floating-point underflow occurred at the RPC server."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_FP_UNDERFLOW
 
 
 class RpcSFpOverflowError(Win32Error):
-    DESCRIPTION = """A floating-point overflow occurred at the RPC server."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_FP_OVERFLOW
 
 
 class RpcXNoMoreEntriesError(Win32Error):
-    DESCRIPTION = """The list of RPC servers available for the binding of auto handles has been exhausted."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_NO_MORE_ENTRIES
 
 
 class RpcXSsCharTransOpenFailError(Win32Error):
-    DESCRIPTION = """Unable to open the character translation table file."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_SS_CHAR_TRANS_OPEN_FAIL
 
 
 class RpcXSsCharTransShortFileError(Win32Error):
-    DESCRIPTION = """The file containing the character translation table has fewer than 512 bytes."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_SS_CHAR_TRANS_SHORT_FILE
 
 
 class RpcXSsInNullContextError(Win32Error):
-    DESCRIPTION = """A null context handle was passed from the client to the host during an RPC."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_SS_IN_NULL_CONTEXT
 
 
 class RpcXSsContextDamagedError(Win32Error):
-    DESCRIPTION = """The context handle changed during an RPC."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_SS_CONTEXT_DAMAGED
 
 
 class RpcXSsHandlesMismatchError(Win32Error):
-    DESCRIPTION = """The binding handles passed to an RPC do not match."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_SS_HANDLES_MISMATCH
 
 
 class RpcXSsCannotGetCallHandleError(Win32Error):
-    DESCRIPTION = """The stub is unable to get the RPC handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_SS_CANNOT_GET_CALL_HANDLE
 
 
 class RpcXNullRefPointerError(Win32Error):
-    DESCRIPTION = """A null reference pointer was passed to the stub."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_NULL_REF_POINTER
 
 
 class RpcXEnumValueOutOfRangeError(Win32Error):
-    DESCRIPTION = """The enumeration value is out of range."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_ENUM_VALUE_OUT_OF_RANGE
 
 
 class RpcXByteCountTooSmallError(Win32Error):
-    DESCRIPTION = """The byte count is too small."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_BYTE_COUNT_TOO_SMALL
 
 
 class RpcXBadStubDataError(Win32Error):
-    DESCRIPTION = """The stub received bad data."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_BAD_STUB_DATA
 
 
 class ErrorInvalidUserBufferError(Win32Error):
-    DESCRIPTION = """The supplied user buffer is not valid for the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_USER_BUFFER
 
 
 class ErrorUnrecognizedMediaError(Win32Error):
-    DESCRIPTION = """The disk media is not recognized. It might not be formatted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNRECOGNIZED_MEDIA
 
 
 class ErrorNoTrustLsaSecretError(Win32Error):
-    DESCRIPTION = """The workstation does not have a trust secret."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_TRUST_LSA_SECRET
 
 
 class ErrorNoTrustSamAccountError(Win32Error):
-    DESCRIPTION = """The security database on the server does not have a computer account for this workstation trust relationship."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_TRUST_SAM_ACCOUNT
 
 
 class ErrorTrustedDomainFailureError(Win32Error):
-    DESCRIPTION = """The trust relationship between the primary domain and the trusted domain failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRUSTED_DOMAIN_FAILURE
 
 
 class ErrorTrustedRelationshipFailureError(Win32Error):
-    DESCRIPTION = """The trust relationship between this workstation and the primary domain failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRUSTED_RELATIONSHIP_FAILURE
 
 
 class ErrorTrustFailureError(Win32Error):
-    DESCRIPTION = """The network logon failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRUST_FAILURE
 
 
 class RpcSCallInProgressError(Win32Error):
-    DESCRIPTION = """An RPC is already in progress for this thread."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_CALL_IN_PROGRESS
 
 
 class ErrorNetlogonNotStartedError(Win32Error):
-    DESCRIPTION = """An attempt was made to log on, but the network logon service was not started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NETLOGON_NOT_STARTED
 
 
 class ErrorAccountExpiredError(Win32Error):
-    DESCRIPTION = """The user's account has expired."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCOUNT_EXPIRED
 
 
 class ErrorRedirectorHasOpenHandlesError(Win32Error):
-    DESCRIPTION = """The redirector is in use and cannot be unloaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REDIRECTOR_HAS_OPEN_HANDLES
 
 
 class ErrorPrinterDriverAlreadyInstalledError(Win32Error):
-    DESCRIPTION = """The specified printer driver is already installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_DRIVER_ALREADY_INSTALLED
 
 
 class ErrorUnknownPortError(Win32Error):
-    DESCRIPTION = """The specified port is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_PORT
 
 
 class ErrorUnknownPrinterDriverError(Win32Error):
-    DESCRIPTION = """The printer driver is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_PRINTER_DRIVER
 
 
 class ErrorUnknownPrintprocessorError(Win32Error):
-    DESCRIPTION = """The print processor is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_PRINTPROCESSOR
 
 
 class ErrorInvalidSeparatorFileError(Win32Error):
-    DESCRIPTION = """The specified separator file is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_SEPARATOR_FILE
 
 
 class ErrorInvalidPriorityError(Win32Error):
-    DESCRIPTION = """The specified priority is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PRIORITY
 
 
 class ErrorInvalidPrinterNameError(Win32Error):
-    DESCRIPTION = """The printer name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PRINTER_NAME
 
 
 class ErrorPrinterAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The printer already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_ALREADY_EXISTS
 
 
 class ErrorInvalidPrinterCommandError(Win32Error):
-    DESCRIPTION = """The printer command is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PRINTER_COMMAND
 
 
 class ErrorInvalidDatatypeError(Win32Error):
-    DESCRIPTION = """The specified data type is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DATATYPE
 
 
 class ErrorInvalidEnvironmentError(Win32Error):
-    DESCRIPTION = """The environment specified is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_ENVIRONMENT
 
 
 class RpcSNoMoreBindingsError(Win32Error):
-    DESCRIPTION = """There are no more bindings."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_MORE_BINDINGS
 
 
 class ErrorNologonInterdomainTrustAccountError(Win32Error):
-    DESCRIPTION = """The account used is an interdomain trust account. Use your global user account or local user account to access this server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOLOGON_INTERDOMAIN_TRUST_ACCOUNT
 
 
 class ErrorNologonWorkstationTrustAccountError(Win32Error):
-    DESCRIPTION = """The account used is a computer account. Use your global user account or local user account to access this server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOLOGON_WORKSTATION_TRUST_ACCOUNT
 
 
 class ErrorNologonServerTrustAccountError(Win32Error):
-    DESCRIPTION = """The account used is a server trust account. Use your global user account or local user account to access this server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOLOGON_SERVER_TRUST_ACCOUNT
 
 
 class ErrorDomainTrustInconsistentError(Win32Error):
-    DESCRIPTION = """The name or SID of the domain specified is inconsistent with the trust information for that domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DOMAIN_TRUST_INCONSISTENT
 
 
 class ErrorServerHasOpenHandlesError(Win32Error):
-    DESCRIPTION = """The server is in use and cannot be unloaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SERVER_HAS_OPEN_HANDLES
 
 
 class ErrorResourceDataNotFoundError(Win32Error):
-    DESCRIPTION = """The specified image file did not contain a resource section."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_DATA_NOT_FOUND
 
 
 class ErrorResourceTypeNotFoundError(Win32Error):
-    DESCRIPTION = """The specified resource type cannot be found in the image file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_TYPE_NOT_FOUND
 
 
 class ErrorResourceNameNotFoundError(Win32Error):
-    DESCRIPTION = """The specified resource name cannot be found in the image file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_NAME_NOT_FOUND
 
 
 class ErrorResourceLangNotFoundError(Win32Error):
-    DESCRIPTION = """The specified resource language ID cannot be found in the image file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_LANG_NOT_FOUND
 
 
 class ErrorNotEnoughQuotaError(Win32Error):
-    DESCRIPTION = """Not enough quota is available to process this command."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_ENOUGH_QUOTA
 
 
 class RpcSNoInterfacesError(Win32Error):
-    DESCRIPTION = """No interfaces have been registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_INTERFACES
 
 
 class RpcSCallCancelledError(Win32Error):
-    DESCRIPTION = """The RPC was canceled."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_CALL_CANCELLED
 
 
 class RpcSBindingIncompleteError(Win32Error):
-    DESCRIPTION = """The binding handle does not contain all the required information."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_BINDING_INCOMPLETE
 
 
 class RpcSCommFailureError(Win32Error):
-    DESCRIPTION = """A communications failure occurred during an RPC."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_COMM_FAILURE
 
 
 class RpcSUnsupportedAuthnLevelError(Win32Error):
-    DESCRIPTION = """The requested authentication level is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UNSUPPORTED_AUTHN_LEVEL
 
 
 class RpcSNoPrincNameError(Win32Error):
-    DESCRIPTION = """No principal name is registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NO_PRINC_NAME
 
 
 class RpcSNotRpcErrorError(Win32Error):
-    DESCRIPTION = """The error specified is not a valid Windows RPC error code."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NOT_RPC_ERROR
 
 
 class RpcSUuidLocalOnlyError(Win32Error):
-    DESCRIPTION = """A UUID that is valid only on this computer has been allocated."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_UUID_LOCAL_ONLY
 
 
 class RpcSSecPkgErrorError(Win32Error):
-    DESCRIPTION = """A security package-specific error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_SEC_PKG_ERROR
 
 
 class RpcSNotCancelledError(Win32Error):
-    DESCRIPTION = """The thread is not canceled."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NOT_CANCELLED
 
 
 class RpcXInvalidEsActionError(Win32Error):
-    DESCRIPTION = """Invalid operation on the encoding/decoding handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_INVALID_ES_ACTION
 
 
 class RpcXWrongEsVersionError(Win32Error):
-    DESCRIPTION = """Incompatible version of the serializing package."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_WRONG_ES_VERSION
 
 
 class RpcXWrongStubVersionError(Win32Error):
-    DESCRIPTION = """Incompatible version of the RPC stub."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_WRONG_STUB_VERSION
 
 
 class RpcXInvalidPipeObjectError(Win32Error):
-    DESCRIPTION = """The RPC pipe object is invalid or corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_INVALID_PIPE_OBJECT
 
 
 class RpcXWrongPipeOrderError(Win32Error):
-    DESCRIPTION = """An invalid operation was attempted on an RPC pipe object."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_WRONG_PIPE_ORDER
 
 
 class RpcXWrongPipeVersionError(Win32Error):
-    DESCRIPTION = """Unsupported RPC pipe version."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_WRONG_PIPE_VERSION
 
 
 class RpcSGroupMemberNotFoundError(Win32Error):
-    DESCRIPTION = """The group member was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_GROUP_MEMBER_NOT_FOUND
 
 
 class EptSCantCreateError(Win32Error):
-    DESCRIPTION = """The endpoint mapper database entry could not be created."""
     WIN32_ERROR_CODE = Win32ErrorCode.EPT_S_CANT_CREATE
 
 
 class RpcSInvalidObjectError(Win32Error):
-    DESCRIPTION = """The object UUID is the nil UUID."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_OBJECT
 
 
 class ErrorInvalidTimeError(Win32Error):
-    DESCRIPTION = """The specified time is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_TIME
 
 
 class ErrorInvalidFormNameError(Win32Error):
-    DESCRIPTION = """The specified form name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_FORM_NAME
 
 
 class ErrorInvalidFormSizeError(Win32Error):
-    DESCRIPTION = """The specified form size is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_FORM_SIZE
 
 
 class ErrorAlreadyWaitingError(Win32Error):
-    DESCRIPTION = """The specified printer handle is already being waited on."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALREADY_WAITING
 
 
 class ErrorPrinterDeletedError(Win32Error):
-    DESCRIPTION = """The specified printer has been deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_DELETED
 
 
 class ErrorInvalidPrinterStateError(Win32Error):
-    DESCRIPTION = """The state of the printer is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PRINTER_STATE
 
 
 class ErrorPasswordMustChangeError(Win32Error):
-    DESCRIPTION = """The user's password must be changed before logging on the first time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PASSWORD_MUST_CHANGE
 
 
 class ErrorDomainControllerNotFoundError(Win32Error):
-    DESCRIPTION = """Could not find the domain controller for this domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DOMAIN_CONTROLLER_NOT_FOUND
 
 
 class ErrorAccountLockedOutError(Win32Error):
-    DESCRIPTION = """The referenced account is currently locked out and cannot be logged on to."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACCOUNT_LOCKED_OUT
 
 
 class OrInvalidOxidError(Win32Error):
-    DESCRIPTION = """The object exporter specified was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.OR_INVALID_OXID
 
 
 class OrInvalidOidError(Win32Error):
-    DESCRIPTION = """The object specified was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.OR_INVALID_OID
 
 
 class OrInvalidSetError(Win32Error):
-    DESCRIPTION = """The object set specified was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.OR_INVALID_SET
 
 
 class RpcSSendIncompleteError(Win32Error):
-    DESCRIPTION = """Some data remains to be sent in the request buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_SEND_INCOMPLETE
 
 
 class RpcSInvalidAsyncHandleError(Win32Error):
-    DESCRIPTION = """Invalid asynchronous RPC handle."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_ASYNC_HANDLE
 
 
 class RpcSInvalidAsyncCallError(Win32Error):
-    DESCRIPTION = """Invalid asynchronous RPC call handle for this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INVALID_ASYNC_CALL
 
 
 class RpcXPipeClosedError(Win32Error):
-    DESCRIPTION = """The RPC pipe object has already been closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_PIPE_CLOSED
 
 
 class RpcXPipeDisciplineErrorError(Win32Error):
-    DESCRIPTION = """The RPC call completed before all pipes were processed."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_PIPE_DISCIPLINE_ERROR
 
 
 class RpcXPipeEmptyError(Win32Error):
-    DESCRIPTION = """No more data is available from the RPC pipe."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_X_PIPE_EMPTY
 
 
 class ErrorNoSitenameError(Win32Error):
-    DESCRIPTION = """No site name is available for this machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SITENAME
 
 
 class ErrorCantAccessFileError(Win32Error):
-    DESCRIPTION = """The file cannot be accessed by the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_ACCESS_FILE
 
 
 class ErrorCantResolveFilenameError(Win32Error):
-    DESCRIPTION = """The name of the file cannot be resolved by the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_RESOLVE_FILENAME
 
 
 class RpcSEntryTypeMismatchError(Win32Error):
-    DESCRIPTION = """The entry is not of the expected type."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_ENTRY_TYPE_MISMATCH
 
 
 class RpcSNotAllObjsExportedError(Win32Error):
-    DESCRIPTION = """Not all object UUIDs could be exported to the specified entry."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_NOT_ALL_OBJS_EXPORTED
 
 
 class RpcSInterfaceNotExportedError(Win32Error):
-    DESCRIPTION = """The interface could not be exported to the specified entry."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_INTERFACE_NOT_EXPORTED
 
 
 class RpcSProfileNotAddedError(Win32Error):
-    DESCRIPTION = """The specified profile entry could not be added."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PROFILE_NOT_ADDED
 
 
 class RpcSPrfEltNotAddedError(Win32Error):
-    DESCRIPTION = """The specified profile element could not be added."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PRF_ELT_NOT_ADDED
 
 
 class RpcSPrfEltNotRemovedError(Win32Error):
-    DESCRIPTION = """The specified profile element could not be removed."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_PRF_ELT_NOT_REMOVED
 
 
 class RpcSGrpEltNotAddedError(Win32Error):
-    DESCRIPTION = """The group element could not be added."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_GRP_ELT_NOT_ADDED
 
 
 class RpcSGrpEltNotRemovedError(Win32Error):
-    DESCRIPTION = """The group element could not be removed."""
     WIN32_ERROR_CODE = Win32ErrorCode.RPC_S_GRP_ELT_NOT_REMOVED
 
 
 class ErrorKmDriverBlockedError(Win32Error):
-    DESCRIPTION = """The printer driver is not compatible with a policy enabled on your computer that blocks Windows NT 4.0 operating system drivers."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_KM_DRIVER_BLOCKED
 
 
 class ErrorContextExpiredError(Win32Error):
-    DESCRIPTION = """The context has expired and can no longer be used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONTEXT_EXPIRED
 
 
 class ErrorPerUserTrustQuotaExceededError(Win32Error):
-    DESCRIPTION = """The current user's delegated trust creation quota has been exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PER_USER_TRUST_QUOTA_EXCEEDED
 
 
 class ErrorAllUserTrustQuotaExceededError(Win32Error):
-    DESCRIPTION = """The total delegated trust creation quota has been exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALL_USER_TRUST_QUOTA_EXCEEDED
 
 
 class ErrorUserDeleteTrustQuotaExceededError(Win32Error):
-    DESCRIPTION = """The current user's delegated trust deletion quota has been exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_USER_DELETE_TRUST_QUOTA_EXCEEDED
 
 
 class ErrorAuthenticationFirewallFailedError(Win32Error):
-    DESCRIPTION = """Logon failure: The machine you are logging on to is protected by an authentication firewall. The specified account is not allowed to authenticate to the machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_AUTHENTICATION_FIREWALL_FAILED
 
 
 class ErrorRemotePrintConnectionsBlockedError(Win32Error):
-    DESCRIPTION = """Remote connections to the Print Spooler are blocked by a policy set on your machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REMOTE_PRINT_CONNECTIONS_BLOCKED
 
 
 class ErrorInvalidPixelFormatError(Win32Error):
-    DESCRIPTION = """The pixel format is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PIXEL_FORMAT
 
 
 class ErrorBadDriverError(Win32Error):
-    DESCRIPTION = """The specified driver is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_DRIVER
 
 
 class ErrorInvalidWindowStyleError(Win32Error):
-    DESCRIPTION = """The window style or class attribute is invalid for this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_WINDOW_STYLE
 
 
 class ErrorMetafileNotSupportedError(Win32Error):
-    DESCRIPTION = """The requested metafile operation is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_METAFILE_NOT_SUPPORTED
 
 
 class ErrorTransformNotSupportedError(Win32Error):
-    DESCRIPTION = """The requested transformation operation is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSFORM_NOT_SUPPORTED
 
 
 class ErrorClippingNotSupportedError(Win32Error):
-    DESCRIPTION = """The requested clipping operation is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLIPPING_NOT_SUPPORTED
 
 
 class ErrorInvalidCmmError(Win32Error):
-    DESCRIPTION = """The specified color management module is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_CMM
 
 
 class ErrorInvalidProfileError(Win32Error):
-    DESCRIPTION = """The specified color profile is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PROFILE
 
 
 class ErrorTagNotFoundError(Win32Error):
-    DESCRIPTION = """The specified tag was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TAG_NOT_FOUND
 
 
 class ErrorTagNotPresentError(Win32Error):
-    DESCRIPTION = """A required tag is not present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TAG_NOT_PRESENT
 
 
 class ErrorDuplicateTagError(Win32Error):
-    DESCRIPTION = """The specified tag is already present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DUPLICATE_TAG
 
 
 class ErrorProfileNotAssociatedWithDeviceError(Win32Error):
-    DESCRIPTION = """The specified color profile is not associated with any device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROFILE_NOT_ASSOCIATED_WITH_DEVICE
 
 
 class ErrorProfileNotFoundError(Win32Error):
-    DESCRIPTION = """The specified color profile was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROFILE_NOT_FOUND
 
 
 class ErrorInvalidColorspaceError(Win32Error):
-    DESCRIPTION = """The specified color space is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_COLORSPACE
 
 
 class ErrorIcmNotEnabledError(Win32Error):
-    DESCRIPTION = """Image Color Management is not enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ICM_NOT_ENABLED
 
 
 class ErrorDeletingIcmXformError(Win32Error):
-    DESCRIPTION = """There was an error while deleting the color transform."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DELETING_ICM_XFORM
 
 
 class ErrorInvalidTransformError(Win32Error):
-    DESCRIPTION = """The specified color transform is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_TRANSFORM
 
 
 class ErrorColorspaceMismatchError(Win32Error):
-    DESCRIPTION = """The specified transform does not match the bitmap's color space."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_COLORSPACE_MISMATCH
 
 
 class ErrorInvalidColorindexError(Win32Error):
-    DESCRIPTION = """The specified named color index is not present in the profile."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_COLORINDEX
 
 
 class ErrorProfileDoesNotMatchDeviceError(Win32Error):
-    DESCRIPTION = """The specified profile is intended for a device of a different type than the specified device."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROFILE_DOES_NOT_MATCH_DEVICE
 
 
 class NerrNetnotstartedError(Win32Error):
-    DESCRIPTION = """The workstation driver is not installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NetNotStarted
 
 
 class NerrUnknownserverError(Win32Error):
-    DESCRIPTION = """The server could not be located."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UnknownServer
 
 
 class NerrSharememError(Win32Error):
-    DESCRIPTION = """An internal error occurred. The network cannot access a shared memory segment."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ShareMem
 
 
 class NerrNonetworkresourceError(Win32Error):
-    DESCRIPTION = """A network resource shortage occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoNetworkResource
 
 
 class NerrRemoteonlyError(Win32Error):
-    DESCRIPTION = """This operation is not supported on workstations."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RemoteOnly
 
 
 class NerrDevnotredirectedError(Win32Error):
-    DESCRIPTION = """The device is not connected."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DevNotRedirected
 
 
 class ErrorConnectedOtherPasswordError(Win32Error):
-    DESCRIPTION = """The network connection was made successfully, but the user had to be prompted for a password other than the one originally specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTED_OTHER_PASSWORD
 
 
 class ErrorConnectedOtherPasswordDefaultError(Win32Error):
-    DESCRIPTION = """The network connection was made successfully using default credentials."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONNECTED_OTHER_PASSWORD_DEFAULT
 
 
 class NerrServernotstartedError(Win32Error):
-    DESCRIPTION = """The Server service is not started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServerNotStarted
 
 
 class NerrItemnotfoundError(Win32Error):
-    DESCRIPTION = """The queue is empty."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ItemNotFound
 
 
 class NerrUnknowndevdirError(Win32Error):
-    DESCRIPTION = """The device or directory does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UnknownDevDir
 
 
 class NerrRedirectedpathError(Win32Error):
-    DESCRIPTION = """The operation is invalid on a redirected resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RedirectedPath
 
 
 class NerrDuplicateshareError(Win32Error):
-    DESCRIPTION = """The name has already been shared."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DuplicateShare
 
 
 class NerrNoroomError(Win32Error):
-    DESCRIPTION = """The server is currently out of the requested resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoRoom
 
 
 class NerrToomanyitemsError(Win32Error):
-    DESCRIPTION = """Requested addition of items exceeds the maximum allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyItems
 
 
 class NerrInvalidmaxusersError(Win32Error):
-    DESCRIPTION = """The Peer service supports only two simultaneous users."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidMaxUsers
 
 
 class NerrBuftoosmallError(Win32Error):
-    DESCRIPTION = """The API return buffer is too small."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BufTooSmall
 
 
 class NerrRemoteerrError(Win32Error):
-    DESCRIPTION = """A remote API error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RemoteErr
 
 
 class NerrLanmaninierrorError(Win32Error):
-    DESCRIPTION = """An error occurred when opening or reading the configuration file."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LanmanIniError
 
 
 class NerrNetworkerrorError(Win32Error):
-    DESCRIPTION = """A general network error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NetworkError
 
 
 class NerrWkstainconsistentstateError(Win32Error):
-    DESCRIPTION = """The Workstation service is in an inconsistent state. Restart the computer before restarting the Workstation service."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_WkstaInconsistentState
 
 
 class NerrWkstanotstartedError(Win32Error):
-    DESCRIPTION = """The Workstation service has not been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_WkstaNotStarted
 
 
 class NerrBrowsernotstartedError(Win32Error):
-    DESCRIPTION = """The requested information is not available."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BrowserNotStarted
 
 
 class NerrInternalerrorError(Win32Error):
-    DESCRIPTION = """An internal error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InternalError
 
 
 class NerrBadtransactconfigError(Win32Error):
-    DESCRIPTION = """The server is not configured for transactions."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadTransactConfig
 
 
 class NerrInvalidapiError(Win32Error):
-    DESCRIPTION = """The requested API is not supported on the remote server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidAPI
 
 
 class NerrBadeventnameError(Win32Error):
-    DESCRIPTION = """The event name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadEventName
 
 
 class NerrDupnamerebootError(Win32Error):
-    DESCRIPTION = """The computer name already exists on the network. Change it and reboot the computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DupNameReboot
 
 
 class NerrCfgcompnotfoundError(Win32Error):
-    DESCRIPTION = """The specified component could not be found in the configuration information."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CfgCompNotFound
 
 
 class NerrCfgparamnotfoundError(Win32Error):
-    DESCRIPTION = """The specified parameter could not be found in the configuration information."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CfgParamNotFound
 
 
 class NerrLinetoolongError(Win32Error):
-    DESCRIPTION = """A line in the configuration file is too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LineTooLong
 
 
 class NerrQnotfoundError(Win32Error):
-    DESCRIPTION = """The printer does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_QNotFound
 
 
 class NerrJobnotfoundError(Win32Error):
-    DESCRIPTION = """The print job does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_JobNotFound
 
 
 class NerrDestnotfoundError(Win32Error):
-    DESCRIPTION = """The printer destination cannot be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DestNotFound
 
 
 class NerrDestexistsError(Win32Error):
-    DESCRIPTION = """The printer destination already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DestExists
 
 
 class NerrQexistsError(Win32Error):
-    DESCRIPTION = """The print queue already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_QExists
 
 
 class NerrQnoroomError(Win32Error):
-    DESCRIPTION = """No more printers can be added."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_QNoRoom
 
 
 class NerrJobnoroomError(Win32Error):
-    DESCRIPTION = """No more print jobs can be added."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_JobNoRoom
 
 
 class NerrDestnoroomError(Win32Error):
-    DESCRIPTION = """No more printer destinations can be added."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DestNoRoom
 
 
 class NerrDestidleError(Win32Error):
-    DESCRIPTION = """This printer destination is idle and cannot accept control operations."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DestIdle
 
 
 class NerrDestinvalidopError(Win32Error):
-    DESCRIPTION = """This printer destination request contains an invalid control function."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DestInvalidOp
 
 
 class NerrProcnorespondError(Win32Error):
-    DESCRIPTION = """The print processor is not responding."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProcNoRespond
 
 
 class NerrSpoolernotloadedError(Win32Error):
-    DESCRIPTION = """The spooler is not running."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SpoolerNotLoaded
 
 
 class NerrDestinvalidstateError(Win32Error):
-    DESCRIPTION = """This operation cannot be performed on the print destination in its current state."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DestInvalidState
 
 
 class NerrQinvalidstateError(Win32Error):
-    DESCRIPTION = """This operation cannot be performed on the print queue in its current state."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_QinvalidState
 
 
 class NerrJobinvalidstateError(Win32Error):
-    DESCRIPTION = """This operation cannot be performed on the print job in its current state."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_JobInvalidState
 
 
 class NerrSpoolnomemoryError(Win32Error):
-    DESCRIPTION = """A spooler memory allocation failure occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SpoolNoMemory
 
 
 class NerrDrivernotfoundError(Win32Error):
-    DESCRIPTION = """The device driver does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DriverNotFound
 
 
 class NerrDatatypeinvalidError(Win32Error):
-    DESCRIPTION = """The data type is not supported by the print processor."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DataTypeInvalid
 
 
 class NerrProcnotfoundError(Win32Error):
-    DESCRIPTION = """The print processor is not installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProcNotFound
 
 
 class NerrServicetablelockedError(Win32Error):
-    DESCRIPTION = """The service database is locked."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceTableLocked
 
 
 class NerrServicetablefullError(Win32Error):
-    DESCRIPTION = """The service table is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceTableFull
 
 
 class NerrServiceinstalledError(Win32Error):
-    DESCRIPTION = """The requested service has already been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceInstalled
 
 
 class NerrServiceentrylockedError(Win32Error):
-    DESCRIPTION = """The service does not respond to control actions."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceEntryLocked
 
 
 class NerrServicenotinstalledError(Win32Error):
-    DESCRIPTION = """The service has not been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceNotInstalled
 
 
 class NerrBadservicenameError(Win32Error):
-    DESCRIPTION = """The service name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadServiceName
 
 
 class NerrServicectltimeoutError(Win32Error):
-    DESCRIPTION = """The service is not responding to the control function."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceCtlTimeout
 
 
 class NerrServicectlbusyError(Win32Error):
-    DESCRIPTION = """The service control is busy."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceCtlBusy
 
 
 class NerrBadserviceprognameError(Win32Error):
-    DESCRIPTION = """The configuration file contains an invalid service program name."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadServiceProgName
 
 
 class NerrServicenotctrlError(Win32Error):
-    DESCRIPTION = """The service could not be controlled in its present state."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceNotCtrl
 
 
 class NerrServicekillprocError(Win32Error):
-    DESCRIPTION = """The service ended abnormally."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceKillProc
 
 
 class NerrServicectlnotvalidError(Win32Error):
-    DESCRIPTION = """The requested pause or stop is not valid for this service."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceCtlNotValid
 
 
 class NerrNotindispatchtblError(Win32Error):
-    DESCRIPTION = """The service control dispatcher could not find the service name in the dispatch table."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NotInDispatchTbl
 
 
 class NerrBadcontrolrecvError(Win32Error):
-    DESCRIPTION = """The service control dispatcher pipe read failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadControlRecv
 
 
 class NerrServicenotstartingError(Win32Error):
-    DESCRIPTION = """A thread for the new service could not be created."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ServiceNotStarting
 
 
 class NerrAlreadyloggedonError(Win32Error):
-    DESCRIPTION = """This workstation is already logged on to the LAN."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AlreadyLoggedOn
 
 
 class NerrNotloggedonError(Win32Error):
-    DESCRIPTION = """The workstation is not logged on to the LAN."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NotLoggedOn
 
 
 class NerrBadusernameError(Win32Error):
-    DESCRIPTION = """The user name or group name parameter is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadUsername
 
 
 class NerrBadpasswordError(Win32Error):
-    DESCRIPTION = """The password parameter is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadPassword
 
 
 class NerrUnabletoaddnameWError(Win32Error):
-    DESCRIPTION = """The logon processor did not add the message alias."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UnableToAddName_W
 
 
 class NerrUnabletoaddnameFError(Win32Error):
-    DESCRIPTION = """The logon processor did not add the message alias."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UnableToAddName_F
 
 
 class NerrUnabletodelnameWError(Win32Error):
-    DESCRIPTION = """@W The logoff processor did not delete the message alias."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UnableToDelName_W
 
 
 class NerrUnabletodelnameFError(Win32Error):
-    DESCRIPTION = """The logoff processor did not delete the message alias."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UnableToDelName_F
 
 
 class NerrLogonspausedError(Win32Error):
-    DESCRIPTION = """Network logons are paused."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogonsPaused
 
 
 class NerrLogonserverconflictError(Win32Error):
-    DESCRIPTION = """A centralized logon server conflict occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogonServerConflict
 
 
 class NerrLogonnouserpathError(Win32Error):
-    DESCRIPTION = """The server is configured without a valid user path."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogonNoUserPath
 
 
 class NerrLogonscripterrorError(Win32Error):
-    DESCRIPTION = """An error occurred while loading or running the logon script."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogonScriptError
 
 
 class NerrStandalonelogonError(Win32Error):
-    DESCRIPTION = """The logon server was not specified. The computer will be logged on as STANDALONE."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_StandaloneLogon
 
 
 class NerrLogonservernotfoundError(Win32Error):
-    DESCRIPTION = """The logon server could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogonServerNotFound
 
 
 class NerrLogondomainexistsError(Win32Error):
-    DESCRIPTION = """There is already a logon domain for this computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogonDomainExists
 
 
 class NerrNonvalidatedlogonError(Win32Error):
-    DESCRIPTION = """The logon server could not validate the logon."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NonValidatedLogon
 
 
 class NerrAcfnotfoundError(Win32Error):
-    DESCRIPTION = """The security database could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ACFNotFound
 
 
 class NerrGroupnotfoundError(Win32Error):
-    DESCRIPTION = """The group name could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_GroupNotFound
 
 
 class NerrUsernotfoundError(Win32Error):
-    DESCRIPTION = """The user name could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UserNotFound
 
 
 class NerrResourcenotfoundError(Win32Error):
-    DESCRIPTION = """The resource name could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ResourceNotFound
 
 
 class NerrGroupexistsError(Win32Error):
-    DESCRIPTION = """The group already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_GroupExists
 
 
 class NerrUserexistsError(Win32Error):
-    DESCRIPTION = """The user account already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UserExists
 
 
 class NerrResourceexistsError(Win32Error):
-    DESCRIPTION = """The resource permission list already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ResourceExists
 
 
 class NerrNotprimaryError(Win32Error):
-    DESCRIPTION = """This operation is allowed only on the PDC of the domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NotPrimary
 
 
 class NerrAcfnotloadedError(Win32Error):
-    DESCRIPTION = """The security database has not been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ACFNotLoaded
 
 
 class NerrAcfnoroomError(Win32Error):
-    DESCRIPTION = """There are too many names in the user accounts database."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ACFNoRoom
 
 
 class NerrAcffileiofailError(Win32Error):
-    DESCRIPTION = """A disk I/O failure occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ACFFileIOFail
 
 
 class NerrAcftoomanylistsError(Win32Error):
-    DESCRIPTION = """The limit of 64 entries per resource was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ACFTooManyLists
 
 
 class NerrUserlogonError(Win32Error):
-    DESCRIPTION = """Deleting a user with a session is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UserLogon
 
 
 class NerrAcfnoparentError(Win32Error):
-    DESCRIPTION = """The parent directory could not be located."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ACFNoParent
 
 
 class NerrCannotgrowsegmentError(Win32Error):
-    DESCRIPTION = """Unable to add to the security database session cache segment."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CanNotGrowSegment
 
 
 class NerrSpegroupopError(Win32Error):
-    DESCRIPTION = """This operation is not allowed on this special group."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SpeGroupOp
 
 
 class NerrNotincacheError(Win32Error):
-    DESCRIPTION = """This user is not cached in the user accounts database session cache."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NotInCache
 
 
 class NerrUseringroupError(Win32Error):
-    DESCRIPTION = """The user already belongs to this group."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UserInGroup
 
 
 class NerrUsernotingroupError(Win32Error):
-    DESCRIPTION = """The user does not belong to this group."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UserNotInGroup
 
 
 class NerrAccountundefinedError(Win32Error):
-    DESCRIPTION = """This user account is undefined."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AccountUndefined
 
 
 class NerrAccountexpiredError(Win32Error):
-    DESCRIPTION = """This user account has expired."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AccountExpired
 
 
 class NerrInvalidworkstationError(Win32Error):
-    DESCRIPTION = """The user is not allowed to log on from this workstation."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidWorkstation
 
 
 class NerrInvalidlogonhoursError(Win32Error):
-    DESCRIPTION = """The user is not allowed to log on at this time."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidLogonHours
 
 
 class NerrPasswordexpiredError(Win32Error):
-    DESCRIPTION = """The password of this user has expired."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordExpired
 
 
 class NerrPasswordcantchangeError(Win32Error):
-    DESCRIPTION = """The password of this user cannot change."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordCantChange
 
 
 class NerrPasswordhistconflictError(Win32Error):
-    DESCRIPTION = """This password cannot be used now."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordHistConflict
 
 
 class NerrPasswordtooshortError(Win32Error):
-    DESCRIPTION = """The password does not meet the password policy requirements. Check the minimum password length, password complexity, and password history requirements."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordTooShort
 
 
 class NerrPasswordtoorecentError(Win32Error):
-    DESCRIPTION = """The password of this user is too recent to change."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordTooRecent
 
 
 class NerrInvaliddatabaseError(Win32Error):
-    DESCRIPTION = """The security database is corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidDatabase
 
 
 class NerrDatabaseuptodateError(Win32Error):
-    DESCRIPTION = """No updates are necessary to this replicant network or local security database."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DatabaseUpToDate
 
 
 class NerrSyncrequiredError(Win32Error):
-    DESCRIPTION = """This replicant database is outdated; synchronization is required."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SyncRequired
 
 
 class NerrUsenotfoundError(Win32Error):
-    DESCRIPTION = """The network connection could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UseNotFound
 
 
 class NerrBadasgtypeError(Win32Error):
-    DESCRIPTION = """This asg_type is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadAsgType
 
 
 class NerrDeviceissharedError(Win32Error):
-    DESCRIPTION = """This device is currently being shared."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DeviceIsShared
 
 
 class NerrNocomputernameError(Win32Error):
-    DESCRIPTION = """The computer name could not be added as a message alias. The name might already exist on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoComputerName
 
 
 class NerrMsgalreadystartedError(Win32Error):
-    DESCRIPTION = """The Messenger service is already started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_MsgAlreadyStarted
 
 
 class NerrMsginitfailedError(Win32Error):
-    DESCRIPTION = """The Messenger service failed to start."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_MsgInitFailed
 
 
 class NerrNamenotfoundError(Win32Error):
-    DESCRIPTION = """The message alias could not be found on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NameNotFound
 
 
 class NerrAlreadyforwardedError(Win32Error):
-    DESCRIPTION = """This message alias has already been forwarded."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AlreadyForwarded
 
 
 class NerrAddforwardedError(Win32Error):
-    DESCRIPTION = """This message alias has been added but is still forwarded."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AddForwarded
 
 
 class NerrAlreadyexistsError(Win32Error):
-    DESCRIPTION = """This message alias already exists locally."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AlreadyExists
 
 
 class NerrToomanynamesError(Win32Error):
-    DESCRIPTION = """The maximum number of added message aliases has been exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyNames
 
 
 class NerrDelcomputernameError(Win32Error):
-    DESCRIPTION = """The computer name could not be deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DelComputerName
 
 
 class NerrLocalforwardError(Win32Error):
-    DESCRIPTION = """Messages cannot be forwarded back to the same workstation."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LocalForward
 
 
 class NerrGrpmsgprocessorError(Win32Error):
-    DESCRIPTION = """An error occurred in the domain message processor."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_GrpMsgProcessor
 
 
 class NerrPausedremoteError(Win32Error):
-    DESCRIPTION = """The message was sent, but the recipient has paused the Messenger service."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PausedRemote
 
 
 class NerrBadreceiveError(Win32Error):
-    DESCRIPTION = """The message was sent but not received."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadReceive
 
 
 class NerrNameinuseError(Win32Error):
-    DESCRIPTION = """The message alias is currently in use. Try again later."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NameInUse
 
 
 class NerrMsgnotstartedError(Win32Error):
-    DESCRIPTION = """The Messenger service has not been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_MsgNotStarted
 
 
 class NerrNotlocalnameError(Win32Error):
-    DESCRIPTION = """The name is not on the local computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NotLocalName
 
 
 class NerrNoforwardnameError(Win32Error):
-    DESCRIPTION = """The forwarded message alias could not be found on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoForwardName
 
 
 class NerrRemotefullError(Win32Error):
-    DESCRIPTION = """The message alias table on the remote station is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RemoteFull
 
 
 class NerrNamenotforwardedError(Win32Error):
-    DESCRIPTION = """Messages for this alias are not currently being forwarded."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NameNotForwarded
 
 
 class NerrTruncatedbroadcastError(Win32Error):
-    DESCRIPTION = """The broadcast message was truncated."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TruncatedBroadcast
 
 
 class NerrInvaliddeviceError(Win32Error):
-    DESCRIPTION = """This is an invalid device name."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidDevice
 
 
 class NerrWritefaultError(Win32Error):
-    DESCRIPTION = """A write fault occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_WriteFault
 
 
 class NerrDuplicatenameError(Win32Error):
-    DESCRIPTION = """A duplicate message alias exists on the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DuplicateName
 
 
 class NerrDeletelaterError(Win32Error):
-    DESCRIPTION = """This message alias will be deleted later."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DeleteLater
 
 
 class NerrIncompletedelError(Win32Error):
-    DESCRIPTION = """The message alias was not successfully deleted from all networks."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_IncompleteDel
 
 
 class NerrMultiplenetsError(Win32Error):
-    DESCRIPTION = """This operation is not supported on computers with multiple networks."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_MultipleNets
 
 
 class NerrNetnamenotfoundError(Win32Error):
-    DESCRIPTION = """This shared resource does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NetNameNotFound
 
 
 class NerrDevicenotsharedError(Win32Error):
-    DESCRIPTION = """This device is not shared."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DeviceNotShared
 
 
 class NerrClientnamenotfoundError(Win32Error):
-    DESCRIPTION = """A session does not exist with that computer name."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ClientNameNotFound
 
 
 class NerrFileidnotfoundError(Win32Error):
-    DESCRIPTION = """There is not an open file with that identification number."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_FileIdNotFound
 
 
 class NerrExecfailureError(Win32Error):
-    DESCRIPTION = """A failure occurred when executing a remote administration command."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ExecFailure
 
 
 class NerrTmpfileError(Win32Error):
-    DESCRIPTION = """A failure occurred when opening a remote temporary file."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TmpFile
 
 
 class NerrToomuchdataError(Win32Error):
-    DESCRIPTION = """The data returned from a remote administration command has been truncated to 64 KB."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooMuchData
 
 
 class NerrDeviceshareconflictError(Win32Error):
-    DESCRIPTION = """This device cannot be shared as both a spooled and a nonspooled resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DeviceShareConflict
 
 
 class NerrBrowsertableincompleteError(Win32Error):
-    DESCRIPTION = """The information in the list of servers might be incorrect."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BrowserTableIncomplete
 
 
 class NerrNotlocaldomainError(Win32Error):
-    DESCRIPTION = """The computer is not active in this domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NotLocalDomain
 
 
 class NerrIsdfsshareError(Win32Error):
-    DESCRIPTION = """The share must be removed from the Distributed File System (DFS) before it can be deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_IsDfsShare
 
 
 class NerrDevinvalidopcodeError(Win32Error):
-    DESCRIPTION = """The operation is invalid for this device."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DevInvalidOpCode
 
 
 class NerrDevnotfoundError(Win32Error):
-    DESCRIPTION = """This device cannot be shared."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DevNotFound
 
 
 class NerrDevnotopenError(Win32Error):
-    DESCRIPTION = """This device was not open."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DevNotOpen
 
 
 class NerrBadqueuedevstringError(Win32Error):
-    DESCRIPTION = """This device name list is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadQueueDevString
 
 
 class NerrBadqueuepriorityError(Win32Error):
-    DESCRIPTION = """The queue priority is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadQueuePriority
 
 
 class NerrNocommdevsError(Win32Error):
-    DESCRIPTION = """There are no shared communication devices."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoCommDevs
 
 
 class NerrQueuenotfoundError(Win32Error):
-    DESCRIPTION = """The queue you specified does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_QueueNotFound
 
 
 class NerrBaddevstringError(Win32Error):
-    DESCRIPTION = """This list of devices is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadDevString
 
 
 class NerrBaddevError(Win32Error):
-    DESCRIPTION = """The requested device is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadDev
 
 
 class NerrInusebyspoolerError(Win32Error):
-    DESCRIPTION = """This device is already in use by the spooler."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InUseBySpooler
 
 
 class NerrCommdevinuseError(Win32Error):
-    DESCRIPTION = """This device is already in use as a communication device."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CommDevInUse
 
 
 class NerrInvalidcomputerError(Win32Error):
-    DESCRIPTION = """This computer name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidComputer
 
 
 class NerrMaxlenexceededError(Win32Error):
-    DESCRIPTION = """The string and prefix specified are too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_MaxLenExceeded
 
 
 class NerrBadcomponentError(Win32Error):
-    DESCRIPTION = """This path component is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadComponent
 
 
 class NerrCanttypeError(Win32Error):
-    DESCRIPTION = """Could not determine the type of input."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CantType
 
 
 class NerrToomanyentriesError(Win32Error):
-    DESCRIPTION = """The buffer for types is not big enough."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyEntries
 
 
 class NerrProfilefiletoobigError(Win32Error):
-    DESCRIPTION = """Profile files cannot exceed 64 KB."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProfileFileTooBig
 
 
 class NerrProfileoffsetError(Win32Error):
-    DESCRIPTION = """The start offset is out of range."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProfileOffset
 
 
 class NerrProfilecleanupError(Win32Error):
-    DESCRIPTION = """The system cannot delete current connections to network resources."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProfileCleanup
 
 
 class NerrProfileunknowncmdError(Win32Error):
-    DESCRIPTION = """The system was unable to parse the command line in this file."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProfileUnknownCmd
 
 
 class NerrProfileloaderrError(Win32Error):
-    DESCRIPTION = """An error occurred while loading the profile file."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProfileLoadErr
 
 
 class NerrProfilesaveerrError(Win32Error):
-    DESCRIPTION = """Errors occurred while saving the profile file. The profile was partially saved."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProfileSaveErr
 
 
 class NerrLogoverflowError(Win32Error):
-    DESCRIPTION = """Log file %1 is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogOverflow
 
 
 class NerrLogfilechangedError(Win32Error):
-    DESCRIPTION = """This log file has changed between reads."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogFileChanged
 
 
 class NerrLogfilecorruptError(Win32Error):
-    DESCRIPTION = """Log file %1 is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogFileCorrupt
 
 
 class NerrSourceisdirError(Win32Error):
-    DESCRIPTION = """The source path cannot be a directory."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SourceIsDir
 
 
 class NerrBadsourceError(Win32Error):
-    DESCRIPTION = """The source path is illegal."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadSource
 
 
 class NerrBaddestError(Win32Error):
-    DESCRIPTION = """The destination path is illegal."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadDest
 
 
 class NerrDifferentserversError(Win32Error):
-    DESCRIPTION = """The source and destination paths are on different servers."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DifferentServers
 
 
 class NerrRunsrvpausedError(Win32Error):
-    DESCRIPTION = """The Run server you requested is paused."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RunSrvPaused
 
 
 class NerrErrcommrunsrvError(Win32Error):
-    DESCRIPTION = """An error occurred when communicating with a Run server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ErrCommRunSrv
 
 
 class NerrErrorexecingghostError(Win32Error):
-    DESCRIPTION = """An error occurred when starting a background process."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ErrorExecingGhost
 
 
 class NerrSharenotfoundError(Win32Error):
-    DESCRIPTION = """The shared resource you are connected to could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ShareNotFound
 
 
 class NerrInvalidlanaError(Win32Error):
-    DESCRIPTION = """The LAN adapter number is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidLana
 
 
 class NerrOpenfilesError(Win32Error):
-    DESCRIPTION = """There are open files on the connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_OpenFiles
 
 
 class NerrActiveconnsError(Win32Error):
-    DESCRIPTION = """Active connections still exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ActiveConns
 
 
 class NerrBadpasswordcoreError(Win32Error):
-    DESCRIPTION = """This share name or password is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadPasswordCore
 
 
 class NerrDevinuseError(Win32Error):
-    DESCRIPTION = """The device is being accessed by an active process."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DevInUse
 
 
 class NerrLocaldriveError(Win32Error):
-    DESCRIPTION = """The drive letter is in use locally."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LocalDrive
 
 
 class NerrAlertexistsError(Win32Error):
-    DESCRIPTION = """The specified client is already registered for the specified event."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AlertExists
 
 
 class NerrToomanyalertsError(Win32Error):
-    DESCRIPTION = """The alert table is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyAlerts
 
 
 class NerrNosuchalertError(Win32Error):
-    DESCRIPTION = """An invalid or nonexistent alert name was raised."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoSuchAlert
 
 
 class NerrBadrecipientError(Win32Error):
-    DESCRIPTION = """The alert recipient is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadRecipient
 
 
 class NerrAcctlimitexceededError(Win32Error):
-    DESCRIPTION = """A user's session with this server has been deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AcctLimitExceeded
 
 
 class NerrInvalidlogseekError(Win32Error):
-    DESCRIPTION = """The log file does not contain the requested record number."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidLogSeek
 
 
 class NerrBaduasconfigError(Win32Error):
-    DESCRIPTION = """The user accounts database is not configured correctly."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadUasConfig
 
 
 class NerrInvaliduasopError(Win32Error):
-    DESCRIPTION = """This operation is not permitted when the Net Logon service is running."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidUASOp
 
 
 class NerrLastadminError(Win32Error):
-    DESCRIPTION = """This operation is not allowed on the last administrative account."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LastAdmin
 
 
 class NerrDcnotfoundError(Win32Error):
-    DESCRIPTION = """Could not find the domain controller for this domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DCNotFound
 
 
 class NerrLogontrackingerrorError(Win32Error):
-    DESCRIPTION = """Could not set logon information for this user."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_LogonTrackingError
 
 
 class NerrNetlogonnotstartedError(Win32Error):
-    DESCRIPTION = """The Net Logon service has not been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NetlogonNotStarted
 
 
 class NerrCannotgrowuasfileError(Win32Error):
-    DESCRIPTION = """Unable to add to the user accounts database."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CanNotGrowUASFile
 
 
 class NerrTimediffatdcError(Win32Error):
-    DESCRIPTION = """This server's clock is not synchronized with the PDC's clock."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TimeDiffAtDC
 
 
 class NerrPasswordmismatchError(Win32Error):
-    DESCRIPTION = """A password mismatch has been detected."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordMismatch
 
 
 class NerrNosuchserverError(Win32Error):
-    DESCRIPTION = """The server identification does not specify a valid server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoSuchServer
 
 
 class NerrNosuchsessionError(Win32Error):
-    DESCRIPTION = """The session identification does not specify a valid session."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoSuchSession
 
 
 class NerrNosuchconnectionError(Win32Error):
-    DESCRIPTION = """The connection identification does not specify a valid connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoSuchConnection
 
 
 class NerrToomanyserversError(Win32Error):
-    DESCRIPTION = """There is no space for another entry in the table of available servers."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyServers
 
 
 class NerrToomanysessionsError(Win32Error):
-    DESCRIPTION = """The server has reached the maximum number of sessions it supports."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManySessions
 
 
 class NerrToomanyconnectionsError(Win32Error):
-    DESCRIPTION = """The server has reached the maximum number of connections it supports."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyConnections
 
 
 class NerrToomanyfilesError(Win32Error):
-    DESCRIPTION = """The server cannot open more files because it has reached its maximum number."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyFiles
 
 
 class NerrNoalternateserversError(Win32Error):
-    DESCRIPTION = """There are no alternate servers registered on this server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoAlternateServers
 
 
 class NerrTrydownlevelError(Win32Error):
-    DESCRIPTION = """Try the down-level (remote admin protocol) version of API instead."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TryDownLevel
 
 
 class NerrUpsdrivernotstartedError(Win32Error):
-    DESCRIPTION = """The uninterruptible power supply (UPS) driver could not be accessed by the UPS service."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UPSDriverNotStarted
 
 
 class NerrUpsinvalidconfigError(Win32Error):
-    DESCRIPTION = """The UPS service is not configured correctly."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UPSInvalidConfig
 
 
 class NerrUpsinvalidcommportError(Win32Error):
-    DESCRIPTION = """The UPS service could not access the specified Comm Port."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UPSInvalidCommPort
 
 
 class NerrUpssignalassertedError(Win32Error):
-    DESCRIPTION = """The UPS indicated a line fail or low battery situation. Service not started."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UPSSignalAsserted
 
 
 class NerrUpsshutdownfailedError(Win32Error):
-    DESCRIPTION = """The UPS service failed to perform a system shut down."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_UPSShutdownFailed
 
 
 class NerrBaddosretcodeError(Win32Error):
-    DESCRIPTION = """The program below returned an MS-DOS error code."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadDosRetCode
 
 
 class NerrProgneedsextramemError(Win32Error):
-    DESCRIPTION = """The program below needs more memory."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ProgNeedsExtraMem
 
 
 class NerrBaddosfunctionError(Win32Error):
-    DESCRIPTION = """The program below called an unsupported MS-DOS function."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadDosFunction
 
 
 class NerrRemotebootfailedError(Win32Error):
-    DESCRIPTION = """The workstation failed to boot."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RemoteBootFailed
 
 
 class NerrBadfilechecksumError(Win32Error):
-    DESCRIPTION = """The file below is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BadFileCheckSum
 
 
 class NerrNorplbootsystemError(Win32Error):
-    DESCRIPTION = """No loader is specified in the boot-block definition file."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NoRplBootSystem
 
 
 class NerrRplloadrnetbioserrError(Win32Error):
-    DESCRIPTION = """NetBIOS returned an error: The network control blocks (NCBs) and Server Message Block (SMB) are dumped above."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplLoadrNetBiosErr
 
 
 class NerrRplloadrdiskerrError(Win32Error):
-    DESCRIPTION = """A disk I/O error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplLoadrDiskErr
 
 
 class NerrImageparamerrError(Win32Error):
-    DESCRIPTION = """Image parameter substitution failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ImageParamErr
 
 
 class NerrToomanyimageparamsError(Win32Error):
-    DESCRIPTION = """Too many image parameters cross disk sector boundaries."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_TooManyImageParams
 
 
 class NerrNondosfloppyusedError(Win32Error):
-    DESCRIPTION = """The image was not generated from an MS-DOS disk formatted with /S."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NonDosFloppyUsed
 
 
 class NerrRplbootrestartError(Win32Error):
-    DESCRIPTION = """Remote boot will be restarted later."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBootRestart
 
 
 class NerrRplsrvrcallfailedError(Win32Error):
-    DESCRIPTION = """The call to the Remoteboot server failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplSrvrCallFailed
 
 
 class NerrCantconnectrplsrvrError(Win32Error):
-    DESCRIPTION = """Cannot connect to the Remoteboot server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CantConnectRplSrvr
 
 
 class NerrCantopenimagefileError(Win32Error):
-    DESCRIPTION = """Cannot open image file on the Remoteboot server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CantOpenImageFile
 
 
 class NerrCallingrplsrvrError(Win32Error):
-    DESCRIPTION = """Connecting to the Remoteboot server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_CallingRplSrvr
 
 
 class NerrStartingrplbootError(Win32Error):
-    DESCRIPTION = """Connecting to the Remoteboot server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_StartingRplBoot
 
 
 class NerrRplbootservicetermError(Win32Error):
-    DESCRIPTION = """Remote boot service was stopped, check the error log for the cause of the problem."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBootServiceTerm
 
 
 class NerrRplbootstartfailedError(Win32Error):
-    DESCRIPTION = """Remote boot startup failed; check the error log for the cause of the problem."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBootStartFailed
 
 
 class NerrRplConnectedError(Win32Error):
-    DESCRIPTION = """A second connection to a Remoteboot resource is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RPL_CONNECTED
 
 
 class NerrBrowserconfiguredtonotrunError(Win32Error):
-    DESCRIPTION = """The browser service was configured with MaintainServerList=No."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_BrowserConfiguredToNotRun
 
 
 class NerrRplnoadaptersstartedError(Win32Error):
-    DESCRIPTION = """Service failed to start because none of the network adapters started with this service."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplNoAdaptersStarted
 
 
 class NerrRplbadregistryError(Win32Error):
-    DESCRIPTION = """Service failed to start due to bad startup information in the registry."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBadRegistry
 
 
 class NerrRplbaddatabaseError(Win32Error):
-    DESCRIPTION = """Service failed to start because its database is absent or corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBadDatabase
 
 
 class NerrRplrplfilesshareError(Win32Error):
-    DESCRIPTION = """Service failed to start because the RPLFILES share is absent."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplRplfilesShare
 
 
 class NerrRplnotrplserverError(Win32Error):
-    DESCRIPTION = """Service failed to start because the RPLUSER group is absent."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplNotRplServer
 
 
 class NerrRplcannotenumError(Win32Error):
-    DESCRIPTION = """Cannot enumerate service records."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplCannotEnum
 
 
 class NerrRplwkstainfocorruptedError(Win32Error):
-    DESCRIPTION = """Workstation record information has been corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplWkstaInfoCorrupted
 
 
 class NerrRplwkstanotfoundError(Win32Error):
-    DESCRIPTION = """Workstation record was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplWkstaNotFound
 
 
 class NerrRplwkstanameunavailableError(Win32Error):
-    DESCRIPTION = """Workstation name is in use by some other workstation."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplWkstaNameUnavailable
 
 
 class NerrRplprofileinfocorruptedError(Win32Error):
-    DESCRIPTION = """Profile record information has been corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplProfileInfoCorrupted
 
 
 class NerrRplprofilenotfoundError(Win32Error):
-    DESCRIPTION = """Profile record was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplProfileNotFound
 
 
 class NerrRplprofilenameunavailableError(Win32Error):
-    DESCRIPTION = """Profile name is in use by some other profile."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplProfileNameUnavailable
 
 
 class NerrRplprofilenotemptyError(Win32Error):
-    DESCRIPTION = """There are workstations using this profile."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplProfileNotEmpty
 
 
 class NerrRplconfiginfocorruptedError(Win32Error):
-    DESCRIPTION = """Configuration record information has been corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplConfigInfoCorrupted
 
 
 class NerrRplconfignotfoundError(Win32Error):
-    DESCRIPTION = """Configuration record was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplConfigNotFound
 
 
 class NerrRpladapterinfocorruptedError(Win32Error):
-    DESCRIPTION = """Adapter ID record information has been corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplAdapterInfoCorrupted
 
 
 class NerrRplinternalError(Win32Error):
-    DESCRIPTION = """An internal service error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplInternal
 
 
 class NerrRplvendorinfocorruptedError(Win32Error):
-    DESCRIPTION = """Vendor ID record information has been corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplVendorInfoCorrupted
 
 
 class NerrRplbootinfocorruptedError(Win32Error):
-    DESCRIPTION = """Boot block record information has been corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBootInfoCorrupted
 
 
 class NerrRplwkstaneedsuseracctError(Win32Error):
-    DESCRIPTION = """The user account for this workstation record is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplWkstaNeedsUserAcct
 
 
 class NerrRplneedsrpluseracctError(Win32Error):
-    DESCRIPTION = """The RPLUSER local group could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplNeedsRPLUSERAcct
 
 
 class NerrRplbootnotfoundError(Win32Error):
-    DESCRIPTION = """Boot block record was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBootNotFound
 
 
 class NerrRplincompatibleprofileError(Win32Error):
-    DESCRIPTION = """Chosen profile is incompatible with this workstation."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplIncompatibleProfile
 
 
 class NerrRpladapternameunavailableError(Win32Error):
-    DESCRIPTION = """Chosen network adapter ID is in use by some other workstation."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplAdapterNameUnavailable
 
 
 class NerrRplconfignotemptyError(Win32Error):
-    DESCRIPTION = """There are profiles using this configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplConfigNotEmpty
 
 
 class NerrRplbootinuseError(Win32Error):
-    DESCRIPTION = """There are workstations, profiles, or configurations using this boot block."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBootInUse
 
 
 class NerrRplbackupdatabaseError(Win32Error):
-    DESCRIPTION = """Service failed to back up the Remoteboot database."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBackupDatabase
 
 
 class NerrRpladapternotfoundError(Win32Error):
-    DESCRIPTION = """Adapter record was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplAdapterNotFound
 
 
 class NerrRplvendornotfoundError(Win32Error):
-    DESCRIPTION = """Vendor record was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplVendorNotFound
 
 
 class NerrRplvendornameunavailableError(Win32Error):
-    DESCRIPTION = """Vendor name is in use by some other vendor record."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplVendorNameUnavailable
 
 
 class NerrRplbootnameunavailableError(Win32Error):
-    DESCRIPTION = """The boot name or vendor ID is in use by some other boot block record."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplBootNameUnavailable
 
 
 class NerrRplconfignameunavailableError(Win32Error):
-    DESCRIPTION = """The configuration name is in use by some other configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_RplConfigNameUnavailable
 
 
 class NerrDfsinternalcorruptionError(Win32Error):
-    DESCRIPTION = """The internal database maintained by the DFS service is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsInternalCorruption
 
 
 class NerrDfsvolumedatacorruptError(Win32Error):
-    DESCRIPTION = """One of the records in the internal DFS database is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsVolumeDataCorrupt
 
 
 class NerrDfsnosuchvolumeError(Win32Error):
-    DESCRIPTION = """There is no DFS name whose entry path matches the input entry path."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsNoSuchVolume
 
 
 class NerrDfsvolumealreadyexistsError(Win32Error):
-    DESCRIPTION = """A root or link with the given name already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsVolumeAlreadyExists
 
 
 class NerrDfsalreadysharedError(Win32Error):
-    DESCRIPTION = """The server share specified is already shared in the DFS."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsAlreadyShared
 
 
 class NerrDfsnosuchshareError(Win32Error):
-    DESCRIPTION = """The indicated server share does not support the indicated DFS namespace."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsNoSuchShare
 
 
 class NerrDfsnotaleafvolumeError(Win32Error):
-    DESCRIPTION = """The operation is not valid in this portion of the namespace."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsNotALeafVolume
 
 
 class NerrDfsleafvolumeError(Win32Error):
-    DESCRIPTION = """The operation is not valid in this portion of the namespace."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsLeafVolume
 
 
 class NerrDfsvolumehasmultipleserversError(Win32Error):
-    DESCRIPTION = """The operation is ambiguous because the link has multiple servers."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsVolumeHasMultipleServers
 
 
 class NerrDfscantcreatejunctionpointError(Win32Error):
-    DESCRIPTION = """Unable to create a link."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsCantCreateJunctionPoint
 
 
 class NerrDfsservernotdfsawareError(Win32Error):
-    DESCRIPTION = """The server is not DFS-aware."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsServerNotDfsAware
 
 
 class NerrDfsbadrenamepathError(Win32Error):
-    DESCRIPTION = """The specified rename target path is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsBadRenamePath
 
 
 class NerrDfsvolumeisofflineError(Win32Error):
-    DESCRIPTION = """The specified DFS link is offline."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsVolumeIsOffline
 
 
 class NerrDfsnosuchserverError(Win32Error):
-    DESCRIPTION = """The specified server is not a server for this link."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsNoSuchServer
 
 
 class NerrDfscyclicalnameError(Win32Error):
-    DESCRIPTION = """A cycle in the DFS name was detected."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsCyclicalName
 
 
 class NerrDfsnotsupportedinserverdfsError(Win32Error):
-    DESCRIPTION = """The operation is not supported on a server-based DFS."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsNotSupportedInServerDfs
 
 
 class NerrDfsduplicateserviceError(Win32Error):
-    DESCRIPTION = """This link is already supported by the specified server share."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsDuplicateService
 
 
 class NerrDfscantremovelastservershareError(Win32Error):
-    DESCRIPTION = """Cannot remove the last server share supporting this root or link."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsCantRemoveLastServerShare
 
 
 class NerrDfsvolumeisinterdfsError(Win32Error):
-    DESCRIPTION = """The operation is not supported for an inter-DFS link."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsVolumeIsInterDfs
 
 
 class NerrDfsinconsistentError(Win32Error):
-    DESCRIPTION = """The internal state of the DFS Service has become inconsistent."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsInconsistent
 
 
 class NerrDfsserverupgradedError(Win32Error):
-    DESCRIPTION = """The DFS Service has been installed on the specified server."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsServerUpgraded
 
 
 class NerrDfsdataisidenticalError(Win32Error):
-    DESCRIPTION = """The DFS data being reconciled is identical."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsDataIsIdentical
 
 
 class NerrDfscantremovedfsrootError(Win32Error):
-    DESCRIPTION = """The DFS root cannot be deleted. Uninstall DFS if required."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsCantRemoveDfsRoot
 
 
 class NerrDfschildorparentindfsError(Win32Error):
-    DESCRIPTION = """A child or parent directory of the share is already in a DFS."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsChildOrParentInDfs
 
 
 class NerrDfsinternalerrorError(Win32Error):
-    DESCRIPTION = """DFS internal error."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DfsInternalError
 
 
 class NerrSetupalreadyjoinedError(Win32Error):
-    DESCRIPTION = """This machine is already joined to a domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SetupAlreadyJoined
 
 
 class NerrSetupnotjoinedError(Win32Error):
-    DESCRIPTION = """This machine is not currently joined to a domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SetupNotJoined
 
 
 class NerrSetupdomaincontrollerError(Win32Error):
-    DESCRIPTION = """This machine is a domain controller and cannot be unjoined from a domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_SetupDomainController
 
 
 class NerrDefaultjoinrequiredError(Win32Error):
-    DESCRIPTION = """The destination domain controller does not support creating machine accounts in organizational units (OUs)."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_DefaultJoinRequired
 
 
 class NerrInvalidworkgroupnameError(Win32Error):
-    DESCRIPTION = """The specified workgroup name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_InvalidWorkgroupName
 
 
 class NerrNameusesincompatiblecodepageError(Win32Error):
-    DESCRIPTION = """The specified computer name is incompatible with the default language used on the domain controller."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_NameUsesIncompatibleCodePage
 
 
 class NerrComputeraccountnotfoundError(Win32Error):
-    DESCRIPTION = """The specified computer account could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_ComputerAccountNotFound
 
 
 class NerrPersonalskuError(Win32Error):
-    DESCRIPTION = """This version of Windows cannot be joined to a domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PersonalSku
 
 
 class NerrPasswordmustchangeError(Win32Error):
-    DESCRIPTION = """The password must change at the next logon."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordMustChange
 
 
 class NerrAccountlockedoutError(Win32Error):
-    DESCRIPTION = """The account is locked out."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_AccountLockedOut
 
 
 class NerrPasswordtoolongError(Win32Error):
-    DESCRIPTION = """The password is too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordTooLong
 
 
 class NerrPasswordnotcomplexenoughError(Win32Error):
-    DESCRIPTION = """The password does not meet the complexity policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordNotComplexEnough
 
 
 class NerrPasswordfiltererrorError(Win32Error):
-    DESCRIPTION = """The password does not meet the requirements of the password filter DLLs."""
     WIN32_ERROR_CODE = Win32ErrorCode.NERR_PasswordFilterError
 
 
 class ErrorUnknownPrintMonitorError(Win32Error):
-    DESCRIPTION = """The specified print monitor is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNKNOWN_PRINT_MONITOR
 
 
 class ErrorPrinterDriverInUseError(Win32Error):
-    DESCRIPTION = """The specified printer driver is currently in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_DRIVER_IN_USE
 
 
 class ErrorSpoolFileNotFoundError(Win32Error):
-    DESCRIPTION = """The spool file was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SPOOL_FILE_NOT_FOUND
 
 
 class ErrorSplNoStartdocError(Win32Error):
-    DESCRIPTION = """A StartDocPrinter call was not issued."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SPL_NO_STARTDOC
 
 
 class ErrorSplNoAddjobError(Win32Error):
-    DESCRIPTION = """An AddJob call was not issued."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SPL_NO_ADDJOB
 
 
 class ErrorPrintProcessorAlreadyInstalledError(Win32Error):
-    DESCRIPTION = """The specified print processor has already been installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINT_PROCESSOR_ALREADY_INSTALLED
 
 
 class ErrorPrintMonitorAlreadyInstalledError(Win32Error):
-    DESCRIPTION = """The specified print monitor has already been installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINT_MONITOR_ALREADY_INSTALLED
 
 
 class ErrorInvalidPrintMonitorError(Win32Error):
-    DESCRIPTION = """The specified print monitor does not have the required functions."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_PRINT_MONITOR
 
 
 class ErrorPrintMonitorInUseError(Win32Error):
-    DESCRIPTION = """The specified print monitor is currently in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINT_MONITOR_IN_USE
 
 
 class ErrorPrinterHasJobsQueuedError(Win32Error):
-    DESCRIPTION = """The requested operation is not allowed when there are jobs queued to the printer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_HAS_JOBS_QUEUED
 
 
 class ErrorSuccessRebootRequiredError(Win32Error):
-    DESCRIPTION = """The requested operation is successful. Changes will not be effective until the system is rebooted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SUCCESS_REBOOT_REQUIRED
 
 
 class ErrorSuccessRestartRequiredError(Win32Error):
-    DESCRIPTION = """The requested operation is successful. Changes will not be effective until the service is restarted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SUCCESS_RESTART_REQUIRED
 
 
 class ErrorPrinterNotFoundError(Win32Error):
-    DESCRIPTION = """No printers were found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_NOT_FOUND
 
 
 class ErrorPrinterDriverWarnedError(Win32Error):
-    DESCRIPTION = """The printer driver is known to be unreliable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_DRIVER_WARNED
 
 
 class ErrorPrinterDriverBlockedError(Win32Error):
-    DESCRIPTION = """The printer driver is known to harm the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_DRIVER_BLOCKED
 
 
 class ErrorPrinterDriverPackageInUseError(Win32Error):
-    DESCRIPTION = """The specified printer driver package is currently in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_DRIVER_PACKAGE_IN_USE
 
 
 class ErrorCoreDriverPackageNotFoundError(Win32Error):
-    DESCRIPTION = """Unable to find a core driver package that is required by the printer driver package."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CORE_DRIVER_PACKAGE_NOT_FOUND
 
 
 class ErrorFailRebootRequiredError(Win32Error):
-    DESCRIPTION = """The requested operation failed. A system reboot is required to roll back changes made."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAIL_REBOOT_REQUIRED
 
 
 class ErrorFailRebootInitiatedError(Win32Error):
-    DESCRIPTION = """The requested operation failed. A system reboot has been initiated to roll back changes made."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FAIL_REBOOT_INITIATED
 
 
 class ErrorPrinterDriverDownloadNeededError(Win32Error):
-    DESCRIPTION = """The specified printer driver was not found on the system and needs to be downloaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PRINTER_DRIVER_DOWNLOAD_NEEDED
 
 
 class ErrorIoReissueAsCachedError(Win32Error):
-    DESCRIPTION = """Reissue the given operation as a cached I/O operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IO_REISSUE_AS_CACHED
 
 
 class ErrorWinsInternalError(Win32Error):
-    DESCRIPTION = """Windows Internet Name Service (WINS) encountered an error while processing the command."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WINS_INTERNAL
 
 
 class ErrorCanNotDelLocalWinsError(Win32Error):
-    DESCRIPTION = """The local WINS cannot be deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CAN_NOT_DEL_LOCAL_WINS
 
 
 class ErrorStaticInitError(Win32Error):
-    DESCRIPTION = """The importation from the file failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_STATIC_INIT
 
 
 class ErrorIncBackupError(Win32Error):
-    DESCRIPTION = """The backup failed. Was a full backup done before?"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INC_BACKUP
 
 
 class ErrorFullBackupError(Win32Error):
-    DESCRIPTION = """The backup failed. Check the directory to which you are backing the database."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FULL_BACKUP
 
 
 class ErrorRecNonExistentError(Win32Error):
-    DESCRIPTION = """The name does not exist in the WINS database."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REC_NON_EXISTENT
 
 
 class ErrorRplNotAllowedError(Win32Error):
-    DESCRIPTION = """Replication with a nonconfigured partner is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RPL_NOT_ALLOWED
 
 
 class PeerdistErrorContentinfoVersionUnsupportedError(Win32Error):
-    DESCRIPTION = """The version of the supplied content information is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_CONTENTINFO_VERSION_UNSUPPORTED
 
 
 class PeerdistErrorCannotParseContentinfoError(Win32Error):
-    DESCRIPTION = """The supplied content information is malformed."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_CANNOT_PARSE_CONTENTINFO
 
 
 class PeerdistErrorMissingDataError(Win32Error):
-    DESCRIPTION = """The requested data cannot be found in local or peer caches."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_MISSING_DATA
 
 
 class PeerdistErrorNoMoreError(Win32Error):
-    DESCRIPTION = """No more data is available or required."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_NO_MORE
 
 
 class PeerdistErrorNotInitializedError(Win32Error):
-    DESCRIPTION = """The supplied object has not been initialized."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_NOT_INITIALIZED
 
 
 class PeerdistErrorAlreadyInitializedError(Win32Error):
-    DESCRIPTION = """The supplied object has already been initialized."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_ALREADY_INITIALIZED
 
 
 class PeerdistErrorShutdownInProgressError(Win32Error):
-    DESCRIPTION = """A shutdown operation is already in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_SHUTDOWN_IN_PROGRESS
 
 
 class PeerdistErrorInvalidatedError(Win32Error):
-    DESCRIPTION = """The supplied object has already been invalidated."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_INVALIDATED
 
 
 class PeerdistErrorAlreadyExistsError(Win32Error):
-    DESCRIPTION = """An element already exists and was not replaced."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_ALREADY_EXISTS
 
 
 class PeerdistErrorOperationNotfoundError(Win32Error):
-    DESCRIPTION = """Cannot cancel the requested operation as it has already been completed."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_OPERATION_NOTFOUND
 
 
 class PeerdistErrorAlreadyCompletedError(Win32Error):
-    DESCRIPTION = """Cannot perform the requested operation because it has already been carried out."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_ALREADY_COMPLETED
 
 
 class PeerdistErrorOutOfBoundsError(Win32Error):
-    DESCRIPTION = """An operation accessed data beyond the bounds of valid data."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_OUT_OF_BOUNDS
 
 
 class PeerdistErrorVersionUnsupportedError(Win32Error):
-    DESCRIPTION = """The requested version is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_VERSION_UNSUPPORTED
 
 
 class PeerdistErrorInvalidConfigurationError(Win32Error):
-    DESCRIPTION = """A configuration value is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_INVALID_CONFIGURATION
 
 
 class PeerdistErrorNotLicensedError(Win32Error):
-    DESCRIPTION = """The SKU is not licensed."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_NOT_LICENSED
 
 
 class PeerdistErrorServiceUnavailableError(Win32Error):
-    DESCRIPTION = """PeerDist Service is still initializing and will be available shortly."""
     WIN32_ERROR_CODE = Win32ErrorCode.PEERDIST_ERROR_SERVICE_UNAVAILABLE
 
 
 class ErrorDhcpAddressConflictError(Win32Error):
-    DESCRIPTION = """The Dynamic Host Configuration Protocol (DHCP) client has obtained an IP address that is already in use on the network. The local interface will be disabled until the DHCP client can obtain a new address."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DHCP_ADDRESS_CONFLICT
 
 
 class ErrorWmiGuidNotFoundError(Win32Error):
-    DESCRIPTION = """The GUID passed was not recognized as valid by a WMI data provider."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_GUID_NOT_FOUND
 
 
 class ErrorWmiInstanceNotFoundError(Win32Error):
-    DESCRIPTION = """The instance name passed was not recognized as valid by a WMI data provider."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_INSTANCE_NOT_FOUND
 
 
 class ErrorWmiItemidNotFoundError(Win32Error):
-    DESCRIPTION = """The data item ID passed was not recognized as valid by a WMI data provider."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_ITEMID_NOT_FOUND
 
 
 class ErrorWmiTryAgainError(Win32Error):
-    DESCRIPTION = """The WMI request could not be completed and should be retried."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_TRY_AGAIN
 
 
 class ErrorWmiDpNotFoundError(Win32Error):
-    DESCRIPTION = """The WMI data provider could not be located."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_DP_NOT_FOUND
 
 
 class ErrorWmiUnresolvedInstanceRefError(Win32Error):
-    DESCRIPTION = """The WMI data provider references an instance set that has not been registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_UNRESOLVED_INSTANCE_REF
 
 
 class ErrorWmiAlreadyEnabledError(Win32Error):
-    DESCRIPTION = """The WMI data block or event notification has already been enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_ALREADY_ENABLED
 
 
 class ErrorWmiGuidDisconnectedError(Win32Error):
-    DESCRIPTION = """The WMI data block is no longer available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_GUID_DISCONNECTED
 
 
 class ErrorWmiServerUnavailableError(Win32Error):
-    DESCRIPTION = """The WMI data service is not available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_SERVER_UNAVAILABLE
 
 
 class ErrorWmiDpFailedError(Win32Error):
-    DESCRIPTION = """The WMI data provider failed to carry out the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_DP_FAILED
 
 
 class ErrorWmiInvalidMofError(Win32Error):
-    DESCRIPTION = """The WMI Managed Object Format (MOF) information is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_INVALID_MOF
 
 
 class ErrorWmiInvalidReginfoError(Win32Error):
-    DESCRIPTION = """The WMI registration information is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_INVALID_REGINFO
 
 
 class ErrorWmiAlreadyDisabledError(Win32Error):
-    DESCRIPTION = """The WMI data block or event notification has already been disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_ALREADY_DISABLED
 
 
 class ErrorWmiReadOnlyError(Win32Error):
-    DESCRIPTION = """The WMI data item or data block is read-only."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_READ_ONLY
 
 
 class ErrorWmiSetFailureError(Win32Error):
-    DESCRIPTION = """The WMI data item or data block could not be changed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WMI_SET_FAILURE
 
 
 class ErrorInvalidMediaError(Win32Error):
-    DESCRIPTION = """The media identifier does not represent a valid medium."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MEDIA
 
 
 class ErrorInvalidLibraryError(Win32Error):
-    DESCRIPTION = """The library identifier does not represent a valid library."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_LIBRARY
 
 
 class ErrorInvalidMediaPoolError(Win32Error):
-    DESCRIPTION = """The media pool identifier does not represent a valid media pool."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_MEDIA_POOL
 
 
 class ErrorDriveMediaMismatchError(Win32Error):
-    DESCRIPTION = """The drive and medium are not compatible, or they exist in different libraries."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DRIVE_MEDIA_MISMATCH
 
 
 class ErrorMediaOfflineError(Win32Error):
-    DESCRIPTION = """The medium currently exists in an offline library and must be online to perform this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEDIA_OFFLINE
 
 
 class ErrorLibraryOfflineError(Win32Error):
-    DESCRIPTION = """The operation cannot be performed on an offline library."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LIBRARY_OFFLINE
 
 
 class ErrorEmptyError(Win32Error):
-    DESCRIPTION = """The library, drive, or media pool is empty."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EMPTY
 
 
 class ErrorNotEmptyError(Win32Error):
-    DESCRIPTION = """The library, drive, or media pool must be empty to perform this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_EMPTY
 
 
 class ErrorMediaUnavailableError(Win32Error):
-    DESCRIPTION = """No media is currently available in this media pool or library."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEDIA_UNAVAILABLE
 
 
 class ErrorResourceDisabledError(Win32Error):
-    DESCRIPTION = """A resource required for this operation is disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_DISABLED
 
 
 class ErrorInvalidCleanerError(Win32Error):
-    DESCRIPTION = """The media identifier does not represent a valid cleaner."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_CLEANER
 
 
 class ErrorUnableToCleanError(Win32Error):
-    DESCRIPTION = """The drive cannot be cleaned or does not support cleaning."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_CLEAN
 
 
 class ErrorObjectNotFoundError(Win32Error):
-    DESCRIPTION = """The object identifier does not represent a valid object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OBJECT_NOT_FOUND
 
 
 class ErrorDatabaseFailureError(Win32Error):
-    DESCRIPTION = """Unable to read from or write to the database."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DATABASE_FAILURE
 
 
 class ErrorDatabaseFullError(Win32Error):
-    DESCRIPTION = """The database is full."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DATABASE_FULL
 
 
 class ErrorMediaIncompatibleError(Win32Error):
-    DESCRIPTION = """The medium is not compatible with the device or media pool."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEDIA_INCOMPATIBLE
 
 
 class ErrorResourceNotPresentError(Win32Error):
-    DESCRIPTION = """The resource required for this operation does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_NOT_PRESENT
 
 
 class ErrorInvalidOperationError(Win32Error):
-    DESCRIPTION = """The operation identifier is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_OPERATION
 
 
 class ErrorMediaNotAvailableError(Win32Error):
-    DESCRIPTION = """The media is not mounted or ready for use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEDIA_NOT_AVAILABLE
 
 
 class ErrorDeviceNotAvailableError(Win32Error):
-    DESCRIPTION = """The device is not ready for use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEVICE_NOT_AVAILABLE
 
 
 class ErrorRequestRefusedError(Win32Error):
-    DESCRIPTION = """The operator or administrator has refused the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REQUEST_REFUSED
 
 
 class ErrorInvalidDriveObjectError(Win32Error):
-    DESCRIPTION = """The drive identifier does not represent a valid drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_DRIVE_OBJECT
 
 
 class ErrorLibraryFullError(Win32Error):
-    DESCRIPTION = """Library is full. No slot is available for use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LIBRARY_FULL
 
 
 class ErrorMediumNotAccessibleError(Win32Error):
-    DESCRIPTION = """The transport cannot access the medium."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MEDIUM_NOT_ACCESSIBLE
 
 
 class ErrorUnableToLoadMediumError(Win32Error):
-    DESCRIPTION = """Unable to load the medium into the drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_LOAD_MEDIUM
 
 
 class ErrorUnableToInventoryDriveError(Win32Error):
-    DESCRIPTION = """Unable to retrieve the drive status."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_INVENTORY_DRIVE
 
 
 class ErrorUnableToInventorySlotError(Win32Error):
-    DESCRIPTION = """Unable to retrieve the slot status."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_INVENTORY_SLOT
 
 
 class ErrorUnableToInventoryTransportError(Win32Error):
-    DESCRIPTION = """Unable to retrieve status about the transport."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_INVENTORY_TRANSPORT
 
 
 class ErrorTransportFullError(Win32Error):
-    DESCRIPTION = """Cannot use the transport because it is already in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSPORT_FULL
 
 
 class ErrorControllingIeportError(Win32Error):
-    DESCRIPTION = """Unable to open or close the inject/eject port."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CONTROLLING_IEPORT
 
 
 class ErrorUnableToEjectMountedMediaError(Win32Error):
-    DESCRIPTION = """Unable to eject the medium because it is in a drive."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNABLE_TO_EJECT_MOUNTED_MEDIA
 
 
 class ErrorCleanerSlotSetError(Win32Error):
-    DESCRIPTION = """A cleaner slot is already reserved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLEANER_SLOT_SET
 
 
 class ErrorCleanerSlotNotSetError(Win32Error):
-    DESCRIPTION = """A cleaner slot is not reserved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLEANER_SLOT_NOT_SET
 
 
 class ErrorCleanerCartridgeSpentError(Win32Error):
-    DESCRIPTION = """The cleaner cartridge has performed the maximum number of drive cleanings."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLEANER_CARTRIDGE_SPENT
 
 
 class ErrorUnexpectedOmidError(Win32Error):
-    DESCRIPTION = """Unexpected on-medium identifier."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNEXPECTED_OMID
 
 
 class ErrorCantDeleteLastItemError(Win32Error):
-    DESCRIPTION = """The last remaining item in this group or resource cannot be deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_DELETE_LAST_ITEM
 
 
 class ErrorMessageExceedsMaxSizeError(Win32Error):
-    DESCRIPTION = """The message provided exceeds the maximum size allowed for this parameter."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MESSAGE_EXCEEDS_MAX_SIZE
 
 
 class ErrorVolumeContainsSysFilesError(Win32Error):
-    DESCRIPTION = """The volume contains system or paging files."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VOLUME_CONTAINS_SYS_FILES
 
 
 class ErrorIndigenousTypeError(Win32Error):
-    DESCRIPTION = """The media type cannot be removed from this library because at least one drive in the library reports it can support this media type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INDIGENOUS_TYPE
 
 
 class ErrorNoSupportingDrivesError(Win32Error):
-    DESCRIPTION = """This offline media cannot be mounted on this system because no enabled drives are present that can be used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SUPPORTING_DRIVES
 
 
 class ErrorCleanerCartridgeInstalledError(Win32Error):
-    DESCRIPTION = """A cleaner cartridge is present in the tape library."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLEANER_CARTRIDGE_INSTALLED
 
 
 class ErrorIeportFullError(Win32Error):
-    DESCRIPTION = """Cannot use the IEport because it is not empty."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IEPORT_FULL
 
 
 class ErrorFileOfflineError(Win32Error):
-    DESCRIPTION = """The remote storage service was not able to recall the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_OFFLINE
 
 
 class ErrorRemoteStorageNotActiveError(Win32Error):
-    DESCRIPTION = """The remote storage service is not operational at this time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REMOTE_STORAGE_NOT_ACTIVE
 
 
 class ErrorRemoteStorageMediaErrorError(Win32Error):
-    DESCRIPTION = """The remote storage service encountered a media error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REMOTE_STORAGE_MEDIA_ERROR
 
 
 class ErrorNotAReparsePointError(Win32Error):
-    DESCRIPTION = """The file or directory is not a reparse point."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_A_REPARSE_POINT
 
 
 class ErrorReparseAttributeConflictError(Win32Error):
-    DESCRIPTION = """The reparse point attribute cannot be set because it conflicts with an existing attribute."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REPARSE_ATTRIBUTE_CONFLICT
 
 
 class ErrorInvalidReparseDataError(Win32Error):
-    DESCRIPTION = """The data present in the reparse point buffer is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_REPARSE_DATA
 
 
 class ErrorReparseTagInvalidError(Win32Error):
-    DESCRIPTION = """The tag present in the reparse point buffer is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REPARSE_TAG_INVALID
 
 
 class ErrorReparseTagMismatchError(Win32Error):
-    DESCRIPTION = """There is a mismatch between the tag specified in the request and the tag present in the reparse point."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REPARSE_TAG_MISMATCH
 
 
 class ErrorVolumeNotSisEnabledError(Win32Error):
-    DESCRIPTION = """Single Instance Storage (SIS) is not available on this volume."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VOLUME_NOT_SIS_ENABLED
 
 
 class ErrorDependentResourceExistsError(Win32Error):
-    DESCRIPTION = """The operation cannot be completed because other resources depend on this resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEPENDENT_RESOURCE_EXISTS
 
 
 class ErrorDependencyNotFoundError(Win32Error):
-    DESCRIPTION = """The cluster resource dependency cannot be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEPENDENCY_NOT_FOUND
 
 
 class ErrorDependencyAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The cluster resource cannot be made dependent on the specified resource because it is already dependent."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEPENDENCY_ALREADY_EXISTS
 
 
 class ErrorResourceNotOnlineError(Win32Error):
-    DESCRIPTION = """The cluster resource is not online."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_NOT_ONLINE
 
 
 class ErrorHostNodeNotAvailableError(Win32Error):
-    DESCRIPTION = """A cluster node is not available for this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOST_NODE_NOT_AVAILABLE
 
 
 class ErrorResourceNotAvailableError(Win32Error):
-    DESCRIPTION = """The cluster resource is not available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_NOT_AVAILABLE
 
 
 class ErrorResourceNotFoundError(Win32Error):
-    DESCRIPTION = """The cluster resource could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_NOT_FOUND
 
 
 class ErrorShutdownClusterError(Win32Error):
-    DESCRIPTION = """The cluster is being shut down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHUTDOWN_CLUSTER
 
 
 class ErrorCantEvictActiveNodeError(Win32Error):
-    DESCRIPTION = """A cluster node cannot be evicted from the cluster unless the node is down or it is the last node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_EVICT_ACTIVE_NODE
 
 
 class ErrorObjectAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The object already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OBJECT_ALREADY_EXISTS
 
 
 class ErrorObjectInListError(Win32Error):
-    DESCRIPTION = """The object is already in the list."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OBJECT_IN_LIST
 
 
 class ErrorGroupNotAvailableError(Win32Error):
-    DESCRIPTION = """The cluster group is not available for any new requests."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GROUP_NOT_AVAILABLE
 
 
 class ErrorGroupNotFoundError(Win32Error):
-    DESCRIPTION = """The cluster group could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GROUP_NOT_FOUND
 
 
 class ErrorGroupNotOnlineError(Win32Error):
-    DESCRIPTION = """The operation could not be completed because the cluster group is not online."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_GROUP_NOT_ONLINE
 
 
 class ErrorHostNodeNotResourceOwnerError(Win32Error):
-    DESCRIPTION = """The operation failed because either the specified cluster node is not the owner of the resource, or the node is not a possible owner of the resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOST_NODE_NOT_RESOURCE_OWNER
 
 
 class ErrorHostNodeNotGroupOwnerError(Win32Error):
-    DESCRIPTION = """The operation failed because either the specified cluster node is not the owner of the group, or the node is not a possible owner of the group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HOST_NODE_NOT_GROUP_OWNER
 
 
 class ErrorResmonCreateFailedError(Win32Error):
-    DESCRIPTION = """The cluster resource could not be created in the specified resource monitor."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESMON_CREATE_FAILED
 
 
 class ErrorResmonOnlineFailedError(Win32Error):
-    DESCRIPTION = """The cluster resource could not be brought online by the resource monitor."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESMON_ONLINE_FAILED
 
 
 class ErrorResourceOnlineError(Win32Error):
-    DESCRIPTION = """The operation could not be completed because the cluster resource is online."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_ONLINE
 
 
 class ErrorQuorumResourceError(Win32Error):
-    DESCRIPTION = """The cluster resource could not be deleted or brought offline because it is the quorum resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_QUORUM_RESOURCE
 
 
 class ErrorNotQuorumCapableError(Win32Error):
-    DESCRIPTION = """The cluster could not make the specified resource a quorum resource because it is not capable of being a quorum resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_QUORUM_CAPABLE
 
 
 class ErrorClusterShuttingDownError(Win32Error):
-    DESCRIPTION = """The cluster software is shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_SHUTTING_DOWN
 
 
 class ErrorInvalidStateError(Win32Error):
-    DESCRIPTION = """The group or resource is not in the correct state to perform the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_STATE
 
 
 class ErrorResourcePropertiesStoredError(Win32Error):
-    DESCRIPTION = """The properties were stored but not all changes will take effect until the next time the resource is brought online."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_PROPERTIES_STORED
 
 
 class ErrorNotQuorumClassError(Win32Error):
-    DESCRIPTION = """The cluster could not make the specified resource a quorum resource because it does not belong to a shared storage class."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_QUORUM_CLASS
 
 
 class ErrorCoreResourceError(Win32Error):
-    DESCRIPTION = """The cluster resource could not be deleted because it is a core resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CORE_RESOURCE
 
 
 class ErrorQuorumResourceOnlineFailedError(Win32Error):
-    DESCRIPTION = """The quorum resource failed to come online."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_QUORUM_RESOURCE_ONLINE_FAILED
 
 
 class ErrorQuorumlogOpenFailedError(Win32Error):
-    DESCRIPTION = """The quorum log could not be created or mounted successfully."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_QUORUMLOG_OPEN_FAILED
 
 
 class ErrorClusterlogCorruptError(Win32Error):
-    DESCRIPTION = """The cluster log is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTERLOG_CORRUPT
 
 
 class ErrorClusterlogRecordExceedsMaxsizeError(Win32Error):
-    DESCRIPTION = """The record could not be written to the cluster log because it exceeds the maximum size."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTERLOG_RECORD_EXCEEDS_MAXSIZE
 
 
 class ErrorClusterlogExceedsMaxsizeError(Win32Error):
-    DESCRIPTION = """The cluster log exceeds its maximum size."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTERLOG_EXCEEDS_MAXSIZE
 
 
 class ErrorClusterlogChkpointNotFoundError(Win32Error):
-    DESCRIPTION = """No checkpoint record was found in the cluster log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTERLOG_CHKPOINT_NOT_FOUND
 
 
 class ErrorClusterlogNotEnoughSpaceError(Win32Error):
-    DESCRIPTION = """The minimum required disk space needed for logging is not available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTERLOG_NOT_ENOUGH_SPACE
 
 
 class ErrorQuorumOwnerAliveError(Win32Error):
-    DESCRIPTION = """The cluster node failed to take control of the quorum resource because the resource is owned by another active node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_QUORUM_OWNER_ALIVE
 
 
 class ErrorNetworkNotAvailableError(Win32Error):
-    DESCRIPTION = """A cluster network is not available for this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NETWORK_NOT_AVAILABLE
 
 
 class ErrorNodeNotAvailableError(Win32Error):
-    DESCRIPTION = """A cluster node is not available for this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NODE_NOT_AVAILABLE
 
 
 class ErrorAllNodesNotAvailableError(Win32Error):
-    DESCRIPTION = """All cluster nodes must be running to perform this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ALL_NODES_NOT_AVAILABLE
 
 
 class ErrorResourceFailedError(Win32Error):
-    DESCRIPTION = """A cluster resource failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_FAILED
 
 
 class ErrorClusterInvalidNodeError(Win32Error):
-    DESCRIPTION = """The cluster node is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_NODE
 
 
 class ErrorClusterNodeExistsError(Win32Error):
-    DESCRIPTION = """The cluster node already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_EXISTS
 
 
 class ErrorClusterJoinInProgressError(Win32Error):
-    DESCRIPTION = """A node is in the process of joining the cluster."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_JOIN_IN_PROGRESS
 
 
 class ErrorClusterNodeNotFoundError(Win32Error):
-    DESCRIPTION = """The cluster node was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_NOT_FOUND
 
 
 class ErrorClusterLocalNodeNotFoundError(Win32Error):
-    DESCRIPTION = """The cluster local node information was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_LOCAL_NODE_NOT_FOUND
 
 
 class ErrorClusterNetworkExistsError(Win32Error):
-    DESCRIPTION = """The cluster network already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETWORK_EXISTS
 
 
 class ErrorClusterNetworkNotFoundError(Win32Error):
-    DESCRIPTION = """The cluster network was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETWORK_NOT_FOUND
 
 
 class ErrorClusterNetinterfaceExistsError(Win32Error):
-    DESCRIPTION = """The cluster network interface already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETINTERFACE_EXISTS
 
 
 class ErrorClusterNetinterfaceNotFoundError(Win32Error):
-    DESCRIPTION = """The cluster network interface was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETINTERFACE_NOT_FOUND
 
 
 class ErrorClusterInvalidRequestError(Win32Error):
-    DESCRIPTION = """The cluster request is not valid for this object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_REQUEST
 
 
 class ErrorClusterInvalidNetworkProviderError(Win32Error):
-    DESCRIPTION = """The cluster network provider is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_NETWORK_PROVIDER
 
 
 class ErrorClusterNodeDownError(Win32Error):
-    DESCRIPTION = """The cluster node is down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_DOWN
 
 
 class ErrorClusterNodeUnreachableError(Win32Error):
-    DESCRIPTION = """The cluster node is not reachable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_UNREACHABLE
 
 
 class ErrorClusterNodeNotMemberError(Win32Error):
-    DESCRIPTION = """The cluster node is not a member of the cluster."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_NOT_MEMBER
 
 
 class ErrorClusterJoinNotInProgressError(Win32Error):
-    DESCRIPTION = """A cluster join operation is not in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_JOIN_NOT_IN_PROGRESS
 
 
 class ErrorClusterInvalidNetworkError(Win32Error):
-    DESCRIPTION = """The cluster network is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_NETWORK
 
 
 class ErrorClusterNodeUpError(Win32Error):
-    DESCRIPTION = """The cluster node is up."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_UP
 
 
 class ErrorClusterIpaddrInUseError(Win32Error):
-    DESCRIPTION = """The cluster IP address is already in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_IPADDR_IN_USE
 
 
 class ErrorClusterNodeNotPausedError(Win32Error):
-    DESCRIPTION = """The cluster node is not paused."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_NOT_PAUSED
 
 
 class ErrorClusterNoSecurityContextError(Win32Error):
-    DESCRIPTION = """No cluster security context is available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NO_SECURITY_CONTEXT
 
 
 class ErrorClusterNetworkNotInternalError(Win32Error):
-    DESCRIPTION = """The cluster network is not configured for internal cluster communication."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETWORK_NOT_INTERNAL
 
 
 class ErrorClusterNodeAlreadyUpError(Win32Error):
-    DESCRIPTION = """The cluster node is already up."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_ALREADY_UP
 
 
 class ErrorClusterNodeAlreadyDownError(Win32Error):
-    DESCRIPTION = """The cluster node is already down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_ALREADY_DOWN
 
 
 class ErrorClusterNetworkAlreadyOnlineError(Win32Error):
-    DESCRIPTION = """The cluster network is already online."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETWORK_ALREADY_ONLINE
 
 
 class ErrorClusterNetworkAlreadyOfflineError(Win32Error):
-    DESCRIPTION = """The cluster network is already offline."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETWORK_ALREADY_OFFLINE
 
 
 class ErrorClusterNodeAlreadyMemberError(Win32Error):
-    DESCRIPTION = """The cluster node is already a member of the cluster."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_ALREADY_MEMBER
 
 
 class ErrorClusterLastInternalNetworkError(Win32Error):
-    DESCRIPTION = """The cluster network is the only one configured for internal cluster communication between two or more active cluster nodes. The internal communication capability cannot be removed from the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_LAST_INTERNAL_NETWORK
 
 
 class ErrorClusterNetworkHasDependentsError(Win32Error):
-    DESCRIPTION = """One or more cluster resources depend on the network to provide service to clients. The client access capability cannot be removed from the network."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETWORK_HAS_DEPENDENTS
 
 
 class ErrorInvalidOperationOnQuorumError(Win32Error):
-    DESCRIPTION = """This operation cannot be performed on the cluster resource because it is the quorum resource. This quorum resource cannot be brought offline and its possible owners list cannot be modified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_OPERATION_ON_QUORUM
 
 
 class ErrorDependencyNotAllowedError(Win32Error):
-    DESCRIPTION = """The cluster quorum resource is not allowed to have any dependencies."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEPENDENCY_NOT_ALLOWED
 
 
 class ErrorClusterNodePausedError(Win32Error):
-    DESCRIPTION = """The cluster node is paused."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_PAUSED
 
 
 class ErrorNodeCantHostResourceError(Win32Error):
-    DESCRIPTION = """The cluster resource cannot be brought online. The owner node cannot run this resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NODE_CANT_HOST_RESOURCE
 
 
 class ErrorClusterNodeNotReadyError(Win32Error):
-    DESCRIPTION = """The cluster node is not ready to perform the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_NOT_READY
 
 
 class ErrorClusterNodeShuttingDownError(Win32Error):
-    DESCRIPTION = """The cluster node is shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_SHUTTING_DOWN
 
 
 class ErrorClusterJoinAbortedError(Win32Error):
-    DESCRIPTION = """The cluster join operation was aborted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_JOIN_ABORTED
 
 
 class ErrorClusterIncompatibleVersionsError(Win32Error):
-    DESCRIPTION = """The cluster join operation failed due to incompatible software versions between the joining node and its sponsor."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INCOMPATIBLE_VERSIONS
 
 
 class ErrorClusterMaxnumOfResourcesExceededError(Win32Error):
-    DESCRIPTION = """This resource cannot be created because the cluster has reached the limit on the number of resources it can monitor."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_MAXNUM_OF_RESOURCES_EXCEEDED
 
 
 class ErrorClusterSystemConfigChangedError(Win32Error):
-    DESCRIPTION = """The system configuration changed during the cluster join or form operation. The join or form operation was aborted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_SYSTEM_CONFIG_CHANGED
 
 
 class ErrorClusterResourceTypeNotFoundError(Win32Error):
-    DESCRIPTION = """The specified resource type was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_RESOURCE_TYPE_NOT_FOUND
 
 
 class ErrorClusterRestypeNotSupportedError(Win32Error):
-    DESCRIPTION = """The specified node does not support a resource of this type. This might be due to version inconsistencies or due to the absence of the resource DLL on this node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_RESTYPE_NOT_SUPPORTED
 
 
 class ErrorClusterResnameNotFoundError(Win32Error):
-    DESCRIPTION = """The specified resource name is not supported by this resource DLL. This might be due to a bad (or changed) name supplied to the resource DLL."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_RESNAME_NOT_FOUND
 
 
 class ErrorClusterNoRpcPackagesRegisteredError(Win32Error):
-    DESCRIPTION = """No authentication package could be registered with the RPC server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NO_RPC_PACKAGES_REGISTERED
 
 
 class ErrorClusterOwnerNotInPreflistError(Win32Error):
-    DESCRIPTION = """You cannot bring the group online because the owner of the group is not in the preferred list for the group. To change the owner node for the group, move the group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_OWNER_NOT_IN_PREFLIST
 
 
 class ErrorClusterDatabaseSeqmismatchError(Win32Error):
-    DESCRIPTION = """The join operation failed because the cluster database sequence number has changed or is incompatible with the locker node. This can happen during a join operation if the cluster database was changing during the join."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_DATABASE_SEQMISMATCH
 
 
 class ErrorResmonInvalidStateError(Win32Error):
-    DESCRIPTION = """The resource monitor will not allow the fail operation to be performed while the resource is in its current state. This can happen if the resource is in a pending state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESMON_INVALID_STATE
 
 
 class ErrorClusterGumNotLockerError(Win32Error):
-    DESCRIPTION = """A non-locker code received a request to reserve the lock for making global updates."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_GUM_NOT_LOCKER
 
 
 class ErrorQuorumDiskNotFoundError(Win32Error):
-    DESCRIPTION = """The quorum disk could not be located by the cluster service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_QUORUM_DISK_NOT_FOUND
 
 
 class ErrorDatabaseBackupCorruptError(Win32Error):
-    DESCRIPTION = """The backed-up cluster database is possibly corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DATABASE_BACKUP_CORRUPT
 
 
 class ErrorClusterNodeAlreadyHasDfsRootError(Win32Error):
-    DESCRIPTION = """A DFS root already exists in this cluster node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NODE_ALREADY_HAS_DFS_ROOT
 
 
 class ErrorResourcePropertyUnchangeableError(Win32Error):
-    DESCRIPTION = """An attempt to modify a resource property failed because it conflicts with another existing property."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_PROPERTY_UNCHANGEABLE
 
 
 class ErrorClusterMembershipInvalidStateError(Win32Error):
-    DESCRIPTION = """An operation was attempted that is incompatible with the current membership state of the node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_MEMBERSHIP_INVALID_STATE
 
 
 class ErrorClusterQuorumlogNotFoundError(Win32Error):
-    DESCRIPTION = """The quorum resource does not contain the quorum log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_QUORUMLOG_NOT_FOUND
 
 
 class ErrorClusterMembershipHaltError(Win32Error):
-    DESCRIPTION = """The membership engine requested shutdown of the cluster service on this node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_MEMBERSHIP_HALT
 
 
 class ErrorClusterInstanceIdMismatchError(Win32Error):
-    DESCRIPTION = """The join operation failed because the cluster instance ID of the joining node does not match the cluster instance ID of the sponsor node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INSTANCE_ID_MISMATCH
 
 
 class ErrorClusterNetworkNotFoundForIpError(Win32Error):
-    DESCRIPTION = """A matching cluster network for the specified IP address could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NETWORK_NOT_FOUND_FOR_IP
 
 
 class ErrorClusterPropertyDataTypeMismatchError(Win32Error):
-    DESCRIPTION = """The actual data type of the property did not match the expected data type of the property."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_PROPERTY_DATA_TYPE_MISMATCH
 
 
 class ErrorClusterEvictWithoutCleanupError(Win32Error):
-    DESCRIPTION = """The cluster node was evicted from the cluster successfully, but the node was not cleaned up. To determine what clean-up steps failed and how to recover, see the Failover Clustering application event log using Event Viewer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_EVICT_WITHOUT_CLEANUP
 
 
 class ErrorClusterParameterMismatchError(Win32Error):
-    DESCRIPTION = """Two or more parameter values specified for a resource's properties are in conflict."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_PARAMETER_MISMATCH
 
 
 class ErrorNodeCannotBeClusteredError(Win32Error):
-    DESCRIPTION = """This computer cannot be made a member of a cluster."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NODE_CANNOT_BE_CLUSTERED
 
 
 class ErrorClusterWrongOsVersionError(Win32Error):
-    DESCRIPTION = """This computer cannot be made a member of a cluster because it does not have the correct version of Windows installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_WRONG_OS_VERSION
 
 
 class ErrorClusterCantCreateDupClusterNameError(Win32Error):
-    DESCRIPTION = """A cluster cannot be created with the specified cluster name because that cluster name is already in use. Specify a different name for the cluster."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_CANT_CREATE_DUP_CLUSTER_NAME
 
 
 class ErrorCluscfgAlreadyCommittedError(Win32Error):
-    DESCRIPTION = """The cluster configuration action has already been committed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSCFG_ALREADY_COMMITTED
 
 
 class ErrorCluscfgRollbackFailedError(Win32Error):
-    DESCRIPTION = """The cluster configuration action could not be rolled back."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSCFG_ROLLBACK_FAILED
 
 
 class ErrorCluscfgSystemDiskDriveLetterConflictError(Win32Error):
-    DESCRIPTION = """The drive letter assigned to a system disk on one node conflicted with the drive letter assigned to a disk on another node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSCFG_SYSTEM_DISK_DRIVE_LETTER_CONFLICT
 
 
 class ErrorClusterOldVersionError(Win32Error):
-    DESCRIPTION = """One or more nodes in the cluster are running a version of Windows that does not support this operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_OLD_VERSION
 
 
 class ErrorClusterMismatchedComputerAcctNameError(Win32Error):
-    DESCRIPTION = """The name of the corresponding computer account does not match the network name for this resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_MISMATCHED_COMPUTER_ACCT_NAME
 
 
 class ErrorClusterNoNetAdaptersError(Win32Error):
-    DESCRIPTION = """No network adapters are available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NO_NET_ADAPTERS
 
 
 class ErrorClusterPoisonedError(Win32Error):
-    DESCRIPTION = """The cluster node has been poisoned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_POISONED
 
 
 class ErrorClusterGroupMovingError(Win32Error):
-    DESCRIPTION = """The group is unable to accept the request because it is moving to another node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_GROUP_MOVING
 
 
 class ErrorClusterResourceTypeBusyError(Win32Error):
-    DESCRIPTION = """The resource type cannot accept the request because it is too busy performing another operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_RESOURCE_TYPE_BUSY
 
 
 class ErrorResourceCallTimedOutError(Win32Error):
-    DESCRIPTION = """The call to the cluster resource DLL timed out."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_CALL_TIMED_OUT
 
 
 class ErrorInvalidClusterIpv6AddressError(Win32Error):
-    DESCRIPTION = """The address is not valid for an IPv6 Address resource. A global IPv6 address is required, and it must match a cluster network. Compatibility addresses are not permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_CLUSTER_IPV6_ADDRESS
 
 
 class ErrorClusterInternalInvalidFunctionError(Win32Error):
-    DESCRIPTION = """An internal cluster error occurred. A call to an invalid function was attempted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INTERNAL_INVALID_FUNCTION
 
 
 class ErrorClusterParameterOutOfBoundsError(Win32Error):
-    DESCRIPTION = """A parameter value is out of acceptable range."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_PARAMETER_OUT_OF_BOUNDS
 
 
 class ErrorClusterPartialSendError(Win32Error):
-    DESCRIPTION = """A network error occurred while sending data to another node in the cluster. The number of bytes transmitted was less than required."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_PARTIAL_SEND
 
 
 class ErrorClusterRegistryInvalidFunctionError(Win32Error):
-    DESCRIPTION = """An invalid cluster registry operation was attempted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_REGISTRY_INVALID_FUNCTION
 
 
 class ErrorClusterInvalidStringTerminationError(Win32Error):
-    DESCRIPTION = """An input string of characters is not properly terminated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_STRING_TERMINATION
 
 
 class ErrorClusterInvalidStringFormatError(Win32Error):
-    DESCRIPTION = """An input string of characters is not in a valid format for the data it represents."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_STRING_FORMAT
 
 
 class ErrorClusterDatabaseTransactionInProgressError(Win32Error):
-    DESCRIPTION = """An internal cluster error occurred. A cluster database transaction was attempted while a transaction was already in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_DATABASE_TRANSACTION_IN_PROGRESS
 
 
 class ErrorClusterDatabaseTransactionNotInProgressError(Win32Error):
-    DESCRIPTION = """An internal cluster error occurred. There was an attempt to commit a cluster database transaction while no transaction was in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_DATABASE_TRANSACTION_NOT_IN_PROGRESS
 
 
 class ErrorClusterNullDataError(Win32Error):
-    DESCRIPTION = """An internal cluster error occurred. Data was not properly initialized."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NULL_DATA
 
 
 class ErrorClusterPartialReadError(Win32Error):
-    DESCRIPTION = """An error occurred while reading from a stream of data. An unexpected number of bytes was returned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_PARTIAL_READ
 
 
 class ErrorClusterPartialWriteError(Win32Error):
-    DESCRIPTION = """An error occurred while writing to a stream of data. The required number of bytes could not be written."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_PARTIAL_WRITE
 
 
 class ErrorClusterCantDeserializeDataError(Win32Error):
-    DESCRIPTION = """An error occurred while deserializing a stream of cluster data."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_CANT_DESERIALIZE_DATA
 
 
 class ErrorDependentResourcePropertyConflictError(Win32Error):
-    DESCRIPTION = """One or more property values for this resource are in conflict with one or more property values associated with its dependent resources."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DEPENDENT_RESOURCE_PROPERTY_CONFLICT
 
 
 class ErrorClusterNoQuorumError(Win32Error):
-    DESCRIPTION = """A quorum of cluster nodes was not present to form a cluster."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_NO_QUORUM
 
 
 class ErrorClusterInvalidIpv6NetworkError(Win32Error):
-    DESCRIPTION = """The cluster network is not valid for an IPv6 address resource, or it does not match the configured address."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_IPV6_NETWORK
 
 
 class ErrorClusterInvalidIpv6TunnelNetworkError(Win32Error):
-    DESCRIPTION = """The cluster network is not valid for an IPv6 tunnel resource. Check the configuration of the IP Address resource on which the IPv6 tunnel resource depends."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CLUSTER_INVALID_IPV6_TUNNEL_NETWORK
 
 
 class ErrorQuorumNotAllowedInThisGroupError(Win32Error):
-    DESCRIPTION = """Quorum resource cannot reside in the available storage group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_QUORUM_NOT_ALLOWED_IN_THIS_GROUP
 
 
 class ErrorEncryptionFailedError(Win32Error):
-    DESCRIPTION = """The specified file could not be encrypted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ENCRYPTION_FAILED
 
 
 class ErrorDecryptionFailedError(Win32Error):
-    DESCRIPTION = """The specified file could not be decrypted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DECRYPTION_FAILED
 
 
 class ErrorFileEncryptedError(Win32Error):
-    DESCRIPTION = """The specified file is encrypted and the user does not have the ability to decrypt it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_ENCRYPTED
 
 
 class ErrorNoRecoveryPolicyError(Win32Error):
-    DESCRIPTION = """There is no valid encryption recovery policy configured for this system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_RECOVERY_POLICY
 
 
 class ErrorNoEfsError(Win32Error):
-    DESCRIPTION = """The required encryption driver is not loaded for this system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_EFS
 
 
 class ErrorWrongEfsError(Win32Error):
-    DESCRIPTION = """The file was encrypted with a different encryption driver than is currently loaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_WRONG_EFS
 
 
 class ErrorNoUserKeysError(Win32Error):
-    DESCRIPTION = """There are no Encrypting File System (EFS) keys defined for the user."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_USER_KEYS
 
 
 class ErrorFileNotEncryptedError(Win32Error):
-    DESCRIPTION = """The specified file is not encrypted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_NOT_ENCRYPTED
 
 
 class ErrorNotExportFormatError(Win32Error):
-    DESCRIPTION = """The specified file is not in the defined EFS export format."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_EXPORT_FORMAT
 
 
 class ErrorFileReadOnlyError(Win32Error):
-    DESCRIPTION = """The specified file is read-only."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_READ_ONLY
 
 
 class ErrorDirEfsDisallowedError(Win32Error):
-    DESCRIPTION = """The directory has been disabled for encryption."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DIR_EFS_DISALLOWED
 
 
 class ErrorEfsServerNotTrustedError(Win32Error):
-    DESCRIPTION = """The server is not trusted for remote encryption operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EFS_SERVER_NOT_TRUSTED
 
 
 class ErrorBadRecoveryPolicyError(Win32Error):
-    DESCRIPTION = """Recovery policy configured for this system contains invalid recovery certificate."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_BAD_RECOVERY_POLICY
 
 
 class ErrorEfsAlgBlobTooBigError(Win32Error):
-    DESCRIPTION = """The encryption algorithm used on the source file needs a bigger key buffer than the one on the destination file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EFS_ALG_BLOB_TOO_BIG
 
 
 class ErrorVolumeNotSupportEfsError(Win32Error):
-    DESCRIPTION = """The disk partition does not support file encryption."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_VOLUME_NOT_SUPPORT_EFS
 
 
 class ErrorEfsDisabledError(Win32Error):
-    DESCRIPTION = """This machine is disabled for file encryption."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EFS_DISABLED
 
 
 class ErrorEfsVersionNotSupportError(Win32Error):
-    DESCRIPTION = """A newer system is required to decrypt this encrypted file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EFS_VERSION_NOT_SUPPORT
 
 
 class ErrorCsEncryptionInvalidServerResponseError(Win32Error):
-    DESCRIPTION = """The remote server sent an invalid response for a file being opened with client-side encryption."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CS_ENCRYPTION_INVALID_SERVER_RESPONSE
 
 
 class ErrorCsEncryptionUnsupportedServerError(Win32Error):
-    DESCRIPTION = """Client-side encryption is not supported by the remote server even though it claims to support it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CS_ENCRYPTION_UNSUPPORTED_SERVER
 
 
 class ErrorCsEncryptionExistingEncryptedFileError(Win32Error):
-    DESCRIPTION = """File is encrypted and should be opened in client-side encryption mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CS_ENCRYPTION_EXISTING_ENCRYPTED_FILE
 
 
 class ErrorCsEncryptionNewEncryptedFileError(Win32Error):
-    DESCRIPTION = """A new encrypted file is being created and a $EFS needs to be provided."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CS_ENCRYPTION_NEW_ENCRYPTED_FILE
 
 
 class ErrorCsEncryptionFileNotCseError(Win32Error):
-    DESCRIPTION = """The SMB client requested a client-side extension (CSE) file system control (FSCTL) on a non-CSE file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CS_ENCRYPTION_FILE_NOT_CSE
 
 
 class ErrorNoBrowserServersFoundError(Win32Error):
-    DESCRIPTION = """The list of servers for this workgroup is not currently available"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_BROWSER_SERVERS_FOUND
 
 
 class SchedEServiceNotLocalsystemError(Win32Error):
-    DESCRIPTION = """The Task Scheduler service must be configured to run in the System account to function properly. Individual tasks can be configured to run in other accounts."""
     WIN32_ERROR_CODE = Win32ErrorCode.SCHED_E_SERVICE_NOT_LOCALSYSTEM
 
 
 class ErrorLogSectorInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered an invalid log sector."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_SECTOR_INVALID
 
 
 class ErrorLogSectorParityInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered a log sector with invalid block parity."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_SECTOR_PARITY_INVALID
 
 
 class ErrorLogSectorRemappedError(Win32Error):
-    DESCRIPTION = """The log service encountered a remapped log sector."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_SECTOR_REMAPPED
 
 
 class ErrorLogBlockIncompleteError(Win32Error):
-    DESCRIPTION = """The log service encountered a partial or incomplete log block."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_BLOCK_INCOMPLETE
 
 
 class ErrorLogInvalidRangeError(Win32Error):
-    DESCRIPTION = """The log service encountered an attempt to access data outside the active log range."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_INVALID_RANGE
 
 
 class ErrorLogBlocksExhaustedError(Win32Error):
-    DESCRIPTION = """The log service user marshaling buffers are exhausted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_BLOCKS_EXHAUSTED
 
 
 class ErrorLogReadContextInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered an attempt to read from a marshaling area with an invalid read context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_READ_CONTEXT_INVALID
 
 
 class ErrorLogRestartInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered an invalid log restart area."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_RESTART_INVALID
 
 
 class ErrorLogBlockVersionError(Win32Error):
-    DESCRIPTION = """The log service encountered an invalid log block version."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_BLOCK_VERSION
 
 
 class ErrorLogBlockInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered an invalid log block."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_BLOCK_INVALID
 
 
 class ErrorLogReadModeInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered an attempt to read the log with an invalid read mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_READ_MODE_INVALID
 
 
 class ErrorLogNoRestartError(Win32Error):
-    DESCRIPTION = """The log service encountered a log stream with no restart area."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_NO_RESTART
 
 
 class ErrorLogMetadataCorruptError(Win32Error):
-    DESCRIPTION = """The log service encountered a corrupted metadata file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_METADATA_CORRUPT
 
 
 class ErrorLogMetadataInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered a metadata file that could not be created by the log file system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_METADATA_INVALID
 
 
 class ErrorLogMetadataInconsistentError(Win32Error):
-    DESCRIPTION = """The log service encountered a metadata file with inconsistent data."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_METADATA_INCONSISTENT
 
 
 class ErrorLogReservationInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered an attempt to erroneous allocate or dispose reservation space."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_RESERVATION_INVALID
 
 
 class ErrorLogCantDeleteError(Win32Error):
-    DESCRIPTION = """The log service cannot delete a log file or file system container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CANT_DELETE
 
 
 class ErrorLogContainerLimitExceededError(Win32Error):
-    DESCRIPTION = """The log service has reached the maximum allowable containers allocated to a log file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CONTAINER_LIMIT_EXCEEDED
 
 
 class ErrorLogStartOfLogError(Win32Error):
-    DESCRIPTION = """The log service has attempted to read or write backward past the start of the log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_START_OF_LOG
 
 
 class ErrorLogPolicyAlreadyInstalledError(Win32Error):
-    DESCRIPTION = """The log policy could not be installed because a policy of the same type is already present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_POLICY_ALREADY_INSTALLED
 
 
 class ErrorLogPolicyNotInstalledError(Win32Error):
-    DESCRIPTION = """The log policy in question was not installed at the time of the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_POLICY_NOT_INSTALLED
 
 
 class ErrorLogPolicyInvalidError(Win32Error):
-    DESCRIPTION = """The installed set of policies on the log is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_POLICY_INVALID
 
 
 class ErrorLogPolicyConflictError(Win32Error):
-    DESCRIPTION = """A policy on the log in question prevented the operation from completing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_POLICY_CONFLICT
 
 
 class ErrorLogPinnedArchiveTailError(Win32Error):
-    DESCRIPTION = """Log space cannot be reclaimed because the log is pinned by the archive tail."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_PINNED_ARCHIVE_TAIL
 
 
 class ErrorLogRecordNonexistentError(Win32Error):
-    DESCRIPTION = """The log record is not a record in the log file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_RECORD_NONEXISTENT
 
 
 class ErrorLogRecordsReservedInvalidError(Win32Error):
-    DESCRIPTION = """The number of reserved log records or the adjustment of the number of reserved log records is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_RECORDS_RESERVED_INVALID
 
 
 class ErrorLogSpaceReservedInvalidError(Win32Error):
-    DESCRIPTION = """The reserved log space or the adjustment of the log space is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_SPACE_RESERVED_INVALID
 
 
 class ErrorLogTailInvalidError(Win32Error):
-    DESCRIPTION = """A new or existing archive tail or base of the active log is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_TAIL_INVALID
 
 
 class ErrorLogFullError(Win32Error):
-    DESCRIPTION = """The log space is exhausted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_FULL
 
 
 class ErrorCouldNotResizeLogError(Win32Error):
-    DESCRIPTION = """The log could not be set to the requested size."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_COULD_NOT_RESIZE_LOG
 
 
 class ErrorLogMultiplexedError(Win32Error):
-    DESCRIPTION = """The log is multiplexed; no direct writes to the physical log are allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_MULTIPLEXED
 
 
 class ErrorLogDedicatedError(Win32Error):
-    DESCRIPTION = """The operation failed because the log is a dedicated log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_DEDICATED
 
 
 class ErrorLogArchiveNotInProgressError(Win32Error):
-    DESCRIPTION = """The operation requires an archive context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_ARCHIVE_NOT_IN_PROGRESS
 
 
 class ErrorLogArchiveInProgressError(Win32Error):
-    DESCRIPTION = """Log archival is in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_ARCHIVE_IN_PROGRESS
 
 
 class ErrorLogEphemeralError(Win32Error):
-    DESCRIPTION = """The operation requires a non-ephemeral log, but the log is ephemeral."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_EPHEMERAL
 
 
 class ErrorLogNotEnoughContainersError(Win32Error):
-    DESCRIPTION = """The log must have at least two containers before it can be read from or written to."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_NOT_ENOUGH_CONTAINERS
 
 
 class ErrorLogClientAlreadyRegisteredError(Win32Error):
-    DESCRIPTION = """A log client has already registered on the stream."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CLIENT_ALREADY_REGISTERED
 
 
 class ErrorLogClientNotRegisteredError(Win32Error):
-    DESCRIPTION = """A log client has not been registered on the stream."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CLIENT_NOT_REGISTERED
 
 
 class ErrorLogFullHandlerInProgressError(Win32Error):
-    DESCRIPTION = """A request has already been made to handle the log full condition."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_FULL_HANDLER_IN_PROGRESS
 
 
 class ErrorLogContainerReadFailedError(Win32Error):
-    DESCRIPTION = """The log service encountered an error when attempting to read from a log container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CONTAINER_READ_FAILED
 
 
 class ErrorLogContainerWriteFailedError(Win32Error):
-    DESCRIPTION = """The log service encountered an error when attempting to write to a log container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CONTAINER_WRITE_FAILED
 
 
 class ErrorLogContainerOpenFailedError(Win32Error):
-    DESCRIPTION = """The log service encountered an error when attempting to open a log container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CONTAINER_OPEN_FAILED
 
 
 class ErrorLogContainerStateInvalidError(Win32Error):
-    DESCRIPTION = """The log service encountered an invalid container state when attempting a requested action."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CONTAINER_STATE_INVALID
 
 
 class ErrorLogStateInvalidError(Win32Error):
-    DESCRIPTION = """The log service is not in the correct state to perform a requested action."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_STATE_INVALID
 
 
 class ErrorLogPinnedError(Win32Error):
-    DESCRIPTION = """The log space cannot be reclaimed because the log is pinned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_PINNED
 
 
 class ErrorLogMetadataFlushFailedError(Win32Error):
-    DESCRIPTION = """The log metadata flush failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_METADATA_FLUSH_FAILED
 
 
 class ErrorLogInconsistentSecurityError(Win32Error):
-    DESCRIPTION = """Security on the log and its containers is inconsistent."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_INCONSISTENT_SECURITY
 
 
 class ErrorLogAppendedFlushFailedError(Win32Error):
-    DESCRIPTION = """Records were appended to the log or reservation changes were made, but the log could not be flushed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_APPENDED_FLUSH_FAILED
 
 
 class ErrorLogPinnedReservationError(Win32Error):
-    DESCRIPTION = """The log is pinned due to reservation consuming most of the log space. Free some reserved records to make space available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_PINNED_RESERVATION
 
 
 class ErrorInvalidTransactionError(Win32Error):
-    DESCRIPTION = """The transaction handle associated with this operation is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INVALID_TRANSACTION
 
 
 class ErrorTransactionNotActiveError(Win32Error):
-    DESCRIPTION = """The requested operation was made in the context of a transaction that is no longer active."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_NOT_ACTIVE
 
 
 class ErrorTransactionRequestNotValidError(Win32Error):
-    DESCRIPTION = """The requested operation is not valid on the transaction object in its current state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_REQUEST_NOT_VALID
 
 
 class ErrorTransactionNotRequestedError(Win32Error):
-    DESCRIPTION = """The caller has called a response API, but the response is not expected because the transaction manager did not issue the corresponding request to the caller."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_NOT_REQUESTED
 
 
 class ErrorTransactionAlreadyAbortedError(Win32Error):
-    DESCRIPTION = """It is too late to perform the requested operation because the transaction has already been aborted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_ALREADY_ABORTED
 
 
 class ErrorTransactionAlreadyCommittedError(Win32Error):
-    DESCRIPTION = """It is too late to perform the requested operation because the transaction has already been committed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_ALREADY_COMMITTED
 
 
 class ErrorTmInitializationFailedError(Win32Error):
-    DESCRIPTION = """The transaction manager was unable to be successfully initialized. Transacted operations are not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TM_INITIALIZATION_FAILED
 
 
 class ErrorResourcemanagerReadOnlyError(Win32Error):
-    DESCRIPTION = """The specified resource manager made no changes or updates to the resource under this transaction."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCEMANAGER_READ_ONLY
 
 
 class ErrorTransactionNotJoinedError(Win32Error):
-    DESCRIPTION = """The resource manager has attempted to prepare a transaction that it has not successfully joined."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_NOT_JOINED
 
 
 class ErrorTransactionSuperiorExistsError(Win32Error):
-    DESCRIPTION = """The transaction object already has a superior enlistment, and the caller attempted an operation that would have created a new superior. Only a single superior enlistment is allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_SUPERIOR_EXISTS
 
 
 class ErrorCrmProtocolAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The resource manager tried to register a protocol that already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CRM_PROTOCOL_ALREADY_EXISTS
 
 
 class ErrorTransactionPropagationFailedError(Win32Error):
-    DESCRIPTION = """The attempt to propagate the transaction failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_PROPAGATION_FAILED
 
 
 class ErrorCrmProtocolNotFoundError(Win32Error):
-    DESCRIPTION = """The requested propagation protocol was not registered as a CRM."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CRM_PROTOCOL_NOT_FOUND
 
 
 class ErrorTransactionInvalidMarshallBufferError(Win32Error):
-    DESCRIPTION = """The buffer passed in to PushTransaction or PullTransaction is not in a valid format."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_INVALID_MARSHALL_BUFFER
 
 
 class ErrorCurrentTransactionNotValidError(Win32Error):
-    DESCRIPTION = """The current transaction context associated with the thread is not a valid handle to a transaction object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CURRENT_TRANSACTION_NOT_VALID
 
 
 class ErrorTransactionNotFoundError(Win32Error):
-    DESCRIPTION = """The specified transaction object could not be opened because it was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_NOT_FOUND
 
 
 class ErrorResourcemanagerNotFoundError(Win32Error):
-    DESCRIPTION = """The specified resource manager object could not be opened because it was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCEMANAGER_NOT_FOUND
 
 
 class ErrorEnlistmentNotFoundError(Win32Error):
-    DESCRIPTION = """The specified enlistment object could not be opened because it was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ENLISTMENT_NOT_FOUND
 
 
 class ErrorTransactionmanagerNotFoundError(Win32Error):
-    DESCRIPTION = """The specified transaction manager object could not be opened because it was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTIONMANAGER_NOT_FOUND
 
 
 class ErrorTransactionmanagerNotOnlineError(Win32Error):
-    DESCRIPTION = """The specified resource manager was unable to create an enlistment because its associated transaction manager is not online."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTIONMANAGER_NOT_ONLINE
 
 
 class ErrorTransactionmanagerRecoveryNameCollisionError(Win32Error):
-    DESCRIPTION = """The specified transaction manager was unable to create the objects contained in its log file in the ObjectB namespace. Therefore, the transaction manager was unable to recover."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTIONMANAGER_RECOVERY_NAME_COLLISION
 
 
 class ErrorTransactionalConflictError(Win32Error):
-    DESCRIPTION = """The function attempted to use a name that is reserved for use by another transaction."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTIONAL_CONFLICT
 
 
 class ErrorRmNotActiveError(Win32Error):
-    DESCRIPTION = """Transaction support within the specified file system resource manager is not started or was shut down due to an error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RM_NOT_ACTIVE
 
 
 class ErrorRmMetadataCorruptError(Win32Error):
-    DESCRIPTION = """The metadata of the resource manager has been corrupted. The resource manager will not function."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RM_METADATA_CORRUPT
 
 
 class ErrorDirectoryNotRmError(Win32Error):
-    DESCRIPTION = """The specified directory does not contain a resource manager."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DIRECTORY_NOT_RM
 
 
 class ErrorTransactionsUnsupportedRemoteError(Win32Error):
-    DESCRIPTION = """The remote server or share does not support transacted file operations."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTIONS_UNSUPPORTED_REMOTE
 
 
 class ErrorLogResizeInvalidSizeError(Win32Error):
-    DESCRIPTION = """The requested log size is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_RESIZE_INVALID_SIZE
 
 
 class ErrorObjectNoLongerExistsError(Win32Error):
-    DESCRIPTION = """The object (file, stream, link) corresponding to the handle has been deleted by a transaction savepoint rollback."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_OBJECT_NO_LONGER_EXISTS
 
 
 class ErrorStreamMiniversionNotFoundError(Win32Error):
-    DESCRIPTION = """The specified file miniversion was not found for this transacted file open."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_STREAM_MINIVERSION_NOT_FOUND
 
 
 class ErrorStreamMiniversionNotValidError(Win32Error):
-    DESCRIPTION = """The specified file miniversion was found but has been invalidated. The most likely cause is a transaction savepoint rollback."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_STREAM_MINIVERSION_NOT_VALID
 
 
 class ErrorMiniversionInaccessibleFromSpecifiedTransactionError(Win32Error):
-    DESCRIPTION = """A miniversion can only be opened in the context of the transaction that created it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MINIVERSION_INACCESSIBLE_FROM_SPECIFIED_TRANSACTION
 
 
 class ErrorCantOpenMiniversionWithModifyIntentError(Win32Error):
-    DESCRIPTION = """It is not possible to open a miniversion with modify access."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_OPEN_MINIVERSION_WITH_MODIFY_INTENT
 
 
 class ErrorCantCreateMoreStreamMiniversionsError(Win32Error):
-    DESCRIPTION = """It is not possible to create any more miniversions for this stream."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_CREATE_MORE_STREAM_MINIVERSIONS
 
 
 class ErrorRemoteFileVersionMismatchError(Win32Error):
-    DESCRIPTION = """The remote server sent mismatching version numbers or FID for a file opened with transactions."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_REMOTE_FILE_VERSION_MISMATCH
 
 
 class ErrorHandleNoLongerValidError(Win32Error):
-    DESCRIPTION = """The handle has been invalidated by a transaction. The most likely cause is the presence of memory mapping on a file, or an open handle when the transaction ended or rolled back to savepoint."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_HANDLE_NO_LONGER_VALID
 
 
 class ErrorNoTxfMetadataError(Win32Error):
-    DESCRIPTION = """There is no transaction metadata on the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_TXF_METADATA
 
 
 class ErrorLogCorruptionDetectedError(Win32Error):
-    DESCRIPTION = """The log data is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_CORRUPTION_DETECTED
 
 
 class ErrorCantRecoverWithHandleOpenError(Win32Error):
-    DESCRIPTION = """The file cannot be recovered because a handle is still open on it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_RECOVER_WITH_HANDLE_OPEN
 
 
 class ErrorRmDisconnectedError(Win32Error):
-    DESCRIPTION = """The transaction outcome is unavailable because the resource manager responsible for it is disconnected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RM_DISCONNECTED
 
 
 class ErrorEnlistmentNotSuperiorError(Win32Error):
-    DESCRIPTION = """The request was rejected because the enlistment in question is not a superior enlistment."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ENLISTMENT_NOT_SUPERIOR
 
 
 class ErrorRecoveryNotNeededError(Win32Error):
-    DESCRIPTION = """The transactional resource manager is already consistent. Recovery is not needed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RECOVERY_NOT_NEEDED
 
 
 class ErrorRmAlreadyStartedError(Win32Error):
-    DESCRIPTION = """The transactional resource manager has already been started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RM_ALREADY_STARTED
 
 
 class ErrorFileIdentityNotPersistentError(Win32Error):
-    DESCRIPTION = """The file cannot be opened in a transaction because its identity depends on the outcome of an unresolved transaction."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FILE_IDENTITY_NOT_PERSISTENT
 
 
 class ErrorCantBreakTransactionalDependencyError(Win32Error):
-    DESCRIPTION = """The operation cannot be performed because another transaction is depending on the fact that this property will not change."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_BREAK_TRANSACTIONAL_DEPENDENCY
 
 
 class ErrorCantCrossRmBoundaryError(Win32Error):
-    DESCRIPTION = """The operation would involve a single file with two transactional resource managers and is therefore not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANT_CROSS_RM_BOUNDARY
 
 
 class ErrorTxfDirNotEmptyError(Win32Error):
-    DESCRIPTION = """The $Txf directory must be empty for this operation to succeed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TXF_DIR_NOT_EMPTY
 
 
 class ErrorIndoubtTransactionsExistError(Win32Error):
-    DESCRIPTION = """The operation would leave a transactional resource manager in an inconsistent state and is, therefore, not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_INDOUBT_TRANSACTIONS_EXIST
 
 
 class ErrorTmVolatileError(Win32Error):
-    DESCRIPTION = """The operation could not be completed because the transaction manager does not have a log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TM_VOLATILE
 
 
 class ErrorRollbackTimerExpiredError(Win32Error):
-    DESCRIPTION = """A rollback could not be scheduled because a previously scheduled rollback has already been executed or is queued for execution."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ROLLBACK_TIMER_EXPIRED
 
 
 class ErrorTxfAttributeCorruptError(Win32Error):
-    DESCRIPTION = """The transactional metadata attribute on the file or directory is corrupt and unreadable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TXF_ATTRIBUTE_CORRUPT
 
 
 class ErrorEfsNotAllowedInTransactionError(Win32Error):
-    DESCRIPTION = """The encryption operation could not be completed because a transaction is active."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EFS_NOT_ALLOWED_IN_TRANSACTION
 
 
 class ErrorTransactionalOpenNotAllowedError(Win32Error):
-    DESCRIPTION = """This object is not allowed to be opened in a transaction."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTIONAL_OPEN_NOT_ALLOWED
 
 
 class ErrorLogGrowthFailedError(Win32Error):
-    DESCRIPTION = """An attempt to create space in the transactional resource manager's log failed. The failure status has been recorded in the event log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_LOG_GROWTH_FAILED
 
 
 class ErrorTransactedMappingUnsupportedRemoteError(Win32Error):
-    DESCRIPTION = """Memory mapping (creating a mapped section) to a remote file under a transaction is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTED_MAPPING_UNSUPPORTED_REMOTE
 
 
 class ErrorTxfMetadataAlreadyPresentError(Win32Error):
-    DESCRIPTION = """Transaction metadata is already present on this file and cannot be superseded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TXF_METADATA_ALREADY_PRESENT
 
 
 class ErrorTransactionScopeCallbacksNotSetError(Win32Error):
-    DESCRIPTION = """A transaction scope could not be entered because the scope handler has not been initialized."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_SCOPE_CALLBACKS_NOT_SET
 
 
 class ErrorTransactionRequiredPromotionError(Win32Error):
-    DESCRIPTION = """Promotion was required to allow the resource manager to enlist, but the transaction was set to disallow it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_REQUIRED_PROMOTION
 
 
 class ErrorCannotExecuteFileInTransactionError(Win32Error):
-    DESCRIPTION = """This file is open for modification in an unresolved transaction and can be opened for execution only by a transacted reader."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_EXECUTE_FILE_IN_TRANSACTION
 
 
 class ErrorTransactionsNotFrozenError(Win32Error):
-    DESCRIPTION = """The request to thaw frozen transactions was ignored because transactions were not previously frozen."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTIONS_NOT_FROZEN
 
 
 class ErrorTransactionFreezeInProgressError(Win32Error):
-    DESCRIPTION = """Transactions cannot be frozen because a freeze is already in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TRANSACTION_FREEZE_IN_PROGRESS
 
 
 class ErrorNotSnapshotVolumeError(Win32Error):
-    DESCRIPTION = """The target volume is not a snapshot volume. This operation is only valid on a volume mounted as a snapshot."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SNAPSHOT_VOLUME
 
 
 class ErrorNoSavepointWithOpenFilesError(Win32Error):
-    DESCRIPTION = """The savepoint operation failed because files are open on the transaction. This is not permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SAVEPOINT_WITH_OPEN_FILES
 
 
 class ErrorDataLostRepairError(Win32Error):
-    DESCRIPTION = """Windows has discovered corruption in a file, and that file has since been repaired. Data loss might have occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DATA_LOST_REPAIR
 
 
 class ErrorSparseNotAllowedInTransactionError(Win32Error):
-    DESCRIPTION = """The sparse operation could not be completed because a transaction is active on the file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SPARSE_NOT_ALLOWED_IN_TRANSACTION
 
 
 class ErrorTmIdentityMismatchError(Win32Error):
-    DESCRIPTION = """The call to create a transaction manager object failed because the Tm Identity stored in the logfile does not match the Tm Identity that was passed in as an argument."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TM_IDENTITY_MISMATCH
 
 
 class ErrorFloatedSectionError(Win32Error):
-    DESCRIPTION = """I/O was attempted on a section object that has been floated as a result of a transaction ending. There is no valid data."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_FLOATED_SECTION
 
 
 class ErrorCannotAcceptTransactedWorkError(Win32Error):
-    DESCRIPTION = """The transactional resource manager cannot currently accept transacted work due to a transient condition, such as low resources."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_ACCEPT_TRANSACTED_WORK
 
 
 class ErrorCannotAbortTransactionsError(Win32Error):
-    DESCRIPTION = """The transactional resource manager had too many transactions outstanding that could not be aborted. The transactional resource manager has been shut down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CANNOT_ABORT_TRANSACTIONS
 
 
 class ErrorCtxWinstationNameInvalidError(Win32Error):
-    DESCRIPTION = """The specified session name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_WINSTATION_NAME_INVALID
 
 
 class ErrorCtxInvalidPdError(Win32Error):
-    DESCRIPTION = """The specified protocol driver is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_INVALID_PD
 
 
 class ErrorCtxPdNotFoundError(Win32Error):
-    DESCRIPTION = """The specified protocol driver was not found in the system path."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_PD_NOT_FOUND
 
 
 class ErrorCtxWdNotFoundError(Win32Error):
-    DESCRIPTION = """The specified terminal connection driver was not found in the system path."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_WD_NOT_FOUND
 
 
 class ErrorCtxCannotMakeEventlogEntryError(Win32Error):
-    DESCRIPTION = """A registry key for event logging could not be created for this session."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CANNOT_MAKE_EVENTLOG_ENTRY
 
 
 class ErrorCtxServiceNameCollisionError(Win32Error):
-    DESCRIPTION = """A service with the same name already exists on the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SERVICE_NAME_COLLISION
 
 
 class ErrorCtxClosePendingError(Win32Error):
-    DESCRIPTION = """A close operation is pending on the session."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CLOSE_PENDING
 
 
 class ErrorCtxNoOutbufError(Win32Error):
-    DESCRIPTION = """There are no free output buffers available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_NO_OUTBUF
 
 
 class ErrorCtxModemInfNotFoundError(Win32Error):
-    DESCRIPTION = """The MODEM.INF file was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_MODEM_INF_NOT_FOUND
 
 
 class ErrorCtxInvalidModemnameError(Win32Error):
-    DESCRIPTION = """The modem name was not found in the MODEM.INF file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_INVALID_MODEMNAME
 
 
 class ErrorCtxModemResponseErrorError(Win32Error):
-    DESCRIPTION = """The modem did not accept the command sent to it. Verify that the configured modem name matches the attached modem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_MODEM_RESPONSE_ERROR
 
 
 class ErrorCtxModemResponseTimeoutError(Win32Error):
-    DESCRIPTION = """The modem did not respond to the command sent to it. Verify that the modem is properly cabled and turned on."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_MODEM_RESPONSE_TIMEOUT
 
 
 class ErrorCtxModemResponseNoCarrierError(Win32Error):
-    DESCRIPTION = """Carrier detect has failed or carrier has been dropped due to disconnect."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_MODEM_RESPONSE_NO_CARRIER
 
 
 class ErrorCtxModemResponseNoDialtoneError(Win32Error):
-    DESCRIPTION = """Dial tone not detected within the required time. Verify that the phone cable is properly attached and functional."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_MODEM_RESPONSE_NO_DIALTONE
 
 
 class ErrorCtxModemResponseBusyError(Win32Error):
-    DESCRIPTION = """Busy signal detected at remote site on callback."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_MODEM_RESPONSE_BUSY
 
 
 class ErrorCtxModemResponseVoiceError(Win32Error):
-    DESCRIPTION = """Voice detected at remote site on callback."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_MODEM_RESPONSE_VOICE
 
 
 class ErrorCtxTdErrorError(Win32Error):
-    DESCRIPTION = """Transport driver error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_TD_ERROR
 
 
 class ErrorCtxWinstationNotFoundError(Win32Error):
-    DESCRIPTION = """The specified session cannot be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_WINSTATION_NOT_FOUND
 
 
 class ErrorCtxWinstationAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The specified session name is already in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_WINSTATION_ALREADY_EXISTS
 
 
 class ErrorCtxWinstationBusyError(Win32Error):
-    DESCRIPTION = """The requested operation cannot be completed because the terminal connection is currently busy processing a connect, disconnect, reset, or delete operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_WINSTATION_BUSY
 
 
 class ErrorCtxBadVideoModeError(Win32Error):
-    DESCRIPTION = """An attempt has been made to connect to a session whose video mode is not supported by the current client."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_BAD_VIDEO_MODE
 
 
 class ErrorCtxGraphicsInvalidError(Win32Error):
-    DESCRIPTION = """The application attempted to enable DOS graphics mode. DOS graphics mode is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_GRAPHICS_INVALID
 
 
 class ErrorCtxLogonDisabledError(Win32Error):
-    DESCRIPTION = """Your interactive logon privilege has been disabled. Contact your administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_LOGON_DISABLED
 
 
 class ErrorCtxNotConsoleError(Win32Error):
-    DESCRIPTION = """The requested operation can be performed only on the system console. This is most often the result of a driver or system DLL requiring direct console access."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_NOT_CONSOLE
 
 
 class ErrorCtxClientQueryTimeoutError(Win32Error):
-    DESCRIPTION = """The client failed to respond to the server connect message."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CLIENT_QUERY_TIMEOUT
 
 
 class ErrorCtxConsoleDisconnectError(Win32Error):
-    DESCRIPTION = """Disconnecting the console session is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CONSOLE_DISCONNECT
 
 
 class ErrorCtxConsoleConnectError(Win32Error):
-    DESCRIPTION = """Reconnecting a disconnected session to the console is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CONSOLE_CONNECT
 
 
 class ErrorCtxShadowDeniedError(Win32Error):
-    DESCRIPTION = """The request to control another session remotely was denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SHADOW_DENIED
 
 
 class ErrorCtxWinstationAccessDeniedError(Win32Error):
-    DESCRIPTION = """The requested session access is denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_WINSTATION_ACCESS_DENIED
 
 
 class ErrorCtxInvalidWdError(Win32Error):
-    DESCRIPTION = """The specified terminal connection driver is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_INVALID_WD
 
 
 class ErrorCtxShadowInvalidError(Win32Error):
-    DESCRIPTION = """The requested session cannot be controlled remotely. This might be because the session is disconnected or does not currently have a user logged on."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SHADOW_INVALID
 
 
 class ErrorCtxShadowDisabledError(Win32Error):
-    DESCRIPTION = """The requested session is not configured to allow remote control."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SHADOW_DISABLED
 
 
 class ErrorCtxClientLicenseInUseError(Win32Error):
-    DESCRIPTION = """Your request to connect to this terminal server has been rejected. Your terminal server client license number is currently being used by another user. Call your system administrator to obtain a unique license number."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CLIENT_LICENSE_IN_USE
 
 
 class ErrorCtxClientLicenseNotSetError(Win32Error):
-    DESCRIPTION = """Your request to connect to this terminal server has been rejected. Your terminal server client license number has not been entered for this copy of the terminal server client. Contact your system administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CLIENT_LICENSE_NOT_SET
 
 
 class ErrorCtxLicenseNotAvailableError(Win32Error):
-    DESCRIPTION = """The number of connections to this computer is limited and all connections are in use right now. Try connecting later or contact your system administrator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_LICENSE_NOT_AVAILABLE
 
 
 class ErrorCtxLicenseClientInvalidError(Win32Error):
-    DESCRIPTION = """The client you are using is not licensed to use this system. Your logon request is denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_LICENSE_CLIENT_INVALID
 
 
 class ErrorCtxLicenseExpiredError(Win32Error):
-    DESCRIPTION = """The system license has expired. Your logon request is denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_LICENSE_EXPIRED
 
 
 class ErrorCtxShadowNotRunningError(Win32Error):
-    DESCRIPTION = """Remote control could not be terminated because the specified session is not currently being remotely controlled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SHADOW_NOT_RUNNING
 
 
 class ErrorCtxShadowEndedByModeChangeError(Win32Error):
-    DESCRIPTION = """The remote control of the console was terminated because the display mode was changed. Changing the display mode in a remote control session is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SHADOW_ENDED_BY_MODE_CHANGE
 
 
 class ErrorActivationCountExceededError(Win32Error):
-    DESCRIPTION = """Activation has already been reset the maximum number of times for this installation. Your activation timer will not be cleared."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ACTIVATION_COUNT_EXCEEDED
 
 
 class ErrorCtxWinstationsDisabledError(Win32Error):
-    DESCRIPTION = """Remote logons are currently disabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_WINSTATIONS_DISABLED
 
 
 class ErrorCtxEncryptionLevelRequiredError(Win32Error):
-    DESCRIPTION = """You do not have the proper encryption level to access this session."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_ENCRYPTION_LEVEL_REQUIRED
 
 
 class ErrorCtxSessionInUseError(Win32Error):
-    DESCRIPTION = """The user %s\\%s is currently logged on to this computer. Only the current user or an administrator can log on to this computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SESSION_IN_USE
 
 
 class ErrorCtxNoForceLogoffError(Win32Error):
-    DESCRIPTION = """The user %s\\%s is already logged on to the console of this computer. You do not have permission to log in at this time. To resolve this issue, contact %s\\%s and have them log off."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_NO_FORCE_LOGOFF
 
 
 class ErrorCtxAccountRestrictionError(Win32Error):
-    DESCRIPTION = """Unable to log you on because of an account restriction."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_ACCOUNT_RESTRICTION
 
 
 class ErrorRdpProtocolErrorError(Win32Error):
-    DESCRIPTION = """The RDP component %2 detected an error in the protocol stream and has disconnected the client."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RDP_PROTOCOL_ERROR
 
 
 class ErrorCtxCdmConnectError(Win32Error):
-    DESCRIPTION = """The Client Drive Mapping Service has connected on terminal connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CDM_CONNECT
 
 
 class ErrorCtxCdmDisconnectError(Win32Error):
-    DESCRIPTION = """The Client Drive Mapping Service has disconnected on terminal connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_CDM_DISCONNECT
 
 
 class ErrorCtxSecurityLayerErrorError(Win32Error):
-    DESCRIPTION = """The terminal server security layer detected an error in the protocol stream and has disconnected the client."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_CTX_SECURITY_LAYER_ERROR
 
 
 class ErrorTsIncompatibleSessionsError(Win32Error):
-    DESCRIPTION = """The target session is incompatible with the current session."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_TS_INCOMPATIBLE_SESSIONS
 
 
 class FrsErrInvalidApiSequenceError(Win32Error):
-    DESCRIPTION = """The file replication service API was called incorrectly."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_INVALID_API_SEQUENCE
 
 
 class FrsErrStartingServiceError(Win32Error):
-    DESCRIPTION = """The file replication service cannot be started."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_STARTING_SERVICE
 
 
 class FrsErrStoppingServiceError(Win32Error):
-    DESCRIPTION = """The file replication service cannot be stopped."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_STOPPING_SERVICE
 
 
 class FrsErrInternalApiError(Win32Error):
-    DESCRIPTION = """The file replication service API terminated the request. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_INTERNAL_API
 
 
 class FrsErrInternalError(Win32Error):
-    DESCRIPTION = """The file replication service terminated the request. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_INTERNAL
 
 
 class FrsErrServiceCommError(Win32Error):
-    DESCRIPTION = """The file replication service cannot be contacted. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_SERVICE_COMM
 
 
 class FrsErrInsufficientPrivError(Win32Error):
-    DESCRIPTION = """The file replication service cannot satisfy the request because the user has insufficient privileges. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_INSUFFICIENT_PRIV
 
 
 class FrsErrAuthenticationError(Win32Error):
-    DESCRIPTION = """The file replication service cannot satisfy the request because authenticated RPC is not available. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_AUTHENTICATION
 
 
 class FrsErrParentInsufficientPrivError(Win32Error):
-    DESCRIPTION = """The file replication service cannot satisfy the request because the user has insufficient privileges on the domain controller. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_PARENT_INSUFFICIENT_PRIV
 
 
 class FrsErrParentAuthenticationError(Win32Error):
-    DESCRIPTION = """The file replication service cannot satisfy the request because authenticated RPC is not available on the domain controller. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_PARENT_AUTHENTICATION
 
 
 class FrsErrChildToParentCommError(Win32Error):
-    DESCRIPTION = """The file replication service cannot communicate with the file replication service on the domain controller. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_CHILD_TO_PARENT_COMM
 
 
 class FrsErrParentToChildCommError(Win32Error):
-    DESCRIPTION = """The file replication service on the domain controller cannot communicate with the file replication service on this computer. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_PARENT_TO_CHILD_COMM
 
 
 class FrsErrSysvolPopulateError(Win32Error):
-    DESCRIPTION = """The file replication service cannot populate the system volume because of an internal error. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_SYSVOL_POPULATE
 
 
 class FrsErrSysvolPopulateTimeoutError(Win32Error):
-    DESCRIPTION = """The file replication service cannot populate the system volume because of an internal time-out. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_SYSVOL_POPULATE_TIMEOUT
 
 
 class FrsErrSysvolIsBusyError(Win32Error):
-    DESCRIPTION = """The file replication service cannot process the request. The system volume is busy with a previous request."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_SYSVOL_IS_BUSY
 
 
 class FrsErrSysvolDemoteError(Win32Error):
-    DESCRIPTION = """The file replication service cannot stop replicating the system volume because of an internal error. The event log might contain more information."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_SYSVOL_DEMOTE
 
 
 class FrsErrInvalidServiceParameterError(Win32Error):
-    DESCRIPTION = """The file replication service detected an invalid parameter."""
     WIN32_ERROR_CODE = Win32ErrorCode.FRS_ERR_INVALID_SERVICE_PARAMETER
 
 
 class ErrorDsNotInstalledError(Win32Error):
-    DESCRIPTION = """An error occurred while installing the directory service. For more information, see the event log."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOT_INSTALLED
 
 
 class ErrorDsMembershipEvaluatedLocallyError(Win32Error):
-    DESCRIPTION = """The directory service evaluated group memberships locally."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MEMBERSHIP_EVALUATED_LOCALLY
 
 
 class ErrorDsNoAttributeOrValueError(Win32Error):
-    DESCRIPTION = """The specified directory service attribute or value does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_ATTRIBUTE_OR_VALUE
 
 
 class ErrorDsInvalidAttributeSyntaxError(Win32Error):
-    DESCRIPTION = """The attribute syntax specified to the directory service is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_ATTRIBUTE_SYNTAX
 
 
 class ErrorDsAttributeTypeUndefinedError(Win32Error):
-    DESCRIPTION = """The attribute type specified to the directory service is not defined."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATTRIBUTE_TYPE_UNDEFINED
 
 
 class ErrorDsAttributeOrValueExistsError(Win32Error):
-    DESCRIPTION = """The specified directory service attribute or value already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATTRIBUTE_OR_VALUE_EXISTS
 
 
 class ErrorDsBusyError(Win32Error):
-    DESCRIPTION = """The directory service is busy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BUSY
 
 
 class ErrorDsUnavailableError(Win32Error):
-    DESCRIPTION = """The directory service is unavailable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNAVAILABLE
 
 
 class ErrorDsNoRidsAllocatedError(Win32Error):
-    DESCRIPTION = """The directory service was unable to allocate a relative identifier."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_RIDS_ALLOCATED
 
 
 class ErrorDsNoMoreRidsError(Win32Error):
-    DESCRIPTION = """The directory service has exhausted the pool of relative identifiers."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_MORE_RIDS
 
 
 class ErrorDsIncorrectRoleOwnerError(Win32Error):
-    DESCRIPTION = """The requested operation could not be performed because the directory service is not the master for that type of operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INCORRECT_ROLE_OWNER
 
 
 class ErrorDsRidmgrInitErrorError(Win32Error):
-    DESCRIPTION = """The directory service was unable to initialize the subsystem that allocates relative identifiers."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_RIDMGR_INIT_ERROR
 
 
 class ErrorDsObjClassViolationError(Win32Error):
-    DESCRIPTION = """The requested operation did not satisfy one or more constraints associated with the class of the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJ_CLASS_VIOLATION
 
 
 class ErrorDsCantOnNonLeafError(Win32Error):
-    DESCRIPTION = """The directory service can perform the requested operation only on a leaf object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_ON_NON_LEAF
 
 
 class ErrorDsCantOnRdnError(Win32Error):
-    DESCRIPTION = """The directory service cannot perform the requested operation on the relative distinguished name (RDN) attribute of an object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_ON_RDN
 
 
 class ErrorDsCantModObjClassError(Win32Error):
-    DESCRIPTION = """The directory service detected an attempt to modify the object class of an object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOD_OBJ_CLASS
 
 
 class ErrorDsCrossDomMoveErrorError(Win32Error):
-    DESCRIPTION = """The requested cross-domain move operation could not be performed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CROSS_DOM_MOVE_ERROR
 
 
 class ErrorDsGcNotAvailableError(Win32Error):
-    DESCRIPTION = """Unable to contact the global catalog (GC) server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GC_NOT_AVAILABLE
 
 
 class ErrorSharedPolicyError(Win32Error):
-    DESCRIPTION = """The policy object is shared and can only be modified at the root."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SHARED_POLICY
 
 
 class ErrorPolicyObjectNotFoundError(Win32Error):
-    DESCRIPTION = """The policy object does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_POLICY_OBJECT_NOT_FOUND
 
 
 class ErrorPolicyOnlyInDsError(Win32Error):
-    DESCRIPTION = """The requested policy information is only in the directory service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_POLICY_ONLY_IN_DS
 
 
 class ErrorPromotionActiveError(Win32Error):
-    DESCRIPTION = """A domain controller promotion is currently active."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_PROMOTION_ACTIVE
 
 
 class ErrorNoPromotionActiveError(Win32Error):
-    DESCRIPTION = """A domain controller promotion is not currently active."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_PROMOTION_ACTIVE
 
 
 class ErrorDsOperationsErrorError(Win32Error):
-    DESCRIPTION = """An operations error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OPERATIONS_ERROR
 
 
 class ErrorDsProtocolErrorError(Win32Error):
-    DESCRIPTION = """A protocol error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_PROTOCOL_ERROR
 
 
 class ErrorDsTimelimitExceededError(Win32Error):
-    DESCRIPTION = """The time limit for this request was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_TIMELIMIT_EXCEEDED
 
 
 class ErrorDsSizelimitExceededError(Win32Error):
-    DESCRIPTION = """The size limit for this request was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SIZELIMIT_EXCEEDED
 
 
 class ErrorDsAdminLimitExceededError(Win32Error):
-    DESCRIPTION = """The administrative limit for this request was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ADMIN_LIMIT_EXCEEDED
 
 
 class ErrorDsCompareFalseError(Win32Error):
-    DESCRIPTION = """The compare response was false."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_COMPARE_FALSE
 
 
 class ErrorDsCompareTrueError(Win32Error):
-    DESCRIPTION = """The compare response was true."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_COMPARE_TRUE
 
 
 class ErrorDsAuthMethodNotSupportedError(Win32Error):
-    DESCRIPTION = """The requested authentication method is not supported by the server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_AUTH_METHOD_NOT_SUPPORTED
 
 
 class ErrorDsStrongAuthRequiredError(Win32Error):
-    DESCRIPTION = """A more secure authentication method is required for this server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_STRONG_AUTH_REQUIRED
 
 
 class ErrorDsInappropriateAuthError(Win32Error):
-    DESCRIPTION = """Inappropriate authentication."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INAPPROPRIATE_AUTH
 
 
 class ErrorDsAuthUnknownError(Win32Error):
-    DESCRIPTION = """The authentication mechanism is unknown."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_AUTH_UNKNOWN
 
 
 class ErrorDsReferralError(Win32Error):
-    DESCRIPTION = """A referral was returned from the server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_REFERRAL
 
 
 class ErrorDsUnavailableCritExtensionError(Win32Error):
-    DESCRIPTION = """The server does not support the requested critical extension."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNAVAILABLE_CRIT_EXTENSION
 
 
 class ErrorDsConfidentialityRequiredError(Win32Error):
-    DESCRIPTION = """This request requires a secure connection."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CONFIDENTIALITY_REQUIRED
 
 
 class ErrorDsInappropriateMatchingError(Win32Error):
-    DESCRIPTION = """Inappropriate matching."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INAPPROPRIATE_MATCHING
 
 
 class ErrorDsConstraintViolationError(Win32Error):
-    DESCRIPTION = """A constraint violation occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CONSTRAINT_VIOLATION
 
 
 class ErrorDsNoSuchObjectError(Win32Error):
-    DESCRIPTION = """There is no such object on the server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_SUCH_OBJECT
 
 
 class ErrorDsAliasProblemError(Win32Error):
-    DESCRIPTION = """There is an alias problem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ALIAS_PROBLEM
 
 
 class ErrorDsInvalidDnSyntaxError(Win32Error):
-    DESCRIPTION = """An invalid dn syntax has been specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_DN_SYNTAX
 
 
 class ErrorDsIsLeafError(Win32Error):
-    DESCRIPTION = """The object is a leaf object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_IS_LEAF
 
 
 class ErrorDsAliasDerefProblemError(Win32Error):
-    DESCRIPTION = """There is an alias dereferencing problem."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ALIAS_DEREF_PROBLEM
 
 
 class ErrorDsUnwillingToPerformError(Win32Error):
-    DESCRIPTION = """The server is unwilling to process the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNWILLING_TO_PERFORM
 
 
 class ErrorDsLoopDetectError(Win32Error):
-    DESCRIPTION = """A loop has been detected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_LOOP_DETECT
 
 
 class ErrorDsNamingViolationError(Win32Error):
-    DESCRIPTION = """There is a naming violation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAMING_VIOLATION
 
 
 class ErrorDsObjectResultsTooLargeError(Win32Error):
-    DESCRIPTION = """The result set is too large."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJECT_RESULTS_TOO_LARGE
 
 
 class ErrorDsAffectsMultipleDsasError(Win32Error):
-    DESCRIPTION = """The operation affects multiple DSAs."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_AFFECTS_MULTIPLE_DSAS
 
 
 class ErrorDsServerDownError(Win32Error):
-    DESCRIPTION = """The server is not operational."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SERVER_DOWN
 
 
 class ErrorDsLocalErrorError(Win32Error):
-    DESCRIPTION = """A local error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_LOCAL_ERROR
 
 
 class ErrorDsEncodingErrorError(Win32Error):
-    DESCRIPTION = """An encoding error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ENCODING_ERROR
 
 
 class ErrorDsDecodingErrorError(Win32Error):
-    DESCRIPTION = """A decoding error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DECODING_ERROR
 
 
 class ErrorDsFilterUnknownError(Win32Error):
-    DESCRIPTION = """The search filter cannot be recognized."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_FILTER_UNKNOWN
 
 
 class ErrorDsParamErrorError(Win32Error):
-    DESCRIPTION = """One or more parameters are illegal."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_PARAM_ERROR
 
 
 class ErrorDsNotSupportedError(Win32Error):
-    DESCRIPTION = """The specified method is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOT_SUPPORTED
 
 
 class ErrorDsNoResultsReturnedError(Win32Error):
-    DESCRIPTION = """No results were returned."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_RESULTS_RETURNED
 
 
 class ErrorDsControlNotFoundError(Win32Error):
-    DESCRIPTION = """The specified control is not supported by the server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CONTROL_NOT_FOUND
 
 
 class ErrorDsClientLoopError(Win32Error):
-    DESCRIPTION = """A referral loop was detected by the client."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CLIENT_LOOP
 
 
 class ErrorDsReferralLimitExceededError(Win32Error):
-    DESCRIPTION = """The preset referral limit was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_REFERRAL_LIMIT_EXCEEDED
 
 
 class ErrorDsSortControlMissingError(Win32Error):
-    DESCRIPTION = """The search requires a SORT control."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SORT_CONTROL_MISSING
 
 
 class ErrorDsOffsetRangeErrorError(Win32Error):
-    DESCRIPTION = """The search results exceed the offset range specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OFFSET_RANGE_ERROR
 
 
 class ErrorDsRootMustBeNcError(Win32Error):
-    DESCRIPTION = """The root object must be the head of a naming context. The root object cannot have an instantiated parent."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ROOT_MUST_BE_NC
 
 
 class ErrorDsAddReplicaInhibitedError(Win32Error):
-    DESCRIPTION = """The add replica operation cannot be performed. The naming context must be writable to create the replica."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ADD_REPLICA_INHIBITED
 
 
 class ErrorDsAttNotDefInSchemaError(Win32Error):
-    DESCRIPTION = """A reference to an attribute that is not defined in the schema occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATT_NOT_DEF_IN_SCHEMA
 
 
 class ErrorDsMaxObjSizeExceededError(Win32Error):
-    DESCRIPTION = """The maximum size of an object has been exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MAX_OBJ_SIZE_EXCEEDED
 
 
 class ErrorDsObjStringNameExistsError(Win32Error):
-    DESCRIPTION = """An attempt was made to add an object to the directory with a name that is already in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJ_STRING_NAME_EXISTS
 
 
 class ErrorDsNoRdnDefinedInSchemaError(Win32Error):
-    DESCRIPTION = """An attempt was made to add an object of a class that does not have an RDN defined in the schema."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_RDN_DEFINED_IN_SCHEMA
 
 
 class ErrorDsRdnDoesntMatchSchemaError(Win32Error):
-    DESCRIPTION = """An attempt was made to add an object using an RDN that is not the RDN defined in the schema."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_RDN_DOESNT_MATCH_SCHEMA
 
 
 class ErrorDsNoRequestedAttsFoundError(Win32Error):
-    DESCRIPTION = """None of the requested attributes were found on the objects."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_REQUESTED_ATTS_FOUND
 
 
 class ErrorDsUserBufferToSmallError(Win32Error):
-    DESCRIPTION = """The user buffer is too small."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_USER_BUFFER_TO_SMALL
 
 
 class ErrorDsAttIsNotOnObjError(Win32Error):
-    DESCRIPTION = """The attribute specified in the operation is not present on the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATT_IS_NOT_ON_OBJ
 
 
 class ErrorDsIllegalModOperationError(Win32Error):
-    DESCRIPTION = """Illegal modify operation. Some aspect of the modification is not permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ILLEGAL_MOD_OPERATION
 
 
 class ErrorDsObjTooLargeError(Win32Error):
-    DESCRIPTION = """The specified object is too large."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJ_TOO_LARGE
 
 
 class ErrorDsBadInstanceTypeError(Win32Error):
-    DESCRIPTION = """The specified instance type is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BAD_INSTANCE_TYPE
 
 
 class ErrorDsMasterdsaRequiredError(Win32Error):
-    DESCRIPTION = """The operation must be performed at a master DSA."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MASTERDSA_REQUIRED
 
 
 class ErrorDsObjectClassRequiredError(Win32Error):
-    DESCRIPTION = """The object class attribute must be specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJECT_CLASS_REQUIRED
 
 
 class ErrorDsMissingRequiredAttError(Win32Error):
-    DESCRIPTION = """A required attribute is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MISSING_REQUIRED_ATT
 
 
 class ErrorDsAttNotDefForClassError(Win32Error):
-    DESCRIPTION = """An attempt was made to modify an object to include an attribute that is not legal for its class."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATT_NOT_DEF_FOR_CLASS
 
 
 class ErrorDsAttAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The specified attribute is already present on the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATT_ALREADY_EXISTS
 
 
 class ErrorDsCantAddAttValuesError(Win32Error):
-    DESCRIPTION = """The specified attribute is not present, or has no values."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_ADD_ATT_VALUES
 
 
 class ErrorDsSingleValueConstraintError(Win32Error):
-    DESCRIPTION = """Multiple values were specified for an attribute that can have only one value."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SINGLE_VALUE_CONSTRAINT
 
 
 class ErrorDsRangeConstraintError(Win32Error):
-    DESCRIPTION = """A value for the attribute was not in the acceptable range of values."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_RANGE_CONSTRAINT
 
 
 class ErrorDsAttValAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The specified value already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATT_VAL_ALREADY_EXISTS
 
 
 class ErrorDsCantRemMissingAttError(Win32Error):
-    DESCRIPTION = """The attribute cannot be removed because it is not present on the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_REM_MISSING_ATT
 
 
 class ErrorDsCantRemMissingAttValError(Win32Error):
-    DESCRIPTION = """The attribute value cannot be removed because it is not present on the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_REM_MISSING_ATT_VAL
 
 
 class ErrorDsRootCantBeSubrefError(Win32Error):
-    DESCRIPTION = """The specified root object cannot be a subreference."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ROOT_CANT_BE_SUBREF
 
 
 class ErrorDsNoChainingError(Win32Error):
-    DESCRIPTION = """Chaining is not permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_CHAINING
 
 
 class ErrorDsNoChainedEvalError(Win32Error):
-    DESCRIPTION = """Chained evaluation is not permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_CHAINED_EVAL
 
 
 class ErrorDsNoParentObjectError(Win32Error):
-    DESCRIPTION = """The operation could not be performed because the object's parent is either uninstantiated or deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_PARENT_OBJECT
 
 
 class ErrorDsParentIsAnAliasError(Win32Error):
-    DESCRIPTION = """Having a parent that is an alias is not permitted. Aliases are leaf objects."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_PARENT_IS_AN_ALIAS
 
 
 class ErrorDsCantMixMasterAndRepsError(Win32Error):
-    DESCRIPTION = """The object and parent must be of the same type, either both masters or both replicas."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MIX_MASTER_AND_REPS
 
 
 class ErrorDsChildrenExistError(Win32Error):
-    DESCRIPTION = """The operation cannot be performed because child objects exist. This operation can only be performed on a leaf object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CHILDREN_EXIST
 
 
 class ErrorDsObjNotFoundError(Win32Error):
-    DESCRIPTION = """Directory object not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJ_NOT_FOUND
 
 
 class ErrorDsAliasedObjMissingError(Win32Error):
-    DESCRIPTION = """The aliased object is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ALIASED_OBJ_MISSING
 
 
 class ErrorDsBadNameSyntaxError(Win32Error):
-    DESCRIPTION = """The object name has bad syntax."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BAD_NAME_SYNTAX
 
 
 class ErrorDsAliasPointsToAliasError(Win32Error):
-    DESCRIPTION = """An alias is not permitted to refer to another alias."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ALIAS_POINTS_TO_ALIAS
 
 
 class ErrorDsCantDerefAliasError(Win32Error):
-    DESCRIPTION = """The alias cannot be dereferenced."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_DEREF_ALIAS
 
 
 class ErrorDsOutOfScopeError(Win32Error):
-    DESCRIPTION = """The operation is out of scope."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OUT_OF_SCOPE
 
 
 class ErrorDsObjectBeingRemovedError(Win32Error):
-    DESCRIPTION = """The operation cannot continue because the object is in the process of being removed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJECT_BEING_REMOVED
 
 
 class ErrorDsCantDeleteDsaObjError(Win32Error):
-    DESCRIPTION = """The DSA object cannot be deleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_DELETE_DSA_OBJ
 
 
 class ErrorDsGenericErrorError(Win32Error):
-    DESCRIPTION = """A directory service error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GENERIC_ERROR
 
 
 class ErrorDsDsaMustBeIntMasterError(Win32Error):
-    DESCRIPTION = """The operation can only be performed on an internal master DSA object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DSA_MUST_BE_INT_MASTER
 
 
 class ErrorDsClassNotDsaError(Win32Error):
-    DESCRIPTION = """The object must be of class DSA."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CLASS_NOT_DSA
 
 
 class ErrorDsInsuffAccessRightsError(Win32Error):
-    DESCRIPTION = """Insufficient access rights to perform the operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INSUFF_ACCESS_RIGHTS
 
 
 class ErrorDsIllegalSuperiorError(Win32Error):
-    DESCRIPTION = """The object cannot be added because the parent is not on the list of possible superiors."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ILLEGAL_SUPERIOR
 
 
 class ErrorDsAttributeOwnedBySamError(Win32Error):
-    DESCRIPTION = """Access to the attribute is not permitted because the attribute is owned by the SAM."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATTRIBUTE_OWNED_BY_SAM
 
 
 class ErrorDsNameTooManyPartsError(Win32Error):
-    DESCRIPTION = """The name has too many parts."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_TOO_MANY_PARTS
 
 
 class ErrorDsNameTooLongError(Win32Error):
-    DESCRIPTION = """The name is too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_TOO_LONG
 
 
 class ErrorDsNameValueTooLongError(Win32Error):
-    DESCRIPTION = """The name value is too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_VALUE_TOO_LONG
 
 
 class ErrorDsNameUnparseableError(Win32Error):
-    DESCRIPTION = """The directory service encountered an error parsing a name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_UNPARSEABLE
 
 
 class ErrorDsNameTypeUnknownError(Win32Error):
-    DESCRIPTION = """The directory service cannot get the attribute type for a name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_TYPE_UNKNOWN
 
 
 class ErrorDsNotAnObjectError(Win32Error):
-    DESCRIPTION = """The name does not identify an object; the name identifies a phantom."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOT_AN_OBJECT
 
 
 class ErrorDsSecDescTooShortError(Win32Error):
-    DESCRIPTION = """The security descriptor is too short."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SEC_DESC_TOO_SHORT
 
 
 class ErrorDsSecDescInvalidError(Win32Error):
-    DESCRIPTION = """The security descriptor is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SEC_DESC_INVALID
 
 
 class ErrorDsNoDeletedNameError(Win32Error):
-    DESCRIPTION = """Failed to create name for deleted object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_DELETED_NAME
 
 
 class ErrorDsSubrefMustHaveParentError(Win32Error):
-    DESCRIPTION = """The parent of a new subreference must exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SUBREF_MUST_HAVE_PARENT
 
 
 class ErrorDsNcnameMustBeNcError(Win32Error):
-    DESCRIPTION = """The object must be a naming context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NCNAME_MUST_BE_NC
 
 
 class ErrorDsCantAddSystemOnlyError(Win32Error):
-    DESCRIPTION = """It is not permitted to add an attribute that is owned by the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_ADD_SYSTEM_ONLY
 
 
 class ErrorDsClassMustBeConcreteError(Win32Error):
-    DESCRIPTION = """The class of the object must be structural; you cannot instantiate an abstract class."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CLASS_MUST_BE_CONCRETE
 
 
 class ErrorDsInvalidDmdError(Win32Error):
-    DESCRIPTION = """The schema object could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_DMD
 
 
 class ErrorDsObjGuidExistsError(Win32Error):
-    DESCRIPTION = """A local object with this GUID (dead or alive) already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJ_GUID_EXISTS
 
 
 class ErrorDsNotOnBacklinkError(Win32Error):
-    DESCRIPTION = """The operation cannot be performed on a back link."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOT_ON_BACKLINK
 
 
 class ErrorDsNoCrossrefForNcError(Win32Error):
-    DESCRIPTION = """The cross-reference for the specified naming context could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_CROSSREF_FOR_NC
 
 
 class ErrorDsShuttingDownError(Win32Error):
-    DESCRIPTION = """The operation could not be performed because the directory service is shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SHUTTING_DOWN
 
 
 class ErrorDsUnknownOperationError(Win32Error):
-    DESCRIPTION = """The directory service request is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNKNOWN_OPERATION
 
 
 class ErrorDsInvalidRoleOwnerError(Win32Error):
-    DESCRIPTION = """The role owner attribute could not be read."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_ROLE_OWNER
 
 
 class ErrorDsCouldntContactFsmoError(Win32Error):
-    DESCRIPTION = """The requested Flexible Single Master Operations (FSMO) operation failed. The current FSMO holder could not be contacted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_COULDNT_CONTACT_FSMO
 
 
 class ErrorDsCrossNcDnRenameError(Win32Error):
-    DESCRIPTION = """Modification of a distinguished name across a naming context is not permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CROSS_NC_DN_RENAME
 
 
 class ErrorDsCantModSystemOnlyError(Win32Error):
-    DESCRIPTION = """The attribute cannot be modified because it is owned by the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOD_SYSTEM_ONLY
 
 
 class ErrorDsReplicatorOnlyError(Win32Error):
-    DESCRIPTION = """Only the replicator can perform this function."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_REPLICATOR_ONLY
 
 
 class ErrorDsObjClassNotDefinedError(Win32Error):
-    DESCRIPTION = """The specified class is not defined."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJ_CLASS_NOT_DEFINED
 
 
 class ErrorDsObjClassNotSubclassError(Win32Error):
-    DESCRIPTION = """The specified class is not a subclass."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OBJ_CLASS_NOT_SUBCLASS
 
 
 class ErrorDsNameReferenceInvalidError(Win32Error):
-    DESCRIPTION = """The name reference is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_REFERENCE_INVALID
 
 
 class ErrorDsCrossRefExistsError(Win32Error):
-    DESCRIPTION = """A cross-reference already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CROSS_REF_EXISTS
 
 
 class ErrorDsCantDelMasterCrossrefError(Win32Error):
-    DESCRIPTION = """It is not permitted to delete a master cross-reference."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_DEL_MASTER_CROSSREF
 
 
 class ErrorDsSubtreeNotifyNotNcHeadError(Win32Error):
-    DESCRIPTION = """Subtree notifications are only supported on naming context (NC) heads."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SUBTREE_NOTIFY_NOT_NC_HEAD
 
 
 class ErrorDsNotifyFilterTooComplexError(Win32Error):
-    DESCRIPTION = """Notification filter is too complex."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOTIFY_FILTER_TOO_COMPLEX
 
 
 class ErrorDsDupRdnError(Win32Error):
-    DESCRIPTION = """Schema update failed: Duplicate RDN."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUP_RDN
 
 
 class ErrorDsDupOidError(Win32Error):
-    DESCRIPTION = """Schema update failed: Duplicate OID."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUP_OID
 
 
 class ErrorDsDupMapiIdError(Win32Error):
-    DESCRIPTION = """Schema update failed: Duplicate Message Application Programming Interface (MAPI) identifier."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUP_MAPI_ID
 
 
 class ErrorDsDupSchemaIdGuidError(Win32Error):
-    DESCRIPTION = """Schema update failed: Duplicate schema ID GUID."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUP_SCHEMA_ID_GUID
 
 
 class ErrorDsDupLdapDisplayNameError(Win32Error):
-    DESCRIPTION = """Schema update failed: Duplicate LDAP display name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUP_LDAP_DISPLAY_NAME
 
 
 class ErrorDsSemanticAttTestError(Win32Error):
-    DESCRIPTION = """Schema update failed: Range-Lower less than Range-Upper."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SEMANTIC_ATT_TEST
 
 
 class ErrorDsSyntaxMismatchError(Win32Error):
-    DESCRIPTION = """Schema update failed: Syntax mismatch."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SYNTAX_MISMATCH
 
 
 class ErrorDsExistsInMustHaveError(Win32Error):
-    DESCRIPTION = """Schema deletion failed: Attribute is used in the Must-Contain list."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EXISTS_IN_MUST_HAVE
 
 
 class ErrorDsExistsInMayHaveError(Win32Error):
-    DESCRIPTION = """Schema deletion failed: Attribute is used in the May-Contain list."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EXISTS_IN_MAY_HAVE
 
 
 class ErrorDsNonexistentMayHaveError(Win32Error):
-    DESCRIPTION = """Schema update failed: Attribute in May-Contain list does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NONEXISTENT_MAY_HAVE
 
 
 class ErrorDsNonexistentMustHaveError(Win32Error):
-    DESCRIPTION = """Schema update failed: Attribute in the Must-Contain list does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NONEXISTENT_MUST_HAVE
 
 
 class ErrorDsAuxClsTestFailError(Win32Error):
-    DESCRIPTION = """Schema update failed: Class in the Aux Class list does not exist or is not an auxiliary class."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_AUX_CLS_TEST_FAIL
 
 
 class ErrorDsNonexistentPossSupError(Win32Error):
-    DESCRIPTION = """Schema update failed: Class in the Poss-Superiors list does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NONEXISTENT_POSS_SUP
 
 
 class ErrorDsSubClsTestFailError(Win32Error):
-    DESCRIPTION = """Schema update failed: Class in the subclass of the list does not exist or does not satisfy hierarchy rules."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SUB_CLS_TEST_FAIL
 
 
 class ErrorDsBadRdnAttIdSyntaxError(Win32Error):
-    DESCRIPTION = """Schema update failed: Rdn-Att-Id has wrong syntax."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BAD_RDN_ATT_ID_SYNTAX
 
 
 class ErrorDsExistsInAuxClsError(Win32Error):
-    DESCRIPTION = """Schema deletion failed: Class is used as an auxiliary class."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EXISTS_IN_AUX_CLS
 
 
 class ErrorDsExistsInSubClsError(Win32Error):
-    DESCRIPTION = """Schema deletion failed: Class is used as a subclass."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EXISTS_IN_SUB_CLS
 
 
 class ErrorDsExistsInPossSupError(Win32Error):
-    DESCRIPTION = """Schema deletion failed: Class is used as a Poss-Superior."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EXISTS_IN_POSS_SUP
 
 
 class ErrorDsRecalcschemaFailedError(Win32Error):
-    DESCRIPTION = """Schema update failed in recalculating validation cache."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_RECALCSCHEMA_FAILED
 
 
 class ErrorDsTreeDeleteNotFinishedError(Win32Error):
-    DESCRIPTION = """The tree deletion is not finished. The request must be made again to continue deleting the tree."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_TREE_DELETE_NOT_FINISHED
 
 
 class ErrorDsCantDeleteError(Win32Error):
-    DESCRIPTION = """The requested delete operation could not be performed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_DELETE
 
 
 class ErrorDsAttSchemaReqIdError(Win32Error):
-    DESCRIPTION = """Cannot read the governs class identifier for the schema record."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATT_SCHEMA_REQ_ID
 
 
 class ErrorDsBadAttSchemaSyntaxError(Win32Error):
-    DESCRIPTION = """The attribute schema has bad syntax."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BAD_ATT_SCHEMA_SYNTAX
 
 
 class ErrorDsCantCacheAttError(Win32Error):
-    DESCRIPTION = """The attribute could not be cached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_CACHE_ATT
 
 
 class ErrorDsCantCacheClassError(Win32Error):
-    DESCRIPTION = """The class could not be cached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_CACHE_CLASS
 
 
 class ErrorDsCantRemoveAttCacheError(Win32Error):
-    DESCRIPTION = """The attribute could not be removed from the cache."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_REMOVE_ATT_CACHE
 
 
 class ErrorDsCantRemoveClassCacheError(Win32Error):
-    DESCRIPTION = """The class could not be removed from the cache."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_REMOVE_CLASS_CACHE
 
 
 class ErrorDsCantRetrieveDnError(Win32Error):
-    DESCRIPTION = """The distinguished name attribute could not be read."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_RETRIEVE_DN
 
 
 class ErrorDsMissingSuprefError(Win32Error):
-    DESCRIPTION = """No superior reference has been configured for the directory service. The directory service is, therefore, unable to issue referrals to objects outside this forest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MISSING_SUPREF
 
 
 class ErrorDsCantRetrieveInstanceError(Win32Error):
-    DESCRIPTION = """The instance type attribute could not be retrieved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_RETRIEVE_INSTANCE
 
 
 class ErrorDsCodeInconsistencyError(Win32Error):
-    DESCRIPTION = """An internal error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CODE_INCONSISTENCY
 
 
 class ErrorDsDatabaseErrorError(Win32Error):
-    DESCRIPTION = """A database error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DATABASE_ERROR
 
 
 class ErrorDsGovernsidMissingError(Win32Error):
-    DESCRIPTION = """The governsID attribute is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GOVERNSID_MISSING
 
 
 class ErrorDsMissingExpectedAttError(Win32Error):
-    DESCRIPTION = """An expected attribute is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MISSING_EXPECTED_ATT
 
 
 class ErrorDsNcnameMissingCrRefError(Win32Error):
-    DESCRIPTION = """The specified naming context is missing a cross-reference."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NCNAME_MISSING_CR_REF
 
 
 class ErrorDsSecurityCheckingErrorError(Win32Error):
-    DESCRIPTION = """A security checking error has occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SECURITY_CHECKING_ERROR
 
 
 class ErrorDsSchemaNotLoadedError(Win32Error):
-    DESCRIPTION = """The schema is not loaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SCHEMA_NOT_LOADED
 
 
 class ErrorDsSchemaAllocFailedError(Win32Error):
-    DESCRIPTION = """Schema allocation failed. Check if the machine is running low on memory."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SCHEMA_ALLOC_FAILED
 
 
 class ErrorDsAttSchemaReqSyntaxError(Win32Error):
-    DESCRIPTION = """Failed to obtain the required syntax for the attribute schema."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ATT_SCHEMA_REQ_SYNTAX
 
 
 class ErrorDsGcverifyErrorError(Win32Error):
-    DESCRIPTION = """The GC verification failed. The GC is not available or does not support the operation. Some part of the directory is currently not available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GCVERIFY_ERROR
 
 
 class ErrorDsDraSchemaMismatchError(Win32Error):
-    DESCRIPTION = """The replication operation failed because of a schema mismatch between the servers involved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SCHEMA_MISMATCH
 
 
 class ErrorDsCantFindDsaObjError(Win32Error):
-    DESCRIPTION = """The DSA object could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_FIND_DSA_OBJ
 
 
 class ErrorDsCantFindExpectedNcError(Win32Error):
-    DESCRIPTION = """The naming context could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_FIND_EXPECTED_NC
 
 
 class ErrorDsCantFindNcInCacheError(Win32Error):
-    DESCRIPTION = """The naming context could not be found in the cache."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_FIND_NC_IN_CACHE
 
 
 class ErrorDsCantRetrieveChildError(Win32Error):
-    DESCRIPTION = """The child object could not be retrieved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_RETRIEVE_CHILD
 
 
 class ErrorDsSecurityIllegalModifyError(Win32Error):
-    DESCRIPTION = """The modification was not permitted for security reasons."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SECURITY_ILLEGAL_MODIFY
 
 
 class ErrorDsCantReplaceHiddenRecError(Win32Error):
-    DESCRIPTION = """The operation cannot replace the hidden record."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_REPLACE_HIDDEN_REC
 
 
 class ErrorDsBadHierarchyFileError(Win32Error):
-    DESCRIPTION = """The hierarchy file is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BAD_HIERARCHY_FILE
 
 
 class ErrorDsBuildHierarchyTableFailedError(Win32Error):
-    DESCRIPTION = """The attempt to build the hierarchy table failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BUILD_HIERARCHY_TABLE_FAILED
 
 
 class ErrorDsConfigParamMissingError(Win32Error):
-    DESCRIPTION = """The directory configuration parameter is missing from the registry."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CONFIG_PARAM_MISSING
 
 
 class ErrorDsCountingAbIndicesFailedError(Win32Error):
-    DESCRIPTION = """The attempt to count the address book indices failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_COUNTING_AB_INDICES_FAILED
 
 
 class ErrorDsHierarchyTableMallocFailedError(Win32Error):
-    DESCRIPTION = """The allocation of the hierarchy table failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_HIERARCHY_TABLE_MALLOC_FAILED
 
 
 class ErrorDsInternalFailureError(Win32Error):
-    DESCRIPTION = """The directory service encountered an internal failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INTERNAL_FAILURE
 
 
 class ErrorDsUnknownErrorError(Win32Error):
-    DESCRIPTION = """The directory service encountered an unknown failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNKNOWN_ERROR
 
 
 class ErrorDsRootRequiresClassTopError(Win32Error):
-    DESCRIPTION = """A root object requires a class of \"top\"."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ROOT_REQUIRES_CLASS_TOP
 
 
 class ErrorDsRefusingFsmoRolesError(Win32Error):
-    DESCRIPTION = """This directory server is shutting down, and cannot take ownership of new floating single-master operation roles."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_REFUSING_FSMO_ROLES
 
 
 class ErrorDsMissingFsmoSettingsError(Win32Error):
-    DESCRIPTION = """The directory service is missing mandatory configuration information and is unable to determine the ownership of floating single-master operation roles."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MISSING_FSMO_SETTINGS
 
 
 class ErrorDsUnableToSurrenderRolesError(Win32Error):
-    DESCRIPTION = """The directory service was unable to transfer ownership of one or more floating single-master operation roles to other servers."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNABLE_TO_SURRENDER_ROLES
 
 
 class ErrorDsDraGenericError(Win32Error):
-    DESCRIPTION = """The replication operation failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_GENERIC
 
 
 class ErrorDsDraInvalidParameterError(Win32Error):
-    DESCRIPTION = """An invalid parameter was specified for this replication operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_INVALID_PARAMETER
 
 
 class ErrorDsDraBusyError(Win32Error):
-    DESCRIPTION = """The directory service is too busy to complete the replication operation at this time."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_BUSY
 
 
 class ErrorDsDraBadDnError(Win32Error):
-    DESCRIPTION = """The DN specified for this replication operation is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_BAD_DN
 
 
 class ErrorDsDraBadNcError(Win32Error):
-    DESCRIPTION = """The naming context specified for this replication operation is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_BAD_NC
 
 
 class ErrorDsDraDnExistsError(Win32Error):
-    DESCRIPTION = """The DN specified for this replication operation already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_DN_EXISTS
 
 
 class ErrorDsDraInternalErrorError(Win32Error):
-    DESCRIPTION = """The replication system encountered an internal error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_INTERNAL_ERROR
 
 
 class ErrorDsDraInconsistentDitError(Win32Error):
-    DESCRIPTION = """The replication operation encountered a database inconsistency."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_INCONSISTENT_DIT
 
 
 class ErrorDsDraConnectionFailedError(Win32Error):
-    DESCRIPTION = """The server specified for this replication operation could not be contacted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_CONNECTION_FAILED
 
 
 class ErrorDsDraBadInstanceTypeError(Win32Error):
-    DESCRIPTION = """The replication operation encountered an object with an invalid instance type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_BAD_INSTANCE_TYPE
 
 
 class ErrorDsDraOutOfMemError(Win32Error):
-    DESCRIPTION = """The replication operation failed to allocate memory."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_OUT_OF_MEM
 
 
 class ErrorDsDraMailProblemError(Win32Error):
-    DESCRIPTION = """The replication operation encountered an error with the mail system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_MAIL_PROBLEM
 
 
 class ErrorDsDraRefAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The replication reference information for the target server already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_REF_ALREADY_EXISTS
 
 
 class ErrorDsDraRefNotFoundError(Win32Error):
-    DESCRIPTION = """The replication reference information for the target server does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_REF_NOT_FOUND
 
 
 class ErrorDsDraObjIsRepSourceError(Win32Error):
-    DESCRIPTION = """The naming context cannot be removed because it is replicated to another server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_OBJ_IS_REP_SOURCE
 
 
 class ErrorDsDraDbErrorError(Win32Error):
-    DESCRIPTION = """The replication operation encountered a database error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_DB_ERROR
 
 
 class ErrorDsDraNoReplicaError(Win32Error):
-    DESCRIPTION = """The naming context is in the process of being removed or is not replicated from the specified server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_NO_REPLICA
 
 
 class ErrorDsDraAccessDeniedError(Win32Error):
-    DESCRIPTION = """Replication access was denied."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_ACCESS_DENIED
 
 
 class ErrorDsDraNotSupportedError(Win32Error):
-    DESCRIPTION = """The requested operation is not supported by this version of the directory service."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_NOT_SUPPORTED
 
 
 class ErrorDsDraRpcCancelledError(Win32Error):
-    DESCRIPTION = """The replication RPC was canceled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_RPC_CANCELLED
 
 
 class ErrorDsDraSourceDisabledError(Win32Error):
-    DESCRIPTION = """The source server is currently rejecting replication requests."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SOURCE_DISABLED
 
 
 class ErrorDsDraSinkDisabledError(Win32Error):
-    DESCRIPTION = """The destination server is currently rejecting replication requests."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SINK_DISABLED
 
 
 class ErrorDsDraNameCollisionError(Win32Error):
-    DESCRIPTION = """The replication operation failed due to a collision of object names."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_NAME_COLLISION
 
 
 class ErrorDsDraSourceReinstalledError(Win32Error):
-    DESCRIPTION = """The replication source has been reinstalled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SOURCE_REINSTALLED
 
 
 class ErrorDsDraMissingParentError(Win32Error):
-    DESCRIPTION = """The replication operation failed because a required parent object is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_MISSING_PARENT
 
 
 class ErrorDsDraPreemptedError(Win32Error):
-    DESCRIPTION = """The replication operation was preempted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_PREEMPTED
 
 
 class ErrorDsDraAbandonSyncError(Win32Error):
-    DESCRIPTION = """The replication synchronization attempt was abandoned because of a lack of updates."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_ABANDON_SYNC
 
 
 class ErrorDsDraShutdownError(Win32Error):
-    DESCRIPTION = """The replication operation was terminated because the system is shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SHUTDOWN
 
 
 class ErrorDsDraIncompatiblePartialSetError(Win32Error):
-    DESCRIPTION = """A synchronization attempt failed because the destination DC is currently waiting to synchronize new partial attributes from the source. This condition is normal if a recent schema change modified the partial attribute set. The destination partial attribute set is not a subset of the source partial attribute set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_INCOMPATIBLE_PARTIAL_SET
 
 
 class ErrorDsDraSourceIsPartialReplicaError(Win32Error):
-    DESCRIPTION = """The replication synchronization attempt failed because a master replica attempted to sync from a partial replica."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SOURCE_IS_PARTIAL_REPLICA
 
 
 class ErrorDsDraExtnConnectionFailedError(Win32Error):
-    DESCRIPTION = """The server specified for this replication operation was contacted, but that server was unable to contact an additional server needed to complete the operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_EXTN_CONNECTION_FAILED
 
 
 class ErrorDsInstallSchemaMismatchError(Win32Error):
-    DESCRIPTION = """The version of the directory service schema of the source forest is not compatible with the version of the directory service on this computer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INSTALL_SCHEMA_MISMATCH
 
 
 class ErrorDsDupLinkIdError(Win32Error):
-    DESCRIPTION = """Schema update failed: An attribute with the same link identifier already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUP_LINK_ID
 
 
 class ErrorDsNameErrorResolvingError(Win32Error):
-    DESCRIPTION = """Name translation: Generic processing error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_ERROR_RESOLVING
 
 
 class ErrorDsNameErrorNotFoundError(Win32Error):
-    DESCRIPTION = """Name translation: Could not find the name or insufficient right to see name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_ERROR_NOT_FOUND
 
 
 class ErrorDsNameErrorNotUniqueError(Win32Error):
-    DESCRIPTION = """Name translation: Input name mapped to more than one output name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_ERROR_NOT_UNIQUE
 
 
 class ErrorDsNameErrorNoMappingError(Win32Error):
-    DESCRIPTION = """Name translation: The input name was found but not the associated output format."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_ERROR_NO_MAPPING
 
 
 class ErrorDsNameErrorDomainOnlyError(Win32Error):
-    DESCRIPTION = """Name translation: Unable to resolve completely, only the domain was found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_ERROR_DOMAIN_ONLY
 
 
 class ErrorDsNameErrorNoSyntacticalMappingError(Win32Error):
-    DESCRIPTION = """Name translation: Unable to perform purely syntactical mapping at the client without going out to the wire."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_ERROR_NO_SYNTACTICAL_MAPPING
 
 
 class ErrorDsConstructedAttModError(Win32Error):
-    DESCRIPTION = """Modification of a constructed attribute is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CONSTRUCTED_ATT_MOD
 
 
 class ErrorDsWrongOmObjClassError(Win32Error):
-    DESCRIPTION = """The OM-Object-Class specified is incorrect for an attribute with the specified syntax."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_WRONG_OM_OBJ_CLASS
 
 
 class ErrorDsDraReplPendingError(Win32Error):
-    DESCRIPTION = """The replication request has been posted; waiting for a reply."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_REPL_PENDING
 
 
 class ErrorDsDsRequiredError(Win32Error):
-    DESCRIPTION = """The requested operation requires a directory service, and none was available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DS_REQUIRED
 
 
 class ErrorDsInvalidLdapDisplayNameError(Win32Error):
-    DESCRIPTION = """The LDAP display name of the class or attribute contains non-ASCII characters."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_LDAP_DISPLAY_NAME
 
 
 class ErrorDsNonBaseSearchError(Win32Error):
-    DESCRIPTION = """The requested search operation is only supported for base searches."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NON_BASE_SEARCH
 
 
 class ErrorDsCantRetrieveAttsError(Win32Error):
-    DESCRIPTION = """The search failed to retrieve attributes from the database."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_RETRIEVE_ATTS
 
 
 class ErrorDsBacklinkWithoutLinkError(Win32Error):
-    DESCRIPTION = """The schema update operation tried to add a backward link attribute that has no corresponding forward link."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_BACKLINK_WITHOUT_LINK
 
 
 class ErrorDsEpochMismatchError(Win32Error):
-    DESCRIPTION = """The source and destination of a cross-domain move do not agree on the object's epoch number. Either the source or the destination does not have the latest version of the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EPOCH_MISMATCH
 
 
 class ErrorDsSrcNameMismatchError(Win32Error):
-    DESCRIPTION = """The source and destination of a cross-domain move do not agree on the object's current name. Either the source or the destination does not have the latest version of the object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SRC_NAME_MISMATCH
 
 
 class ErrorDsSrcAndDstNcIdenticalError(Win32Error):
-    DESCRIPTION = """The source and destination for the cross-domain move operation are identical. The caller should use a local move operation instead of a cross-domain move operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SRC_AND_DST_NC_IDENTICAL
 
 
 class ErrorDsDstNcMismatchError(Win32Error):
-    DESCRIPTION = """The source and destination for a cross-domain move do not agree on the naming contexts in the forest. Either the source or the destination does not have the latest version of the Partitions container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DST_NC_MISMATCH
 
 
 class ErrorDsNotAuthoritiveForDstNcError(Win32Error):
-    DESCRIPTION = """The destination of a cross-domain move is not authoritative for the destination naming context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOT_AUTHORITIVE_FOR_DST_NC
 
 
 class ErrorDsSrcGuidMismatchError(Win32Error):
-    DESCRIPTION = """The source and destination of a cross-domain move do not agree on the identity of the source object. Either the source or the destination does not have the latest version of the source object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SRC_GUID_MISMATCH
 
 
 class ErrorDsCantMoveDeletedObjectError(Win32Error):
-    DESCRIPTION = """The object being moved across domains is already known to be deleted by the destination server. The source server does not have the latest version of the source object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOVE_DELETED_OBJECT
 
 
 class ErrorDsPdcOperationInProgressError(Win32Error):
-    DESCRIPTION = """Another operation that requires exclusive access to the PDC FSMO is already in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_PDC_OPERATION_IN_PROGRESS
 
 
 class ErrorDsCrossDomainCleanupReqdError(Win32Error):
-    DESCRIPTION = """A cross-domain move operation failed because two versions of the moved object exist—one each in the source and destination domains. The destination object needs to be removed to restore the system to a consistent state."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CROSS_DOMAIN_CLEANUP_REQD
 
 
 class ErrorDsIllegalXdomMoveOperationError(Win32Error):
-    DESCRIPTION = """This object cannot be moved across domain boundaries either because cross-domain moves for this class are not allowed, or the object has some special characteristics, for example, a trust account or a restricted relative identifier (RID), that prevent its move."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ILLEGAL_XDOM_MOVE_OPERATION
 
 
 class ErrorDsCantWithAcctGroupMembershpsError(Win32Error):
-    DESCRIPTION = """Cannot move objects with memberships across domain boundaries because, once moved, this violates the membership conditions of the account group. Remove the object from any account group memberships and retry."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_WITH_ACCT_GROUP_MEMBERSHPS
 
 
 class ErrorDsNcMustHaveNcParentError(Win32Error):
-    DESCRIPTION = """A naming context head must be the immediate child of another naming context head, not of an interior node."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NC_MUST_HAVE_NC_PARENT
 
 
 class ErrorDsCrImpossibleToValidateError(Win32Error):
-    DESCRIPTION = """The directory cannot validate the proposed naming context name because it does not hold a replica of the naming context above the proposed naming context. Ensure that the domain naming master role is held by a server that is configured as a GC server, and that the server is up-to-date with its replication partners. (Applies only to Windows 2000 operating system domain naming masters.)"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CR_IMPOSSIBLE_TO_VALIDATE
 
 
 class ErrorDsDstDomainNotNativeError(Win32Error):
-    DESCRIPTION = """Destination domain must be in native mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DST_DOMAIN_NOT_NATIVE
 
 
 class ErrorDsMissingInfrastructureContainerError(Win32Error):
-    DESCRIPTION = """The operation cannot be performed because the server does not have an infrastructure container in the domain of interest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MISSING_INFRASTRUCTURE_CONTAINER
 
 
 class ErrorDsCantMoveAccountGroupError(Win32Error):
-    DESCRIPTION = """Cross-domain moves of nonempty account groups is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOVE_ACCOUNT_GROUP
 
 
 class ErrorDsCantMoveResourceGroupError(Win32Error):
-    DESCRIPTION = """Cross-domain moves of nonempty resource groups is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOVE_RESOURCE_GROUP
 
 
 class ErrorDsInvalidSearchFlagError(Win32Error):
-    DESCRIPTION = """The search flags for the attribute are invalid. The ambiguous name resolution (ANR) bit is valid only on attributes of Unicode or Teletex strings."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_SEARCH_FLAG
 
 
 class ErrorDsNoTreeDeleteAboveNcError(Win32Error):
-    DESCRIPTION = """Tree deletions starting at an object that has an NC head as a descendant are not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_TREE_DELETE_ABOVE_NC
 
 
 class ErrorDsCouldntLockTreeForDeleteError(Win32Error):
-    DESCRIPTION = """The directory service failed to lock a tree in preparation for a tree deletion because the tree was in use."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_COULDNT_LOCK_TREE_FOR_DELETE
 
 
 class ErrorDsCouldntIdentifyObjectsForTreeDeleteError(Win32Error):
-    DESCRIPTION = """The directory service failed to identify the list of objects to delete while attempting a tree deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_COULDNT_IDENTIFY_OBJECTS_FOR_TREE_DELETE
 
 
 class ErrorDsSamInitFailureError(Win32Error):
-    DESCRIPTION = """SAM initialization failed because of the following error: %1. Error Status: 0x%2. Click OK to shut down the system and reboot into Directory Services Restore Mode. Check the event log for detailed information."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SAM_INIT_FAILURE
 
 
 class ErrorDsSensitiveGroupViolationError(Win32Error):
-    DESCRIPTION = """Only an administrator can modify the membership list of an administrative group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SENSITIVE_GROUP_VIOLATION
 
 
 class ErrorDsCantModPrimarygroupidError(Win32Error):
-    DESCRIPTION = """Cannot change the primary group ID of a domain controller account."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOD_PRIMARYGROUPID
 
 
 class ErrorDsIllegalBaseSchemaModError(Win32Error):
-    DESCRIPTION = """An attempt was made to modify the base schema."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ILLEGAL_BASE_SCHEMA_MOD
 
 
 class ErrorDsNonsafeSchemaChangeError(Win32Error):
-    DESCRIPTION = """Adding a new mandatory attribute to an existing class, deleting a mandatory attribute from an existing class, or adding an optional attribute to the special class Top that is not a backlink attribute (directly or through inheritance, for example, by adding or deleting an auxiliary class) is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NONSAFE_SCHEMA_CHANGE
 
 
 class ErrorDsSchemaUpdateDisallowedError(Win32Error):
-    DESCRIPTION = """Schema update is not allowed on this DC because the DC is not the schema FSMO role owner."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SCHEMA_UPDATE_DISALLOWED
 
 
 class ErrorDsCantCreateUnderSchemaError(Win32Error):
-    DESCRIPTION = """An object of this class cannot be created under the schema container. You can only create Attribute-Schema and Class-Schema objects under the schema container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_CREATE_UNDER_SCHEMA
 
 
 class ErrorDsInstallNoSrcSchVersionError(Win32Error):
-    DESCRIPTION = """The replica or child install failed to get the objectVersion attribute on the schema container on the source DC. Either the attribute is missing on the schema container or the credentials supplied do not have permission to read it."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INSTALL_NO_SRC_SCH_VERSION
 
 
 class ErrorDsInstallNoSchVersionInInifileError(Win32Error):
-    DESCRIPTION = """The replica or child install failed to read the objectVersion attribute in the SCHEMA section of the file schema.ini in the System32 directory."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INSTALL_NO_SCH_VERSION_IN_INIFILE
 
 
 class ErrorDsInvalidGroupTypeError(Win32Error):
-    DESCRIPTION = """The specified group type is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_GROUP_TYPE
 
 
 class ErrorDsNoNestGlobalgroupInMixeddomainError(Win32Error):
-    DESCRIPTION = """You cannot nest global groups in a mixed domain if the group is security-enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_NEST_GLOBALGROUP_IN_MIXEDDOMAIN
 
 
 class ErrorDsNoNestLocalgroupInMixeddomainError(Win32Error):
-    DESCRIPTION = """You cannot nest local groups in a mixed domain if the group is security-enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_NEST_LOCALGROUP_IN_MIXEDDOMAIN
 
 
 class ErrorDsGlobalCantHaveLocalMemberError(Win32Error):
-    DESCRIPTION = """A global group cannot have a local group as a member."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GLOBAL_CANT_HAVE_LOCAL_MEMBER
 
 
 class ErrorDsGlobalCantHaveUniversalMemberError(Win32Error):
-    DESCRIPTION = """A global group cannot have a universal group as a member."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GLOBAL_CANT_HAVE_UNIVERSAL_MEMBER
 
 
 class ErrorDsUniversalCantHaveLocalMemberError(Win32Error):
-    DESCRIPTION = """A universal group cannot have a local group as a member."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNIVERSAL_CANT_HAVE_LOCAL_MEMBER
 
 
 class ErrorDsGlobalCantHaveCrossdomainMemberError(Win32Error):
-    DESCRIPTION = """A global group cannot have a cross-domain member."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GLOBAL_CANT_HAVE_CROSSDOMAIN_MEMBER
 
 
 class ErrorDsLocalCantHaveCrossdomainLocalMemberError(Win32Error):
-    DESCRIPTION = """A local group cannot have another cross domain local group as a member."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_LOCAL_CANT_HAVE_CROSSDOMAIN_LOCAL_MEMBER
 
 
 class ErrorDsHavePrimaryMembersError(Win32Error):
-    DESCRIPTION = """A group with primary members cannot change to a security-disabled group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_HAVE_PRIMARY_MEMBERS
 
 
 class ErrorDsStringSdConversionFailedError(Win32Error):
-    DESCRIPTION = """The schema cache load failed to convert the string default security descriptor (SD) on a class-schema object."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_STRING_SD_CONVERSION_FAILED
 
 
 class ErrorDsNamingMasterGcError(Win32Error):
-    DESCRIPTION = """Only DSAs configured to be GC servers should be allowed to hold the domain naming master FSMO role. (Applies only to Windows 2000 servers.)"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAMING_MASTER_GC
 
 
 class ErrorDsDnsLookupFailureError(Win32Error):
-    DESCRIPTION = """The DSA operation is unable to proceed because of a DNS lookup failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DNS_LOOKUP_FAILURE
 
 
 class ErrorDsCouldntUpdateSpnsError(Win32Error):
-    DESCRIPTION = """While processing a change to the DNS host name for an object, the SPN values could not be kept in sync."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_COULDNT_UPDATE_SPNS
 
 
 class ErrorDsCantRetrieveSdError(Win32Error):
-    DESCRIPTION = """The Security Descriptor attribute could not be read."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_RETRIEVE_SD
 
 
 class ErrorDsKeyNotUniqueError(Win32Error):
-    DESCRIPTION = """The object requested was not found, but an object with that key was found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_KEY_NOT_UNIQUE
 
 
 class ErrorDsWrongLinkedAttSyntaxError(Win32Error):
-    DESCRIPTION = """The syntax of the linked attribute being added is incorrect. Forward links can only have syntax 2.5.5.1, 2.5.5.7, and 2.5.5.14, and backlinks can only have syntax 2.5.5.1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_WRONG_LINKED_ATT_SYNTAX
 
 
 class ErrorDsSamNeedBootkeyPasswordError(Win32Error):
-    DESCRIPTION = """SAM needs to get the boot password."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SAM_NEED_BOOTKEY_PASSWORD
 
 
 class ErrorDsSamNeedBootkeyFloppyError(Win32Error):
-    DESCRIPTION = """SAM needs to get the boot key from the floppy disk."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SAM_NEED_BOOTKEY_FLOPPY
 
 
 class ErrorDsCantStartError(Win32Error):
-    DESCRIPTION = """Directory Service cannot start."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_START
 
 
 class ErrorDsInitFailureError(Win32Error):
-    DESCRIPTION = """Directory Services could not start."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INIT_FAILURE
 
 
 class ErrorDsNoPktPrivacyOnConnectionError(Win32Error):
-    DESCRIPTION = """The connection between client and server requires packet privacy or better."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_PKT_PRIVACY_ON_CONNECTION
 
 
 class ErrorDsSourceDomainInForestError(Win32Error):
-    DESCRIPTION = """The source domain cannot be in the same forest as the destination."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SOURCE_DOMAIN_IN_FOREST
 
 
 class ErrorDsDestinationDomainNotInForestError(Win32Error):
-    DESCRIPTION = """The destination domain MUST be in the forest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DESTINATION_DOMAIN_NOT_IN_FOREST
 
 
 class ErrorDsDestinationAuditingNotEnabledError(Win32Error):
-    DESCRIPTION = """The operation requires that destination domain auditing be enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DESTINATION_AUDITING_NOT_ENABLED
 
 
 class ErrorDsCantFindDcForSrcDomainError(Win32Error):
-    DESCRIPTION = """The operation could not locate a DC for the source domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_FIND_DC_FOR_SRC_DOMAIN
 
 
 class ErrorDsSrcObjNotGroupOrUserError(Win32Error):
-    DESCRIPTION = """The source object must be a group or user."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SRC_OBJ_NOT_GROUP_OR_USER
 
 
 class ErrorDsSrcSidExistsInForestError(Win32Error):
-    DESCRIPTION = """The source object's SID already exists in the destination forest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SRC_SID_EXISTS_IN_FOREST
 
 
 class ErrorDsSrcAndDstObjectClassMismatchError(Win32Error):
-    DESCRIPTION = """The source and destination object must be of the same type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SRC_AND_DST_OBJECT_CLASS_MISMATCH
 
 
 class ErrorSamInitFailureError(Win32Error):
-    DESCRIPTION = """SAM initialization failed because of the following error: %1. Error Status: 0x%2. Click OK to shut down the system and reboot into Safe Mode. Check the event log for detailed information."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SAM_INIT_FAILURE
 
 
 class ErrorDsDraSchemaInfoShipError(Win32Error):
-    DESCRIPTION = """Schema information could not be included in the replication request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SCHEMA_INFO_SHIP
 
 
 class ErrorDsDraSchemaConflictError(Win32Error):
-    DESCRIPTION = """The replication operation could not be completed due to a schema incompatibility."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_SCHEMA_CONFLICT
 
 
 class ErrorDsDraEarlierSchemaConflictError(Win32Error):
-    DESCRIPTION = """The replication operation could not be completed due to a previous schema incompatibility."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_EARLIER_SCHEMA_CONFLICT
 
 
 class ErrorDsDraObjNcMismatchError(Win32Error):
-    DESCRIPTION = """The replication update could not be applied because either the source or the destination has not yet received information regarding a recent cross-domain move operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_OBJ_NC_MISMATCH
 
 
 class ErrorDsNcStillHasDsasError(Win32Error):
-    DESCRIPTION = """The requested domain could not be deleted because there exist domain controllers that still host this domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NC_STILL_HAS_DSAS
 
 
 class ErrorDsGcRequiredError(Win32Error):
-    DESCRIPTION = """The requested operation can be performed only on a GC server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GC_REQUIRED
 
 
 class ErrorDsLocalMemberOfLocalOnlyError(Win32Error):
-    DESCRIPTION = """A local group can only be a member of other local groups in the same domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_LOCAL_MEMBER_OF_LOCAL_ONLY
 
 
 class ErrorDsNoFpoInUniversalGroupsError(Win32Error):
-    DESCRIPTION = """Foreign security principals cannot be members of universal groups."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_FPO_IN_UNIVERSAL_GROUPS
 
 
 class ErrorDsCantAddToGcError(Win32Error):
-    DESCRIPTION = """The attribute is not allowed to be replicated to the GC because of security reasons."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_ADD_TO_GC
 
 
 class ErrorDsNoCheckpointWithPdcError(Win32Error):
-    DESCRIPTION = """The checkpoint with the PDC could not be taken because too many modifications are currently being processed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_CHECKPOINT_WITH_PDC
 
 
 class ErrorDsSourceAuditingNotEnabledError(Win32Error):
-    DESCRIPTION = """The operation requires that source domain auditing be enabled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SOURCE_AUDITING_NOT_ENABLED
 
 
 class ErrorDsCantCreateInNondomainNcError(Win32Error):
-    DESCRIPTION = """Security principal objects can only be created inside domain naming contexts."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_CREATE_IN_NONDOMAIN_NC
 
 
 class ErrorDsInvalidNameForSpnError(Win32Error):
-    DESCRIPTION = """An SPN could not be constructed because the provided host name is not in the necessary format."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_NAME_FOR_SPN
 
 
 class ErrorDsFilterUsesContructedAttrsError(Win32Error):
-    DESCRIPTION = """A filter was passed that uses constructed attributes."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_FILTER_USES_CONTRUCTED_ATTRS
 
 
 class ErrorDsUnicodepwdNotInQuotesError(Win32Error):
-    DESCRIPTION = """The unicodePwd attribute value must be enclosed in quotation marks."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UNICODEPWD_NOT_IN_QUOTES
 
 
 class ErrorDsMachineAccountQuotaExceededError(Win32Error):
-    DESCRIPTION = """Your computer could not be joined to the domain. You have exceeded the maximum number of computer accounts you are allowed to create in this domain. Contact your system administrator to have this limit reset or increased."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MACHINE_ACCOUNT_QUOTA_EXCEEDED
 
 
 class ErrorDsMustBeRunOnDstDcError(Win32Error):
-    DESCRIPTION = """For security reasons, the operation must be run on the destination DC."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MUST_BE_RUN_ON_DST_DC
 
 
 class ErrorDsSrcDcMustBeSp4OrGreaterError(Win32Error):
-    DESCRIPTION = """For security reasons, the source DC must be NT4SP4 or greater."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SRC_DC_MUST_BE_SP4_OR_GREATER
 
 
 class ErrorDsCantTreeDeleteCriticalObjError(Win32Error):
-    DESCRIPTION = """Critical directory service system objects cannot be deleted during tree deletion operations. The tree deletion might have been partially performed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_TREE_DELETE_CRITICAL_OBJ
 
 
 class ErrorDsInitFailureConsoleError(Win32Error):
-    DESCRIPTION = """Directory Services could not start because of the following error: %1. Error Status: 0x%2. Click OK to shut down the system. You can use the Recovery Console to further diagnose the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INIT_FAILURE_CONSOLE
 
 
 class ErrorDsSamInitFailureConsoleError(Win32Error):
-    DESCRIPTION = """SAM initialization failed because of the following error: %1. Error Status: 0x%2. Click OK to shut down the system. You can use the Recovery Console to further diagnose the system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SAM_INIT_FAILURE_CONSOLE
 
 
 class ErrorDsForestVersionTooHighError(Win32Error):
-    DESCRIPTION = """The version of the operating system installed is incompatible with the current forest functional level. You must upgrade to a new version of the operating system before this server can become a domain controller in this forest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_FOREST_VERSION_TOO_HIGH
 
 
 class ErrorDsDomainVersionTooHighError(Win32Error):
-    DESCRIPTION = """The version of the operating system installed is incompatible with the current domain functional level. You must upgrade to a new version of the operating system before this server can become a domain controller in this domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DOMAIN_VERSION_TOO_HIGH
 
 
 class ErrorDsForestVersionTooLowError(Win32Error):
-    DESCRIPTION = """The version of the operating system installed on this server no longer supports the current forest functional level. You must raise the forest functional level before this server can become a domain controller in this forest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_FOREST_VERSION_TOO_LOW
 
 
 class ErrorDsDomainVersionTooLowError(Win32Error):
-    DESCRIPTION = """The version of the operating system installed on this server no longer supports the current domain functional level. You must raise the domain functional level before this server can become a domain controller in this domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DOMAIN_VERSION_TOO_LOW
 
 
 class ErrorDsIncompatibleVersionError(Win32Error):
-    DESCRIPTION = """The version of the operating system installed on this server is incompatible with the functional level of the domain or forest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INCOMPATIBLE_VERSION
 
 
 class ErrorDsLowDsaVersionError(Win32Error):
-    DESCRIPTION = """The functional level of the domain (or forest) cannot be raised to the requested value because one or more domain controllers in the domain (or forest) are at a lower, incompatible functional level."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_LOW_DSA_VERSION
 
 
 class ErrorDsNoBehaviorVersionInMixeddomainError(Win32Error):
-    DESCRIPTION = """The forest functional level cannot be raised to the requested value because one or more domains are still in mixed-domain mode. All domains in the forest must be in native mode for you to raise the forest functional level."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_BEHAVIOR_VERSION_IN_MIXEDDOMAIN
 
 
 class ErrorDsNotSupportedSortOrderError(Win32Error):
-    DESCRIPTION = """The sort order requested is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOT_SUPPORTED_SORT_ORDER
 
 
 class ErrorDsNameNotUniqueError(Win32Error):
-    DESCRIPTION = """The requested name already exists as a unique identifier."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_NOT_UNIQUE
 
 
 class ErrorDsMachineAccountCreatedPrent4Error(Win32Error):
-    DESCRIPTION = """The machine account was created before Windows NT 4.0. The account needs to be re-created."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MACHINE_ACCOUNT_CREATED_PRENT4
 
 
 class ErrorDsOutOfVersionStoreError(Win32Error):
-    DESCRIPTION = """The database is out of version store."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_OUT_OF_VERSION_STORE
 
 
 class ErrorDsIncompatibleControlsUsedError(Win32Error):
-    DESCRIPTION = """Unable to continue operation because multiple conflicting controls were used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INCOMPATIBLE_CONTROLS_USED
 
 
 class ErrorDsNoRefDomainError(Win32Error):
-    DESCRIPTION = """Unable to find a valid security descriptor reference domain for this partition."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_REF_DOMAIN
 
 
 class ErrorDsReservedLinkIdError(Win32Error):
-    DESCRIPTION = """Schema update failed: The link identifier is reserved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_RESERVED_LINK_ID
 
 
 class ErrorDsLinkIdNotAvailableError(Win32Error):
-    DESCRIPTION = """Schema update failed: There are no link identifiers available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_LINK_ID_NOT_AVAILABLE
 
 
 class ErrorDsAgCantHaveUniversalMemberError(Win32Error):
-    DESCRIPTION = """An account group cannot have a universal group as a member."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_AG_CANT_HAVE_UNIVERSAL_MEMBER
 
 
 class ErrorDsModifydnDisallowedByInstanceTypeError(Win32Error):
-    DESCRIPTION = """Rename or move operations on naming context heads or read-only objects are not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MODIFYDN_DISALLOWED_BY_INSTANCE_TYPE
 
 
 class ErrorDsNoObjectMoveInSchemaNcError(Win32Error):
-    DESCRIPTION = """Move operations on objects in the schema naming context are not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_OBJECT_MOVE_IN_SCHEMA_NC
 
 
 class ErrorDsModifydnDisallowedByFlagError(Win32Error):
-    DESCRIPTION = """A system flag has been set on the object that does not allow the object to be moved or renamed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MODIFYDN_DISALLOWED_BY_FLAG
 
 
 class ErrorDsModifydnWrongGrandparentError(Win32Error):
-    DESCRIPTION = """This object is not allowed to change its grandparent container. Moves are not forbidden on this object, but are restricted to sibling containers."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_MODIFYDN_WRONG_GRANDPARENT
 
 
 class ErrorDsNameErrorTrustReferralError(Win32Error):
-    DESCRIPTION = """Unable to resolve completely; a referral to another forest was generated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NAME_ERROR_TRUST_REFERRAL
 
 
 class ErrorNotSupportedOnStandardServerError(Win32Error):
-    DESCRIPTION = """The requested action is not supported on a standard server."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NOT_SUPPORTED_ON_STANDARD_SERVER
 
 
 class ErrorDsCantAccessRemotePartOfAdError(Win32Error):
-    DESCRIPTION = """Could not access a partition of the directory service located on a remote server. Make sure at least one server is running for the partition in question."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_ACCESS_REMOTE_PART_OF_AD
 
 
 class ErrorDsCrImpossibleToValidateV2Error(Win32Error):
-    DESCRIPTION = """The directory cannot validate the proposed naming context (or partition) name because it does not hold a replica, nor can it contact a replica of the naming context above the proposed naming context. Ensure that the parent naming context is properly registered in the DNS, and at least one replica of this naming context is reachable by the domain naming master."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CR_IMPOSSIBLE_TO_VALIDATE_V2
 
 
 class ErrorDsThreadLimitExceededError(Win32Error):
-    DESCRIPTION = """The thread limit for this request was exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_THREAD_LIMIT_EXCEEDED
 
 
 class ErrorDsNotClosestError(Win32Error):
-    DESCRIPTION = """The GC server is not in the closest site."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NOT_CLOSEST
 
 
 class ErrorDsCantDeriveSpnWithoutServerRefError(Win32Error):
-    DESCRIPTION = """The directory service cannot derive an SPN with which to mutually authenticate the target server because the corresponding server object in the local DS database has no serverReference attribute."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_DERIVE_SPN_WITHOUT_SERVER_REF
 
 
 class ErrorDsSingleUserModeFailedError(Win32Error):
-    DESCRIPTION = """The directory service failed to enter single-user mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SINGLE_USER_MODE_FAILED
 
 
 class ErrorDsNtdscriptSyntaxErrorError(Win32Error):
-    DESCRIPTION = """The directory service cannot parse the script because of a syntax error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NTDSCRIPT_SYNTAX_ERROR
 
 
 class ErrorDsNtdscriptProcessErrorError(Win32Error):
-    DESCRIPTION = """The directory service cannot process the script because of an error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NTDSCRIPT_PROCESS_ERROR
 
 
 class ErrorDsDifferentReplEpochsError(Win32Error):
-    DESCRIPTION = """The directory service cannot perform the requested operation because the servers involved are of different replication epochs (which is usually related to a domain rename that is in progress)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DIFFERENT_REPL_EPOCHS
 
 
 class ErrorDsDrsExtensionsChangedError(Win32Error):
-    DESCRIPTION = """The directory service binding must be renegotiated due to a change in the server extensions information."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRS_EXTENSIONS_CHANGED
 
 
 class ErrorDsReplicaSetChangeNotAllowedOnDisabledCrError(Win32Error):
-    DESCRIPTION = """The operation is not allowed on a disabled cross-reference."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_REPLICA_SET_CHANGE_NOT_ALLOWED_ON_DISABLED_CR
 
 
 class ErrorDsNoMsdsIntidError(Win32Error):
-    DESCRIPTION = """Schema update failed: No values for msDS-IntId are available."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_MSDS_INTID
 
 
 class ErrorDsDupMsdsIntidError(Win32Error):
-    DESCRIPTION = """Schema update failed: Duplicate msDS-IntId. Retry the operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUP_MSDS_INTID
 
 
 class ErrorDsExistsInRdnattidError(Win32Error):
-    DESCRIPTION = """Schema deletion failed: Attribute is used in rDNAttID."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EXISTS_IN_RDNATTID
 
 
 class ErrorDsAuthorizationFailedError(Win32Error):
-    DESCRIPTION = """The directory service failed to authorize the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_AUTHORIZATION_FAILED
 
 
 class ErrorDsInvalidScriptError(Win32Error):
-    DESCRIPTION = """The directory service cannot process the script because it is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_SCRIPT
 
 
 class ErrorDsRemoteCrossrefOpFailedError(Win32Error):
-    DESCRIPTION = """The remote create cross-reference operation failed on the domain naming master FSMO. The operation's error is in the extended data."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_REMOTE_CROSSREF_OP_FAILED
 
 
 class ErrorDsCrossRefBusyError(Win32Error):
-    DESCRIPTION = """A cross-reference is in use locally with the same name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CROSS_REF_BUSY
 
 
 class ErrorDsCantDeriveSpnForDeletedDomainError(Win32Error):
-    DESCRIPTION = """The directory service cannot derive an SPN with which to mutually authenticate the target server because the server's domain has been deleted from the forest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_DERIVE_SPN_FOR_DELETED_DOMAIN
 
 
 class ErrorDsCantDemoteWithWriteableNcError(Win32Error):
-    DESCRIPTION = """Writable NCs prevent this DC from demoting."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_DEMOTE_WITH_WRITEABLE_NC
 
 
 class ErrorDsDuplicateIdFoundError(Win32Error):
-    DESCRIPTION = """The requested object has a nonunique identifier and cannot be retrieved."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DUPLICATE_ID_FOUND
 
 
 class ErrorDsInsufficientAttrToCreateObjectError(Win32Error):
-    DESCRIPTION = """Insufficient attributes were given to create an object. This object might not exist because it might have been deleted and the garbage already collected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INSUFFICIENT_ATTR_TO_CREATE_OBJECT
 
 
 class ErrorDsGroupConversionErrorError(Win32Error):
-    DESCRIPTION = """The group cannot be converted due to attribute restrictions on the requested group type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_GROUP_CONVERSION_ERROR
 
 
 class ErrorDsCantMoveAppBasicGroupError(Win32Error):
-    DESCRIPTION = """Cross-domain moves of nonempty basic application groups is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOVE_APP_BASIC_GROUP
 
 
 class ErrorDsCantMoveAppQueryGroupError(Win32Error):
-    DESCRIPTION = """Cross-domain moves of nonempty query-based application groups is not allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_CANT_MOVE_APP_QUERY_GROUP
 
 
 class ErrorDsRoleNotVerifiedError(Win32Error):
-    DESCRIPTION = """The FSMO role ownership could not be verified because its directory partition did not replicate successfully with at least one replication partner."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_ROLE_NOT_VERIFIED
 
 
 class ErrorDsWkoContainerCannotBeSpecialError(Win32Error):
-    DESCRIPTION = """The target container for a redirection of a well-known object container cannot already be a special container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_WKO_CONTAINER_CANNOT_BE_SPECIAL
 
 
 class ErrorDsDomainRenameInProgressError(Win32Error):
-    DESCRIPTION = """The directory service cannot perform the requested operation because a domain rename operation is in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DOMAIN_RENAME_IN_PROGRESS
 
 
 class ErrorDsExistingAdChildNcError(Win32Error):
-    DESCRIPTION = """The directory service detected a child partition below the requested partition name. The partition hierarchy must be created in a top down method."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_EXISTING_AD_CHILD_NC
 
 
 class ErrorDsReplLifetimeExceededError(Win32Error):
-    DESCRIPTION = """The directory service cannot replicate with this server because the time since the last replication with this server has exceeded the tombstone lifetime."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_REPL_LIFETIME_EXCEEDED
 
 
 class ErrorDsDisallowedInSystemContainerError(Win32Error):
-    DESCRIPTION = """The requested operation is not allowed on an object under the system container."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DISALLOWED_IN_SYSTEM_CONTAINER
 
 
 class ErrorDsLdapSendQueueFullError(Win32Error):
-    DESCRIPTION = """The LDAP server's network send queue has filled up because the client is not processing the results of its requests fast enough. No more requests will be processed until the client catches up. If the client does not catch up then it will be disconnected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_LDAP_SEND_QUEUE_FULL
 
 
 class ErrorDsDraOutScheduleWindowError(Win32Error):
-    DESCRIPTION = """The scheduled replication did not take place because the system was too busy to execute the request within the schedule window. The replication queue is overloaded. Consider reducing the number of partners or decreasing the scheduled replication frequency."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_OUT_SCHEDULE_WINDOW
 
 
 class ErrorDsPolicyNotKnownError(Win32Error):
-    DESCRIPTION = """At this time, it cannot be determined if the branch replication policy is available on the hub domain controller. Retry at a later time to account for replication latencies."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_POLICY_NOT_KNOWN
 
 
 class ErrorNoSiteSettingsObjectError(Win32Error):
-    DESCRIPTION = """The site settings object for the specified site does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SITE_SETTINGS_OBJECT
 
 
 class ErrorNoSecretsError(Win32Error):
-    DESCRIPTION = """The local account store does not contain secret material for the specified account."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_SECRETS
 
 
 class ErrorNoWritableDcFoundError(Win32Error):
-    DESCRIPTION = """Could not find a writable domain controller in the domain."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_NO_WRITABLE_DC_FOUND
 
 
 class ErrorDsNoServerObjectError(Win32Error):
-    DESCRIPTION = """The server object for the domain controller does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_SERVER_OBJECT
 
 
 class ErrorDsNoNtdsaObjectError(Win32Error):
-    DESCRIPTION = """The NTDS Settings object for the domain controller does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NO_NTDSA_OBJECT
 
 
 class ErrorDsNonAsqSearchError(Win32Error):
-    DESCRIPTION = """The requested search operation is not supported for attribute scoped query (ASQ) searches."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_NON_ASQ_SEARCH
 
 
 class ErrorDsAuditFailureError(Win32Error):
-    DESCRIPTION = """A required audit event could not be generated for the operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_AUDIT_FAILURE
 
 
 class ErrorDsInvalidSearchFlagSubtreeError(Win32Error):
-    DESCRIPTION = """The search flags for the attribute are invalid. The subtree index bit is valid only on single-valued attributes."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_SEARCH_FLAG_SUBTREE
 
 
 class ErrorDsInvalidSearchFlagTupleError(Win32Error):
-    DESCRIPTION = """The search flags for the attribute are invalid. The tuple index bit is valid only on attributes of Unicode strings."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_INVALID_SEARCH_FLAG_TUPLE
 
 
 class ErrorDsDraRecycledTargetError(Win32Error):
-    DESCRIPTION = """The replication operation failed because the target object referenced by a link value is recycled."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_DRA_RECYCLED_TARGET
 
 
 class ErrorDsHighDsaVersionError(Win32Error):
-    DESCRIPTION = """The functional level of the domain (or forest) cannot be lowered to the requested value."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_HIGH_DSA_VERSION
 
 
 class ErrorDsSpnValueNotUniqueInForestError(Win32Error):
-    DESCRIPTION = """The operation failed because the SPN value provided for addition/modification is not unique forest-wide."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_SPN_VALUE_NOT_UNIQUE_IN_FOREST
 
 
 class ErrorDsUpnValueNotUniqueInForestError(Win32Error):
-    DESCRIPTION = """The operation failed because the UPN value provided for addition/modification is not unique forest-wide."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_DS_UPN_VALUE_NOT_UNIQUE_IN_FOREST
 
 
 class DnsErrorRcodeFormatErrorError(Win32Error):
-    DESCRIPTION = """DNS server unable to interpret format."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_FORMAT_ERROR
 
 
 class DnsErrorRcodeServerFailureError(Win32Error):
-    DESCRIPTION = """DNS server failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_SERVER_FAILURE
 
 
 class DnsErrorRcodeNameErrorError(Win32Error):
-    DESCRIPTION = """DNS name does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_NAME_ERROR
 
 
 class DnsErrorRcodeNotImplementedError(Win32Error):
-    DESCRIPTION = """DNS request not supported by name server."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_NOT_IMPLEMENTED
 
 
 class DnsErrorRcodeRefusedError(Win32Error):
-    DESCRIPTION = """DNS operation refused."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_REFUSED
 
 
 class DnsErrorRcodeYxdomainError(Win32Error):
-    DESCRIPTION = """DNS name that should not exist, does exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_YXDOMAIN
 
 
 class DnsErrorRcodeYxrrsetError(Win32Error):
-    DESCRIPTION = """DNS resource record (RR) set that should not exist, does exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_YXRRSET
 
 
 class DnsErrorRcodeNxrrsetError(Win32Error):
-    DESCRIPTION = """DNS RR set that should to exist, does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_NXRRSET
 
 
 class DnsErrorRcodeNotauthError(Win32Error):
-    DESCRIPTION = """DNS server not authoritative for zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_NOTAUTH
 
 
 class DnsErrorRcodeNotzoneError(Win32Error):
-    DESCRIPTION = """DNS name in update or prereq is not in zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_NOTZONE
 
 
 class DnsErrorRcodeBadsigError(Win32Error):
-    DESCRIPTION = """DNS signature failed to verify."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_BADSIG
 
 
 class DnsErrorRcodeBadkeyError(Win32Error):
-    DESCRIPTION = """DNS bad key."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_BADKEY
 
 
 class DnsErrorRcodeBadtimeError(Win32Error):
-    DESCRIPTION = """DNS signature validity expired."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE_BADTIME
 
 
 class DnsInfoNoRecordsError(Win32Error):
-    DESCRIPTION = """No records found for given DNS query."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_INFO_NO_RECORDS
 
 
 class DnsErrorBadPacketError(Win32Error):
-    DESCRIPTION = """Bad DNS packet."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_BAD_PACKET
 
 
 class DnsErrorNoPacketError(Win32Error):
-    DESCRIPTION = """No DNS packet."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NO_PACKET
 
 
 class DnsErrorRcodeError(Win32Error):
-    DESCRIPTION = """DNS error, check rcode."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RCODE
 
 
 class DnsErrorUnsecurePacketError(Win32Error):
-    DESCRIPTION = """Unsecured DNS packet."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_UNSECURE_PACKET
 
 
 class DnsErrorInvalidTypeError(Win32Error):
-    DESCRIPTION = """Invalid DNS type."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INVALID_TYPE
 
 
 class DnsErrorInvalidIpAddressError(Win32Error):
-    DESCRIPTION = """Invalid IP address."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INVALID_IP_ADDRESS
 
 
 class DnsErrorInvalidPropertyError(Win32Error):
-    DESCRIPTION = """Invalid property."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INVALID_PROPERTY
 
 
 class DnsErrorTryAgainLaterError(Win32Error):
-    DESCRIPTION = """Try DNS operation again later."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_TRY_AGAIN_LATER
 
 
 class DnsErrorNotUniqueError(Win32Error):
-    DESCRIPTION = """Record for given name and type is not unique."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NOT_UNIQUE
 
 
 class DnsErrorNonRfcNameError(Win32Error):
-    DESCRIPTION = """DNS name does not comply with RFC specifications."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NON_RFC_NAME
 
 
 class DnsStatusFqdnError(Win32Error):
-    DESCRIPTION = """DNS name is a fully qualified DNS name."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_STATUS_FQDN
 
 
 class DnsStatusDottedNameError(Win32Error):
-    DESCRIPTION = """DNS name is dotted (multilabel)."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_STATUS_DOTTED_NAME
 
 
 class DnsStatusSinglePartNameError(Win32Error):
-    DESCRIPTION = """DNS name is a single-part name."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_STATUS_SINGLE_PART_NAME
 
 
 class DnsErrorInvalidNameCharError(Win32Error):
-    DESCRIPTION = """DNS name contains an invalid character."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INVALID_NAME_CHAR
 
 
 class DnsErrorNumericNameError(Win32Error):
-    DESCRIPTION = """DNS name is entirely numeric."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NUMERIC_NAME
 
 
 class DnsErrorNotAllowedOnRootServerError(Win32Error):
-    DESCRIPTION = """The operation requested is not permitted on a DNS root server."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NOT_ALLOWED_ON_ROOT_SERVER
 
 
 class DnsErrorNotAllowedUnderDelegationError(Win32Error):
-    DESCRIPTION = """The record could not be created because this part of the DNS namespace has been delegated to another server."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NOT_ALLOWED_UNDER_DELEGATION
 
 
 class DnsErrorCannotFindRootHintsError(Win32Error):
-    DESCRIPTION = """The DNS server could not find a set of root hints."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_CANNOT_FIND_ROOT_HINTS
 
 
 class DnsErrorInconsistentRootHintsError(Win32Error):
-    DESCRIPTION = """The DNS server found root hints but they were not consistent across all adapters."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INCONSISTENT_ROOT_HINTS
 
 
 class DnsErrorDwordValueTooSmallError(Win32Error):
-    DESCRIPTION = """The specified value is too small for this parameter."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DWORD_VALUE_TOO_SMALL
 
 
 class DnsErrorDwordValueTooLargeError(Win32Error):
-    DESCRIPTION = """The specified value is too large for this parameter."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DWORD_VALUE_TOO_LARGE
 
 
 class DnsErrorBackgroundLoadingError(Win32Error):
-    DESCRIPTION = """This operation is not allowed while the DNS server is loading zones in the background. Try again later."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_BACKGROUND_LOADING
 
 
 class DnsErrorNotAllowedOnRodcError(Win32Error):
-    DESCRIPTION = """The operation requested is not permitted on against a DNS server running on a read-only DC."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NOT_ALLOWED_ON_RODC
 
 
 class DnsErrorZoneDoesNotExistError(Win32Error):
-    DESCRIPTION = """DNS zone does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_DOES_NOT_EXIST
 
 
 class DnsErrorNoZoneInfoError(Win32Error):
-    DESCRIPTION = """DNS zone information not available."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NO_ZONE_INFO
 
 
 class DnsErrorInvalidZoneOperationError(Win32Error):
-    DESCRIPTION = """Invalid operation for DNS zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INVALID_ZONE_OPERATION
 
 
 class DnsErrorZoneConfigurationErrorError(Win32Error):
-    DESCRIPTION = """Invalid DNS zone configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_CONFIGURATION_ERROR
 
 
 class DnsErrorZoneHasNoSoaRecordError(Win32Error):
-    DESCRIPTION = """DNS zone has no start of authority (SOA) record."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_HAS_NO_SOA_RECORD
 
 
 class DnsErrorZoneHasNoNsRecordsError(Win32Error):
-    DESCRIPTION = """DNS zone has no Name Server (NS) record."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_HAS_NO_NS_RECORDS
 
 
 class DnsErrorZoneLockedError(Win32Error):
-    DESCRIPTION = """DNS zone is locked."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_LOCKED
 
 
 class DnsErrorZoneCreationFailedError(Win32Error):
-    DESCRIPTION = """DNS zone creation failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_CREATION_FAILED
 
 
 class DnsErrorZoneAlreadyExistsError(Win32Error):
-    DESCRIPTION = """DNS zone already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_ALREADY_EXISTS
 
 
 class DnsErrorAutozoneAlreadyExistsError(Win32Error):
-    DESCRIPTION = """DNS automatic zone already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_AUTOZONE_ALREADY_EXISTS
 
 
 class DnsErrorInvalidZoneTypeError(Win32Error):
-    DESCRIPTION = """Invalid DNS zone type."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INVALID_ZONE_TYPE
 
 
 class DnsErrorSecondaryRequiresMasterIpError(Win32Error):
-    DESCRIPTION = """Secondary DNS zone requires master IP address."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_SECONDARY_REQUIRES_MASTER_IP
 
 
 class DnsErrorZoneNotSecondaryError(Win32Error):
-    DESCRIPTION = """DNS zone not secondary."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_NOT_SECONDARY
 
 
 class DnsErrorNeedSecondaryAddressesError(Win32Error):
-    DESCRIPTION = """Need secondary IP address."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NEED_SECONDARY_ADDRESSES
 
 
 class DnsErrorWinsInitFailedError(Win32Error):
-    DESCRIPTION = """WINS initialization failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_WINS_INIT_FAILED
 
 
 class DnsErrorNeedWinsServersError(Win32Error):
-    DESCRIPTION = """Need WINS servers."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NEED_WINS_SERVERS
 
 
 class DnsErrorNbstatInitFailedError(Win32Error):
-    DESCRIPTION = """NBTSTAT initialization call failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NBSTAT_INIT_FAILED
 
 
 class DnsErrorSoaDeleteInvalidError(Win32Error):
-    DESCRIPTION = """Invalid delete of SOA."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_SOA_DELETE_INVALID
 
 
 class DnsErrorForwarderAlreadyExistsError(Win32Error):
-    DESCRIPTION = """A conditional forwarding zone already exists for that name."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_FORWARDER_ALREADY_EXISTS
 
 
 class DnsErrorZoneRequiresMasterIpError(Win32Error):
-    DESCRIPTION = """This zone must be configured with one or more master DNS server IP addresses."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_REQUIRES_MASTER_IP
 
 
 class DnsErrorZoneIsShutdownError(Win32Error):
-    DESCRIPTION = """The operation cannot be performed because this zone is shut down."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_ZONE_IS_SHUTDOWN
 
 
 class DnsErrorPrimaryRequiresDatafileError(Win32Error):
-    DESCRIPTION = """The primary DNS zone requires a data file."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_PRIMARY_REQUIRES_DATAFILE
 
 
 class DnsErrorInvalidDatafileNameError(Win32Error):
-    DESCRIPTION = """Invalid data file name for the DNS zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_INVALID_DATAFILE_NAME
 
 
 class DnsErrorDatafileOpenFailureError(Win32Error):
-    DESCRIPTION = """Failed to open the data file for the DNS zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DATAFILE_OPEN_FAILURE
 
 
 class DnsErrorFileWritebackFailedError(Win32Error):
-    DESCRIPTION = """Failed to write the data file for the DNS zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_FILE_WRITEBACK_FAILED
 
 
 class DnsErrorDatafileParsingError(Win32Error):
-    DESCRIPTION = """Failure while reading datafile for DNS zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DATAFILE_PARSING
 
 
 class DnsErrorRecordDoesNotExistError(Win32Error):
-    DESCRIPTION = """DNS record does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RECORD_DOES_NOT_EXIST
 
 
 class DnsErrorRecordFormatError(Win32Error):
-    DESCRIPTION = """DNS record format error."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RECORD_FORMAT
 
 
 class DnsErrorNodeCreationFailedError(Win32Error):
-    DESCRIPTION = """Node creation failure in DNS."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NODE_CREATION_FAILED
 
 
 class DnsErrorUnknownRecordTypeError(Win32Error):
-    DESCRIPTION = """Unknown DNS record type."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_UNKNOWN_RECORD_TYPE
 
 
 class DnsErrorRecordTimedOutError(Win32Error):
-    DESCRIPTION = """DNS record timed out."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RECORD_TIMED_OUT
 
 
 class DnsErrorNameNotInZoneError(Win32Error):
-    DESCRIPTION = """Name not in DNS zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NAME_NOT_IN_ZONE
 
 
 class DnsErrorCnameLoopError(Win32Error):
-    DESCRIPTION = """CNAME loop detected."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_CNAME_LOOP
 
 
 class DnsErrorNodeIsCnameError(Win32Error):
-    DESCRIPTION = """Node is a CNAME DNS record."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NODE_IS_CNAME
 
 
 class DnsErrorCnameCollisionError(Win32Error):
-    DESCRIPTION = """A CNAME record already exists for the given name."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_CNAME_COLLISION
 
 
 class DnsErrorRecordOnlyAtZoneRootError(Win32Error):
-    DESCRIPTION = """Record is only at DNS zone root."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RECORD_ONLY_AT_ZONE_ROOT
 
 
 class DnsErrorRecordAlreadyExistsError(Win32Error):
-    DESCRIPTION = """DNS record already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_RECORD_ALREADY_EXISTS
 
 
 class DnsErrorSecondaryDataError(Win32Error):
-    DESCRIPTION = """Secondary DNS zone data error."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_SECONDARY_DATA
 
 
 class DnsErrorNoCreateCacheDataError(Win32Error):
-    DESCRIPTION = """Could not create DNS cache data."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NO_CREATE_CACHE_DATA
 
 
 class DnsErrorNameDoesNotExistError(Win32Error):
-    DESCRIPTION = """DNS name does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NAME_DOES_NOT_EXIST
 
 
 class DnsWarningPtrCreateFailedError(Win32Error):
-    DESCRIPTION = """Could not create pointer (PTR) record."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_WARNING_PTR_CREATE_FAILED
 
 
 class DnsWarningDomainUndeletedError(Win32Error):
-    DESCRIPTION = """DNS domain was undeleted."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_WARNING_DOMAIN_UNDELETED
 
 
 class DnsErrorDsUnavailableError(Win32Error):
-    DESCRIPTION = """The directory service is unavailable."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DS_UNAVAILABLE
 
 
 class DnsErrorDsZoneAlreadyExistsError(Win32Error):
-    DESCRIPTION = """DNS zone already exists in the directory service."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DS_ZONE_ALREADY_EXISTS
 
 
 class DnsErrorNoBootfileIfDsZoneError(Win32Error):
-    DESCRIPTION = """DNS server not creating or reading the boot file for the directory service integrated DNS zone."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NO_BOOTFILE_IF_DS_ZONE
 
 
 class DnsInfoAxfrCompleteError(Win32Error):
-    DESCRIPTION = """DNS AXFR (zone transfer) complete."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_INFO_AXFR_COMPLETE
 
 
 class DnsErrorAxfrError(Win32Error):
-    DESCRIPTION = """DNS zone transfer failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_AXFR
 
 
 class DnsInfoAddedLocalWinsError(Win32Error):
-    DESCRIPTION = """Added local WINS server."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_INFO_ADDED_LOCAL_WINS
 
 
 class DnsStatusContinueNeededError(Win32Error):
-    DESCRIPTION = """Secure update call needs to continue update request."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_STATUS_CONTINUE_NEEDED
 
 
 class DnsErrorNoTcpipError(Win32Error):
-    DESCRIPTION = """TCP/IP network protocol not installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NO_TCPIP
 
 
 class DnsErrorNoDnsServersError(Win32Error):
-    DESCRIPTION = """No DNS servers configured for local system."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_NO_DNS_SERVERS
 
 
 class DnsErrorDpDoesNotExistError(Win32Error):
-    DESCRIPTION = """The specified directory partition does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DP_DOES_NOT_EXIST
 
 
 class DnsErrorDpAlreadyExistsError(Win32Error):
-    DESCRIPTION = """The specified directory partition already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DP_ALREADY_EXISTS
 
 
 class DnsErrorDpNotEnlistedError(Win32Error):
-    DESCRIPTION = """This DNS server is not enlisted in the specified directory partition."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DP_NOT_ENLISTED
 
 
 class DnsErrorDpAlreadyEnlistedError(Win32Error):
-    DESCRIPTION = """This DNS server is already enlisted in the specified directory partition."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DP_ALREADY_ENLISTED
 
 
 class DnsErrorDpNotAvailableError(Win32Error):
-    DESCRIPTION = """The directory partition is not available at this time. Wait a few minutes and try again."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DP_NOT_AVAILABLE
 
 
 class DnsErrorDpFsmoErrorError(Win32Error):
-    DESCRIPTION = """The application directory partition operation failed. The domain controller holding the domain naming master role is down or unable to service the request or is not running Windows Server 2003."""
     WIN32_ERROR_CODE = Win32ErrorCode.DNS_ERROR_DP_FSMO_ERROR
 
 
 class WsaeintrError(Win32Error):
-    DESCRIPTION = """A blocking operation was interrupted by a call to WSACancelBlockingCall."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEINTR
 
 
 class WsaebadfError(Win32Error):
-    DESCRIPTION = """The file handle supplied is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEBADF
 
 
 class WsaeaccesError(Win32Error):
-    DESCRIPTION = """An attempt was made to access a socket in a way forbidden by its access permissions."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEACCES
 
 
 class WsaefaultError(Win32Error):
-    DESCRIPTION = """The system detected an invalid pointer address in attempting to use a pointer argument in a call."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEFAULT
 
 
 class WsaeinvalError(Win32Error):
-    DESCRIPTION = """An invalid argument was supplied."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEINVAL
 
 
 class WsaemfileError(Win32Error):
-    DESCRIPTION = """Too many open sockets."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEMFILE
 
 
 class WsaewouldblockError(Win32Error):
-    DESCRIPTION = """A nonblocking socket operation could not be completed immediately."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEWOULDBLOCK
 
 
 class WsaeinprogressError(Win32Error):
-    DESCRIPTION = """A blocking operation is currently executing."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEINPROGRESS
 
 
 class WsaealreadyError(Win32Error):
-    DESCRIPTION = """An operation was attempted on a nonblocking socket that already had an operation in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEALREADY
 
 
 class WsaenotsockError(Win32Error):
-    DESCRIPTION = """An operation was attempted on something that is not a socket."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENOTSOCK
 
 
 class WsaedestaddrreqError(Win32Error):
-    DESCRIPTION = """A required address was omitted from an operation on a socket."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEDESTADDRREQ
 
 
 class WsaemsgsizeError(Win32Error):
-    DESCRIPTION = """A message sent on a datagram socket was larger than the internal message buffer or some other network limit, or the buffer used to receive a datagram into was smaller than the datagram itself."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEMSGSIZE
 
 
 class WsaeprototypeError(Win32Error):
-    DESCRIPTION = """A protocol was specified in the socket function call that does not support the semantics of the socket type requested."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEPROTOTYPE
 
 
 class WsaenoprotooptError(Win32Error):
-    DESCRIPTION = """An unknown, invalid, or unsupported option or level was specified in a getsockopt or setsockopt call."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENOPROTOOPT
 
 
 class WsaeprotonosupportError(Win32Error):
-    DESCRIPTION = """The requested protocol has not been configured into the system, or no implementation for it exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEPROTONOSUPPORT
 
 
 class WsaesocktnosupportError(Win32Error):
-    DESCRIPTION = """The support for the specified socket type does not exist in this address family."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAESOCKTNOSUPPORT
 
 
 class WsaeopnotsuppError(Win32Error):
-    DESCRIPTION = """The attempted operation is not supported for the type of object referenced."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEOPNOTSUPP
 
 
 class WsaepfnosupportError(Win32Error):
-    DESCRIPTION = """The protocol family has not been configured into the system or no implementation for it exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEPFNOSUPPORT
 
 
 class WsaeafnosupportError(Win32Error):
-    DESCRIPTION = """An address incompatible with the requested protocol was used."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEAFNOSUPPORT
 
 
 class WsaeaddrinuseError(Win32Error):
-    DESCRIPTION = """Only one usage of each socket address (protocol/network address/port) is normally permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEADDRINUSE
 
 
 class WsaeaddrnotavailError(Win32Error):
-    DESCRIPTION = """The requested address is not valid in its context."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEADDRNOTAVAIL
 
 
 class WsaenetdownError(Win32Error):
-    DESCRIPTION = """A socket operation encountered a dead network."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENETDOWN
 
 
 class WsaenetunreachError(Win32Error):
-    DESCRIPTION = """A socket operation was attempted to an unreachable network."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENETUNREACH
 
 
 class WsaenetresetError(Win32Error):
-    DESCRIPTION = """The connection has been broken due to keep-alive activity detecting a failure while the operation was in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENETRESET
 
 
 class WsaeconnabortedError(Win32Error):
-    DESCRIPTION = """An established connection was aborted by the software in your host machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAECONNABORTED
 
 
 class WsaeconnresetError(Win32Error):
-    DESCRIPTION = """An existing connection was forcibly closed by the remote host."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAECONNRESET
 
 
 class WsaenobufsError(Win32Error):
-    DESCRIPTION = """An operation on a socket could not be performed because the system lacked sufficient buffer space or because a queue was full."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENOBUFS
 
 
 class WsaeisconnError(Win32Error):
-    DESCRIPTION = """A connect request was made on an already connected socket."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEISCONN
 
 
 class WsaenotconnError(Win32Error):
-    DESCRIPTION = """A request to send or receive data was disallowed because the socket is not connected and (when sending on a datagram socket using a sendto call) no address was supplied."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENOTCONN
 
 
 class WsaeshutdownError(Win32Error):
-    DESCRIPTION = """A request to send or receive data was disallowed because the socket had already been shut down in that direction with a previous shutdown call."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAESHUTDOWN
 
 
 class WsaetoomanyrefsError(Win32Error):
-    DESCRIPTION = """Too many references to a kernel object."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAETOOMANYREFS
 
 
 class WsaetimedoutError(Win32Error):
-    DESCRIPTION = """A connection attempt failed because the connected party did not properly respond after a period of time, or the established connection failed because the connected host failed to respond."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAETIMEDOUT
 
 
 class WsaeconnrefusedError(Win32Error):
-    DESCRIPTION = """No connection could be made because the target machine actively refused it."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAECONNREFUSED
 
 
 class WsaeloopError(Win32Error):
-    DESCRIPTION = """Cannot translate name."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAELOOP
 
 
 class WsaenametoolongError(Win32Error):
-    DESCRIPTION = """Name or name component was too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENAMETOOLONG
 
 
 class WsaehostdownError(Win32Error):
-    DESCRIPTION = """A socket operation failed because the destination host was down."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEHOSTDOWN
 
 
 class WsaehostunreachError(Win32Error):
-    DESCRIPTION = """A socket operation was attempted to an unreachable host."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEHOSTUNREACH
 
 
 class WsaenotemptyError(Win32Error):
-    DESCRIPTION = """Cannot remove a directory that is not empty."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENOTEMPTY
 
 
 class WsaeproclimError(Win32Error):
-    DESCRIPTION = """A Windows Sockets implementation might have a limit on the number of applications that can use it simultaneously."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEPROCLIM
 
 
 class WsaeusersError(Win32Error):
-    DESCRIPTION = """Ran out of quota."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEUSERS
 
 
 class WsaedquotError(Win32Error):
-    DESCRIPTION = """Ran out of disk quota."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEDQUOT
 
 
 class WsaestaleError(Win32Error):
-    DESCRIPTION = """File handle reference is no longer available."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAESTALE
 
 
 class WsaeremoteError(Win32Error):
-    DESCRIPTION = """Item is not available locally."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEREMOTE
 
 
 class WsasysnotreadyError(Win32Error):
-    DESCRIPTION = """WSAStartup cannot function at this time because the underlying system it uses to provide network services is currently unavailable."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSASYSNOTREADY
 
 
 class WsavernotsupportedError(Win32Error):
-    DESCRIPTION = """The Windows Sockets version requested is not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAVERNOTSUPPORTED
 
 
 class WsanotinitialisedError(Win32Error):
-    DESCRIPTION = """Either the application has not called WSAStartup, or WSAStartup failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSANOTINITIALISED
 
 
 class WsaedisconError(Win32Error):
-    DESCRIPTION = """Returned by WSARecv or WSARecvFrom to indicate that the remote party has initiated a graceful shutdown sequence."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEDISCON
 
 
 class WsaenomoreError(Win32Error):
-    DESCRIPTION = """No more results can be returned by WSALookupServiceNext."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAENOMORE
 
 
 class WsaecancelledError(Win32Error):
-    DESCRIPTION = """A call to WSALookupServiceEnd was made while this call was still processing. The call has been canceled."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAECANCELLED
 
 
 class WsaeinvalidproctableError(Win32Error):
-    DESCRIPTION = """The procedure call table is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEINVALIDPROCTABLE
 
 
 class WsaeinvalidproviderError(Win32Error):
-    DESCRIPTION = """The requested service provider is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEINVALIDPROVIDER
 
 
 class WsaeproviderfailedinitError(Win32Error):
-    DESCRIPTION = """The requested service provider could not be loaded or initialized."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEPROVIDERFAILEDINIT
 
 
 class WsasyscallfailureError(Win32Error):
-    DESCRIPTION = """A system call that should never fail has failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSASYSCALLFAILURE
 
 
 class WsaserviceNotFoundError(Win32Error):
-    DESCRIPTION = """No such service is known. The service cannot be found in the specified namespace."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSASERVICE_NOT_FOUND
 
 
 class WsatypeNotFoundError(Win32Error):
-    DESCRIPTION = """The specified class was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSATYPE_NOT_FOUND
 
 
 class WsaENoMoreError(Win32Error):
-    DESCRIPTION = """No more results can be returned by WSALookupServiceNext."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_E_NO_MORE
 
 
 class WsaECancelledError(Win32Error):
-    DESCRIPTION = """A call to WSALookupServiceEnd was made while this call was still processing. The call has been canceled."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_E_CANCELLED
 
 
 class WsaerefusedError(Win32Error):
-    DESCRIPTION = """A database query failed because it was actively refused."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAEREFUSED
 
 
 class WsahostNotFoundError(Win32Error):
-    DESCRIPTION = """No such host is known."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSAHOST_NOT_FOUND
 
 
 class WsatryAgainError(Win32Error):
-    DESCRIPTION = """This is usually a temporary error during host name resolution and means that the local server did not receive a response from an authoritative server."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSATRY_AGAIN
 
 
 class WsanoRecoveryError(Win32Error):
-    DESCRIPTION = """A nonrecoverable error occurred during a database lookup."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSANO_RECOVERY
 
 
 class WsanoDataError(Win32Error):
-    DESCRIPTION = """The requested name is valid, but no data of the requested type was found."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSANO_DATA
 
 
 class WsaQosReceiversError(Win32Error):
-    DESCRIPTION = """At least one reserve has arrived."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_RECEIVERS
 
 
 class WsaQosSendersError(Win32Error):
-    DESCRIPTION = """At least one path has arrived."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_SENDERS
 
 
 class WsaQosNoSendersError(Win32Error):
-    DESCRIPTION = """There are no senders."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_NO_SENDERS
 
 
 class WsaQosNoReceiversError(Win32Error):
-    DESCRIPTION = """There are no receivers."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_NO_RECEIVERS
 
 
 class WsaQosRequestConfirmedError(Win32Error):
-    DESCRIPTION = """Reserve has been confirmed."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_REQUEST_CONFIRMED
 
 
 class WsaQosAdmissionFailureError(Win32Error):
-    DESCRIPTION = """Error due to lack of resources."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_ADMISSION_FAILURE
 
 
 class WsaQosPolicyFailureError(Win32Error):
-    DESCRIPTION = """Rejected for administrative reasons—bad credentials."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_POLICY_FAILURE
 
 
 class WsaQosBadStyleError(Win32Error):
-    DESCRIPTION = """Unknown or conflicting style."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_BAD_STYLE
 
 
 class WsaQosBadObjectError(Win32Error):
-    DESCRIPTION = """There is a problem with some part of the filterspec or provider-specific buffer in general."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_BAD_OBJECT
 
 
 class WsaQosTrafficCtrlErrorError(Win32Error):
-    DESCRIPTION = """There is a problem with some part of the flowspec."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_TRAFFIC_CTRL_ERROR
 
 
 class WsaQosGenericErrorError(Win32Error):
-    DESCRIPTION = """General quality of serve (QOS) error."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_GENERIC_ERROR
 
 
 class WsaQosEservicetypeError(Win32Error):
-    DESCRIPTION = """An invalid or unrecognized service type was found in the flowspec."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_ESERVICETYPE
 
 
 class WsaQosEflowspecError(Win32Error):
-    DESCRIPTION = """An invalid or inconsistent flowspec was found in the QOS structure."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EFLOWSPEC
 
 
 class WsaQosEprovspecbufError(Win32Error):
-    DESCRIPTION = """Invalid QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EPROVSPECBUF
 
 
 class WsaQosEfilterstyleError(Win32Error):
-    DESCRIPTION = """An invalid QOS filter style was used."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EFILTERSTYLE
 
 
 class WsaQosEfiltertypeError(Win32Error):
-    DESCRIPTION = """An invalid QOS filter type was used."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EFILTERTYPE
 
 
 class WsaQosEfiltercountError(Win32Error):
-    DESCRIPTION = """An incorrect number of QOS FILTERSPECs were specified in the FLOWDESCRIPTOR."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EFILTERCOUNT
 
 
 class WsaQosEobjlengthError(Win32Error):
-    DESCRIPTION = """An object with an invalid ObjectLength field was specified in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EOBJLENGTH
 
 
 class WsaQosEflowcountError(Win32Error):
-    DESCRIPTION = """An incorrect number of flow descriptors was specified in the QOS structure."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EFLOWCOUNT
 
 
 class WsaQosEunkownpsobjError(Win32Error):
-    DESCRIPTION = """An unrecognized object was found in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EUNKOWNPSOBJ
 
 
 class WsaQosEpolicyobjError(Win32Error):
-    DESCRIPTION = """An invalid policy object was found in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EPOLICYOBJ
 
 
 class WsaQosEflowdescError(Win32Error):
-    DESCRIPTION = """An invalid QOS flow descriptor was found in the flow descriptor list."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EFLOWDESC
 
 
 class WsaQosEpsflowspecError(Win32Error):
-    DESCRIPTION = """An invalid or inconsistent flowspec was found in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EPSFLOWSPEC
 
 
 class WsaQosEpsfilterspecError(Win32Error):
-    DESCRIPTION = """An invalid FILTERSPEC was found in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_EPSFILTERSPEC
 
 
 class WsaQosEsdmodeobjError(Win32Error):
-    DESCRIPTION = """An invalid shape discard mode object was found in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_ESDMODEOBJ
 
 
 class WsaQosEshaperateobjError(Win32Error):
-    DESCRIPTION = """An invalid shaping rate object was found in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_ESHAPERATEOBJ
 
 
 class WsaQosReservedPetypeError(Win32Error):
-    DESCRIPTION = """A reserved policy element was found in the QOS provider-specific buffer."""
     WIN32_ERROR_CODE = Win32ErrorCode.WSA_QOS_RESERVED_PETYPE
 
 
 class ErrorIpsecQmPolicyExistsError(Win32Error):
-    DESCRIPTION = """The specified quick mode policy already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_QM_POLICY_EXISTS
 
 
 class ErrorIpsecQmPolicyNotFoundError(Win32Error):
-    DESCRIPTION = """The specified quick mode policy was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_QM_POLICY_NOT_FOUND
 
 
 class ErrorIpsecQmPolicyInUseError(Win32Error):
-    DESCRIPTION = """The specified quick mode policy is being used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_QM_POLICY_IN_USE
 
 
 class ErrorIpsecMmPolicyExistsError(Win32Error):
-    DESCRIPTION = """The specified main mode policy already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_POLICY_EXISTS
 
 
 class ErrorIpsecMmPolicyNotFoundError(Win32Error):
-    DESCRIPTION = """The specified main mode policy was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_POLICY_NOT_FOUND
 
 
 class ErrorIpsecMmPolicyInUseError(Win32Error):
-    DESCRIPTION = """The specified main mode policy is being used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_POLICY_IN_USE
 
 
 class ErrorIpsecMmFilterExistsError(Win32Error):
-    DESCRIPTION = """The specified main mode filter already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_FILTER_EXISTS
 
 
 class ErrorIpsecMmFilterNotFoundError(Win32Error):
-    DESCRIPTION = """The specified main mode filter was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_FILTER_NOT_FOUND
 
 
 class ErrorIpsecTransportFilterExistsError(Win32Error):
-    DESCRIPTION = """The specified transport mode filter already exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_TRANSPORT_FILTER_EXISTS
 
 
 class ErrorIpsecTransportFilterNotFoundError(Win32Error):
-    DESCRIPTION = """The specified transport mode filter does not exist."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_TRANSPORT_FILTER_NOT_FOUND
 
 
 class ErrorIpsecMmAuthExistsError(Win32Error):
-    DESCRIPTION = """The specified main mode authentication list exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_AUTH_EXISTS
 
 
 class ErrorIpsecMmAuthNotFoundError(Win32Error):
-    DESCRIPTION = """The specified main mode authentication list was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_AUTH_NOT_FOUND
 
 
 class ErrorIpsecMmAuthInUseError(Win32Error):
-    DESCRIPTION = """The specified main mode authentication list is being used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_AUTH_IN_USE
 
 
 class ErrorIpsecDefaultMmPolicyNotFoundError(Win32Error):
-    DESCRIPTION = """The specified default main mode policy was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_DEFAULT_MM_POLICY_NOT_FOUND
 
 
 class ErrorIpsecDefaultMmAuthNotFoundError(Win32Error):
-    DESCRIPTION = """The specified default main mode authentication list was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_DEFAULT_MM_AUTH_NOT_FOUND
 
 
 class ErrorIpsecDefaultQmPolicyNotFoundError(Win32Error):
-    DESCRIPTION = """The specified default quick mode policy was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_DEFAULT_QM_POLICY_NOT_FOUND
 
 
 class ErrorIpsecTunnelFilterExistsError(Win32Error):
-    DESCRIPTION = """The specified tunnel mode filter exists."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_TUNNEL_FILTER_EXISTS
 
 
 class ErrorIpsecTunnelFilterNotFoundError(Win32Error):
-    DESCRIPTION = """The specified tunnel mode filter was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_TUNNEL_FILTER_NOT_FOUND
 
 
 class ErrorIpsecMmFilterPendingDeletionError(Win32Error):
-    DESCRIPTION = """The main mode filter is pending deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_FILTER_PENDING_DELETION
 
 
 class ErrorIpsecTransportFilterEndingDeletionError(Win32Error):
-    DESCRIPTION = """The transport filter is pending deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_TRANSPORT_FILTER_ENDING_DELETION
 
 
 class ErrorIpsecTunnelFilterPendingDeletionError(Win32Error):
-    DESCRIPTION = """The tunnel filter is pending deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_TUNNEL_FILTER_PENDING_DELETION
 
 
 class ErrorIpsecMmPolicyPendingEletionError(Win32Error):
-    DESCRIPTION = """The main mode policy is pending deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_POLICY_PENDING_ELETION
 
 
 class ErrorIpsecMmAuthPendingDeletionError(Win32Error):
-    DESCRIPTION = """The main mode authentication bundle is pending deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_MM_AUTH_PENDING_DELETION
 
 
 class ErrorIpsecQmPolicyPendingDeletionError(Win32Error):
-    DESCRIPTION = """The quick mode policy is pending deletion."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_QM_POLICY_PENDING_DELETION
 
 
 class WarningIpsecMmPolicyPrunedError(Win32Error):
-    DESCRIPTION = """The main mode policy was successfully added, but some of the requested offers are not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.WARNING_IPSEC_MM_POLICY_PRUNED
 
 
 class WarningIpsecQmPolicyPrunedError(Win32Error):
-    DESCRIPTION = """The quick mode policy was successfully added, but some of the requested offers are not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.WARNING_IPSEC_QM_POLICY_PRUNED
 
 
 class ErrorIpsecIkeNegStatusBeginError(Win32Error):
-    DESCRIPTION = """Starts the list of frequencies of various IKE Win32 error codes encountered during negotiations."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NEG_STATUS_BEGIN
 
 
 class ErrorIpsecIkeAuthFailError(Win32Error):
-    DESCRIPTION = """The IKE authentication credentials are unacceptable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_AUTH_FAIL
 
 
 class ErrorIpsecIkeAttribFailError(Win32Error):
-    DESCRIPTION = """The IKE security attributes are unacceptable."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_ATTRIB_FAIL
 
 
 class ErrorIpsecIkeNegotiationPendingError(Win32Error):
-    DESCRIPTION = """The IKE negotiation is in progress."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NEGOTIATION_PENDING
 
 
 class ErrorIpsecIkeGeneralProcessingErrorError(Win32Error):
-    DESCRIPTION = """General processing error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_GENERAL_PROCESSING_ERROR
 
 
 class ErrorIpsecIkeTimedOutError(Win32Error):
-    DESCRIPTION = """Negotiation timed out."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_TIMED_OUT
 
 
 class ErrorIpsecIkeNoCertError(Win32Error):
-    DESCRIPTION = """The IKE failed to find a valid machine certificate. Contact your network security administrator about installing a valid certificate in the appropriate certificate store."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NO_CERT
 
 
 class ErrorIpsecIkeSaDeletedError(Win32Error):
-    DESCRIPTION = """The IKE security association (SA) was deleted by a peer before it was completely established."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_SA_DELETED
 
 
 class ErrorIpsecIkeSaReapedError(Win32Error):
-    DESCRIPTION = """The IKE SA was deleted before it was completely established."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_SA_REAPED
 
 
 class ErrorIpsecIkeMmAcquireDropError(Win32Error):
-    DESCRIPTION = """The negotiation request sat in the queue too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_MM_ACQUIRE_DROP
 
 
 class ErrorIpsecIkeQmAcquireDropError(Win32Error):
-    DESCRIPTION = """The negotiation request sat in the queue too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_QM_ACQUIRE_DROP
 
 
 class ErrorIpsecIkeQueueDropMmError(Win32Error):
-    DESCRIPTION = """The negotiation request sat in the queue too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_QUEUE_DROP_MM
 
 
 class ErrorIpsecIkeQueueDropNoMmError(Win32Error):
-    DESCRIPTION = """The negotiation request sat in the queue too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_QUEUE_DROP_NO_MM
 
 
 class ErrorIpsecIkeDropNoResponseError(Win32Error):
-    DESCRIPTION = """There was no response from a peer."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_DROP_NO_RESPONSE
 
 
 class ErrorIpsecIkeMmDelayDropError(Win32Error):
-    DESCRIPTION = """The negotiation took too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_MM_DELAY_DROP
 
 
 class ErrorIpsecIkeQmDelayDropError(Win32Error):
-    DESCRIPTION = """The negotiation took too long."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_QM_DELAY_DROP
 
 
 class ErrorIpsecIkeErrorError(Win32Error):
-    DESCRIPTION = """An unknown error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_ERROR
 
 
 class ErrorIpsecIkeCrlFailedError(Win32Error):
-    DESCRIPTION = """The certificate revocation check failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_CRL_FAILED
 
 
 class ErrorIpsecIkeInvalidKeyUsageError(Win32Error):
-    DESCRIPTION = """Invalid certificate key usage."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_KEY_USAGE
 
 
 class ErrorIpsecIkeInvalidCertTypeError(Win32Error):
-    DESCRIPTION = """Invalid certificate type."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_CERT_TYPE
 
 
 class ErrorIpsecIkeNoPrivateKeyError(Win32Error):
-    DESCRIPTION = """The IKE negotiation failed because the machine certificate used does not have a private key. IPsec certificates require a private key. Contact your network security administrator about a certificate that has a private key."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NO_PRIVATE_KEY
 
 
 class ErrorIpsecIkeDhFailError(Win32Error):
-    DESCRIPTION = """There was a failure in the Diffie-Hellman computation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_DH_FAIL
 
 
 class ErrorIpsecIkeInvalidHeaderError(Win32Error):
-    DESCRIPTION = """Invalid header."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_HEADER
 
 
 class ErrorIpsecIkeNoPolicyError(Win32Error):
-    DESCRIPTION = """No policy configured."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NO_POLICY
 
 
 class ErrorIpsecIkeInvalidSignatureError(Win32Error):
-    DESCRIPTION = """Failed to verify signature."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_SIGNATURE
 
 
 class ErrorIpsecIkeKerberosErrorError(Win32Error):
-    DESCRIPTION = """Failed to authenticate using Kerberos."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_KERBEROS_ERROR
 
 
 class ErrorIpsecIkeNoPublicKeyError(Win32Error):
-    DESCRIPTION = """The peer's certificate did not have a public key."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NO_PUBLIC_KEY
 
 
 class ErrorIpsecIkeProcessErrError(Win32Error):
-    DESCRIPTION = """Error processing the error payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR
 
 
 class ErrorIpsecIkeProcessErrSaError(Win32Error):
-    DESCRIPTION = """Error processing the SA payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_SA
 
 
 class ErrorIpsecIkeProcessErrPropError(Win32Error):
-    DESCRIPTION = """Error processing the proposal payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_PROP
 
 
 class ErrorIpsecIkeProcessErrTransError(Win32Error):
-    DESCRIPTION = """Error processing the transform payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_TRANS
 
 
 class ErrorIpsecIkeProcessErrKeError(Win32Error):
-    DESCRIPTION = """Error processing the key exchange payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_KE
 
 
 class ErrorIpsecIkeProcessErrIdError(Win32Error):
-    DESCRIPTION = """Error processing the ID payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_ID
 
 
 class ErrorIpsecIkeProcessErrCertError(Win32Error):
-    DESCRIPTION = """Error processing the certification payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_CERT
 
 
 class ErrorIpsecIkeProcessErrCertReqError(Win32Error):
-    DESCRIPTION = """Error processing the certificate request payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_CERT_REQ
 
 
 class ErrorIpsecIkeProcessErrHashError(Win32Error):
-    DESCRIPTION = """Error processing the hash payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_HASH
 
 
 class ErrorIpsecIkeProcessErrSigError(Win32Error):
-    DESCRIPTION = """Error processing the signature payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_SIG
 
 
 class ErrorIpsecIkeProcessErrNonceError(Win32Error):
-    DESCRIPTION = """Error processing the nonce payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_NONCE
 
 
 class ErrorIpsecIkeProcessErrNotifyError(Win32Error):
-    DESCRIPTION = """Error processing the notify payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_NOTIFY
 
 
 class ErrorIpsecIkeProcessErrDeleteError(Win32Error):
-    DESCRIPTION = """Error processing the delete payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_DELETE
 
 
 class ErrorIpsecIkeProcessErrVendorError(Win32Error):
-    DESCRIPTION = """Error processing the VendorId payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_VENDOR
 
 
 class ErrorIpsecIkeInvalidPayloadError(Win32Error):
-    DESCRIPTION = """Invalid payload received."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_PAYLOAD
 
 
 class ErrorIpsecIkeLoadSoftSaError(Win32Error):
-    DESCRIPTION = """Soft SA loaded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_LOAD_SOFT_SA
 
 
 class ErrorIpsecIkeSoftSaTornDownError(Win32Error):
-    DESCRIPTION = """Soft SA torn down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_SOFT_SA_TORN_DOWN
 
 
 class ErrorIpsecIkeInvalidCookieError(Win32Error):
-    DESCRIPTION = """Invalid cookie received."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_COOKIE
 
 
 class ErrorIpsecIkeNoPeerCertError(Win32Error):
-    DESCRIPTION = """Peer failed to send valid machine certificate."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NO_PEER_CERT
 
 
 class ErrorIpsecIkePeerCrlFailedError(Win32Error):
-    DESCRIPTION = """Certification revocation check of peer's certificate failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PEER_CRL_FAILED
 
 
 class ErrorIpsecIkePolicyChangeError(Win32Error):
-    DESCRIPTION = """New policy invalidated SAs formed with the old policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_POLICY_CHANGE
 
 
 class ErrorIpsecIkeNoMmPolicyError(Win32Error):
-    DESCRIPTION = """There is no available main mode IKE policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NO_MM_POLICY
 
 
 class ErrorIpsecIkeNotcbprivError(Win32Error):
-    DESCRIPTION = """Failed to enabled trusted computer base (TCB) privilege."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NOTCBPRIV
 
 
 class ErrorIpsecIkeSecloadfailError(Win32Error):
-    DESCRIPTION = """Failed to load SECURITY.DLL."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_SECLOADFAIL
 
 
 class ErrorIpsecIkeFailsspinitError(Win32Error):
-    DESCRIPTION = """Failed to obtain the security function table dispatch address from the SSPI."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_FAILSSPINIT
 
 
 class ErrorIpsecIkeFailquerysspError(Win32Error):
-    DESCRIPTION = """Failed to query the Kerberos package to obtain the max token size."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_FAILQUERYSSP
 
 
 class ErrorIpsecIkeSrvacqfailError(Win32Error):
-    DESCRIPTION = """Failed to obtain the Kerberos server credentials for the Internet Security Association and Key Management Protocol (ISAKMP)/ERROR_IPSEC_IKE service. Kerberos authentication will not function. The most likely reason for this is lack of domain membership. This is normal if your computer is a member of a workgroup."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_SRVACQFAIL
 
 
 class ErrorIpsecIkeSrvquerycredError(Win32Error):
-    DESCRIPTION = """Failed to determine the SSPI principal name for ISAKMP/ERROR_IPSEC_IKE service (QueryCredentialsAttributes)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_SRVQUERYCRED
 
 
 class ErrorIpsecIkeGetspifailError(Win32Error):
-    DESCRIPTION = """Failed to obtain a new service provider interface (SPI) for the inbound SA from the IPsec driver. The most common cause for this is that the driver does not have the correct filter. Check your policy to verify the filters."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_GETSPIFAIL
 
 
 class ErrorIpsecIkeInvalidFilterError(Win32Error):
-    DESCRIPTION = """Given filter is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_FILTER
 
 
 class ErrorIpsecIkeOutOfMemoryError(Win32Error):
-    DESCRIPTION = """Memory allocation failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_OUT_OF_MEMORY
 
 
 class ErrorIpsecIkeAddUpdateKeyFailedError(Win32Error):
-    DESCRIPTION = """Failed to add an SA to the IPSec driver. The most common cause for this is if the IKE negotiation took too long to complete. If the problem persists, reduce the load on the faulting machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_ADD_UPDATE_KEY_FAILED
 
 
 class ErrorIpsecIkeInvalidPolicyError(Win32Error):
-    DESCRIPTION = """Invalid policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_POLICY
 
 
 class ErrorIpsecIkeUnknownDoiError(Win32Error):
-    DESCRIPTION = """Invalid digital object identifier (DOI)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_UNKNOWN_DOI
 
 
 class ErrorIpsecIkeInvalidSituationError(Win32Error):
-    DESCRIPTION = """Invalid situation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_SITUATION
 
 
 class ErrorIpsecIkeDhFailureError(Win32Error):
-    DESCRIPTION = """Diffie-Hellman failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_DH_FAILURE
 
 
 class ErrorIpsecIkeInvalidGroupError(Win32Error):
-    DESCRIPTION = """Invalid Diffie-Hellman group."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_GROUP
 
 
 class ErrorIpsecIkeEncryptError(Win32Error):
-    DESCRIPTION = """Error encrypting payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_ENCRYPT
 
 
 class ErrorIpsecIkeDecryptError(Win32Error):
-    DESCRIPTION = """Error decrypting payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_DECRYPT
 
 
 class ErrorIpsecIkePolicyMatchError(Win32Error):
-    DESCRIPTION = """Policy match error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_POLICY_MATCH
 
 
 class ErrorIpsecIkeUnsupportedIdError(Win32Error):
-    DESCRIPTION = """Unsupported ID."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_UNSUPPORTED_ID
 
 
 class ErrorIpsecIkeInvalidHashError(Win32Error):
-    DESCRIPTION = """Hash verification failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_HASH
 
 
 class ErrorIpsecIkeInvalidHashAlgError(Win32Error):
-    DESCRIPTION = """Invalid hash algorithm."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_HASH_ALG
 
 
 class ErrorIpsecIkeInvalidHashSizeError(Win32Error):
-    DESCRIPTION = """Invalid hash size."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_HASH_SIZE
 
 
 class ErrorIpsecIkeInvalidEncryptAlgError(Win32Error):
-    DESCRIPTION = """Invalid encryption algorithm."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_ENCRYPT_ALG
 
 
 class ErrorIpsecIkeInvalidAuthAlgError(Win32Error):
-    DESCRIPTION = """Invalid authentication algorithm."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_AUTH_ALG
 
 
 class ErrorIpsecIkeInvalidSigError(Win32Error):
-    DESCRIPTION = """Invalid certificate signature."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_SIG
 
 
 class ErrorIpsecIkeLoadFailedError(Win32Error):
-    DESCRIPTION = """Load failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_LOAD_FAILED
 
 
 class ErrorIpsecIkeRpcDeleteError(Win32Error):
-    DESCRIPTION = """Deleted by using an RPC call."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_RPC_DELETE
 
 
 class ErrorIpsecIkeBenignReinitError(Win32Error):
-    DESCRIPTION = """A temporary state was created to perform reinitialization. This is not a real failure."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_BENIGN_REINIT
 
 
 class ErrorIpsecIkeInvalidResponderLifetimeNotifyError(Win32Error):
-    DESCRIPTION = """The lifetime value received in the Responder Lifetime Notify is below the Windows 2000 configured minimum value. Fix the policy on the peer machine."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_RESPONDER_LIFETIME_NOTIFY
 
 
 class ErrorIpsecIkeInvalidCertKeylenError(Win32Error):
-    DESCRIPTION = """Key length in the certificate is too small for configured security requirements."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_CERT_KEYLEN
 
 
 class ErrorIpsecIkeMmLimitError(Win32Error):
-    DESCRIPTION = """Maximum number of established MM SAs to peer exceeded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_MM_LIMIT
 
 
 class ErrorIpsecIkeNegotiationDisabledError(Win32Error):
-    DESCRIPTION = """The IKE received a policy that disables negotiation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NEGOTIATION_DISABLED
 
 
 class ErrorIpsecIkeQmLimitError(Win32Error):
-    DESCRIPTION = """Reached maximum quick mode limit for the main mode. New main mode will be started."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_QM_LIMIT
 
 
 class ErrorIpsecIkeMmExpiredError(Win32Error):
-    DESCRIPTION = """Main mode SA lifetime expired or the peer sent a main mode delete."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_MM_EXPIRED
 
 
 class ErrorIpsecIkePeerMmAssumedInvalidError(Win32Error):
-    DESCRIPTION = """Main mode SA assumed to be invalid because peer stopped responding."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PEER_MM_ASSUMED_INVALID
 
 
 class ErrorIpsecIkeCertChainPolicyMismatchError(Win32Error):
-    DESCRIPTION = """Certificate does not chain to a trusted root in IPsec policy."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_CERT_CHAIN_POLICY_MISMATCH
 
 
 class ErrorIpsecIkeUnexpectedMessageIdError(Win32Error):
-    DESCRIPTION = """Received unexpected message ID."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_UNEXPECTED_MESSAGE_ID
 
 
 class ErrorIpsecIkeInvalidUmattsError(Win32Error):
-    DESCRIPTION = """Received invalid AuthIP user mode attributes."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_UMATTS
 
 
 class ErrorIpsecIkeDosCookieSentError(Win32Error):
-    DESCRIPTION = """Sent DOS cookie notify to initiator."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_DOS_COOKIE_SENT
 
 
 class ErrorIpsecIkeShuttingDownError(Win32Error):
-    DESCRIPTION = """The IKE service is shutting down."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_SHUTTING_DOWN
 
 
 class ErrorIpsecIkeCgaAuthFailedError(Win32Error):
-    DESCRIPTION = """Could not verify the binding between the color graphics adapter (CGA) address and the certificate."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_CGA_AUTH_FAILED
 
 
 class ErrorIpsecIkeProcessErrNatoaError(Win32Error):
-    DESCRIPTION = """Error processing the NatOA payload."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_PROCESS_ERR_NATOA
 
 
 class ErrorIpsecIkeInvalidMmForQmError(Win32Error):
-    DESCRIPTION = """The parameters of the main mode are invalid for this quick mode."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_INVALID_MM_FOR_QM
 
 
 class ErrorIpsecIkeQmExpiredError(Win32Error):
-    DESCRIPTION = """The quick mode SA was expired by the IPsec driver."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_QM_EXPIRED
 
 
 class ErrorIpsecIkeTooManyFiltersError(Win32Error):
-    DESCRIPTION = """Too many dynamically added IKEEXT filters were detected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_TOO_MANY_FILTERS
 
 
 class ErrorIpsecIkeNegStatusEndError(Win32Error):
-    DESCRIPTION = """Ends the list of frequencies of various IKE Win32 error codes encountered during negotiations."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_IPSEC_IKE_NEG_STATUS_END
 
 
 class ErrorSxsSectionNotFoundError(Win32Error):
-    DESCRIPTION = """The requested section was not present in the activation context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_SECTION_NOT_FOUND
 
 
 class ErrorSxsCantGenActctxError(Win32Error):
-    DESCRIPTION = """The application has failed to start because its side-by-side configuration is incorrect. See the application event log for more detail."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_CANT_GEN_ACTCTX
 
 
 class ErrorSxsInvalidActctxdataFormatError(Win32Error):
-    DESCRIPTION = """The application binding data format is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INVALID_ACTCTXDATA_FORMAT
 
 
 class ErrorSxsAssemblyNotFoundError(Win32Error):
-    DESCRIPTION = """The referenced assembly is not installed on your system."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_ASSEMBLY_NOT_FOUND
 
 
 class ErrorSxsManifestFormatErrorError(Win32Error):
-    DESCRIPTION = """The manifest file does not begin with the required tag and format information."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MANIFEST_FORMAT_ERROR
 
 
 class ErrorSxsManifestParseErrorError(Win32Error):
-    DESCRIPTION = """The manifest file contains one or more syntax errors."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MANIFEST_PARSE_ERROR
 
 
 class ErrorSxsActivationContextDisabledError(Win32Error):
-    DESCRIPTION = """The application attempted to activate a disabled activation context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_ACTIVATION_CONTEXT_DISABLED
 
 
 class ErrorSxsKeyNotFoundError(Win32Error):
-    DESCRIPTION = """The requested lookup key was not found in any active activation context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_KEY_NOT_FOUND
 
 
 class ErrorSxsVersionConflictError(Win32Error):
-    DESCRIPTION = """A component version required by the application conflicts with another active component version."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_VERSION_CONFLICT
 
 
 class ErrorSxsWrongSectionTypeError(Win32Error):
-    DESCRIPTION = """The type requested activation context section does not match the query API used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_WRONG_SECTION_TYPE
 
 
 class ErrorSxsThreadQueriesDisabledError(Win32Error):
-    DESCRIPTION = """Lack of system resources has required isolated activation to be disabled for the current thread of execution."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_THREAD_QUERIES_DISABLED
 
 
 class ErrorSxsProcessDefaultAlreadySetError(Win32Error):
-    DESCRIPTION = """An attempt to set the process default activation context failed because the process default activation context was already set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_PROCESS_DEFAULT_ALREADY_SET
 
 
 class ErrorSxsUnknownEncodingGroupError(Win32Error):
-    DESCRIPTION = """The encoding group identifier specified is not recognized."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_UNKNOWN_ENCODING_GROUP
 
 
 class ErrorSxsUnknownEncodingError(Win32Error):
-    DESCRIPTION = """The encoding requested is not recognized."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_UNKNOWN_ENCODING
 
 
 class ErrorSxsInvalidXmlNamespaceUriError(Win32Error):
-    DESCRIPTION = """The manifest contains a reference to an invalid URI."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INVALID_XML_NAMESPACE_URI
 
 
 class ErrorSxsRootManifestDependencyOtInstalledError(Win32Error):
-    DESCRIPTION = """The application manifest contains a reference to a dependent assembly that is not installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_ROOT_MANIFEST_DEPENDENCY_OT_INSTALLED
 
 
 class ErrorSxsLeafManifestDependencyNotInstalledError(Win32Error):
-    DESCRIPTION = """The manifest for an assembly used by the application has a reference to a dependent assembly that is not installed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_LEAF_MANIFEST_DEPENDENCY_NOT_INSTALLED
 
 
 class ErrorSxsInvalidAssemblyIdentityAttributeError(Win32Error):
-    DESCRIPTION = """The manifest contains an attribute for the assembly identity that is not valid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INVALID_ASSEMBLY_IDENTITY_ATTRIBUTE
 
 
 class ErrorSxsManifestMissingRequiredDefaultNamespaceError(Win32Error):
-    DESCRIPTION = """The manifest is missing the required default namespace specification on the assembly element."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MANIFEST_MISSING_REQUIRED_DEFAULT_NAMESPACE
 
 
 class ErrorSxsManifestInvalidRequiredDefaultNamespaceError(Win32Error):
-    DESCRIPTION = """The manifest has a default namespace specified on the assembly element but its value is not urn:schemas-microsoft-com:asm.v1\".\""""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MANIFEST_INVALID_REQUIRED_DEFAULT_NAMESPACE
 
 
 class ErrorSxsPrivateManifestCrossPathWithReparsePointError(Win32Error):
-    DESCRIPTION = """The private manifest probed has crossed the reparse-point-associated path."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_PRIVATE_MANIFEST_CROSS_PATH_WITH_REPARSE_POINT
 
 
 class ErrorSxsDuplicateDllNameError(Win32Error):
-    DESCRIPTION = """Two or more components referenced directly or indirectly by the application manifest have files by the same name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_DUPLICATE_DLL_NAME
 
 
 class ErrorSxsDuplicateWindowclassNameError(Win32Error):
-    DESCRIPTION = """Two or more components referenced directly or indirectly by the application manifest have window classes with the same name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_DUPLICATE_WINDOWCLASS_NAME
 
 
 class ErrorSxsDuplicateClsidError(Win32Error):
-    DESCRIPTION = """Two or more components referenced directly or indirectly by the application manifest have the same COM server CLSIDs."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_DUPLICATE_CLSID
 
 
 class ErrorSxsDuplicateIidError(Win32Error):
-    DESCRIPTION = """Two or more components referenced directly or indirectly by the application manifest have proxies for the same COM interface IIDs."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_DUPLICATE_IID
 
 
 class ErrorSxsDuplicateTlbidError(Win32Error):
-    DESCRIPTION = """Two or more components referenced directly or indirectly by the application manifest have the same COM type library TLBIDs."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_DUPLICATE_TLBID
 
 
 class ErrorSxsDuplicateProgidError(Win32Error):
-    DESCRIPTION = """Two or more components referenced directly or indirectly by the application manifest have the same COM ProgIDs."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_DUPLICATE_PROGID
 
 
 class ErrorSxsDuplicateAssemblyNameError(Win32Error):
-    DESCRIPTION = """Two or more components referenced directly or indirectly by the application manifest are different versions of the same component, which is not permitted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_DUPLICATE_ASSEMBLY_NAME
 
 
 class ErrorSxsFileHashMismatchError(Win32Error):
-    DESCRIPTION = """A component's file does not match the verification information present in the component manifest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_FILE_HASH_MISMATCH
 
 
 class ErrorSxsPolicyParseErrorError(Win32Error):
-    DESCRIPTION = """The policy manifest contains one or more syntax errors."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_POLICY_PARSE_ERROR
 
 
 class ErrorSxsXmlEMissingquoteError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A string literal was expected, but no opening quotation mark was found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MISSINGQUOTE
 
 
 class ErrorSxsXmlECommentsyntaxError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Incorrect syntax was used in a comment."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_COMMENTSYNTAX
 
 
 class ErrorSxsXmlEBadstartnamecharError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A name started with an invalid character."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_BADSTARTNAMECHAR
 
 
 class ErrorSxsXmlEBadnamecharError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A name contained an invalid character."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_BADNAMECHAR
 
 
 class ErrorSxsXmlEBadcharinstringError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A string literal contained an invalid character."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_BADCHARINSTRING
 
 
 class ErrorSxsXmlEXmldeclsyntaxError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Invalid syntax for an XML declaration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_XMLDECLSYNTAX
 
 
 class ErrorSxsXmlEBadchardataError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: An Invalid character was found in text content."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_BADCHARDATA
 
 
 class ErrorSxsXmlEMissingwhitespaceError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Required white space was missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MISSINGWHITESPACE
 
 
 class ErrorSxsXmlEExpectingtagendError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: The angle bracket (>) character was expected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_EXPECTINGTAGEND
 
 
 class ErrorSxsXmlEMissingsemicolonError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A semicolon (;) was expected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MISSINGSEMICOLON
 
 
 class ErrorSxsXmlEUnbalancedparenError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Unbalanced parentheses."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNBALANCEDPAREN
 
 
 class ErrorSxsXmlEInternalerrorError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Internal error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INTERNALERROR
 
 
 class ErrorSxsXmlEUnexpectedWhitespaceError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Whitespace is not allowed at this location."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNEXPECTED_WHITESPACE
 
 
 class ErrorSxsXmlEIncompleteEncodingError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: End of file reached in invalid state for current encoding."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INCOMPLETE_ENCODING
 
 
 class ErrorSxsXmlEMissingParenError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Missing parenthesis."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MISSING_PAREN
 
 
 class ErrorSxsXmlEExpectingclosequoteError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A single (') or double (\") quotation mark is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_EXPECTINGCLOSEQUOTE
 
 
 class ErrorSxsXmlEMultipleColonsError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Multiple colons are not allowed in a name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MULTIPLE_COLONS
 
 
 class ErrorSxsXmlEInvalidDecimalError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Invalid character for decimal digit."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALID_DECIMAL
 
 
 class ErrorSxsXmlEInvalidHexidecimalError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Invalid character for hexadecimal digit."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALID_HEXIDECIMAL
 
 
 class ErrorSxsXmlEInvalidUnicodeError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Invalid Unicode character value for this platform."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALID_UNICODE
 
 
 class ErrorSxsXmlEWhitespaceorquestionmarkError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Expecting whitespace or question mark (?)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_WHITESPACEORQUESTIONMARK
 
 
 class ErrorSxsXmlEUnexpectedendtagError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: End tag was not expected at this location."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNEXPECTEDENDTAG
 
 
 class ErrorSxsXmlEUnclosedtagError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: The following tags were not closed: %1."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNCLOSEDTAG
 
 
 class ErrorSxsXmlEDuplicateattributeError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Duplicate attribute."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_DUPLICATEATTRIBUTE
 
 
 class ErrorSxsXmlEMultiplerootsError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Only one top-level element is allowed in an XML document."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MULTIPLEROOTS
 
 
 class ErrorSxsXmlEInvalidatrootlevelError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Invalid at the top level of the document."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALIDATROOTLEVEL
 
 
 class ErrorSxsXmlEBadxmldeclError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Invalid XML declaration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_BADXMLDECL
 
 
 class ErrorSxsXmlEMissingrootError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: XML document must have a top-level element."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MISSINGROOT
 
 
 class ErrorSxsXmlEUnexpectedeofError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Unexpected end of file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNEXPECTEDEOF
 
 
 class ErrorSxsXmlEBadperefinsubsetError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Parameter entities cannot be used inside markup declarations in an internal subset."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_BADPEREFINSUBSET
 
 
 class ErrorSxsXmlEUnclosedstarttagError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Element was not closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNCLOSEDSTARTTAG
 
 
 class ErrorSxsXmlEUnclosedendtagError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: End element was missing the angle bracket (>) character."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNCLOSEDENDTAG
 
 
 class ErrorSxsXmlEUnclosedstringError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A string literal was not closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNCLOSEDSTRING
 
 
 class ErrorSxsXmlEUnclosedcommentError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A comment was not closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNCLOSEDCOMMENT
 
 
 class ErrorSxsXmlEUncloseddeclError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A declaration was not closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNCLOSEDDECL
 
 
 class ErrorSxsXmlEUnclosedcdataError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: A CDATA section was not closed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNCLOSEDCDATA
 
 
 class ErrorSxsXmlEReservednamespaceError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: The namespace prefix is not allowed to start with the reserved string xml\".\""""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_RESERVEDNAMESPACE
 
 
 class ErrorSxsXmlEInvalidencodingError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: System does not support the specified encoding."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALIDENCODING
 
 
 class ErrorSxsXmlEInvalidswitchError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Switch from current encoding to specified encoding not supported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALIDSWITCH
 
 
 class ErrorSxsXmlEBadxmlcaseError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: The name \"xml\" is reserved and must be lowercase."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_BADXMLCASE
 
 
 class ErrorSxsXmlEInvalidStandaloneError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: The stand-alone attribute must have the value \"yes\" or \"no\"."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALID_STANDALONE
 
 
 class ErrorSxsXmlEUnexpectedStandaloneError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: The stand-alone attribute cannot be used in external entities."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_UNEXPECTED_STANDALONE
 
 
 class ErrorSxsXmlEInvalidVersionError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Invalid version number."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_INVALID_VERSION
 
 
 class ErrorSxsXmlEMissingequalsError(Win32Error):
-    DESCRIPTION = """Manifest Parse Error: Missing equal sign (=) between the attribute and the attribute value."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_XML_E_MISSINGEQUALS
 
 
 class ErrorSxsProtectionRecoveryFailedError(Win32Error):
-    DESCRIPTION = """Assembly Protection Error: Unable to recover the specified assembly."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_PROTECTION_RECOVERY_FAILED
 
 
 class ErrorSxsProtectionPublicKeyOoShortError(Win32Error):
-    DESCRIPTION = """Assembly Protection Error: The public key for an assembly was too short to be allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_PROTECTION_PUBLIC_KEY_OO_SHORT
 
 
 class ErrorSxsProtectionCatalogNotValidError(Win32Error):
-    DESCRIPTION = """Assembly Protection Error: The catalog for an assembly is not valid, or does not match the assembly's manifest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_PROTECTION_CATALOG_NOT_VALID
 
 
 class ErrorSxsUntranslatableHresultError(Win32Error):
-    DESCRIPTION = """An HRESULT could not be translated to a corresponding Win32 error code."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_UNTRANSLATABLE_HRESULT
 
 
 class ErrorSxsProtectionCatalogFileMissingError(Win32Error):
-    DESCRIPTION = """Assembly Protection Error: The catalog for an assembly is missing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_PROTECTION_CATALOG_FILE_MISSING
 
 
 class ErrorSxsMissingAssemblyIdentityAttributeError(Win32Error):
-    DESCRIPTION = """The supplied assembly identity is missing one or more attributes that must be present in this context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MISSING_ASSEMBLY_IDENTITY_ATTRIBUTE
 
 
 class ErrorSxsInvalidAssemblyIdentityAttributeNameError(Win32Error):
-    DESCRIPTION = """The supplied assembly identity has one or more attribute names that contain characters not permitted in XML names."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INVALID_ASSEMBLY_IDENTITY_ATTRIBUTE_NAME
 
 
 class ErrorSxsAssemblyMissingError(Win32Error):
-    DESCRIPTION = """The referenced assembly could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_ASSEMBLY_MISSING
 
 
 class ErrorSxsCorruptActivationStackError(Win32Error):
-    DESCRIPTION = """The activation context activation stack for the running thread of execution is corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_CORRUPT_ACTIVATION_STACK
 
 
 class ErrorSxsCorruptionError(Win32Error):
-    DESCRIPTION = """The application isolation metadata for this process or thread has become corrupt."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_CORRUPTION
 
 
 class ErrorSxsEarlyDeactivationError(Win32Error):
-    DESCRIPTION = """The activation context being deactivated is not the most recently activated one."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_EARLY_DEACTIVATION
 
 
 class ErrorSxsInvalidDeactivationError(Win32Error):
-    DESCRIPTION = """The activation context being deactivated is not active for the current thread of execution."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INVALID_DEACTIVATION
 
 
 class ErrorSxsMultipleDeactivationError(Win32Error):
-    DESCRIPTION = """The activation context being deactivated has already been deactivated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MULTIPLE_DEACTIVATION
 
 
 class ErrorSxsProcessTerminationRequestedError(Win32Error):
-    DESCRIPTION = """A component used by the isolation facility has requested to terminate the process."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_PROCESS_TERMINATION_REQUESTED
 
 
 class ErrorSxsReleaseActivationOntextError(Win32Error):
-    DESCRIPTION = """A kernel mode component is releasing a reference on an activation context."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_RELEASE_ACTIVATION_ONTEXT
 
 
 class ErrorSxsSystemDefaultActivationContextEmptyError(Win32Error):
-    DESCRIPTION = """The activation context of the system default assembly could not be generated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_SYSTEM_DEFAULT_ACTIVATION_CONTEXT_EMPTY
 
 
 class ErrorSxsInvalidIdentityAttributeValueError(Win32Error):
-    DESCRIPTION = """The value of an attribute in an identity is not within the legal range."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INVALID_IDENTITY_ATTRIBUTE_VALUE
 
 
 class ErrorSxsInvalidIdentityAttributeNameError(Win32Error):
-    DESCRIPTION = """The name of an attribute in an identity is not within the legal range."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INVALID_IDENTITY_ATTRIBUTE_NAME
 
 
 class ErrorSxsIdentityDuplicateAttributeError(Win32Error):
-    DESCRIPTION = """An identity contains two definitions for the same attribute."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_IDENTITY_DUPLICATE_ATTRIBUTE
 
 
 class ErrorSxsIdentityParseErrorError(Win32Error):
-    DESCRIPTION = """The identity string is malformed. This might be due to a trailing comma, more than two unnamed attributes, a missing attribute name, or a missing attribute value."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_IDENTITY_PARSE_ERROR
 
 
 class ErrorMalformedSubstitutionStringError(Win32Error):
-    DESCRIPTION = """A string containing localized substitutable content was malformed. Either a dollar sign ($) was followed by something other than a left parenthesis or another dollar sign, or a substitution's right parenthesis was not found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MALFORMED_SUBSTITUTION_STRING
 
 
 class ErrorSxsIncorrectPublicKeyOkenError(Win32Error):
-    DESCRIPTION = """The public key token does not correspond to the public key specified."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_INCORRECT_PUBLIC_KEY_OKEN
 
 
 class ErrorUnmappedSubstitutionStringError(Win32Error):
-    DESCRIPTION = """A substitution string had no mapping."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_UNMAPPED_SUBSTITUTION_STRING
 
 
 class ErrorSxsAssemblyNotLockedError(Win32Error):
-    DESCRIPTION = """The component must be locked before making the request."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_ASSEMBLY_NOT_LOCKED
 
 
 class ErrorSxsComponentStoreCorruptError(Win32Error):
-    DESCRIPTION = """The component store has been corrupted."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_COMPONENT_STORE_CORRUPT
 
 
 class ErrorAdvancedInstallerFailedError(Win32Error):
-    DESCRIPTION = """An advanced installer failed during setup or servicing."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_ADVANCED_INSTALLER_FAILED
 
 
 class ErrorXmlEncodingMismatchError(Win32Error):
-    DESCRIPTION = """The character encoding in the XML declaration did not match the encoding used in the document."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_XML_ENCODING_MISMATCH
 
 
 class ErrorSxsManifestIdentitySameButContentsDifferentError(Win32Error):
-    DESCRIPTION = """The identities of the manifests are identical, but the contents are different."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MANIFEST_IDENTITY_SAME_BUT_CONTENTS_DIFFERENT
 
 
 class ErrorSxsIdentitiesDifferentError(Win32Error):
-    DESCRIPTION = """The component identities are different."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_IDENTITIES_DIFFERENT
 
 
 class ErrorSxsAssemblyIsNotADeploymentError(Win32Error):
-    DESCRIPTION = """The assembly is not a deployment."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_ASSEMBLY_IS_NOT_A_DEPLOYMENT
 
 
 class ErrorSxsFileNotPartOfAssemblyError(Win32Error):
-    DESCRIPTION = """The file is not a part of the assembly."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_FILE_NOT_PART_OF_ASSEMBLY
 
 
 class ErrorSxsManifestTooBigError(Win32Error):
-    DESCRIPTION = """The size of the manifest exceeds the maximum allowed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_MANIFEST_TOO_BIG
 
 
 class ErrorSxsSettingNotRegisteredError(Win32Error):
-    DESCRIPTION = """The setting is not registered."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_SETTING_NOT_REGISTERED
 
 
 class ErrorSxsTransactionClosureIncompleteError(Win32Error):
-    DESCRIPTION = """One or more required members of the transaction are not present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SXS_TRANSACTION_CLOSURE_INCOMPLETE
 
 
 class ErrorEvtInvalidChannelPathError(Win32Error):
-    DESCRIPTION = """The specified channel path is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_INVALID_CHANNEL_PATH
 
 
 class ErrorEvtInvalidQueryError(Win32Error):
-    DESCRIPTION = """The specified query is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_INVALID_QUERY
 
 
 class ErrorEvtPublisherMetadataNotFoundError(Win32Error):
-    DESCRIPTION = """The publisher metadata cannot be found in the resource."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_PUBLISHER_METADATA_NOT_FOUND
 
 
 class ErrorEvtEventTemplateNotFoundError(Win32Error):
-    DESCRIPTION = """The template for an event definition cannot be found in the resource (error = %1)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_EVENT_TEMPLATE_NOT_FOUND
 
 
 class ErrorEvtInvalidPublisherNameError(Win32Error):
-    DESCRIPTION = """The specified publisher name is invalid."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_INVALID_PUBLISHER_NAME
 
 
 class ErrorEvtInvalidEventDataError(Win32Error):
-    DESCRIPTION = """The event data raised by the publisher is not compatible with the event template definition in the publisher's manifest."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_INVALID_EVENT_DATA
 
 
 class ErrorEvtChannelNotFoundError(Win32Error):
-    DESCRIPTION = """The specified channel could not be found. Check channel configuration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_CHANNEL_NOT_FOUND
 
 
 class ErrorEvtMalformedXmlTextError(Win32Error):
-    DESCRIPTION = """The specified XML text was not well-formed. See extended error for more details."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_MALFORMED_XML_TEXT
 
 
 class ErrorEvtSubscriptionToDirectChannelError(Win32Error):
-    DESCRIPTION = """The caller is trying to subscribe to a direct channel which is not allowed. The events for a direct channel go directly to a log file and cannot be subscribed to."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_SUBSCRIPTION_TO_DIRECT_CHANNEL
 
 
 class ErrorEvtConfigurationErrorError(Win32Error):
-    DESCRIPTION = """Configuration error."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_CONFIGURATION_ERROR
 
 
 class ErrorEvtQueryResultStaleError(Win32Error):
-    DESCRIPTION = """The query result is stale or invalid. This might be due to the log being cleared or rolling over after the query result was created. Users should handle this code by releasing the query result object and reissuing the query."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_QUERY_RESULT_STALE
 
 
 class ErrorEvtQueryResultInvalidPositionError(Win32Error):
-    DESCRIPTION = """Query result is currently at an invalid position."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_QUERY_RESULT_INVALID_POSITION
 
 
 class ErrorEvtNonValidatingMsxmlError(Win32Error):
-    DESCRIPTION = """Registered Microsoft XML (MSXML) does not support validation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_NON_VALIDATING_MSXML
 
 
 class ErrorEvtFilterAlreadyscopedError(Win32Error):
-    DESCRIPTION = """An expression can only be followed by a change-of-scope operation if it itself evaluates to a node set and is not already part of some other change-of-scope operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_ALREADYSCOPED
 
 
 class ErrorEvtFilterNoteltsetError(Win32Error):
-    DESCRIPTION = """Cannot perform a step operation from a term that does not represent an element set."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_NOTELTSET
 
 
 class ErrorEvtFilterInvargError(Win32Error):
-    DESCRIPTION = """Left side arguments to binary operators must be either attributes, nodes, or variables and right side arguments must be constants."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_INVARG
 
 
 class ErrorEvtFilterInvtestError(Win32Error):
-    DESCRIPTION = """A step operation must involve either a node test or, in the case of a predicate, an algebraic expression against which to test each node in the node set identified by the preceding node set can be evaluated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_INVTEST
 
 
 class ErrorEvtFilterInvtypeError(Win32Error):
-    DESCRIPTION = """This data type is currently unsupported."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_INVTYPE
 
 
 class ErrorEvtFilterParseerrError(Win32Error):
-    DESCRIPTION = """A syntax error occurred at position %1!d!"""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_PARSEERR
 
 
 class ErrorEvtFilterUnsupportedopError(Win32Error):
-    DESCRIPTION = """This operator is unsupported by this implementation of the filter."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_UNSUPPORTEDOP
 
 
 class ErrorEvtFilterUnexpectedtokenError(Win32Error):
-    DESCRIPTION = """The token encountered was unexpected."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_UNEXPECTEDTOKEN
 
 
 class ErrorEvtInvalidOperationOverEnabledDirectChannelError(Win32Error):
-    DESCRIPTION = """The requested operation cannot be performed over an enabled direct channel. The channel must first be disabled before performing the requested operation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_INVALID_OPERATION_OVER_ENABLED_DIRECT_CHANNEL
 
 
 class ErrorEvtInvalidChannelPropertyValueError(Win32Error):
-    DESCRIPTION = """Channel property %1!s! contains an invalid value. The value has an invalid type, is outside the valid range, cannot be updated, or is not supported by this type of channel."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_INVALID_CHANNEL_PROPERTY_VALUE
 
 
 class ErrorEvtInvalidPublisherPropertyValueError(Win32Error):
-    DESCRIPTION = """Publisher property %1!s! contains an invalid value. The value has an invalid type, is outside the valid range, cannot be updated, or is not supported by this type of publisher."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_INVALID_PUBLISHER_PROPERTY_VALUE
 
 
 class ErrorEvtChannelCannotActivateError(Win32Error):
-    DESCRIPTION = """The channel fails to activate."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_CHANNEL_CANNOT_ACTIVATE
 
 
 class ErrorEvtFilterTooComplexError(Win32Error):
-    DESCRIPTION = """The xpath expression exceeded supported complexity. Simplify it or split it into two or more simple expressions."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_FILTER_TOO_COMPLEX
 
 
 class ErrorEvtMessageNotFoundError(Win32Error):
-    DESCRIPTION = """The message resource is present but the message is not found in the string or message table."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_MESSAGE_NOT_FOUND
 
 
 class ErrorEvtMessageIdNotFoundError(Win32Error):
-    DESCRIPTION = """The message ID for the desired message could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_MESSAGE_ID_NOT_FOUND
 
 
 class ErrorEvtUnresolvedValueInsertError(Win32Error):
-    DESCRIPTION = """The substitution string for the insert index (%1) could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_UNRESOLVED_VALUE_INSERT
 
 
 class ErrorEvtUnresolvedParameterInsertError(Win32Error):
-    DESCRIPTION = """The description string for the parameter reference (%1) could not be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_UNRESOLVED_PARAMETER_INSERT
 
 
 class ErrorEvtMaxInsertsReachedError(Win32Error):
-    DESCRIPTION = """The maximum number of replacements has been reached."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_MAX_INSERTS_REACHED
 
 
 class ErrorEvtEventDefinitionNotOundError(Win32Error):
-    DESCRIPTION = """The event definition could not be found for the event ID (%1)."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_EVENT_DEFINITION_NOT_OUND
 
 
 class ErrorEvtMessageLocaleNotFoundError(Win32Error):
-    DESCRIPTION = """The locale-specific resource for the desired message is not present."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_MESSAGE_LOCALE_NOT_FOUND
 
 
 class ErrorEvtVersionTooOldError(Win32Error):
-    DESCRIPTION = """The resource is too old to be compatible."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_VERSION_TOO_OLD
 
 
 class ErrorEvtVersionTooNewError(Win32Error):
-    DESCRIPTION = """The resource is too new to be compatible."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_VERSION_TOO_NEW
 
 
 class ErrorEvtCannotOpenChannelOfQueryError(Win32Error):
-    DESCRIPTION = """The channel at index %1 of the query cannot be opened."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_CANNOT_OPEN_CHANNEL_OF_QUERY
 
 
 class ErrorEvtPublisherDisabledError(Win32Error):
-    DESCRIPTION = """The publisher has been disabled and its resource is not available. This usually occurs when the publisher is in the process of being uninstalled or upgraded."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EVT_PUBLISHER_DISABLED
 
 
 class ErrorEcSubscriptionCannotActivateError(Win32Error):
-    DESCRIPTION = """The subscription fails to activate."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EC_SUBSCRIPTION_CANNOT_ACTIVATE
 
 
 class ErrorEcLogDisabledError(Win32Error):
-    DESCRIPTION = """The log of the subscription is in a disabled state and events cannot be forwarded to it. The log must first be enabled before the subscription can be activated."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_EC_LOG_DISABLED
 
 
 class ErrorMuiFileNotFoundError(Win32Error):
-    DESCRIPTION = """The resource loader failed to find the Multilingual User Interface (MUI) file."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_FILE_NOT_FOUND
 
 
 class ErrorMuiInvalidFileError(Win32Error):
-    DESCRIPTION = """The resource loader failed to load the MUI file because the file failed to pass validation."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_INVALID_FILE
 
 
 class ErrorMuiInvalidRcConfigError(Win32Error):
-    DESCRIPTION = """The release candidate (RC) manifest is corrupted with garbage data, is an unsupported version, or is missing a required item."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_INVALID_RC_CONFIG
 
 
 class ErrorMuiInvalidLocaleNameError(Win32Error):
-    DESCRIPTION = """The RC manifest has an invalid culture name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_INVALID_LOCALE_NAME
 
 
 class ErrorMuiInvalidUltimatefallbackNameError(Win32Error):
-    DESCRIPTION = """The RC Manifest has an invalid ultimate fallback name."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_INVALID_ULTIMATEFALLBACK_NAME
 
 
 class ErrorMuiFileNotLoadedError(Win32Error):
-    DESCRIPTION = """The resource loader cache does not have a loaded MUI entry."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_FILE_NOT_LOADED
 
 
 class ErrorResourceEnumUserStopError(Win32Error):
-    DESCRIPTION = """The user stopped resource enumeration."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_RESOURCE_ENUM_USER_STOP
 
 
 class ErrorMuiIntlsettingsUilangNotInstalledError(Win32Error):
-    DESCRIPTION = """User interface language installation failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_INTLSETTINGS_UILANG_NOT_INSTALLED
 
 
 class ErrorMuiIntlsettingsInvalidLocaleNameError(Win32Error):
-    DESCRIPTION = """Locale installation failed."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MUI_INTLSETTINGS_INVALID_LOCALE_NAME
 
 
 class ErrorMcaInvalidCapabilitiesStringError(Win32Error):
-    DESCRIPTION = """The monitor returned a DDC/CI capabilities string that did not comply with the ACCESS.bus 3.0, DDC/CI 1.1, or MCCS 2 Revision 1 specification."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_INVALID_CAPABILITIES_STRING
 
 
 class ErrorMcaInvalidVcpVersionError(Win32Error):
-    DESCRIPTION = """The monitor's VCP version (0xDF) VCP code returned an invalid version value."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_INVALID_VCP_VERSION
 
 
 class ErrorMcaMonitorViolatesMccsSpecificationError(Win32Error):
-    DESCRIPTION = """The monitor does not comply with the MCCS specification it claims to support."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_MONITOR_VIOLATES_MCCS_SPECIFICATION
 
 
 class ErrorMcaMccsVersionMismatchError(Win32Error):
-    DESCRIPTION = """The MCCS version in a monitor's mccs_ver capability does not match the MCCS version the monitor reports when the VCP version (0xDF) VCP code is used."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_MCCS_VERSION_MISMATCH
 
 
 class ErrorMcaUnsupportedMccsVersionError(Win32Error):
-    DESCRIPTION = """The monitor configuration API works only with monitors that support the MCCS 1.0, MCCS 2.0, or MCCS 2.0 Revision 1 specifications."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_UNSUPPORTED_MCCS_VERSION
 
 
 class ErrorMcaInternalErrorError(Win32Error):
-    DESCRIPTION = """An internal monitor configuration API error occurred."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_INTERNAL_ERROR
 
 
 class ErrorMcaInvalidTechnologyTypeReturnedError(Win32Error):
-    DESCRIPTION = """The monitor returned an invalid monitor technology type. CRT, plasma, and LCD (TFT) are examples of monitor technology types. This error implies that the monitor violated the MCCS 2.0 or MCCS 2.0 Revision 1 specification."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_INVALID_TECHNOLOGY_TYPE_RETURNED
 
 
 class ErrorMcaUnsupportedColorTemperatureError(Win32Error):
-    DESCRIPTION = """The SetMonitorColorTemperature() caller passed a color temperature to it that the current monitor did not support. CRT, plasma, and LCD (TFT) are examples of monitor technology types. This error implies that the monitor violated the MCCS 2.0 or MCCS 2.0 Revision 1 specification."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_MCA_UNSUPPORTED_COLOR_TEMPERATURE
 
 
 class ErrorAmbiguousSystemDeviceError(Win32Error):
-    DESCRIPTION = """The requested system device cannot be identified due to multiple indistinguishable devices potentially matching the identification criteria."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_AMBIGUOUS_SYSTEM_DEVICE
 
 
 class ErrorSystemDeviceNotFoundError(Win32Error):
-    DESCRIPTION = """The requested system device cannot be found."""
     WIN32_ERROR_CODE = Win32ErrorCode.ERROR_SYSTEM_DEVICE_NOT_FOUND
 
 
+# `__mro__` is checked rather than using `issubclass`, which would fill the ABC caches of every error class.
 Win32Error.WIN32_ERROR_CODE_TO_ERROR_CLASS = {
     error_class.WIN32_ERROR_CODE: error_class
     for _, error_class in inspect_getmembers(
         sys_modules[__name__],
-        lambda value: inspect_isclass(value) and issubclass(value, Win32Error)
+        lambda value: (
+            inspect_isclass(value) and Win32Error in value.__mro__
+            and value.WIN32_ERROR_CODE is not NotImplemented
+        )
     )
 }
+
+Win32Error.WIN32_ERROR_CODE_INT_TO_ERROR_CLASS = {
+    int(win32_error_code): error_class
+    for win32_error_code, error_class in Win32Error.WIN32_ERROR_CODE_TO_ERROR_CLASS.items()
+}
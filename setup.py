@@ -1,13 +1,38 @@
+from os import environ
 from setuptools import setup, find_packages
 
+# `msdsalgs` and `msdsalgs.accelerator` import only the standard library, so they can be imported before the package
+# is installed.
+from msdsalgs.accelerator import ACCELERATED_MODULES
+
+# The modules compiled into the optional accelerator.
+ACCELERATED_MODULE_PATHS = [f'{module_name.replace(".", "/")}.py' for module_name in ACCELERATED_MODULES]
+
+ext_modules = []
+if environ.get('MSDSALGS_BUILD_ACCELERATOR'):
+    from Cython.Build import cythonize
+
+    # Annotations are not used for typing, as the decoders are annotated with `bytes` but accept any buffer.
+    ext_modules = cythonize(
+        ACCELERATED_MODULE_PATHS,
+        compiler_directives=dict(language_level=3, annotation_typing=False, binding=True)
+    )
+
 setup(
     name='msdsalgs',
     version='0.11',
     packages=find_packages(),
+    package_data={
+        'msdsalgs': ['ntstatus_descriptions.bin', 'win32_error_descriptions.bin']
+    },
+    ext_modules=ext_modules,
     install_requires=[
         'pycryptodome',
         'pyutils @ git+https://github.com/vphpersson/pyutils.git#egg=pyutils',
         'string_utils_py @ git+https://github.com/vphpersson/string_utils_py.git#egg=string_utils_py',
         'ndr @ git+https://github.com/vphpersson/ndr.git#egg=ndr'
-    ]
+    ],
+    extras_require={
+        'numpy': ['numpy']
+    }
 )
@@ -0,0 +1,108 @@
+from json import loads as json_loads, dumps as json_dumps
+from os import environ
+from os.path import dirname, isfile, join
+from subprocess import run
+from sys import executable
+
+from msdsalgs.accelerator import ACCELERATED_MODULES, accelerated_modules
+from msdsalgs.synthetic_corpus import SecurityDescriptorProfile, DirectoryBufferProfile, generate_corpus
+from msdsalgs.fscc.file_information_classes import FileInformationClass, decode_directory_buffer
+from msdsalgs.security_types.acl import ACL
+from msdsalgs.security_types.sid import SID
+from msdsalgs.time import filetime_to_datetime, datetime_to_filetime, dos_date_to_datetime, dos_time_to_timedelta
+
+REPOSITORY_DIRECTORY: str = dirname(dirname(__file__))
+
+SUMMARY_PROGRAM = '''
+from json import dumps
+from tests.test_accelerator import decode_summary, imported_module_files
+print(dumps(dict(summary=decode_summary(), module_files=imported_module_files())))
+'''
+
+
+def _summarize_acl(acl: ACL) -> list:
+    return [
+        (
+            int(ace.header.ace_type),
+            int(ace.header.ace_flags),
+            ace.header.ace_size,
+            int(ace.access_mask),
+            str(ace.trustee_sid),
+            str(getattr(ace, 'object_type', None)),
+            str(getattr(ace, 'inherited_object_type', None)),
+            ace._data().hex()
+        )
+        for ace in acl.aces
+    ]
+
+
+def decode_summary() -> dict:
+    """
+    Decode a corpus with the accelerated modules, summarizing the results in a JSON serializable form.
+    """
+
+    acls = []
+    for data in generate_corpus(SecurityDescriptorProfile(), count=50, seed=0):
+        acl_offset: int = int.from_bytes(data[16:20], byteorder='little')
+        acls.append(_summarize_acl(ACL.from_bytes(memoryview(data)[acl_offset:])))
+
+    entries = []
+    for file_information_class in FileInformationClass:
+        for data in generate_corpus(DirectoryBufferProfile(file_information_class=file_information_class), 3, seed=0):
+            for entry in decode_directory_buffer(file_information_class, data):
+                file_information = getattr(entry, 'file_information', None)
+                entries.append((
+                    entry.file_name,
+                    repr(file_information),
+                    str(file_information.last_write_time) if file_information is not None else None
+                ))
+
+    times = [
+        (
+            str(filetime_to_datetime(filetime)),
+            str(filetime_to_datetime(filetime.to_bytes(8, byteorder='little'))),
+            str(dos_date_to_datetime((i % 128) << 9 | (i % 12 + 1) << 5 | (i % 28 + 1))),
+            str(dos_time_to_timedelta(filetime & 0xFFFF)),
+            datetime_to_filetime(filetime_to_datetime(filetime or 1)).hex()
+        )
+        for i, filetime in enumerate(range(0, 2 ** 61, 2 ** 53 + 12345))
+    ]
+
+    sids = [
+        (str(SID.from_string(sid_string)), bytes(SID.from_string(sid_string)).hex())
+        for sid_string in ('S-1-1-0', 'S-1-5-32-544', 'S-1-5-21-1004336348-1177238915-682003330-512')
+    ]
+
+    return json_loads(json_dumps(dict(acls=acls, entries=entries, times=times, sids=sids)))
+
+
+def imported_module_files() -> dict:
+    from sys import modules
+    return {module_name: modules[module_name].__file__ for module_name in ACCELERATED_MODULES}
+
+
+def test_parity_with_pure_python():
+    result = run(
+        [executable, '-c', SUMMARY_PROGRAM],
+        env={**environ, 'MSDSALGS_NO_ACCELERATOR': '1'},
+        cwd=REPOSITORY_DIRECTORY,
+        check=True,
+        capture_output=True
+    )
+    pure_python = json_loads(result.stdout)
+
+    # The sources are imported even if the accelerator has been built.
+    assert all(module_file.endswith('.py') for module_file in pure_python['module_files'].values())
+
+    assert decode_summary() == pure_python['summary']
+
+
+def test_accelerated_modules():
+    assert set(accelerated_modules()) <= set(ACCELERATED_MODULES)
+
+    # `setup.py` compiles the source file of each of the modules.
+    for module_name in ACCELERATED_MODULES:
+        assert isfile(join(REPOSITORY_DIRECTORY, f'{module_name.replace(".", "/")}.py'))
+
+    for module_name, module_file in imported_module_files().items():
+        assert module_file.endswith('.py') != (module_name in accelerated_modules())
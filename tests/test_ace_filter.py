@@ -0,0 +1,81 @@
+from struct import pack as struct_pack
+from uuid import UUID
+
+from msdsalgs.security_types.ace import ACEType, ActiveDirectoryRightsMask
+from msdsalgs.security_types.ace_filter import ACEFilter, filter_acl, find_aces, find_trustees
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+from msdsalgs.synthetic_corpus import SecurityDescriptorProfile, generate_corpus
+
+from .test_security_descriptor import SECURITY_DESCRIPTOR_BYTES, OBJECT_TYPE, sid_bytes, make_ace, make_acl, \
+    make_security_descriptor_bytes
+
+GENERIC_ALL = ActiveDirectoryRightsMask.ADS_RIGHT_GENERIC_ALL
+OTHER_OBJECT_TYPE = UUID('00299570-246d-11d0-a768-00aa006e0529')
+
+DACL: bytes = make_acl([
+    make_ace(0x00, 0x00, 0x10000000, sid_bytes('S-1-5-32-544')),
+    make_ace(0x00, 0x00, 0x00020094, sid_bytes('S-1-5-11')),
+    make_ace(0x01, 0x00, 0x10000000, sid_bytes('S-1-1-0')),
+    make_ace(0x05, 0x00, 0x00000100, struct_pack('<I', 0x1) + OBJECT_TYPE.bytes_le + sid_bytes('S-1-5-18')),
+    make_ace(0x05, 0x00, 0x10000100, struct_pack('<I', 0x2) + OBJECT_TYPE.bytes_le + sid_bytes('S-1-5-9')),
+    make_ace(0x00, 0x00, 0x10000000, sid_bytes('S-1-5-32-544'))
+])
+
+
+def ace_trustees(aces) -> list:
+    return [str(ace.trustee_sid) for ace in aces]
+
+
+def test_filter_acl():
+    assert ace_trustees(filter_acl(DACL, ACEFilter())) == [
+        'S-1-5-32-544', 'S-1-5-11', 'S-1-1-0', 'S-1-5-18', 'S-1-5-9', 'S-1-5-32-544'
+    ]
+    assert ace_trustees(
+        filter_acl(DACL, ACEFilter(ace_types={ACEType.ACCESS_ALLOWED_ACE_TYPE}, access_mask=GENERIC_ALL))
+    ) == ['S-1-5-32-544', 'S-1-5-32-544']
+    assert ace_trustees(filter_acl(DACL, ACEFilter(access_mask=0x10000100, all_access_mask_bits=True))) == ['S-1-5-9']
+    # The object type of the last object ACE is an inherited object type.
+    assert ace_trustees(filter_acl(DACL, ACEFilter(object_types={OBJECT_TYPE}))) == ['S-1-5-18']
+    assert filter_acl(DACL, ACEFilter(object_types={OTHER_OBJECT_TYPE})) == []
+    assert ace_trustees(filter_acl(DACL, ACEFilter(trustee_sids={'S-1-5-9', 'S-1-1-0'}))) == ['S-1-1-0', 'S-1-5-9']
+
+
+def test_find_trustees():
+    data = make_security_descriptor_bytes(
+        owner=sid_bytes('S-1-5-32-544'),
+        sacl=make_acl([make_ace(0x02, 0x80, 0x10000000, sid_bytes('S-1-5-7'))]),
+        dacl=DACL
+    )
+
+    assert [str(sid) for sid in find_trustees(data, ACEFilter(access_mask=GENERIC_ALL))] == [
+        'S-1-5-32-544', 'S-1-1-0', 'S-1-5-9'
+    ]
+    assert [str(sid) for sid in find_trustees(data, ACEFilter(access_mask=GENERIC_ALL), dacl=False, sacl=True)] == [
+        'S-1-5-7'
+    ]
+
+
+def test_find_aces_matches_full_decoding():
+    ace_filter = ACEFilter(
+        ace_types={ACEType.ACCESS_ALLOWED_ACE_TYPE, ACEType.ACCESS_ALLOWED_OBJECT_ACE_TYPE},
+        access_mask=0x00000030
+    )
+
+    for data in [SECURITY_DESCRIPTOR_BYTES, *generate_corpus(SecurityDescriptorProfile(), count=50, seed=0)]:
+        security_descriptor = SecurityDescriptor.from_bytes(data)
+        expected = [
+            bytes(ace) for ace in security_descriptor.dacl.aces
+            if ace.header.ace_type in ace_filter.ace_types and int(ace.access_mask) & 0x00000030
+        ] if security_descriptor.dacl is not None else []
+
+        assert [bytes(ace) for ace in find_aces(data, ace_filter)] == expected
+
+
+def test_filter_acl_skips_unsupported_ace_types():
+    # ACEs of types that cannot be decoded are skipped when they do not match.
+    data = make_acl([
+        make_ace(0x03, 0x00, 0x10000000, sid_bytes('S-1-1-0')),
+        make_ace(0x00, 0x00, 0x10000000, sid_bytes('S-1-5-18'))
+    ])
+
+    assert ace_trustees(filter_acl(data, ACEFilter(ace_types={ACEType.ACCESS_ALLOWED_ACE_TYPE}))) == ['S-1-5-18']
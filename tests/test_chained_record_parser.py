@@ -0,0 +1,115 @@
+from asyncio import run as asyncio_run, StreamReader
+from struct import pack as struct_pack
+from typing import List
+
+from pytest import raises as pytest_raises
+
+from msdsalgs.utils import extract_elements
+from msdsalgs.fscc.chained_record_parser import ChainedRecordParser, IncompleteChainedRecordsError
+from msdsalgs.fscc.file_notify_information import FileNotifyInformation, FileNotifyAction
+from msdsalgs.fscc.file_information_classes import FileIdFullDirectoryInformation
+
+
+def make_file_id_full_directory_information_buffer(file_names: List[str]) -> bytes:
+    records: List[bytes] = []
+    for i, file_name in enumerate(file_names):
+        file_name_bytes: bytes = file_name.encode(encoding='utf-16-le')
+        record_len: int = 80 + len(file_name_bytes)
+        padding: bytes = b'\x00' * (-record_len % 8)
+        records.append(
+            b''.join([
+                struct_pack('<II', 0 if i == len(file_names) - 1 else record_len + len(padding), i),
+                struct_pack('<QQQQQQI', 1, 2, 3, 4, 100 + i, 4096, 0x20),
+                struct_pack('<III', len(file_name_bytes), 0, 0),
+                struct_pack('<Q', 1000 + i),
+                file_name_bytes,
+                padding
+            ])
+        )
+
+    return b''.join(records)
+
+
+def make_file_notify_information_buffer(file_names: List[str]) -> bytes:
+    records: List[bytes] = []
+    for i, file_name in enumerate(file_names):
+        file_name_bytes: bytes = file_name.encode(encoding='utf-16-le')
+        record_len: int = 12 + len(file_name_bytes)
+        padding: bytes = b'\x00' * (-record_len % 4)
+        next_entry_offset: int = 0 if i == len(file_names) - 1 else record_len + len(padding)
+        records.append(
+            struct_pack('<III', next_entry_offset, FileNotifyAction.FILE_ACTION_MODIFIED, len(file_name_bytes))
+            + file_name_bytes
+            + padding
+        )
+
+    return b''.join(records)
+
+
+def parse_all(record_class, data: bytes):
+    return extract_elements(
+        data=data,
+        create_element=record_class.from_bytes,
+        get_next_offset=lambda record: record.next_entry_offset
+    )
+
+
+def test_feed_byte_by_byte():
+    data = make_file_id_full_directory_information_buffer(['.', '..', 'a.txt', 'directory', 'ü.bin'])
+    parser = ChainedRecordParser(record_class=FileIdFullDirectoryInformation)
+
+    records = []
+    for i in range(len(data)):
+        records.extend(parser.feed(data[i:i+1]))
+
+    assert parser.finished
+    assert records == parse_all(FileIdFullDirectoryInformation, data)
+    assert records[3].file_id == struct_pack('<Q', 1003)
+
+
+def test_feed_unused_data():
+    data = make_file_notify_information_buffer(['a', 'bb'])
+    parser = ChainedRecordParser(record_class=FileNotifyInformation)
+
+    records = parser.feed(data + b'\x01\x02')
+
+    assert [record.file_name for record in records] == ['a', 'bb']
+    assert parser.finished
+    assert parser.unused_data == b'\x01\x02'
+
+
+def test_close_incomplete():
+    data = make_file_notify_information_buffer(['a', 'bb'])
+    parser = ChainedRecordParser(record_class=FileNotifyInformation)
+
+    assert len(parser.feed(data[:-1])) == 1
+
+    with pytest_raises(IncompleteChainedRecordsError):
+        parser.close()
+
+
+def test_records_from_stream_reader():
+    data = make_file_notify_information_buffer([f'file_{i}' for i in range(100)])
+
+    async def parse():
+        stream = StreamReader()
+        for i in range(0, len(data), 7):
+            stream.feed_data(data[i:i+7])
+        stream.feed_eof()
+
+        return [record async for record in ChainedRecordParser(FileNotifyInformation).records(stream, chunk_size=5)]
+
+    assert asyncio_run(parse()) == parse_all(FileNotifyInformation, data)
+
+
+def test_records_from_async_iterable():
+    data = make_file_id_full_directory_information_buffer(['x', 'y', 'z'])
+
+    async def chunks():
+        for i in range(0, len(data), 50):
+            yield data[i:i+50]
+
+    async def parse():
+        return [record async for record in ChainedRecordParser(FileIdFullDirectoryInformation).records(chunks())]
+
+    assert asyncio_run(parse()) == parse_all(FileIdFullDirectoryInformation, data)
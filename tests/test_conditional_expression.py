@@ -0,0 +1,211 @@
+from struct import pack as struct_pack
+
+from pytest import raises
+
+from msdsalgs.security_types.ace import ACE, ACEType
+from msdsalgs.security_types.conditional_expression import ConditionalContext, ConditionalResult, \
+    ConditionalExpressionError, compile_conditional_expression, evaluate_ace_condition, ace_applies, \
+    ClaimSecurityAttribute, ClaimSecurityAttributeFlag, parse_claim_security_attribute, resource_attributes_from_acl
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+from msdsalgs.security_types.sid import SID
+from msdsalgs.synthetic_corpus import SecurityDescriptorProfile, generate_corpus
+
+from .test_security_descriptor import sid_bytes, make_ace, make_acl, make_security_descriptor_bytes
+
+TRUE, FALSE, UNKNOWN = ConditionalResult.TRUE, ConditionalResult.FALSE, ConditionalResult.UNKNOWN
+
+CALLBACK_ACE_TYPES = {ACEType.ACCESS_ALLOWED_CALLBACK_ACE_TYPE, ACEType.ACCESS_DENIED_CALLBACK_ACE_TYPE}
+
+
+def attribute(token: int, name: str) -> bytes:
+    name_bytes = name.encode(encoding='utf-16-le')
+    return struct_pack('<BI', token, len(name_bytes)) + name_bytes
+
+
+def user(name: str) -> bytes:
+    return attribute(0xF9, name)
+
+
+def resource(name: str) -> bytes:
+    return attribute(0xFA, name)
+
+
+def integer(value: int) -> bytes:
+    return struct_pack('<BqBB', 0x04, value, 0x03, 0x02)
+
+
+def string(value: str) -> bytes:
+    return attribute(0x10, value)
+
+
+def sid(sid_string: str) -> bytes:
+    data = sid_bytes(sid_string)
+    return struct_pack('<BI', 0x51, len(data)) + data
+
+
+def composite(*elements: bytes) -> bytes:
+    data = b''.join(elements)
+    return struct_pack('<BI', 0x50, len(data)) + data
+
+
+def expression(*tokens) -> bytes:
+    return b'artx' + b''.join(bytes((token,)) if isinstance(token, int) else token for token in tokens)
+
+
+def evaluate(data: bytes, **context_kwargs) -> ConditionalResult:
+    return compile_conditional_expression(data).evaluate(ConditionalContext(**context_kwargs))
+
+
+def test_relational_operators():
+    # (@User.Department == "Sales")
+    department_is_sales = expression(user('Department'), string('Sales'), 0x80)
+
+    assert evaluate(department_is_sales, user_claims={'department': 'SALES'}) is TRUE
+    assert evaluate(department_is_sales, user_claims={'Department': 'Finance'}) is FALSE
+    assert evaluate(department_is_sales) is UNKNOWN
+    assert evaluate(department_is_sales, user_claims={'Department': 1}) is UNKNOWN
+
+    # (@User.Clearance >= 3)
+    clearance = expression(user('Clearance'), integer(3), 0x85)
+    assert evaluate(clearance, user_claims={'Clearance': 3}) is TRUE
+    assert evaluate(clearance, user_claims={'Clearance': 2}) is FALSE
+    assert evaluate(clearance, user_claims={'Clearance': [2, 4]}) is UNKNOWN
+
+    # (@User.Project Any_of {"A", "B"}) and (@User.Project Contains {"A", "B"})
+    assert evaluate(expression(user('Project'), composite(string('A'), string('B')), 0x88), user_claims={
+        'Project': ['b', 'c']
+    }) is TRUE
+    assert evaluate(expression(user('Project'), composite(string('A'), string('B')), 0x86), user_claims={
+        'Project': ['b', 'c']
+    }) is FALSE
+
+
+def test_logical_operators():
+    # (@User.Department == "Sales" && !(@User.Clearance < 3)) || Exists @User.Override
+    data = expression(
+        user('Department'), string('Sales'), 0x80,
+        user('Clearance'), integer(3), 0x82, 0xA2,
+        0xA0,
+        user('Override'), 0x87,
+        0xA1,
+        # The padding of the ACE.
+        bytes(3)
+    )
+
+    assert evaluate(data, user_claims={'Department': 'Sales', 'Clearance': 5}) is TRUE
+    assert evaluate(data, user_claims={'Department': 'Sales', 'Clearance': 1}) is FALSE
+    assert evaluate(data, user_claims={'Department': 'Sales', 'Override': True}) is TRUE
+    # Without the clearance, the conjunction is unknown, as is its disjunction with a false operand.
+    assert evaluate(data, user_claims={'Department': 'Sales'}) is UNKNOWN
+    assert evaluate(data, user_claims={'Department': 'Finance'}) is FALSE
+    assert evaluate(expression(user('Department'), string('Sales'), 0x80, user('Clearance'), 0xA0), user_claims={
+        'Department': 'Sales'
+    }) is UNKNOWN
+
+
+def test_member_of():
+    member_of = expression(composite(sid('S-1-5-32-544'), sid('S-1-5-11')), 0x89)
+    member_of_any = expression(composite(sid('S-1-5-32-544'), sid('S-1-5-11')), 0x8B)
+
+    assert evaluate(member_of, user_sids=['S-1-5-32-544', 'S-1-5-11', 'S-1-1-0']) is TRUE
+    assert evaluate(member_of, user_sids=[SID.from_string('S-1-5-11')]) is FALSE
+    assert evaluate(member_of_any, user_sids=['S-1-5-11']) is TRUE
+    assert evaluate(expression(sid('S-1-5-11'), 0x8A), user_sids=['S-1-5-11']) is FALSE
+    assert evaluate(expression(sid('S-1-5-11'), 0x90), user_sids=['S-1-5-11']) is FALSE
+
+
+def test_resource_attributes():
+    for data in generate_corpus(SecurityDescriptorProfile(sacl_probability=1.0, num_sacl_aces=(4, 4)), 20, seed=0):
+        sacl = SecurityDescriptor.from_bytes(data).sacl
+        resource_attributes = resource_attributes_from_acl(sacl)
+
+        for name, attribute in resource_attributes.items():
+            values = attribute.values
+            # (@Resource.<name> == <the first value>)
+            literal = integer(values[0]) if isinstance(values[0], int) else string(values[0])
+            assert evaluate(
+                expression(resource(name), literal, 0x80 if len(values) == 1 else 0x88),
+                resource_attributes=resource_attributes
+            ) is TRUE
+
+    name_bytes = 'Secrecy'.encode(encoding='utf-16-le') + b'\x00\x00'
+    data = struct_pack('<IHHII2I', 24, 0x0001, 0, 0x0003, 2, 24 + len(name_bytes), 32 + len(name_bytes)) + name_bytes \
+        + struct_pack('<qq', -1, 3)
+    assert parse_claim_security_attribute(data) == ClaimSecurityAttribute(
+        name='Secrecy',
+        values=(-1, 3),
+        flags=ClaimSecurityAttributeFlag.NON_INHERITABLE | ClaimSecurityAttributeFlag.VALUE_CASE_SENSITIVE
+    )
+
+
+def test_case_sensitive_attributes():
+    department_is_sales = expression(resource('Department'), string('Sales'), 0x80)
+    case_sensitive = ClaimSecurityAttributeFlag.VALUE_CASE_SENSITIVE
+
+    assert evaluate(department_is_sales, resource_attributes={
+        'Department': ClaimSecurityAttribute(name='Department', values=('SALES',))
+    }) is TRUE
+    assert evaluate(department_is_sales, resource_attributes={
+        'Department': ClaimSecurityAttribute(name='Department', values=('SALES',), flags=case_sensitive)
+    }) is FALSE
+    assert evaluate(department_is_sales, resource_attributes={
+        'Department': ClaimSecurityAttribute(name='Department', values=('Sales',), flags=case_sensitive)
+    }) is TRUE
+
+    # A case-sensitive operand makes the comparison case-sensitive, whichever side it is on.
+    projects = expression(user('Project'), resource('Project'), 0x88)
+    assert evaluate(projects, user_claims={'Project': ['a']}, resource_attributes={'Project': ['A', 'B']}) is TRUE
+    assert evaluate(projects, user_claims={'Project': ['a']}, resource_attributes={
+        'Project': ClaimSecurityAttribute(name='Project', values=('A', 'B'), flags=case_sensitive)
+    }) is FALSE
+    assert evaluate(expression(resource('Project'), string('b'), 0x84), resource_attributes={
+        'Project': ClaimSecurityAttribute(name='Project', values=('B',), flags=case_sensitive)
+    }) is FALSE
+
+    # The flags of the resource attribute ACEs of a SACL are kept.
+    name_bytes = 'Department'.encode(encoding='utf-16-le') + b'\x00\x00'
+    value_bytes = 'SALES'.encode(encoding='utf-16-le') + b'\x00\x00'
+    attribute_data = struct_pack('<IHHIII', 20, 0x0003, 0, 0x0002, 1, 20 + len(name_bytes)) + name_bytes + value_bytes
+    sacl = SecurityDescriptor.from_bytes(make_security_descriptor_bytes(
+        owner=sid_bytes('S-1-5-18'),
+        sacl=make_acl([make_ace(0x12, 0x00, 0x0, sid_bytes('S-1-1-0') + attribute_data)])
+    )).sacl
+    assert evaluate(department_is_sales, resource_attributes=resource_attributes_from_acl(sacl)) is FALSE
+
+
+def test_callback_aces():
+    condition = expression(user('Department'), string('Sales'), 0x80)
+    allowed = ACE.from_bytes(make_ace(0x09, 0x00, 0x1, sid_bytes('S-1-1-0') + condition))
+    denied = ACE.from_bytes(make_ace(0x0A, 0x00, 0x1, sid_bytes('S-1-1-0') + condition))
+
+    assert evaluate_ace_condition(allowed, ConditionalContext(user_claims={'Department': 'Sales'})) is TRUE
+    assert not ace_applies(allowed, ConditionalContext())
+    # An access-denied ACE whose expression is unknown applies.
+    assert ace_applies(denied, ConditionalContext())
+
+    # The compiled expression is cached.
+    assert compile_conditional_expression(allowed.application_data) is compile_conditional_expression(condition)
+
+    for data in generate_corpus(SecurityDescriptorProfile(), count=50, seed=0):
+        for ace in SecurityDescriptor.from_bytes(data).dacl.aces:
+            if ace.header.ace_type in CALLBACK_ACE_TYPES:
+                assert evaluate_ace_condition(ace, ConditionalContext()) in {FALSE, UNKNOWN}
+
+
+def test_malformed_expressions():
+    with raises(ConditionalExpressionError):
+        compile_conditional_expression(b'xxxx')
+    with raises(ConditionalExpressionError):
+        compile_conditional_expression(expression(user('Department'), 0x80))
+    with raises(ConditionalExpressionError):
+        compile_conditional_expression(expression(user('Department'), string('Sales')))
+    with raises(ConditionalExpressionError):
+        compile_conditional_expression(expression(0xFF))
+    with raises(ConditionalExpressionError):
+        compile_conditional_expression(expression(user('Department'), string('Sales'), 0x80, integer(1), 0x80))
+    # The operand of `Exists` and `Not_Exists` must be an attribute.
+    for token in (0x87, 0x8D):
+        with raises(ConditionalExpressionError):
+            compile_conditional_expression(expression(integer(1), token))
+        with raises(ConditionalExpressionError):
+            compile_conditional_expression(expression(user('Department'), string('Sales'), 0x80, token))
@@ -0,0 +1,54 @@
+from pytest import raises as pytest_raises
+
+from msdsalgs.description_store import DescriptionStore, write_description_store, BadDescriptionStoreError
+from msdsalgs.description_store_generation import DESCRIPTION_STORE_SPECS, read_descriptions
+from msdsalgs.ntstatus_value import StatusAccessDeniedError, NTStatusValueError, StatusFwpTooManyCalloutsError, \
+    StatusFwpTooManyBoottimeFiltersError
+from msdsalgs.win32_error import ErrorAccessDeniedError
+
+
+def test_round_trip(tmp_path):
+    key_to_description = {f'Key{index}': f'Description {index % 7}' for index in range(200)}
+    path = tmp_path / 'descriptions.bin'
+    write_description_store(path=path, key_to_description=key_to_description, block_size=16)
+
+    store = DescriptionStore.from_path(path=path)
+    assert len(store) == 200
+    assert store.num_descriptions == 7
+    assert dict(store.items()) == key_to_description
+    assert store.description('Key150') == 'Description 3'
+    assert store.description('Missing') is None
+    assert 'Key0' in store and 'Key' not in store
+
+
+def test_bad_store():
+    with pytest_raises(BadDescriptionStoreError):
+        DescriptionStore(data=b'\x00' * 32)
+
+
+def test_stored_descriptions():
+    assert StatusAccessDeniedError.DESCRIPTION.startswith('{Access Denied}')
+    assert str(StatusAccessDeniedError()) == StatusAccessDeniedError.DESCRIPTION
+    assert str(StatusAccessDeniedError(description='Custom.')) == 'Custom.'
+    assert str(ErrorAccessDeniedError()) == 'Access is denied.'
+    assert NTStatusValueError.DESCRIPTION is NotImplemented
+
+    # The classes of an aliased value keep their own descriptions.
+    assert StatusFwpTooManyCalloutsError.DESCRIPTION != StatusFwpTooManyBoottimeFiltersError.DESCRIPTION
+
+
+def test_subclass_inherits_description():
+    class SubStatusAccessDeniedError(StatusAccessDeniedError):
+        pass
+
+    class SubNTStatusValueError(NTStatusValueError):
+        pass
+
+    assert SubStatusAccessDeniedError.DESCRIPTION == StatusAccessDeniedError.DESCRIPTION
+    assert str(SubStatusAccessDeniedError()) == StatusAccessDeniedError.DESCRIPTION
+    assert SubNTStatusValueError.DESCRIPTION is NotImplemented
+
+
+def test_stores_are_up_to_date():
+    for spec in DESCRIPTION_STORE_SPECS:
+        assert dict(DescriptionStore.from_path(spec.store_path).items()) == read_descriptions(spec)
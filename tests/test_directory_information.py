@@ -0,0 +1,123 @@
+from struct import pack as struct_pack, pack_into as struct_pack_into
+from typing import List
+
+from msdsalgs.utils import extract_elements
+from msdsalgs.fscc.file_information_classes import FileInformationClass, FILE_INFORMATION_CLASS_TO_DECODER, \
+    decode_directory_buffer, FileBothDirectoryInformation, FileIdBothDirectoryInformation, \
+    FileIdExtdDirectoryInformation, FileNamesInformation
+
+# The times, `EndOfFile`, `AllocationSize` and `FileAttributes`.
+FILE_INFORMATION_FIELDS = (1, 2, 3, 4, 100, 4096, 0x20)
+
+
+def make_entry(file_information_class: FileInformationClass, file_index: int, file_name: str) -> bytes:
+    file_name_bytes: bytes = file_name.encode(encoding='utf-16-le')
+    short_name_bytes: bytes = f'S~{file_index}'.encode(encoding='utf-16-le')
+    file_id: bytes = struct_pack('<Q', 1000 + file_index)
+
+    if file_information_class is FileInformationClass.FileNamesInformation:
+        return struct_pack('<III', 0, file_index, len(file_name_bytes)) + file_name_bytes
+
+    fixed: bytes = struct_pack('<IIQQQQQQII', 0, file_index, *FILE_INFORMATION_FIELDS, len(file_name_bytes))
+
+    return fixed + {
+        FileInformationClass.FileDirectoryInformation: b'',
+        FileInformationClass.FileFullDirectoryInformation: struct_pack('<I', 7),
+        FileInformationClass.FileIdFullDirectoryInformation: struct_pack('<I4x8s', 7, file_id),
+        FileInformationClass.FileBothDirectoryInformation: struct_pack(
+            '<IBx24s', 7, len(short_name_bytes), short_name_bytes
+        ),
+        FileInformationClass.FileIdBothDirectoryInformation: struct_pack(
+            '<IBx24s2x8s', 7, len(short_name_bytes), short_name_bytes, file_id
+        ),
+        FileInformationClass.FileIdExtdDirectoryInformation: struct_pack('<II16s', 7, 0xA000000C, file_id * 2),
+    }[file_information_class] + file_name_bytes
+
+
+def make_directory_buffer(file_information_class: FileInformationClass, file_names: List[str]) -> bytes:
+    entries: List[bytes] = []
+    for i, file_name in enumerate(file_names):
+        entry: bytes = make_entry(file_information_class=file_information_class, file_index=i, file_name=file_name)
+        entry += b'\x00' * (-len(entry) % 8)
+        if i != len(file_names) - 1:
+            entry = struct_pack('<I', len(entry)) + entry[4:]
+        entries.append(entry)
+
+    return b''.join(entries)
+
+
+def test_registry_complete():
+    assert set(FILE_INFORMATION_CLASS_TO_DECODER) == set(FileInformationClass)
+
+    for file_information_class, decoder in FILE_INFORMATION_CLASS_TO_DECODER.items():
+        assert decoder.__name__ == file_information_class.name
+        assert decoder._STRUCT.size == decoder.structure_size
+
+
+def test_decode_directory_buffer():
+    file_names = ['.', '..', 'a.txt', 'Ünïcode directory']
+
+    for file_information_class in FileInformationClass:
+        data = make_directory_buffer(file_information_class=file_information_class, file_names=file_names)
+
+        entries = decode_directory_buffer(file_information_class, data)
+
+        assert [entry.file_name for entry in entries] == file_names
+        assert [entry.file_index for entry in entries] == list(range(len(file_names)))
+        assert entries == extract_elements(
+            data=data,
+            create_element=FILE_INFORMATION_CLASS_TO_DECODER[file_information_class].from_bytes,
+            get_next_offset=lambda entry: entry.next_entry_offset
+        )
+
+        if not isinstance(entries[0], FileNamesInformation):
+            assert entries[2].file_information.endof_file == 100
+            assert entries[2].file_information.allocation_size == 4096
+            assert entries[2].file_information.file_attributes.archive
+
+
+def test_decode_directory_buffer_specific_fields():
+    both_entry = decode_directory_buffer(
+        FileInformationClass.FileBothDirectoryInformation,
+        make_directory_buffer(FileInformationClass.FileBothDirectoryInformation, ['long file name.txt'])
+    )[0]
+    assert isinstance(both_entry, FileBothDirectoryInformation)
+    assert both_entry.short_name == 'S~0' and both_entry.ea_size == 7
+
+    id_both_entry = decode_directory_buffer(
+        FileInformationClass.FileIdBothDirectoryInformation,
+        make_directory_buffer(FileInformationClass.FileIdBothDirectoryInformation, ['a', 'b'])
+    )[1]
+    assert isinstance(id_both_entry, FileIdBothDirectoryInformation)
+    assert id_both_entry.short_name == 'S~1' and id_both_entry.file_id == struct_pack('<Q', 1001)
+
+    id_extd_entry = decode_directory_buffer(
+        FileInformationClass.FileIdExtdDirectoryInformation,
+        make_directory_buffer(FileInformationClass.FileIdExtdDirectoryInformation, ['a'])
+    )[0]
+    assert isinstance(id_extd_entry, FileIdExtdDirectoryInformation)
+    assert id_extd_entry.reparse_point_tag == 0xA000000C and len(id_extd_entry.file_id) == 16
+
+
+def test_decode_directory_buffer_spec_offsets():
+    file_name_bytes: bytes = 'a.txt'.encode(encoding='utf-16-le')
+    data = bytearray(80 + len(file_name_bytes))
+    # The offsets of `FileIdFullDirectoryInformation` in [MS-FSCC] 2.4.18.
+    struct_pack_into('<Q', data, 8, 1)
+    struct_pack_into('<Q', data, 40, 100)
+    struct_pack_into('<Q', data, 48, 4096)
+    struct_pack_into('<I', data, 56, 0x20)
+    struct_pack_into('<I', data, 60, len(file_name_bytes))
+    struct_pack_into('<Q', data, 72, 1000)
+    data[80:] = file_name_bytes
+
+    entry, = decode_directory_buffer(FileInformationClass.FileIdFullDirectoryInformation, bytes(data))
+
+    assert entry.file_information.endof_file == 100
+    assert entry.file_information.allocation_size == 4096
+    assert entry.file_information.file_attributes.archive
+    assert entry.file_id == struct_pack('<Q', 1000) and entry.file_name == 'a.txt'
+
+
+def test_decode_directory_buffer_empty():
+    assert decode_directory_buffer(FileInformationClass.FileNamesInformation, b'') == []
@@ -0,0 +1,92 @@
+from pytest import raises as pytest_raises
+
+from msdsalgs.fscc.file_information_classes import FileInformationClass, decode_directory_buffer
+from msdsalgs.fscc.directory_listing_cache import DirectoryListingCache, DirectoryListingCacheWriter, \
+    BadDirectoryListingCacheError
+
+from .test_directory_information import make_directory_buffer
+
+
+def test_write_and_read(tmp_path):
+    cache_path = tmp_path / 'listings.cache'
+
+    root_data = make_directory_buffer(FileInformationClass.FileIdFullDirectoryInformation, ['.', '..', 'dir', 'a'])
+    dir_data = make_directory_buffer(FileInformationClass.FileNamesInformation, ['.', '..', 'ö.txt'])
+
+    with DirectoryListingCacheWriter(cache_path) as writer:
+        writer.append('\\', FileInformationClass.FileIdFullDirectoryInformation, root_data)
+        writer.append('\\dir', FileInformationClass.FileNamesInformation, dir_data)
+        writer.append('\\empty', FileInformationClass.FileNamesInformation, b'')
+
+    with DirectoryListingCache(cache_path) as cache:
+        assert list(cache) == ['\\', '\\dir', '\\empty']
+        assert cache.file_information_class('\\dir') is FileInformationClass.FileNamesInformation
+        assert list(cache.entries('\\')) == decode_directory_buffer(
+            FileInformationClass.FileIdFullDirectoryInformation,
+            root_data
+        )
+        assert [entry.file_name for entry in cache.entries('\\dir')] == ['.', '..', 'ö.txt']
+        assert list(cache.entries('\\empty')) == []
+
+        with cache.raw_buffer('\\dir') as raw_buffer:
+            assert raw_buffer == dir_data
+
+
+def test_refresh(tmp_path):
+    cache_path = tmp_path / 'listings.cache'
+
+    with DirectoryListingCacheWriter(cache_path) as writer:
+        writer.append('\\', FileInformationClass.FileNamesInformation, make_directory_buffer(
+            FileInformationClass.FileNamesInformation, ['a']
+        ))
+
+        with DirectoryListingCache(cache_path) as cache:
+            assert len(cache) == 1
+
+            writer.append('\\', FileInformationClass.FileNamesInformation, make_directory_buffer(
+                FileInformationClass.FileNamesInformation, ['a', 'b']
+            ))
+            writer.append('\\b', FileInformationClass.FileNamesInformation, b'')
+
+            cache.refresh()
+
+            assert len(cache) == 2
+            assert [entry.file_name for entry in cache.entries('\\')] == ['a', 'b']
+
+
+def test_refresh_releases_replaced_mappings(tmp_path):
+    cache_path = tmp_path / 'listings.cache'
+
+    with DirectoryListingCacheWriter(cache_path) as writer:
+        writer.append('\\a', FileInformationClass.FileNamesInformation, b'')
+
+        with DirectoryListingCache(cache_path) as cache:
+            first_mmap = cache._mmap
+            # A refresh without new records keeps the mapping.
+            cache.refresh()
+            assert cache._mmap is first_mmap
+
+            writer.append('\\b', FileInformationClass.FileNamesInformation, b'')
+            cache.refresh()
+            assert first_mmap.closed
+
+            second_mmap = cache._mmap
+            raw_buffer = cache.raw_buffer('\\b')
+            writer.append('\\c', FileInformationClass.FileNamesInformation, b'')
+            cache.refresh()
+            # The replaced mapping is kept until the buffer referring to it is released.
+            assert not second_mmap.closed
+
+            raw_buffer.release()
+            writer.append('\\d', FileInformationClass.FileNamesInformation, b'')
+            cache.refresh()
+            assert second_mmap.closed
+            assert list(cache) == ['\\a', '\\b', '\\c', '\\d']
+
+
+def test_bad_file(tmp_path):
+    cache_path = tmp_path / 'not.cache'
+    cache_path.write_bytes(b'something else')
+
+    with pytest_raises(BadDirectoryListingCacheError):
+        DirectoryListingCache(cache_path)
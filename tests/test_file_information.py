@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from struct import pack as struct_pack
+
+from msdsalgs.fscc.file_information import FileInformation
+
+# 2020-01-01 00:00:00 UTC
+FILETIME = 132223104000000000
+
+DATA = struct_pack('<QQQQQQI', FILETIME, FILETIME + 10, 0, FILETIME, 4096, 100, 0x22)
+
+
+def test_from_bytes():
+    file_information = FileInformation.from_bytes(b'\xff' * 8 + DATA + b'\xff' * 8, base_offset=8)
+
+    assert file_information.creation_time == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert file_information.last_access_time == datetime(2020, 1, 1, 0, 0, 0, 1, tzinfo=timezone.utc)
+    assert file_information.last_write_time is None
+    assert file_information.allocation_size == 4096
+    assert file_information.endof_file == 100
+    assert file_information.file_attributes.hidden and file_information.file_attributes.archive
+    assert int(file_information.file_attributes) == 0x22
+
+
+def test_timestamps_memoized():
+    file_information = FileInformation.from_bytes(DATA)
+
+    assert file_information.creation_time is file_information.creation_time
+    assert file_information.last_write_time is None
+
+
+def test_bytes():
+    assert bytes(FileInformation.from_bytes(DATA)) == DATA
+    assert len(FileInformation.from_bytes(DATA)) == len(DATA)
+
+
+def test_pack_into():
+    buffer = bytearray(4 + len(DATA))
+    FileInformation.from_bytes(DATA).pack_into(buffer, offset=4)
+
+    assert buffer == b'\x00' * 4 + DATA
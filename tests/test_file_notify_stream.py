@@ -0,0 +1,103 @@
+from struct import pack as struct_pack
+from typing import List, Tuple
+
+from pytest import raises
+
+from msdsalgs.fscc.file_notify_information import FileNotifyInformation, FileNotifyAction
+from msdsalgs.fscc.file_notify_stream import iter_file_notify_information, FileNotifyCoalescer
+
+ADDED = FileNotifyAction.FILE_ACTION_ADDED
+REMOVED = FileNotifyAction.FILE_ACTION_REMOVED
+MODIFIED = FileNotifyAction.FILE_ACTION_MODIFIED
+RENAMED_OLD_NAME = FileNotifyAction.FILE_ACTION_RENAMED_OLD_NAME
+RENAMED_NEW_NAME = FileNotifyAction.FILE_ACTION_RENAMED_NEW_NAME
+
+
+def make_notify_buffer(events: List[Tuple[FileNotifyAction, str]]) -> bytes:
+    records: List[bytes] = []
+    for i, (action, file_name) in enumerate(events):
+        file_name_bytes: bytes = file_name.encode(encoding='utf-16-le')
+        record_len: int = 12 + len(file_name_bytes)
+        padding: bytes = b'\x00' * (-record_len % 4)
+        next_entry_offset: int = 0 if i == len(events) - 1 else record_len + len(padding)
+        records.append(struct_pack('<III', next_entry_offset, action, len(file_name_bytes)) + file_name_bytes + padding)
+
+    return b''.join(records)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_iter_file_notify_information():
+    events = [(ADDED, 'a.txt'), (MODIFIED, 'dir\\long_file_name.docx'), (REMOVED, 'b')]
+    data = make_notify_buffer(events)
+
+    records = list(iter_file_notify_information(data))
+
+    assert [(record.action, record.file_name) for record in records] == events
+    assert records[0].to_file_notify_information() == FileNotifyInformation.from_bytes(data)
+    assert records[-1].next_entry_offset == 0
+
+
+def test_iter_file_notify_information_truncated_file_name():
+    data = struct_pack('<III', 0, ADDED, 3) + 'ab'.encode(encoding='utf-16-le')[:3] + b'\x00'
+
+    record, = iter_file_notify_information(data)
+
+    with raises(UnicodeDecodeError):
+        record.file_name
+
+
+def test_iter_file_notify_information_empty():
+    assert list(iter_file_notify_information(b'')) == []
+
+
+def test_coalescer():
+    clock = FakeClock()
+    coalescer = FileNotifyCoalescer(window=1.0, clock=clock)
+
+    coalescer.feed(make_notify_buffer([(ADDED, 'a'), (MODIFIED, 'a'), (MODIFIED, 'b'), (MODIFIED, 'a')]))
+    coalescer.feed(make_notify_buffer([(ADDED, 'tmp'), (MODIFIED, 'b'), (REMOVED, 'tmp')]))
+
+    assert coalescer.flush() == []
+
+    clock.now = 0.5
+    coalescer.add(action=MODIFIED, file_name='c')
+
+    clock.now = 1.0
+    assert coalescer.flush() == [(ADDED, 'a'), (MODIFIED, 'b')]
+    assert coalescer.flush(force=True) == [(MODIFIED, 'c')]
+    assert len(coalescer) == 0
+
+
+def test_coalescer_rename_ends_burst():
+    coalescer = FileNotifyCoalescer(window=1.0, clock=FakeClock())
+
+    coalescer.feed(make_notify_buffer([
+        (MODIFIED, 'a'),
+        (RENAMED_OLD_NAME, 'a'),
+        (RENAMED_NEW_NAME, 'b'),
+        (ADDED, 'a'),
+        (MODIFIED, 'a')
+    ]))
+
+    assert coalescer.flush(force=True) == [
+        (MODIFIED, 'a'),
+        (RENAMED_OLD_NAME, 'a'),
+        (RENAMED_NEW_NAME, 'b'),
+        (ADDED, 'a')
+    ]
+
+
+def test_coalescer_window_expired_before_flush():
+    coalescer = FileNotifyCoalescer(window=1.0, clock=FakeClock())
+
+    coalescer.add(action=ADDED, file_name='a', timestamp=0.0)
+    coalescer.add(action=MODIFIED, file_name='a', timestamp=2.0)
+
+    assert coalescer.flush(force=True) == [(ADDED, 'a'), (MODIFIED, 'a')]
@@ -0,0 +1,98 @@
+from pytest import raises, importorskip
+
+from msdsalgs import instrumentation
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+from msdsalgs.security_types.sid import SID
+from msdsalgs.utils import extract_elements
+from msdsalgs.fscc.file_notify_information import FileNotifyInformation
+
+from .test_security_descriptor import SECURITY_DESCRIPTOR_BYTES
+from .test_file_notify_stream import make_notify_buffer, ADDED, REMOVED
+
+
+def test_disabled_by_default():
+    original_from_bytes = SID.__dict__['from_bytes']
+
+    instrumentation.reset()
+    SecurityDescriptor.from_bytes(SECURITY_DESCRIPTOR_BYTES)
+
+    assert not instrumentation.is_enabled()
+    assert instrumentation.snapshot() == dict(counters={}, histograms={})
+    assert SID.__dict__['from_bytes'] is original_from_bytes
+
+
+def test_security_descriptor_metrics():
+    original_from_bytes = SID.__dict__['from_bytes']
+    instrumentation.reset()
+
+    with instrumentation.enabled():
+        assert SID.__dict__['from_bytes'] is not original_from_bytes
+        SecurityDescriptor.from_bytes(SECURITY_DESCRIPTOR_BYTES)
+
+    assert SID.__dict__['from_bytes'] is original_from_bytes
+
+    snapshot = instrumentation.snapshot()
+
+    assert {name: histogram['count'] for name, histogram in snapshot['histograms'].items()} == {
+        'security_descriptor.from_bytes': 1,
+        'acl.from_bytes': 2,
+        'ace.from_bytes': 4,
+        'sid.from_bytes': 6
+    }
+    assert snapshot['counters'] == {
+        'ace.from_bytes.SYSTEM_AUDIT_ACE_TYPE': 1,
+        'ace.from_bytes.ACCESS_ALLOWED_ACE_TYPE': 1,
+        'ace.from_bytes.ACCESS_ALLOWED_OBJECT_ACE_TYPE': 1,
+        'ace.from_bytes.ACCESS_ALLOWED_CALLBACK_ACE_TYPE': 1
+    }
+
+    histogram = snapshot['histograms']['sid.from_bytes']
+    assert histogram['buckets'][-1] == (float('inf'), 6)
+    assert [count for _, count in histogram['buckets']] == sorted(count for _, count in histogram['buckets'])
+    assert histogram['sum'] > 0
+
+    # Collection stops when disabled, and the collected metrics are kept.
+    SecurityDescriptor.from_bytes(SECURITY_DESCRIPTOR_BYTES)
+    assert instrumentation.snapshot() == snapshot
+
+    instrumentation.reset()
+    assert instrumentation.snapshot() == dict(counters={}, histograms={})
+
+
+def test_errors_and_extract_elements():
+    instrumentation.reset()
+
+    with instrumentation.enabled():
+        with raises(Exception):
+            SID.from_bytes(b'\x01')
+
+        extract_elements(
+            data=make_notify_buffer([(ADDED, 'a'), (REMOVED, 'b')]),
+            create_element=FileNotifyInformation.from_bytes,
+            get_next_offset=lambda record: record.next_entry_offset
+        )
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot['counters'] == {'sid.from_bytes.errors': 1, 'extract_elements.elements': 2}
+    assert snapshot['histograms']['sid.from_bytes']['count'] == 1
+    assert snapshot['histograms']['extract_elements']['count'] == 1
+
+
+def test_crypto():
+    importorskip('Crypto')
+    from msdsalgs.crypto import DesEcbLmCipher, decrypt_aes
+
+    instrumentation.reset()
+
+    with instrumentation.enabled():
+        cipher = DesEcbLmCipher.from_int_key(500)
+        assert cipher.decrypt(cipher.encrypt(bytes(range(16)))) == bytes(range(16))
+        decrypt_aes(bytes(16), bytes(32))
+
+    assert {name: histogram['count'] for name, histogram in instrumentation.snapshot()['histograms'].items()} == {
+        'crypto.transform_des_key': 2,
+        'crypto.des_ecb_lm.encrypt': 1,
+        'crypto.des_ecb_lm.decrypt': 1,
+        'crypto.decrypt_aes': 1
+    }
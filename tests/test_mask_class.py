@@ -1,6 +1,7 @@
 from enum import IntFlag
+from struct import pack as struct_pack
 from msdsalgs.utils import Mask
-from pytest import raises as pytest_raises
+from pytest import raises as pytest_raises, importorskip as pytest_importorskip
 
 
 class SCManagerAccessFlag(IntFlag):
@@ -104,3 +105,56 @@ def test_incorrect_paramaters():
 
     with pytest_raises(ValueError):
         SCManagerAccessFlagMask(connect=True, incorrect_parameter=True)
+
+
+def test_flag_table():
+    assert SCManagerAccessFlagMask.FLAG_TABLE == (
+        ('connect', 0x01),
+        ('create_service', 0x02),
+        ('enumerate_service', 0x04),
+        ('lock', 0x08),
+        ('modify_boot_config', 0x20),
+        ('query_lock_status', 0x10)
+    )
+    assert SCManagerAccessFlagMask.ALL_FLAGS_VALUE == 0x3f
+
+
+def test_equality():
+    assert SCManagerAccessFlagMask.from_int(5) == SCManagerAccessFlagMask(connect=True, enumerate_service=True)
+    assert SCManagerAccessFlagMask.from_int(5) != SCManagerAccessFlagMask.from_int(4)
+
+
+def test_int_storage():
+    mask = SCManagerAccessFlagMask.from_int(SCManagerAccessFlag.SC_MANAGER_LOCK)
+
+    assert type(int(mask)) is int
+    assert repr(mask) == repr(SCManagerAccessFlag.SC_MANAGER_LOCK)
+    assert not hasattr(mask, '__dict__')
+
+
+def test_flag_matrix():
+    numpy = pytest_importorskip('numpy')
+
+    matrix = SCManagerAccessFlagMask.flag_matrix(numpy.array([0, 1, 0x3f, 0x12], dtype=numpy.uint32))
+
+    assert matrix.shape == (4, len(SCManagerAccessFlagMask.FLAG_TABLE))
+    assert matrix.tolist() == [
+        [value for _, value in SCManagerAccessFlagMask.from_int(int_value).items()]
+        for int_value in (0, 1, 0x3f, 0x12)
+    ]
+
+
+def test_flag_counts_from_buffer():
+    pytest_importorskip('numpy')
+
+    # Mask values at offset 2 of 6-byte records.
+    data = b''.join(b'\xff\xff' + struct_pack('<I', value) for value in (0x01, 0x03, 0x10))
+
+    assert SCManagerAccessFlagMask.flag_counts(data, stride=6, offset=2) == {
+        'connect': 2,
+        'create_service': 1,
+        'enumerate_service': 0,
+        'lock': 0,
+        'modify_boot_config': 0,
+        'query_lock_status': 1
+    }
@@ -0,0 +1,49 @@
+from enum import IntFlag
+
+from msdsalgs.utils import Mask
+from msdsalgs.mask_generation import GENERATED_MODULE_PATH, generate_module_source
+from msdsalgs.fscc.file_attributes import FileAttributes, FileAttributesFlag
+
+
+def test_generated_module_is_up_to_date():
+    assert GENERATED_MODULE_PATH.read_text() == generate_module_source()
+
+
+def test_generated_class_used():
+    assert FileAttributes.__module__ == 'msdsalgs._generated_masks'
+    assert FileAttributes.INT_FLAG_CLASS is FileAttributesFlag
+
+
+def test_generated_class_equivalent_to_dynamic_class():
+    dynamic_class = Mask.make_dynamic_class(int_flag_class=FileAttributesFlag, prefix='FILE_ATTRIBUTE_')
+
+    assert dynamic_class.FLAG_TABLE == FileAttributes.FLAG_TABLE
+    assert dynamic_class.ALL_FLAGS_VALUE == FileAttributes.ALL_FLAGS_VALUE
+
+    for value in (0, 0x22, 0x0002FFB7):
+        assert dynamic_class.from_int(value).items() == FileAttributes.from_int(value).items()
+
+
+def test_stale_generated_class_not_used():
+    class FileAttributesFlag(IntFlag):
+        FILE_ATTRIBUTE_ARCHIVE = 0x00000020
+
+    mask_class = Mask.make_class(int_flag_class=FileAttributesFlag, prefix='FILE_ATTRIBUTE_')
+
+    assert mask_class is not FileAttributes
+    assert mask_class.FLAG_TABLE == (('archive', 0x20),)
+
+
+def test_generated_class_not_shared_with_equal_int_flag_class():
+    # An `IntFlag` class with the same name and members as the one a class was generated from.
+    FileAttributesFlagCopy = IntFlag(
+        'FileAttributesFlag',
+        [(member.name, member.value) for member in FileAttributesFlag]
+    )
+
+    mask_class = Mask.make_class(int_flag_class=FileAttributesFlagCopy, prefix='FILE_ATTRIBUTE_')
+
+    assert mask_class is not FileAttributes
+    assert mask_class.INT_FLAG_CLASS is FileAttributesFlagCopy
+    assert FileAttributes.INT_FLAG_CLASS is FileAttributesFlag
+    assert FileAttributes.from_int(0x20).to_int_flag() is FileAttributesFlag.FILE_ATTRIBUTE_ARCHIVE
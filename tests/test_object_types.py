@@ -0,0 +1,58 @@
+from struct import pack as struct_pack
+from uuid import UUID
+
+from msdsalgs.security_types.ace import ACE
+from msdsalgs.security_types.object_types import intern_guid, clear_interned_guids, well_known_object_type, \
+    object_type_name, ObjectTypeKind
+
+from .test_security_descriptor import sid_bytes, make_ace
+
+DS_REPLICATION_GET_CHANGES_ALL = UUID('1131f6ad-9c07-11d1-f79f-00c04fc2dcd2')
+
+
+def make_object_ace(object_type: UUID, inherited_object_type: UUID) -> bytes:
+    return make_ace(
+        0x05,
+        0x00,
+        0x00000100,
+        struct_pack('<I', 0x3) + object_type.bytes_le + inherited_object_type.bytes_le + sid_bytes('S-1-5-11')
+    )
+
+
+def test_intern_guid():
+    guid = UUID('8f3c5b9e-1d2a-4c6b-9e7f-0a1b2c3d4e5f')
+
+    interned_guid = intern_guid(memoryview(guid.bytes_le))
+
+    assert interned_guid == guid
+    assert intern_guid(bytes(guid.bytes_le)) is interned_guid
+
+    clear_interned_guids()
+    assert intern_guid(guid.bytes_le) is not interned_guid
+
+
+def test_object_ace_guids_are_interned():
+    user = UUID('bf967aba-0de6-11d0-a285-00aa003049e2')
+
+    first = ACE.from_bytes(make_object_ace(DS_REPLICATION_GET_CHANGES_ALL, user))
+    second = ACE.from_bytes(make_object_ace(DS_REPLICATION_GET_CHANGES_ALL, user))
+
+    assert first.object_type == DS_REPLICATION_GET_CHANGES_ALL
+    assert first.inherited_object_type == user
+    assert first.object_type is second.object_type
+    assert bytes(first) == make_object_ace(DS_REPLICATION_GET_CHANGES_ALL, user)
+
+
+def test_well_known_object_types():
+    object_type = ACE.from_bytes(
+        make_object_ace(DS_REPLICATION_GET_CHANGES_ALL, DS_REPLICATION_GET_CHANGES_ALL)
+    ).object_type
+
+    well_known = well_known_object_type(object_type)
+    assert well_known.name == 'DS-Replication-Get-Changes-All'
+    assert well_known.kind is ObjectTypeKind.EXTENDED_RIGHT
+    # The GUIDs of the table are the interned GUIDs.
+    assert well_known.guid is object_type
+
+    assert object_type_name(UUID('bf967a9c-0de6-11d0-a285-00aa003049e2')) == 'Group'
+    assert object_type_name(UUID('8f3c5b9e-1d2a-4c6b-9e7f-0a1b2c3d4e5f')) is None
@@ -0,0 +1,37 @@
+from struct import pack as struct_pack
+
+from pytest import importorskip as pytest_importorskip
+
+from .test_security_descriptor import SECURITY_DESCRIPTOR_BYTES
+
+pytest_importorskip('ndr')
+
+from msdsalgs.rpc.rpc_security_attributes import RPCSecurityAttributesView
+
+
+def test_rpc_security_attributes_view():
+    security_descriptor_len: int = len(SECURITY_DESCRIPTOR_BYTES)
+    data = b''.join([
+        b'\xAA' * 8,
+        struct_pack('<II', security_descriptor_len, 0x00020000),
+        SECURITY_DESCRIPTOR_BYTES,
+        struct_pack('<IIB', security_descriptor_len, security_descriptor_len, 1)
+    ])
+
+    view = RPCSecurityAttributesView.from_bytes(data=data, base_offset=8)
+
+    assert view.inherit_handle is True
+    assert view.in_security_descriptor == security_descriptor_len
+    assert len(view) == len(data) - 8
+    assert view.raw_security_descriptor.obj is data
+    assert view.raw_security_descriptor == SECURITY_DESCRIPTOR_BYTES
+    assert bytes(view.security_descriptor) == SECURITY_DESCRIPTOR_BYTES
+    assert view.security_descriptor is view.security_descriptor
+
+
+def test_rpc_security_attributes_view_null_security_descriptor():
+    view = RPCSecurityAttributesView.from_bytes(data=struct_pack('<IIIIB', 0, 0, 0, 0, 0))
+
+    assert view.security_descriptor is None
+    assert view.raw_security_descriptor is None
+    assert view.inherit_handle is False
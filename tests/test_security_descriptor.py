@@ -0,0 +1,98 @@
+from struct import pack as struct_pack
+from uuid import UUID
+
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+from msdsalgs.security_types.sid import SID
+from msdsalgs.security_types.ace import AccessAllowedObjectACE, AccessAllowedCallbackACE
+
+
+def sid_bytes(sid_string: str) -> bytes:
+    return bytes(SID.from_string(sid_string))
+
+
+def make_ace(ace_type: int, ace_flags: int, access_mask: int, body: bytes) -> bytes:
+    ace_size: int = 8 + len(body)
+    return struct_pack('<BBHI', ace_type, ace_flags, ace_size, access_mask) + body
+
+
+def make_acl(aces: list) -> bytes:
+    return struct_pack('<BBHHH', 2, 0, 8 + sum(len(ace) for ace in aces), len(aces), 0) + b''.join(aces)
+
+
+def make_security_descriptor_bytes(
+    owner: bytes = None,
+    group: bytes = None,
+    sacl: bytes = None,
+    dacl: bytes = None
+) -> bytes:
+    """
+    Make a self-relative security descriptor, with its components in the order owner, group, SACL and DACL.
+    """
+
+    control: int = 0x8000 | (0x0010 if sacl is not None else 0) | (0x0004 if dacl is not None else 0)
+    control |= (0x0001 if owner is None else 0) | (0x0002 if group is None else 0)
+
+    offsets = []
+    body = b''
+    for component in (owner, group, sacl, dacl):
+        offsets.append(20 + len(body) if component is not None else 0)
+        body += component or b''
+
+    return struct_pack('<BBHIIII', 1, 0, control, *offsets) + body
+
+
+OBJECT_TYPE = UUID('bf967aba-0de6-11d0-a285-00aa003049e2')
+
+SECURITY_DESCRIPTOR_BYTES: bytes = make_security_descriptor_bytes(
+    owner=sid_bytes('S-1-5-32-544'),
+    group=sid_bytes('S-1-5-18'),
+    sacl=make_acl([make_ace(0x02, 0x80, 0x000F003F, sid_bytes('S-1-1-0'))]),
+    dacl=make_acl([
+        make_ace(0x00, 0x02, 0x001F01FF, sid_bytes('S-1-5-32-544')),
+        make_ace(0x05, 0x00, 0x00000100, struct_pack('<I', 0x1) + OBJECT_TYPE.bytes_le + sid_bytes('S-1-5-11')),
+        make_ace(0x09, 0x00, 0x00000001, sid_bytes('S-1-1-0') + b'artx\x00\x00\x00\x00')
+    ])
+)
+
+
+def test_round_trip():
+    security_descriptor = SecurityDescriptor.from_bytes(data=SECURITY_DESCRIPTOR_BYTES)
+
+    assert str(security_descriptor.owner_sid) == 'S-1-5-32-544'
+    assert isinstance(security_descriptor.dacl.aces[1], AccessAllowedObjectACE)
+    assert security_descriptor.dacl.aces[1].object_type == OBJECT_TYPE
+    assert isinstance(security_descriptor.dacl.aces[2], AccessAllowedCallbackACE)
+
+    assert bytes(security_descriptor) == SECURITY_DESCRIPTOR_BYTES
+    assert len(security_descriptor) == len(SECURITY_DESCRIPTOR_BYTES)
+
+
+def test_serialization_reflects_changes():
+    security_descriptor = SecurityDescriptor.from_bytes(data=SECURITY_DESCRIPTOR_BYTES)
+
+    security_descriptor.owner_sid = SID.from_string('S-1-5-21-1-2-3-500')
+    assert len(security_descriptor) == len(SECURITY_DESCRIPTOR_BYTES) + 12
+    assert len(bytes(security_descriptor)) == len(security_descriptor)
+
+    # Components changed in place are serialized anew.
+    security_descriptor.owner_sid.sub_authorities = (21, 1, 2, 3, 501)
+    assert SecurityDescriptor.from_bytes(data=bytes(security_descriptor)).owner_sid.rid == 501
+
+    security_descriptor.dacl.aces[0].trustee_sid.sub_authorities = (32, 545)
+    security_descriptor.dacl.aces = security_descriptor.dacl.aces[:2]
+    dacl = SecurityDescriptor.from_bytes(data=bytes(security_descriptor)).dacl
+    assert len(dacl.aces) == 2
+    assert str(dacl.aces[0].trustee_sid) == 'S-1-5-32-545'
+
+    buffer = bytearray(b'\xFF' * (len(security_descriptor) + 4))
+    assert security_descriptor.pack_into(buffer, 4) == len(buffer)
+    assert bytes(buffer[4:]) == bytes(security_descriptor)
+
+
+def test_ace_application_data_length():
+    callback_ace = SecurityDescriptor.from_bytes(data=SECURITY_DESCRIPTOR_BYTES).dacl.aces[2]
+
+    # The application data is measured and written as is, e.g. a view of a larger buffer.
+    callback_ace.application_data = memoryview(b'artx' + bytes(12))[:12]
+    assert len(callback_ace) == len(bytes(callback_ace)) == 8 + 12 + 12
+    assert bytes(callback_ace).endswith(b'artx' + bytes(8))
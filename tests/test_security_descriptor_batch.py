@@ -0,0 +1,137 @@
+from dataclasses import FrozenInstanceError
+from struct import pack as struct_pack, pack_into as struct_pack_into
+
+import pytest
+
+from msdsalgs.security_types.acl import DACL
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor, BadDACLOffsetError
+from msdsalgs.security_types.security_descriptor_batch import SecurityDescriptorField, SecurityDescriptorBatchDecoder, \
+    DACLSummary, decode_many
+from msdsalgs.synthetic_corpus import SecurityDescriptorProfile, generate_corpus
+
+from .test_security_descriptor import SECURITY_DESCRIPTOR_BYTES, OBJECT_TYPE, sid_bytes, make_ace, make_acl, \
+    make_security_descriptor_bytes
+
+
+def component_bytes(component) -> bytes:
+    return bytes(component) if component is not None else None
+
+
+def test_decode_many_matches_from_bytes():
+    blobs = list(generate_corpus(SecurityDescriptorProfile(sacl_probability=0.5), count=50, seed=0))
+
+    for data, decoded in zip(blobs, decode_many(blobs)):
+        security_descriptor = SecurityDescriptor.from_bytes(data)
+
+        assert int(decoded.control) == int(security_descriptor.control)
+        for name in ('owner_sid', 'group_sid', 'sacl', 'dacl'):
+            assert component_bytes(getattr(decoded, name)) == component_bytes(getattr(security_descriptor, name))
+        assert decoded.dacl_summary is None
+
+
+def test_fields():
+    decoded, = decode_many(
+        [SECURITY_DESCRIPTOR_BYTES],
+        fields=SecurityDescriptorField.OWNER | SecurityDescriptorField.DACL_SUMMARY
+    )
+
+    assert str(decoded.owner_sid) == 'S-1-5-32-544'
+    assert decoded.control is None and decoded.group_sid is None and decoded.sacl is None and decoded.dacl is None
+    assert decoded.dacl_summary == DACLSummary(
+        num_aces=3,
+        num_inherited_aces=0,
+        allowed={'S-1-5-32-544': 0x001F01FF}
+    )
+
+
+def test_dacl_summary():
+    dacl = make_acl([
+        make_ace(0x00, 0x10, 0x00020000, sid_bytes('S-1-5-11')),
+        make_ace(0x00, 0x00, 0x00000010, sid_bytes('S-1-5-11')),
+        make_ace(0x01, 0x00, 0x00040000, sid_bytes('S-1-1-0')),
+        # Inherit-only ACEs and object ACEs with an object type do not apply to the object itself.
+        make_ace(0x00, 0x0A, 0x10000000, sid_bytes('S-1-1-0')),
+        make_ace(0x05, 0x00, 0x00000100, struct_pack('<I', 0x1) + OBJECT_TYPE.bytes_le + sid_bytes('S-1-1-0')),
+        make_ace(0x05, 0x00, 0x00000020, struct_pack('<I', 0x0) + sid_bytes('S-1-5-18'))
+    ])
+
+    decoded, = decode_many(
+        [make_security_descriptor_bytes(owner=sid_bytes('S-1-5-18'), dacl=dacl)],
+        fields=SecurityDescriptorField.DACL_SUMMARY
+    )
+
+    assert decoded.dacl_summary == DACLSummary(
+        num_aces=6,
+        num_inherited_aces=1,
+        allowed={'S-1-5-11': 0x00020010, 'S-1-5-18': 0x00000020},
+        denied={'S-1-1-0': 0x00040000}
+    )
+
+
+def test_components_are_not_shared():
+    decoder = SecurityDescriptorBatchDecoder()
+
+    first, second = decoder.decode_many([SECURITY_DESCRIPTOR_BYTES, bytes(SECURITY_DESCRIPTOR_BYTES)])
+
+    assert first.owner_sid is not second.owner_sid
+    assert first.dacl is not second.dacl
+    assert first.dacl.aces[0] is not second.dacl.aces[0]
+    assert first.dacl.aces[0].trustee_sid is not second.dacl.aces[0].trustee_sid
+
+    first.owner_sid.sub_authorities = (32, 545)
+    first.dacl.aces[0].trustee_sid.sub_authorities = (18,)
+    first.dacl.aces[0].header.ace_flags = 0x02
+
+    third, = decoder.decode_many([SECURITY_DESCRIPTOR_BYTES])
+
+    for decoded in (second, third):
+        assert str(decoded.owner_sid) == 'S-1-5-32-544'
+        assert bytes(decoded.dacl) == bytes(SecurityDescriptor.from_bytes(SECURITY_DESCRIPTOR_BYTES).dacl)
+
+
+def test_bounded_caches():
+    blobs = list(generate_corpus(SecurityDescriptorProfile(), count=20, seed=2))
+    decoder = SecurityDescriptorBatchDecoder(max_cached_components=4)
+
+    for data, decoded in zip(blobs, decoder.decode_many(blobs)):
+        assert component_bytes(decoded.dacl) == component_bytes(SecurityDescriptor.from_bytes(data).dacl)
+
+    caches = (decoder._sids, decoder._aces, decoder._acls, decoder._dacl_summaries)
+    assert all(len(cache) <= 4 for cache in caches)
+    # The most recently used components are kept.
+    assert (DACL, bytes(SecurityDescriptor.from_bytes(blobs[-1]).dacl)) in decoder._acls
+
+    decoder.clear()
+    assert all(len(cache) == 0 for cache in caches)
+
+
+def test_dacl_summary_is_read_only():
+    decoded, = decode_many([SECURITY_DESCRIPTOR_BYTES], fields=SecurityDescriptorField.DACL_SUMMARY)
+
+    with pytest.raises(FrozenInstanceError):
+        decoded.dacl_summary.num_aces = 0
+    with pytest.raises(TypeError):
+        decoded.dacl_summary.allowed['S-1-1-0'] = 0x001F01FF
+
+
+def test_missing_dacl():
+    # `SE_DACL_PRESENT` is set, but the DACL offset is 0.
+    data = bytearray(make_security_descriptor_bytes(owner=sid_bytes('S-1-5-18'), dacl=make_acl([])))
+    struct_pack_into('<I', data, 16, 0)
+
+    with pytest.raises(BadDACLOffsetError):
+        decode_many([bytes(data)])
+
+
+def test_process_pool():
+    blobs = list(generate_corpus(SecurityDescriptorProfile(), count=30, seed=1))
+    fields = SecurityDescriptorField.CONTROL | SecurityDescriptorField.OWNER | SecurityDescriptorField.DACL_SUMMARY
+
+    pooled = decode_many(blobs, fields=fields, processes=2, chunk_size=8)
+    in_process = decode_many(blobs, fields=fields)
+
+    assert [int(decoded.control) for decoded in pooled] == [int(decoded.control) for decoded in in_process]
+    assert [component_bytes(decoded.owner_sid) for decoded in pooled] == [
+        component_bytes(decoded.owner_sid) for decoded in in_process
+    ]
+    assert [decoded.dacl_summary for decoded in pooled] == [decoded.dacl_summary for decoded in in_process]
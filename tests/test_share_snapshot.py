@@ -0,0 +1,167 @@
+from array import array
+from random import Random
+from struct import pack as struct_pack
+from sys import modules as sys_modules
+from typing import Dict, Tuple
+
+from pytest import importorskip
+
+from msdsalgs.fscc.file_attributes import FileAttributes
+from msdsalgs.fscc.file_information import FileInformation
+from msdsalgs.fscc.file_information_classes import FileIdFullDirectoryInformation, FileInformationClass, \
+    decode_directory_buffer
+from msdsalgs.fscc.share_snapshot import ShareSnapshot, ShareSnapshotBuilder, SnapshotChange, SnapshotChangeFlag, \
+    diff_snapshots, _unique_argsort
+
+
+def make_entry(file_id: int, file_name: str, last_write_time: int = 1, endof_file: int = 0):
+    return FileIdFullDirectoryInformation(
+        next_entry_offset=0,
+        file_index=0,
+        file_information=FileInformation(
+            _creation_time=1,
+            _last_access_time=1,
+            _last_write_time=last_write_time,
+            _change_time=last_write_time,
+            allocation_size=0,
+            endof_file=endof_file,
+            file_attributes=FileAttributes.from_int(0x20)
+        ),
+        file_name=file_name,
+        ea_size=0,
+        file_id=struct_pack('<Q', file_id)
+    )
+
+
+def make_snapshot(files: Dict[int, Tuple[str, str, int]]) -> ShareSnapshot:
+    builder = ShareSnapshotBuilder()
+    for file_id, (directory_path, file_name, last_write_time) in files.items():
+        builder.add_directory(directory_path, [
+            make_entry(file_id=0, file_name='.'),
+            make_entry(file_id=file_id, file_name=file_name, last_write_time=last_write_time)
+        ])
+    return builder.build()
+
+
+OLD = make_snapshot({
+    30: ('\\', 'unchanged.txt', 1),
+    10: ('\\dir', 'modified.txt', 1),
+    20: ('\\', 'renamed.txt', 1),
+    40: ('\\', 'removed.txt', 1),
+    50: ('\\', 'moved_and_modified.txt', 1),
+})
+
+NEW = make_snapshot({
+    30: ('\\', 'unchanged.txt', 1),
+    10: ('\\dir', 'modified.txt', 2),
+    20: ('\\', 'renamed_to.txt', 1),
+    5: ('\\', 'added.txt', 1),
+    50: ('\\dir\\', 'moved_and_modified.txt', 2),
+})
+
+
+def test_build():
+    assert list(OLD.file_ids) == [10, 20, 30, 40, 50]
+    assert [OLD.path(i) for i in range(len(OLD))] == [
+        '\\dir\\modified.txt',
+        '\\renamed.txt',
+        '\\unchanged.txt',
+        '\\removed.txt',
+        '\\moved_and_modified.txt'
+    ]
+    assert OLD.find(30) == 2
+    assert OLD.find(31) is None
+
+
+def test_build_duplicate_file_ids():
+    builder = ShareSnapshotBuilder()
+    builder.add('\\first', make_entry(file_id=1, file_name='first'))
+    builder.add('\\second', make_entry(file_id=1, file_name='second'))
+
+    snapshot = builder.build()
+
+    assert len(snapshot) == 1
+    assert snapshot.path(0) == '\\first'
+
+
+def test_build_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys_modules, 'numpy', None)
+
+    builder = ShareSnapshotBuilder()
+    for i in range(len(OLD)):
+        builder.add(OLD.path(i), make_entry(file_id=OLD.file_ids[i], file_name=''))
+    builder.add('\\duplicate', make_entry(file_id=OLD.file_ids[0], file_name=''))
+
+    snapshot = builder.build()
+
+    assert snapshot.file_ids == OLD.file_ids
+    assert snapshot.path_offsets == OLD.path_offsets
+    assert snapshot.path_data == OLD.path_data
+
+
+def test_unique_argsort():
+    random = Random(0)
+    keys = array('Q', (random.choice([random.getrandbits(64), random.getrandbits(20)]) for _ in range(2000)))
+    keys.extend(keys[:100])
+
+    first_indices: Dict[int, int] = {}
+    for index, key in enumerate(keys):
+        first_indices.setdefault(key, index)
+    expected = [first_indices[key] for key in sorted(first_indices)]
+
+    assert list(_unique_argsort(keys)) == expected
+    assert list(_unique_argsort(array('Q'))) == []
+    assert list(_unique_argsort(array('Q', [7] * 3))) == [0]
+
+    numpy = importorskip('numpy')
+    assert list(_unique_argsort(keys, numpy=numpy)) == expected
+    assert list(_unique_argsort(array('Q'), numpy=numpy)) == []
+
+
+def test_diff_snapshots():
+    assert list(diff_snapshots(OLD, NEW)) == [
+        SnapshotChange(SnapshotChangeFlag.ADDED, 5, None, '\\added.txt'),
+        SnapshotChange(SnapshotChangeFlag.MODIFIED, 10, '\\dir\\modified.txt', '\\dir\\modified.txt'),
+        SnapshotChange(SnapshotChangeFlag.RENAMED, 20, '\\renamed.txt', '\\renamed_to.txt'),
+        SnapshotChange(SnapshotChangeFlag.REMOVED, 40, '\\removed.txt', None),
+        SnapshotChange(
+            SnapshotChangeFlag.MODIFIED | SnapshotChangeFlag.RENAMED,
+            50,
+            '\\moved_and_modified.txt',
+            '\\dir\\moved_and_modified.txt'
+        ),
+    ]
+    assert list(diff_snapshots(OLD, OLD)) == []
+
+
+def test_diff_snapshots_end_of_file_within_cluster():
+    def snapshot_from_buffer(endof_file: int) -> ShareSnapshot:
+        file_name_bytes: bytes = 'small.txt'.encode(encoding='utf-16-le')
+        # A `FileIdFullDirectoryInformation` entry, with `EndOfFile` at offset 40 and `AllocationSize` at offset 48.
+        data: bytes = struct_pack(
+            '<IIQQQQQQIII4xQ', 0, 0, 1, 1, 1, 1, endof_file, 4096, 0x20, len(file_name_bytes), 0, 7
+        ) + file_name_bytes
+
+        builder = ShareSnapshotBuilder()
+        builder.add_directory('\\', decode_directory_buffer(FileInformationClass.FileIdFullDirectoryInformation, data))
+        return builder.build()
+
+    old, new = snapshot_from_buffer(endof_file=100), snapshot_from_buffer(endof_file=200)
+
+    assert list(old.endof_files) == [100]
+    assert list(diff_snapshots(old, new)) == [
+        SnapshotChange(SnapshotChangeFlag.MODIFIED, 7, '\\small.txt', '\\small.txt')
+    ]
+
+
+def test_save_and_load(tmp_path):
+    snapshot_path = tmp_path / 'share.snapshot'
+    OLD.save(snapshot_path)
+
+    loaded = ShareSnapshot.load(snapshot_path)
+
+    assert len(loaded) == len(OLD)
+    assert loaded.path_data == OLD.path_data
+    for column_name in ShareSnapshot._COLUMN_NAMES:
+        assert getattr(loaded, column_name) == getattr(OLD, column_name)
+    assert list(diff_snapshots(loaded, NEW)) == list(diff_snapshots(OLD, NEW))
@@ -0,0 +1,42 @@
+from pytest import raises as pytest_raises
+
+from msdsalgs.ntstatus_value import NTStatusValueError, UnknownNTStatusValueError, StatusAccessDeniedError
+from msdsalgs.win32_error import Win32Error, UnknownWin32Error, ErrorAccessDeniedError
+
+
+def test_from_nt_status_int():
+    assert type(NTStatusValueError.from_nt_status_int(0xC0000022)) is StatusAccessDeniedError
+
+    error = NTStatusValueError.from_nt_status_int(0xCFFFFFFF)
+    assert type(error) is UnknownNTStatusValueError
+    assert error.nt_status == 0xCFFFFFFF
+    assert '0xCFFFFFFF' in str(error)
+
+    assert NotImplemented not in NTStatusValueError.NT_STATUS_TO_ERROR_CLASS
+
+
+def test_raise_for_nt_status():
+    assert NTStatusValueError.raise_for_nt_status(0) is None
+
+    with pytest_raises(StatusAccessDeniedError):
+        NTStatusValueError.raise_for_nt_status(0xC0000022)
+
+    with pytest_raises(UnknownNTStatusValueError):
+        NTStatusValueError.raise_for_nt_status(0xCFFFFFFF)
+
+
+def test_from_win32_error_code_int():
+    assert type(Win32Error.from_win32_error_code_int(5)) is ErrorAccessDeniedError
+
+    error = Win32Error.from_win32_error_code_int(0xFFFF, response='response')
+    assert type(error) is UnknownWin32Error
+    assert error.win32_error_code == 0xFFFF
+    assert error.response == 'response'
+
+
+def test_raise_for_win32_error_code():
+    assert Win32Error.raise_for_win32_error_code(0) is None
+
+    with pytest_raises(ErrorAccessDeniedError) as exception_info:
+        Win32Error.raise_for_win32_error_code(5, response='response')
+    assert exception_info.value.response == 'response'
@@ -0,0 +1,34 @@
+from array import array
+
+from pytest import importorskip as pytest_importorskip
+
+from msdsalgs.status_histogram import nt_status_histogram, win32_error_histogram
+
+
+def test_nt_status_histogram():
+    pytest_importorskip('numpy')
+
+    nt_statuses = array('I', [0xC0000022] * 5 + [0x00000000] * 3 + [0x80000005] * 3 + [0xC00D0001, 0xCFFFFFFF])
+    histogram = nt_status_histogram(nt_statuses)
+
+    assert len(histogram) == 5
+    assert histogram.total == 13
+    assert histogram.severity_counts.tolist() == [3, 0, 3, 7]
+    assert histogram.facility_counts[0x0] == 11
+    assert histogram.facility_counts[0xD] == 1
+    assert histogram.facility_counts[0xFFF] == 1
+
+    assert histogram.top(3) == [
+        (0xC0000022, 5, 'STATUS_ACCESS_DENIED'),
+        (0x00000000, 3, 'STATUS_SUCCESS'),
+        (0x80000005, 3, 'STATUS_BUFFER_OVERFLOW')
+    ]
+    assert histogram.top(10)[-1] == (0xCFFFFFFF, 1, None)
+
+
+def test_win32_error_histogram():
+    numpy = pytest_importorskip('numpy')
+
+    histogram = win32_error_histogram(numpy.array([5, 5, 2, 0xFFFF], dtype=numpy.uint32))
+    assert histogram.values.tolist() == [2, 5, 0xFFFF]
+    assert histogram.top(1) == [(5, 2, 'ERROR_ACCESS_DENIED')]
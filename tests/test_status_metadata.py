@@ -0,0 +1,40 @@
+from msdsalgs.status_metadata import NT_STATUS_TABLE, WIN32_ERROR_TABLE, NTStatusSeverity, nt_status_severity, \
+    nt_status_facility, nt_status_code, nt_status_is_customer, nt_success, nt_information, nt_warning, nt_error
+from msdsalgs.ntstatus_value import NTStatusValue
+
+
+def test_nt_status_fields():
+    value = 0xC0000022
+
+    assert nt_status_severity(value) == NTStatusSeverity.STATUS_SEVERITY_ERROR
+    assert nt_status_facility(value) == 0
+    assert nt_status_code(value) == 0x22
+    assert not nt_status_is_customer(value)
+    assert nt_error(value) and not nt_success(value)
+
+    assert nt_status_facility(0xC00D0001) == 0x0D
+    assert nt_status_is_customer(0xE0000001)
+    assert nt_success(0x40000000) and nt_information(0x40000000)
+    assert nt_warning(0x80000005) and not nt_success(0x80000005)
+
+
+def test_nt_status_table():
+    assert len(NT_STATUS_TABLE) == len(set(NTStatusValue))
+    assert list(NT_STATUS_TABLE.values) == sorted(NT_STATUS_TABLE.values)
+
+    assert NT_STATUS_TABLE.name(0xC0000022) == 'STATUS_ACCESS_DENIED'
+    assert NT_STATUS_TABLE.description(0xC0000022).startswith('{Access Denied}')
+    # The first defined name of an aliased value is used.
+    assert NT_STATUS_TABLE.name(0x00000080) == NTStatusValue(0x00000080).name
+
+    assert 0xC0000022 in NT_STATUS_TABLE
+    assert 0xCFFFFFFF not in NT_STATUS_TABLE
+    assert NT_STATUS_TABLE.name(0xCFFFFFFF) is None
+    assert NT_STATUS_TABLE.description(0xCFFFFFFF) is None
+
+
+def test_win32_error_table():
+    assert WIN32_ERROR_TABLE.name(0) == 'ERROR_SUCCESS'
+    assert WIN32_ERROR_TABLE.name(5) == 'ERROR_ACCESS_DENIED'
+    assert WIN32_ERROR_TABLE.description(5) == 'Access is denied.'
+    assert WIN32_ERROR_TABLE.index(0xFFFF) is None
@@ -0,0 +1,105 @@
+from pytest import importorskip as pytest_importorskip
+
+from msdsalgs.status_translation import nt_status_to_win32_error_code, nt_statuses_to_win32_error_codes, \
+    hresult_from_win32, hresult_from_nt, nt_status_from_win32, NT_STATUS_TRANSLATION_KEYS
+from msdsalgs.status_translation_generation import GENERATED_MODULE_PATH, generate_module_source
+from msdsalgs.ntstatus_value import NTStatusValue
+from msdsalgs.win32_error import Win32ErrorCode
+
+_NT_STATUSES = [
+    0,
+    NTStatusValue.STATUS_ACCESS_DENIED,
+    NTStatusValue.STATUS_OBJECT_NAME_NOT_FOUND,
+    NTStatusValue.STATUS_BUFFER_OVERFLOW,
+    0xC0070005,
+    0xD0000022,
+    0xE0001234,
+    0xCFFFFFFF
+]
+
+_WIN32_ERROR_CODES = [
+    Win32ErrorCode.ERROR_SUCCESS,
+    Win32ErrorCode.ERROR_ACCESS_DENIED,
+    Win32ErrorCode.ERROR_FILE_NOT_FOUND,
+    Win32ErrorCode.ERROR_MORE_DATA,
+    Win32ErrorCode.ERROR_ACCESS_DENIED,
+    Win32ErrorCode.ERROR_ACCESS_DENIED,
+    0xE0001234,
+    Win32ErrorCode.ERROR_MR_MID_NOT_FOUND
+]
+
+
+# Statuses commonly returned by SMB and SAMR servers, and the Win32 error codes they translate into.
+_SMB_AND_SAMR_TRANSLATIONS = [
+    ('STATUS_ACCESS_DENIED', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_OBJECT_NAME_NOT_FOUND', 'ERROR_FILE_NOT_FOUND'),
+    ('STATUS_OBJECT_PATH_NOT_FOUND', 'ERROR_PATH_NOT_FOUND'),
+    ('STATUS_OBJECT_NAME_COLLISION', 'ERROR_ALREADY_EXISTS'),
+    ('STATUS_SHARING_VIOLATION', 'ERROR_SHARING_VIOLATION'),
+    ('STATUS_BAD_NETWORK_NAME', 'ERROR_BAD_NET_NAME'),
+    ('STATUS_NETWORK_NAME_DELETED', 'ERROR_NETNAME_DELETED'),
+    ('STATUS_USER_SESSION_DELETED', 'ERROR_UNEXP_NET_ERR'),
+    ('STATUS_MORE_PROCESSING_REQUIRED', 'ERROR_MORE_DATA'),
+    ('STATUS_NOT_SUPPORTED', 'ERROR_NOT_SUPPORTED'),
+    ('STATUS_INVALID_PARAMETER', 'ERROR_INVALID_PARAMETER'),
+    ('STATUS_END_OF_FILE', 'ERROR_HANDLE_EOF'),
+    ('STATUS_NO_MORE_FILES', 'ERROR_NO_MORE_FILES'),
+    ('STATUS_DIRECTORY_NOT_EMPTY', 'ERROR_DIR_NOT_EMPTY'),
+    ('STATUS_FILE_IS_A_DIRECTORY', 'ERROR_ACCESS_DENIED'),
+    ('STATUS_NOT_A_DIRECTORY', 'ERROR_DIRECTORY'),
+    ('STATUS_LOGON_FAILURE', 'ERROR_LOGON_FAILURE'),
+    ('STATUS_WRONG_PASSWORD', 'ERROR_INVALID_PASSWORD'),
+    ('STATUS_PASSWORD_EXPIRED', 'ERROR_PASSWORD_EXPIRED'),
+    ('STATUS_PASSWORD_MUST_CHANGE', 'ERROR_PASSWORD_MUST_CHANGE'),
+    ('STATUS_ACCOUNT_DISABLED', 'ERROR_ACCOUNT_DISABLED'),
+    ('STATUS_ACCOUNT_LOCKED_OUT', 'ERROR_ACCOUNT_LOCKED_OUT'),
+    ('STATUS_NO_SUCH_USER', 'ERROR_NO_SUCH_USER'),
+    ('STATUS_NO_SUCH_GROUP', 'ERROR_NO_SUCH_GROUP'),
+    ('STATUS_NO_SUCH_ALIAS', 'ERROR_NO_SUCH_ALIAS'),
+    ('STATUS_NO_SUCH_DOMAIN', 'ERROR_NO_SUCH_DOMAIN'),
+    ('STATUS_NONE_MAPPED', 'ERROR_NONE_MAPPED'),
+    ('STATUS_SOME_NOT_MAPPED', 'ERROR_SOME_NOT_MAPPED'),
+    ('STATUS_NO_MORE_ENTRIES', 'ERROR_NO_MORE_ITEMS'),
+    ('STATUS_MEMBER_NOT_IN_ALIAS', 'ERROR_MEMBER_NOT_IN_ALIAS'),
+    ('STATUS_COMMITMENT_LIMIT', 'ERROR_COMMITMENT_LIMIT'),
+    ('STATUS_OBJECT_NAME_EXISTS', 'ERROR_OBJECT_NAME_EXISTS'),
+    ('STATUS_NULL_LM_PASSWORD', 'ERROR_NULL_LM_PASSWORD'),
+    ('STATUS_LOCAL_USER_SESSION_KEY', 'ERROR_LOCAL_USER_SESSION_KEY'),
+    ('RPC_NT_SERVER_UNAVAILABLE', 'RPC_S_SERVER_UNAVAILABLE'),
+]
+
+
+def test_generated_module_is_up_to_date():
+    assert GENERATED_MODULE_PATH.read_text() == generate_module_source()
+
+
+def test_translation_table_sorted():
+    assert list(NT_STATUS_TRANSLATION_KEYS) == sorted(set(NT_STATUS_TRANSLATION_KEYS))
+
+
+def test_nt_status_to_win32_error_code():
+    assert [nt_status_to_win32_error_code(nt_status) for nt_status in _NT_STATUSES] == _WIN32_ERROR_CODES
+
+
+def test_smb_and_samr_statuses():
+    for nt_status_name, win32_error_code_name in _SMB_AND_SAMR_TRANSLATIONS:
+        assert nt_status_to_win32_error_code(NTStatusValue[nt_status_name]) == Win32ErrorCode[win32_error_code_name], \
+            nt_status_name
+
+
+def test_nt_statuses_to_win32_error_codes():
+    pytest_importorskip('numpy')
+    assert nt_statuses_to_win32_error_codes(_NT_STATUSES).tolist() == _WIN32_ERROR_CODES
+
+
+def test_hresult():
+    assert hresult_from_win32(0) == 0
+    assert hresult_from_win32(Win32ErrorCode.ERROR_ACCESS_DENIED) == 0x80070005
+    assert hresult_from_win32(0x80070005) == 0x80070005
+    assert hresult_from_nt(NTStatusValue.STATUS_ACCESS_DENIED) == 0xD0000022
+
+
+def test_nt_status_from_win32():
+    nt_status: int = nt_status_from_win32(Win32ErrorCode.ERROR_ACCESS_DENIED)
+    assert nt_status == 0xC0070005
+    assert nt_status_to_win32_error_code(nt_status) == Win32ErrorCode.ERROR_ACCESS_DENIED
@@ -0,0 +1,122 @@
+from os import listdir
+from random import Random
+
+from msdsalgs.synthetic_corpus import SecurityDescriptorProfile, DirectoryBufferProfile, NotifyBufferProfile, \
+    generate_corpus, corpus_item, write_corpus, generate_security_descriptor, DACL_ACE_TYPE_WEIGHTS, \
+    SACL_ACE_TYPE_WEIGHTS
+from msdsalgs.security_types.security_descriptor import SecurityDescriptor
+from msdsalgs.security_types.ace import ACEType
+from msdsalgs.fscc.file_information_classes import FileInformationClass, decode_directory_buffer
+from msdsalgs.fscc.file_notify_stream import iter_file_notify_information
+
+
+def security_descriptor_components(security_descriptor: SecurityDescriptor) -> list:
+    return [
+        bytes(component) if component is not None else None
+        for component in (
+            security_descriptor.owner_sid,
+            security_descriptor.group_sid,
+            security_descriptor.sacl,
+            security_descriptor.dacl
+        )
+    ]
+
+
+def test_deterministic():
+    profile = SecurityDescriptorProfile()
+
+    assert list(generate_corpus(profile, count=10, seed=1)) == list(generate_corpus(profile, count=10, seed=1))
+    assert list(generate_corpus(profile, count=10, seed=1)) != list(generate_corpus(profile, count=10, seed=2))
+    assert corpus_item(profile, seed=1, index=7) == list(generate_corpus(profile, count=10, seed=1))[7]
+
+
+def test_security_descriptors():
+    profile = SecurityDescriptorProfile(
+        sacl_probability=0.5,
+        owner_probability=0.8,
+        group_probability=0.8,
+        num_sub_authorities=(1, 15)
+    )
+
+    ace_types = set()
+    num_without_sacl = num_without_owner = 0
+    for data in generate_corpus(profile, count=200, seed=0):
+        security_descriptor = SecurityDescriptor.from_bytes(data)
+
+        assert len(security_descriptor) == len(data)
+        assert security_descriptor_components(
+            SecurityDescriptor.from_bytes(bytes(security_descriptor))
+        ) == security_descriptor_components(security_descriptor)
+
+        for acl in (security_descriptor.sacl, security_descriptor.dacl):
+            if acl is not None:
+                ace_types.update(ace.header.ace_type for ace in acl.aces)
+
+        num_without_sacl += security_descriptor.sacl is None
+        num_without_owner += security_descriptor.owner_sid is None
+
+    assert ace_types == set(DACL_ACE_TYPE_WEIGHTS) | set(SACL_ACE_TYPE_WEIGHTS)
+    assert 0 < num_without_sacl < 200
+    assert 0 < num_without_owner < 200
+
+
+def test_security_descriptor_ace_type_mix():
+    profile = SecurityDescriptorProfile(
+        dacl_ace_type_weights={ACEType.ACCESS_ALLOWED_CALLBACK_OBJECT_ACE_TYPE: 1.0},
+        sacl_probability=0.0,
+        num_dacl_aces=(3, 3)
+    )
+
+    security_descriptor = SecurityDescriptor.from_bytes(generate_security_descriptor(Random(0), profile))
+
+    assert security_descriptor.sacl is None
+    assert len(security_descriptor.dacl.aces) == 3
+    assert {ace.header.ace_type for ace in security_descriptor.dacl.aces} == set(profile.dacl_ace_type_weights)
+
+
+def test_directory_buffers():
+    for file_information_class in FileInformationClass:
+        profile = DirectoryBufferProfile(file_information_class=file_information_class, num_entries=(10, 10))
+
+        entries = decode_directory_buffer(file_information_class, corpus_item(profile, seed=0, index=0))
+
+        assert len(entries) == 10
+        assert [entry.file_name for entry in entries[:2]] == ['.', '..']
+        assert [entry.file_index for entry in entries] == list(range(10))
+
+        if file_information_class is not FileInformationClass.FileNamesInformation:
+            # `EndOfFile` precedes `AllocationSize`, which is rounded up to the cluster size.
+            for entry in entries:
+                endof_file = entry.file_information.endof_file
+                assert entry.file_information.allocation_size == -(-endof_file // 4096) * 4096
+
+
+def test_directory_buffer_name_lengths():
+    profile = DirectoryBufferProfile(
+        num_entries=(50, 50),
+        dot_entries=False,
+        name_length_weights={12: 1.0},
+        non_ascii_probability=0.0
+    )
+
+    entries = decode_directory_buffer(profile.file_information_class, corpus_item(profile, seed=0, index=0))
+
+    assert all(len(entry.file_name) <= 12 for entry in entries)
+
+
+def test_notify_buffers():
+    profile = NotifyBufferProfile(num_records=(20, 20))
+
+    records = list(iter_file_notify_information(corpus_item(profile, seed=0, index=0)))
+
+    assert len(records) == 20
+    assert {record.action for record in records} <= set(profile.action_weights)
+
+
+def test_write_corpus(tmp_path):
+    items = list(generate_corpus(NotifyBufferProfile(), count=3, seed=0))
+
+    paths = write_corpus(tmp_path / 'corpus', items, prefix='notify')
+
+    assert sorted(listdir(tmp_path / 'corpus')) == ['notify-000000.bin', 'notify-000001.bin', 'notify-000002.bin']
+    assert [open(path, 'rb').read() for path in paths] == items